@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import time
+import platform
+import asyncio
+import argparse
+import tracemalloc
+from python_vm import VirtualMachine
+from python_vm.opcode import OPERATION_NAMES
+from python_vm.output import OutputBuffer
+from python_vm.script import read_script
+from python_vm.virtual_machine import ENGINES
+from python_vm.vault import random_grid, solve
+from python_vm.server import GameServer, DEFAULT_BUDGET
+from python_vm.profiler import Profile
+from python_vm.fusion import instruction_mix, dump_mix
+from python_vm.lockstep import STEPWISE, Lockstep, time_engine, dump_report
+from python_vm import teleporter
+from python_vm.intrinsics import CONFIRMATION_ADDRESS
+
+DEFAULT_BIN_PATH = 'challenge.bin'
+PLAYTHROUGH = ['solutions/part1.txt', 'solutions/teleporter.txt',
+               'solutions/part2.txt']
+
+KERNEL_R7 = 10
+
+
+class PrintOutput:
+    """Unbuffered output sink, writing each character with its own `print`"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def put(self, ordinal: int):
+        print(chr(ordinal), end='', file=self._stream)
+
+    def write(self, text: str):
+        for char in text:
+            print(char, end='', file=self._stream)
+
+    def flush(self):
+        self._stream.flush()
+
+
+def load_challenge(engine: str) -> VirtualMachine:
+    return VirtualMachine(DEFAULT_BIN_PATH, engine=engine)
+
+
+def load_kernel(engine: str, r7: int) -> VirtualMachine:
+    """
+    Loads the binary with a stub at address 0 which calls the teleporter
+    confirmation routine with r0 = 3, r1 = 1 and the given r7, then halts.
+    """
+    memory = VirtualMachine._retrieve_binary(DEFAULT_BIN_PATH)
+    stub = [1, 32768, 3, 1, 32769, 1, 1, 32775, r7,
+            17, CONFIRMATION_ADDRESS, 0]
+    memory[:len(stub)] = type(memory)(memory.typecode, stub)
+    return VirtualMachine(memory, engine=engine)
+
+
+# each workload loads a virtual machine and then runs it on a script; only
+# the kernel's loader takes the value of r7 as well
+WORKLOADS = {
+    'boot': (load_challenge, []),
+    'playthrough': (load_challenge, PLAYTHROUGH),
+    'kernel': (load_kernel, []),
+}
+
+
+def run_workload(name: str, engine: str, r7: int,
+                 instrument=None) -> float:
+    """Runs a workload to completion, returning the time taken in seconds."""
+    load, scripts = WORKLOADS[name]
+    vm = load(engine, r7) if load is load_kernel else load(engine)
+    if instrument is not None:
+        instrument(vm)
+    commands = list(read_script(*scripts))
+    start = time.perf_counter()
+    vm.run_script(commands)
+    return time.perf_counter() - start
+
+
+def count_instructions(name: str, r7: int) -> int:
+    """
+    Counts the instructions a workload executes by running it on the
+    reference interpreter with every operation wrapped in a counter. All
+    engines execute the same instructions, so this is only done once.
+    """
+    count = 0
+
+    def counted(operation):
+        def wrapper(*args, **kwargs):
+            nonlocal count
+            count += 1
+            return operation(*args, **kwargs)
+        return wrapper
+
+    def instrument(vm):
+        for name in OPERATION_NAMES:
+            setattr(vm._ops, name, counted(getattr(vm._ops, name)))
+
+    run_workload(name, 'operations', r7, instrument)
+    return count
+
+
+def measure(name: str, engine: str, r7: int, repeat: int) -> dict:
+    wall_time = min(run_workload(name, engine, r7) for _ in range(repeat))
+    tracemalloc.start()
+    try:
+        run_workload(name, engine, r7)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'wall_time': wall_time, 'peak_memory': peak}
+
+
+def run_suite(engines: list, workloads: list, r7: int, repeat: int) -> dict:
+    results = []
+    for name in workloads:
+        instructions = count_instructions(name, r7)
+        for engine in engines:
+            result = measure(name, engine, r7, repeat)
+            result.update({
+                'workload': name,
+                'engine': engine,
+                'instructions': instructions,
+                'ips': instructions / result['wall_time'],
+            })
+            results.append(result)
+            print("{:12} {:11} {:>8.3f}s {:>10} instr {:>12,.0f} instr/s {:>9.1f} KiB".format(
+                name, engine, result['wall_time'], instructions,
+                result['ips'], result['peak_memory'] / 1024), file=sys.stderr)
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'kernel_r7': r7,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Returns a message for every workload and engine whose instructions per
+    second dropped by more than `tolerance` (a fraction) against `baseline`.
+    """
+    previous = {(r['workload'], r['engine']): r for r in baseline['results']}
+    regressions = []
+    for result in report['results']:
+        old = previous.get((result['workload'], result['engine']))
+        if old is None:
+            continue
+        ratio = result['ips'] / old['ips']
+        if ratio < 1 - tolerance:
+            regressions.append("{} on {}: {:,.0f} -> {:,.0f} instr/s ({:.0%})".format(
+                result['workload'], result['engine'], old['ips'],
+                result['ips'], ratio))
+    return regressions
+
+
+def play(engine: str, output) -> float:
+    """Runs the whole scripted playthrough, returning the time taken."""
+    vm = VirtualMachine(DEFAULT_BIN_PATH, engine=engine, output=output)
+    start = time.perf_counter()
+    vm.run_script(read_script(*PLAYTHROUGH))
+    return time.perf_counter() - start
+
+
+def replay(text: str, output) -> float:
+    """Writes `text` through `output` one character at a time."""
+    start = time.perf_counter()
+    for char in text:
+        output.put(ord(char))
+    output.flush()
+    return time.perf_counter() - start
+
+
+def bench_output(engine: str, stream, repeat: int):
+    text = VirtualMachine(DEFAULT_BIN_PATH, engine=engine).run_script(
+        read_script(*PLAYTHROUGH))
+    print("Playthrough output: {} characters, {} lines".format(
+        len(text), text.count('\n')), file=sys.stderr)
+
+    sinks = [('print', PrintOutput), ('buffered', OutputBuffer)]
+    for name, sink in sinks:
+        total = min(play(engine, sink(stream)) for _ in range(repeat))
+        output_only = min(replay(text, sink(stream)) for _ in range(repeat))
+        print("{:10} playthrough {:>7.3f}s   output only {:>7.3f}s".format(
+            name, total, output_only), file=sys.stderr)
+
+
+def bench_vault(sizes: list, values: int, seed: int, repeat: int):
+    """Times one search for the target values 1..`values` on a random grid of each size"""
+    for size in sizes:
+        grid = random_grid(size, seed)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            paths = solve(grid, (size - 1, 0), (0, size - 1), range(1, values + 1))
+            timings.append(time.perf_counter() - start)
+        reached = [path for path in paths.values() if path is not None]
+        print("{:>3}x{:<3} {:>8.3f}s {:>5}/{} values reached, longest walk {} steps".format(
+            size, size, min(timings), len(reached), values,
+            max(map(len, reached), default=0)), file=sys.stderr)
+
+
+def report_mix(top: int):
+    """
+    Profiles the scripted playthrough and reports its instruction mix, and
+    how many dispatches fusing each of `fusion.PATTERNS` would save on it.
+    """
+    vm = VirtualMachine(DEFAULT_BIN_PATH, engine='dispatch')
+    profile = Profile()
+    vm.run_script(read_script(*PLAYTHROUGH), profile)
+    dump_mix(instruction_mix(vm._bin, profile.hits), sys.stderr, top)
+
+
+def run_lockstep(reference: str, other: str, every: int, repeat: int) -> bool:
+    """
+    Checks `other` against `reference` on the scripted playthrough, then
+    times each on its own, returning whether they agreed throughout.
+    """
+    commands = list(read_script(*PLAYTHROUGH))
+    report = Lockstep(DEFAULT_BIN_PATH, reference, other, every).run(commands)
+    report = report._replace(
+        reference_time=time_engine(DEFAULT_BIN_PATH, reference, commands, repeat),
+        other_time=time_engine(DEFAULT_BIN_PATH, other, commands, repeat))
+    dump_report(report, sys.stderr)
+    return report.divergence is None
+
+
+# the game prints a prompt after every command except meta-commands
+PROMPT = b'What do you do?\n'
+META_COMMANDS = ('rewire teleporter', 'save')
+
+
+async def player(port: int, commands: list, latencies: list):
+    """
+    Plays `commands` over a connection like a player would, typing each one
+    once the previous reply has arrived, and records how long each took.
+    Meta-commands have no reply of their own and go out with the next one.
+    """
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    await reader.readuntil(PROMPT)
+    pending = b''
+    for command in commands:
+        pending += command.encode('utf-8') + b'\n'
+        if command.startswith(META_COMMANDS):
+            continue
+        start = time.perf_counter()
+        writer.write(pending)
+        pending = b''
+        await reader.readuntil(PROMPT)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def play_sessions(sessions: int, engine: str, budget: int) -> tuple:
+    server = GameServer(DEFAULT_BIN_PATH, engine, budget)
+    listener = await server.start()
+    port = listener.sockets[0].getsockname()[1]
+    commands = list(read_script(*PLAYTHROUGH))
+    latencies = []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(player(port, commands, latencies)
+                               for _ in range(sessions)))
+    finally:
+        await server.close()
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def bench_sessions(counts: list, engine: str, budget: int):
+    """
+    Plays the whole playthrough in `count` concurrent sessions against a
+    server in this process, which runs them all on one core.
+    """
+    teleporter.energy_level()
+    for count in counts:
+        wall_time, latencies = asyncio.run(play_sessions(count, engine, budget))
+        print("{:>4} sessions {:>8.3f}s {:>7.2f} playthroughs/s   reply p50 {:>7.1f}ms p99 {:>7.1f}ms".format(
+            count, wall_time, count / wall_time,
+            latencies[len(latencies) // 2] * 1000,
+            latencies[len(latencies) * 99 // 100] * 1000), file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the virtual machine on challenge.bin")
+    subparsers = parser.add_subparsers(dest='command')
+
+    suite = subparsers.add_parser(
+        'suite', help="time every engine on the standard workloads (default)")
+    suite.add_argument('--engines', nargs='+', choices=ENGINES,
+                       default=list(ENGINES))
+    suite.add_argument('--workloads', nargs='+', choices=WORKLOADS,
+                       default=list(WORKLOADS))
+    suite.add_argument('--kernel-r7', type=int, default=KERNEL_R7,
+                       help="value of r7 for the confirmation routine kernel")
+    suite.add_argument('--repeat', type=int, default=3)
+    suite.add_argument('--json', help="write the results to this file")
+    suite.add_argument('--baseline',
+                       help="results file of an earlier run to compare against")
+    suite.add_argument('--tolerance', type=float, default=0.1,
+                       help="allowed fractional drop in instr/s against the baseline")
+
+    output = subparsers.add_parser(
+        'output', help="compare buffered and unbuffered output")
+    output.add_argument('--engine', choices=ENGINES, default='dispatch')
+    output.add_argument('--repeat', type=int, default=3)
+    output.add_argument('--tty', action='store_true',
+                        help="write game output to stdout instead of os.devnull")
+
+    vault = subparsers.add_parser(
+        'vault', help="time the vault grid solver on larger random grids")
+    vault.add_argument('--sizes', type=int, nargs='+', default=[4, 8, 16])
+    vault.add_argument('--values', type=int, default=100,
+                       help="search for the values 1 to this in one go")
+    vault.add_argument('--seed', type=int, default=0)
+    vault.add_argument('--repeat', type=int, default=3)
+
+    sessions = subparsers.add_parser(
+        'sessions', help="play concurrent sessions against the game server")
+    sessions.add_argument('--counts', type=int, nargs='+', default=[1, 4, 16, 64])
+    sessions.add_argument('--engine', choices=['dispatch', 'blocks'], default='dispatch')
+    sessions.add_argument('--budget', type=int, default=DEFAULT_BUDGET)
+
+    mix = subparsers.add_parser(
+        'mix', help="report the instruction mix of the playthrough")
+    mix.add_argument('--top', type=int, default=15)
+
+    lockstep = subparsers.add_parser(
+        'lockstep', help="check an engine against a reference on the playthrough, "
+                         "and time both")
+    lockstep.add_argument('--reference', choices=STEPWISE, default='operations')
+    lockstep.add_argument('--engine', choices=ENGINES, default='blocks')
+    lockstep.add_argument('--every', type=int, default=10000,
+                          help="steps of the engine between checkpoints")
+    lockstep.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == 'lockstep':
+        if not run_lockstep(args.reference, args.engine, args.every, args.repeat):
+            sys.exit(1)
+        return
+
+    if args.command == 'mix':
+        report_mix(args.top)
+        return
+
+    if args.command == 'sessions':
+        bench_sessions(args.counts, args.engine, args.budget)
+        return
+
+    if args.command == 'vault':
+        bench_vault(args.sizes, args.values, args.seed, args.repeat)
+        return
+
+    if args.command == 'output':
+        if args.tty:
+            bench_output(args.engine, sys.stdout, args.repeat)
+        else:
+            with open(os.devnull, 'w') as stream:
+                bench_output(args.engine, stream, args.repeat)
+        return
+
+    if args.command is None:
+        args = suite.parse_args([])
+    report = run_suite(args.engines, args.workloads, args.kernel_r7,
+                       args.repeat)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=4)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for message in regressions:
+            print("Regression: " + message, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
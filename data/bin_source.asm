@@ -1,26712 +1,3831 @@
 0:     NOOP
 1:     NOOP
-2:     OUT  'W'
-4:     OUT  'e'
-6:     OUT  'l'
-8:     OUT  'c'
-10:    OUT  'o'
-12:    OUT  'm'
-14:    OUT  'e'
-16:    OUT  ' '
-18:    OUT  't'
-20:    OUT  'o'
-22:    OUT  ' '
-24:    OUT  't'
-26:    OUT  'h'
-28:    OUT  'e'
-30:    OUT  ' '
-32:    OUT  'S'
-34:    OUT  'y'
-36:    OUT  'n'
-38:    OUT  'a'
-40:    OUT  'c'
-42:    OUT  'o'
-44:    OUT  'r'
-46:    OUT  ' '
-48:    OUT  'C'
-50:    OUT  'h'
-52:    OUT  'a'
-54:    OUT  'l'
-56:    OUT  'l'
-58:    OUT  'e'
-60:    OUT  'n'
-62:    OUT  'g'
-64:    OUT  'e'
-66:    OUT  '!'
-68:    OUT  '\n'
-70:    OUT  'P'
-72:    OUT  'l'
-74:    OUT  'e'
-76:    OUT  'a'
-78:    OUT  's'
-80:    OUT  'e'
-82:    OUT  ' '
-84:    OUT  'r'
-86:    OUT  'e'
-88:    OUT  'c'
-90:    OUT  'o'
-92:    OUT  'r'
-94:    OUT  'd'
-96:    OUT  ' '
-98:    OUT  'y'
-100:   OUT  'o'
-102:   OUT  'u'
-104:   OUT  'r'
-106:   OUT  ' '
-108:   OUT  'p'
-110:   OUT  'r'
-112:   OUT  'o'
-114:   OUT  'g'
-116:   OUT  'r'
-118:   OUT  'e'
-120:   OUT  's'
-122:   OUT  's'
-124:   OUT  ' '
-126:   OUT  'b'
-128:   OUT  'y'
-130:   OUT  ' '
-132:   OUT  'p'
-134:   OUT  'u'
-136:   OUT  't'
-138:   OUT  't'
-140:   OUT  'i'
-142:   OUT  'n'
-144:   OUT  'g'
-146:   OUT  ' '
-148:   OUT  'c'
-150:   OUT  'o'
-152:   OUT  'd'
-154:   OUT  'e'
-156:   OUT  's'
-158:   OUT  ' '
-160:   OUT  'l'
-162:   OUT  'i'
-164:   OUT  'k'
-166:   OUT  'e'
-168:   OUT  '\n'
-170:   OUT  't'
-172:   OUT  'h'
-174:   OUT  'i'
-176:   OUT  's'
-178:   OUT  ' '
-180:   OUT  'o'
-182:   OUT  'n'
-184:   OUT  'e'
-186:   OUT  ' '
-188:   OUT  'i'
-190:   OUT  'n'
-192:   OUT  't'
-194:   OUT  'o'
-196:   OUT  ' '
-198:   OUT  't'
-200:   OUT  'h'
-202:   OUT  'e'
-204:   OUT  ' '
-206:   OUT  'c'
-208:   OUT  'h'
-210:   OUT  'a'
-212:   OUT  'l'
-214:   OUT  'l'
-216:   OUT  'e'
-218:   OUT  'n'
-220:   OUT  'g'
-222:   OUT  'e'
-224:   OUT  ' '
-226:   OUT  'w'
-228:   OUT  'e'
-230:   OUT  'b'
-232:   OUT  's'
-234:   OUT  'i'
-236:   OUT  't'
-238:   OUT  'e'
-240:   OUT  ':'
-242:   OUT  ' '
-244:   OUT  'd'
-246:   OUT  'y'
-248:   OUT  'G'
-250:   OUT  'y'
-252:   OUT  'P'
-254:   OUT  'z'
-256:   OUT  'b'
-258:   OUT  'A'
-260:   OUT  'E'
-262:   OUT  'Y'
-264:   OUT  't'
-266:   OUT  'Z'
-268:   OUT  '\n'
-270:   OUT  '\n'
-272:   OUT  'E'
-274:   OUT  'x'
-276:   OUT  'e'
-278:   OUT  'c'
-280:   OUT  'u'
-282:   OUT  't'
-284:   OUT  'i'
-286:   OUT  'n'
-288:   OUT  'g'
-290:   OUT  ' '
-292:   OUT  's'
-294:   OUT  'e'
-296:   OUT  'l'
-298:   OUT  'f'
-300:   OUT  '-'
-302:   OUT  't'
-304:   OUT  'e'
-306:   OUT  's'
-308:   OUT  't'
-310:   OUT  '.'
-312:   OUT  '.'
-314:   OUT  '.'
-316:   OUT  '\n'
-318:   OUT  '\n'
-320:   JMP  347  
-322:   OUT  'j'
-324:   OUT  'm'
-326:   OUT  'p'
-328:   OUT  ' '
-330:   OUT  'f'
-332:   OUT  'a'
-334:   OUT  'i'
-336:   OUT  'l'
-338:   OUT  's'
-340:   OUT  '\n'
-342:   HALT
-343:   NOOP
-344:   NOOP
-345:   NOOP
-346:   NOOP
+2:     OUT  "Welcome to the Synacor Challenge!\nPlease record your progress by putting codes like\nthis one into the challenge website: dyGyPzbAEYtZ\n\nExecuting self-test...\n\n"
+320:   JMP  loc_347
+322:   DATA 19, 106, 19, 109, 19, 112, 19, 32
+330:   DATA 19, 102, 19, 97, 19, 105, 19, 108
+338:   DATA 19, 115, 19, 10, 0, 21, 21, 21
+346:   DATA 21
+loc_347:
 347:   NOOP
 348:   NOOP
 349:   NOOP
 350:   NOOP
 351:   NOOP
-352:   JMP  358  
-354:   JMP  368  
-356:   JMP  397  
-358:   JMP  484  
-360:   JMP  424  
-362:   JMP  453  
-364:   NOOP
-365:   NOOP
-366:   NOOP
-367:   NOOP
-368:   OUT  'j'
-370:   OUT  'm'
-372:   OUT  'p'
-374:   OUT  ' '
-376:   OUT  'l'
-378:   OUT  'a'
-380:   OUT  'n'
-382:   OUT  'd'
-384:   OUT  's'
-386:   OUT  ' '
-388:   OUT  '-'
-390:   OUT  '2'
-392:   OUT  '\n'
-394:   HALT
-395:   NOOP
-396:   NOOP
-397:   OUT  'j'
-399:   OUT  'm'
-401:   OUT  'p'
-403:   OUT  ' '
-405:   OUT  'l'
-407:   OUT  'a'
-409:   OUT  'n'
-411:   OUT  'd'
-413:   OUT  's'
-415:   OUT  ' '
-417:   OUT  '-'
-419:   OUT  '1'
-421:   OUT  '\n'
-423:   HALT
-424:   NOOP
-425:   NOOP
-426:   OUT  'j'
-428:   OUT  'm'
-430:   OUT  'p'
-432:   OUT  ' '
-434:   OUT  'l'
-436:   OUT  'a'
-438:   OUT  'n'
-440:   OUT  'd'
-442:   OUT  's'
-444:   OUT  ' '
-446:   OUT  '+'
-448:   OUT  '1'
-450:   OUT  '\n'
-452:   HALT
-453:   NOOP
-454:   NOOP
-455:   NOOP
-456:   NOOP
-457:   OUT  'j'
-459:   OUT  'm'
-461:   OUT  'p'
-463:   OUT  ' '
-465:   OUT  'l'
-467:   OUT  'a'
-469:   OUT  'n'
-471:   OUT  'd'
-473:   OUT  's'
-475:   OUT  ' '
-477:   OUT  '+'
-479:   OUT  '2'
-481:   OUT  '\n'
-483:   HALT
-484:   JT   0     1074 
-487:   JF   1     1074 
-490:   JT   1     495  
-493:   JMP  1074 
-495:   JF   0     500  
-498:   JMP  1074 
-500:   JT   r0    1093 
-503:   JT   r1    1093 
-506:   JT   r2    1093 
-509:   JT   r3    1093 
-512:   JT   r4    1093 
-515:   JT   r5    1093 
-518:   JT   r6    1093 
-521:   JT   r7    1093 
-524:   SET  r0    1    
-527:   JF   r0    1118 
-530:   SET  r0    0    
-533:   JT   r0    1118 
-536:   ADD  r0    1     1    
-540:   JT   r0    564  
-543:   OUT  'n'
-545:   OUT  'o'
-547:   OUT  ' '
-549:   OUT  'a'
-551:   OUT  'd'
-553:   OUT  'd'
-555:   OUT  ' '
-557:   OUT  'o'
-559:   OUT  'p'
-561:   OUT  '\n'
+352:   JMP  loc_358
+354:   DATA 6, 368, 6, 397
+loc_358:
+358:   JMP  loc_484
+360:   DATA 6, 424, 6, 453, 21, 21, 21, 21
+368:   DATA 19, 106, 19, 109, 19, 112, 19, 32
+376:   DATA 19, 108, 19, 97, 19, 110, 19, 100
+384:   DATA 19, 115, 19, 32, 19, 45, 19, 50
+392:   DATA 19, 10, 0, 21, 21, 19, 106, 19
+400:   DATA 109, 19, 112, 19, 32, 19, 108, 19
+408:   DATA 97, 19, 110, 19, 100, 19, 115, 19
+416:   DATA 32, 19, 45, 19, 49, 19, 10, 0
+424:   DATA 21, 21, 19, 106, 19, 109, 19, 112
+432:   DATA 19, 32, 19, 108, 19, 97, 19, 110
+440:   DATA 19, 100, 19, 115, 19, 32, 19, 43
+448:   DATA 19, 49, 19, 10, 0, 21, 21, 21
+456:   DATA 21, 19, 106, 19, 109, 19, 112, 19
+464:   DATA 32, 19, 108, 19, 97, 19, 110, 19
+472:   DATA 100, 19, 115, 19, 32, 19, 43, 19
+480:   DATA 50, 19, 10, 0
+loc_484:
+484:   JT   0     loc_1074
+487:   JF   1     loc_1074
+490:   JT   1     loc_495
+493:   JMP  loc_1074
+loc_495:
+495:   JF   0     loc_500
+498:   JMP  loc_1074
+loc_500:
+500:   JT   r0    loc_1093
+503:   JT   r1    loc_1093
+506:   JT   r2    loc_1093
+509:   JT   r3    loc_1093
+512:   JT   r4    loc_1093
+515:   JT   r5    loc_1093
+518:   JT   r6    loc_1093
+521:   JT   r7    loc_1093
+524:   SET  r0    1
+527:   JF   r0    loc_1118
+530:   SET  r0    0
+533:   JT   r0    loc_1118
+536:   ADD  r0    1     1
+540:   JT   r0    loc_564
+543:   OUT  "no add op\n"
 563:   HALT
-564:   EQ   r1    r0    2    
-568:   JT   r1    590  
-571:   OUT  'n'
-573:   OUT  'o'
-575:   OUT  ' '
-577:   OUT  'e'
-579:   OUT  'q'
-581:   OUT  ' '
-583:   OUT  'o'
-585:   OUT  'p'
-587:   OUT  '\n'
+loc_564:
+564:   EQ   r1    r0    2
+568:   JT   r1    loc_590
+571:   OUT  "no eq op\n"
 589:   HALT
-590:   PUSH r0   
-592:   PUSH r1   
-594:   POP  r0   
-596:   POP  r1   
-598:   EQ   r2    r1    2    
-602:   JF   r2    1158 
-605:   EQ   r2    r0    1    
-609:   JF   r2    1158 
-612:   GT   r2    r1    r0   
-616:   JF   r2    1139 
-619:   GT   r2    r0    r1   
-623:   JT   r2    1139 
-626:   GT   r2    42    42   
-630:   JT   r2    1139 
+loc_590:
+590:   PUSH r0
+592:   PUSH r1
+594:   POP  r0
+596:   POP  r1
+598:   EQ   r2    r1    2
+602:   JF   r2    loc_1158
+605:   EQ   r2    r0    1
+609:   JF   r2    loc_1158
+612:   GT   r2    r1    r0
+616:   JF   r2    loc_1139
+619:   GT   r2    r0    r1
+623:   JT   r2    loc_1139
+626:   GT   r2    42    42
+630:   JT   r2    loc_1139
 633:   AND  r0    28912 19626
 637:   EQ   r1    r0    16544
-641:   JF   r1    1177 
+641:   JF   r1    loc_1177
 644:   OR   r1    28912 19626
 648:   EQ   r0    r1    31994
-652:   JT   r0    684  
-655:   OUT  'n'
-657:   OUT  'o'
-659:   OUT  ' '
-661:   OUT  'b'
-663:   OUT  'i'
-665:   OUT  't'
-667:   OUT  'w'
-669:   OUT  'i'
-671:   OUT  's'
-673:   OUT  'e'
-675:   OUT  ' '
-677:   OUT  'o'
-679:   OUT  'r'
-681:   OUT  '\n'
+652:   JT   r0    loc_684
+655:   OUT  "no bitwise or\n"
 683:   HALT
-684:   NOT  r0    0    
+loc_684:
+684:   NOT  r0    0
 687:   EQ   r1    r0    32767
-691:   JF   r1    1208 
+691:   JF   r1    loc_1208
 694:   NOT  r0    21845
 697:   EQ   r1    r0    10922
-701:   JF   r1    1208 
-704:   CALL 1285 
-706:   JMP  1289 
-708:   POP  r0   
-710:   EQ   r1    r0    708  
-714:   JT   r1    1289 
-717:   EQ   r1    r0    706  
-721:   JF   r1    1289 
-724:   SET  r0    1287 
-727:   CALL r0   
-729:   JMP  1289 
-731:   POP  r0   
-733:   EQ   r1    r0    731  
-737:   JT   r1    1289 
-740:   EQ   r1    r0    729  
-744:   JF   r1    1289 
+701:   JF   r1    loc_1208
+704:   CALL sub_1285
+706:   JMP  loc_1289
+loc_708:
+708:   POP  r0
+710:   EQ   r1    r0    708
+714:   JT   r1    loc_1289
+717:   EQ   r1    r0    706
+721:   JF   r1    loc_1289
+724:   SET  r0    1287
+727:   CALL r0
+729:   JMP  loc_1289
+loc_731:
+731:   POP  r0
+733:   EQ   r1    r0    731
+737:   JT   r1    loc_1289
+740:   EQ   r1    r0    729
+744:   JF   r1    loc_1289
 747:   ADD  r0    32767 32767
 751:   EQ   r1    r0    32766
-755:   JF   r1    1312 
-758:   EQ   r1    32766 r0   
-762:   JF   r1    1312 
+755:   JF   r1    loc_1312
+758:   EQ   r1    32766 r0
+762:   JF   r1    loc_1312
 765:   ADD  r0    16384 16384
-769:   JT   r0    1312 
+769:   JT   r0    loc_1312
 772:   ADD  r0    16384 16384
-776:   JT   r0    1312 
-779:   MULT r0    6     9    
-783:   EQ   r1    r0    42   
-787:   JT   r1    1381 
-790:   EQ   r1    r0    54   
-794:   JF   r1    1414 
+776:   JT   r0    loc_1312
+779:   MULT r0    6     9
+783:   EQ   r1    r0    42
+787:   JT   r1    loc_1381
+790:   EQ   r1    r0    54
+794:   JF   r1    loc_1414
 797:   MULT r0    12345 32123
-801:   EQ   r1    r0    99   
-805:   JF   r1    1312 
-808:   MOD  r0    6     3    
-812:   EQ   r1    r0    0    
-816:   JF   r1    1437 
-819:   MOD  r0    70    6    
-823:   EQ   r1    r0    4    
-827:   JF   r1    1437 
-830:   MULT r0    32766 15   
+801:   EQ   r1    r0    99
+805:   JF   r1    loc_1312
+808:   MOD  r0    6     3
+812:   EQ   r1    r0    0
+816:   JF   r1    loc_1437
+819:   MOD  r0    70    6
+823:   EQ   r1    r0    4
+827:   JF   r1    loc_1437
+830:   MULT r0    32766 15
 834:   EQ   r1    r0    32738
-838:   JF   r1    1312 
-841:   JMP  845  
-843:   DATA: 20000
-844:   DATA: 10000
-845:   RMEM r0    843  
+838:   JF   r1    loc_1312
+841:   JMP  loc_845
+843:   DATA 20000, 10000
+loc_845:
+845:   RMEM r0    843
 848:   EQ   r1    r0    20000
-852:   JF   r1    1239 
-855:   ADD  r2    843   1    
-859:   RMEM r0    r2   
+852:   JF   r1    loc_1239
+855:   ADD  r2    843   1
+859:   RMEM r0    r2
 862:   EQ   r1    r0    10000
-866:   JF   r1    1239 
-869:   SET  r0    843  
+866:   JF   r1    loc_1239
+869:   SET  r0    843
 872:   WMEM r0    30000
-875:   RMEM r2    r0   
+875:   RMEM r2    r0
 878:   EQ   r1    r2    30000
-882:   JF   r1    1262 
-885:   CALL 1723 
-887:   RMEM r0    6068 
-890:   EQ   r1    r0    11   
-894:   JF   r1    1239 
-897:   ADD  r2    6068  1    
-901:   RMEM r0    r2   
-904:   EQ   r1    r0    116  
-908:   JF   r1    1239 
-911:   WMEM r2    84   
-914:   RMEM r0    r2   
-917:   EQ   r1    r0    116  
-921:   JT   r1    1262 
-924:   EQ   r1    r0    84   
-928:   JF   r1    1262 
-931:   WMEM 937   21   
-934:   WMEM 938   7    
-937:   JMP  941  
-939:   OUT  'ϒ'
-941:   OUT  'w'
-943:   OUT  'm'
-945:   OUT  'e'
-947:   OUT  'm'
-949:   OUT  ' '
-951:   OUT  'o'
-953:   OUT  'p'
-955:   OUT  'w'
-957:   OUT  'r'
-959:   OUT  'i'
-961:   OUT  't'
-963:   OUT  'e'
-965:   OUT  ' '
-967:   OUT  'f'
-969:   OUT  'a'
-971:   OUT  'i'
-973:   OUT  'l'
-975:   OUT  '\n'
+882:   JF   r1    loc_1262
+885:   CALL sub_1723
+887:   RMEM r0    6068
+890:   EQ   r1    r0    11
+894:   JF   r1    loc_1239
+897:   ADD  r2    6068  1
+901:   RMEM r0    r2
+904:   EQ   r1    r0    116
+908:   JF   r1    loc_1239
+911:   WMEM r2    84
+914:   RMEM r0    r2
+917:   EQ   r1    r0    116
+921:   JT   r1    loc_1262
+924:   EQ   r1    r0    84
+928:   JF   r1    loc_1262
+931:   WMEM 937   21
+934:   WMEM 938   7
+937:   JMP  loc_941
+939:   DATA 19, 978
+loc_941:
+941:   OUT  "wmem opwrite fail\n"
 977:   HALT
-978:   ADD  r1    10    6080 
-982:   ADD  r1    r1    1    
-986:   RMEM r2    6116 
-989:   ADD  r2    r2    6116 
-993:   SET  r0    6116 
-996:   ADD  r0    r0    1    
-1000:  GT   r3    r0    r2   
-1004:  JT   r3    1023 
-1007:  RMEM r4    r0   
-1010:  WMEM r1    r4   
-1013:  ADD  r0    r0    1    
-1017:  ADD  r1    r1    1    
-1021:  JMP  1000 
-1023:  RMEM r0    6080 
-1026:  RMEM r1    6099 
-1029:  ADD  r0    r0    r1   
-1033:  ADD  r0    r0    1    
-1037:  WMEM 6080  r0   
-1040:  WMEM 6099  44   
-1043:  SET  r0    6080 
-1046:  CALL 1518 
-1048:  PUSH r0   
-1050:  PUSH r1   
-1052:  PUSH r2   
-1054:  SET  r0    26851
-1057:  SET  r1    1531 
-1060:  ADD  r2    20986 5502 
-1064:  CALL 1458 
-1066:  POP  r2   
-1068:  POP  r1   
-1070:  POP  r0   
-1072:  JMP  2734 
-1074:  OUT  'n'
-1076:  OUT  'o'
-1078:  OUT  ' '
-1080:  OUT  'j'
-1082:  OUT  't'
-1084:  OUT  '/'
-1086:  OUT  'j'
-1088:  OUT  'f'
-1090:  OUT  '\n'
+978:   DATA 9, 32769, 10, 6080, 9, 32769, 32769, 1
+986:   DATA 15, 32770, 6116, 9, 32770, 32770, 6116, 1
+994:   DATA 32768, 6116, 9, 32768, 32768, 1, 5, 32771
+1002:  DATA 32768, 32770, 7, 32771, 1023, 15, 32772, 32768
+1010:  DATA 16, 32769, 32772, 9, 32768, 32768, 1, 9
+1018:  DATA 32769, 32769, 1, 6, 1000, 15, 32768, 6080
+1026:  DATA 15, 32769, 6099, 9, 32768, 32768, 32769, 9
+1034:  DATA 32768, 32768, 1, 16, 6080, 32768, 16, 6099
+1042:  DATA 44, 1, 32768, 6080, 17, 1518, 2, 32768
+1050:  DATA 2, 32769, 2, 32770, 1, 32768, 26851, 1
+1058:  DATA 32769, 1531, 9, 32770, 20986, 5502, 17, 1458
+1066:  DATA 3, 32770, 3, 32769, 3, 32768, 6, 2734
+loc_1074:
+1074:  OUT  "no jt/jf\n"
 1092:  HALT
-1093:  OUT  'n'
-1095:  OUT  'o'
-1097:  OUT  'n'
-1099:  OUT  'z'
-1101:  OUT  'e'
-1103:  OUT  'r'
-1105:  OUT  'o'
-1107:  OUT  ' '
-1109:  OUT  'r'
-1111:  OUT  'e'
-1113:  OUT  'g'
-1115:  OUT  '\n'
+loc_1093:
+1093:  OUT  "nonzero reg\n"
 1117:  HALT
-1118:  OUT  'n'
-1120:  OUT  'o'
-1122:  OUT  ' '
-1124:  OUT  's'
-1126:  OUT  'e'
-1128:  OUT  't'
-1130:  OUT  ' '
-1132:  OUT  'o'
-1134:  OUT  'p'
-1136:  OUT  '\n'
+loc_1118:
+1118:  OUT  "no set op\n"
 1138:  HALT
-1139:  OUT  'n'
-1141:  OUT  'o'
-1143:  OUT  ' '
-1145:  OUT  'g'
-1147:  OUT  't'
-1149:  OUT  ' '
-1151:  OUT  'o'
-1153:  OUT  'p'
-1155:  OUT  '\n'
+loc_1139:
+1139:  OUT  "no gt op\n"
 1157:  HALT
-1158:  OUT  'n'
-1160:  OUT  'o'
-1162:  OUT  ' '
-1164:  OUT  's'
-1166:  OUT  't'
-1168:  OUT  'a'
-1170:  OUT  'c'
-1172:  OUT  'k'
-1174:  OUT  '\n'
+loc_1158:
+1158:  OUT  "no stack\n"
 1176:  HALT
-1177:  OUT  'n'
-1179:  OUT  'o'
-1181:  OUT  ' '
-1183:  OUT  'b'
-1185:  OUT  'i'
-1187:  OUT  't'
-1189:  OUT  'w'
-1191:  OUT  'i'
-1193:  OUT  's'
-1195:  OUT  'e'
-1197:  OUT  ' '
-1199:  OUT  'a'
-1201:  OUT  'n'
-1203:  OUT  'd'
-1205:  OUT  '\n'
+loc_1177:
+1177:  OUT  "no bitwise and\n"
 1207:  HALT
-1208:  OUT  'n'
-1210:  OUT  'o'
-1212:  OUT  ' '
-1214:  OUT  'b'
-1216:  OUT  'i'
-1218:  OUT  't'
-1220:  OUT  'w'
-1222:  OUT  'i'
-1224:  OUT  's'
-1226:  OUT  'e'
-1228:  OUT  ' '
-1230:  OUT  'n'
-1232:  OUT  'o'
-1234:  OUT  't'
-1236:  OUT  '\n'
+loc_1208:
+1208:  OUT  "no bitwise not\n"
 1238:  HALT
-1239:  OUT  'n'
-1241:  OUT  'o'
-1243:  OUT  ' '
-1245:  OUT  'r'
-1247:  OUT  'm'
-1249:  OUT  'e'
-1251:  OUT  'm'
-1253:  OUT  ' '
-1255:  OUT  'o'
-1257:  OUT  'p'
-1259:  OUT  '\n'
+loc_1239:
+1239:  OUT  "no rmem op\n"
 1261:  HALT
-1262:  OUT  'n'
-1264:  OUT  'o'
-1266:  OUT  ' '
-1268:  OUT  'w'
-1270:  OUT  'm'
-1272:  OUT  'e'
-1274:  OUT  'm'
-1276:  OUT  ' '
-1278:  OUT  'o'
-1280:  OUT  'p'
-1282:  OUT  '\n'
+loc_1262:
+1262:  OUT  "no wmem op\n"
 1284:  HALT
-1285:  JMP  708  
-1287:  JMP  731  
-1289:  OUT  'n'
-1291:  OUT  'o'
-1293:  OUT  ' '
-1295:  OUT  'c'
-1297:  OUT  'a'
-1299:  OUT  'l'
-1301:  OUT  'l'
-1303:  OUT  ' '
-1305:  OUT  'o'
-1307:  OUT  'p'
-1309:  OUT  '\n'
+
+sub_1285:
+1285:  JMP  loc_708
+
+sub_1287:
+1287:  JMP  loc_731
+loc_1289:
+1289:  OUT  "no call op\n"
 1311:  HALT
-1312:  OUT  'n'
-1314:  OUT  'o'
-1316:  OUT  ' '
-1318:  OUT  'm'
-1320:  OUT  'o'
-1322:  OUT  'd'
-1324:  OUT  'u'
-1326:  OUT  'l'
-1328:  OUT  'o'
-1330:  OUT  ' '
-1332:  OUT  'm'
-1334:  OUT  'a'
-1336:  OUT  't'
-1338:  OUT  'h'
-1340:  OUT  ' '
-1342:  OUT  'd'
-1344:  OUT  'u'
-1346:  OUT  'r'
-1348:  OUT  'i'
-1350:  OUT  'n'
-1352:  OUT  'g'
-1354:  OUT  ' '
-1356:  OUT  'a'
-1358:  OUT  'd'
-1360:  OUT  'd'
-1362:  OUT  ' '
-1364:  OUT  'o'
-1366:  OUT  'r'
-1368:  OUT  ' '
-1370:  OUT  'm'
-1372:  OUT  'u'
-1374:  OUT  'l'
-1376:  OUT  't'
-1378:  OUT  '\n'
+loc_1312:
+1312:  OUT  "no modulo math during add or mult\n"
 1380:  HALT
-1381:  OUT  'n'
-1383:  OUT  'o'
-1385:  OUT  't'
-1387:  OUT  ' '
-1389:  OUT  'h'
-1391:  OUT  'i'
-1393:  OUT  't'
-1395:  OUT  'c'
-1397:  OUT  'h'
-1399:  OUT  'h'
-1401:  OUT  'i'
-1403:  OUT  'k'
-1405:  OUT  'i'
-1407:  OUT  'n'
-1409:  OUT  'g'
-1411:  OUT  '\n'
+loc_1381:
+1381:  OUT  "not hitchhiking\n"
 1413:  HALT
-1414:  OUT  'n'
-1416:  OUT  'o'
-1418:  OUT  ' '
-1420:  OUT  'm'
-1422:  OUT  'u'
-1424:  OUT  'l'
-1426:  OUT  't'
-1428:  OUT  ' '
-1430:  OUT  'o'
-1432:  OUT  'p'
-1434:  OUT  '\n'
+loc_1414:
+1414:  OUT  "no mult op\n"
 1436:  HALT
-1437:  OUT  'n'
-1439:  OUT  'o'
-1441:  OUT  ' '
-1443:  OUT  'm'
-1445:  OUT  'o'
-1447:  OUT  'd'
-1449:  OUT  ' '
-1451:  OUT  'o'
-1453:  OUT  'p'
-1455:  OUT  '\n'
+loc_1437:
+1437:  OUT  "no mod op\n"
 1457:  HALT
-1458:  PUSH r0   
-1460:  PUSH r3   
-1462:  PUSH r4   
-1464:  PUSH r5   
-1466:  PUSH r6   
-1468:  SET  r6    r0   
-1471:  SET  r5    r1   
-1474:  RMEM r4    r0   
-1477:  SET  r1    0    
-1480:  ADD  r3    1     r1   
-1484:  GT   r0    r3    r4   
-1488:  JT   r0    1507 
-1491:  ADD  r3    r3    r6   
-1495:  RMEM r0    r3   
-1498:  CALL r5   
-1500:  ADD  r1    r1    1    
-1504:  JT   r1    1480 
-1507:  POP  r6   
-1509:  POP  r5   
-1511:  POP  r4   
-1513:  POP  r3   
-1515:  POP  r0   
-1517:  RET 
-1518:  PUSH r1   
-1520:  SET  r1    1528 
-1523:  CALL 1458 
-1525:  POP  r1   
-1527:  RET 
-1528:  OUT  r0
-1530:  RET 
-1531:  PUSH r1   
-1533:  SET  r1    r2   
-1536:  CALL 2125 
-1538:  OUT  r0
-1540:  POP  r1   
-1542:  RET 
-1543:  PUSH r1   
-1545:  PUSH r3   
-1547:  RMEM r3    r0   
-1550:  JF   r3    1563 
-1553:  CALL 1458 
-1555:  JT   r1    1563 
-1558:  SET  r0    r2   
-1561:  JMP  1566 
-1563:  SET  r0    32767
-1566:  POP  r3   
-1568:  POP  r1   
-1570:  RET 
-1571:  PUSH r1   
-1573:  PUSH r2   
-1575:  SET  r2    r1   
-1578:  SET  r1    1605 
-1581:  CALL 1543 
-1583:  POP  r2   
-1585:  POP  r1   
-1587:  RET 
-1588:  PUSH r1   
-1590:  PUSH r2   
-1592:  SET  r2    r1   
-1595:  SET  r1    1648 
-1598:  CALL 1543 
-1600:  POP  r2   
-1602:  POP  r1   
-1604:  RET 
-1605:  EQ   r0    r0    r2   
-1609:  JF   r0    1618 
-1612:  SET  r2    r1   
-1615:  SET  r1    32767
-1618:  RET 
-1619:  PUSH r3   
-1621:  ADD  r3    r2    1    
-1625:  ADD  r3    r3    r1   
-1629:  RMEM r3    r3   
-1632:  EQ   r3    r0    r3   
-1636:  JT   r3    1645 
-1639:  SET  r2    r1   
-1642:  SET  r1    32767
-1645:  POP  r3   
-1647:  RET 
-1648:  PUSH r1   
-1650:  SET  r1    r2   
-1653:  CALL 1667 
-1655:  POP  r1   
-1657:  JF   r0    1666 
-1660:  SET  r2    r1   
-1663:  SET  r1    32767
-1666:  RET 
-1667:  PUSH r1   
-1669:  PUSH r2   
-1671:  PUSH r3   
-1673:  PUSH r4   
-1675:  RMEM r3    r0   
-1678:  RMEM r4    r1   
-1681:  EQ   r2    r3    r4   
-1685:  JF   r2    1711 
-1688:  OR   r2    r3    r4   
-1692:  JF   r2    1706 
-1695:  SET  r2    r1   
-1698:  SET  r1    1619 
-1701:  CALL 1458 
-1703:  JF   r1    1711 
-1706:  SET  r0    1    
-1709:  JMP  1714 
-1711:  SET  r0    0    
-1714:  POP  r4   
-1716:  POP  r3   
-1718:  POP  r2   
-1720:  POP  r1   
-1722:  RET 
-1723:  PUSH r0   
-1725:  PUSH r1   
-1727:  SET  r1    6068 
-1730:  RMEM r0    r1   
-1733:  PUSH r1   
-1735:  MULT r1    r1    r1   
-1739:  CALL 2125 
+1458:  DATA 2, 32768, 2, 32771, 2, 32772, 2, 32773
+1466:  DATA 2, 32774, 1, 32774, 32768, 1, 32773, 32769
+1474:  DATA 15, 32772, 32768, 1, 32769, 0, 9, 32771
+1482:  DATA 1, 32769, 5, 32768, 32771, 32772, 7, 32768
+1490:  DATA 1507, 9, 32771, 32771, 32774, 15, 32768, 32771
+1498:  DATA 17, 32773, 9, 32769, 32769, 1, 7, 32769
+1506:  DATA 1480, 3, 32774, 3, 32773, 3, 32772, 3
+1514:  DATA 32771, 3, 32768, 18, 2, 32769, 1, 32769
+1522:  DATA 1528, 17, 1458, 3, 32769, 18, 19, 32768
+1530:  DATA 18, 2, 32769, 1, 32769, 32770, 17, 2125
+1538:  DATA 19, 32768, 3, 32769, 18, 2, 32769, 2
+1546:  DATA 32771, 15, 32771, 32768, 8, 32771, 1563, 17
+1554:  DATA 1458, 7, 32769, 1563, 1, 32768, 32770, 6
+1562:  DATA 1566, 1, 32768, 32767, 3, 32771, 3, 32769
+1570:  DATA 18, 2, 32769, 2, 32770, 1, 32770, 32769
+1578:  DATA 1, 32769, 1605, 17, 1543, 3, 32770, 3
+1586:  DATA 32769, 18, 2, 32769, 2, 32770, 1, 32770
+1594:  DATA 32769, 1, 32769, 1648, 17, 1543, 3, 32770
+1602:  DATA 3, 32769, 18, 4, 32768, 32768, 32770, 8
+1610:  DATA 32768, 1618, 1, 32770, 32769, 1, 32769, 32767
+1618:  DATA 18, 2, 32771, 9, 32771, 32770, 1, 9
+1626:  DATA 32771, 32771, 32769, 15, 32771, 32771, 4, 32771
+1634:  DATA 32768, 32771, 7, 32771, 1645, 1, 32770, 32769
+1642:  DATA 1, 32769, 32767, 3, 32771, 18, 2, 32769
+1650:  DATA 1, 32769, 32770, 17, 1667, 3, 32769, 8
+1658:  DATA 32768, 1666, 1, 32770, 32769, 1, 32769, 32767
+1666:  DATA 18, 2, 32769, 2, 32770, 2, 32771, 2
+1674:  DATA 32772, 15, 32771, 32768, 15, 32772, 32769, 4
+1682:  DATA 32770, 32771, 32772, 8, 32770, 1711, 13, 32770
+1690:  DATA 32771, 32772, 8, 32770, 1706, 1, 32770, 32769
+1698:  DATA 1, 32769, 1619, 17, 1458, 8, 32769, 1711
+1706:  DATA 1, 32768, 1, 6, 1714, 1, 32768, 0
+1714:  DATA 3, 32772, 3, 32771, 3, 32770, 3, 32769
+1722:  DATA 18
+
+sub_1723:
+1723:  PUSH r0
+1725:  PUSH r1
+1727:  SET  r1    6068
+loc_1730:
+1730:  RMEM r0    r1
+1733:  PUSH r1
+1735:  MULT r1    r1    r1
+1739:  CALL sub_2125
 1741:  SET  r1    16724
-1744:  CALL 2125 
-1746:  POP  r1   
-1748:  WMEM r1    r0   
-1751:  ADD  r1    r1    1    
-1755:  EQ   r0    30050 r1   
-1759:  JF   r0    1730 
-1762:  POP  r1   
-1764:  POP  r0   
-1766:  RET 
-1767:  PUSH r0   
-1769:  PUSH r2   
-1771:  PUSH r3   
-1773:  PUSH r4   
-1775:  PUSH r5   
-1777:  ADD  r2    r1    r0   
-1781:  SET  r0    r1   
-1784:  SET  r5    0    
-1787:  ADD  r0    r0    1    
-1791:  GT   r3    r0    r2   
-1795:  JT   r3    1816 
-1798:  IN   r4   
-1800:  EQ   r3    r4    10   
-1804:  JT   r3    1816 
-1807:  WMEM r0    r4   
-1810:  ADD  r5    r5    1    
-1814:  JMP  1787 
-1816:  WMEM r1    r5   
-1819:  EQ   r3    r4    10   
-1823:  JT   r3    1830 
-1826:  IN   r4   
-1828:  JMP  1819 
-1830:  POP  r5   
-1832:  POP  r4   
-1834:  POP  r3   
-1836:  POP  r2   
-1838:  POP  r0   
-1840:  RET 
-1841:  PUSH r3   
-1843:  PUSH r4   
-1845:  PUSH r5   
-1847:  PUSH r6   
-1849:  SET  r6    1    
-1852:  ADD  r4    r3    r6   
-1856:  RMEM r4    r4   
-1859:  ADD  r5    6125  r6   
-1863:  WMEM r5    r4   
-1866:  ADD  r6    r6    1    
-1870:  RMEM r5    6125 
-1873:  GT   r4    r6    r5   
-1877:  JF   r4    1852 
-1880:  SET  r3    0    
-1883:  SET  r4    0    
-1886:  RMEM r5    6125 
-1889:  MOD  r5    r4    r5   
-1893:  ADD  r5    r5    6125 
-1897:  ADD  r5    r5    1    
-1901:  RMEM r6    r5   
-1904:  MULT r6    r6    5249 
-1908:  ADD  r6    r6    12345
-1912:  WMEM r5    r6   
-1915:  PUSH r0   
-1917:  PUSH r1   
-1919:  SET  r1    r6   
-1922:  CALL 2125 
-1924:  SET  r6    r0   
-1927:  POP  r1   
-1929:  POP  r0   
-1931:  RMEM r5    r1   
-1934:  MOD  r6    r6    r5   
-1938:  ADD  r6    r6    1    
-1942:  GT   r5    r6    r2   
-1946:  JT   r5    1952 
-1949:  SET  r3    1    
-1952:  ADD  r6    r6    r1   
-1956:  RMEM r6    r6   
-1959:  ADD  r4    r4    1    
-1963:  ADD  r5    r4    6129 
-1967:  WMEM r5    r6   
-1970:  RMEM r5    6129 
-1973:  EQ   r5    r4    r5   
-1977:  JF   r5    1886 
-1980:  JF   r3    1880 
-1983:  PUSH r0   
-1985:  SET  r0    6129 
-1988:  CALL 1518 
-1990:  POP  r0   
-1992:  POP  r6   
-1994:  POP  r5   
-1996:  POP  r4   
-1998:  POP  r3   
-2000:  RET 
-2001:  PUSH r0   
-2003:  PUSH r1   
-2005:  PUSH r2   
-2007:  PUSH r3   
-2009:  PUSH r4   
-2011:  PUSH r5   
-2013:  SET  r2    1    
-2016:  SET  r5    0    
-2019:  JF   r0    2092 
-2022:  EQ   r4    r2    10000
-2026:  SET  r3    r0   
-2029:  JT   r4    2040 
-2032:  MULT r1    r2    10   
-2036:  MOD  r3    r0    r1   
-2040:  SET  r4    0    
-2043:  MULT r2    r2    32767
-2047:  JF   r3    2060 
-2050:  ADD  r4    r4    1    
-2054:  ADD  r3    r3    r2   
-2058:  JMP  2047 
-2060:  MULT r2    r2    32767
-2064:  MULT r3    r4    r2   
-2068:  MULT r3    r3    32767
-2072:  ADD  r0    r0    r3   
-2076:  ADD  r4    r4    48   
-2080:  MULT r2    r2    10   
-2084:  ADD  r5    r5    1    
-2088:  PUSH r4   
-2090:  JMP  2019 
-2092:  JT   r5    2099 
-2095:  OUT  '0'
-2097:  JMP  2112 
-2099:  JF   r5    2112 
-2102:  POP  r0   
-2104:  OUT  r0
-2106:  ADD  r5    r5    32767
-2110:  JMP  2099 
-2112:  POP  r5   
-2114:  POP  r4   
-2116:  POP  r3   
-2118:  POP  r2   
-2120:  POP  r1   
-2122:  POP  r0   
-2124:  RET 
-2125:  PUSH r1   
-2127:  PUSH r2   
-2129:  AND  r2    r0    r1   
-2133:  NOT  r2    r2   
-2136:  OR   r0    r0    r1   
-2140:  AND  r0    r0    r2   
-2144:  POP  r2   
-2146:  POP  r1   
-2148:  RET 
-2149:  ADD  r0    r0    r1   
-2153:  GT   r1    r1    r0   
-2157:  RET 
-2158:  PUSH r2   
-2160:  GT   r2    r1    r0   
-2164:  MULT r1    r1    32767
-2168:  ADD  r0    r0    r1   
-2172:  SET  r1    r2   
-2175:  POP  r2   
-2177:  RET 
-2178:  JF   r0    2241 
-2181:  JF   r1    2241 
-2184:  PUSH r2   
-2186:  PUSH r3   
-2188:  GT   r2    r1    r0   
-2192:  JT   r2    2204 
-2195:  SET  r2    r0   
-2198:  SET  r0    r1   
-2201:  SET  r1    r2   
-2204:  SET  r2    r0   
-2207:  SET  r0    0    
-2210:  ADD  r0    r0    r1   
-2214:  GT   r3    r1    r0   
-2218:  JT   r3    2233 
-2221:  ADD  r2    r2    32767
-2225:  JT   r2    2210 
-2228:  SET  r1    0    
-2231:  JMP  2236 
-2233:  SET  r1    1    
-2236:  POP  r3   
-2238:  POP  r2   
-2240:  RET 
-2241:  SET  r0    0    
-2244:  SET  r1    0    
-2247:  RET 
-2248:  PUSH r1   
-2250:  PUSH r2   
-2252:  JF   r1    2276 
-2255:  ADD  r1    r1    32767
-2259:  AND  r2    r0    16384
-2263:  MULT r0    r0    2    
-2267:  JF   r2    2252 
-2270:  OR   r0    r0    1    
-2274:  JMP  2252 
-2276:  POP  r2   
-2278:  POP  r1   
-2280:  RET 
-2281:  PUSH r1   
-2283:  GT   r1    r0    14   
-2287:  JT   r1    2309 
-2290:  SET  r1    r0   
-2293:  SET  r0    1    
-2296:  JF   r1    2312 
-2299:  ADD  r1    r1    32767
-2303:  MULT r0    r0    2    
-2307:  JMP  2296 
-2309:  SET  r0    32767
-2312:  POP  r1   
-2314:  RET 
-2315:  JMP  2734 
-2317:  DATA: 6142
-2318:  DATA: 6152
-2319:  DATA: 26900
-2320:  DATA: 26903
-2321:  HALT
-2322:  DATA: 6350
-2323:  DATA: 6360
-2324:  DATA: 26906
-2325:  DATA: 26908
-2326:  HALT
-2327:  DATA: 6441
-2328:  DATA: 6451
-2329:  DATA: 26910
-2330:  DATA: 26913
-2331:  HALT
-2332:  DATA: 6597
-2333:  DATA: 6607
-2334:  DATA: 26916
-2335:  DATA: 26919
-2336:  HALT
-2337:  DATA: 6711
-2338:  DATA: 6721
-2339:  DATA: 26922
-2340:  DATA: 26925
-2341:  HALT
-2342:  DATA: 6922
-2343:  DATA: 6934
-2344:  DATA: 26928
-2345:  DATA: 26931
-2346:  HALT
-2347:  DATA: 7070
-2348:  DATA: 7095
-2349:  DATA: 26934
-2350:  DATA: 26936
-2351:  HALT
-2352:  DATA: 7270
-2353:  DATA: 7282
-2354:  DATA: 26938
-2355:  DATA: 26941
-2356:  HALT
-2357:  DATA: 7502
-2358:  DATA: 7514
-2359:  DATA: 26944
-2360:  DATA: 26946
-2361:  HALT
-2362:  DATA: 7616
-2363:  DATA: 7628
-2364:  DATA: 26948
-2365:  DATA: 26951
-2366:  HALT
-2367:  DATA: 7799
-2368:  DATA: 7807
-2369:  DATA: 26954
-2370:  DATA: 26958
-2371:  HALT
-2372:  DATA: 8007
-2373:  DATA: 26962
-2374:  DATA: 26965
-2375:  DATA: 26968
-2376:  HALT
-2377:  DATA: 8163
-2378:  DATA: 8179
-2379:  DATA: 26971
-2380:  DATA: 26977
-2381:  DATA: 3742
-2382:  DATA: 8332
-2383:  DATA: 8348
-2384:  DATA: 26983
-2385:  DATA: 26987
-2386:  DATA: 3746
-2387:  DATA: 8421
-2388:  DATA: 8437
-2389:  DATA: 26991
-2390:  DATA: 26995
-2391:  DATA: 3756
-2392:  DATA: 8510
-2393:  DATA: 8526
-2394:  DATA: 26999
-2395:  DATA: 27004
-2396:  DATA: 3766
-2397:  DATA: 8673
-2398:  DATA: 8689
-2399:  DATA: 27009
-2400:  DATA: 27013
-2401:  DATA: 3776
-2402:  DATA: 8762
-2403:  DATA: 8778
-2404:  DATA: 27017
-2405:  DATA: 27022
-2406:  DATA: 3786
-2407:  DATA: 8932
-2408:  DATA: 8948
-2409:  DATA: 27027
-2410:  DATA: 27031
-2411:  DATA: 3796
-2412:  DATA: 9021
-2413:  DATA: 9037
-2414:  DATA: 27035
-2415:  DATA: 27037
-2416:  DATA: 3806
-2417:  DATA: 9098
-2418:  DATA: 9114
-2419:  DATA: 27039
-2420:  DATA: 27041
-2421:  HALT
-2422:  DATA: 9175
-2423:  DATA: 9191
-2424:  DATA: 27043
-2425:  DATA: 27046
-2426:  DATA: 3656
-2427:  DATA: 9259
-2428:  DATA: 9272
-2429:  DATA: 27049
-2430:  DATA: 27052
-2431:  DATA: 3656
-2432:  DATA: 9397
-2433:  DATA: 9410
-2434:  DATA: 27055
-2435:  DATA: 27058
-2436:  DATA: 3656
-2437:  DATA: 9455
-2438:  DATA: 9468
-2439:  DATA: 27061
-2440:  DATA: 27064
-2441:  DATA: 3656
-2442:  DATA: 9513
-2443:  DATA: 9526
-2444:  DATA: 27067
-2445:  DATA: 27070
-2446:  DATA: 3656
-2447:  DATA: 9637
-2448:  DATA: 9643
-2449:  DATA: 27073
-2450:  DATA: 27076
-2451:  HALT
-2452:  DATA: 9903
-2453:  DATA: 9909
-2454:  DATA: 27079
-2455:  DATA: 27082
-2456:  HALT
-2457:  DATA: 10103
-2458:  DATA: 10109
-2459:  DATA: 27085
-2460:  DATA: 27090
-2461:  HALT
-2462:  HALT
-2463:  DATA: 10425
-2464:  DATA: 10431
-2465:  DATA: 27107
-2466:  DATA: 27109
-2467:  DATA: 3893
-2468:  DATA: 10605
-2469:  DATA: 10611
-2470:  DATA: 27111
-2471:  DATA: 27114
-2472:  HALT
-2473:  DATA: 10760
-2474:  DATA: 10766
-2475:  DATA: 27117
-2476:  DATA: 27119
-2477:  HALT
-2478:  DATA: 10892
-2479:  DATA: 10898
-2480:  DATA: 27121
-2481:  DATA: 27124
-2482:  HALT
-2483:  DATA: 11086
-2484:  DATA: 11092
-2485:  DATA: 27127
-2486:  DATA: 27129
-2487:  HALT
-2488:  DATA: 11267
-2489:  DATA: 11288
-2490:  DATA: 27131
-2491:  DATA: 27133
-2492:  HALT
-2493:  DATA: 11552
-2494:  DATA: 11573
-2495:  DATA: 27135
-2496:  DATA: 27137
-2497:  HALT
-2498:  DATA: 11726
-2499:  DATA: 11732
-2500:  DATA: 27139
-2501:  DATA: 27143
-2502:  HALT
-2503:  DATA: 11919
-2504:  DATA: 11925
-2505:  DATA: 27147
-2506:  DATA: 27150
-2507:  HALT
-2508:  DATA: 12199
-2509:  DATA: 12205
-2510:  DATA: 27153
-2511:  DATA: 27156
-2512:  HALT
-2513:  DATA: 12459
-2514:  DATA: 12475
-2515:  DATA: 27159
-2516:  DATA: 27163
-2517:  HALT
-2518:  DATA: 12691
-2519:  DATA: 12707
-2520:  DATA: 27167
-2521:  DATA: 27171
-2522:  HALT
-2523:  DATA: 12847
-2524:  DATA: 12863
-2525:  DATA: 27175
-2526:  DATA: 27178
-2527:  HALT
-2528:  DATA: 13106
-2529:  DATA: 13122
-2530:  DATA: 27181
-2531:  DATA: 27184
-2532:  HALT
-2533:  DATA: 13420
-2534:  DATA: 13436
-2535:  DATA: 27187
-2536:  DATA: 27190
-2537:  HALT
-2538:  DATA: 13694
-2539:  DATA: 13708
-2540:  DATA: 27193
-2541:  DATA: 27196
-2542:  HALT
-2543:  DATA: 13941
-2544:  DATA: 13955
-2545:  DATA: 27199
-2546:  DATA: 27202
-2547:  HALT
-2548:  DATA: 14090
-2549:  DATA: 14104
-2550:  DATA: 27205
-2551:  DATA: 27209
-2552:  HALT
-2553:  DATA: 14444
-2554:  DATA: 14465
-2555:  DATA: 27213
-2556:  DATA: 27215
-2557:  HALT
-2558:  DATA: 14634
-2559:  DATA: 14648
-2560:  DATA: 27217
-2561:  DATA: 27220
-2562:  DATA: 4611
-2563:  DATA: 14765
-2564:  DATA: 14776
-2565:  DATA: 27223
-2566:  DATA: 27226
-2567:  DATA: 3958
-2568:  DATA: 14916
-2569:  DATA: 14927
-2570:  DATA: 27229
-2571:  DATA: 27233
-2572:  DATA: 3975
-2573:  DATA: 15074
-2574:  DATA: 15085
-2575:  DATA: 27237
-2576:  DATA: 27241
-2577:  DATA: 3992
-2578:  DATA: 15230
-2579:  DATA: 15241
-2580:  DATA: 27245
-2581:  DATA: 27249
-2582:  DATA: 4009
-2583:  DATA: 15505
-2584:  DATA: 15516
-2585:  DATA: 27253
-2586:  DATA: 27257
-2587:  DATA: 4028
-2588:  DATA: 15664
-2589:  DATA: 15675
-2590:  DATA: 27261
-2591:  DATA: 27266
-2592:  DATA: 4045
-2593:  DATA: 15826
-2594:  DATA: 15837
-2595:  DATA: 27271
-2596:  DATA: 27276
-2597:  DATA: 4062
-2598:  DATA: 15991
-2599:  DATA: 16002
-2600:  DATA: 27281
-2601:  DATA: 27285
-2602:  DATA: 4079
-2603:  DATA: 16148
-2604:  DATA: 16159
-2605:  DATA: 27289
-2606:  DATA: 27293
-2607:  DATA: 4096
-2608:  DATA: 16305
-2609:  DATA: 16316
-2610:  DATA: 27297
-2611:  DATA: 27302
-2612:  DATA: 4113
-2613:  DATA: 16469
-2614:  DATA: 16480
-2615:  DATA: 27307
-2616:  DATA: 27312
-2617:  DATA: 4130
-2618:  DATA: 16631
-2619:  DATA: 16642
-2620:  DATA: 27317
-2621:  DATA: 27321
-2622:  DATA: 4147
-2623:  DATA: 16791
-2624:  DATA: 16809
-2625:  DATA: 27325
-2626:  DATA: 27329
-2627:  DATA: 4164
-2628:  DATA: 16971
-2629:  DATA: 16982
-2630:  DATA: 27333
-2631:  DATA: 27337
-2632:  DATA: 4167
-2633:  DATA: 17127
-2634:  DATA: 17138
-2635:  DATA: 27341
-2636:  DATA: 27345
-2637:  DATA: 4184
-2638:  DATA: 17285
-2639:  DATA: 17296
-2640:  DATA: 27349
-2641:  DATA: 27352
-2642:  DATA: 4201
-2643:  DATA: 17436
-2644:  DATA: 17442
-2645:  DATA: 27355
-2646:  DATA: 27357
-2647:  DATA: 4690
-2648:  DATA: 17661
-2649:  DATA: 17693
-2650:  DATA: 27359
-2651:  DATA: 27362
-2652:  HALT
-2653:  DATA: 17806
-2654:  DATA: 17838
-2655:  DATA: 27365
-2656:  DATA: 27368
-2657:  HALT
-2658:  DATA: 17949
-2659:  DATA: 17967
-2660:  DATA: 27371
-2661:  DATA: 27375
-2662:  HALT
-2663:  DATA: 18055
-2664:  DATA: 18061
-2665:  DATA: 27379
-2666:  DATA: 27380
-2667:  DATA: 3701
-2668:  DATA: 18062
-2669:  DATA: 18069
-2670:  DATA: 2317
-2671:  DATA: 4720
-2672:  DATA: 18206
-2673:  DATA: 18220
-2674:  DATA: 2357
-2675:  HALT
-2676:  DATA: 18344
-2677:  DATA: 18352
-2678:  DATA: 32767
-2679:  DATA: 4885
-2680:  DATA: 18468
-2681:  DATA: 18480
-2682:  DATA: 32767
-2683:  DATA: 4931
-2684:  DATA: 18568
-2685:  DATA: 18572
-2686:  DATA: 2417
-2687:  DATA: 4799
-2688:  DATA: 18618
-2689:  DATA: 18627
-2690:  DATA: 2452
-2691:  DATA: 5360
-2692:  DATA: 18691
-2693:  DATA: 18705
-2694:  DATA: 2473
-2695:  DATA: 5377
-2696:  DATA: 18769
-2697:  DATA: 18780
-2698:  DATA: 2483
-2699:  DATA: 5394
-2700:  DATA: 18852
-2701:  DATA: 18865
-2702:  DATA: 2468
-2703:  DATA: 5411
-2704:  DATA: 18953
-2705:  DATA: 18963
-2706:  DATA: 2478
-2707:  DATA: 5428
-2708:  DATA: 19029
-2709:  DATA: 19040
-2710:  DATA: 2463
-2711:  DATA: 5445
-2712:  DATA: 19113
-2713:  DATA: 19127
-2714:  DATA: 2488
-2715:  HALT
-2716:  DATA: 19192
-2717:  DATA: 19196
-2718:  DATA: 2623
-2719:  HALT
-2720:  DATA: 19258
-2721:  DATA: 19265
-2722:  DATA: 2643
-2723:  DATA: 5721
-2724:  DATA: 19384
-2725:  DATA: 19397
-2726:  DATA: 2488
-2727:  HALT
-2728:  DATA: 22093
-2729:  DATA: 22101
-2730:  DATA: 2553
-2731:  HALT
-2732:  DATA: 2317
-2733:  HALT
-2734:  PUSH r0   
-2736:  PUSH r1   
-2738:  PUSH r2   
-2740:  PUSH r3   
-2742:  RMEM r1    2732 
-2745:  RMEM r0    2733 
-2748:  EQ   r0    r0    r1   
-2752:  JT   r0    2770 
-2755:  RMEM r0    2732 
-2758:  ADD  r0    r0    4    
-2762:  RMEM r0    r0   
-2765:  JF   r0    2770 
-2768:  CALL r0   
-2770:  RMEM r1    2732 
-2773:  RMEM r0    2733 
-2776:  EQ   r0    r0    r1   
-2780:  JT   r0    2791 
-2783:  SET  r0    25974
-2786:  WMEM r0    0    
-2789:  CALL 2964 
-2791:  WMEM 2733  r1   
-2794:  PUSH r0   
-2796:  PUSH r1   
-2798:  PUSH r2   
-2800:  SET  r0    27414
-2803:  SET  r1    1531 
-2806:  ADD  r2    6407  10488
-2810:  CALL 1458 
-2812:  POP  r2   
-2814:  POP  r1   
-2816:  POP  r0   
-2818:  SET  r0    32   
-2821:  SET  r1    25974
-2824:  CALL 1767 
-2826:  OUT  '\n'
-2828:  OUT  '\n'
-2830:  SET  r0    25974
-2833:  SET  r1    32   
-2836:  CALL 1571 
-2838:  EQ   r1    r0    32767
-2842:  JF   r1    2848 
-2845:  RMEM r0    25974
-2848:  SET  r2    r0   
-2851:  RMEM r1    25974
-2854:  PUSH r1   
-2856:  WMEM 25974 r2   
-2859:  SET  r0    27398
-2862:  SET  r1    25974
-2865:  CALL 1588 
-2867:  POP  r1   
-2869:  WMEM 25974 r1   
-2872:  EQ   r1    r0    32767
-2876:  JF   r1    2885 
-2879:  SET  r0    0    
-2882:  SET  r2    0    
-2885:  ADD  r1    27406 1    
-2889:  ADD  r1    r1    r0   
-2893:  RMEM r1    r1   
-2896:  RMEM r3    25974
-2899:  EQ   r3    r3    r2   
-2903:  JT   r3    2944 
-2906:  MULT r0    r2    32767
-2910:  RMEM r3    25974
-2913:  ADD  r3    r0    r3   
-2917:  JF   r2    2924 
-2920:  ADD  r3    r3    32767
-2924:  MOD  r3    r3    32   
-2928:  ADD  r0    25974 r2   
-2932:  JF   r2    2939 
-2935:  ADD  r0    r0    1    
-2939:  WMEM r0    r3   
-2942:  JMP  2950 
-2944:  SET  r0    25974
-2947:  WMEM r0    0    
-2950:  CALL r1   
-2952:  JT   r1    2742 
-2955:  POP  r3   
-2957:  POP  r2   
-2959:  POP  r1   
-2961:  POP  r0   
-2963:  RET 
-2964:  PUSH r0   
-2966:  PUSH r1   
-2968:  PUSH r2   
-2970:  RMEM r1    r0   
-2973:  JF   r1    3032 
-2976:  CALL 5921 
-2978:  JF   r0    3006 
-2981:  PUSH r0   
-2983:  CALL 5990 
-2985:  SET  r1    r0   
-2988:  POP  r0   
-2990:  JF   r1    3006 
-2993:  ADD  r1    r0    1    
-2997:  RMEM r0    r1   
-3000:  CALL 1518 
-3002:  OUT  '\n'
-3004:  JMP  3238 
-3006:  PUSH r0   
-3008:  PUSH r1   
-3010:  PUSH r2   
-3012:  SET  r0    27432
-3015:  SET  r1    1531 
-3018:  ADD  r2    4492  21100
-3022:  CALL 1458 
-3024:  POP  r2   
-3026:  POP  r1   
-3028:  POP  r0   
-3030:  JMP  3238 
-3032:  RMEM r0    2732 
-3035:  PUSH r0   
-3037:  OUT  '='
-3039:  OUT  '='
-3041:  OUT  ' '
-3043:  ADD  r0    r0    0    
-3047:  RMEM r0    r0   
-3050:  CALL 1518 
-3052:  OUT  ' '
-3054:  OUT  '='
-3056:  OUT  '='
-3058:  OUT  '\n'
-3060:  POP  r0   
-3062:  PUSH r0   
-3064:  ADD  r0    r0    1    
-3068:  RMEM r0    r0   
-3071:  RMEM r1    r0   
-3074:  EQ   r1    r1    2    
-3078:  JF   r1    3104 
-3081:  PUSH r0   
-3083:  SET  r0    2680 
-3086:  CALL 5990 
-3088:  SET  r1    r0   
-3091:  POP  r0   
-3093:  ADD  r0    r0    1    
-3097:  ADD  r0    r0    r1   
-3101:  RMEM r0    r0   
-3104:  CALL 1518 
-3106:  OUT  '\n'
-3108:  POP  r0   
-3110:  PUSH r0   
-3112:  CALL 5823 
-3114:  JF   r0    3146 
-3117:  PUSH r0   
-3119:  PUSH r1   
-3121:  PUSH r2   
-3123:  SET  r0    27455
-3126:  SET  r1    1531 
-3129:  ADD  r2    4024  12730
-3133:  CALL 1458 
-3135:  POP  r2   
-3137:  POP  r1   
-3139:  POP  r0   
-3141:  RMEM r2    2732 
-3144:  CALL 5876 
-3146:  POP  r0   
-3148:  PUSH r0   
-3150:  ADD  r0    r0    2    
-3154:  RMEM r0    r0   
-3157:  RMEM r0    r0   
-3160:  EQ   r2    r0    1    
-3164:  OUT  '\n'
-3166:  OUT  'T'
-3168:  OUT  'h'
-3170:  OUT  'e'
-3172:  OUT  'r'
-3174:  OUT  'e'
-3176:  OUT  ' '
-3178:  JT   r2    3189 
-3181:  OUT  'a'
-3183:  OUT  'r'
-3185:  OUT  'e'
-3187:  JMP  3193 
-3189:  OUT  'i'
-3191:  OUT  's'
-3193:  OUT  ' '
-3195:  CALL 2001 
-3197:  OUT  ' '
-3199:  OUT  'e'
-3201:  OUT  'x'
-3203:  OUT  'i'
-3205:  OUT  't'
-3207:  EQ   r2    r0    1    
-3211:  JT   r2    3216 
-3214:  OUT  's'
-3216:  OUT  ':'
-3218:  OUT  '\n'
-3220:  POP  r0   
-3222:  PUSH r0   
-3224:  ADD  r0    r0    2    
-3228:  RMEM r0    r0   
-3231:  SET  r1    5814 
-3234:  CALL 1458 
-3236:  POP  r0   
-3238:  POP  r2   
-3240:  POP  r1   
-3242:  POP  r0   
-3244:  RET 
-3245:  PUSH r0   
-3247:  PUSH r1   
-3249:  PUSH r2   
-3251:  SET  r1    r0   
-3254:  RMEM r0    2732 
-3257:  ADD  r0    r0    2    
-3261:  RMEM r0    r0   
-3264:  CALL 1588 
-3266:  EQ   r2    r0    32767
-3270:  JT   r2    3302 
-3273:  RMEM r2    2732 
-3276:  ADD  r2    r2    3    
-3280:  RMEM r2    r2   
-3283:  ADD  r2    r2    1    
-3287:  ADD  r2    r2    r0   
-3291:  RMEM r2    r2   
-3294:  WMEM 2732  r2   
-3297:  WMEM 2733  0    
-3300:  JMP  3326 
-3302:  PUSH r0   
-3304:  PUSH r1   
-3306:  PUSH r2   
-3308:  SET  r0    27482
-3311:  SET  r1    1531 
-3314:  ADD  r2    1864  4776 
-3318:  CALL 1458 
-3320:  POP  r2   
-3322:  POP  r1   
-3324:  POP  r0   
-3326:  POP  r2   
-3328:  POP  r1   
-3330:  POP  r0   
-3332:  RET 
-3333:  PUSH r0   
-3335:  PUSH r0   
-3337:  PUSH r1   
-3339:  PUSH r2   
-3341:  SET  r0    27532
-3344:  SET  r1    1531 
-3347:  ADD  r2    3699  4858 
-3351:  CALL 1458 
-3353:  POP  r2   
-3355:  POP  r1   
-3357:  POP  r0   
-3359:  POP  r0   
-3361:  RET 
-3362:  PUSH r0   
-3364:  PUSH r2   
-3366:  PUSH r0   
-3368:  PUSH r1   
-3370:  PUSH r2   
-3372:  SET  r0    28037
-3375:  SET  r1    1531 
-3378:  ADD  r2    4075  14467
-3382:  CALL 1458 
-3384:  POP  r2   
-3386:  POP  r1   
-3388:  POP  r0   
-3390:  SET  r2    0    
-3393:  CALL 5876 
-3395:  POP  r2   
-3397:  POP  r0   
-3399:  RET 
-3400:  PUSH r0   
-3402:  PUSH r1   
-3404:  PUSH r2   
-3406:  CALL 5921 
-3408:  JF   r0    3457 
-3411:  ADD  r1    r0    2    
-3415:  RMEM r0    r1   
-3418:  RMEM r2    2732 
-3421:  EQ   r2    r0    r2   
-3425:  JF   r2    3457 
-3428:  WMEM r1    0    
-3431:  PUSH r0   
-3433:  PUSH r1   
-3435:  PUSH r2   
-3437:  SET  r0    28054
-3440:  SET  r1    1531 
-3443:  ADD  r2    973   4913 
-3447:  CALL 1458 
-3449:  POP  r2   
-3451:  POP  r1   
-3453:  POP  r0   
-3455:  JMP  3481 
-3457:  PUSH r0   
-3459:  PUSH r1   
-3461:  PUSH r2   
-3463:  SET  r0    28062
-3466:  SET  r1    1531 
-3469:  ADD  r2    11382 1281 
-3473:  CALL 1458 
-3475:  POP  r2   
-3477:  POP  r1   
-3479:  POP  r0   
-3481:  POP  r2   
-3483:  POP  r1   
-3485:  POP  r0   
-3487:  RET 
-3488:  PUSH r0   
-3490:  PUSH r1   
-3492:  CALL 5921 
-3494:  JF   r0    3539 
-3497:  ADD  r1    r0    2    
-3501:  RMEM r0    r1   
-3504:  JT   r0    3539 
-3507:  RMEM r0    2732 
-3510:  WMEM r1    r0   
-3513:  PUSH r0   
-3515:  PUSH r1   
-3517:  PUSH r2   
-3519:  SET  r0    28090
-3522:  SET  r1    1531 
-3525:  ADD  r2    4134  9810 
-3529:  CALL 1458 
-3531:  POP  r2   
-3533:  POP  r1   
-3535:  POP  r0   
-3537:  JMP  3563 
-3539:  PUSH r0   
-3541:  PUSH r1   
-3543:  PUSH r2   
-3545:  SET  r0    28100
-3548:  SET  r1    1531 
-3551:  ADD  r2    3164  1183 
-3555:  CALL 1458 
-3557:  POP  r2   
-3559:  POP  r1   
-3561:  POP  r0   
-3563:  POP  r1   
-3565:  POP  r0   
-3567:  RET 
-3568:  PUSH r0   
-3570:  PUSH r1   
-3572:  CALL 5921 
-3574:  JF   r0    3601 
-3577:  ADD  r1    r0    2    
-3581:  RMEM r1    r1   
-3584:  JT   r1    3601 
-3587:  ADD  r1    r0    3    
-3591:  RMEM r1    r1   
-3594:  JF   r1    3627 
-3597:  CALL r1   
-3599:  JMP  3651 
-3601:  PUSH r0   
-3603:  PUSH r1   
-3605:  PUSH r2   
-3607:  SET  r0    28135
-3610:  SET  r1    1531 
-3613:  ADD  r2    8926  13573
-3617:  CALL 1458 
-3619:  POP  r2   
-3621:  POP  r1   
-3623:  POP  r0   
-3625:  JMP  3651 
-3627:  PUSH r0   
-3629:  PUSH r1   
-3631:  PUSH r2   
-3633:  SET  r0    28170
-3636:  SET  r1    1531 
-3639:  ADD  r2    15871 13924
-3643:  CALL 1458 
-3645:  POP  r2   
-3647:  POP  r1   
-3649:  POP  r0   
-3651:  POP  r1   
-3653:  POP  r0   
-3655:  RET 
-3656:  PUSH r0   
-3658:  PUSH r1   
-3660:  PUSH r2   
-3662:  SET  r0    2680 
-3665:  CALL 5990 
-3667:  JT   r0    3694 
-3670:  ADD  r0    2676  2    
-3674:  WMEM r0    32767
-3677:  ADD  r0    2680  2    
-3681:  WMEM r0    32767
-3684:  ADD  r0    2672  2    
-3688:  WMEM r0    32767
-3691:  WMEM 2732  2648 
-3694:  POP  r2   
-3696:  POP  r1   
-3698:  POP  r0   
-3700:  RET 
-3701:  PUSH r0   
-3703:  PUSH r1   
-3705:  PUSH r2   
-3707:  SET  r0    28204
-3710:  SET  r1    1531 
-3713:  ADD  r2    2240  3644 
-3717:  CALL 1458 
-3719:  POP  r2   
-3721:  POP  r1   
-3723:  POP  r0   
-3725:  HALT
-3726:  HALT
-3727:  PUSH r1   
-3729:  RMEM r1    3726 
-3732:  OR   r1    r1    r0   
-3736:  WMEM 3726  r1   
-3739:  POP  r1   
-3741:  RET 
-3742:  WMEM 3726  0    
-3745:  RET 
-3746:  PUSH r0   
-3748:  SET  r0    1    
-3751:  CALL 3727 
-3753:  POP  r0   
-3755:  RET 
-3756:  PUSH r0   
-3758:  SET  r0    2    
-3761:  CALL 3727 
-3763:  POP  r0   
-3765:  RET 
-3766:  PUSH r0   
-3768:  SET  r0    4    
-3771:  CALL 3727 
-3773:  POP  r0   
-3775:  RET 
-3776:  PUSH r0   
-3778:  SET  r0    8    
-3781:  CALL 3727 
-3783:  POP  r0   
-3785:  RET 
-3786:  PUSH r0   
-3788:  SET  r0    16   
-3791:  CALL 3727 
-3793:  POP  r0   
-3795:  RET 
-3796:  PUSH r0   
-3798:  SET  r0    32   
-3801:  CALL 3727 
-3803:  POP  r0   
-3805:  RET 
-3806:  PUSH r0   
-3808:  PUSH r1   
-3810:  PUSH r2   
-3812:  PUSH r3   
-3814:  SET  r0    64   
-3817:  CALL 3727 
-3819:  PUSH r0   
-3821:  PUSH r1   
-3823:  PUSH r2   
-3825:  SET  r0    28236
-3828:  SET  r1    1531 
-3831:  ADD  r2    20974 8720 
-3835:  CALL 1458 
-3837:  POP  r2   
-3839:  POP  r1   
-3841:  POP  r0   
-3843:  RMEM r0    3726 
-3846:  SET  r1    25866
-3849:  SET  r2    32767
-3852:  SET  r3    28299
-3855:  CALL 1841 
-3857:  PUSH r0   
-3859:  PUSH r1   
-3861:  PUSH r2   
-3863:  SET  r0    28303
-3866:  SET  r1    1531 
-3869:  ADD  r2    24489 3154 
-3873:  CALL 1458 
-3875:  POP  r2   
-3877:  POP  r1   
-3879:  POP  r0   
-3881:  WMEM 2732  2417 
-3884:  POP  r3   
-3886:  POP  r2   
-3888:  POP  r1   
-3890:  POP  r0   
-3892:  RET 
-3893:  PUSH r0   
-3895:  PUSH r1   
-3897:  RMEM r0    2462 
-3900:  RMEM r1    27101
-3903:  EQ   r0    r0    r1   
-3907:  JT   r0    3940 
-3910:  PUSH r0   
-3912:  PUSH r1   
-3914:  PUSH r2   
-3916:  SET  r0    28347
-3919:  SET  r1    1531 
-3922:  ADD  r2    11851 14889
-3926:  CALL 1458 
-3928:  POP  r2   
-3930:  POP  r1   
-3932:  POP  r0   
-3934:  WMEM 2732  2457 
-3937:  WMEM 2733  2457 
-3940:  POP  r1   
-3942:  POP  r0   
-3944:  RET 
-3945:  DATA: 26007
-3946:  DATA: 26013
-3947:  DATA: 26017
-3948:  DATA: 2149
-3949:  DATA: 2158
-3950:  DATA: 2178
-3951:  HALT
-3952:  DATA: 22
-3953:  HALT
-3954:  HALT
-3955:  HALT
-3956:  HALT
-3957:  HALT
-3958:  PUSH r0   
-3960:  PUSH r1   
-3962:  SET  r0    2    
-3965:  SET  r1    0    
-3968:  CALL 4218 
-3970:  POP  r1   
-3972:  POP  r0   
-3974:  RET 
-3975:  PUSH r0   
-3977:  PUSH r1   
-3979:  SET  r0    8    
-3982:  SET  r1    1    
-3985:  CALL 4279 
-3987:  POP  r1   
-3989:  POP  r0   
-3991:  RET 
-3992:  PUSH r0   
-3994:  PUSH r1   
-3996:  SET  r0    1    
-3999:  SET  r1    2    
-4002:  CALL 4218 
-4004:  POP  r1   
-4006:  POP  r0   
-4008:  RET 
-4009:  PUSH r0   
-4011:  PUSH r1   
-4013:  SET  r0    1    
-4016:  SET  r1    3    
-4019:  CALL 4279 
-4021:  CALL 4533 
-4023:  POP  r1   
-4025:  POP  r0   
-4027:  RET 
-4028:  PUSH r0   
-4030:  PUSH r1   
-4032:  SET  r0    4    
-4035:  SET  r1    4    
-4038:  CALL 4279 
-4040:  POP  r1   
-4042:  POP  r0   
-4044:  RET 
-4045:  PUSH r0   
-4047:  PUSH r1   
-4049:  SET  r0    2    
-4052:  SET  r1    5    
-4055:  CALL 4218 
-4057:  POP  r1   
-4059:  POP  r0   
-4061:  RET 
-4062:  PUSH r0   
-4064:  PUSH r1   
-4066:  SET  r0    11   
-4069:  SET  r1    6    
-4072:  CALL 4279 
-4074:  POP  r1   
-4076:  POP  r0   
-4078:  RET 
-4079:  PUSH r0   
-4081:  PUSH r1   
-4083:  SET  r0    2    
-4086:  SET  r1    7    
-4089:  CALL 4218 
-4091:  POP  r1   
-4093:  POP  r0   
-4095:  RET 
-4096:  PUSH r0   
-4098:  PUSH r1   
-4100:  SET  r0    0    
-4103:  SET  r1    8    
-4106:  CALL 4218 
-4108:  POP  r1   
-4110:  POP  r0   
-4112:  RET 
-4113:  PUSH r0   
-4115:  PUSH r1   
-4117:  SET  r0    4    
-4120:  SET  r1    9    
-4123:  CALL 4279 
-4125:  POP  r1   
-4127:  POP  r0   
-4129:  RET 
-4130:  PUSH r0   
-4132:  PUSH r1   
-4134:  SET  r0    1    
-4137:  SET  r1    10   
-4140:  CALL 4218 
-4142:  POP  r1   
-4144:  POP  r0   
-4146:  RET 
-4147:  PUSH r0   
-4149:  PUSH r1   
-4151:  SET  r0    18   
-4154:  SET  r1    11   
-4157:  CALL 4279 
-4159:  POP  r1   
-4161:  POP  r0   
-4163:  RET 
-4164:  CALL 4611 
-4166:  RET 
-4167:  PUSH r0   
-4169:  PUSH r1   
-4171:  SET  r0    1    
-4174:  SET  r1    12   
-4177:  CALL 4218 
-4179:  POP  r1   
-4181:  POP  r0   
-4183:  RET 
-4184:  PUSH r0   
-4186:  PUSH r1   
-4188:  SET  r0    9    
-4191:  SET  r1    13   
-4194:  CALL 4279 
-4196:  POP  r1   
-4198:  POP  r0   
-4200:  RET 
-4201:  PUSH r0   
-4203:  PUSH r1   
-4205:  SET  r0    2    
-4208:  SET  r1    14   
-4211:  CALL 4218 
-4213:  POP  r1   
-4215:  POP  r0   
-4217:  RET 
-4218:  PUSH r0   
-4220:  PUSH r1   
-4222:  PUSH r2   
-4224:  ADD  r2    2716  2    
-4228:  RMEM r2    r2   
-4231:  JT   r2    4272 
-4234:  CALL 4405 
-4236:  WMEM 3951  r0   
-4239:  ADD  r1    r0    3945 
-4243:  RMEM r1    r1   
-4246:  SET  r0    26024
-4249:  CALL 1518 
-4251:  SET  r0    r1   
-4254:  CALL 1518 
-4256:  SET  r0    26088
-4259:  CALL 1518 
-4261:  SET  r0    r1   
-4264:  CALL 1518 
-4266:  OUT  '.'
-4268:  OUT  '\n'
-4270:  OUT  '\n'
-4272:  POP  r2   
-4274:  POP  r1   
-4276:  POP  r0   
-4278:  RET 
-4279:  PUSH r0   
-4281:  PUSH r1   
-4283:  PUSH r2   
-4285:  ADD  r2    2716  2    
-4289:  RMEM r2    r2   
-4292:  JT   r2    4398 
-4295:  CALL 4405 
-4297:  PUSH r0   
-4299:  RMEM r0    3951 
-4302:  ADD  r1    r0    3945 
-4306:  RMEM r1    r1   
-4309:  SET  r0    26122
-4312:  CALL 1518 
-4314:  SET  r0    r1   
-4317:  CALL 1518 
-4319:  SET  r0    26170
-4322:  CALL 1518 
-4324:  POP  r0   
-4326:  SET  r1    r0   
-4329:  RMEM r0    3952 
-4332:  RMEM r2    3951 
-4335:  ADD  r2    r2    3948 
-4339:  RMEM r2    r2   
-4342:  CALL r2   
-4344:  JT   r1    4391 
-4347:  RMEM r1    3952 
-4350:  WMEM 3952  r0   
-4353:  GT   r2    r0    r1   
-4357:  JF   r2    4369 
-4360:  PUSH r0   
-4362:  SET  r0    26235
-4365:  CALL 1518 
-4367:  POP  r0   
-4369:  GT   r2    r1    r0   
-4373:  JF   r2    4385 
-4376:  PUSH r0   
-4378:  SET  r0    26267
-4381:  CALL 1518 
-4383:  POP  r0   
-4385:  OUT  '\n'
-4387:  OUT  '\n'
-4389:  JMP  4398 
-4391:  CALL 4660 
-4393:  SET  r0    26299
-4396:  CALL 1518 
-4398:  POP  r2   
-4400:  POP  r1   
-4402:  POP  r0   
-4404:  RET 
-4405:  PUSH r0   
-4407:  PUSH r1   
-4409:  PUSH r2   
-4411:  PUSH r3   
-4413:  PUSH r4   
-4415:  PUSH r5   
-4417:  RMEM r5    3953 
-4420:  GT   r3    r5    29999
-4424:  JT   r3    4434 
-4427:  ADD  r5    r5    1    
-4431:  WMEM 3953  r5   
-4434:  SET  r3    r0   
-4437:  SET  r4    r1   
-4440:  ADD  r0    r5    2    
-4444:  CALL 2281 
-4446:  RMEM r1    3954 
-4449:  OR   r0    r1    r0   
-4453:  SET  r1    r4   
-4456:  CALL 2248 
-4458:  WMEM 3954  r0   
-4461:  SET  r0    3955 
-4464:  ADD  r1    r5    2    
-4468:  SET  r2    r4   
-4471:  CALL 4515 
-4473:  SET  r0    3956 
-4476:  MULT r1    r5    r5   
-4480:  MULT r2    r4    r4   
-4484:  CALL 4515 
-4486:  SET  r0    3957 
-4489:  SET  r1    13   
-4492:  MULT r2    r3    9    
-4496:  MULT r2    r2    r2   
-4500:  CALL 4515 
-4502:  POP  r5   
-4504:  POP  r4   
-4506:  POP  r3   
-4508:  POP  r2   
-4510:  POP  r1   
-4512:  POP  r0   
-4514:  RET 
-4515:  PUSH r0   
-4517:  RMEM r0    r0   
-4520:  CALL 2248 
-4522:  SET  r1    r2   
-4525:  CALL 2125 
-4527:  POP  r1   
-4529:  WMEM r1    r0   
-4532:  RET 
-4533:  PUSH r0   
-4535:  ADD  r0    2716  2    
-4539:  RMEM r0    r0   
-4542:  JT   r0    4608 
-4545:  SET  r0    26321
-4548:  CALL 1518 
-4550:  RMEM r0    3952 
-4553:  EQ   r0    r0    30   
-4557:  JT   r0    4574 
-4560:  SET  r0    26354
-4563:  CALL 1518 
-4565:  SET  r0    26398
-4568:  CALL 1518 
-4570:  CALL 4660 
-4572:  JMP  4608 
-4574:  SET  r0    26440
-4577:  CALL 1518 
-4579:  RMEM r0    3954 
-4582:  ADD  r0    r0    1    
-4586:  JT   r0    4596 
-4589:  SET  r0    26484
-4592:  CALL 1518 
-4594:  JMP  4565 
-4596:  SET  r0    26584
-4599:  CALL 1518 
-4601:  ADD  r0    2716  2    
-4605:  WMEM r0    32767
-4608:  POP  r0   
-4610:  RET 
-4611:  PUSH r0   
-4613:  ADD  r0    2716  2    
-4617:  RMEM r0    r0   
-4620:  JT   r0    4657 
-4623:  SET  r0    26717
-4626:  CALL 1518 
-4628:  RMEM r0    2732 
-4631:  EQ   r0    r0    2623 
-4635:  JT   r0    4645 
-4638:  SET  r0    26725
-4641:  CALL 1518 
-4643:  JMP  4650 
-4645:  SET  r0    26731
-4648:  CALL 1518 
-4650:  SET  r0    26737
-4653:  CALL 1518 
-4655:  CALL 4660 
-4657:  POP  r0   
-4659:  RET 
-4660:  PUSH r0   
-4662:  WMEM 3952  22   
-4665:  WMEM 3953  0    
-4668:  WMEM 3954  0    
-4671:  WMEM 3955  0    
-4674:  WMEM 3956  0    
-4677:  WMEM 3957  0    
-4680:  ADD  r0    2716  2    
-4684:  WMEM r0    2623 
-4687:  POP  r0   
-4689:  RET 
-4690:  PUSH r0   
-4692:  ADD  r0    2716  2    
-4696:  RMEM r0    r0   
-4699:  EQ   r0    r0    32767
-4703:  JT   r0    4717 
-4706:  SET  r0    26824
-4709:  CALL 1518 
-4711:  WMEM 2732  2578 
-4714:  WMEM 2733  2578 
-4717:  POP  r0   
-4719:  RET 
-4720:  PUSH r0   
-4722:  PUSH r1   
-4724:  PUSH r2   
-4726:  PUSH r3   
-4728:  PUSH r0   
-4730:  PUSH r1   
-4732:  PUSH r2   
-4734:  SET  r0    28369
-4737:  SET  r1    1531 
-4740:  ADD  r2    11257 1670 
-4744:  CALL 1458 
-4746:  POP  r2   
-4748:  POP  r1   
-4750:  POP  r0   
-4752:  SET  r0    4242 
-4755:  SET  r1    25866
-4758:  SET  r2    32767
-4761:  SET  r3    28397
-4764:  CALL 1841 
-4766:  PUSH r0   
-4768:  PUSH r1   
-4770:  PUSH r2   
-4772:  SET  r0    28401
-4775:  SET  r1    1531 
-4778:  ADD  r2    4295  20766
-4782:  CALL 1458 
-4784:  POP  r2   
-4786:  POP  r1   
-4788:  POP  r0   
-4790:  POP  r3   
-4792:  POP  r2   
-4794:  POP  r1   
-4796:  POP  r0   
-4798:  RET 
-4799:  PUSH r0   
-4801:  ADD  r0    2672  2    
-4805:  RMEM r0    r0   
-4808:  JT   r0    4858 
-4811:  ADD  r0    2684  2    
-4815:  WMEM r0    32767
-4818:  ADD  r0    2672  2    
-4822:  WMEM r0    32767
-4825:  ADD  r0    2676  2    
-4829:  WMEM r0    0    
-4832:  PUSH r0   
-4834:  PUSH r1   
-4836:  PUSH r2   
-4838:  SET  r0    28453
-4841:  SET  r1    1531 
-4844:  ADD  r2    18845 13524
-4848:  CALL 1458 
-4850:  POP  r2   
-4852:  POP  r1   
-4854:  POP  r0   
-4856:  JMP  4882 
-4858:  PUSH r0   
-4860:  PUSH r1   
-4862:  PUSH r2   
-4864:  SET  r0    28510
-4867:  SET  r1    1531 
-4870:  ADD  r2    2056  862  
-4874:  CALL 1458 
-4876:  POP  r2   
-4878:  POP  r1   
-4880:  POP  r0   
-4882:  POP  r0   
-4884:  RET 
-4885:  PUSH r0   
-4887:  ADD  r0    2676  2    
-4891:  WMEM r0    32767
-4894:  ADD  r0    2680  2    
-4898:  WMEM r0    0    
-4901:  PUSH r0   
-4903:  PUSH r1   
-4905:  PUSH r2   
-4907:  SET  r0    28569
-4910:  SET  r1    1531 
-4913:  ADD  r2    187   28589
-4917:  CALL 1458 
-4919:  POP  r2   
-4921:  POP  r1   
-4923:  POP  r0   
-4925:  WMEM 2733  0    
-4928:  POP  r0   
-4930:  RET 
-4931:  PUSH r0   
-4933:  ADD  r0    2676  2    
-4937:  WMEM r0    0    
-4940:  ADD  r0    2680  2    
-4944:  WMEM r0    32767
-4947:  PUSH r0   
-4949:  PUSH r1   
-4951:  PUSH r2   
-4953:  SET  r0    28595
-4956:  SET  r1    1531 
-4959:  ADD  r2    5267  1248 
-4963:  CALL 1458 
-4965:  POP  r2   
-4967:  POP  r1   
-4969:  POP  r0   
-4971:  WMEM 2733  0    
-4974:  POP  r0   
-4976:  RET 
-4977:  PUSH r2   
-4979:  PUSH r3   
-4981:  RMEM r2    2732 
-4984:  EQ   r2    r2    2457 
-4988:  JT   r2    5017 
-4991:  PUSH r0   
-4993:  PUSH r1   
-4995:  PUSH r2   
-4997:  SET  r0    28621
-5000:  SET  r1    1531 
-5003:  ADD  r2    1605  816  
-5007:  CALL 1458 
-5009:  POP  r2   
-5011:  POP  r1   
-5013:  POP  r0   
-5015:  JMP  5336 
-5017:  ADD  r2    r0    2    
-5021:  WMEM r2    32767
-5024:  RMEM r2    2462 
-5027:  ADD  r2    r2    27095
-5031:  ADD  r2    r2    1    
-5035:  RMEM r2    r2   
-5038:  ADD  r3    2457  1    
-5042:  RMEM r3    r3   
-5045:  ADD  r3    r3    r2   
-5049:  ADD  r2    r1    48   
-5053:  WMEM r3    r2   
-5056:  RMEM r2    2462 
-5059:  ADD  r2    r2    27101
-5063:  ADD  r2    r2    1    
-5067:  WMEM r2    r1   
-5070:  PUSH r0   
-5072:  PUSH r0   
-5074:  PUSH r1   
-5076:  PUSH r2   
-5078:  SET  r0    28664
-5081:  SET  r1    1531 
-5084:  ADD  r2    5946  1989 
-5088:  CALL 1458 
-5090:  POP  r2   
-5092:  POP  r1   
-5094:  POP  r0   
-5096:  POP  r0   
-5098:  PUSH r0   
-5100:  ADD  r2    r0    0    
-5104:  RMEM r0    r2   
-5107:  CALL 1518 
-5109:  POP  r0   
-5111:  PUSH r0   
-5113:  PUSH r0   
-5115:  PUSH r1   
-5117:  PUSH r2   
-5119:  SET  r0    28679
-5122:  SET  r1    1531 
-5125:  ADD  r2    6158  5594 
-5129:  CALL 1458 
-5131:  POP  r2   
-5133:  POP  r1   
-5135:  POP  r0   
-5137:  POP  r0   
-5139:  RMEM r2    2462 
-5142:  ADD  r2    r2    1    
-5146:  WMEM 2462  r2   
-5149:  RMEM r3    27101
-5152:  EQ   r3    r2    r3   
-5156:  JF   r3    5336 
-5159:  SET  r0    0    
-5162:  ADD  r1    27101 1    
-5166:  RMEM r1    r1   
-5169:  ADD  r0    r0    r1   
-5173:  ADD  r1    27101 2    
-5177:  RMEM r1    r1   
-5180:  ADD  r2    27101 3    
-5184:  RMEM r2    r2   
-5187:  MULT r2    r2    r2   
-5191:  MULT r1    r1    r2   
-5195:  ADD  r0    r0    r1   
-5199:  ADD  r1    27101 4    
-5203:  RMEM r1    r1   
-5206:  MULT r2    r1    r1   
-5210:  MULT r2    r2    r1   
-5214:  ADD  r0    r0    r2   
-5218:  ADD  r1    27101 5    
-5222:  RMEM r1    r1   
-5225:  MULT r1    r1    32767
-5229:  ADD  r0    r0    r1   
-5233:  EQ   r1    r0    399  
-5237:  JT   r1    5312 
-5240:  ADD  r2    2688  2    
-5244:  WMEM r2    2457 
-5247:  ADD  r2    2692  2    
-5251:  WMEM r2    2457 
-5254:  ADD  r2    2696  2    
-5258:  WMEM r2    2457 
-5261:  ADD  r2    2700  2    
-5265:  WMEM r2    2457 
-5268:  ADD  r2    2704  2    
-5272:  WMEM r2    2457 
-5275:  WMEM 2462  0    
-5278:  SET  r0    27095
-5281:  SET  r1    5341 
-5284:  CALL 1458 
-5286:  PUSH r0   
-5288:  PUSH r1   
-5290:  PUSH r2   
-5292:  SET  r0    28710
-5295:  SET  r1    1531 
-5298:  ADD  r2    8818  12149
-5302:  CALL 1458 
-5304:  POP  r2   
-5306:  POP  r1   
-5308:  POP  r0   
-5310:  JMP  5336 
-5312:  PUSH r0   
-5314:  PUSH r1   
-5316:  PUSH r2   
-5318:  SET  r0    28777
-5321:  SET  r1    1531 
-5324:  ADD  r2    14300 14471
-5328:  CALL 1458 
-5330:  POP  r2   
-5332:  POP  r1   
-5334:  POP  r0   
-5336:  POP  r3   
-5338:  POP  r2   
-5340:  RET 
-5341:  PUSH r2   
-5343:  ADD  r2    2457  1    
-5347:  RMEM r2    r2   
-5350:  ADD  r2    r2    r0   
-5354:  WMEM r2    95   
-5357:  POP  r2   
-5359:  RET 
-5360:  PUSH r0   
-5362:  PUSH r1   
-5364:  SET  r0    2688 
-5367:  SET  r1    2    
-5370:  CALL 4977 
-5372:  POP  r1   
-5374:  POP  r0   
-5376:  RET 
-5377:  PUSH r0   
-5379:  PUSH r1   
-5381:  SET  r0    2692 
-5384:  SET  r1    3    
-5387:  CALL 4977 
-5389:  POP  r1   
-5391:  POP  r0   
-5393:  RET 
-5394:  PUSH r0   
-5396:  PUSH r1   
-5398:  SET  r0    2696 
-5401:  SET  r1    5    
-5404:  CALL 4977 
-5406:  POP  r1   
-5408:  POP  r0   
-5410:  RET 
-5411:  PUSH r0   
-5413:  PUSH r1   
-5415:  SET  r0    2700 
-5418:  SET  r1    7    
-5421:  CALL 4977 
-5423:  POP  r1   
-5425:  POP  r0   
-5427:  RET 
-5428:  PUSH r0   
-5430:  PUSH r1   
-5432:  SET  r0    2704 
-5435:  SET  r1    9    
-5438:  CALL 4977 
-5440:  POP  r1   
-5442:  POP  r0   
-5444:  RET 
-5445:  PUSH r0   
-5447:  PUSH r1   
-5449:  PUSH r2   
-5451:  JF   r7    5605 
-5454:  PUSH r0   
-5456:  PUSH r1   
-5458:  PUSH r2   
-5460:  SET  r0    28844
-5463:  SET  r1    1531 
-5466:  ADD  r2    2256  37   
-5470:  CALL 1458 
-5472:  POP  r2   
-5474:  POP  r1   
-5476:  POP  r0   
-5478:  NOOP
-5479:  NOOP
-5480:  NOOP
-5481:  NOOP
-5482:  NOOP
-5483:  SET  r0    4                 # r0 = 4
-5486:  SET  r1    1                 # r1 = 1
-5489:  CALL 6027                    # call function beginning at 6027
-5491:  EQ   r1    r0    6           # if r0 == 6, set r1 = 1, else r1 = 0
-5495:  JF   r1    5579              # if r1 == 0 jump to 5579
-5498:  PUSH r0   
-5500:  PUSH r1   
-5502:  PUSH r2   
-5504:  SET  r0    29014
-5507:  SET  r1    1531 
-5510:  ADD  r2    6359  23581
-5514:  CALL 1458 
-5516:  POP  r2   
-5518:  POP  r1   
-5520:  POP  r0   
-5522:  SET  r0    r7   
-5525:  SET  r1    25866
-5528:  SET  r2    32767
-5531:  PUSH r3   
-5533:  SET  r3    29241
-5536:  CALL 1841 
-5538:  POP  r3   
-5540:  PUSH r0   
-5542:  PUSH r1   
-5544:  PUSH r2   
-5546:  SET  r0    29245
-5549:  SET  r1    1531 
-5552:  ADD  r2    5293  580  
-5556:  CALL 1458 
-5558:  POP  r2   
-5560:  POP  r1   
-5562:  POP  r0   
-5564:  WMEM 2732  2498 
-5567:  WMEM 2733  0    
-5570:  ADD  r1    2708  2    
-5574:  WMEM r1    32767
-5577:  JMP  5714 
-5579:  PUSH r0   
-5581:  PUSH r1   
-5583:  PUSH r2   
-5585:  SET  r0    29400
-5588:  SET  r1    1531 
-5591:  ADD  r2    9791  15672
-5595:  CALL 1458 
-5597:  POP  r2   
-5599:  POP  r1   
-5601:  POP  r0   
-5603:  JMP  5714 
-5605:  PUSH r0   
-5607:  PUSH r1   
-5609:  PUSH r2   
-5611:  SET  r0    29545
-5614:  SET  r1    1531 
-5617:  ADD  r2    4216  18691
-5621:  CALL 1458 
-5623:  POP  r2   
-5625:  POP  r1   
-5627:  POP  r0   
-5629:  SET  r0    0    
-5632:  ADD  r2    1     27101
-5636:  RMEM r1    r2   
-5639:  ADD  r0    r0    r1   
-5643:  MULT r0    r0    31660
-5647:  CALL 2125 
-5649:  RMEM r1    27101
-5652:  ADD  r1    r1    27101
-5656:  ADD  r2    r2    1    
-5660:  GT   r1    r2    r1   
-5664:  JF   r1    5636 
-5667:  SET  r1    25866
-5670:  SET  r2    32767
-5673:  PUSH r3   
-5675:  SET  r3    29663
-5678:  CALL 1841 
-5680:  POP  r3   
-5682:  PUSH r0   
-5684:  PUSH r1   
-5686:  PUSH r2   
-5688:  SET  r0    29667
-5691:  SET  r1    1531 
-5694:  ADD  r2    2802  9075 
-5698:  CALL 1458 
-5700:  POP  r2   
-5702:  POP  r1   
-5704:  POP  r0   
-5706:  WMEM 2732  2488 
-5709:  WMEM 2733  0    
-5712:  JMP  5714 
-5714:  POP  r2   
-5716:  POP  r1   
-5718:  POP  r0   
-5720:  RET 
-5721:  PUSH r0   
-5723:  PUSH r1   
-5725:  PUSH r2   
-5727:  PUSH r3   
-5729:  PUSH r0   
-5731:  PUSH r1   
-5733:  PUSH r2   
-5735:  SET  r0    29757
-5738:  SET  r1    1531 
-5741:  ADD  r2    812   312  
-5745:  CALL 1458 
-5747:  POP  r2   
-5749:  POP  r1   
-5751:  POP  r0   
-5753:  RMEM r0    3955 
-5756:  RMEM r1    3956 
-5759:  CALL 2125 
-5761:  RMEM r1    3957 
-5764:  CALL 2125 
-5766:  SET  r1    25919
-5769:  SET  r2    4    
-5772:  PUSH r3   
-5774:  SET  r3    29942
-5777:  CALL 1841 
-5779:  POP  r3   
-5781:  PUSH r0   
-5783:  PUSH r1   
-5785:  PUSH r2   
-5787:  SET  r0    29946
-5790:  SET  r1    1531 
-5793:  ADD  r2    13860 330  
-5797:  CALL 1458 
-5799:  POP  r2   
-5801:  POP  r1   
-5803:  POP  r0   
-5805:  POP  r3   
-5807:  POP  r2   
-5809:  POP  r1   
-5811:  POP  r0   
-5813:  RET 
-5814:  OUT  '-'
-5816:  OUT  ' '
-5818:  CALL 1518 
-5820:  OUT  '\n'
-5822:  RET 
-5823:  PUSH r1   
-5825:  PUSH r2   
-5827:  SET  r0    27381
-5830:  SET  r1    5846 
-5833:  SET  r2    0    
-5836:  CALL 1458 
-5838:  SET  r0    r2   
-5841:  POP  r2   
-5843:  POP  r1   
-5845:  RET 
-5846:  PUSH r3   
-5848:  PUSH r4   
-5850:  RMEM r3    2732 
-5853:  ADD  r4    r0    2    
-5857:  RMEM r4    r4   
-5860:  EQ   r3    r3    r4   
-5864:  JF   r3    5871 
-5867:  ADD  r2    r2    1    
-5871:  POP  r4   
-5873:  POP  r3   
-5875:  RET 
-5876:  PUSH r0   
-5878:  PUSH r1   
-5880:  SET  r0    27381
-5883:  SET  r1    5893 
-5886:  CALL 1458 
-5888:  POP  r1   
-5890:  POP  r0   
-5892:  RET 
-5893:  PUSH r3   
-5895:  ADD  r3    r0    2    
-5899:  RMEM r3    r3   
-5902:  EQ   r3    r2    r3   
-5906:  JF   r3    5918 
-5909:  ADD  r0    r0    0    
-5913:  RMEM r0    r0   
-5916:  CALL 5814 
-5918:  POP  r3   
-5920:  RET 
-5921:  PUSH r1   
-5923:  PUSH r2   
-5925:  SET  r2    r0   
-5928:  SET  r0    27381
-5931:  SET  r1    5964 
-5934:  CALL 1543 
-5936:  EQ   r1    r0    32767
-5940:  JT   r1    5956 
-5943:  ADD  r1    27381 r0   
-5947:  ADD  r1    r1    1    
-5951:  RMEM r0    r1   
-5954:  JMP  5959 
-5956:  SET  r0    0    
-5959:  POP  r2   
-5961:  POP  r1   
-5963:  RET 
-5964:  PUSH r1   
-5966:  SET  r1    r2   
-5969:  ADD  r0    r0    0    
-5973:  RMEM r0    r0   
-5976:  CALL 1667 
-5978:  POP  r1   
-5980:  JF   r0    5989 
-5983:  SET  r2    r1   
-5986:  SET  r1    32767
-5989:  RET 
-5990:  PUSH r1   
-5992:  PUSH r2   
-5994:  ADD  r0    r0    2    
-5998:  RMEM r0    r0   
-6001:  JF   r0    6019 
-6004:  RMEM r1    2732 
-6007:  EQ   r1    r0    r1   
-6011:  JT   r1    6019 
-6014:  SET  r0    0    
-6017:  JMP  6022 
-6019:  SET  r0    1    
-6022:  POP  r2   
-6024:  POP  r1   
-6026:  RET 
-6027:  JT   r0    6035              # if r0 != 0 jump to 6035, else 
-6030:  ADD  r0    r1    1           # r0 = r1 + 1
-6034:  RET                          
-6035:  JT   r1    6048              # if r1 != 0 jump to 6048, else
-6038:  ADD  r0    r0    32767       # r0 = (r0 - 1) mod 32768
-6042:  SET  r1    r7                # r1 = r7
-6045:  CALL 6027                    
-6047:  RET                          
-6048:  PUSH r0                      # append r0 to stack 
-6050:  ADD  r1    r1    32767       # r1 = (r1 - 1) mod 32768
-6054:  CALL 6027                    
-6056:  SET  r1    r0                # r1 = r0
-6059:  POP  r0                      # pop from stack and assign to r0
-6061:  ADD  r0    r0    32767       # r0 = (r0 - 1) mod 32768
-6065:  CALL 6027             
-6067:  RET 
-6068:  DATA: 6095
-6069:  DATA: 17625
-6070:  DATA: 29781
-6071:  DATA: 9718
-6072:  DATA: 21856
-6073:  DATA: 709
-6074:  DATA: 12803
-6075:  DATA: 25529
-6076:  DATA: 4918
-6077:  DATA: 16564
-6078:  DATA: 28734
-6079:  DATA: 8626
-6080:  DATA: 20806
-6081:  DATA: 32422
-6082:  DATA: 11829
-6083:  DATA: 24497
-6084:  DATA: 3874
-6085:  DATA: 15584
-6086:  DATA: 27652
-6087:  DATA: 7552
-6088:  DATA: 19815
-6089:  DATA: 31473
-6090:  DATA: 10768
-6091:  DATA: 23531
-6092:  DATA: 2949
-6093:  DATA: 15156
-6094:  DATA: 26844
-6095:  DATA: 6256
-6096:  DATA: 18448
-6097:  DATA: 31188
-6098:  DATA: 10545
-6099:  DATA: 22189
-6100:  DATA: 1764
-6101:  DATA: 13836
-6102:  DATA: 26588
-6103:  DATA: 6057
-6104:  DATA: 18228
-6105:  DATA: 29905
-6106:  DATA: 9365
-6107:  DATA: 21630
-6108:  DATA: 1072
-6109:  DATA: 13806
-6110:  DATA: 26096
-6111:  DATA: 5477
-6112:  DATA: 17717
-6113:  DATA: 29414
-6114:  DATA: 8867
-6115:  DATA: 21015
-6116:  DATA: 588
-6117:  DATA: 13294
-6118:  DATA: 25503
-6119:  DATA: 4936
-6120:  DATA: 17252
-6121:  DATA: 29481
-6122:  DATA: 8405
-6123:  DATA: 20633
-6124:  DATA: 161
-6125:  DATA: 12350
-6126:  DATA: 24592
-6127:  DATA: 4213
-6128:  DATA: 16468
-6129:  DATA: 29113
-6130:  DATA: 8592
-6131:  DATA: 20989
-6132:  DATA: 452
-6133:  DATA: 12589
-6134:  DATA: 24880
-6135:  DATA: 4357
-6136:  DATA: 16660
-6137:  DATA: 29029
-6138:  DATA: 8560
-6139:  DATA: 20813
-6140:  DATA: 324
-6141:  DATA: 12637
-6142:  DATA: 24921
-6143:  DATA: 4371
-6144:  DATA: 16699
-6145:  DATA: 28986
-6146:  DATA: 8484
-6147:  DATA: 20789
-6148:  DATA: 301
-6149:  DATA: 12577
-6150:  DATA: 24860
-6151:  DATA: 4374
-6152:  DATA: 16803
-6153:  DATA: 29020
-6154:  DATA: 8543
-6155:  DATA: 20824
-6156:  DATA: 484
-6157:  DATA: 12699
-6158:  DATA: 25081
-6159:  DATA: 4571
-6160:  DATA: 16432
-6161:  DATA: 28757
-6162:  DATA: 8297
-6163:  DATA: 20562
-6164:  DATA: 177
-6165:  DATA: 12447
-6166:  DATA: 24771
-6167:  DATA: 4896
-6168:  DATA: 17272
-6169:  DATA: 29507
-6170:  DATA: 9168
-6171:  DATA: 21502
-6172:  DATA: 560
-6173:  DATA: 12924
-6174:  DATA: 25278
-6175:  DATA: 4849
-6176:  DATA: 17725
-6177:  DATA: 30075
-6178:  DATA: 9655
-6179:  DATA: 21949
-6180:  DATA: 1061
-6181:  DATA: 13433
-6182:  DATA: 25808
-6183:  DATA: 5329
-6184:  DATA: 18300
-6185:  DATA: 30624
-6186:  DATA: 10128
-6187:  DATA: 22031
-6188:  DATA: 1701
-6189:  DATA: 14030
-6190:  DATA: 26997
-6191:  DATA: 6613
-6192:  DATA: 18491
-6193:  DATA: 30803
-6194:  DATA: 10416
-6195:  DATA: 23324
-6196:  DATA: 2986
-6197:  DATA: 15245
-6198:  DATA: 27221
-6199:  DATA: 6891
-6200:  DATA: 19835
-6201:  DATA: 32151
-6202:  DATA: 11293
-6203:  DATA: 23714
-6204:  DATA: 3889
-6205:  DATA: 16302
-6206:  DATA: 28272
-6207:  DATA: 7864
-6208:  DATA: 20795
-6209:  DATA: 416
-6210:  DATA: 12350
-6211:  DATA: 24745
-6212:  DATA: 4901
-6213:  DATA: 17316
-6214:  DATA: 29214
-6215:  DATA: 8907
-6216:  DATA: 21812
-6217:  DATA: 1445
-6218:  DATA: 13425
-6219:  DATA: 25817
-6220:  DATA: 6116
-6221:  DATA: 17940
-6222:  DATA: 30436
-6223:  DATA: 10566
-6224:  DATA: 22644
-6225:  DATA: 2199
-6226:  DATA: 15217
-6227:  DATA: 27598
-6228:  DATA: 6817
-6229:  DATA: 19789
-6230:  DATA: 32196
-6231:  DATA: 11434
-6232:  DATA: 24372
-6233:  DATA: 4049
-6234:  DATA: 16024
-6235:  DATA: 29032
-6236:  DATA: 8292
-6237:  DATA: 20723
-6238:  DATA: 959
-6239:  DATA: 12903
-6240:  DATA: 25888
-6241:  DATA: 5629
-6242:  DATA: 17660
-6243:  DATA: 30525
-6244:  DATA: 9776
-6245:  DATA: 22245
-6246:  DATA: 2453
-6247:  DATA: 14423
-6248:  DATA: 27505
-6249:  DATA: 6757
-6250:  DATA: 19161
-6251:  DATA: 32158
-6252:  DATA: 11492
-6253:  DATA: 24412
-6254:  DATA: 3632
-6255:  DATA: 16664
-6256:  DATA: 28725
-6257:  DATA: 8390
-6258:  DATA: 21475
-6259:  DATA: 660
-6260:  DATA: 13746
-6261:  DATA: 25672
-6262:  DATA: 5904
-6263:  DATA: 18017
-6264:  DATA: 31099
-6265:  DATA: 10250
-6266:  DATA: 23298
-6267:  DATA: 2618
-6268:  DATA: 15653
-6269:  DATA: 27684
-6270:  DATA: 8062
-6271:  DATA: 20085
-6272:  DATA: 372
-6273:  DATA: 12308
-6274:  DATA: 25456
-6275:  DATA: 4654
-6276:  DATA: 17709
-6277:  DATA: 29738
-6278:  DATA: 10014
-6279:  DATA: 22085
-6280:  DATA: 2426
-6281:  DATA: 14432
-6282:  DATA: 27473
-6283:  DATA: 6751
-6284:  DATA: 19878
-6285:  DATA: 31876
-6286:  DATA: 12208
-6287:  DATA: 24263
-6288:  DATA: 4145
-6289:  DATA: 17172
-6290:  DATA: 29300
-6291:  DATA: 9550
-6292:  DATA: 21732
-6293:  DATA: 1999
-6294:  DATA: 14075
-6295:  DATA: 26656
-6296:  DATA: 7025
-6297:  DATA: 19029
-6298:  DATA: 32208
-6299:  DATA: 11490
-6300:  DATA: 24113
-6301:  DATA: 4457
-6302:  DATA: 16625
-6303:  DATA: 29621
-6304:  DATA: 9588
-6305:  DATA: 21585
-6306:  DATA: 1973
-6307:  DATA: 14075
-6308:  DATA: 26669
-6309:  DATA: 7011
-6310:  DATA: 19097
-6311:  DATA: 32209
-6312:  DATA: 12145
-6313:  DATA: 24233
-6314:  DATA: 4553
-6315:  DATA: 17229
-6316:  DATA: 29354
-6317:  DATA: 9682
-6318:  DATA: 22320
-6319:  DATA: 1665
-6320:  DATA: 14374
-6321:  DATA: 27472
-6322:  DATA: 6897
-6323:  DATA: 19470
-6324:  DATA: 32689
-6325:  DATA: 11999
-6326:  DATA: 24661
-6327:  DATA: 5029
-6328:  DATA: 17763
-6329:  DATA: 29836
-6330:  DATA: 9732
-6331:  DATA: 22949
-6332:  DATA: 2861
-6333:  DATA: 15027
-6334:  DATA: 27761
-6335:  DATA: 8183
-6336:  DATA: 20819
-6337:  DATA: 177
-6338:  DATA: 12863
-6339:  DATA: 26034
-6340:  DATA: 5942
-6341:  DATA: 18106
-6342:  DATA: 30737
-6343:  DATA: 11164
-6344:  DATA: 23825
-6345:  DATA: 3318
-6346:  DATA: 15967
-6347:  DATA: 29144
-6348:  DATA: 9136
-6349:  DATA: 21781
-6350:  DATA: 1177
-6351:  DATA: 13939
-6352:  DATA: 26683
-6353:  DATA: 7066
-6354:  DATA: 19812
-6355:  DATA: 31957
-6356:  DATA: 11949
-6357:  DATA: 24577
-6358:  DATA: 5084
-6359:  DATA: 17846
-6360:  DATA: 30558
-6361:  DATA: 9956
-6362:  DATA: 22659
-6363:  DATA: 2605
-6364:  DATA: 15421
-6365:  DATA: 28658
-6366:  DATA: 8613
-6367:  DATA: 21301
-6368:  DATA: 1334
-6369:  DATA: 13552
-6370:  DATA: 26295
-6371:  DATA: 6260
-6372:  DATA: 18986
-6373:  DATA: 32173
-6374:  DATA: 12164
-6375:  DATA: 24906
-6376:  DATA: 4916
-6377:  DATA: 17705
-6378:  DATA: 29909
-6379:  DATA: 9868
-6380:  DATA: 22706
-6381:  DATA: 2648
-6382:  DATA: 15420
-6383:  DATA: 28245
-6384:  DATA: 8237
-6385:  DATA: 21466
-6386:  DATA: 1509
-6387:  DATA: 14301
-6388:  DATA: 27042
-6389:  DATA: 6984
-6390:  DATA: 19797
-6391:  DATA: 32617
-6392:  DATA: 12596
-6393:  DATA: 25361
-6394:  DATA: 5400
-6395:  DATA: 18216
-6396:  DATA: 31076
-6397:  DATA: 11048
-6398:  DATA: 23842
-6399:  DATA: 3890
-6400:  DATA: 16689
-6401:  DATA: 29557
-6402:  DATA: 9526
-6403:  DATA: 22322
-6404:  DATA: 2358
-6405:  DATA: 15213
-6406:  DATA: 27921
-6407:  DATA: 7937
-6408:  DATA: 20834
-6409:  DATA: 864
-6410:  DATA: 13662
-6411:  DATA: 26457
-6412:  DATA: 6577
-6413:  DATA: 19343
-6414:  DATA: 32245
-6415:  DATA: 12181
-6416:  DATA: 24612
-6417:  DATA: 4608
-6418:  DATA: 17532
-6419:  DATA: 30289
-6420:  DATA: 10413
-6421:  DATA: 23171
-6422:  DATA: 3287
-6423:  DATA: 16741
-6424:  DATA: 29549
-6425:  DATA: 9546
-6426:  DATA: 22405
-6427:  DATA: 2477
-6428:  DATA: 14886
-6429:  DATA: 27772
-6430:  DATA: 7859
-6431:  DATA: 20734
-6432:  DATA: 1402
-6433:  DATA: 14139
-6434:  DATA: 27134
-6435:  DATA: 7064
-6436:  DATA: 19498
-6437:  DATA: 32354
-6438:  DATA: 12418
-6439:  DATA: 25297
-6440:  DATA: 6012
-6441:  DATA: 18892
-6442:  DATA: 31732
-6443:  DATA: 11276
-6444:  DATA: 24246
-6445:  DATA: 4310
-6446:  DATA: 17712
-6447:  DATA: 30614
-6448:  DATA: 10293
-6449:  DATA: 23107
-6450:  DATA: 3317
-6451:  DATA: 16888
-6452:  DATA: 29584
-6453:  DATA: 9669
-6454:  DATA: 22105
-6455:  DATA: 2294
-6456:  DATA: 15668
-6457:  DATA: 28566
-6458:  DATA: 8213
-6459:  DATA: 21160
-6460:  DATA: 1833
-6461:  DATA: 14766
-6462:  DATA: 27248
-6463:  DATA: 7329
-6464:  DATA: 20795
-6465:  DATA: 1013
-6466:  DATA: 13362
-6467:  DATA: 26296
-6468:  DATA: 7012
-6469:  DATA: 19897
-6470:  DATA: 32280
-6471:  DATA: 12416
-6472:  DATA: 25908
-6473:  DATA: 6120
-6474:  DATA: 18527
-6475:  DATA: 31448
-6476:  DATA: 12208
-6477:  DATA: 24597
-6478:  DATA: 4784
-6479:  DATA: 18266
-6480:  DATA: 30770
-6481:  DATA: 10965
-6482:  DATA: 24433
-6483:  DATA: 4509
-6484:  DATA: 17056
-6485:  DATA: 30472
-6486:  DATA: 10709
-6487:  DATA: 23221
-6488:  DATA: 3892
-6489:  DATA: 16838
-6490:  DATA: 29329
-6491:  DATA: 10107
-6492:  DATA: 22561
-6493:  DATA: 2739
-6494:  DATA: 16368
-6495:  DATA: 28725
-6496:  DATA: 9493
-6497:  DATA: 22502
-6498:  DATA: 2288
-6499:  DATA: 15716
-6500:  DATA: 28203
-6501:  DATA: 8440
-6502:  DATA: 21968
-6503:  DATA: 1621
-6504:  DATA: 15217
-6505:  DATA: 27680
-6506:  DATA: 7874
-6507:  DATA: 21453
-6508:  DATA: 1194
-6509:  DATA: 14674
-6510:  DATA: 27234
-6511:  DATA: 7937
-6512:  DATA: 20540
-6513:  DATA: 661
-6514:  DATA: 14329
-6515:  DATA: 26771
-6516:  DATA: 7600
-6517:  DATA: 20034
-6518:  DATA: 784
-6519:  DATA: 13425
-6520:  DATA: 27004
-6521:  DATA: 6656
-6522:  DATA: 20304
-6523:  DATA: 41
-6524:  DATA: 13605
-6525:  DATA: 26159
-6526:  DATA: 6971
-6527:  DATA: 19515
-6528:  DATA: 305
-6529:  DATA: 12838
-6530:  DATA: 26403
-6531:  DATA: 6257
-6532:  DATA: 19812
-6533:  DATA: 32308
-6534:  DATA: 13087
-6535:  DATA: 25616
-6536:  DATA: 6452
-6537:  DATA: 19057
-6538:  DATA: 32600
-6539:  DATA: 12356
-6540:  DATA: 26026
-6541:  DATA: 5782
-6542:  DATA: 19376
-6543:  DATA: 31948
-6544:  DATA: 12347
-6545:  DATA: 25856
-6546:  DATA: 5680
-6547:  DATA: 19285
-6548:  DATA: 31905
-6549:  DATA: 12684
-6550:  DATA: 25282
-6551:  DATA: 5733
-6552:  DATA: 19296
-6553:  DATA: 31821
-6554:  DATA: 12693
-6555:  DATA: 25261
-6556:  DATA: 5665
-6557:  DATA: 19326
-6558:  DATA: 31928
-6559:  DATA: 12794
-6560:  DATA: 25905
-6561:  DATA: 5734
-6562:  DATA: 19440
-6563:  DATA: 31986
-6564:  DATA: 12322
-6565:  DATA: 25901
-6566:  DATA: 5778
-6567:  DATA: 19396
-6568:  DATA: 32608
-6569:  DATA: 12470
-6570:  DATA: 26000
-6571:  DATA: 6409
-6572:  DATA: 19105
-6573:  DATA: 32728
-6574:  DATA: 13152
-6575:  DATA: 25744
-6576:  DATA: 6182
-6577:  DATA: 19733
-6578:  DATA: 32487
-6579:  DATA: 12820
-6580:  DATA: 26544
-6581:  DATA: 6341
-6582:  DATA: 19545
-6583:  DATA: 491
-6584:  DATA: 13626
-6585:  DATA: 26336
-6586:  DATA: 6686
-6587:  DATA: 20386
-6588:  DATA: 822
-6589:  DATA: 13481
-6590:  DATA: 26680
-6591:  DATA: 7632
-6592:  DATA: 20775
-6593:  DATA: 698
-6594:  DATA: 13861
-6595:  DATA: 27561
-6596:  DATA: 7980
-6597:  DATA: 20676
-6598:  DATA: 1076
-6599:  DATA: 14724
-6600:  DATA: 28006
-6601:  DATA: 7918
-6602:  DATA: 21008
-6603:  DATA: 1998
-6604:  DATA: 15269
-6605:  DATA: 28427
-6606:  DATA: 8437
-6607:  DATA: 21614
-6608:  DATA: 2048
-6609:  DATA: 15773
-6610:  DATA: 29045
-6611:  DATA: 8861
-6612:  DATA: 22183
-6613:  DATA: 2572
-6614:  DATA: 16326
-6615:  DATA: 29600
-6616:  DATA: 10036
-6617:  DATA: 22732
-6618:  DATA: 3203
-6619:  DATA: 16429
-6620:  DATA: 29751
-6621:  DATA: 10738
-6622:  DATA: 23997
-6623:  DATA: 4464
-6624:  DATA: 17699
-6625:  DATA: 30461
-6626:  DATA: 10929
-6627:  DATA: 24169
-6628:  DATA: 4708
-6629:  DATA: 18403
-6630:  DATA: 31633
-6631:  DATA: 12119
-6632:  DATA: 25446
-6633:  DATA: 5930
-6634:  DATA: 18631
-6635:  DATA: 31949
-6636:  DATA: 12460
-6637:  DATA: 25688
-6638:  DATA: 6242
-6639:  DATA: 19472
-6640:  DATA: 120
-6641:  DATA: 13717
-6642:  DATA: 27121
-6643:  DATA: 7571
-6644:  DATA: 20896
-6645:  DATA: 1293
-6646:  DATA: 14660
-6647:  DATA: 28013
-6648:  DATA: 8561
-6649:  DATA: 21829
-6650:  DATA: 2332
-6651:  DATA: 15652
-6652:  DATA: 28963
-6653:  DATA: 9525
-6654:  DATA: 22820
-6655:  DATA: 3445
-6656:  DATA: 16690
-6657:  DATA: 29991
-6658:  DATA: 10559
-6659:  DATA: 23856
-6660:  DATA: 4452
-6661:  DATA: 17721
-6662:  DATA: 31000
-6663:  DATA: 11520
-6664:  DATA: 24884
-6665:  DATA: 5473
-6666:  DATA: 18783
-6667:  DATA: 32066
-6668:  DATA: 12726
-6669:  DATA: 25994
-6670:  DATA: 6641
-6671:  DATA: 19916
-6672:  DATA: 116
-6673:  DATA: 13313
-6674:  DATA: 26751
-6675:  DATA: 7197
-6676:  DATA: 20656
-6677:  DATA: 1157
-6678:  DATA: 14549
-6679:  DATA: 28517
-6680:  DATA: 9063
-6681:  DATA: 22346
-6682:  DATA: 2949
-6683:  DATA: 16377
-6684:  DATA: 29228
-6685:  DATA: 9789
-6686:  DATA: 23225
-6687:  DATA: 3814
-6688:  DATA: 17780
-6689:  DATA: 31076
-6690:  DATA: 11685
-6691:  DATA: 25076
-6692:  DATA: 5168
-6693:  DATA: 18536
-6694:  DATA: 31952
-6695:  DATA: 12481
-6696:  DATA: 26493
-6697:  DATA: 7080
-6698:  DATA: 20382
-6699:  DATA: 616
-6700:  DATA: 13994
-6701:  DATA: 27346
-6702:  DATA: 8546
-6703:  DATA: 21889
-6704:  DATA: 2108
-6705:  DATA: 15408
-6706:  DATA: 28899
-6707:  DATA: 10002
-6708:  DATA: 23473
-6709:  DATA: 4057
-6710:  DATA: 16984
-6711:  DATA: 30348
-6712:  DATA: 11600
-6713:  DATA: 24964
-6714:  DATA: 5122
-6715:  DATA: 18598
-6716:  DATA: 32612
-6717:  DATA: 13246
-6718:  DATA: 26161
-6719:  DATA: 6819
-6720:  DATA: 20785
-6721:  DATA: 1390
-6722:  DATA: 14340
-6723:  DATA: 27829
-6724:  DATA: 8993
-6725:  DATA: 22509
-6726:  DATA: 2579
-6727:  DATA: 16004
-6728:  DATA: 30050
-6729:  DATA: 10720
-6730:  DATA: 23568
-6731:  DATA: 4300
-6732:  DATA: 18343
-6733:  DATA: 31250
-6734:  DATA: 12005
-6735:  DATA: 25926
-6736:  DATA: 6176
-6737:  DATA: 19612
-6738:  DATA: 883
-6739:  DATA: 14286
-6740:  DATA: 27364
-6741:  DATA: 8457
-6742:  DATA: 21954
-6743:  DATA: 2212
-6744:  DATA: 16249
-6745:  DATA: 29636
-6746:  DATA: 9860
-6747:  DATA: 23908
-6748:  DATA: 4135
-6749:  DATA: 17660
-6750:  DATA: 31676
-6751:  DATA: 11897
-6752:  DATA: 25901
-6753:  DATA: 6581
-6754:  DATA: 19635
-6755:  DATA: 885
-6756:  DATA: 13861
-6757:  DATA: 27363
-6758:  DATA: 8599
-6759:  DATA: 21568
-6760:  DATA: 2868
-6761:  DATA: 15908
-6762:  DATA: 29379
-6763:  DATA: 10701
-6764:  DATA: 23741
-6765:  DATA: 4946
-6766:  DATA: 18021
-6767:  DATA: 32085
-6768:  DATA: 12338
-6769:  DATA: 25820
-6770:  DATA: 7166
-6771:  DATA: 20121
-6772:  DATA: 1508
-6773:  DATA: 14420
-6774:  DATA: 28511
-6775:  DATA: 8816
-6776:  DATA: 22886
-6777:  DATA: 3094
-6778:  DATA: 17173
-6779:  DATA: 30241
-6780:  DATA: 11554
-6781:  DATA: 24701
-6782:  DATA: 5937
-6783:  DATA: 18977
-6784:  DATA: 372
-6785:  DATA: 13364
-6786:  DATA: 27504
-6787:  DATA: 7729
-6788:  DATA: 21793
-6789:  DATA: 2090
-6790:  DATA: 16148
-6791:  DATA: 29184
-6792:  DATA: 10548
-6793:  DATA: 23652
-6794:  DATA: 4946
-6795:  DATA: 17986
-6796:  DATA: 32178
-6797:  DATA: 12440
-6798:  DATA: 26544
-6799:  DATA: 6868
-6800:  DATA: 20596
-6801:  DATA: 1817
-6802:  DATA: 14961
-6803:  DATA: 29007
-6804:  DATA: 9379
-6805:  DATA: 23432
-6806:  DATA: 3728
-6807:  DATA: 17446
-6808:  DATA: 31612
-6809:  DATA: 11844
-6810:  DATA: 25987
-6811:  DATA: 6368
-6812:  DATA: 20074
-6813:  DATA: 1341
-6814:  DATA: 14576
-6815:  DATA: 28609
-6816:  DATA: 9532
-6817:  DATA: 22640
-6818:  DATA: 4002
-6819:  DATA: 17144
-6820:  DATA: 30820
-6821:  DATA: 12132
-6822:  DATA: 25219
-6823:  DATA: 6533
-6824:  DATA: 20342
-6825:  DATA: 676
-6826:  DATA: 14786
-6827:  DATA: 28424
-6828:  DATA: 8872
-6829:  DATA: 22980
-6830:  DATA: 3888
-6831:  DATA: 17040
-6832:  DATA: 30778
-6833:  DATA: 12122
-6834:  DATA: 25317
-6835:  DATA: 6170
-6836:  DATA: 20396
-6837:  DATA: 653
-6838:  DATA: 14428
-6839:  DATA: 28652
-6840:  DATA: 9587
-6841:  DATA: 22669
-6842:  DATA: 3588
-6843:  DATA: 17901
-6844:  DATA: 31532
-6845:  DATA: 11960
-6846:  DATA: 25634
-6847:  DATA: 7088
-6848:  DATA: 20852
-6849:  DATA: 1185
-6850:  DATA: 14911
-6851:  DATA: 29181
-6852:  DATA: 10026
-6853:  DATA: 23202
-6854:  DATA: 4100
-6855:  DATA: 18316
-6856:  DATA: 32119
-6857:  DATA: 12512
-6858:  DATA: 26128
-6859:  DATA: 7628
-6860:  DATA: 21476
-6861:  DATA: 2319
-6862:  DATA: 15615
-6863:  DATA: 29253
-6864:  DATA: 10289
-6865:  DATA: 24533
-6866:  DATA: 5490
-6867:  DATA: 18639
-6868:  DATA: 32429
-6869:  DATA: 13321
-6870:  DATA: 27607
-6871:  DATA: 8608
-6872:  DATA: 22324
-6873:  DATA: 2761
-6874:  DATA: 16533
-6875:  DATA: 30316
-6876:  DATA: 11296
-6877:  DATA: 25588
-6878:  DATA: 6590
-6879:  DATA: 20338
-6880:  DATA: 1396
-6881:  DATA: 14586
-6882:  DATA: 28325
-6883:  DATA: 9321
-6884:  DATA: 23140
-6885:  DATA: 4580
-6886:  DATA: 18334
-6887:  DATA: 32081
-6888:  DATA: 13179
-6889:  DATA: 26981
-6890:  DATA: 7364
-6891:  DATA: 21125
-6892:  DATA: 2209
-6893:  DATA: 15901
-6894:  DATA: 29812
-6895:  DATA: 10772
-6896:  DATA: 24614
-6897:  DATA: 6110
-6898:  DATA: 19888
-6899:  DATA: 920
-6900:  DATA: 14761
-6901:  DATA: 28509
-6902:  DATA: 9540
-6903:  DATA: 23404
-6904:  DATA: 4474
-6905:  DATA: 18176
-6906:  DATA: 32003
-6907:  DATA: 13118
-6908:  DATA: 26986
-6909:  DATA: 8027
-6910:  DATA: 21810
-6911:  DATA: 2855
-6912:  DATA: 16701
-6913:  DATA: 30513
-6914:  DATA: 11575
-6915:  DATA: 25400
-6916:  DATA: 6465
-6917:  DATA: 20286
-6918:  DATA: 1311
-6919:  DATA: 15120
-6920:  DATA: 29024
-6921:  DATA: 10093
-6922:  DATA: 23867
-6923:  DATA: 4991
-6924:  DATA: 18859
-6925:  DATA: 32653
-6926:  DATA: 13813
-6927:  DATA: 27541
-6928:  DATA: 8246
-6929:  DATA: 22023
-6930:  DATA: 3193
-6931:  DATA: 16985
-6932:  DATA: 30883
-6933:  DATA: 11912
-6934:  DATA: 25801
-6935:  DATA: 7441
-6936:  DATA: 21372
-6937:  DATA: 2380
-6938:  DATA: 16259
-6939:  DATA: 30125
-6940:  DATA: 10806
-6941:  DATA: 24690
-6942:  DATA: 5792
-6943:  DATA: 19696
-6944:  DATA: 1396
-6945:  DATA: 15223
-6946:  DATA: 29090
-6947:  DATA: 10228
-6948:  DATA: 23584
-6949:  DATA: 4714
-6950:  DATA: 18581
-6951:  DATA: 32389
-6952:  DATA: 14199
-6953:  DATA: 28087
-6954:  DATA: 9173
-6955:  DATA: 22540
-6956:  DATA: 3759
-6957:  DATA: 17614
-6958:  DATA: 32048
-6959:  DATA: 13204
-6960:  DATA: 26663
-6961:  DATA: 7701
-6962:  DATA: 21737
-6963:  DATA: 3346
-6964:  DATA: 17329
-6965:  DATA: 31117
-6966:  DATA: 11847
-6967:  DATA: 25828
-6968:  DATA: 7544
-6969:  DATA: 21390
-6970:  DATA: 2128
-6971:  DATA: 16044
-6972:  DATA: 30504
-6973:  DATA: 11698
-6974:  DATA: 25150
-6975:  DATA: 6322
-6976:  DATA: 20852
-6977:  DATA: 1980
-6978:  DATA: 15396
-6979:  DATA: 29427
-6980:  DATA: 11108
-6981:  DATA: 25069
-6982:  DATA: 5673
-6983:  DATA: 19594
-6984:  DATA: 1377
-6985:  DATA: 15269
-6986:  DATA: 28753
-6987:  DATA: 9951
-6988:  DATA: 24481
-6989:  DATA: 5139
-6990:  DATA: 19127
-6991:  DATA: 833
-6992:  DATA: 14452
-6993:  DATA: 28294
-6994:  DATA: 10085
-6995:  DATA: 24015
-6996:  DATA: 4769
-6997:  DATA: 19277
-6998:  DATA: 472
-6999:  DATA: 13994
-7000:  DATA: 28515
-7001:  DATA: 9605
-7002:  DATA: 23199
-7003:  DATA: 4961
-7004:  DATA: 18464
-7005:  DATA: 32445
-7006:  DATA: 14265
-7007:  DATA: 27745
-7008:  DATA: 9588
-7009:  DATA: 23548
-7010:  DATA: 4259
-7011:  DATA: 18737
-7012:  DATA: 32356
-7013:  DATA: 13538
-7014:  DATA: 28034
-7015:  DATA: 8709
-7016:  DATA: 23395
-7017:  DATA: 4141
-7018:  DATA: 18133
-7019:  DATA: 32665
-7020:  DATA: 13484
-7021:  DATA: 27992
-7022:  DATA: 8802
-7023:  DATA: 23381
-7024:  DATA: 4157
-7025:  DATA: 18113
-7026:  DATA: 32688
-7027:  DATA: 13470
-7028:  DATA: 28069
-7029:  DATA: 8771
-7030:  DATA: 23312
-7031:  DATA: 4192
-7032:  DATA: 18786
-7033:  DATA: 32256
-7034:  DATA: 14110
-7035:  DATA: 27757
-7036:  DATA: 9527
-7037:  DATA: 23080
-7038:  DATA: 4896
-7039:  DATA: 18469
-7040:  DATA: 315
-7041:  DATA: 13863
-7042:  DATA: 28452
-7043:  DATA: 9341
-7044:  DATA: 23869
-7045:  DATA: 4642
-7046:  DATA: 19205
-7047:  DATA: 23
-7048:  DATA: 14644
-7049:  DATA: 28274
-7050:  DATA: 10069
-7051:  DATA: 23620
-7052:  DATA: 5539
-7053:  DATA: 19093
-7054:  DATA: 996
-7055:  DATA: 14491
-7056:  DATA: 28764
-7057:  DATA: 10518
-7058:  DATA: 24191
-7059:  DATA: 5971
-7060:  DATA: 19632
-7061:  DATA: 1412
-7062:  DATA: 15070
-7063:  DATA: 29232
-7064:  DATA: 11121
-7065:  DATA: 24609
-7066:  DATA: 6546
-7067:  DATA: 20204
-7068:  DATA: 1575
-7069:  DATA: 16246
-7070:  DATA: 29896
-7071:  DATA: 11731
-7072:  DATA: 25909
-7073:  DATA: 6777
-7074:  DATA: 21436
-7075:  DATA: 2292
-7076:  DATA: 16426
-7077:  DATA: 31082
-7078:  DATA: 11984
-7079:  DATA: 26577
-7080:  DATA: 8060
-7081:  DATA: 21687
-7082:  DATA: 3551
-7083:  DATA: 17688
-7084:  DATA: 31395
-7085:  DATA: 13269
-7086:  DATA: 27440
-7087:  DATA: 8321
-7088:  DATA: 22588
-7089:  DATA: 4432
-7090:  DATA: 18096
-7091:  DATA: 32284
-7092:  DATA: 14253
-7093:  DATA: 27871
-7094:  DATA: 9233
-7095:  DATA: 23852
-7096:  DATA: 5461
-7097:  DATA: 19094
-7098:  DATA: 592
-7099:  DATA: 15284
-7100:  DATA: 29483
-7101:  DATA: 10408
-7102:  DATA: 24688
-7103:  DATA: 6582
-7104:  DATA: 20795
-7105:  DATA: 1723
-7106:  DATA: 15908
-7107:  DATA: 30644
-7108:  DATA: 12074
-7109:  DATA: 25784
-7110:  DATA: 7189
-7111:  DATA: 21957
-7112:  DATA: 3445
-7113:  DATA: 17129
-7114:  DATA: 31327
-7115:  DATA: 13251
-7116:  DATA: 27555
-7117:  DATA: 9053
-7118:  DATA: 22756
-7119:  DATA: 4189
-7120:  DATA: 18481
-7121:  DATA: 469
-7122:  DATA: 14706
-7123:  DATA: 28367
-7124:  DATA: 9901
-7125:  DATA: 24073
-7126:  DATA: 6103
-7127:  DATA: 20384
-7128:  DATA: 1848
-7129:  DATA: 15493
-7130:  DATA: 29849
-7131:  DATA: 11385
-7132:  DATA: 25700
-7133:  DATA: 7662
-7134:  DATA: 21950
-7135:  DATA: 3444
-7136:  DATA: 17700
-7137:  DATA: 31462
-7138:  DATA: 13041
-7139:  DATA: 27197
-7140:  DATA: 8804
-7141:  DATA: 23508
-7142:  DATA: 5023
-7143:  DATA: 19280
-7144:  DATA: 820
-7145:  DATA: 15153
-7146:  DATA: 28866
-7147:  DATA: 10388
-7148:  DATA: 24804
-7149:  DATA: 6217
-7150:  DATA: 20607
-7151:  DATA: 2133
-7152:  DATA: 16435
-7153:  DATA: 31175
-7154:  DATA: 12785
-7155:  DATA: 27039
-7156:  DATA: 8676
-7157:  DATA: 22873
-7158:  DATA: 4440
-7159:  DATA: 18784
-7160:  DATA: 308
-7161:  DATA: 14599
-7162:  DATA: 28930
-7163:  DATA: 10532
-7164:  DATA: 24864
-7165:  DATA: 6458
-7166:  DATA: 20789
-7167:  DATA: 2425
-7168:  DATA: 16756
-7169:  DATA: 31031
-7170:  DATA: 12581
-7171:  DATA: 26921
-7172:  DATA: 8548
-7173:  DATA: 22820
-7174:  DATA: 4356
-7175:  DATA: 18757
-7176:  DATA: 369
-7177:  DATA: 14707
-7178:  DATA: 29009
-7179:  DATA: 10569
-7180:  DATA: 24993
-7181:  DATA: 6542
-7182:  DATA: 20912
-7183:  DATA: 2508
-7184:  DATA: 16443
-7185:  DATA: 30720
-7186:  DATA: 12386
-7187:  DATA: 26653
-7188:  DATA: 8355
-7189:  DATA: 22687
-7190:  DATA: 4305
-7191:  DATA: 19254
-7192:  DATA: 868
-7193:  DATA: 15109
-7194:  DATA: 29593
-7195:  DATA: 11235
-7196:  DATA: 25188
-7197:  DATA: 6761
-7198:  DATA: 21176
-7199:  DATA: 2800
-7200:  DATA: 17780
-7201:  DATA: 32113
-7202:  DATA: 13745
-7203:  DATA: 28143
-7204:  DATA: 9263
-7205:  DATA: 23651
-7206:  DATA: 5269
-7207:  DATA: 19670
-7208:  DATA: 1895
-7209:  DATA: 16363
-7210:  DATA: 30608
-7211:  DATA: 11853
-7212:  DATA: 26269
-7213:  DATA: 7890
-7214:  DATA: 22885
-7215:  DATA: 4565
-7216:  DATA: 18485
-7217:  DATA: 71
-7218:  DATA: 14581
-7219:  DATA: 29533
-7220:  DATA: 11188
-7221:  DATA: 25537
-7222:  DATA: 6725
-7223:  DATA: 21224
-7224:  DATA: 3449
-7225:  DATA: 17792
-7226:  DATA: 31748
-7227:  DATA: 13476
-7228:  DATA: 28458
-7229:  DATA: 10170
-7230:  DATA: 24176
-7231:  DATA: 5796
-7232:  DATA: 20769
-7233:  DATA: 2492
-7234:  DATA: 16435
-7235:  DATA: 30902
-7236:  DATA: 13096
-7237:  DATA: 27572
-7238:  DATA: 8784
-7239:  DATA: 23169
-7240:  DATA: 5499
-7241:  DATA: 19954
-7242:  DATA: 1118
-7243:  DATA: 15578
-7244:  DATA: 30629
-7245:  DATA: 11791
-7246:  DATA: 26356
-7247:  DATA: 8469
-7248:  DATA: 22589
-7249:  DATA: 4251
-7250:  DATA: 19300
-7251:  DATA: 978
-7252:  DATA: 15076
-7253:  DATA: 29977
-7254:  DATA: 11736
-7255:  DATA: 25760
-7256:  DATA: 7988
-7257:  DATA: 22470
-7258:  DATA: 3736
-7259:  DATA: 18796
-7260:  DATA: 55
-7261:  DATA: 14576
-7262:  DATA: 29694
-7263:  DATA: 10811
-7264:  DATA: 25978
-7265:  DATA: 7569
-7266:  DATA: 21684
-7267:  DATA: 3954
-7268:  DATA: 17971
-7269:  DATA: 32483
-7270:  DATA: 14843
-7271:  DATA: 28776
-7272:  DATA: 11131
-7273:  DATA: 25142
-7274:  DATA: 6851
-7275:  DATA: 21965
-7276:  DATA: 3239
-7277:  DATA: 18268
-7278:  DATA: 32358
-7279:  DATA: 14608
-7280:  DATA: 28710
-7281:  DATA: 10459
-7282:  DATA: 25409
-7283:  DATA: 6820
-7284:  DATA: 21931
-7285:  DATA: 3160
-7286:  DATA: 18192
-7287:  DATA: 32356
-7288:  DATA: 14694
-7289:  DATA: 28672
-7290:  DATA: 11088
-7291:  DATA: 25150
-7292:  DATA: 7472
-7293:  DATA: 21564
-7294:  DATA: 3902
-7295:  DATA: 17969
-7296:  DATA: 317
-7297:  DATA: 14395
-7298:  DATA: 29495
-7299:  DATA: 10877
-7300:  DATA: 25901
-7301:  DATA: 7203
-7302:  DATA: 22352
-7303:  DATA: 3588
-7304:  DATA: 18740
-7305:  DATA: 105
-7306:  DATA: 15185
-7307:  DATA: 29279
-7308:  DATA: 11683
-7309:  DATA: 25752
-7310:  DATA: 8112
-7311:  DATA: 22230
-7312:  DATA: 4149
-7313:  DATA: 19203
-7314:  DATA: 629
-7315:  DATA: 15695
-7316:  DATA: 29866
-7317:  DATA: 12237
-7318:  DATA: 26326
-7319:  DATA: 8240
-7320:  DATA: 23416
-7321:  DATA: 4681
-7322:  DATA: 19920
-7323:  DATA: 1250
-7324:  DATA: 15906
-7325:  DATA: 31037
-7326:  DATA: 12466
-7327:  DATA: 27644
-7328:  DATA: 9531
-7329:  DATA: 23673
-7330:  DATA: 6053
-7331:  DATA: 20208
-7332:  DATA: 2093
-7333:  DATA: 17251
-7334:  DATA: 31381
-7335:  DATA: 13782
-7336:  DATA: 28535
-7337:  DATA: 9888
-7338:  DATA: 25054
-7339:  DATA: 6937
-7340:  DATA: 21220
-7341:  DATA: 3536
-7342:  DATA: 18303
-7343:  DATA: 32390
-7344:  DATA: 14375
-7345:  DATA: 29467
-7346:  DATA: 10928
-7347:  DATA: 25693
-7348:  DATA: 8077
-7349:  DATA: 22233
-7350:  DATA: 4112
-7351:  DATA: 19432
-7352:  DATA: 1377
-7353:  DATA: 15510
-7354:  DATA: 30212
-7355:  DATA: 12781
-7356:  DATA: 27436
-7357:  DATA: 8892
-7358:  DATA: 23590
-7359:  DATA: 6064
-7360:  DATA: 20852
-7361:  DATA: 2231
-7362:  DATA: 16930
-7363:  DATA: 32178
-7364:  DATA: 14127
-7365:  DATA: 28328
-7366:  DATA: 10270
-7367:  DATA: 25541
-7368:  DATA: 7533
-7369:  DATA: 21738
-7370:  DATA: 3653
-7371:  DATA: 18911
-7372:  DATA: 996
-7373:  DATA: 15643
-7374:  DATA: 29937
-7375:  DATA: 11865
-7376:  DATA: 26680
-7377:  DATA: 9172
-7378:  DATA: 23856
-7379:  DATA: 5277
-7380:  DATA: 20112
-7381:  DATA: 2053
-7382:  DATA: 17365
-7383:  DATA: 32229
-7384:  DATA: 14199
-7385:  DATA: 28356
-7386:  DATA: 10374
-7387:  DATA: 25192
-7388:  DATA: 7222
-7389:  DATA: 22515
-7390:  DATA: 4592
-7391:  DATA: 19312
-7392:  DATA: 1324
-7393:  DATA: 15585
-7394:  DATA: 30389
-7395:  DATA: 12403
-7396:  DATA: 27168
-7397:  DATA: 9726
-7398:  DATA: 24528
-7399:  DATA: 6481
-7400:  DATA: 21371
-7401:  DATA: 3429
-7402:  DATA: 17604
-7403:  DATA: 32389
-7404:  DATA: 14497
-7405:  DATA: 29213
-7406:  DATA: 11381
-7407:  DATA: 26132
-7408:  DATA: 8231
-7409:  DATA: 23489
-7410:  DATA: 5552
-7411:  DATA: 20380
-7412:  DATA: 2474
-7413:  DATA: 17225
-7414:  DATA: 32016
-7415:  DATA: 14194
-7416:  DATA: 29041
-7417:  DATA: 11030
-7418:  DATA: 25860
-7419:  DATA: 8054
-7420:  DATA: 22884
-7421:  DATA: 4924
-7422:  DATA: 19748
-7423:  DATA: 1909
-7424:  DATA: 16672
-7425:  DATA: 31549
-7426:  DATA: 13621
-7427:  DATA: 28541
-7428:  DATA: 10547
-7429:  DATA: 25384
-7430:  DATA: 7427
-7431:  DATA: 22289
-7432:  DATA: 4404
-7433:  DATA: 19296
-7434:  DATA: 1374
-7435:  DATA: 16201
-7436:  DATA: 31208
-7437:  DATA: 13277
-7438:  DATA: 28137
-7439:  DATA: 10202
-7440:  DATA: 24609
-7441:  DATA: 6741
-7442:  DATA: 21604
-7443:  DATA: 3669
-7444:  DATA: 18605
-7445:  DATA: 643
-7446:  DATA: 15579
-7447:  DATA: 31077
-7448:  DATA: 13165
-7449:  DATA: 27978
-7450:  DATA: 10117
-7451:  DATA: 25005
-7452:  DATA: 6711
-7453:  DATA: 21624
-7454:  DATA: 3765
-7455:  DATA: 18613
-7456:  DATA: 1333
-7457:  DATA: 16181
-7458:  DATA: 31136
-7459:  DATA: 13308
-7460:  DATA: 27703
-7461:  DATA: 9854
-7462:  DATA: 24721
-7463:  DATA: 6850
-7464:  DATA: 22385
-7465:  DATA: 4581
-7466:  DATA: 19420
-7467:  DATA: 1032
-7468:  DATA: 16037
-7469:  DATA: 30937
-7470:  DATA: 13689
-7471:  DATA: 28571
-7472:  DATA: 10291
-7473:  DATA: 25109
-7474:  DATA: 7423
-7475:  DATA: 22792
-7476:  DATA: 5040
-7477:  DATA: 19853
-7478:  DATA: 1631
-7479:  DATA: 16611
-7480:  DATA: 32052
-7481:  DATA: 14225
-7482:  DATA: 28696
-7483:  DATA: 10920
-7484:  DATA: 26468
-7485:  DATA: 8638
-7486:  DATA: 23089
-7487:  DATA: 5283
-7488:  DATA: 20785
-7489:  DATA: 2983
-7490:  DATA: 17470
-7491:  DATA: 32499
-7492:  DATA: 15168
-7493:  DATA: 30138
-7494:  DATA: 11797
-7495:  DATA: 26774
-7496:  DATA: 9568
-7497:  DATA: 24449
-7498:  DATA: 6229
-7499:  DATA: 21196
-7500:  DATA: 4023
-7501:  DATA: 18441
-7502:  DATA: 667
-7503:  DATA: 16248
-7504:  DATA: 30779
-7505:  DATA: 12934
-7506:  DATA: 28515
-7507:  DATA: 10653
-7508:  DATA: 25255
-7509:  DATA: 7948
-7510:  DATA: 22982
-7511:  DATA: 4768
-7512:  DATA: 20326
-7513:  DATA: 2507
-7514:  DATA: 17040
-7515:  DATA: 32596
-7516:  DATA: 14379
-7517:  DATA: 29416
-7518:  DATA: 12272
-7519:  DATA: 26740
-7520:  DATA: 9510
-7521:  DATA: 24560
-7522:  DATA: 6384
-7523:  DATA: 21870
-7524:  DATA: 3632
-7525:  DATA: 18668
-7526:  DATA: 1438
-7527:  DATA: 15937
-7528:  DATA: 31613
-7529:  DATA: 13355
-7530:  DATA: 28375
-7531:  DATA: 11213
-7532:  DATA: 25773
-7533:  DATA: 8531
-7534:  DATA: 23088
-7535:  DATA: 5908
-7536:  DATA: 20596
-7537:  DATA: 2777
-7538:  DATA: 18417
-7539:  DATA: 143
-7540:  DATA: 15779
-7541:  DATA: 30280
-7542:  DATA: 13072
-7543:  DATA: 27750
-7544:  DATA: 10613
-7545:  DATA: 25107
-7546:  DATA: 7957
-7547:  DATA: 22591
-7548:  DATA: 5418
-7549:  DATA: 20093
-7550:  DATA: 2870
-7551:  DATA: 17440
-7552:  DATA: 312
-7553:  DATA: 14905
-7554:  DATA: 30576
-7555:  DATA: 12338
-7556:  DATA: 27938
-7557:  DATA: 9837
-7558:  DATA: 25362
-7559:  DATA: 7180
-7560:  DATA: 22907
-7561:  DATA: 4713
-7562:  DATA: 20293
-7563:  DATA: 2112
-7564:  DATA: 17837
-7565:  DATA: 32403
-7566:  DATA: 15349
-7567:  DATA: 29894
-7568:  DATA: 12343
-7569:  DATA: 27920
-7570:  DATA: 9854
-7571:  DATA: 25417
-7572:  DATA: 7396
-7573:  DATA: 22912
-7574:  DATA: 4831
-7575:  DATA: 20022
-7576:  DATA: 2919
-7577:  DATA: 17419
-7578:  DATA: 464
-7579:  DATA: 15021
-7580:  DATA: 30224
-7581:  DATA: 13173
-7582:  DATA: 27829
-7583:  DATA: 10677
-7584:  DATA: 25911
-7585:  DATA: 7796
-7586:  DATA: 23462
-7587:  DATA: 5368
-7588:  DATA: 20534
-7589:  DATA: 3427
-7590:  DATA: 18128
-7591:  DATA: 960
-7592:  DATA: 16236
-7593:  DATA: 30897
-7594:  DATA: 13781
-7595:  DATA: 28931
-7596:  DATA: 10912
-7597:  DATA: 26574
-7598:  DATA: 9008
-7599:  DATA: 23681
-7600:  DATA: 6203
-7601:  DATA: 21781
-7602:  DATA: 3812
-7603:  DATA: 18965
-7604:  DATA: 1953
-7605:  DATA: 16525
-7606:  DATA: 31815
-7607:  DATA: 14816
-7608:  DATA: 30055
-7609:  DATA: 11921
-7610:  DATA: 27230
-7611:  DATA: 10185
-7612:  DATA: 25395
-7613:  DATA: 7352
-7614:  DATA: 22563
-7615:  DATA: 5537
-7616:  DATA: 20831
-7617:  DATA: 2712
-7618:  DATA: 17983
-7619:  DATA: 942
-7620:  DATA: 16183
-7621:  DATA: 30957
-7622:  DATA: 13331
-7623:  DATA: 29060
-7624:  DATA: 11618
-7625:  DATA: 26336
-7626:  DATA: 8770
-7627:  DATA: 24515
-7628:  DATA: 7001
-7629:  DATA: 22308
-7630:  DATA: 4351
-7631:  DATA: 19520
-7632:  DATA: 2164
-7633:  DATA: 17812
-7634:  DATA: 354
-7635:  DATA: 15064
-7636:  DATA: 30436
-7637:  DATA: 12830
-7638:  DATA: 28612
-7639:  DATA: 11172
-7640:  DATA: 26490
-7641:  DATA: 8385
-7642:  DATA: 23705
-7643:  DATA: 6243
-7644:  DATA: 21539
-7645:  DATA: 4541
-7646:  DATA: 19897
-7647:  DATA: 2427
-7648:  DATA: 17780
-7649:  DATA: 32500
-7650:  DATA: 15088
-7651:  DATA: 30321
-7652:  DATA: 12837
-7653:  DATA: 28671
-7654:  DATA: 11159
-7655:  DATA: 26432
-7656:  DATA: 9012
-7657:  DATA: 24358
-7658:  DATA: 6353
-7659:  DATA: 21659
-7660:  DATA: 4257
-7661:  DATA: 19535
-7662:  DATA: 2174
-7663:  DATA: 17493
-7664:  DATA: 50
-7665:  DATA: 15808
-7666:  DATA: 31228
-7667:  DATA: 13713
-7668:  DATA: 29156
-7669:  DATA: 11586
-7670:  DATA: 26966
-7671:  DATA: 9509
-7672:  DATA: 24950
-7673:  DATA: 7436
-7674:  DATA: 22815
-7675:  DATA: 5409
-7676:  DATA: 20785
-7677:  DATA: 3376
-7678:  DATA: 18745
-7679:  DATA: 1339
-7680:  DATA: 16689
-7681:  DATA: 32038
-7682:  DATA: 14643
-7683:  DATA: 30008
-7684:  DATA: 12586
-7685:  DATA: 27961
-7686:  DATA: 10576
-7687:  DATA: 25864
-7688:  DATA: 8571
-7689:  DATA: 23926
-7690:  DATA: 6467
-7691:  DATA: 21763
-7692:  DATA: 4580
-7693:  DATA: 19933
-7694:  DATA: 2500
-7695:  DATA: 17885
-7696:  DATA: 49
-7697:  DATA: 15445
-7698:  DATA: 30835
-7699:  DATA: 13404
-7700:  DATA: 28850
-7701:  DATA: 11400
-7702:  DATA: 26818
-7703:  DATA: 10027
-7704:  DATA: 25396
-7705:  DATA: 8000
-7706:  DATA: 23432
-7707:  DATA: 6137
-7708:  DATA: 21025
-7709:  DATA: 3699
-7710:  DATA: 19124
-7711:  DATA: 1766
-7712:  DATA: 17780
-7713:  DATA: 353
-7714:  DATA: 15807
-7715:  DATA: 31165
-7716:  DATA: 13360
-7717:  DATA: 28773
-7718:  DATA: 11413
-7719:  DATA: 26757
-7720:  DATA: 10097
-7721:  DATA: 25508
-7722:  DATA: 8131
-7723:  DATA: 23065
-7724:  DATA: 5866
-7725:  DATA: 21149
-7726:  DATA: 4400
-7727:  DATA: 19873
-7728:  DATA: 2108
-7729:  DATA: 17488
-7730:  DATA: 226
-7731:  DATA: 16152
-7732:  DATA: 31716
-7733:  DATA: 14276
-7734:  DATA: 29251
-7735:  DATA: 11941
-7736:  DATA: 28021
-7737:  DATA: 10693
-7738:  DATA: 25619
-7739:  DATA: 8383
-7740:  DATA: 24353
-7741:  DATA: 7083
-7742:  DATA: 22073
-7743:  DATA: 4774
-7744:  DATA: 20785
-7745:  DATA: 3573
-7746:  DATA: 18489
-7747:  DATA: 1203
-7748:  DATA: 17252
-7749:  DATA: 32697
-7750:  DATA: 14872
-7751:  DATA: 30336
-7752:  DATA: 13620
-7753:  DATA: 29175
-7754:  DATA: 11359
-7755:  DATA: 26830
-7756:  DATA: 10159
-7757:  DATA: 25102
-7758:  DATA: 7856
-7759:  DATA: 23874
-7760:  DATA: 6204
-7761:  DATA: 21660
-7762:  DATA: 4979
-7763:  DATA: 20437
-7764:  DATA: 2788
-7765:  DATA: 18690
-7766:  DATA: 1472
-7767:  DATA: 16544
-7768:  DATA: 32634
-7769:  DATA: 15318
-7770:  DATA: 30416
-7771:  DATA: 13668
-7772:  DATA: 28714
-7773:  DATA: 11497
-7774:  DATA: 27583
-7775:  DATA: 9781
-7776:  DATA: 25909
-7777:  DATA: 8629
-7778:  DATA: 23712
-7779:  DATA: 7036
-7780:  DATA: 22071
-7781:  DATA: 4862
-7782:  DATA: 20881
-7783:  DATA: 3138
-7784:  DATA: 19313
-7785:  DATA: 1643
-7786:  DATA: 17076
-7787:  DATA: 392
-7788:  DATA: 15525
-7789:  DATA: 31566
-7790:  DATA: 13924
-7791:  DATA: 30066
-7792:  DATA: 12324
-7793:  DATA: 27860
-7794:  DATA: 11235
-7795:  DATA: 26254
-7796:  DATA: 9637
-7797:  DATA: 24650
-7798:  DATA: 8021
-7799:  DATA: 23042
-7800:  DATA: 6468
-7801:  DATA: 21508
-7802:  DATA: 4867
-7803:  DATA: 20030
-7804:  DATA: 3365
-7805:  DATA: 18490
-7806:  DATA: 1845
-7807:  DATA: 17125
-7808:  DATA: 269
-7809:  DATA: 15418
-7810:  DATA: 31525
-7811:  DATA: 13949
-7812:  DATA: 29989
-7813:  DATA: 12351
-7814:  DATA: 28437
-7815:  DATA: 10821
-7816:  DATA: 27005
-7817:  DATA: 9323
-7818:  DATA: 25360
-7819:  DATA: 7756
-7820:  DATA: 24036
-7821:  DATA: 6302
-7822:  DATA: 22498
-7823:  DATA: 4816
-7824:  DATA: 20514
-7825:  DATA: 3868
-7826:  DATA: 19043
-7827:  DATA: 2392
-7828:  DATA: 17636
-7829:  DATA: 898
-7830:  DATA: 16094
-7831:  DATA: 31845
-7832:  DATA: 15200
-7833:  DATA: 30285
-7834:  DATA: 13717
-7835:  DATA: 28845
-7836:  DATA: 11827
-7837:  DATA: 28024
-7838:  DATA: 10403
-7839:  DATA: 26593
-7840:  DATA: 9588
-7841:  DATA: 24674
-7842:  DATA: 8113
-7843:  DATA: 23281
-7844:  DATA: 6184
-7845:  DATA: 22317
-7846:  DATA: 4767
-7847:  DATA: 20931
-7848:  DATA: 3892
-7849:  DATA: 19121
-7850:  DATA: 2520
-7851:  DATA: 18184
-7852:  DATA: 740
-7853:  DATA: 16848
-7854:  DATA: 32639
-7855:  DATA: 14982
-7856:  DATA: 30759
-7857:  DATA: 14101
-7858:  DATA: 29427
-7859:  DATA: 12316
-7860:  DATA: 28594
-7861:  DATA: 10952
-7862:  DATA: 26690
-7863:  DATA: 10219
-7864:  DATA: 25914
-7865:  DATA: 8389
-7866:  DATA: 24144
-7867:  DATA: 7564
-7868:  DATA: 23396
-7869:  DATA: 5817
-7870:  DATA: 21553
-7871:  DATA: 5031
-7872:  DATA: 20799
-7873:  DATA: 3317
-7874:  DATA: 18976
-7875:  DATA: 2492
-7876:  DATA: 18231
-7877:  DATA: 702
-7878:  DATA: 16401
-7879:  DATA: 32642
-7880:  DATA: 15729
-7881:  DATA: 30885
-7882:  DATA: 13916
-7883:  DATA: 30152
-7884:  DATA: 13221
-7885:  DATA: 28953
-7886:  DATA: 11491
-7887:  DATA: 27157
-7888:  DATA: 10290
-7889:  DATA: 26496
-7890:  DATA: 9570
-7891:  DATA: 24777
-7892:  DATA: 7852
-7893:  DATA: 23560
-7894:  DATA: 7106
-7895:  DATA: 23013
-7896:  DATA: 5987
-7897:  DATA: 21184
-7898:  DATA: 4227
-7899:  DATA: 20089
-7900:  DATA: 3178
-7901:  DATA: 19389
-7902:  DATA: 2544
-7903:  DATA: 18241
-7904:  DATA: 1340
-7905:  DATA: 16624
-7906:  DATA: 32418
-7907:  DATA: 15480
-7908:  DATA: 31332
-7909:  DATA: 14820
-7910:  DATA: 30595
-7911:  DATA: 13573
-7912:  DATA: 29557
-7913:  DATA: 12645
-7914:  DATA: 27868
-7915:  DATA: 10892
-7916:  DATA: 26784
-7917:  DATA: 9817
-7918:  DATA: 25717
-7919:  DATA: 8711
-7920:  DATA: 24692
-7921:  DATA: 8157
-7922:  DATA: 24053
-7923:  DATA: 7055
-7924:  DATA: 22945
-7925:  DATA: 5901
-7926:  DATA: 21831
-7927:  DATA: 4973
-7928:  DATA: 20861
-7929:  DATA: 3846
-7930:  DATA: 19736
-7931:  DATA: 2925
-7932:  DATA: 18728
-7933:  DATA: 1848
-7934:  DATA: 17713
-7935:  DATA: 817
-7936:  DATA: 16679
-7937:  DATA: 32629
-7938:  DATA: 15668
-7939:  DATA: 31538
-7940:  DATA: 14643
-7941:  DATA: 30499
-7942:  DATA: 13648
-7943:  DATA: 29452
-7944:  DATA: 12666
-7945:  DATA: 28529
-7946:  DATA: 11615
-7947:  DATA: 27405
-7948:  DATA: 10661
-7949:  DATA: 26589
-7950:  DATA: 9699
-7951:  DATA: 25560
-7952:  DATA: 8245
-7953:  DATA: 24089
-7954:  DATA: 7292
-7955:  DATA: 23128
-7956:  DATA: 6326
-7957:  DATA: 22209
-7958:  DATA: 5264
-7959:  DATA: 21800
-7960:  DATA: 4987
-7961:  DATA: 20822
-7962:  DATA: 3971
-7963:  DATA: 19872
-7964:  DATA: 2594
-7965:  DATA: 18548
-7966:  DATA: 1724
-7967:  DATA: 17657
-7968:  DATA: 1329
-7969:  DATA: 17265
-7970:  DATA: 496
-7971:  DATA: 16382
-7972:  DATA: 31781
-7973:  DATA: 14971
-7974:  DATA: 30869
-7975:  DATA: 14039
-7976:  DATA: 30586
-7977:  DATA: 13797
-7978:  DATA: 29650
-7979:  DATA: 12296
-7980:  DATA: 28328
-7981:  DATA: 11474
-7982:  DATA: 28007
-7983:  DATA: 11227
-7984:  DATA: 26706
-7985:  DATA: 9814
-7986:  DATA: 25841
-7987:  DATA: 9483
-7988:  DATA: 25505
-7989:  DATA: 8671
-7990:  DATA: 24158
-7991:  DATA: 7299
-7992:  DATA: 23928
-7993:  DATA: 7044
-7994:  DATA: 22548
-7995:  DATA: 5801
-7996:  DATA: 22305
-7997:  DATA: 5551
-7998:  DATA: 21080
-7999:  DATA: 4273
-8000:  DATA: 20789
-8001:  DATA: 4007
-8002:  DATA: 19515
-8003:  DATA: 2739
-8004:  DATA: 19233
-8005:  DATA: 2494
-8006:  DATA: 17923
-8007:  DATA: 1250
-8008:  DATA: 17732
-8009:  DATA: 996
-8010:  DATA: 16451
-8011:  DATA: 32478
-8012:  DATA: 16293
-8013:  DATA: 31770
-8014:  DATA: 15093
-8015:  DATA: 31500
-8016:  DATA: 14365
-8017:  DATA: 30337
-8018:  DATA: 14128
-8019:  DATA: 30164
-8020:  DATA: 12983
-8021:  DATA: 29517
-8022:  DATA: 12736
-8023:  DATA: 28332
-8024:  DATA: 12128
-8025:  DATA: 28102
-8026:  DATA: 10904
-8027:  DATA: 27437
-8028:  DATA: 10278
-8029:  DATA: 26353
-8030:  DATA: 10161
-8031:  DATA: 25718
-8032:  DATA: 9535
-8033:  DATA: 25531
-8034:  DATA: 8432
-8035:  DATA: 24893
-8036:  DATA: 7709
-8037:  DATA: 23778
-8038:  DATA: 7557
-8039:  DATA: 23045
-8040:  DATA: 7029
-8041:  DATA: 22583
-8042:  DATA: 5845
-8043:  DATA: 22477
-8044:  DATA: 5288
-8045:  DATA: 21844
-8046:  DATA: 4731
-8047:  DATA: 21264
-8048:  DATA: 4152
-8049:  DATA: 20172
-8050:  DATA: 4016
-8051:  DATA: 19593
-8052:  DATA: 3499
-8053:  DATA: 18957
-8054:  DATA: 2898
-8055:  DATA: 18528
-8056:  DATA: 2356
-8057:  DATA: 17920
-8058:  DATA: 1809
-8059:  DATA: 17465
-8060:  DATA: 1313
-8061:  DATA: 16947
-8062:  DATA: 880
-8063:  DATA: 16439
-8064:  DATA: 301
-8065:  DATA: 15989
-8066:  DATA: 32561
-8067:  DATA: 15485
-8068:  DATA: 32035
-8069:  DATA: 14911
-8070:  DATA: 31493
-8071:  DATA: 14336
-8072:  DATA: 31034
-8073:  DATA: 13902
-8074:  DATA: 30569
-8075:  DATA: 13378
-8076:  DATA: 30129
-8077:  DATA: 13021
-8078:  DATA: 29686
-8079:  DATA: 12496
-8080:  DATA: 28721
-8081:  DATA: 12569
-8082:  DATA: 28208
-8083:  DATA: 12105
-8084:  DATA: 27820
-8085:  DATA: 11660
-8086:  DATA: 27332
-8087:  DATA: 10853
-8088:  DATA: 27501
-8089:  DATA: 10314
-8090:  DATA: 27013
-8091:  DATA: 9983
-8092:  DATA: 26212
-8093:  DATA: 10097
-8094:  DATA: 25785
-8095:  DATA: 9714
-8096:  DATA: 25916
-8097:  DATA: 8801
-8098:  DATA: 25584
-8099:  DATA: 8430
-8100:  DATA: 24619
-8101:  DATA: 8568
-8102:  DATA: 24194
-8103:  DATA: 8134
-8104:  DATA: 24433
-8105:  DATA: 7397
-8106:  DATA: 24025
-8107:  DATA: 7454
-8108:  DATA: 23268
-8109:  DATA: 7120
-8110:  DATA: 23423
-8111:  DATA: 6279
-8112:  DATA: 22577
-8113:  DATA: 6421
-8114:  DATA: 22244
-8115:  DATA: 5653
-8116:  DATA: 22437
-8117:  DATA: 5315
-8118:  DATA: 21520
-8119:  DATA: 5622
-8120:  DATA: 21857
-8121:  DATA: 4739
-8122:  DATA: 21014
-8123:  DATA: 5028
-8124:  DATA: 21287
-8125:  DATA: 4276
-8126:  DATA: 20533
-8127:  DATA: 4539
-8128:  DATA: 20768
-8129:  DATA: 3829
-8130:  DATA: 20004
-8131:  DATA: 4018
-8132:  DATA: 20324
-8133:  DATA: 3238
-8134:  DATA: 19477
-8135:  DATA: 3456
-8136:  DATA: 19812
-8137:  DATA: 2725
-8138:  DATA: 19031
-8139:  DATA: 3039
-8140:  DATA: 19377
-8141:  DATA: 2840
-8142:  DATA: 18659
-8143:  DATA: 2069
-8144:  DATA: 18485
-8145:  DATA: 2434
-8146:  DATA: 18801
-8147:  DATA: 1732
-8148:  DATA: 18154
-8149:  DATA: 1637
-8150:  DATA: 18387
-8151:  DATA: 1962
-8152:  DATA: 18298
-8153:  DATA: 1233
-8154:  DATA: 17561
-8155:  DATA: 1123
-8156:  DATA: 17457
-8157:  DATA: 1528
-8158:  DATA: 17876
-8159:  DATA: 1399
-8160:  DATA: 17717
-8161:  DATA: 758
-8162:  DATA: 17083
-8163:  DATA: 530
-8164:  DATA: 16912
-8165:  DATA: 1018
-8166:  DATA: 17305
-8167:  DATA: 854
-8168:  DATA: 17248
-8169:  DATA: 828
-8170:  DATA: 16528
-8171:  DATA: 157
-8172:  DATA: 16549
-8173:  DATA: 78
-8174:  DATA: 16483
-8175:  IN   16435
-8177:  DATA: 464
-8178:  DATA: 16867
-8179:  DATA: 390
-8180:  DATA: 16797
-8181:  DATA: 322
-8182:  DATA: 16709
-8183:  DATA: 293
-8184:  DATA: 16757
-8185:  DATA: 279
-8186:  DATA: 16661
-8187:  DATA: 365
-8188:  DATA: 16685
-8189:  DATA: 307
-8190:  DATA: 16752
-8191:  DATA: 308
-8192:  DATA: 16756
-8193:  DATA: 312
-8194:  DATA: 16689
-8195:  DATA: 295
-8196:  DATA: 16673
-8197:  DATA: 365
-8198:  DATA: 16671
-8199:  DATA: 259
-8200:  DATA: 16692
-8201:  DATA: 369
-8202:  DATA: 16711
-8203:  DATA: 324
-8204:  DATA: 16823
-8205:  DATA: 393
-8206:  DATA: 16873
-8207:  DATA: 405
-8208:  DATA: 16440
-8209:  DATA: 28
-8210:  DATA: 16484
-8211:  DATA: 73
-8212:  DATA: 16552
-8213:  DATA: 136
-8214:  DATA: 16528
-8215:  DATA: 821
-8216:  DATA: 17269
-8217:  DATA: 854
-8218:  DATA: 17283
-8219:  DATA: 1004
-8220:  DATA: 16931
-8221:  DATA: 632
-8222:  DATA: 17059
-8223:  DATA: 697
-8224:  DATA: 17780
-8225:  DATA: 1396
-8226:  DATA: 17852
-8227:  DATA: 1521
-8228:  DATA: 17508
-8229:  DATA: 1129
-8230:  DATA: 17561
-8231:  DATA: 1224
-8232:  DATA: 18296
-8233:  DATA: 1980
-8234:  DATA: 18320
-8235:  DATA: 1537
-8236:  DATA: 18093
-8237:  DATA: 1737
-8238:  DATA: 18736
-8239:  DATA: 2455
-8240:  DATA: 18477
-8241:  DATA: 2069
-8242:  DATA: 18685
-8243:  DATA: 2834
-8244:  DATA: 19382
-8245:  DATA: 3016
-8246:  DATA: 18960
-8247:  DATA: 2791
-8248:  DATA: 19837
-8249:  DATA: 3466
-8250:  DATA: 19484
-8251:  DATA: 3256
-8252:  DATA: 20265
-8253:  DATA: 4020
-8254:  DATA: 20030
-8255:  DATA: 3760
-8256:  DATA: 20775
-8257:  DATA: 4534
-8258:  DATA: 20533
-8259:  DATA: 4275
-8260:  DATA: 21296
-8261:  DATA: 5101
-8262:  DATA: 21021
-8263:  DATA: 4746
-8264:  DATA: 21863
-8265:  DATA: 5622
-8266:  DATA: 21534
-8267:  DATA: 5261
-8268:  DATA: 22500
-8269:  DATA: 5673
-8270:  DATA: 22264
-8271:  DATA: 6480
-8272:  DATA: 22566
-8273:  DATA: 6288
-8274:  DATA: 23344
-8275:  DATA: 7124
-8276:  DATA: 23223
-8277:  DATA: 7501
-8278:  DATA: 24017
-8279:  DATA: 7397
-8280:  DATA: 24440
-8281:  DATA: 8132
-8282:  DATA: 24212
-8283:  DATA: 8553
-8284:  DATA: 24609
-8285:  DATA: 8431
-8286:  DATA: 25584
-8287:  DATA: 8829
-8288:  DATA: 25905
-8289:  DATA: 9703
-8290:  DATA: 25781
-8291:  DATA: 10045
-8292:  DATA: 26152
-8293:  DATA: 9960
-8294:  DATA: 27025
-8295:  DATA: 10305
-8296:  DATA: 27517
-8297:  DATA: 10795
-8298:  DATA: 27351
-8299:  DATA: 11725
-8300:  DATA: 27825
-8301:  DATA: 12109
-8302:  DATA: 28222
-8303:  DATA: 12659
-8304:  DATA: 28728
-8305:  DATA: 12500
-8306:  DATA: 29684
-8307:  DATA: 12953
-8308:  DATA: 30113
-8309:  DATA: 13407
-8310:  DATA: 30517
-8311:  DATA: 13931
-8312:  DATA: 31099
-8313:  DATA: 14359
-8314:  DATA: 31492
-8315:  DATA: 14885
-8316:  DATA: 32065
-8317:  DATA: 15406
-8318:  DATA: 32575
-8319:  DATA: 15904
-8320:  DATA: 288
-8321:  DATA: 16445
-8322:  DATA: 852
-8323:  DATA: 16952
-8324:  DATA: 1317
-8325:  DATA: 17470
-8326:  DATA: 1796
-8327:  DATA: 18017
-8328:  DATA: 2403
-8329:  DATA: 18528
-8330:  DATA: 2883
-8331:  DATA: 19033
-8332:  DATA: 3531
-8333:  DATA: 19625
-8334:  DATA: 4071
-8335:  DATA: 20188
-8336:  DATA: 4135
-8337:  DATA: 21249
-8338:  DATA: 4713
-8339:  DATA: 21789
-8340:  DATA: 5300
-8341:  DATA: 22412
-8342:  DATA: 5827
-8343:  DATA: 22582
-8344:  DATA: 7029
-8345:  DATA: 23106
-8346:  DATA: 7573
-8347:  DATA: 23806
-8348:  DATA: 7795
-8349:  DATA: 24900
-8350:  DATA: 8383
-8351:  DATA: 25568
-8352:  DATA: 9588
-8353:  DATA: 25716
-8354:  DATA: 10146
-8355:  DATA: 26360
-8356:  DATA: 10340
-8357:  DATA: 27492
-8358:  DATA: 10910
-8359:  DATA: 28037
-8360:  DATA: 12149
-8361:  DATA: 28389
-8362:  DATA: 12740
-8363:  DATA: 29466
-8364:  DATA: 12973
-8365:  DATA: 30158
-8366:  DATA: 14180
-8367:  DATA: 30348
-8368:  DATA: 14452
-8369:  DATA: 31576
-8370:  DATA: 15089
-8371:  DATA: 31751
-8372:  DATA: 16289
-8373:  DATA: 32397
-8374:  DATA: 16479
-8375:  DATA: 995
-8376:  DATA: 17716
-8377:  DATA: 1161
-8378:  DATA: 17945
-8379:  DATA: 2489
-8380:  DATA: 19248
-8381:  DATA: 2737
-8382:  DATA: 19509
-8383:  DATA: 4085
-8384:  DATA: 20772
-8385:  DATA: 4276
-8386:  DATA: 21027
-8387:  DATA: 5550
-8388:  DATA: 22309
-8389:  DATA: 5802
-8390:  DATA: 22549
-8391:  DATA: 7062
-8392:  DATA: 23864
-8393:  DATA: 7333
-8394:  DATA: 24145
-8395:  DATA: 8641
-8396:  DATA: 25512
-8397:  DATA: 9565
-8398:  DATA: 25841
-8399:  DATA: 9817
-8400:  DATA: 26685
-8401:  DATA: 11166
-8402:  DATA: 28021
-8403:  DATA: 11411
-8404:  DATA: 28353
-8405:  DATA: 12291
-8406:  DATA: 29663
-8407:  DATA: 13751
-8408:  DATA: 30560
-8409:  DATA: 14029
-8410:  DATA: 30965
-8411:  DATA: 14974
-8412:  DATA: 31787
-8413:  DATA: 16360
-8414:  DATA: 420
-8415:  DATA: 17277
-8416:  DATA: 1360
-8417:  DATA: 17634
-8418:  DATA: 1717
-8419:  DATA: 18542
-8420:  DATA: 2608
-8421:  DATA: 19842
-8422:  DATA: 4004
-8423:  DATA: 20818
-8424:  DATA: 4989
-8425:  DATA: 21814
-8426:  DATA: 5316
-8427:  DATA: 22164
-8428:  DATA: 6372
-8429:  DATA: 23117
-8430:  DATA: 7281
-8431:  DATA: 24070
-8432:  DATA: 8231
-8433:  DATA: 25556
-8434:  DATA: 9719
-8435:  DATA: 26520
-8436:  DATA: 10679
-8437:  DATA: 27418
-8438:  DATA: 11625
-8439:  DATA: 28522
-8440:  DATA: 12641
-8441:  DATA: 29509
-8442:  DATA: 13585
-8443:  DATA: 30527
-8444:  DATA: 14625
-8445:  DATA: 31613
-8446:  DATA: 15673
-8447:  DATA: 32571
-8448:  DATA: 16756
-8449:  DATA: 820
-8450:  DATA: 17776
-8451:  DATA: 1840
-8452:  DATA: 18725
-8453:  DATA: 2871
-8454:  DATA: 19733
-8455:  DATA: 3909
-8456:  DATA: 20859
-8457:  DATA: 4963
-8458:  DATA: 21776
-8459:  DATA: 5953
-8460:  DATA: 22957
-8461:  DATA: 7049
-8462:  DATA: 24036
-8463:  DATA: 8153
-8464:  DATA: 24625
-8465:  DATA: 8789
-8466:  DATA: 25700
-8467:  DATA: 9802
-8468:  DATA: 26797
-8469:  DATA: 10910
-8470:  DATA: 27844
-8471:  DATA: 12604
-8472:  DATA: 29492
-8473:  DATA: 13653
-8474:  DATA: 30609
-8475:  DATA: 14846
-8476:  DATA: 31287
-8477:  DATA: 15484
-8478:  DATA: 32439
-8479:  DATA: 16624
-8480:  DATA: 1319
-8481:  DATA: 18233
-8482:  DATA: 2544
-8483:  DATA: 19452
-8484:  DATA: 3112
-8485:  DATA: 20065
-8486:  DATA: 4304
-8487:  DATA: 21188
-8488:  DATA: 6008
-8489:  DATA: 22956
-8490:  DATA: 7131
-8491:  DATA: 23560
-8492:  DATA: 7914
-8493:  DATA: 24760
-8494:  DATA: 9598
-8495:  DATA: 26522
-8496:  DATA: 10278
-8497:  DATA: 27201
-8498:  DATA: 11512
-8499:  DATA: 29048
-8500:  DATA: 13239
-8501:  DATA: 30146
-8502:  DATA: 13893
-8503:  DATA: 30961
-8504:  DATA: 15740
-8505:  DATA: 32737
-8506:  DATA: 16405
-8507:  DATA: 684
-8508:  DATA: 18231
-8509:  DATA: 2473
-8510:  DATA: 19039
-8511:  DATA: 3201
-8512:  DATA: 20771
-8513:  DATA: 5052
-8514:  DATA: 21539
-8515:  DATA: 5801
-8516:  DATA: 23357
-8517:  DATA: 7661
-8518:  DATA: 24064
-8519:  DATA: 8324
-8520:  DATA: 25959
-8521:  DATA: 10230
-8522:  DATA: 26705
-8523:  DATA: 10954
-8524:  DATA: 28577
-8525:  DATA: 12302
-8526:  DATA: 29420
-8527:  DATA: 14188
-8528:  DATA: 30779
-8529:  DATA: 14976
-8530:  DATA: 32560
-8531:  DATA: 16860
-8532:  DATA: 694
-8533:  DATA: 18184
-8534:  DATA: 2448
-8535:  DATA: 19116
-8536:  DATA: 3962
-8537:  DATA: 20869
-8538:  DATA: 4753
-8539:  DATA: 22317
-8540:  DATA: 6185
-8541:  DATA: 23292
-8542:  DATA: 8106
-8543:  DATA: 24688
-8544:  DATA: 9588
-8545:  DATA: 26618
-8546:  DATA: 10422
-8547:  DATA: 27965
-8548:  DATA: 11813
-8549:  DATA: 28897
-8550:  DATA: 13721
-8551:  DATA: 30286
-8552:  DATA: 15217
-8553:  DATA: 31845
-8554:  DATA: 16092
-8555:  DATA: 900
-8556:  DATA: 17584
-8557:  DATA: 2377
-8558:  DATA: 19068
-8559:  DATA: 3856
-8560:  DATA: 20596
-8561:  DATA: 4805
-8562:  DATA: 22513
-8563:  DATA: 6286
-8564:  DATA: 23991
-8565:  DATA: 7756
-8566:  DATA: 25431
-8567:  DATA: 9312
-8568:  DATA: 26983
-8569:  DATA: 10825
-8570:  DATA: 28496
-8571:  DATA: 12332
-8572:  DATA: 29992
-8573:  DATA: 13873
-8574:  DATA: 31600
-8575:  DATA: 15393
-8576:  DATA: 291
-8577:  DATA: 16956
-8578:  DATA: 1827
-8579:  DATA: 18473
-8580:  DATA: 3389
-8581:  DATA: 20067
-8582:  DATA: 4986
-8583:  DATA: 21615
-8584:  DATA: 6464
-8585:  DATA: 23149
-8586:  DATA: 8021
-8587:  DATA: 24589
-8588:  DATA: 9652
-8589:  DATA: 26268
-8590:  DATA: 11235
-8591:  DATA: 27846
-8592:  DATA: 12341
-8593:  DATA: 29970
-8594:  DATA: 13941
-8595:  DATA: 31517
-8596:  DATA: 15536
-8597:  DATA: 386
-8598:  DATA: 17040
-8599:  DATA: 1585
-8600:  DATA: 19324
-8601:  DATA: 3136
-8602:  DATA: 20944
-8603:  DATA: 4840
-8604:  DATA: 22053
-8605:  DATA: 7022
-8606:  DATA: 23716
-8607:  DATA: 8629
-8608:  DATA: 25912
-8609:  DATA: 9850
-8610:  DATA: 27583
-8611:  DATA: 11510
-8612:  DATA: 28727
-8613:  DATA: 13613
-8614:  DATA: 30342
-8615:  DATA: 15296
-8616:  DATA: 32614
-8617:  DATA: 16572
-8618:  DATA: 1424
-8619:  DATA: 18697
-8620:  DATA: 2725
-8621:  DATA: 20431
-8622:  DATA: 4987
-8623:  DATA: 21710
-8624:  DATA: 6260
-8625:  DATA: 23884
-8626:  DATA: 7935
-8627:  DATA: 25096
-8628:  DATA: 10212
-8629:  DATA: 26841
-8630:  DATA: 11352
-8631:  DATA: 29164
-8632:  DATA: 13690
-8633:  DATA: 30350
-8634:  DATA: 14928
-8635:  DATA: 32692
-8636:  DATA: 17195
-8637:  DATA: 1192
-8638:  DATA: 18544
-8639:  DATA: 3517
-8640:  DATA: 20785
-8641:  DATA: 4788
-8642:  DATA: 22050
-8643:  DATA: 7165
-8644:  DATA: 24357
-8645:  DATA: 8429
-8646:  DATA: 25655
-8647:  DATA: 10647
-8648:  DATA: 28001
-8649:  DATA: 12000
-8650:  DATA: 29214
-8651:  DATA: 14248
-8652:  DATA: 31658
-8653:  DATA: 16146
-8654:  DATA: 226
-8655:  DATA: 17473
-8656:  DATA: 2108
-8657:  DATA: 19952
-8658:  DATA: 4451
-8659:  DATA: 21202
-8660:  DATA: 5809
-8661:  DATA: 23065
-8662:  DATA: 8152
-8663:  DATA: 25537
-8664:  DATA: 10083
-8665:  DATA: 26816
-8666:  DATA: 11395
-8667:  DATA: 28793
-8668:  DATA: 13376
-8669:  DATA: 31224
-8670:  DATA: 15793
-8671:  DATA: 358
-8672:  DATA: 17696
-8673:  DATA: 1690
-8674:  DATA: 19076
-8675:  DATA: 3690
-8676:  DATA: 21037
-8677:  DATA: 6142
-8678:  DATA: 23428
-8679:  DATA: 8028
-8680:  DATA: 25396
-8681:  DATA: 10037
-8682:  DATA: 26833
-8683:  DATA: 11422
-8684:  DATA: 28855
-8685:  DATA: 13404
-8686:  DATA: 30839
-8687:  DATA: 15376
-8688:  DATA: 39
-8689:  DATA: 17794
-8690:  DATA: 2505
-8691:  DATA: 19858
-8692:  DATA: 4529
-8693:  DATA: 21773
-8694:  DATA: 6481
-8695:  DATA: 23927
-8696:  DATA: 8561
-8697:  DATA: 25925
-8698:  DATA: 10521
-8699:  DATA: 27939
-8700:  DATA: 12644
-8701:  DATA: 30012
-8702:  DATA: 14704
-8703:  DATA: 32057
-8704:  DATA: 16701
-8705:  DATA: 1313
-8706:  DATA: 18724
-8707:  DATA: 3377
-8708:  DATA: 20769
-8709:  DATA: 5485
-8710:  DATA: 22813
-8711:  DATA: 7428
-8712:  DATA: 24942
-8713:  DATA: 9568
-8714:  DATA: 26896
-8715:  DATA: 11586
-8716:  DATA: 29090
-8717:  DATA: 13789
-8718:  DATA: 31204
-8719:  DATA: 15810
-8720:  DATA: 61
-8721:  DATA: 17414
-8722:  DATA: 2148
-8723:  DATA: 19524
-8724:  DATA: 4324
-8725:  DATA: 21661
-8726:  DATA: 6353
-8727:  DATA: 24374
-8728:  DATA: 9063
-8729:  DATA: 26436
-8730:  DATA: 11159
-8731:  DATA: 28648
-8732:  DATA: 12855
-8733:  DATA: 30257
-8734:  DATA: 15088
-8735:  DATA: 32500
-8736:  DATA: 17720
-8737:  DATA: 2425
-8738:  DATA: 19952
-8739:  DATA: 4604
-8740:  DATA: 21544
-8741:  DATA: 6244
-8742:  DATA: 23707
-8743:  DATA: 8384
-8744:  DATA: 26426
-8745:  DATA: 11200
-8746:  DATA: 28638
-8747:  DATA: 12802
-8748:  DATA: 30390
-8749:  DATA: 15049
-8750:  DATA: 376
-8751:  DATA: 17904
-8752:  DATA: 2087
-8753:  DATA: 19546
-8754:  DATA: 4325
-8755:  DATA: 22281
-8756:  DATA: 7084
-8757:  DATA: 24489
-8758:  DATA: 8789
-8759:  DATA: 26340
-8760:  DATA: 11623
-8761:  DATA: 29073
-8762:  DATA: 13439
-8763:  DATA: 30873
-8764:  DATA: 16179
-8765:  DATA: 948
-8766:  DATA: 17955
-8767:  DATA: 2721
-8768:  DATA: 20781
-8769:  DATA: 5621
-8770:  DATA: 22560
-8771:  DATA: 7356
-8772:  DATA: 25399
-8773:  DATA: 10174
-8774:  DATA: 27153
-8775:  DATA: 11906
-8776:  DATA: 30065
-8777:  DATA: 14838
-8778:  DATA: 31923
-8779:  DATA: 16628
-8780:  DATA: 1963
-8781:  DATA: 18952
-8782:  DATA: 3760
-8783:  DATA: 21844
-8784:  DATA: 6182
-8785:  DATA: 23696
-8786:  DATA: 9008
-8787:  DATA: 26580
-8788:  DATA: 10922
-8789:  DATA: 29005
-8790:  DATA: 13777
-8791:  DATA: 30949
-8792:  DATA: 16224
-8793:  DATA: 978
-8794:  DATA: 18073
-8795:  DATA: 3454
-8796:  DATA: 20528
-8797:  DATA: 5348
-8798:  DATA: 23536
-8799:  DATA: 7796
-8800:  DATA: 25912
-8801:  DATA: 10748
-8802:  DATA: 27835
-8803:  DATA: 13176
-8804:  DATA: 30308
-8805:  DATA: 15074
-8806:  DATA: 406
-8807:  DATA: 17413
-8808:  DATA: 2936
-8809:  DATA: 20012
-8810:  DATA: 4804
-8811:  DATA: 22937
-8812:  DATA: 7336
-8813:  DATA: 25432
-8814:  DATA: 9776
-8815:  DATA: 27909
-8816:  DATA: 12341
-8817:  DATA: 29894
-8818:  DATA: 15331
-8819:  DATA: 32412
-8820:  DATA: 17827
-8821:  DATA: 2120
-8822:  DATA: 20291
-8823:  DATA: 4649
-8824:  DATA: 22836
-8825:  DATA: 7172
-8826:  DATA: 25372
-8827:  DATA: 9761
-8828:  DATA: 28004
-8829:  DATA: 12336
-8830:  DATA: 30513
-8831:  DATA: 14895
-8832:  DATA: 305
-8833:  DATA: 17531
-8834:  DATA: 2906
-8835:  DATA: 20055
-8836:  DATA: 5392
-8837:  DATA: 22565
-8838:  DATA: 7957
-8839:  DATA: 25157
-8840:  DATA: 10609
-8841:  DATA: 27748
-8842:  DATA: 13123
-8843:  DATA: 30297
-8844:  DATA: 15844
-8845:  DATA: 141
-8846:  DATA: 18417
-8847:  DATA: 2758
-8848:  DATA: 20519
-8849:  DATA: 5908
-8850:  DATA: 23159
-8851:  DATA: 8536
-8852:  DATA: 25828
-8853:  DATA: 11148
-8854:  DATA: 28352
-8855:  DATA: 13365
-8856:  DATA: 31601
-8857:  DATA: 15940
-8858:  DATA: 1410
-8859:  DATA: 18686
-8860:  DATA: 3684
-8861:  DATA: 21867
-8862:  DATA: 6325
-8863:  DATA: 24551
-8864:  DATA: 9517
-8865:  DATA: 26677
-8866:  DATA: 12212
-8867:  DATA: 29436
-8868:  DATA: 14390
-8869:  DATA: 32614
-8870:  DATA: 17099
-8871:  DATA: 2437
-8872:  DATA: 20333
-8873:  DATA: 4778
-8874:  DATA: 22981
-8875:  DATA: 8013
-8876:  DATA: 25250
-8877:  DATA: 10712
-8878:  DATA: 28533
-8879:  DATA: 12953
-8880:  DATA: 30836
-8881:  DATA: 16217
-8882:  DATA: 761
-8883:  DATA: 18454
-8884:  DATA: 4001
-8885:  DATA: 21185
-8886:  DATA: 6217
-8887:  DATA: 24485
-8888:  DATA: 9568
-8889:  DATA: 26762
-8890:  DATA: 11856
-8891:  DATA: 30127
-8892:  DATA: 15137
-8893:  DATA: 32509
-8894:  DATA: 17461
-8895:  DATA: 2996
-8896:  DATA: 20768
-8897:  DATA: 5296
-8898:  DATA: 23102
-8899:  DATA: 8701
-8900:  DATA: 26406
-8901:  DATA: 10932
-8902:  DATA: 28752
-8903:  DATA: 14212
-8904:  DATA: 32052
-8905:  DATA: 16578
-8906:  DATA: 1602
-8907:  DATA: 19928
-8908:  DATA: 5025
-8909:  DATA: 22867
-8910:  DATA: 7317
-8911:  DATA: 25179
-8912:  DATA: 10299
-8913:  DATA: 28551
-8914:  DATA: 13668
-8915:  DATA: 30933
-8916:  DATA: 16065
-8917:  DATA: 1054
-8918:  DATA: 19423
-8919:  DATA: 4528
-8920:  DATA: 22368
-8921:  DATA: 6861
-8922:  DATA: 24820
-8923:  DATA: 9850
-8924:  DATA: 27681
-8925:  DATA: 13294
-8926:  DATA: 31140
-8927:  DATA: 16145
-8928:  DATA: 1329
-8929:  DATA: 18676
-8930:  DATA: 3747
-8931:  DATA: 21609
-8932:  DATA: 6731
-8933:  DATA: 25049
-8934:  DATA: 10119
-8935:  DATA: 27980
-8936:  DATA: 13159
-8937:  DATA: 31025
-8938:  DATA: 15561
-8939:  DATA: 717
-8940:  DATA: 18612
-8941:  DATA: 3676
-8942:  DATA: 21603
-8943:  DATA: 6662
-8944:  DATA: 24629
-8945:  DATA: 10194
-8946:  DATA: 28149
-8947:  DATA: 13198
-8948:  DATA: 31219
-8949:  DATA: 16244
-8950:  DATA: 1375
-8951:  DATA: 19312
-8952:  DATA: 4404
-8953:  DATA: 22276
-8954:  DATA: 7426
-8955:  DATA: 25384
-8956:  DATA: 10596
-8957:  DATA: 28468
-8958:  DATA: 13630
-8959:  DATA: 31605
-8960:  DATA: 16693
-8961:  DATA: 1909
-8962:  DATA: 19773
-8963:  DATA: 4924
-8964:  DATA: 22846
-8965:  DATA: 7976
-8966:  DATA: 25936
-8967:  DATA: 11018
-8968:  DATA: 29042
-8969:  DATA: 14117
-8970:  DATA: 32081
-8971:  DATA: 17217
-8972:  DATA: 2477
-8973:  DATA: 20374
-8974:  DATA: 5621
-8975:  DATA: 23445
-8976:  DATA: 8224
-8977:  DATA: 26114
-8978:  DATA: 11385
-8979:  DATA: 29262
-8980:  DATA: 14512
-8981:  DATA: 32404
-8982:  DATA: 17552
-8983:  DATA: 3381
-8984:  DATA: 21365
-8985:  DATA: 6486
-8986:  DATA: 24451
-8987:  DATA: 9708
-8988:  DATA: 27171
-8989:  DATA: 12408
-8990:  DATA: 30371
-8991:  DATA: 15545
-8992:  DATA: 1396
-8993:  DATA: 19316
-8994:  DATA: 4540
-8995:  DATA: 22513
-8996:  DATA: 7268
-8997:  DATA: 25185
-8998:  DATA: 10393
-8999:  DATA: 28369
-9000:  DATA: 14176
-9001:  DATA: 32169
-9002:  DATA: 17365
-9003:  DATA: 2115
-9004:  DATA: 20161
-9005:  DATA: 5331
-9006:  DATA: 23935
-9007:  DATA: 9095
-9008:  DATA: 26656
-9009:  DATA: 11869
-9010:  DATA: 29844
-9011:  DATA: 15640
-9012:  DATA: 933
-9013:  DATA: 18910
-9014:  DATA: 3652
-9015:  DATA: 21632
-9016:  DATA: 7527
-9017:  DATA: 25482
-9018:  DATA: 10245
-9019:  DATA: 28345
-9020:  DATA: 14124
-9021:  DATA: 32210
-9022:  DATA: 16900
-9023:  DATA: 2210
-9024:  DATA: 20797
-9025:  DATA: 6054
-9026:  DATA: 23588
-9027:  DATA: 8868
-9028:  DATA: 27492
-9029:  DATA: 12733
-9030:  DATA: 30225
-9031:  DATA: 15510
-9032:  DATA: 1383
-9033:  DATA: 19428
-9034:  DATA: 4183
-9035:  DATA: 22216
-9036:  DATA: 8119
-9037:  DATA: 25674
-9038:  DATA: 10953
-9039:  DATA: 29530
-9040:  DATA: 14369
-9041:  DATA: 32469
-9042:  DATA: 18289
-9043:  DATA: 3535
-9044:  DATA: 21153
-9045:  DATA: 6989
-9046:  DATA: 25049
-9047:  DATA: 9899
-9048:  DATA: 28468
-9049:  DATA: 13764
-9050:  DATA: 31440
-9051:  DATA: 17248
-9052:  DATA: 2085
-9053:  DATA: 20199
-9054:  DATA: 6069
-9055:  DATA: 23605
-9056:  DATA: 9531
-9057:  DATA: 27635
-9058:  DATA: 12528
-9059:  DATA: 31081
-9060:  DATA: 15923
-9061:  DATA: 1252
-9062:  DATA: 19843
-9063:  DATA: 4689
-9064:  DATA: 23405
-9065:  DATA: 8293
-9066:  DATA: 26332
-9067:  DATA: 12164
-9068:  DATA: 29872
-9069:  DATA: 15689
-9070:  DATA: 636
-9071:  DATA: 19216
-9072:  DATA: 4212
-9073:  DATA: 22213
-9074:  DATA: 8177
-9075:  DATA: 25742
-9076:  DATA: 11703
-9077:  DATA: 29260
-9078:  DATA: 15191
-9079:  DATA: 96
-9080:  DATA: 18791
-9081:  DATA: 3657
-9082:  DATA: 22352
-9083:  DATA: 7212
-9084:  DATA: 25896
-9085:  DATA: 10801
-9086:  DATA: 29552
-9087:  DATA: 14388
-9088:  DATA: 312
-9089:  DATA: 17980
-9090:  DATA: 3899
-9091:  DATA: 21560
-9092:  DATA: 7530
-9093:  DATA: 25161
-9094:  DATA: 11015
-9095:  DATA: 28672
-9096:  DATA: 14695
-9097:  DATA: 32369
-9098:  DATA: 18239
-9099:  DATA: 3193
-9100:  DATA: 21939
-9101:  DATA: 6804
-9102:  DATA: 25571
-9103:  DATA: 10433
-9104:  DATA: 28717
-9105:  DATA: 14677
-9106:  DATA: 32352
-9107:  DATA: 18268
-9108:  DATA: 3255
-9109:  DATA: 21918
-9110:  DATA: 6865
-9111:  DATA: 25122
-9112:  DATA: 11121
-9113:  DATA: 28758
-9114:  DATA: 14791
-9115:  DATA: 32468
-9116:  DATA: 17963
-9117:  DATA: 3944
-9118:  DATA: 21744
-9119:  DATA: 7668
-9120:  DATA: 25894
-9121:  DATA: 10864
-9122:  DATA: 29680
-9123:  DATA: 14580
-9124:  DATA: 42
-9125:  DATA: 18733
-9126:  DATA: 3729
-9127:  DATA: 22405
-9128:  DATA: 8057
-9129:  DATA: 25764
-9130:  DATA: 11722
-9131:  DATA: 29960
-9132:  DATA: 15076
-9133:  DATA: 978
-9134:  DATA: 19318
-9135:  DATA: 4309
-9136:  DATA: 22560
-9137:  DATA: 8514
-9138:  DATA: 26361
-9139:  DATA: 11790
-9140:  DATA: 30640
-9141:  DATA: 15572
-9142:  DATA: 1040
-9143:  DATA: 19945
-9144:  DATA: 5501
-9145:  DATA: 23185
-9146:  DATA: 8708
-9147:  DATA: 27553
-9148:  DATA: 13089
-9149:  DATA: 30973
-9150:  DATA: 16416
-9151:  DATA: 2484
-9152:  DATA: 20775
-9153:  DATA: 5798
-9154:  DATA: 24113
-9155:  DATA: 10170
-9156:  DATA: 28449
-9157:  DATA: 13502
-9158:  DATA: 31836
-9159:  DATA: 17861
-9160:  DATA: 3445
-9161:  DATA: 21225
-9162:  DATA: 6748
-9163:  DATA: 25485
-9164:  DATA: 11173
-9165:  DATA: 29457
-9166:  DATA: 14585
-9167:  DATA: 94
-9168:  DATA: 18481
-9169:  DATA: 4571
-9170:  DATA: 22804
-9171:  DATA: 7882
-9172:  DATA: 26273
-9173:  DATA: 11806
-9174:  DATA: 30660
-9175:  DATA: 16330
-9176:  DATA: 1856
-9177:  DATA: 19666
-9178:  DATA: 5273
-9179:  DATA: 23678
-9180:  DATA: 9264
-9181:  DATA: 28132
-9182:  DATA: 13808
-9183:  DATA: 32101
-9184:  DATA: 17717
-9185:  DATA: 2790
-9186:  DATA: 21155
-9187:  DATA: 6780
-9188:  DATA: 25123
-9189:  DATA: 11240
-9190:  DATA: 29571
-9191:  DATA: 15122
-9192:  DATA: 845
-9193:  DATA: 19242
-9194:  DATA: 4293
-9195:  DATA: 22733
-9196:  DATA: 8357
-9197:  DATA: 26703
-9198:  DATA: 12405
-9199:  DATA: 30805
-9200:  DATA: 16445
-9201:  DATA: 2523
-9202:  DATA: 20912
-9203:  DATA: 6556
-9204:  DATA: 25060
-9205:  DATA: 10585
-9206:  DATA: 28999
-9207:  DATA: 14700
-9208:  DATA: 359
-9209:  DATA: 18705
-9210:  DATA: 4361
-9211:  DATA: 22893
-9212:  DATA: 8489
-9213:  DATA: 26940
-9214:  DATA: 12586
-9215:  DATA: 31024
-9216:  DATA: 16756
-9217:  DATA: 2362
-9218:  DATA: 20790
-9219:  DATA: 6525
-9220:  DATA: 24872
-9221:  DATA: 10532
-9222:  DATA: 28932
-9223:  DATA: 14609
-9224:  DATA: 376
-9225:  DATA: 18784
-9226:  DATA: 4368
-9227:  DATA: 22877
-9228:  DATA: 8613
-9229:  DATA: 27022
-9230:  DATA: 12771
-9231:  DATA: 31188
-9232:  DATA: 16435
-9233:  DATA: 2064
-9234:  DATA: 20579
-9235:  DATA: 6161
-9236:  DATA: 24804
-9237:  DATA: 10380
-9238:  DATA: 28892
-9239:  DATA: 15145
-9240:  DATA: 820
-9241:  DATA: 19268
-9242:  DATA: 5020
-9243:  DATA: 23524
-9244:  DATA: 8751
-9245:  DATA: 27256
-9246:  DATA: 13054
-9247:  DATA: 31376
-9248:  DATA: 17722
-9249:  DATA: 3450
-9250:  DATA: 21922
-9251:  DATA: 7657
-9252:  DATA: 25644
-9253:  DATA: 11272
-9254:  DATA: 29827
-9255:  DATA: 15562
-9256:  DATA: 1889
-9257:  DATA: 20401
-9258:  DATA: 6104
-9259:  DATA: 24161
-9260:  DATA: 9856
-9261:  DATA: 28380
-9262:  DATA: 14690
-9263:  DATA: 414
-9264:  DATA: 18548
-9265:  DATA: 4165
-9266:  DATA: 22769
-9267:  DATA: 8974
-9268:  DATA: 27575
-9269:  DATA: 13260
-9270:  DATA: 31319
-9271:  DATA: 17120
-9272:  DATA: 3430
-9273:  DATA: 21948
-9274:  DATA: 7199
-9275:  DATA: 25784
-9276:  DATA: 12132
-9277:  DATA: 30652
-9278:  DATA: 15906
-9279:  DATA: 1712
-9280:  DATA: 20852
-9281:  DATA: 6588
-9282:  DATA: 24638
-9283:  DATA: 10493
-9284:  DATA: 29477
-9285:  DATA: 15341
-9286:  DATA: 542
-9287:  DATA: 19076
-9288:  DATA: 5478
-9289:  DATA: 24055
-9290:  DATA: 9311
-9291:  DATA: 27866
-9292:  DATA: 14308
-9293:  DATA: 32269
-9294:  DATA: 18161
-9295:  DATA: 4422
-9296:  DATA: 22567
-9297:  DATA: 8340
-9298:  DATA: 27511
-9299:  DATA: 13272
-9300:  DATA: 31466
-9301:  DATA: 17741
-9302:  DATA: 3472
-9303:  DATA: 21649
-9304:  DATA: 8060
-9305:  DATA: 26560
-9306:  DATA: 11906
-9307:  DATA: 31080
-9308:  DATA: 16484
-9309:  DATA: 2292
-9310:  DATA: 21411
-9311:  DATA: 6709
-9312:  DATA: 25904
-9313:  DATA: 11764
-9314:  DATA: 29858
-9315:  DATA: 16246
-9316:  DATA: 1578
-9317:  DATA: 20200
-9318:  DATA: 6531
-9319:  DATA: 24662
-9320:  DATA: 11060
-9321:  DATA: 29233
-9322:  DATA: 15071
-9323:  DATA: 1485
-9324:  DATA: 19632
-9325:  DATA: 5973
-9326:  DATA: 24181
-9327:  DATA: 10581
-9328:  DATA: 28707
-9329:  DATA: 14544
-9330:  DATA: 995
-9331:  DATA: 19081
-9332:  DATA: 5608
-9333:  DATA: 23565
-9334:  DATA: 10066
-9335:  DATA: 28272
-9336:  DATA: 14688
-9337:  DATA: 69
-9338:  DATA: 19209
-9339:  DATA: 4642
-9340:  DATA: 23857
-9341:  DATA: 9341
-9342:  DATA: 28467
-9343:  DATA: 13876
-9344:  DATA: 314
-9345:  DATA: 18549
-9346:  DATA: 4914
-9347:  DATA: 23100
-9348:  DATA: 9526
-9349:  DATA: 27688
-9350:  DATA: 14108
-9351:  DATA: 32284
-9352:  DATA: 18740
-9353:  DATA: 4214
-9354:  DATA: 23381
-9355:  DATA: 8776
-9356:  DATA: 28132
-9357:  DATA: 13468
-9358:  DATA: 32688
-9359:  DATA: 18130
-9360:  DATA: 4152
-9361:  DATA: 23322
-9362:  DATA: 8807
-9363:  DATA: 27988
-9364:  DATA: 13482
-9365:  DATA: 32650
-9366:  DATA: 18064
-9367:  DATA: 4138
-9368:  DATA: 23396
-9369:  DATA: 8768
-9370:  DATA: 28062
-9371:  DATA: 13540
-9372:  DATA: 32298
-9373:  DATA: 18810
-9374:  DATA: 4336
-9375:  DATA: 23521
-9376:  DATA: 9531
-9377:  DATA: 27701
-9378:  DATA: 14244
-9379:  DATA: 32501
-9380:  DATA: 18465
-9381:  DATA: 4909
-9382:  DATA: 23189
-9383:  DATA: 9668
-9384:  DATA: 28519
-9385:  DATA: 14001
-9386:  DATA: 414
-9387:  DATA: 19305
-9388:  DATA: 4787
-9389:  DATA: 24024
-9390:  DATA: 10083
-9391:  DATA: 28289
-9392:  DATA: 14416
-9393:  DATA: 848
-9394:  DATA: 19185
-9395:  DATA: 5134
-9396:  DATA: 24496
-9397:  DATA: 9889
-9398:  DATA: 28788
-9399:  DATA: 15332
-9400:  DATA: 1382
-9401:  DATA: 19598
-9402:  DATA: 5712
-9403:  DATA: 25021
-9404:  DATA: 11045
-9405:  DATA: 29358
-9406:  DATA: 15395
-9407:  DATA: 1972
-9408:  DATA: 20787
-9409:  DATA: 6320
-9410:  DATA: 25202
-9411:  DATA: 11652
-9412:  DATA: 30507
-9413:  DATA: 16056
-9414:  DATA: 2128
-9415:  DATA: 21380
-9416:  DATA: 7526
-9417:  DATA: 25824
-9418:  DATA: 11792
-9419:  DATA: 31172
-9420:  DATA: 17322
-9421:  DATA: 3421
-9422:  DATA: 21745
-9423:  DATA: 7701
-9424:  DATA: 26672
-9425:  DATA: 13204
-9426:  DATA: 32098
-9427:  DATA: 17622
-9428:  DATA: 3816
-9429:  DATA: 22605
-9430:  DATA: 9182
-9431:  DATA: 28068
-9432:  DATA: 14182
-9433:  DATA: 32471
-9434:  DATA: 18591
-9435:  DATA: 4730
-9436:  DATA: 23652
-9437:  DATA: 10221
-9438:  DATA: 29105
-9439:  DATA: 15206
-9440:  DATA: 1319
-9441:  DATA: 19700
-9442:  DATA: 5815
-9443:  DATA: 24696
-9444:  DATA: 10858
-9445:  DATA: 30089
-9446:  DATA: 16277
-9447:  DATA: 2372
-9448:  DATA: 21351
-9449:  DATA: 7473
-9450:  DATA: 25780
-9451:  DATA: 11930
-9452:  DATA: 30881
-9453:  DATA: 16974
-9454:  DATA: 3172
-9455:  DATA: 22137
-9456:  DATA: 8208
-9457:  DATA: 27604
-9458:  DATA: 13794
-9459:  DATA: 32662
-9460:  DATA: 18916
-9461:  DATA: 4957
-9462:  DATA: 23889
-9463:  DATA: 10102
-9464:  DATA: 29031
-9465:  DATA: 15108
-9466:  DATA: 1303
-9467:  DATA: 20264
-9468:  DATA: 6502
-9469:  DATA: 25348
-9470:  DATA: 11583
-9471:  DATA: 30496
-9472:  DATA: 16756
-9473:  DATA: 2868
-9474:  DATA: 21794
-9475:  DATA: 7992
-9476:  DATA: 26980
-9477:  DATA: 13092
-9478:  DATA: 32030
-9479:  DATA: 18245
-9480:  DATA: 4469
-9481:  DATA: 23333
-9482:  DATA: 9556
-9483:  DATA: 28492
-9484:  DATA: 14774
-9485:  DATA: 918
-9486:  DATA: 19900
-9487:  DATA: 6037
-9488:  DATA: 24634
-9489:  DATA: 10772
-9490:  DATA: 29794
-9491:  DATA: 15951
-9492:  DATA: 2219
-9493:  DATA: 21146
-9494:  DATA: 7312
-9495:  DATA: 26933
-9496:  DATA: 13173
-9497:  DATA: 32086
-9498:  DATA: 18307
-9499:  DATA: 4588
-9500:  DATA: 23075
-9501:  DATA: 9336
-9502:  DATA: 28414
-9503:  DATA: 14481
-9504:  DATA: 1329
-9505:  DATA: 20340
-9506:  DATA: 6563
-9507:  DATA: 25577
-9508:  DATA: 11328
-9509:  DATA: 30330
-9510:  DATA: 16533
-9511:  DATA: 2774
-9512:  DATA: 22368
-9513:  DATA: 8649
-9514:  DATA: 27636
-9515:  DATA: 13324
-9516:  DATA: 32438
-9517:  DATA: 18646
-9518:  DATA: 5424
-9519:  DATA: 24453
-9520:  DATA: 10293
-9521:  DATA: 29254
-9522:  DATA: 15587
-9523:  DATA: 2332
-9524:  DATA: 21411
-9525:  DATA: 7624
-9526:  DATA: 26196
-9527:  DATA: 12508
-9528:  DATA: 32123
-9529:  DATA: 18320
-9530:  DATA: 4176
-9531:  DATA: 23212
-9532:  DATA: 10038
-9533:  DATA: 29112
-9534:  DATA: 14960
-9535:  DATA: 1212
-9536:  DATA: 20794
-9537:  DATA: 7157
-9538:  DATA: 25649
-9539:  DATA: 12029
-9540:  DATA: 31520
-9541:  DATA: 17836
-9542:  DATA: 3586
-9543:  DATA: 22670
-9544:  DATA: 9528
-9545:  DATA: 28581
-9546:  DATA: 14430
-9547:  DATA: 716
-9548:  DATA: 20406
-9549:  DATA: 6159
-9550:  DATA: 25343
-9551:  DATA: 12098
-9552:  DATA: 30836
-9553:  DATA: 17029
-9554:  DATA: 3953
-9555:  DATA: 22990
-9556:  DATA: 8887
-9557:  DATA: 28428
-9558:  DATA: 14807
-9559:  DATA: 672
-9560:  DATA: 20282
-9561:  DATA: 6533
-9562:  DATA: 25296
-9563:  DATA: 12121
-9564:  DATA: 30763
-9565:  DATA: 17085
-9566:  DATA: 4004
-9567:  DATA: 22653
-9568:  DATA: 9521
-9569:  DATA: 28597
-9570:  DATA: 14503
-9571:  DATA: 1400
-9572:  DATA: 20023
-9573:  DATA: 6393
-9574:  DATA: 26076
-9575:  DATA: 11781
-9576:  DATA: 31597
-9577:  DATA: 17450
-9578:  DATA: 3781
-9579:  DATA: 23501
-9580:  DATA: 9399
-9581:  DATA: 29005
-9582:  DATA: 14975
-9583:  DATA: 1793
-9584:  DATA: 20596
-9585:  DATA: 6854
-9586:  DATA: 26623
-9587:  DATA: 12432
-9588:  DATA: 32161
-9589:  DATA: 17933
-9590:  DATA: 4934
-9591:  DATA: 23648
-9592:  DATA: 10611
-9593:  DATA: 29184
-9594:  DATA: 16132
-9595:  DATA: 2092
-9596:  DATA: 21808
-9597:  DATA: 7732
-9598:  DATA: 27455
-9599:  DATA: 13371
-9600:  DATA: 372
-9601:  DATA: 18978
-9602:  DATA: 5944
-9603:  DATA: 24632
-9604:  DATA: 11574
-9605:  DATA: 30248
-9606:  DATA: 17232
-9607:  DATA: 3089
-9608:  DATA: 22908
-9609:  DATA: 8800
-9610:  DATA: 28432
-9611:  DATA: 14429
-9612:  DATA: 1445
-9613:  DATA: 20110
-9614:  DATA: 7139
-9615:  DATA: 25812
-9616:  DATA: 12339
-9617:  DATA: 32016
-9618:  DATA: 17968
-9619:  DATA: 4952
-9620:  DATA: 23740
-9621:  DATA: 10653
-9622:  DATA: 29393
-9623:  DATA: 15915
-9624:  DATA: 2928
-9625:  DATA: 21590
-9626:  DATA: 8670
-9627:  DATA: 27273
-9628:  DATA: 13857
-9629:  DATA: 892
-9630:  DATA: 19619
-9631:  DATA: 6625
-9632:  DATA: 25936
-9633:  DATA: 11874
-9634:  DATA: 31669
-9635:  DATA: 17646
-9636:  DATA: 4144
-9637:  DATA: 23816
-9638:  DATA: 9890
-9639:  DATA: 29648
-9640:  DATA: 16253
-9641:  DATA: 2219
-9642:  DATA: 21955
-9643:  DATA: 8597
-9644:  DATA: 27293
-9645:  DATA: 14290
-9646:  DATA: 869
-9647:  DATA: 19669
-9648:  DATA: 6183
-9649:  DATA: 25921
-9650:  DATA: 12017
-9651:  DATA: 31251
-9652:  DATA: 18336
-9653:  DATA: 4237
-9654:  DATA: 23641
-9655:  DATA: 10731
-9656:  DATA: 30004
-9657:  DATA: 16004
-9658:  DATA: 2640
-9659:  DATA: 22433
-9660:  DATA: 8997
-9661:  DATA: 27823
-9662:  DATA: 14391
-9663:  DATA: 1456
-9664:  DATA: 20852
-9665:  DATA: 6838
-9666:  DATA: 26161
-9667:  DATA: 13227
-9668:  DATA: 32545
-9669:  DATA: 18623
-9670:  DATA: 5150
-9671:  DATA: 25029
-9672:  DATA: 11619
-9673:  DATA: 30444
-9674:  DATA: 16964
-9675:  DATA: 4037
-9676:  DATA: 23524
-9677:  DATA: 10012
-9678:  DATA: 28848
-9679:  DATA: 15453
-9680:  DATA: 2081
-9681:  DATA: 21906
-9682:  DATA: 8565
-9683:  DATA: 27293
-9684:  DATA: 14006
-9685:  DATA: 536
-9686:  DATA: 20441
-9687:  DATA: 7083
-9688:  DATA: 26420
-9689:  DATA: 12497
-9690:  DATA: 31903
-9691:  DATA: 18477
-9692:  DATA: 5168
-9693:  DATA: 25077
-9694:  DATA: 11701
-9695:  DATA: 31029
-9696:  DATA: 17722
-9697:  DATA: 3834
-9698:  DATA: 23202
-9699:  DATA: 9833
-9700:  DATA: 29228
-9701:  DATA: 16289
-9702:  DATA: 3024
-9703:  DATA: 22346
-9704:  DATA: 9058
-9705:  DATA: 28448
-9706:  DATA: 14530
-9707:  DATA: 1162
-9708:  DATA: 20662
-9709:  DATA: 7250
-9710:  DATA: 26727
-9711:  DATA: 13339
-9712:  DATA: 116
-9713:  DATA: 19927
-9714:  DATA: 6633
-9715:  DATA: 26077
-9716:  DATA: 12724
-9717:  DATA: 32065
-9718:  DATA: 18769
-9719:  DATA: 5483
-9720:  DATA: 24928
-9721:  DATA: 11589
-9722:  DATA: 31004
-9723:  DATA: 17700
-9724:  DATA: 4386
-9725:  DATA: 23864
-9726:  DATA: 10622
-9727:  DATA: 30069
-9728:  DATA: 16756
-9729:  DATA: 3329
-9730:  DATA: 22840
-9731:  DATA: 9528
-9732:  DATA: 28982
-9733:  DATA: 15656
-9734:  DATA: 2384
-9735:  DATA: 21772
-9736:  DATA: 8551
-9737:  DATA: 27941
-9738:  DATA: 14673
-9739:  DATA: 1293
-9740:  DATA: 20904
-9741:  DATA: 7580
-9742:  DATA: 27106
-9743:  DATA: 13778
-9744:  DATA: 49
-9745:  DATA: 19541
-9746:  DATA: 6243
-9747:  DATA: 25673
-9748:  DATA: 12459
-9749:  DATA: 31875
-9750:  DATA: 18645
-9751:  DATA: 5989
-9752:  DATA: 25461
-9753:  DATA: 12119
-9754:  DATA: 31635
-9755:  DATA: 18405
-9756:  DATA: 4659
-9757:  DATA: 24188
-9758:  DATA: 10921
-9759:  DATA: 30389
-9760:  DATA: 17696
-9761:  DATA: 4474
-9762:  DATA: 24048
-9763:  DATA: 10729
-9764:  DATA: 29740
-9765:  DATA: 16488
-9766:  DATA: 3280
-9767:  DATA: 22731
-9768:  DATA: 10107
-9769:  DATA: 29623
-9770:  DATA: 16324
-9771:  DATA: 2565
-9772:  DATA: 22244
-9773:  DATA: 8924
-9774:  DATA: 29043
-9775:  DATA: 15745
-9776:  DATA: 2109
-9777:  DATA: 21595
-9778:  DATA: 8439
-9779:  DATA: 28509
-9780:  DATA: 15269
-9781:  DATA: 2014
-9782:  DATA: 21008
-9783:  DATA: 7921
-9784:  DATA: 28028
-9785:  DATA: 14720
-9786:  DATA: 1104
-9787:  DATA: 20649
-9788:  DATA: 7979
-9789:  DATA: 27570
-9790:  DATA: 13858
-9791:  DATA: 674
-9792:  DATA: 20789
-9793:  DATA: 7596
-9794:  DATA: 26736
-9795:  DATA: 13481
-9796:  DATA: 811
-9797:  DATA: 20461
-9798:  DATA: 6660
-9799:  DATA: 26253
-9800:  DATA: 13681
-9801:  DATA: 421
-9802:  DATA: 19522
-9803:  DATA: 6360
-9804:  DATA: 26541
-9805:  DATA: 12819
-9806:  DATA: 32501
-9807:  DATA: 19793
-9808:  DATA: 6260
-9809:  DATA: 25750
-9810:  DATA: 13183
-9811:  DATA: 32720
-9812:  DATA: 19124
-9813:  DATA: 6401
-9814:  DATA: 26069
-9815:  DATA: 12477
-9816:  DATA: 32570
-9817:  DATA: 19333
-9818:  DATA: 5840
-9819:  DATA: 25932
-9820:  DATA: 12388
-9821:  DATA: 31998
-9822:  DATA: 19362
-9823:  DATA: 5744
-9824:  DATA: 25890
-9825:  DATA: 12796
-9826:  DATA: 31923
-9827:  DATA: 19320
-9828:  DATA: 5732
-9829:  DATA: 25316
-9830:  DATA: 12702
-9831:  DATA: 31749
-9832:  DATA: 19296
-9833:  DATA: 5677
-9834:  DATA: 25301
-9835:  DATA: 12749
-9836:  DATA: 31926
-9837:  DATA: 19282
-9838:  DATA: 5747
-9839:  DATA: 25886
-9840:  DATA: 12404
-9841:  DATA: 31937
-9842:  DATA: 19455
-9843:  DATA: 5853
-9844:  DATA: 26032
-9845:  DATA: 12357
-9846:  DATA: 32597
-9847:  DATA: 18981
-9848:  DATA: 6513
-9849:  DATA: 25604
-9850:  DATA: 13059
-9851:  DATA: 32313
-9852:  DATA: 19812
-9853:  DATA: 6193
-9854:  DATA: 26421
-9855:  DATA: 12852
-9856:  DATA: 304
-9857:  DATA: 19494
-9858:  DATA: 7024
-9859:  DATA: 26153
-9860:  DATA: 13611
-9861:  DATA: 109
-9862:  DATA: 20241
-9863:  DATA: 6667
-9864:  DATA: 26932
-9865:  DATA: 13412
-9866:  DATA: 860
-9867:  DATA: 20044
-9868:  DATA: 7606
-9869:  DATA: 26768
-9870:  DATA: 14329
-9871:  DATA: 731
-9872:  DATA: 20531
-9873:  DATA: 7961
-9874:  DATA: 27241
-9875:  DATA: 14621
-9876:  DATA: 1184
-9877:  DATA: 21388
-9878:  DATA: 7874
-9879:  DATA: 27694
-9880:  DATA: 15156
-9881:  DATA: 1621
-9882:  DATA: 21905
-9883:  DATA: 8446
-9884:  DATA: 28215
-9885:  DATA: 15740
-9886:  DATA: 2231
-9887:  DATA: 22512
-9888:  DATA: 9507
-9889:  DATA: 28788
-9890:  DATA: 16297
-9891:  DATA: 2739
-9892:  DATA: 22592
-9893:  DATA: 10088
-9894:  DATA: 29329
-9895:  DATA: 16854
-9896:  DATA: 3936
-9897:  DATA: 23232
-9898:  DATA: 10718
-9899:  DATA: 30466
-9900:  DATA: 17078
-9901:  DATA: 4553
-9902:  DATA: 24440
-9903:  DATA: 10992
-9904:  DATA: 30726
-9905:  DATA: 18240
-9906:  DATA: 4857
-9907:  DATA: 24595
-9908:  DATA: 12215
-9909:  DATA: 31256
-9910:  DATA: 18537
-9911:  DATA: 6122
-9912:  DATA: 25953
-9913:  DATA: 12485
-9914:  DATA: 32273
-9915:  DATA: 19903
-9916:  DATA: 6945
-9917:  DATA: 26365
-9918:  DATA: 13369
-9919:  DATA: 955
-9920:  DATA: 20852
-9921:  DATA: 7329
-9922:  DATA: 27192
-9923:  DATA: 14776
-9924:  DATA: 1892
-9925:  DATA: 21154
-9926:  DATA: 8222
-9927:  DATA: 28550
-9928:  DATA: 15729
-9929:  DATA: 2216
-9930:  DATA: 22111
-9931:  DATA: 9693
-9932:  DATA: 29617
-9933:  DATA: 16657
-9934:  DATA: 3317
-9935:  DATA: 23131
-9936:  DATA: 10272
-9937:  DATA: 30677
-9938:  DATA: 17782
-9939:  DATA: 4306
-9940:  DATA: 24253
-9941:  DATA: 11272
-9942:  DATA: 31682
-9943:  DATA: 18917
-9944:  DATA: 6011
-9945:  DATA: 25283
-9946:  DATA: 12496
-9947:  DATA: 32364
-9948:  DATA: 19556
-9949:  DATA: 7152
-9950:  DATA: 27057
-9951:  DATA: 14182
-9952:  DATA: 1319
-9953:  DATA: 20732
-9954:  DATA: 7846
-9955:  DATA: 27768
-9956:  DATA: 14948
-9957:  DATA: 2559
-9958:  DATA: 22405
-9959:  DATA: 9548
-9960:  DATA: 29562
-9961:  DATA: 16672
-9962:  DATA: 3284
-9963:  DATA: 23245
-9964:  DATA: 10407
-9965:  DATA: 30290
-9966:  DATA: 17533
-9967:  DATA: 4613
-9968:  DATA: 24632
-9969:  DATA: 12240
-9970:  DATA: 32232
-9971:  DATA: 19411
-9972:  DATA: 6628
-9973:  DATA: 26381
-9974:  DATA: 13668
-9975:  DATA: 877
-9976:  DATA: 20849
-9977:  DATA: 7959
-9978:  DATA: 27925
-9979:  DATA: 15213
-9980:  DATA: 2349
-9981:  DATA: 22318
-9982:  DATA: 9584
-9983:  DATA: 29492
-9984:  DATA: 16756
-9985:  DATA: 3889
-9986:  DATA: 23871
-9987:  DATA: 11058
-9988:  DATA: 31030
-9989:  DATA: 18285
-9990:  DATA: 5380
-9991:  DATA: 25354
-9992:  DATA: 12596
-9993:  DATA: 32625
-9994:  DATA: 19800
-9995:  DATA: 6984
-9996:  DATA: 27108
-9997:  DATA: 14222
-9998:  DATA: 1535
-9999:  DATA: 21440
-10000: DATA: 8224
-10001: DATA: 28189
-10002: DATA: 15408
-10003: DATA: 2641
-10004: DATA: 22689
-10005: DATA: 9868
-10006: DATA: 29908
-10007: DATA: 17708
-10008: DATA: 4986
-10009: DATA: 24898
-10010: DATA: 12240
-10011: DATA: 32249
-10012: DATA: 18987
-10013: DATA: 6205
-10014: DATA: 26276
-10015: DATA: 13565
-10016: DATA: 1329
-10017: DATA: 21301
-10018: DATA: 8639
-10019: DATA: 28651
-10020: DATA: 15393
-10021: DATA: 2687
-10022: DATA: 22679
-10023: DATA: 9943
-10024: DATA: 30587
-10025: DATA: 17842
-10026: DATA: 5060
-10027: DATA: 24581
-10028: DATA: 12004
-10029: DATA: 31954
-10030: DATA: 19813
-10031: DATA: 7041
-10032: DATA: 26663
-10033: DATA: 13916
-10034: DATA: 1268
-10035: DATA: 21784
-10036: DATA: 9188
-10037: DATA: 29132
-10038: DATA: 15966
-10039: DATA: 3297
-10040: DATA: 23860
-10041: DATA: 11158
-10042: DATA: 30724
-10043: DATA: 18092
-10044: DATA: 5933
-10045: DATA: 26031
-10046: DATA: 12835
-10047: DATA: 245
-10048: DATA: 20768
-10049: DATA: 8122
-10050: DATA: 27760
-10051: DATA: 15017
-10052: DATA: 2860
-10053: DATA: 22952
-10054: DATA: 9808
-10055: DATA: 29835
-10056: DATA: 17787
-10057: DATA: 5111
-10058: DATA: 24644
-10059: DATA: 11973
-10060: DATA: 32740
-10061: DATA: 19466
-10062: DATA: 6904
-10063: DATA: 27484
-10064: DATA: 14391
-10065: DATA: 1693
-10066: DATA: 22320
-10067: DATA: 9681
-10068: DATA: 29345
-10069: DATA: 17164
-10070: DATA: 4564
-10071: DATA: 24293
-10072: DATA: 12157
-10073: DATA: 32203
-10074: DATA: 19076
-10075: DATA: 7010
-10076: DATA: 26724
-10077: DATA: 14076
-10078: DATA: 2032
-10079: DATA: 21625
-10080: DATA: 9525
-10081: DATA: 29671
-10082: DATA: 16567
-10083: DATA: 4472
-10084: DATA: 24118
-10085: DATA: 11437
-10086: DATA: 32152
-10087: DATA: 19012
-10088: DATA: 7032
-10089: DATA: 26665
-10090: DATA: 13982
-10091: DATA: 2024
-10092: DATA: 21674
-10093: DATA: 9554
-10094: DATA: 29282
-10095: DATA: 17153
-10096: DATA: 4156
-10097: DATA: 24240
-10098: DATA: 12259
-10099: DATA: 31890
-10100: DATA: 19889
-10101: DATA: 6745
-10102: DATA: 27480
-10103: DATA: 14336
-10104: DATA: 2374
-10105: DATA: 22032
-10106: DATA: 10009
-10107: DATA: 29731
-10108: DATA: 17719
-10109: DATA: 4984
-10110: DATA: 25353
-10111: DATA: 12346
-10112: DATA: 289
-10113: DATA: 20085
-10114: DATA: 7971
-10115: DATA: 27689
-10116: DATA: 15653
-10117: DATA: 2595
-10118: DATA: 23316
-10119: DATA: 10309
-10120: DATA: 31101
-10121: DATA: 18027
-10122: DATA: 5904
-10123: DATA: 25689
-10124: DATA: 13740
-10125: DATA: 664
-10126: DATA: 21424
-10127: DATA: 8408
-10128: DATA: 28725
-10129: DATA: 16646
-10130: DATA: 3683
-10131: DATA: 24404
-10132: DATA: 11442
-10133: DATA: 32136
-10134: DATA: 19088
-10135: DATA: 6694
-10136: DATA: 27505
-10137: DATA: 14411
-10138: DATA: 2436
-10139: DATA: 22271
-10140: DATA: 9765
-10141: DATA: 30577
-10142: DATA: 17648
-10143: DATA: 5629
-10144: DATA: 25909
-10145: DATA: 12921
-10146: DATA: 956
-10147: DATA: 20669
-10148: DATA: 8235
-10149: DATA: 29035
-10150: DATA: 16080
-10151: DATA: 4049
-10152: DATA: 24444
-10153: DATA: 11424
-10154: DATA: 32195
-10155: DATA: 19720
-10156: DATA: 6884
-10157: DATA: 27599
-10158: DATA: 15205
-10159: DATA: 2204
-10160: DATA: 22586
-10161: DATA: 10566
-10162: DATA: 30398
-10163: DATA: 18013
-10164: DATA: 6116
-10165: DATA: 25849
-10166: DATA: 13400
-10167: DATA: 1504
-10168: DATA: 21812
-10169: DATA: 8850
-10170: DATA: 29201
-10171: DATA: 17313
-10172: DATA: 4904
-10173: DATA: 24750
-10174: DATA: 12400
-10175: DATA: 436
-10176: DATA: 20774
-10177: DATA: 7856
-10178: DATA: 28272
-10179: DATA: 16318
-10180: DATA: 3894
-10181: DATA: 23736
-10182: DATA: 11293
-10183: DATA: 32135
-10184: DATA: 19832
-10185: DATA: 6892
-10186: DATA: 27230
-10187: DATA: 15306
-10188: DATA: 3048
-10189: DATA: 23389
-10190: DATA: 10481
-10191: DATA: 30811
-10192: DATA: 18480
-10193: DATA: 6613
-10194: DATA: 26982
-10195: DATA: 14040
-10196: DATA: 1699
-10197: DATA: 22024
-10198: DATA: 10180
-10199: DATA: 30628
-10200: DATA: 18272
-10201: DATA: 5324
-10202: DATA: 25759
-10203: DATA: 13411
-10204: DATA: 1124
-10205: DATA: 22005
-10206: DATA: 9649
-10207: DATA: 30054
-10208: DATA: 17780
-10209: DATA: 4854
-10210: DATA: 25276
-10211: DATA: 12920
-10212: DATA: 549
-10213: DATA: 21503
-10214: DATA: 9116
-10215: DATA: 29532
-10216: DATA: 17204
-10217: DATA: 4913
-10218: DATA: 24785
-10219: DATA: 12422
-10220: DATA: 161
-10221: DATA: 20563
-10222: DATA: 8240
-10223: DATA: 28698
-10224: DATA: 16418
-10225: DATA: 4560
-10226: DATA: 25058
-10227: DATA: 12755
-10228: DATA: 484
-10229: DATA: 20749
-10230: DATA: 8546
-10231: DATA: 29034
-10232: DATA: 16763
-10233: DATA: 4360
-10234: DATA: 24835
-10235: DATA: 12653
-10236: DATA: 293
-10237: DATA: 20783
-10238: DATA: 8501
-10239: DATA: 29045
-10240: DATA: 16693
-10241: DATA: 4385
-10242: DATA: 24868
-10243: DATA: 12604
-10244: DATA: 295
-10245: DATA: 20773
-10246: DATA: 8469
-10247: DATA: 28929
-10248: DATA: 16692
-10249: DATA: 4460
-10250: DATA: 24926
-10251: DATA: 12557
-10252: DATA: 421
-10253: DATA: 20881
-10254: DATA: 8700
-10255: DATA: 29077
-10256: DATA: 16432
-10257: DATA: 4124
-10258: DATA: 24674
-10259: DATA: 12376
-10260: DATA: 167
-10261: DATA: 20633
-10262: DATA: 8409
-10263: DATA: 29482
-10264: DATA: 17274
-10265: DATA: 4950
-10266: DATA: 25566
-10267: DATA: 13229
-10268: DATA: 612
-10269: DATA: 21065
-10270: DATA: 8888
-10271: DATA: 29424
-10272: DATA: 17702
-10273: DATA: 5488
-10274: DATA: 26096
-10275: DATA: 13812
-10276: DATA: 1079
-10277: DATA: 21549
-10278: DATA: 9361
-10279: DATA: 29829
-10280: DATA: 18279
-10281: DATA: 6065
-10282: DATA: 26562
-10283: DATA: 13836
-10284: DATA: 1706
-10285: DATA: 22234
-10286: DATA: 10613
-10287: DATA: 31189
-10288: DATA: 18489
-10289: DATA: 6234
-10290: DATA: 26878
-10291: DATA: 15112
-10292: DATA: 2985
-10293: DATA: 23496
-10294: DATA: 10846
-10295: DATA: 31473
-10296: DATA: 19764
-10297: DATA: 7564
-10298: DATA: 27678
-10299: DATA: 15597
-10300: DATA: 3888
-10301: DATA: 24501
-10302: DATA: 11829
-10303: DATA: 32501
-10304: DATA: 20791
-10305: DATA: 8624
-10306: DATA: 28734
-10307: DATA: 16553
-10308: DATA: 4897
-10309: DATA: 25535
-10310: DATA: 12880
-10311: DATA: 650
-10312: DATA: 21874
-10313: DATA: 9637
-10314: DATA: 29764
-10315: DATA: 17605
-10316: DATA: 6049
-10317: DATA: 26205
-10318: DATA: 14072
-10319: DATA: 2388
-10320: DATA: 22584
-10321: DATA: 10393
-10322: DATA: 31536
-10323: DATA: 19402
-10324: DATA: 6829
-10325: DATA: 27929
-10326: DATA: 15832
-10327: DATA: 3301
-10328: DATA: 24439
-10329: DATA: 12236
-10330: DATA: 32386
-10331: DATA: 20846
-10332: DATA: 8241
-10333: DATA: 28913
-10334: DATA: 17329
-10335: DATA: 4711
-10336: DATA: 25972
-10337: DATA: 13798
-10338: DATA: 1212
-10339: DATA: 22386
-10340: DATA: 9776
-10341: DATA: 30462
-10342: DATA: 18896
-10343: DATA: 6212
-10344: DATA: 27514
-10345: DATA: 14881
-10346: DATA: 2704
-10347: DATA: 23960
-10348: DATA: 11434
-10349: DATA: 32584
-10350: DATA: 20067
-10351: DATA: 8448
-10352: DATA: 28725
-10353: DATA: 16601
-10354: DATA: 5040
-10355: DATA: 25230
-10356: DATA: 13757
-10357: DATA: 1088
-10358: DATA: 22354
-10359: DATA: 9834
-10360: DATA: 31096
-10361: DATA: 18454
-10362: DATA: 7006
-10363: DATA: 27245
-10364: DATA: 15716
-10365: DATA: 3092
-10366: DATA: 24356
-10367: DATA: 11893
-10368: DATA: 294
-10369: DATA: 20528
-10370: DATA: 9009
-10371: DATA: 29241
-10372: DATA: 17719
-10373: DATA: 5239
-10374: DATA: 26490
-10375: DATA: 13935
-10376: DATA: 2379
-10377: DATA: 22565
-10378: DATA: 11035
-10379: DATA: 31245
-10380: DATA: 19867
-10381: DATA: 7389
-10382: DATA: 28602
-10383: DATA: 16021
-10384: DATA: 4107
-10385: DATA: 25387
-10386: DATA: 12834
-10387: DATA: 1309
-10388: DATA: 21743
-10389: DATA: 10189
-10390: DATA: 30447
-10391: DATA: 18459
-10392: DATA: 6951
-10393: DATA: 27141
-10394: DATA: 15837
-10395: DATA: 3245
-10396: DATA: 24091
-10397: DATA: 12605
-10398: DATA: 237
-10399: DATA: 21429
-10400: DATA: 9575
-10401: DATA: 29740
-10402: DATA: 18409
-10403: DATA: 5784
-10404: DATA: 26666
-10405: DATA: 15202
-10406: DATA: 2690
-10407: DATA: 24017
-10408: DATA: 12156
-10409: DATA: 32448
-10410: DATA: 20931
-10411: DATA: 8962
-10412: DATA: 29361
-10413: DATA: 17865
-10414: DATA: 6008
-10415: DATA: 26353
-10416: DATA: 14385
-10417: DATA: 2900
-10418: DATA: 23267
-10419: DATA: 11273
-10420: DATA: 32704
-10421: DATA: 20186
-10422: DATA: 8277
-10423: DATA: 29686
-10424: DATA: 17760
-10425: DATA: 5344
-10426: DATA: 26146
-10427: DATA: 14776
-10428: DATA: 2861
-10429: DATA: 23219
-10430: DATA: 11299
-10431: DATA: 32626
-10432: DATA: 20758
-10433: DATA: 8368
-10434: DATA: 29235
-10435: DATA: 17852
-10436: DATA: 5937
-10437: DATA: 26302
-10438: DATA: 14357
-10439: DATA: 3013
-10440: DATA: 23933
-10441: DATA: 11505
-10442: DATA: 32272
-10443: DATA: 20933
-10444: DATA: 9125
-10445: DATA: 29966
-10446: DATA: 17584
-10447: DATA: 5719
-10448: DATA: 26673
-10449: DATA: 15248
-10450: DATA: 3454
-10451: DATA: 23709
-10452: DATA: 11959
-10453: PUSH 21392
-10455: DATA: 9650
-10456: DATA: 30577
-10457: DATA: 18121
-10458: DATA: 6300
-10459: DATA: 27168
-10460: DATA: 15412
-10461: DATA: 4079
-10462: DATA: 25023
-10463: DATA: 13153
-10464: DATA: 1329
-10465: DATA: 21750
-10466: DATA: 9892
-10467: DATA: 30840
-10468: DATA: 18976
-10469: DATA: 7585
-10470: DATA: 28624
-10471: DATA: 16721
-10472: DATA: 4988
-10473: DATA: 25900
-10474: DATA: 13507
-10475: DATA: 1741
-10476: DATA: 22710
-10477: DATA: 10834
-10478: DATA: 31871
-10479: DATA: 19992
-10480: DATA: 8308
-10481: DATA: 29661
-10482: DATA: 17905
-10483: DATA: 6031
-10484: DATA: 27040
-10485: DATA: 15169
-10486: DATA: 3401
-10487: DATA: 24357
-10488: DATA: 12647
-10489: DATA: 781
-10490: DATA: 21791
-10491: DATA: 10042
-10492: DATA: 31031
-10493: DATA: 19325
-10494: DATA: 7459
-10495: DATA: 28476
-10496: DATA: 16691
-10497: DATA: 4923
-10498: DATA: 25891
-10499: DATA: 14205
-10500: DATA: 2347
-10501: DATA: 23339
-10502: DATA: 11600
-10503: DATA: 32513
-10504: DATA: 20849
-10505: DATA: 9062
-10506: DATA: 30033
-10507: DATA: 18260
-10508: DATA: 6634
-10509: DATA: 27613
-10510: DATA: 15792
-10511: DATA: 4065
-10512: DATA: 24636
-10513: DATA: 12816
-10514: DATA: 1072
-10515: DATA: 22090
-10516: DATA: 10405
-10517: DATA: 31361
-10518: DATA: 19676
-10519: DATA: 8502
-10520: DATA: 29492
-10521: DATA: 17732
-10522: DATA: 6018
-10523: DATA: 27112
-10524: DATA: 14948
-10525: DATA: 3198
-10526: DATA: 24255
-10527: DATA: 12515
-10528: DATA: 1329
-10529: DATA: 22375
-10530: DATA: 10677
-10531: DATA: 31737
-10532: DATA: 19556
-10533: DATA: 7780
-10534: DATA: 28830
-10535: DATA: 17029
-10536: DATA: 6001
-10537: DATA: 27049
-10538: DATA: 15313
-10539: DATA: 3087
-10540: DATA: 24235
-10541: DATA: 12495
-10542: DATA: 1393
-10543: DATA: 22401
-10544: DATA: 10289
-10545: DATA: 31253
-10546: DATA: 19709
-10547: DATA: 8456
-10548: DATA: 29622
-10549: DATA: 17868
-10550: DATA: 5724
-10551: DATA: 26870
-10552: DATA: 15668
-10553: DATA: 3972
-10554: DATA: 24606
-10555: DATA: 12969
-10556: DATA: 1892
-10557: DATA: 22969
-10558: DATA: 10805
-10559: DATA: 31926
-10560: DATA: 20795
-10561: DATA: 9127
-10562: DATA: 29745
-10563: DATA: 18089
-10564: DATA: 6945
-10565: DATA: 28073
-10566: DATA: 15952
-10567: DATA: 4242
-10568: DATA: 25981
-10569: DATA: 14321
-10570: DATA: 2136
-10571: DATA: 23181
-10572: DATA: 12212
-10573: RMEM 21237 10070
-10576: DATA: 30781
-10577: DATA: 19098
-10578: DATA: 8037
-10579: DATA: 29134
-10580: DATA: 17124
-10581: DATA: 5888
-10582: DATA: 27093
-10583: DATA: 15025
-10584: DATA: 3957
-10585: DATA: 25033
-10586: DATA: 12931
-10587: DATA: 1837
-10588: DATA: 22565
-10589: DATA: 10995
-10590: DATA: 32692
-10591: DATA: 20533
-10592: DATA: 9511
-10593: DATA: 30689
-10594: DATA: 18623
-10595: DATA: 7539
-10596: DATA: 28193
-10597: DATA: 16638
-10598: DATA: 5598
-10599: DATA: 26144
-10600: DATA: 15207
-10601: DATA: 3114
-10602: DATA: 24261
-10603: DATA: 13209
-10604: DATA: 1196
-10605: DATA: 22840
-10606: DATA: 10818
-10607: DATA: 32512
-10608: DATA: 20541
-10609: DATA: 8923
-10610: DATA: 30691
-10611: DATA: 18551
-10612: DATA: 7581
-10613: DATA: 28226
-10614: DATA: 17221
-10615: DATA: 5157
-10616: DATA: 26983
-10617: DATA: 14865
-10618: DATA: 3857
-10619: DATA: 24611
-10620: DATA: 13600
-10621: DATA: 1661
-10622: DATA: 23353
-10623: DATA: 11323
-10624: DATA: 372
-10625: DATA: 21026
-10626: DATA: 10040
-10627: DATA: 30780
-10628: DATA: 19760
-10629: DATA: 7789
-10630: DATA: 29443
-10631: DATA: 17408
-10632: DATA: 6513
-10633: DATA: 27240
-10634: DATA: 16195
-10635: DATA: 4109
-10636: DATA: 26032
-10637: DATA: 13970
-10638: DATA: 2992
-10639: DATA: 23773
-10640: DATA: 12341
-10641: DATA: 1283
-10642: DATA: 22133
-10643: DATA: 11037
-10644: DATA: 31915
-10645: DATA: 20867
-10646: DATA: 8915
-10647: DATA: 30240
-10648: DATA: 19252
-10649: DATA: 7239
-10650: DATA: 29077
-10651: DATA: 17128
-10652: DATA: 5674
-10653: DATA: 27453
-10654: DATA: 15537
-10655: DATA: 4533
-10656: DATA: 25904
-10657: DATA: 13948
-10658: DATA: 3006
-10659: DATA: 23796
-10660: DATA: 12330
-10661: DATA: 1386
-10662: DATA: 22224
-10663: DATA: 11213
-10664: DATA: 32629
-10665: DATA: 20649
-10666: DATA: 9692
-10667: DATA: 31062
-10668: DATA: 19172
-10669: DATA: 8159
-10670: DATA: 29538
-10671: DATA: 17562
-10672: DATA: 6207
-10673: DATA: 27984
-10674: DATA: 16126
-10675: DATA: 4701
-10676: DATA: 26544
-10677: DATA: 14540
-10678: DATA: 3154
-10679: DATA: 25065
-10680: DATA: 13681
-10681: DATA: 1686
-10682: DATA: 23120
-10683: DATA: 12204
-10684: DATA: 810
-10685: DATA: 21689
-10686: DATA: 10352
-10687: DATA: 32165
-10688: DATA: 20795
-10689: DATA: 8865
-10690: DATA: 30244
-10691: DATA: 19384
-10692: DATA: 7990
-10693: DATA: 28852
-10694: DATA: 17488
-10695: DATA: 6532
-10696: DATA: 28006
-10697: DATA: 16096
-10698: DATA: 4624
-10699: DATA: 26590
-10700: DATA: 15271
-10701: DATA: 3868
-10702: DATA: 24804
-10703: DATA: 13377
-10704: DATA: 2097
-10705: DATA: 23943
-10706: DATA: 12661
-10707: DATA: 729
-10708: DATA: 22244
-10709: DATA: 10760
-10710: DATA: 32710
-10711: DATA: 21408
-10712: DATA: 10086
-10713: DATA: 30940
-10714: DATA: 19591
-10715: DATA: 8293
-10716: DATA: 29729
-10717: DATA: 18927
-10718: DATA: 7605
-10719: DATA: 28987
-10720: DATA: 17780
-10721: DATA: 5813
-10722: DATA: 27281
-10723: DATA: 15933
-10724: DATA: 4663
-10725: DATA: 26617
-10726: DATA: 15249
-10727: DATA: 3916
-10728: DATA: 25446
-10729: DATA: 14118
-10730: DATA: 2257
-10731: DATA: 23710
-10732: DATA: 12449
-10733: DATA: 1053
-10734: DATA: 22648
-10735: DATA: 11280
-10736: DATA: 38
-10737: DATA: 21968
-10738: DATA: 10672
-10739: DATA: 32145
-10740: DATA: 20897
-10741: DATA: 9548
-10742: DATA: 31060
-10743: DATA: 19830
-10744: DATA: 8500
-10745: DATA: 29953
-10746: DATA: 18719
-10747: DATA: 7482
-10748: DATA: 28970
-10749: DATA: 17779
-10750: DATA: 6484
-10751: DATA: 27953
-10752: DATA: 16699
-10753: DATA: 5410
-10754: DATA: 26942
-10755: DATA: 15705
-10756: DATA: 4403
-10757: DATA: 25896
-10758: DATA: 14595
-10759: DATA: 3345
-10760: DATA: 24849
-10761: DATA: 13655
-10762: DATA: 2373
-10763: DATA: 23876
-10764: DATA: 12714
-10765: DATA: 1422
-10766: DATA: 23018
-10767: DATA: 11745
-10768: DATA: 60
-10769: DATA: 21532
-10770: DATA: 10339
-10771: DATA: 31773
-10772: DATA: 20663
-10773: DATA: 9352
-10774: DATA: 30933
-10775: DATA: 20264
-10776: DATA: 9063
-10777: DATA: 30469
-10778: DATA: 19332
-10779: DATA: 8162
-10780: DATA: 29284
-10781: DATA: 18047
-10782: DATA: 6837
-10783: DATA: 28341
-10784: DATA: 17717
-10785: DATA: 6453
-10786: DATA: 28091
-10787: DATA: 16884
-10788: DATA: 5168
-10789: DATA: 26734
-10790: DATA: 15512
-10791: DATA: 4288
-10792: DATA: 26490
-10793: DATA: 15358
-10794: DATA: 3984
-10795: DATA: 25113
-10796: DATA: 13996
-10797: DATA: 2776
-10798: DATA: 24930
-10799: DATA: 13712
-10800: DATA: 2164
-10801: DATA: 23636
-10802: DATA: 12514
-10803: DATA: 1816
-10804: DATA: 23524
-10805: DATA: 12239
-10806: DATA: 578
-10807: DATA: 22252
-10808: DATA: 11639
-10809: DATA: 398
-10810: DATA: 21584
-10811: DATA: 10430
-10812: DATA: 32560
-10813: DATA: 21426
-10814: DATA: 9766
-10815: DATA: 31408
-10816: DATA: 20775
-10817: DATA: 9717
-10818: DATA: 30769
-10819: DATA: 19635
-10820: DATA: 8992
-10821: DATA: 30701
-10822: DATA: 18947
-10823: DATA: 7821
-10824: DATA: 30065
-10825: DATA: 18921
-10826: DATA: 7238
-10827: DATA: 28872
-10828: DATA: 18359
-10829: DATA: 6749
-10830: DATA: 28401
-10831: DATA: 17753
-10832: DATA: 6203
-10833: DATA: 27803
-10834: DATA: 17271
-10835: DATA: 6045
-10836: DATA: 27312
-10837: DATA: 16645
-10838: DATA: 5589
-10839: DATA: 26853
-10840: DATA: 16227
-10841: DATA: 5060
-10842: DATA: 26268
-10843: DATA: 15713
-10844: DATA: 4202
-10845: DATA: 25789
-10846: DATA: 15344
-10847: DATA: 3664
-10848: DATA: 25890
-10849: DATA: 14832
-10850: DATA: 3234
-10851: DATA: 25444
-10852: DATA: 13872
-10853: DATA: 2789
-10854: DATA: 24985
-10855: DATA: 13387
-10856: DATA: 2931
-10857: DATA: 24165
-10858: DATA: 13016
-10859: DATA: 2440
-10860: DATA: 23734
-10861: DATA: 13144
-10862: DATA: 1584
-10863: DATA: 23837
-10864: DATA: 12341
-10865: DATA: 1222
-10866: DATA: 23472
-10867: DATA: 11931
-10868: DATA: 1445
-10869: DATA: 22593
-10870: DATA: 12124
-10871: DATA: 608
-10872: DATA: 22906
-10873: DATA: 11333
-10874: DATA: 793
-10875: DATA: 22051
-10876: DATA: 11568
-10877: DATA: 50
-10878: DATA: 22384
-10879: DATA: 10801
-10880: DATA: 317
-10881: DATA: 21542
-10882: DATA: 11042
-10883: DATA: 32312
-10884: DATA: 21812
-10885: DATA: 10284
-10886: DATA: 32537
-10887: DATA: 21015
-10888: DATA: 10554
-10889: DATA: 31751
-10890: DATA: 21317
-10891: DATA: 9821
-10892: DATA: 32193
-10893: DATA: 20655
-10894: DATA: 10213
-10895: DATA: 31452
-10896: DATA: 20538
-10897: DATA: 9990
-10898: DATA: 31395
-10899: DATA: 20836
-10900: DATA: 9387
-10901: DATA: 31640
-10902: DATA: 20112
-10903: DATA: 9251
-10904: DATA: 31613
-10905: DATA: 20043
-10906: DATA: 9620
-10907: DATA: 30893
-10908: DATA: 20029
-10909: DATA: 9586
-10910: DATA: 30885
-10911: DATA: 20455
-10912: DATA: 9511
-10913: DATA: 30832
-10914: DATA: 20412
-10915: DATA: 8955
-10916: DATA: 30820
-10917: DATA: 20324
-10918: DATA: 8862
-10919: DATA: 31109
-10920: DATA: 20323
-10921: DATA: 8877
-10922: DATA: 31185
-10923: DATA: 20249
-10924: DATA: 8932
-10925: DATA: 31178
-10926: DATA: 20337
-10927: DATA: 8838
-10928: DATA: 30836
-10929: DATA: 20314
-10930: DATA: 8958
-10931: DATA: 30750
-10932: DATA: 20385
-10933: DATA: 8845
-10934: DATA: 30788
-10935: DATA: 20461
-10936: DATA: 9585
-10937: DATA: 30917
-10938: DATA: 19996
-10939: DATA: 9636
-10940: DATA: 31538
-10941: DATA: 20148
-10942: DATA: 9278
-10943: DATA: 31666
-10944: DATA: 20852
-10945: DATA: 9380
-10946: DATA: 31269
-10947: DATA: 20924
-10948: DATA: 10038
-10949: DATA: 31417
-10950: DATA: 20501
-10951: DATA: 10135
-10952: DATA: 32103
-10953: DATA: 20645
-10954: DATA: 9814
-10955: DATA: 32194
-10956: DATA: 21430
-10957: DATA: 10589
-10958: DATA: 31972
-10959: DATA: 21085
-10960: DATA: 10289
-10961: DATA: 32725
-10962: DATA: 21875
-10963: DATA: 10450
-10964: DATA: 32425
-10965: DATA: 21533
-10966: DATA: 11228
-10967: DATA: 416
-10968: DATA: 22380
-10969: DATA: 10891
-10970: DATA: 208
-10971: DATA: 22061
-10972: DATA: 11273
-10973: DATA: 1020
-10974: DATA: 22974
-10975: DATA: 12140
-10976: DATA: 1396
-10977: DATA: 22758
-10978: DATA: 11965
-10979: DATA: 1148
-10980: DATA: 23080
-10981: DATA: 12769
-10982: DATA: 1941
-10983: DATA: 23895
-10984: DATA: 13108
-10985: DATA: 2359
-10986: DATA: 23775
-10987: DATA: 12930
-10988: DATA: 2217
-10989: DATA: 24142
-10990: DATA: 13360
-10991: DATA: 2562
-10992: DATA: 24636
-10993: DATA: 14300
-10994: DATA: 3571
-10995: DATA: 25493
-10996: DATA: 14820
-10997: DATA: 3906
-10998: DATA: 25950
-10999: DATA: 15206
-11000: DATA: 4465
-11001: DATA: 26437
-11002: DATA: 15640
-11003: DATA: 4908
-11004: DATA: 26912
-11005: DATA: 16253
-11006: DATA: 5415
-11007: DATA: 27444
-11008: DATA: 16696
-11009: DATA: 5945
-11010: DATA: 27939
-11011: DATA: 17277
-11012: DATA: 6448
-11013: DATA: 28450
-11014: DATA: 17744
-11015: DATA: 6913
-11016: DATA: 29053
-11017: DATA: 18291
-11018: DATA: 7513
-11019: DATA: 29513
-11020: DATA: 18849
-11021: DATA: 8157
-11022: DATA: 30180
-11023: DATA: 19421
-11024: DATA: 8241
-11025: DATA: 30232
-11026: DATA: 19504
-11027: DATA: 8787
-11028: DATA: 30891
-11029: DATA: 20122
-11030: DATA: 9360
-11031: DATA: 32041
-11032: DATA: 21365
-11033: DATA: 10588
-11034: DATA: 32720
-11035: DATA: 21988
-11036: DATA: 10794
-11037: DATA: 61
-11038: DATA: 22196
-11039: DATA: 11516
-11040: DATA: 1319
-11041: DATA: 23412
-11042: DATA: 12706
-11043: DATA: 2031
-11044: DATA: 23589
-11045: DATA: 12916
-11046: DATA: 2270
-11047: DATA: 24197
-11048: DATA: 14132
-11049: DATA: 3473
-11050: DATA: 25560
-11051: DATA: 14344
-11052: DATA: 3766
-11053: DATA: 25816
-11054: DATA: 15664
-11055: DATA: 5020
-11056: DATA: 26663
-11057: DATA: 15893
-11058: DATA: 5361
-11059: DATA: 27997
-11060: DATA: 17335
-11061: DATA: 6617
-11062: DATA: 28241
-11063: DATA: 17644
-11064: DATA: 7526
-11065: DATA: 29574
-11066: DATA: 18449
-11067: DATA: 7870
-11068: DATA: 30497
-11069: DATA: 19965
-11070: DATA: 8741
-11071: DATA: 30885
-11072: DATA: 20852
-11073: DATA: 10173
-11074: DATA: 31797
-11075: DATA: 21167
-11076: DATA: 11041
-11077: DATA: 483
-11078: DATA: 22130
-11079: DATA: 11408
-11080: DATA: 1380
-11081: DATA: 23425
-11082: DATA: 12373
-11083: DATA: 1740
-11084: DATA: 24503
-11085: DATA: 13321
-11086: DATA: 2709
-11087: DATA: 25447
-11088: DATA: 14369
-11089: DATA: 3740
-11090: DATA: 26494
-11091: DATA: 15822
-11092: DATA: 4717
-11093: DATA: 27449
-11094: DATA: 16856
-11095: DATA: 5804
-11096: DATA: 28519
-11097: DATA: 17797
-11098: DATA: 6791
-11099: DATA: 29548
-11100: DATA: 18487
-11101: DATA: 7869
-11102: DATA: 30652
-11103: DATA: 19578
-11104: DATA: 9530
-11105: DATA: 31730
-11106: DATA: 20720
-11107: DATA: 10620
-11108: DATA: 32291
-11109: DATA: 21730
-11110: DATA: 11728
-11111: DATA: 580
-11112: DATA: 23348
-11113: DATA: 12329
-11114: DATA: 1745
-11115: DATA: 24475
-11116: DATA: 13485
-11117: DATA: 3406
-11118: DATA: 25208
-11119: DATA: 15189
-11120: DATA: 4128
-11121: DATA: 26333
-11122: DATA: 16354
-11123: DATA: 5266
-11124: DATA: 28074
-11125: DATA: 16968
-11126: DATA: 6928
-11127: DATA: 28791
-11128: DATA: 18811
-11129: DATA: 7690
-11130: DATA: 30493
-11131: DATA: 19555
-11132: DATA: 9572
-11133: DATA: 31357
-11134: DATA: 21268
-11135: DATA: 10279
-11136: DATA: 317
-11137: DATA: 22064
-11138: DATA: 12084
-11139: DATA: 1136
-11140: DATA: 23857
-11141: DATA: 12861
-11142: DATA: 2896
-11143: DATA: 24579
-11144: DATA: 14715
-11145: DATA: 3696
-11146: DATA: 26462
-11147: DATA: 15449
-11148: DATA: 5541
-11149: DATA: 27284
-11150: DATA: 17406
-11151: DATA: 6342
-11152: DATA: 28788
-11153: DATA: 18708
-11154: DATA: 7806
-11155: DATA: 30553
-11156: DATA: 19684
-11157: DATA: 9614
-11158: DATA: 31426
-11159: DATA: 21040
-11160: DATA: 11129
-11161: DATA: 71
-11162: DATA: 22940
-11163: DATA: 12004
-11164: DATA: 1578
-11165: DATA: 24442
-11166: DATA: 13552
-11167: DATA: 3558
-11168: DATA: 25888
-11169: DATA: 14964
-11170: DATA: 5028
-11171: DATA: 26856
-11172: DATA: 16417
-11173: DATA: 6526
-11174: DATA: 28368
-11175: DATA: 18377
-11176: DATA: 8061
-11177: DATA: 29867
-11178: DATA: 19925
-11179: DATA: 9549
-11180: DATA: 31408
-11181: DATA: 21461
-11182: DATA: 11125
-11183: DATA: 213
-11184: DATA: 22563
-11185: DATA: 12628
-11186: DATA: 1788
-11187: DATA: 24081
-11188: DATA: 14263
-11189: DATA: 3201
-11190: DATA: 25616
-11191: DATA: 15844
-11192: DATA: 5498
-11193: DATA: 27265
-11194: DATA: 16976
-11195: DATA: 7097
-11196: DATA: 29484
-11197: DATA: 18616
-11198: DATA: 8304
-11199: DATA: 31158
-11200: DATA: 20789
-11201: DATA: 9895
-11202: DATA: 32294
-11203: DATA: 22456
-11204: DATA: 12064
-11205: DATA: 1261
-11206: DATA: 23555
-11207: DATA: 13713
-11208: DATA: 3451
-11209: DATA: 25323
-11210: DATA: 14933
-11211: DATA: 5005
-11212: DATA: 27568
-11213: DATA: 17173
-11214: DATA: 6370
-11215: DATA: 28762
-11216: DATA: 18490
-11217: DATA: 8592
-11218: DATA: 31024
-11219: DATA: 20180
-11220: DATA: 9898
-11221: DATA: 32333
-11222: DATA: 22468
-11223: DATA: 12205
-11224: DATA: 1905
-11225: DATA: 23685
-11226: DATA: 13459
-11227: DATA: 3176
-11228: DATA: 25642
-11229: DATA: 15849
-11230: DATA: 5557
-11231: DATA: 28007
-11232: DATA: 17780
-11233: DATA: 6906
-11234: DATA: 29366
-11235: DATA: 19005
-11236: DATA: 8752
-11237: DATA: 31717
-11238: DATA: 21397
-11239: DATA: 11013
-11240: DATA: 870
-11241: DATA: 23338
-11242: DATA: 12511
-11243: DATA: 2176
-11244: DATA: 24804
-11245: DATA: 14420
-11246: DATA: 4195
-11247: DATA: 26709
-11248: DATA: 16434
-11249: DATA: 6612
-11250: DATA: 29180
-11251: DATA: 18833
-11252: DATA: 8621
-11253: DATA: 31043
-11254: DATA: 20823
-11255: DATA: 10533
-11256: DATA: 373
-11257: DATA: 22805
-11258: DATA: 12561
-11259: DATA: 2367
-11260: DATA: 24880
-11261: DATA: 14707
-11262: DATA: 4436
-11263: DATA: 26929
-11264: DATA: 16699
-11265: DATA: 6434
-11266: DATA: 28990
-11267: DATA: 18761
-11268: DATA: 8471
-11269: DATA: 31028
-11270: DATA: 20766
-11271: DATA: 10500
-11272: DATA: 375
-11273: DATA: 22890
-11274: DATA: 12610
-11275: DATA: 2317
-11276: DATA: 24972
-11277: DATA: 14744
-11278: DATA: 4593
-11279: DATA: 27089
-11280: DATA: 16421
-11281: DATA: 6144
-11282: DATA: 28785
-11283: DATA: 18511
-11284: DATA: 8368
-11285: DATA: 30856
-11286: DATA: 20674
-11287: DATA: 11062
-11288: DATA: 1003
-11289: DATA: 23420
-11290: DATA: 13215
-11291: DATA: 3064
-11292: DATA: 25188
-11293: DATA: 14958
-11294: DATA: 4772
-11295: DATA: 27380
-11296: DATA: 17722
-11297: DATA: 7537
-11298: DATA: 30192
-11299: DATA: 19956
-11300: DATA: 9258
-11301: DATA: 31789
-11302: DATA: 21636
-11303: DATA: 11469
-11304: DATA: 1905
-11305: DATA: 24549
-11306: DATA: 14300
-11307: DATA: 3586
-11308: DATA: 26278
-11309: DATA: 16095
-11310: DATA: 6505
-11311: DATA: 29141
-11312: DATA: 18491
-11313: DATA: 8275
-11314: DATA: 30896
-11315: DATA: 21258
-11316: DATA: 11180
-11317: DATA: 972
-11318: DATA: 23108
-11319: DATA: 12965
-11320: DATA: 3445
-11321: DATA: 26005
-11322: DATA: 15360
-11323: DATA: 5288
-11324: DATA: 28453
-11325: DATA: 18351
-11326: DATA: 7715
-11327: DATA: 30453
-11328: DATA: 20768
-11329: DATA: 10682
-11330: DATA: 112
-11331: DATA: 22719
-11332: DATA: 13089
-11333: DATA: 3053
-11334: DATA: 25105
-11335: DATA: 15045
-11336: DATA: 5478
-11337: DATA: 28128
-11338: DATA: 17489
-11339: DATA: 7361
-11340: DATA: 30632
-11341: DATA: 19972
-11342: DATA: 9904
-11343: DATA: 339
-11344: DATA: 22561
-11345: DATA: 12443
-11346: DATA: 2864
-11347: DATA: 25549
-11348: DATA: 15016
-11349: DATA: 5388
-11350: DATA: 28115
-11351: DATA: 17568
-11352: DATA: 7988
-11353: DATA: 30673
-11354: DATA: 20127
-11355: DATA: 10541
-11356: DATA: 51
-11357: DATA: 22770
-11358: DATA: 13218
-11359: DATA: 2686
-11360: DATA: 25973
-11361: DATA: 15797
-11362: DATA: 5360
-11363: DATA: 28494
-11364: DATA: 17957
-11365: DATA: 7913
-11366: DATA: 31132
-11367: DATA: 20572
-11368: DATA: 11064
-11369: DATA: 613
-11370: DATA: 23236
-11371: DATA: 13701
-11372: DATA: 3233
-11373: DATA: 26447
-11374: DATA: 15989
-11375: DATA: 6485
-11376: DATA: 28720
-11377: DATA: 18650
-11378: DATA: 9205
-11379: DATA: 31374
-11380: DATA: 21930
-11381: DATA: 11274
-11382: DATA: 1860
-11383: DATA: 24101
-11384: DATA: 14695
-11385: DATA: 4096
-11386: DATA: 27413
-11387: DATA: 16928
-11388: DATA: 7524
-11389: DATA: 29737
-11390: DATA: 20287
-11391: DATA: 9845
-11392: DATA: 310
-11393: DATA: 22576
-11394: DATA: 13168
-11395: DATA: 2620
-11396: DATA: 25898
-11397: DATA: 15412
-11398: DATA: 5919
-11399: DATA: 28171
-11400: DATA: 18801
-11401: DATA: 8229
-11402: DATA: 31569
-11403: DATA: 21087
-11404: DATA: 11691
-11405: DATA: 1160
-11406: DATA: 24574
-11407: DATA: 14033
-11408: DATA: 4212
-11409: DATA: 27412
-11410: DATA: 16996
-11411: DATA: 7453
-11412: DATA: 29872
-11413: DATA: 20357
-11414: DATA: 9941
-11415: DATA: 101
-11416: DATA: 23417
-11417: DATA: 12874
-11418: DATA: 3485
-11419: DATA: 25832
-11420: DATA: 15914
-11421: DATA: 6505
-11422: DATA: 28924
-11423: DATA: 19381
-11424: DATA: 9511
-11425: DATA: 31866
-11426: DATA: 22512
-11427: DATA: 12004
-11428: DATA: 2091
-11429: DATA: 25464
-11430: DATA: 15056
-11431: DATA: 5576
-11432: DATA: 28533
-11433: DATA: 18094
-11434: DATA: 8661
-11435: DATA: 31565
-11436: DATA: 21157
-11437: DATA: 11677
-11438: DATA: 1918
-11439: DATA: 24218
-11440: DATA: 14368
-11441: DATA: 4944
-11442: DATA: 27312
-11443: DATA: 17417
-11444: DATA: 8107
-11445: DATA: 30349
-11446: DATA: 20563
-11447: DATA: 11236
-11448: DATA: 1400
-11449: DATA: 23689
-11450: DATA: 13904
-11451: DATA: 4537
-11452: DATA: 27436
-11453: DATA: 17080
-11454: DATA: 7229
-11455: DATA: 30709
-11456: DATA: 20792
-11457: DATA: 10420
-11458: DATA: 548
-11459: DATA: 23992
-11460: DATA: 14134
-11461: DATA: 3811
-11462: DATA: 26704
-11463: DATA: 17349
-11464: DATA: 7488
-11465: DATA: 29933
-11466: DATA: 20053
-11467: DATA: 10637
-11468: DATA: 934
-11469: DATA: 23826
-11470: DATA: 13567
-11471: DATA: 3678
-11472: DATA: 26663
-11473: DATA: 17309
-11474: DATA: 7541
-11475: DATA: 29905
-11476: DATA: 20130
-11477: DATA: 10317
-11478: DATA: 984
-11479: DATA: 23968
-11480: DATA: 14182
-11481: DATA: 3776
-11482: DATA: 26832
-11483: DATA: 16993
-11484: DATA: 7211
-11485: DATA: 30706
-11486: DATA: 20923
-11487: DATA: 11110
-11488: DATA: 1396
-11489: DATA: 23801
-11490: DATA: 14009
-11491: DATA: 4214
-11492: DATA: 27169
-11493: DATA: 17837
-11494: DATA: 8089
-11495: DATA: 31057
-11496: DATA: 21300
-11497: DATA: 11560
-11498: DATA: 1241
-11499: DATA: 24202
-11500: DATA: 14508
-11501: DATA: 4681
-11502: DATA: 27696
-11503: DATA: 17949
-11504: DATA: 8245
-11505: DATA: 31683
-11506: DATA: 22005
-11507: DATA: 12253
-11508: DATA: 2487
-11509: DATA: 25410
-11510: DATA: 15709
-11511: DATA: 5984
-11512: DATA: 29024
-11513: DATA: 19213
-11514: DATA: 9497
-11515: DATA: 32547
-11516: DATA: 22819
-11517: DATA: 13181
-11518: DATA: 3385
-11519: DATA: 26427
-11520: DATA: 16672
-11521: DATA: 6960
-11522: DATA: 29986
-11523: DATA: 20280
-11524: DATA: 10551
-11525: DATA: 825
-11526: DATA: 23833
-11527: DATA: 14091
-11528: DATA: 4467
-11529: DATA: 27429
-11530: DATA: 17753
-11531: DATA: 8003
-11532: DATA: 31204
-11533: DATA: 21396
-11534: DATA: 11748
-11535: DATA: 1945
-11536: DATA: 24692
-11537: DATA: 14849
-11538: DATA: 5240
-11539: DATA: 28242
-11540: DATA: 18609
-11541: DATA: 8842
-11542: DATA: 31960
-11543: DATA: 22891
-11544: DATA: 13075
-11545: DATA: 3402
-11546: DATA: 26501
-11547: DATA: 16889
-11548: DATA: 6711
-11549: DATA: 29812
-11550: DATA: 20148
-11551: DATA: 10480
-11552: DATA: 1344
-11553: DATA: 24390
-11554: DATA: 14761
-11555: DATA: 5107
-11556: DATA: 27685
-11557: DATA: 18030
-11558: DATA: 8351
-11559: DATA: 31447
-11560: DATA: 22324
-11561: DATA: 12685
-11562: DATA: 3029
-11563: DATA: 25612
-11564: DATA: 16032
-11565: DATA: 6348
-11566: DATA: 30053
-11567: DATA: 20372
-11568: DATA: 10278
-11569: DATA: 577
-11570: DATA: 23797
-11571: DATA: 14607
-11572: DATA: 5047
-11573: DATA: 27964
-11574: DATA: 18041
-11575: DATA: 8433
-11576: DATA: 32051
-11577: DATA: 22422
-11578: DATA: 12368
-11579: DATA: 2732
-11580: DATA: 26468
-11581: DATA: 16810
-11582: DATA: 6705
-11583: DATA: 29863
-11584: DATA: 20793
-11585: DATA: 11257
-11586: DATA: 1136
-11587: DATA: 24238
-11588: DATA: 15153
-11589: DATA: 5539
-11590: DATA: 28190
-11591: DATA: 18588
-11592: DATA: 9524
-11593: DATA: 32737
-11594: DATA: 22609
-11595: DATA: 13012
-11596: DATA: 4069
-11597: DATA: 26717
-11598: DATA: 17072
-11599: DATA: 8034
-11600: DATA: 30780
-11601: DATA: 21148
-11602: DATA: 12156
-11603: DATA: 2520
-11604: DATA: 25316
-11605: DATA: 16153
-11606: DATA: 6616
-11607: DATA: 29344
-11608: DATA: 20276
-11609: DATA: 10695
-11610: DATA: 642
-11611: DATA: 24424
-11612: DATA: 14369
-11613: DATA: 4839
-11614: DATA: 28597
-11615: DATA: 18485
-11616: DATA: 9522
-11617: DATA: 32743
-11618: DATA: 22719
-11619: DATA: 13680
-11620: DATA: 3684
-11621: DATA: 26817
-11622: DATA: 17809
-11623: DATA: 7758
-11624: DATA: 31601
-11625: DATA: 21605
-11626: DATA: 12021
-11627: DATA: 2975
-11628: DATA: 25773
-11629: DATA: 16728
-11630: DATA: 6704
-11631: DATA: 30492
-11632: DATA: 20519
-11633: DATA: 10901
-11634: DATA: 2035
-11635: DATA: 24728
-11636: DATA: 15798
-11637: DATA: 5721
-11638: DATA: 29521
-11639: DATA: 19564
-11640: DATA: 10618
-11641: DATA: 521
-11642: DATA: 24329
-11643: DATA: 14445
-11644: DATA: 5430
-11645: DATA: 28216
-11646: DATA: 19254
-11647: DATA: 9255
-11648: DATA: 305
-11649: DATA: 23078
-11650: DATA: 14136
-11651: DATA: 4148
-11652: DATA: 27946
-11653: DATA: 17962
-11654: DATA: 9052
-11655: DATA: 31813
-11656: DATA: 22893
-11657: DATA: 12906
-11658: DATA: 3909
-11659: DATA: 26637
-11660: DATA: 17824
-11661: DATA: 7826
-11662: DATA: 31742
-11663: DATA: 21650
-11664: DATA: 12320
-11665: DATA: 3413
-11666: DATA: 26211
-11667: DATA: 17240
-11668: DATA: 7329
-11669: DATA: 31181
-11670: DATA: 21201
-11671: DATA: 11819
-11672: DATA: 2925
-11673: DATA: 25681
-11674: DATA: 16792
-11675: DATA: 6884
-11676: DATA: 30250
-11677: DATA: 21370
-11678: DATA: 11504
-11679: DATA: 2557
-11680: DATA: 25905
-11681: DATA: 15975
-11682: DATA: 7093
-11683: DATA: 29885
-11684: DATA: 20528
-11685: DATA: 11621
-11686: DATA: 1681
-11687: DATA: 25553
-11688: DATA: 16180
-11689: DATA: 6322
-11690: DATA: 30169
-11691: DATA: 20737
-11692: DATA: 10920
-11693: DATA: 1949
-11694: DATA: 25464
-11695: DATA: 15504
-11696: DATA: 6200
-11697: DATA: 30021
-11698: DATA: 20144
-11699: DATA: 10756
-11700: DATA: 1963
-11701: DATA: 24792
-11702: DATA: 15376
-11703: DATA: 6642
-11704: DATA: 30077
-11705: DATA: 20113
-11706: DATA: 10776
-11707: DATA: 2029
-11708: DATA: 25405
-11709: DATA: 15538
-11710: DATA: 6181
-11711: DATA: 30119
-11712: DATA: 20852
-11713: DATA: 10916
-11714: DATA: 1573
-11715: DATA: 25528
-11716: DATA: 16183
-11717: DATA: 6329
-11718: DATA: 29790
-11719: DATA: 20963
-11720: DATA: 11645
-11721: DATA: 1771
-11722: DATA: 25155
-11723: DATA: 16324
-11724: DATA: 7072
-11725: DATA: 30488
-11726: DATA: 20629
-11727: DATA: 11383
-11728: DATA: 2097
-11729: DATA: 26004
-11730: DATA: 16755
-11731: DATA: 6869
-11732: DATA: 30318
-11733: DATA: 21049
-11734: DATA: 12248
-11735: DATA: 2988
-11736: DATA: 26471
-11737: DATA: 16517
-11738: DATA: 7321
-11739: DATA: 30846
-11740: DATA: 21604
-11741: DATA: 12796
-11742: DATA: 3568
-11743: DATA: 26982
-11744: DATA: 17717
-11745: DATA: 7931
-11746: DATA: 31412
-11747: DATA: 22116
-11748: DATA: 12900
-11749: DATA: 4079
-11750: DATA: 27541
-11751: DATA: 18244
-11752: DATA: 9079
-11753: DATA: 32557
-11754: DATA: 22672
-11755: DATA: 13444
-11756: DATA: 4266
-11757: DATA: 27677
-11758: DATA: 18545
-11759: DATA: 9301
-11760: DATA: 55
-11761: DATA: 24026
-11762: DATA: 14822
-11763: DATA: 5528
-11764: DATA: 29156
-11765: DATA: 19778
-11766: DATA: 10590
-11767: DATA: 1317
-11768: DATA: 24935
-11769: DATA: 15626
-11770: DATA: 6429
-11771: DATA: 29992
-11772: DATA: 20836
-11773: DATA: 11561
-11774: DATA: 2338
-11775: DATA: 25914
-11776: DATA: 16676
-11777: DATA: 7484
-11778: DATA: 31027
-11779: DATA: 21820
-11780: DATA: 12584
-11781: DATA: 3437
-11782: DATA: 26905
-11783: DATA: 17686
-11784: DATA: 8568
-11785: DATA: 32100
-11786: DATA: 22878
-11787: DATA: 13641
-11788: DATA: 4586
-11789: DATA: 28125
-11790: DATA: 18864
-11791: DATA: 9724
-11792: DATA: 32
-11793: DATA: 23637
-11794: DATA: 14457
-11795: DATA: 5198
-11796: DATA: 28900
-11797: DATA: 19615
-11798: DATA: 10449
-11799: DATA: 1836
-11800: DATA: 25466
-11801: DATA: 16204
-11802: DATA: 7070
-11803: DATA: 30698
-11804: DATA: 21098
-11805: DATA: 11837
-11806: DATA: 2800
-11807: DATA: 26305
-11808: DATA: 17724
-11809: DATA: 8560
-11810: DATA: 32240
-11811: DATA: 23026
-11812: DATA: 13351
-11813: DATA: 4200
-11814: DATA: 27793
-11815: DATA: 18635
-11816: DATA: 10036
-11817: DATA: 940
-11818: DATA: 24515
-11819: DATA: 14925
-11820: DATA: 5808
-11821: DATA: 29394
-11822: DATA: 20784
-11823: DATA: 11660
-11824: DATA: 2107
-11825: DATA: 25664
-11826: DATA: 16610
-11827: DATA: 8029
-11828: DATA: 31671
-11829: DATA: 22466
-11830: DATA: 12869
-11831: DATA: 3825
-11832: DATA: 28028
-11833: DATA: 18889
-11834: DATA: 9296
-11835: DATA: 172
-11836: DATA: 24362
-11837: DATA: 15289
-11838: DATA: 5744
-11839: DATA: 29373
-11840: DATA: 20785
-11841: DATA: 11700
-11842: DATA: 2086
-11843: DATA: 25764
-11844: DATA: 17252
-11845: DATA: 8107
-11846: DATA: 31263
-11847: DATA: 22153
-11848: DATA: 13693
-11849: DATA: 4580
-11850: DATA: 27735
-11851: DATA: 18632
-11852: DATA: 10212
-11853: DATA: 532
-11854: DATA: 24291
-11855: DATA: 15637
-11856: DATA: 6176
-11857: DATA: 29850
-11858: DATA: 21296
-11859: DATA: 12228
-11860: DATA: 2731
-11861: DATA: 26904
-11862: DATA: 17858
-11863: DATA: 8421
-11864: DATA: 32634
-11865: DATA: 23498
-11866: DATA: 13954
-11867: DATA: 5497
-11868: DATA: 28716
-11869: DATA: 19622
-11870: DATA: 11248
-11871: DATA: 1633
-11872: DATA: 25916
-11873: DATA: 16880
-11874: DATA: 7408
-11875: DATA: 31615
-11876: DATA: 22049
-11877: DATA: 13036
-11878: DATA: 4499
-11879: DATA: 27725
-11880: DATA: 19252
-11881: DATA: 9760
-11882: DATA: 712
-11883: DATA: 24985
-11884: DATA: 15521
-11885: DATA: 6995
-11886: DATA: 30324
-11887: DATA: 21766
-11888: DATA: 12404
-11889: DATA: 3266
-11890: DATA: 27637
-11891: DATA: 18062
-11892: DATA: 9648
-11893: OR   24401 14955 6512 
-11897: DATA: 29765
-11898: DATA: 21269
-11899: DATA: 11820
-11900: DATA: 3383
-11901: DATA: 26665
-11902: DATA: 18302
-11903: DATA: 8785
-11904: DATA: 291
-11905: DATA: 23600
-11906: DATA: 15139
-11907: DATA: 5673
-11908: DATA: 30016
-11909: DATA: 20520
-11910: DATA: 12049
-11911: DATA: 2582
-11912: DATA: 26976
-11913: DATA: 17408
-11914: DATA: 9054
-11915: DATA: 32322
-11916: DATA: 23990
-11917: DATA: 14473
-11918: DATA: 6136
-11919: DATA: 29360
-11920: DATA: 20502
-11921: DATA: 12048
-11922: DATA: 2673
-11923: DATA: 26974
-11924: DATA: 17580
-11925: DATA: 8939
-11926: DATA: 32484
-11927: DATA: 23597
-11928: DATA: 15229
-11929: DATA: 5718
-11930: DATA: 30160
-11931: DATA: 20708
-11932: DATA: 11831
-11933: DATA: 3389
-11934: DATA: 26801
-11935: DATA: 18357
-11936: DATA: 9511
-11937: DATA: 116
-11938: DATA: 24510
-11939: DATA: 15097
-11940: DATA: 6205
-11941: DATA: 30509
-11942: DATA: 21138
-11943: DATA: 12736
-11944: DATA: 3957
-11945: DATA: 27302
-11946: DATA: 18904
-11947: DATA: 10061
-11948: DATA: 685
-11949: DATA: 25043
-11950: DATA: 16176
-11951: DATA: 6804
-11952: DATA: 30836
-11953: DATA: 22358
-11954: DATA: 13055
-11955: DATA: 4107
-11956: DATA: 28577
-11957: DATA: 19085
-11958: DATA: 10335
-11959: DATA: 2027
-11960: DATA: 25908
-11961: DATA: 16534
-11962: DATA: 7711
-11963: DATA: 32160
-11964: DATA: 23329
-11965: DATA: 14077
-11966: DATA: 5156
-11967: DATA: 29607
-11968: DATA: 20795
-11969: DATA: 11429
-11970: DATA: 2617
-11971: DATA: 27070
-11972: DATA: 18213
-11973: DATA: 8865
-11974: DATA: 80
-11975: DATA: 24460
-11976: DATA: 15719
-11977: DATA: 6377
-11978: DATA: 30289
-11979: DATA: 21955
-11980: DATA: 13216
-11981: DATA: 4435
-11982: DATA: 27824
-11983: DATA: 18965
-11984: DATA: 10269
-11985: DATA: 1921
-11986: DATA: 25904
-11987: DATA: 16596
-11988: DATA: 7863
-11989: DATA: 31821
-11990: DATA: 23490
-11991: DATA: 14756
-11992: DATA: 6013
-11993: DATA: 29387
-11994: DATA: 20633
-11995: DATA: 11875
-11996: DATA: 3107
-11997: DATA: 27571
-11998: DATA: 18928
-11999: DATA: 10037
-12000: DATA: 1280
-12001: DATA: 24826
-12002: DATA: 16112
-12003: DATA: 7268
-12004: DATA: 31275
-12005: DATA: 23032
-12006: DATA: 14210
-12007: DATA: 5381
-12008: DATA: 29539
-12009: DATA: 20768
-12010: DATA: 11459
-12011: DATA: 2713
-12012: DATA: 26852
-12013: DATA: 18004
-12014: DATA: 9315
-12015: DATA: 597
-12016: DATA: 24629
-12017: DATA: 16347
-12018: DATA: 7600
-12019: DATA: 31640
-12020: DATA: 22953
-12021: DATA: 14159
-12022: DATA: 5457
-12023: DATA: 29547
-12024: DATA: 20863
-12025: DATA: 12040
-12026: DATA: 3349
-12027: DATA: 27427
-12028: DATA: 18736
-12029: DATA: 10109
-12030: DATA: 1343
-12031: DATA: 25395
-12032: DATA: 16756
-12033: DATA: 7969
-12034: DATA: 32056
-12035: DATA: 23352
-12036: DATA: 14692
-12037: DATA: 5934
-12038: DATA: 29983
-12039: DATA: 21267
-12040: DATA: 12657
-12041: DATA: 3877
-12042: DATA: 27975
-12043: DATA: 19269
-12044: DATA: 10669
-12045: DATA: 1950
-12046: DATA: 26104
-12047: DATA: 17301
-12048: DATA: 8248
-12049: DATA: 32282
-12050: DATA: 23679
-12051: DATA: 14934
-12052: DATA: 6327
-12053: DATA: 30413
-12054: DATA: 21700
-12055: DATA: 13610
-12056: DATA: 4987
-12057: DATA: 28933
-12058: DATA: 20355
-12059: DATA: 11769
-12060: DATA: 2593
-12061: DATA: 26744
-12062: DATA: 18080
-12063: DATA: 9397
-12064: DATA: 1312
-12065: DATA: 25466
-12066: DATA: 16880
-12067: DATA: 8190
-12068: DATA: 31784
-12069: DATA: 23140
-12070: DATA: 14493
-12071: DATA: 5831
-12072: DATA: 30522
-12073: DATA: 21989
-12074: DATA: 13200
-12075: DATA: 4153
-12076: DATA: 28332
-12077: DATA: 19672
-12078: DATA: 11568
-12079: DATA: 2967
-12080: DATA: 26673
-12081: DATA: 18004
-12082: DATA: 9459
-12083: DATA: 1301
-12084: DATA: 25572
-12085: DATA: 16840
-12086: DATA: 7752
-12087: DATA: 31985
-12088: DATA: 23921
-12089: DATA: 15243
-12090: DATA: 6164
-12091: DATA: 30398
-12092: DATA: 22372
-12093: DATA: 13737
-12094: DATA: 4671
-12095: DATA: 28917
-12096: DATA: 20768
-12097: DATA: 12221
-12098: DATA: 3125
-12099: DATA: 27389
-12100: DATA: 19233
-12101: DATA: 10668
-12102: DATA: 1539
-12103: DATA: 25745
-12104: DATA: 17720
-12105: DATA: 9125
-12106: DATA: 81
-12107: DATA: 24259
-12108: DATA: 16288
-12109: DATA: 7261
-12110: DATA: 31460
-12111: DATA: 23389
-12112: DATA: 14385
-12113: DATA: 5767
-12114: DATA: 30581
-12115: DATA: 21917
-12116: DATA: 12973
-12117: DATA: 4894
-12118: DATA: 29072
-12119: DATA: 20129
-12120: DATA: 12145
-12121: DATA: 3531
-12122: DATA: 27267
-12123: DATA: 19304
-12124: DATA: 10340
-12125: DATA: 1787
-12126: DATA: 26559
-12127: DATA: 17529
-12128: DATA: 9533
-12129: DATA: 1012
-12130: DATA: 24759
-12131: DATA: 16760
-12132: DATA: 7780
-12133: DATA: 31993
-12134: DATA: 23967
-12135: DATA: 14853
-12136: DATA: 7008
-12137: DATA: 30765
-12138: DATA: 22229
-12139: DATA: 14285
-12140: DATA: 5290
-12141: DATA: 30034
-12142: DATA: 21090
-12143: DATA: 13057
-12144: DATA: 4156
-12145: DATA: 28315
-12146: DATA: 20400
-12147: DATA: 11485
-12148: DATA: 3472
-12149: DATA: 27205
-12150: DATA: 19285
-12151: DATA: 10277
-12152: DATA: 2427
-12153: DATA: 26118
-12154: DATA: 18197
-12155: DATA: 9260
-12156: DATA: 1322
-12157: DATA: 25213
-12158: DATA: 17188
-12159: DATA: 8250
-12160: DATA: 372
-12161: DATA: 24097
-12162: DATA: 16184
-12163: DATA: 7224
-12164: DATA: 32100
-12165: DATA: 23102
-12166: DATA: 15135
-12167: DATA: 6160
-12168: DATA: 31072
-12169: DATA: 22125
-12170: DATA: 14096
-12171: DATA: 5214
-12172: DATA: 30113
-12173: DATA: 21144
-12174: DATA: 13309
-12175: DATA: 4294
-12176: DATA: 28788
-12177: DATA: 20736
-12178: DATA: 11902
-12179: DATA: 3924
-12180: DATA: 27818
-12181: DATA: 19867
-12182: DATA: 10969
-12183: DATA: 2609
-12184: DATA: 27517
-12185: DATA: 18507
-12186: DATA: 10647
-12187: DATA: 1699
-12188: DATA: 26176
-12189: DATA: 18296
-12190: DATA: 9393
-12191: DATA: 1510
-12192: DATA: 25888
-12193: DATA: 16912
-12194: DATA: 9150
-12195: DATA: 242
-12196: DATA: 24630
-12197: DATA: 16761
-12198: DATA: 7832
-12199: DATA: 32672
-12200: DATA: 24406
-12201: DATA: 15520
-12202: DATA: 7633
-12203: DATA: 32014
-12204: DATA: 23212
-12205: DATA: 15183
-12206: DATA: 6980
-12207: DATA: 30877
-12208: DATA: 22589
-12209: DATA: 14662
-12210: DATA: 5808
-12211: DATA: 30228
-12212: DATA: 22455
-12213: DATA: 13453
-12214: DATA: 5201
-12215: DATA: 30117
-12216: DATA: 21863
-12217: DATA: 12932
-12218: DATA: 4638
-12219: DATA: 29609
-12220: DATA: 21309
-12221: DATA: 12541
-12222: DATA: 4146
-12223: DATA: 29104
-12224: DATA: 20789
-12225: DATA: 11958
-12226: DATA: 3640
-12227: DATA: 28669
-12228: DATA: 20269
-12229: DATA: 11427
-12230: DATA: 3152
-12231: DATA: 28036
-12232: DATA: 19764
-12233: DATA: 10982
-12234: DATA: 2655
-12235: DATA: 27611
-12236: DATA: 19361
-12237: DATA: 11101
-12238: DATA: 2303
-12239: DATA: 26715
-12240: DATA: 18548
-12241: DATA: 10630
-12242: DATA: 2431
-12243: DATA: 26320
-12244: DATA: 18081
-12245: DATA: 9805
-12246: DATA: 1988
-12247: DATA: 26551
-12248: DATA: 18299
-12249: DATA: 9429
-12250: DATA: 1177
-12251: DATA: 25710
-12252: DATA: 17445
-12253: DATA: 9713
-12254: DATA: 1520
-12255: DATA: 25980
-12256: DATA: 17703
-12257: DATA: 8953
-12258: DATA: 689
-12259: DATA: 25203
-12260: DATA: 16928
-12261: DATA: 9123
-12262: DATA: 976
-12263: DATA: 25349
-12264: DATA: 17245
-12265: DATA: 9009
-12266: DATA: 144
-12267: DATA: 24708
-12268: DATA: 16567
-12269: DATA: 8221
-12270: DATA: 98
-12271: DATA: 24596
-12272: DATA: 16445
-12273: DATA: 8667
-12274: DATA: 505
-12275: DATA: 24979
-12276: DATA: 16803
-12277: DATA: 8451
-12278: DATA: 272
-12279: DATA: 24869
-12280: DATA: 16704
-12281: DATA: 8461
-12282: DATA: 277
-12283: DATA: 24941
-12284: DATA: 16695
-12285: DATA: 8489
-12286: DATA: 309
-12287: DATA: 24880
-12288: DATA: 16676
-12289: DATA: 8565
-12290: DATA: 307
-12291: DATA: 24882
-12292: DATA: 16690
-12293: DATA: 8488
-12294: DATA: 336
-12295: DATA: 24832
-12296: DATA: 16761
-12297: DATA: 8551
-12298: DATA: 337
-12299: DATA: 24899
-12300: DATA: 16815
-12301: DATA: 8592
-12302: DATA: 501
-12303: DATA: 25051
-12304: DATA: 16416
-12305: DATA: 8277
-12306: DATA: 100
-12307: DATA: 24658
-12308: DATA: 16612
-12309: DATA: 8340
-12310: DATA: 223
-12311: DATA: 25392
-12312: DATA: 17254
-12313: DATA: 8965
-12314: DATA: 917
-12315: DATA: 25580
-12316: DATA: 16951
-12317: DATA: 8809
-12318: DATA: 752
-12319: DATA: 25335
-12320: DATA: 17720
-12321: DATA: 9594
-12322: DATA: 1459
-12323: DATA: 26102
-12324: DATA: 17463
-12325: DATA: 9261
-12326: DATA: 1161
-12327: DATA: 25802
-12328: DATA: 18273
-12329: DATA: 10167
-12330: DATA: 1936
-12331: DATA: 26141
-12332: DATA: 18085
-12333: DATA: 9929
-12334: DATA: 2424
-12335: DATA: 27097
-12336: DATA: 18548
-12337: DATA: 10324
-12338: DATA: 2302
-12339: DATA: 27417
-12340: DATA: 19428
-12341: DATA: 11225
-12342: DATA: 2648
-12343: DATA: 27360
-12344: DATA: 19764
-12345: DATA: 11658
-12346: DATA: 3091
-12347: DATA: 27816
-12348: DATA: 20261
-12349: DATA: 12211
-12350: DATA: 3696
-12351: DATA: 28322
-12352: DATA: 20789
-12353: DATA: 12705
-12354: DATA: 4149
-12355: DATA: 28847
-12356: DATA: 21303
-12357: DATA: 13293
-12358: DATA: 4632
-12359: DATA: 29312
-12360: DATA: 21862
-12361: DATA: 13792
-12362: DATA: 5136
-12363: DATA: 29889
-12364: DATA: 22443
-12365: DATA: 13842
-12366: DATA: 5883
-12367: DATA: 30997
-12368: DATA: 22561
-12369: DATA: 14491
-12370: DATA: 7011
-12371: DATA: 31708
-12372: DATA: 23202
-12373: DATA: 15624
-12374: DATA: 7582
-12375: DATA: 31973
-12376: DATA: 24372
-12377: DATA: 16369
-12378: DATA: 7832
-12379: DATA: 360
-12380: DATA: 24676
-12381: DATA: 16639
-12382: DATA: 9141
-12383: DATA: 628
-12384: DATA: 25911
-12385: DATA: 17917
-12386: DATA: 9456
-12387: DATA: 1912
-12388: DATA: 26172
-12389: DATA: 18169
-12390: DATA: 10645
-12391: DATA: 2123
-12392: DATA: 27504
-12393: DATA: 18998
-12394: DATA: 10896
-12395: DATA: 3481
-12396: DATA: 27819
-12397: DATA: 20253
-12398: DATA: 11876
-12399: DATA: 4381
-12400: DATA: 28721
-12401: DATA: 20629
-12402: DATA: 13287
-12403: DATA: 4760
-12404: DATA: 30135
-12405: DATA: 21593
-12406: DATA: 14108
-12407: DATA: 5669
-12408: DATA: 31093
-12409: DATA: 22539
-12410: DATA: 15124
-12411: DATA: 6765
-12412: DATA: 32048
-12413: DATA: 23605
-12414: DATA: 16181
-12415: DATA: 7719
-12416: DATA: 305
-12417: DATA: 24693
-12418: DATA: 17209
-12419: DATA: 8750
-12420: DATA: 1380
-12421: DATA: 25641
-12422: DATA: 18197
-12423: DATA: 9739
-12424: DATA: 2407
-12425: DATA: 26720
-12426: DATA: 19216
-12427: DATA: 10827
-12428: DATA: 3499
-12429: DATA: 27793
-12430: DATA: 20473
-12431: DATA: 11988
-12432: DATA: 4147
-12433: DATA: 29456
-12434: DATA: 21040
-12435: DATA: 13641
-12436: DATA: 5291
-12437: DATA: 30669
-12438: DATA: 22212
-12439: DATA: 14381
-12440: DATA: 7025
-12441: DATA: 31237
-12442: DATA: 23966
-12443: DATA: 15586
-12444: DATA: 7734
-12445: DATA: 361
-12446: DATA: 24760
-12447: DATA: 17339
-12448: DATA: 9552
-12449: DATA: 1122
-12450: DATA: 26549
-12451: DATA: 18158
-12452: DATA: 10288
-12453: DATA: 2824
-12454: DATA: 27294
-12455: DATA: 19914
-12456: DATA: 12134
-12457: DATA: 3761
-12458: DATA: 29144
-12459: DATA: 21346
-12460: DATA: 12944
-12461: DATA: 5583
-12462: DATA: 30591
-12463: DATA: 22149
-12464: DATA: 14397
-12465: DATA: 6998
-12466: DATA: 31473
-12467: DATA: 23569
-12468: DATA: 16356
-12469: DATA: 7908
-12470: DATA: 67
-12471: DATA: 25577
-12472: DATA: 17781
-12473: DATA: 9355
-12474: DATA: 1556
-12475: DATA: 26891
-12476: DATA: 19216
-12477: DATA: 10933
-12478: DATA: 3125
-12479: DATA: 28661
-12480: DATA: 20792
-12481: DATA: 12468
-12482: DATA: 4642
-12483: DATA: 30138
-12484: DATA: 22305
-12485: DATA: 14061
-12486: DATA: 6148
-12487: DATA: 31639
-12488: DATA: 23921
-12489: DATA: 15584
-12490: DATA: 7747
-12491: DATA: 397
-12492: DATA: 25516
-12493: DATA: 17688
-12494: DATA: 9442
-12495: DATA: 1616
-12496: DATA: 26740
-12497: DATA: 19334
-12498: DATA: 11637
-12499: DATA: 3288
-12500: DATA: 28329
-12501: DATA: 20557
-12502: DATA: 13252
-12503: DATA: 5546
-12504: DATA: 30516
-12505: DATA: 22215
-12506: DATA: 14485
-12507: DATA: 6701
-12508: DATA: 31796
-12509: DATA: 24559
-12510: DATA: 16831
-12511: DATA: 9057
-12512: DATA: 1329
-12513: DATA: 25846
-12514: DATA: 18084
-12515: DATA: 10356
-12516: DATA: 2602
-12517: DATA: 28138
-12518: DATA: 20432
-12519: DATA: 12636
-12520: DATA: 4987
-12521: DATA: 30000
-12522: DATA: 21648
-12523: DATA: 13963
-12524: DATA: 6326
-12525: DATA: 31314
-12526: DATA: 23677
-12527: DATA: 15957
-12528: DATA: 8224
-12529: DATA: 989
-12530: DATA: 26101
-12531: DATA: 18397
-12532: DATA: 10678
-12533: DATA: 2892
-12534: DATA: 27993
-12535: DATA: 20331
-12536: DATA: 12602
-12537: DATA: 4933
-12538: DATA: 30032
-12539: DATA: 22284
-12540: DATA: 14647
-12541: DATA: 7037
-12542: DATA: 32041
-12543: DATA: 24378
-12544: DATA: 16673
-12545: DATA: 9077
-12546: DATA: 1312
-12547: DATA: 26408
-12548: DATA: 18743
-12549: DATA: 11045
-12550: DATA: 3408
-12551: DATA: 28433
-12552: DATA: 20860
-12553: DATA: 13175
-12554: DATA: 5471
-12555: DATA: 30552
-12556: DATA: 22947
-12557: DATA: 15253
-12558: DATA: 7600
-12559: DATA: 32705
-12560: DATA: 24636
-12561: DATA: 16912
-12562: DATA: 9264
-12563: DATA: 1608
-12564: DATA: 26794
-12565: DATA: 19081
-12566: DATA: 11477
-12567: DATA: 4407
-12568: DATA: 29555
-12569: DATA: 21847
-12570: DATA: 14239
-12571: DATA: 6650
-12572: DATA: 31280
-12573: DATA: 23669
-12574: DATA: 16124
-12575: DATA: 8373
-12576: DATA: 1325
-12577: DATA: 26490
-12578: DATA: 18853
-12579: DATA: 11197
-12580: DATA: 3111
-12581: DATA: 28268
-12582: DATA: 20638
-12583: DATA: 12933
-12584: DATA: 6012
-12585: DATA: 31136
-12586: DATA: 23505
-12587: DATA: 15391
-12588: DATA: 7908
-12589: DATA: 223
-12590: DATA: 25977
-12591: DATA: 18311
-12592: DATA: 10288
-12593: DATA: 2630
-12594: DATA: 27824
-12595: DATA: 20766
-12596: DATA: 13228
-12597: DATA: 5572
-12598: DATA: 30274
-12599: DATA: 22773
-12600: DATA: 15741
-12601: DATA: 8075
-12602: DATA: 23
-12603: DATA: 25325
-12604: DATA: 18219
-12605: DATA: 10667
-12606: DATA: 2613
-12607: DATA: 27815
-12608: DATA: 20796
-12609: DATA: 13232
-12610: DATA: 5169
-12611: DATA: 30393
-12612: DATA: 23402
-12613: DATA: 15853
-12614: DATA: 7760
-12615: DATA: 177
-12616: DATA: 25980
-12617: DATA: 18400
-12618: DATA: 10306
-12619: DATA: 2760
-12620: DATA: 28644
-12621: DATA: 20500
-12622: DATA: 13027
-12623: DATA: 5909
-12624: DATA: 30773
-12625: DATA: 23253
-12626: DATA: 16227
-12627: DATA: 8649
-12628: DATA: 673
-12629: DATA: 26376
-12630: DATA: 18880
-12631: DATA: 10981
-12632: DATA: 3942
-12633: DATA: 29130
-12634: DATA: 21139
-12635: DATA: 14182
-12636: DATA: 6244
-12637: DATA: 31483
-12638: DATA: 24497
-12639: DATA: 16502
-12640: DATA: 9521
-12641: DATA: 1973
-12642: DATA: 26788
-12643: DATA: 19826
-12644: DATA: 11876
-12645: DATA: 4340
-12646: DATA: 30111
-12647: DATA: 22096
-12648: DATA: 15206
-12649: DATA: 7269
-12650: DATA: 32455
-12651: DATA: 25480
-12652: DATA: 17591
-12653: DATA: 10569
-12654: DATA: 2608
-12655: DATA: 28439
-12656: DATA: 20536
-12657: DATA: 13018
-12658: DATA: 6131
-12659: DATA: 30870
-12660: DATA: 23981
-12661: DATA: 15939
-12662: DATA: 9047
-12663: DATA: 1061
-12664: DATA: 26989
-12665: DATA: 18954
-12666: DATA: 12037
-12667: DATA: 4159
-12668: DATA: 30052
-12669: DATA: 22061
-12670: DATA: 15153
-12671: DATA: 7201
-12672: DATA: 316
-12673: DATA: 25211
-12674: DATA: 18261
-12675: DATA: 10291
-12676: DATA: 3371
-12677: DATA: 28223
-12678: DATA: 21252
-12679: DATA: 13325
-12680: DATA: 6417
-12681: DATA: 31350
-12682: DATA: 24415
-12683: DATA: 16472
-12684: DATA: 9648
-12685: DATA: 1685
-12686: DATA: 27540
-12687: DATA: 19664
-12688: DATA: 12341
-12689: DATA: 5382
-12690: DATA: 30308
-12691: DATA: 23346
-12692: DATA: 15504
-12693: DATA: 8607
-12694: DATA: 735
-12695: DATA: 26165
-12696: DATA: 19325
-12697: DATA: 11334
-12698: DATA: 4497
-12699: DATA: 29409
-12700: DATA: 22116
-12701: DATA: 15188
-12702: DATA: 7331
-12703: DATA: 505
-12704: DATA: 25909
-12705: DATA: 18043
-12706: DATA: 11188
-12707: DATA: 3303
-12708: DATA: 28688
-12709: DATA: 21861
-12710: DATA: 13973
-12711: DATA: 7045
-12712: DATA: 32625
-12713: DATA: 24740
-12714: DATA: 17859
-12715: DATA: 10521
-12716: DATA: 2788
-12717: DATA: 28632
-12718: DATA: 21373
-12719: DATA: 13463
-12720: DATA: 6197
-12721: DATA: 32091
-12722: DATA: 24315
-12723: DATA: 16912
-12724: DATA: 10145
-12725: DATA: 2243
-12726: DATA: 27716
-12727: DATA: 20901
-12728: DATA: 13691
-12729: DATA: 5763
-12730: DATA: 31312
-12731: DATA: 24505
-12732: DATA: 17196
-12733: DATA: 9400
-12734: DATA: 2160
-12735: DATA: 28086
-12736: DATA: 20795
-12737: DATA: 12963
-12738: DATA: 5685
-12739: DATA: 31741
-12740: DATA: 24368
-12741: DATA: 16546
-12742: DATA: 9223
-12743: DATA: 2432
-12744: DATA: 28006
-12745: DATA: 20214
-12746: DATA: 12816
-12747: DATA: 6082
-12748: DATA: 31666
-12749: DATA: 24344
-12750: DATA: 16610
-12751: DATA: 9237
-12752: DATA: 2093
-12753: DATA: 28058
-12754: DATA: 20837
-12755: DATA: 12947
-12756: DATA: 5860
-12757: DATA: 31309
-12758: DATA: 24569
-12759: DATA: 17329
-12760: DATA: 10036
-12761: DATA: 2261
-12762: DATA: 27778
-12763: DATA: 20578
-12764: DATA: 13344
-12765: DATA: 6632
-12766: DATA: 32179
-12767: DATA: 24944
-12768: DATA: 17703
-12769: DATA: 9909
-12770: DATA: 2737
-12771: DATA: 28221
-12772: DATA: 21047
-12773: DATA: 14304
-12774: DATA: 7057
-12775: DATA: 32585
-12776: DATA: 25464
-12777: DATA: 18277
-12778: DATA: 10439
-12779: DATA: 3212
-12780: DATA: 28848
-12781: DATA: 21592
-12782: DATA: 14434
-12783: DATA: 7187
-12784: DATA: 53
-12785: DATA: 26073
-12786: DATA: 18940
-12787: DATA: 11741
-12788: DATA: 4524
-12789: DATA: 30024
-12790: DATA: 22850
-12791: DATA: 15712
-12792: DATA: 8500
-12793: DATA: 1298
-12794: DATA: 26904
-12795: DATA: 19748
-12796: DATA: 12583
-12797: DATA: 5429
-12798: DATA: 31088
-12799: DATA: 23862
-12800: DATA: 16693
-12801: DATA: 9510
-12802: DATA: 2355
-12803: DATA: 27964
-12804: DATA: 20768
-12805: DATA: 13608
-12806: DATA: 6403
-12807: DATA: 32069
-12808: DATA: 24945
-12809: DATA: 17789
-12810: DATA: 10579
-12811: DATA: 3396
-12812: DATA: 29104
-12813: DATA: 21912
-12814: DATA: 14836
-12815: DATA: 7641
-12816: DATA: 45
-12817: DATA: 25685
-12818: DATA: 18553
-12819: DATA: 11347
-12820: DATA: 4272
-12821: DATA: 29826
-12822: DATA: 22672
-12823: DATA: 16164
-12824: DATA: 9012
-12825: DATA: 1877
-12826: DATA: 27551
-12827: DATA: 20450
-12828: DATA: 12840
-12829: DATA: 5683
-12830: DATA: 31445
-12831: DATA: 24315
-12832: DATA: 17723
-12833: DATA: 10599
-12834: DATA: 3492
-12835: DATA: 29173
-12836: DATA: 21569
-12837: DATA: 14462
-12838: DATA: 7327
-12839: DATA: 208
-12840: DATA: 26464
-12841: DATA: 19373
-12842: DATA: 12212
-12843: DATA: 4634
-12844: DATA: 30369
-12845: DATA: 23246
-12846: DATA: 16740
-12847: DATA: 9722
-12848: DATA: 2048
-12849: DATA: 27719
-12850: DATA: 20735
-12851: DATA: 14093
-12852: DATA: 7085
-12853: DATA: 32718
-12854: DATA: 25169
-12855: DATA: 18153
-12856: DATA: 11572
-12857: DATA: 4524
-12858: DATA: 29699
-12859: DATA: 22689
-12860: DATA: 16165
-12861: DATA: 9139
-12862: DATA: 1588
-12863: DATA: 27187
-12864: DATA: 20736
-12865: DATA: 13757
-12866: DATA: 6197
-12867: DATA: 31997
-12868: DATA: 25377
-12869: DATA: 18336
-12870: DATA: 10770
-12871: DATA: 3716
-12872: DATA: 30074
-12873: DATA: 23022
-12874: DATA: 15453
-12875: DATA: 8392
-12876: DATA: 1962
-12877: DATA: 27145
-12878: DATA: 20144
-12879: DATA: 13658
-12880: DATA: 6194
-12881: DATA: 31957
-12882: DATA: 25444
-12883: DATA: 18389
-12884: DATA: 10913
-12885: DATA: 4429
-12886: DATA: 30163
-12887: DATA: 22698
-12888: DATA: 16226
-12889: DATA: 9152
-12890: DATA: 1744
-12891: DATA: 28014
-12892: DATA: 20523
-12893: DATA: 13552
-12894: DATA: 7093
-12895: DATA: 32309
-12896: DATA: 25888
-12897: DATA: 18938
-12898: DATA: 11445
-12899: DATA: 4986
-12900: DATA: 30252
-12901: DATA: 23272
-12902: DATA: 16770
-12903: DATA: 9221
-12904: DATA: 2940
-12905: DATA: 28192
-12906: DATA: 21186
-12907: DATA: 14728
-12908: DATA: 7396
-12909: DATA: 841
-12910: DATA: 26239
-12911: DATA: 19797
-12912: DATA: 12333
-12913: DATA: 5338
-12914: DATA: 31717
-12915: DATA: 24207
-12916: DATA: 17892
-12917: DATA: 10312
-12918: DATA: 3921
-12919: DATA: 29302
-12920: DATA: 22880
-12921: DATA: 15429
-12922: DATA: 8977
-12923: DATA: 1571
-12924: DATA: 27936
-12925: DATA: 20605
-12926: DATA: 14119
-12927: DATA: 6704
-12928: DATA: 295
-12929: DATA: 25633
-12930: DATA: 19326
-12931: DATA: 11901
-12932: DATA: 5476
-12933: DATA: 30735
-12934: DATA: 24341
-12935: DATA: 16913
-12936: DATA: 10595
-12937: DATA: 3168
-12938: DATA: 29525
-12939: DATA: 22083
-12940: DATA: 15844
-12941: DATA: 8329
-12942: DATA: 2040
-12943: DATA: 27344
-12944: DATA: 20519
-12945: DATA: 14096
-12946: DATA: 6704
-12947: DATA: 329
-12948: DATA: 25765
-12949: DATA: 19329
-12950: DATA: 11996
-12951: DATA: 5221
-12952: DATA: 31590
-12953: DATA: 24138
-12954: DATA: 17811
-12955: DATA: 10470
-12956: DATA: 3684
-12957: DATA: 30075
-12958: DATA: 22705
-12959: DATA: 16374
-12960: DATA: 9521
-12961: DATA: 2150
-12962: DATA: 28668
-12963: DATA: 21181
-12964: DATA: 14384
-12965: DATA: 8037
-12966: DATA: 661
-12967: DATA: 27095
-12968: DATA: 20337
-12969: DATA: 13029
-12970: DATA: 6617
-12971: DATA: 32542
-12972: DATA: 25316
-12973: DATA: 18908
-12974: DATA: 12080
-12975: DATA: 4763
-12976: DATA: 30773
-12977: DATA: 24391
-12978: DATA: 17122
-12979: DATA: 10258
-12980: DATA: 4019
-12981: DATA: 29313
-12982: DATA: 22544
-12983: DATA: 16362
-12984: DATA: 9570
-12985: DATA: 2176
-12986: DATA: 28162
-12987: DATA: 21930
-12988: DATA: 15158
-12989: DATA: 7858
-12990: DATA: 1063
-12991: DATA: 27579
-12992: DATA: 20852
-12993: DATA: 13477
-12994: DATA: 6705
-12995: DATA: 425
-12996: DATA: 26412
-12997: DATA: 19181
-12998: DATA: 12316
-12999: DATA: 6016
-13000: DATA: 32117
-13001: DATA: 24801
-13002: DATA: 18009
-13003: DATA: 11715
-13004: DATA: 5027
-13005: DATA: 31069
-13006: DATA: 23806
-13007: DATA: 16986
-13008: DATA: 10278
-13009: DATA: 3969
-13010: DATA: 30072
-13011: DATA: 22675
-13012: DATA: 16100
-13013: DATA: 9293
-13014: DATA: 3049
-13015: DATA: 29098
-13016: DATA: 22369
-13017: DATA: 14981
-13018: DATA: 8344
-13019: DATA: 1640
-13020: DATA: 27685
-13021: DATA: 21487
-13022: DATA: 14832
-13023: DATA: 8034
-13024: DATA: 1333
-13025: DATA: 26851
-13026: DATA: 20149
-13027: DATA: 13422
-13028: DATA: 6756
-13029: DATA: 481
-13030: DATA: 26513
-13031: DATA: 19797
-13032: DATA: 13156
-13033: DATA: 6444
-13034: DATA: 31966
-13035: DATA: 25226
-13036: DATA: 18660
-13037: DATA: 11848
-13038: DATA: 5216
-13039: DATA: 31317
-13040: DATA: 24635
-13041: DATA: 18395
-13042: DATA: 11696
-13043: DATA: 5020
-13044: DATA: 31204
-13045: DATA: 24399
-13046: DATA: 17749
-13047: DATA: 11108
-13048: DATA: 4471
-13049: DATA: 30477
-13050: DATA: 23888
-13051: DATA: 17209
-13052: DATA: 10540
-13053: DATA: 3887
-13054: DATA: 30015
-13055: DATA: 23328
-13056: DATA: 16691
-13057: DATA: 10045
-13058: DATA: 3440
-13059: DATA: 29481
-13060: DATA: 22828
-13061: DATA: 16168
-13062: DATA: 9552
-13063: DATA: 2817
-13064: DATA: 29041
-13065: DATA: 22379
-13066: DATA: 15683
-13067: DATA: 9032
-13068: DATA: 2532
-13069: DATA: 28555
-13070: DATA: 22005
-13071: DATA: 15314
-13072: DATA: 8241
-13073: DATA: 1537
-13074: DATA: 27761
-13075: DATA: 21065
-13076: DATA: 14509
-13077: DATA: 7810
-13078: DATA: 1246
-13079: DATA: 28005
-13080: DATA: 21344
-13081: DATA: 14666
-13082: DATA: 8144
-13083: DATA: 1524
-13084: DATA: 27179
-13085: DATA: 20584
-13086: DATA: 13986
-13087: DATA: 7349
-13088: DATA: 1319
-13089: DATA: 27514
-13090: DATA: 20901
-13091: DATA: 14313
-13092: DATA: 7212
-13093: DATA: 547
-13094: DATA: 26869
-13095: DATA: 20171
-13096: DATA: 14203
-13097: DATA: 7607
-13098: DATA: 964
-13099: DATA: 26629
-13100: DATA: 20161
-13101: DATA: 13518
-13102: DATA: 7551
-13103: DATA: 896
-13104: DATA: 26656
-13105: DATA: 20061
-13106: DATA: 13471
-13107: DATA: 7465
-13108: DATA: 950
-13109: DATA: 27074
-13110: DATA: 20032
-13111: DATA: 13548
-13112: DATA: 7543
-13113: DATA: 900
-13114: DATA: 26652
-13115: DATA: 20205
-13116: DATA: 14093
-13117: DATA: 7598
-13118: DATA: 572
-13119: DATA: 26804
-13120: DATA: 20794
-13121: DATA: 14257
-13122: DATA: 7501
-13123: DATA: 644
-13124: DATA: 27435
-13125: DATA: 20920
-13126: DATA: 13904
-13127: DATA: 7300
-13128: DATA: 1382
-13129: DATA: 27616
-13130: DATA: 20496
-13131: DATA: 14018
-13132: DATA: 8106
-13133: DATA: 1117
-13134: DATA: 27377
-13135: DATA: 21269
-13136: DATA: 14394
-13137: DATA: 7828
-13138: DATA: 1890
-13139: DATA: 28111
-13140: DATA: 21163
-13141: DATA: 15130
-13142: DATA: 8592
-13143: DATA: 1717
-13144: DATA: 28533
-13145: DATA: 21969
-13146: DATA: 15000
-13147: DATA: 9005
-13148: DATA: 2086
-13149: DATA: 28408
-13150: DATA: 22436
-13151: DATA: 15458
-13152: DATA: 9521
-13153: DATA: 3056
-13154: DATA: 28862
-13155: DATA: 22845
-13156: DATA: 15920
-13157: DATA: 9466
-13158: DATA: 3487
-13159: DATA: 29189
-13160: DATA: 23399
-13161: DATA: 16433
-13162: DATA: 9941
-13163: DATA: 3976
-13164: DATA: 29876
-13165: DATA: 23837
-13166: DATA: 16994
-13167: DATA: 11034
-13168: DATA: 4151
-13169: DATA: 30430
-13170: DATA: 24496
-13171: DATA: 17563
-13172: DATA: 11685
-13173: DATA: 4686
-13174: DATA: 31573
-13175: DATA: 24694
-13176: DATA: 18740
-13177: DATA: 11794
-13178: DATA: 5912
-13179: DATA: 31780
-13180: DATA: 25895
-13181: DATA: 18997
-13182: DATA: 13168
-13183: DATA: 6201
-13184: DATA: 315
-13185: DATA: 26170
-13186: DATA: 20283
-13187: DATA: 13437
-13188: DATA: 7464
-13189: DATA: 548
-13190: DATA: 27419
-13191: DATA: 20480
-13192: DATA: 14644
-13193: DATA: 7793
-13194: DATA: 1880
-13195: DATA: 27720
-13196: DATA: 21949
-13197: DATA: 15069
-13198: DATA: 9208
-13199: DATA: 2260
-13200: DATA: 28706
-13201: DATA: 22800
-13202: DATA: 15920
-13203: DATA: 10079
-13204: DATA: 3233
-13205: DATA: 30088
-13206: DATA: 23262
-13207: DATA: 16997
-13208: DATA: 11132
-13209: DATA: 4160
-13210: DATA: 31106
-13211: DATA: 24296
-13212: DATA: 18020
-13213: DATA: 12155
-13214: DATA: 5311
-13215: DATA: 32231
-13216: DATA: 25972
-13217: DATA: 19041
-13218: DATA: 13240
-13219: DATA: 6386
-13220: DATA: 49
-13221: DATA: 27006
-13222: DATA: 20113
-13223: DATA: 14283
-13224: DATA: 8048
-13225: DATA: 1206
-13226: DATA: 28048
-13227: DATA: 21762
-13228: DATA: 15010
-13229: DATA: 9117
-13230: DATA: 2921
-13231: DATA: 28816
-13232: DATA: 22581
-13233: DATA: 16711
-13234: DATA: 9955
-13235: DATA: 3667
-13236: DATA: 30692
-13237: DATA: 23693
-13238: DATA: 17506
-13239: DATA: 11748
-13240: DATA: 5501
-13241: DATA: 31371
-13242: DATA: 25168
-13243: DATA: 19385
-13244: DATA: 13110
-13245: DATA: 6324
-13246: DATA: 51
-13247: DATA: 27070
-13248: DATA: 20792
-13249: DATA: 14000
-13250: DATA: 7715
-13251: DATA: 2045
-13252: DATA: 28448
-13253: DATA: 21666
-13254: DATA: 15367
-13255: DATA: 9611
-13256: DATA: 3380
-13257: DATA: 29425
-13258: DATA: 23128
-13259: DATA: 17375
-13260: DATA: 11179
-13261: DATA: 4872
-13262: DATA: 30967
-13263: DATA: 24669
-13264: DATA: 18548
-13265: DATA: 12673
-13266: DATA: 6520
-13267: DATA: 32472
-13268: DATA: 26340
-13269: DATA: 19995
-13270: DATA: 14293
-13271: DATA: 8098
-13272: DATA: 1905
-13273: DATA: 27857
-13274: DATA: 21649
-13275: DATA: 15481
-13276: DATA: 9261
-13277: DATA: 3570
-13278: DATA: 30142
-13279: DATA: 23861
-13280: DATA: 17717
-13281: DATA: 11003
-13282: DATA: 4788
-13283: DATA: 31293
-13284: DATA: 25129
-13285: DATA: 19426
-13286: DATA: 13187
-13287: DATA: 6998
-13288: DATA: 824
-13289: DATA: 27493
-13290: DATA: 20689
-13291: DATA: 14467
-13292: DATA: 8352
-13293: DATA: 2077
-13294: DATA: 28772
-13295: DATA: 22557
-13296: DATA: 16422
-13297: DATA: 10714
-13298: DATA: 4581
-13299: DATA: 31130
-13300: DATA: 25004
-13301: DATA: 18701
-13302: DATA: 12612
-13303: DATA: 6509
-13304: DATA: 369
-13305: DATA: 26949
-13306: DATA: 20764
-13307: DATA: 14632
-13308: DATA: 8485
-13309: DATA: 2347
-13310: DATA: 28981
-13311: DATA: 22822
-13312: DATA: 16756
-13313: DATA: 10540
-13314: DATA: 4415
-13315: DATA: 31016
-13316: DATA: 24932
-13317: DATA: 18734
-13318: DATA: 12561
-13319: DATA: 6411
-13320: DATA: 308
-13321: DATA: 26986
-13322: DATA: 20819
-13323: DATA: 14670
-13324: DATA: 8613
-13325: DATA: 2446
-13326: DATA: 29177
-13327: DATA: 23002
-13328: DATA: 16442
-13329: DATA: 10260
-13330: DATA: 4220
-13331: DATA: 30801
-13332: DATA: 24765
-13333: DATA: 18637
-13334: DATA: 12483
-13335: DATA: 6944
-13336: DATA: 881
-13337: DATA: 27397
-13338: DATA: 21393
-13339: DATA: 15277
-13340: DATA: 8759
-13341: DATA: 2673
-13342: DATA: 29369
-13343: DATA: 23267
-13344: DATA: 17713
-13345: DATA: 11623
-13346: DATA: 5616
-13347: DATA: 32242
-13348: DATA: 25634
-13349: DATA: 19501
-13350: DATA: 13468
-13351: DATA: 7372
-13352: DATA: 1907
-13353: DATA: 28589
-13354: DATA: 22468
-13355: DATA: 15949
-13356: DATA: 9900
-13357: DATA: 3784
-13358: DATA: 31102
-13359: DATA: 24977
-13360: DATA: 18470
-13361: DATA: 12368
-13362: DATA: 6388
-13363: DATA: 782
-13364: DATA: 27620
-13365: DATA: 21442
-13366: DATA: 14934
-13367: DATA: 8869
-13368: DATA: 3442
-13369: DATA: 30080
-13370: DATA: 23573
-13371: DATA: 17593
-13372: DATA: 12132
-13373: DATA: 6076
-13374: DATA: 32306
-13375: DATA: 26298
-13376: DATA: 20770
-13377: DATA: 14768
-13378: DATA: 8304
-13379: DATA: 2212
-13380: DATA: 29483
-13381: DATA: 23480
-13382: DATA: 16976
-13383: DATA: 10898
-13384: DATA: 5500
-13385: DATA: 32224
-13386: DATA: 25666
-13387: DATA: 19656
-13388: DATA: 14308
-13389: DATA: 7689
-13390: DATA: 1784
-13391: DATA: 29008
-13392: DATA: 22644
-13393: DATA: 16519
-13394: DATA: 11135
-13395: DATA: 5086
-13396: DATA: 31407
-13397: DATA: 25933
-13398: DATA: 19911
-13399: DATA: 13476
-13400: DATA: 8056
-13401: DATA: 1993
-13402: DATA: 28291
-13403: DATA: 22829
-13404: DATA: 16417
-13405: DATA: 10483
-13406: DATA: 5044
-13407: DATA: 31291
-13408: DATA: 25937
-13409: DATA: 19963
-13410: DATA: 13503
-13411: DATA: 8047
-13412: DATA: 1584
-13413: DATA: 28389
-13414: DATA: 23029
-13415: DATA: 16470
-13416: DATA: 11131
-13417: DATA: 4656
-13418: DATA: 31428
-13419: DATA: 25989
-13420: DATA: 19659
-13421: DATA: 14185
-13422: DATA: 7778
-13423: DATA: 2330
-13424: DATA: 28708
-13425: DATA: 22748
-13426: DATA: 17395
-13427: DATA: 10908
-13428: DATA: 5544
-13429: DATA: 31757
-13430: DATA: 26489
-13431: DATA: 20086
-13432: DATA: 14712
-13433: DATA: 8196
-13434: DATA: 2846
-13435: DATA: 29225
-13436: DATA: 23985
-13437: DATA: 17417
-13438: DATA: 12088
-13439: DATA: 5680
-13440: DATA: 372
-13441: DATA: 26683
-13442: DATA: 21297
-13443: DATA: 14895
-13444: DATA: 9526
-13445: DATA: 3106
-13446: DATA: 30471
-13447: DATA: 24133
-13448: DATA: 18788
-13449: DATA: 12388
-13450: DATA: 6980
-13451: DATA: 581
-13452: DATA: 28132
-13453: DATA: 21646
-13454: DATA: 16380
-13455: DATA: 9946
-13456: DATA: 4132
-13457: DATA: 31504
-13458: DATA: 25187
-13459: DATA: 19741
-13460: DATA: 13472
-13461: DATA: 8066
-13462: DATA: 1735
-13463: DATA: 28715
-13464: DATA: 23395
-13465: DATA: 16964
-13466: DATA: 11650
-13467: DATA: 5353
-13468: DATA: 32356
-13469: DATA: 26985
-13470: DATA: 20671
-13471: DATA: 15285
-13472: DATA: 9504
-13473: DATA: 3197
-13474: DATA: 30645
-13475: DATA: 24253
-13476: DATA: 18474
-13477: DATA: 13154
-13478: DATA: 6786
-13479: DATA: 1489
-13480: DATA: 28540
-13481: DATA: 22245
-13482: DATA: 16849
-13483: DATA: 11011
-13484: DATA: 4768
-13485: DATA: 32157
-13486: DATA: 26492
-13487: DATA: 20112
-13488: DATA: 14389
-13489: DATA: 9041
-13490: DATA: 2787
-13491: DATA: 29789
-13492: DATA: 24496
-13493: DATA: 18114
-13494: DATA: 12304
-13495: DATA: 7153
-13496: DATA: 1404
-13497: DATA: 27776
-13498: DATA: 22096
-13499: DATA: 16800
-13500: DATA: 11051
-13501: DATA: 4776
-13502: DATA: 31780
-13503: DATA: 26557
-13504: DATA: 20852
-13505: DATA: 14522
-13506: DATA: 8758
-13507: DATA: 3581
-13508: DATA: 30501
-13509: DATA: 24301
-13510: DATA: 18435
-13511: DATA: 13192
-13512: DATA: 7541
-13513: DATA: 1257
-13514: DATA: 28252
-13515: DATA: 22925
-13516: DATA: 17319
-13517: DATA: 11548
-13518: DATA: 5350
-13519: DATA: 32336
-13520: DATA: 26746
-13521: DATA: 21461
-13522: DATA: 15664
-13523: DATA: 9468
-13524: DATA: 3812
-13525: DATA: 30750
-13526: DATA: 25561
-13527: DATA: 19874
-13528: DATA: 14202
-13529: DATA: 7813
-13530: DATA: 2206
-13531: DATA: 29288
-13532: DATA: 23589
-13533: DATA: 18415
-13534: DATA: 12722
-13535: DATA: 7020
-13536: DATA: 1396
-13537: DATA: 27879
-13538: DATA: 22197
-13539: DATA: 16508
-13540: DATA: 10784
-13541: DATA: 5630
-13542: DATA: 32720
-13543: DATA: 26887
-13544: DATA: 21312
-13545: DATA: 15671
-13546: DATA: 9429
-13547: DATA: 3724
-13548: DATA: 30903
-13549: DATA: 25160
-13550: DATA: 19554
-13551: DATA: 13840
-13552: DATA: 8308
-13553: DATA: 3043
-13554: DATA: 30193
-13555: DATA: 24456
-13556: DATA: 18856
-13557: DATA: 13145
-13558: DATA: 7440
-13559: DATA: 1860
-13560: DATA: 29047
-13561: DATA: 23302
-13562: DATA: 17685
-13563: DATA: 12094
-13564: DATA: 6455
-13565: DATA: 895
-13566: DATA: 28028
-13567: DATA: 22389
-13568: DATA: 16694
-13569: DATA: 11040
-13570: DATA: 5412
-13571: DATA: 32637
-13572: DATA: 26912
-13573: DATA: 21284
-13574: DATA: 15638
-13575: DATA: 9987
-13576: DATA: 4465
-13577: DATA: 31607
-13578: DATA: 25941
-13579: DATA: 20291
-13580: DATA: 14768
-13581: DATA: 9181
-13582: DATA: 3576
-13583: DATA: 30676
-13584: DATA: 24634
-13585: DATA: 18961
-13586: DATA: 13415
-13587: DATA: 7759
-13588: DATA: 2221
-13589: DATA: 29337
-13590: DATA: 23769
-13591: DATA: 18731
-13592: DATA: 13171
-13593: DATA: 7429
-13594: DATA: 1944
-13595: DATA: 29164
-13596: DATA: 23095
-13597: DATA: 17469
-13598: DATA: 11955
-13599: DATA: 6375
-13600: DATA: 1339
-13601: DATA: 28518
-13602: DATA: 22947
-13603: DATA: 17400
-13604: DATA: 11296
-13605: DATA: 5677
-13606: DATA: 132
-13607: DATA: 27341
-13608: DATA: 22397
-13609: DATA: 16822
-13610: DATA: 11152
-13611: DATA: 5122
-13612: DATA: 32433
-13613: DATA: 26825
-13614: DATA: 21808
-13615: DATA: 16276
-13616: DATA: 10298
-13617: DATA: 4689
-13618: DATA: 31920
-13619: DATA: 26890
-13620: DATA: 21430
-13621: DATA: 15812
-13622: DATA: 9796
-13623: DATA: 4337
-13624: DATA: 32113
-13625: DATA: 26507
-13626: DATA: 20560
-13627: DATA: 15087
-13628: DATA: 9992
-13629: DATA: 4540
-13630: DATA: 31289
-13631: DATA: 25767
-13632: DATA: 20852
-13633: DATA: 15290
-13634: DATA: 9270
-13635: DATA: 3837
-13636: DATA: 31500
-13637: DATA: 26018
-13638: DATA: 19970
-13639: DATA: 14487
-13640: DATA: 9597
-13641: DATA: 4071
-13642: DATA: 30812
-13643: DATA: 25288
-13644: DATA: 20452
-13645: DATA: 14384
-13646: DATA: 8959
-13647: DATA: 3931
-13648: DATA: 30759
-13649: DATA: 25217
-13650: DATA: 20341
-13651: DATA: 14799
-13652: DATA: 8933
-13653: DATA: 3917
-13654: DATA: 31120
-13655: DATA: 25220
-13656: DATA: 20344
-13657: DATA: 14793
-13658: DATA: 8912
-13659: DATA: 3939
-13660: DATA: 30763
-13661: DATA: 25331
-13662: DATA: 20477
-13663: DATA: 14437
-13664: DATA: 9533
-13665: DATA: 4071
-13666: DATA: 30897
-13667: DATA: 25961
-13668: DATA: 20001
-13669: DATA: 14590
-13670: DATA: 9680
-13671: DATA: 3662
-13672: DATA: 31601
-13673: DATA: 25632
-13674: DATA: 20160
-13675: DATA: 15309
-13676: DATA: 9387
-13677: DATA: 4424
-13678: DATA: 31332
-13679: DATA: 26452
-13680: DATA: 20598
-13681: DATA: 15003
-13682: DATA: 10133
-13683: DATA: 4243
-13684: DATA: 32171
-13685: DATA: 26207
-13686: DATA: 21316
-13687: DATA: 15469
-13688: DATA: 10513
-13689: DATA: 4630
-13690: DATA: 32543
-13691: DATA: 26680
-13692: DATA: 21808
-13693: DATA: 15925
-13694: DATA: 11101
-13695: DATA: 5121
-13696: DATA: 294
-13697: DATA: 27194
-13698: DATA: 22304
-13699: DATA: 16436
-13700: DATA: 11559
-13701: DATA: 5676
-13702: DATA: 796
-13703: DATA: 27717
-13704: DATA: 22871
-13705: DATA: 16996
-13706: DATA: 12102
-13707: DATA: 6216
-13708: DATA: 1304
-13709: DATA: 28324
-13710: DATA: 23551
-13711: DATA: 17600
-13712: DATA: 12404
-13713: DATA: 7430
-13714: DATA: 1636
-13715: DATA: 29532
-13716: DATA: 23722
-13717: DATA: 18825
-13718: DATA: 12944
-13719: DATA: 7716
-13720: DATA: 2912
-13721: DATA: 29701
-13722: DATA: 24964
-13723: DATA: 19173
-13724: DATA: 13857
-13725: DATA: 9021
-13726: DATA: 3253
-13727: DATA: 31227
-13728: DATA: 25888
-13729: DATA: 20071
-13730: DATA: 15281
-13731: DATA: 9459
-13732: DATA: 4135
-13733: DATA: 32104
-13734: DATA: 26320
-13735: DATA: 21457
-13736: DATA: 16251
-13737: DATA: 10469
-13738: DATA: 5585
-13739: DATA: 333
-13740: DATA: 27306
-13741: DATA: 22492
-13742: DATA: 17252
-13743: DATA: 11392
-13744: DATA: 6182
-13745: DATA: 1364
-13746: DATA: 28412
-13747: DATA: 23133
-13748: DATA: 18343
-13749: DATA: 12492
-13750: DATA: 7238
-13751: DATA: 2528
-13752: DATA: 30004
-13753: DATA: 24210
-13754: DATA: 18968
-13755: DATA: 14244
-13756: DATA: 8999
-13757: DATA: 3253
-13758: DATA: 30832
-13759: DATA: 26041
-13760: DATA: 20795
-13761: DATA: 15034
-13762: DATA: 9787
-13763: DATA: 5038
-13764: DATA: 32612
-13765: DATA: 26785
-13766: DATA: 21529
-13767: DATA: 16782
-13768: DATA: 11633
-13769: DATA: 5797
-13770: DATA: 601
-13771: DATA: 28633
-13772: DATA: 23524
-13773: DATA: 18197
-13774: DATA: 12529
-13775: DATA: 7238
-13776: DATA: 2106
-13777: DATA: 30162
-13778: DATA: 24932
-13779: DATA: 19101
-13780: DATA: 13990
-13781: DATA: 8712
-13782: DATA: 4053
-13783: DATA: 31659
-13784: DATA: 26420
-13785: DATA: 20691
-13786: DATA: 15513
-13787: DATA: 10366
-13788: DATA: 5165
-13789: DATA: 489
-13790: DATA: 28085
-13791: DATA: 22897
-13792: DATA: 17780
-13793: DATA: 12028
-13794: DATA: 6846
-13795: DATA: 1597
-13796: DATA: 29237
-13797: DATA: 24568
-13798: DATA: 19353
-13799: DATA: 14161
-13800: DATA: 9073
-13801: DATA: 3941
-13802: DATA: 30915
-13803: DATA: 25730
-13804: DATA: 20649
-13805: DATA: 15448
-13806: DATA: 10288
-13807: DATA: 5121
-13808: DATA: 61
-13809: DATA: 28120
-13810: DATA: 23029
-13811: DATA: 17875
-13812: DATA: 12772
-13813: DATA: 7437
-13814: DATA: 2428
-13815: DATA: 30060
-13816: DATA: 24947
-13817: DATA: 19725
-13818: DATA: 14596
-13819: DATA: 9581
-13820: DATA: 4404
-13821: DATA: 32050
-13822: DATA: 26917
-13823: DATA: 21799
-13824: DATA: 16679
-13825: DATA: 11637
-13826: DATA: 6457
-13827: DATA: 1331
-13828: DATA: 29028
-13829: DATA: 23865
-13830: DATA: 18712
-13831: DATA: 13591
-13832: DATA: 8571
-13833: DATA: 3440
-13834: DATA: 31063
-13835: DATA: 25925
-13836: DATA: 20964
-13837: DATA: 15753
-13838: DATA: 10744
-13839: DATA: 5584
-13840: DATA: 116
-13841: DATA: 27674
-13842: DATA: 22624
-13843: DATA: 17496
-13844: DATA: 12458
-13845: DATA: 7300
-13846: DATA: 2270
-13847: DATA: 30498
-13848: DATA: 25396
-13849: DATA: 20305
-13850: DATA: 15263
-13851: DATA: 10157
-13852: DATA: 4656
-13853: DATA: 32373
-13854: DATA: 27317
-13855: DATA: 22197
-13856: DATA: 17703
-13857: DATA: 12666
-13858: DATA: 7589
-13859: DATA: 2537
-13860: DATA: 29740
-13861: DATA: 24609
-13862: DATA: 19664
-13863: DATA: 14546
-13864: DATA: 10108
-13865: DATA: 5036
-13866: DATA: 32732
-13867: DATA: 27144
-13868: DATA: 22244
-13869: DATA: 17115
-13870: DATA: 12665
-13871: DATA: 7559
-13872: DATA: 2097
-13873: DATA: 29779
-13874: DATA: 24828
-13875: DATA: 20244
-13876: DATA: 15265
-13877: DATA: 10206
-13878: DATA: 4624
-13879: DATA: 32489
-13880: DATA: 28029
-13881: DATA: 22914
-13882: DATA: 17432
-13883: DATA: 12473
-13884: DATA: 8036
-13885: DATA: 2985
-13886: DATA: 30264
-13887: DATA: 25264
-13888: DATA: 20852
-13889: DATA: 15781
-13890: DATA: 10289
-13891: DATA: 5289
-13892: DATA: 812
-13893: DATA: 28653
-13894: DATA: 23062
-13895: DATA: 18064
-13896: DATA: 13670
-13897: DATA: 8689
-13898: DATA: 3160
-13899: DATA: 30920
-13900: DATA: 26550
-13901: DATA: 21085
-13902: DATA: 16121
-13903: DATA: 11611
-13904: DATA: 6176
-13905: DATA: 1178
-13906: DATA: 29488
-13907: DATA: 24521
-13908: DATA: 19116
-13909: DATA: 14600
-13910: DATA: 9616
-13911: DATA: 4262
-13912: DATA: 32629
-13913: DATA: 27603
-13914: DATA: 22165
-13915: DATA: 17709
-13916: DATA: 12336
-13917: DATA: 7410
-13918: DATA: 3056
-13919: DATA: 30305
-13920: DATA: 25916
-13921: DATA: 20976
-13922: DATA: 15600
-13923: DATA: 11123
-13924: DATA: 5675
-13925: DATA: 767
-13926: DATA: 29060
-13927: DATA: 23629
-13928: DATA: 19258
-13929: DATA: 13888
-13930: DATA: 8926
-13931: DATA: 4482
-13932: DATA: 31926
-13933: DATA: 27465
-13934: DATA: 22136
-13935: DATA: 17776
-13936: DATA: 12327
-13937: DATA: 7386
-13938: DATA: 3045
-13939: DATA: 30345
-13940: DATA: 26028
-13941: DATA: 20512
-13942: DATA: 16228
-13943: DATA: 10871
-13944: DATA: 6523
-13945: DATA: 1045
-13946: DATA: 29465
-13947: DATA: 24110
-13948: DATA: 19749
-13949: DATA: 14385
-13950: DATA: 10096
-13951: DATA: 4630
-13952: DATA: 309
-13953: DATA: 27683
-13954: DATA: 23349
-13955: DATA: 17959
-13956: DATA: 13570
-13957: DATA: 8228
-13958: DATA: 3842
-13959: DATA: 31232
-13960: DATA: 26994
-13961: DATA: 21609
-13962: DATA: 17241
-13963: DATA: 11848
-13964: DATA: 7607
-13965: DATA: 2269
-13966: DATA: 30691
-13967: DATA: 25305
-13968: DATA: 20539
-13969: DATA: 16130
-13970: DATA: 10876
-13971: DATA: 6468
-13972: DATA: 1252
-13973: DATA: 29577
-13974: DATA: 24258
-13975: DATA: 19500
-13976: DATA: 15218
-13977: DATA: 9809
-13978: DATA: 5584
-13979: DATA: 236
-13980: DATA: 28214
-13981: DATA: 23922
-13982: DATA: 18597
-13983: DATA: 14331
-13984: DATA: 9520
-13985: DATA: 4149
-13986: DATA: 32681
-13987: DATA: 27378
-13988: DATA: 22577
-13989: DATA: 18221
-13990: DATA: 12945
-13991: DATA: 8651
-13992: DATA: 3952
-13993: DATA: 31461
-13994: DATA: 27100
-13995: DATA: 22276
-13996: DATA: 17059
-13997: DATA: 12757
-13998: DATA: 8036
-13999: DATA: 2773
-14000: DATA: 30752
-14001: DATA: 26461
-14002: DATA: 21237
-14003: DATA: 16477
-14004: DATA: 12208
-14005: DATA: 6872
-14006: DATA: 2142
-14007: DATA: 30699
-14008: DATA: 25969
-14009: DATA: 20617
-14010: DATA: 15964
-14011: DATA: 11757
-14012: DATA: 6963
-14013: DATA: 1717
-14014: DATA: 29753
-14015: DATA: 25526
-14016: DATA: 20796
-14017: DATA: 15605
-14018: DATA: 10787
-14019: DATA: 6584
-14020: DATA: 1825
-14021: DATA: 29344
-14022: DATA: 24579
-14023: DATA: 20421
-14024: DATA: 15712
-14025: DATA: 10474
-14026: DATA: 5648
-14027: DATA: 1482
-14028: DATA: 29601
-14029: DATA: 24841
-14030: DATA: 19632
-14031: DATA: 14935
-14032: DATA: 10278
-14033: DATA: 6044
-14034: DATA: 1399
-14035: DATA: 28885
-14036: DATA: 24240
-14037: DATA: 19464
-14038: DATA: 15298
-14039: DATA: 10725
-14040: DATA: 5984
-14041: DATA: 714
-14042: DATA: 28880
-14043: DATA: 24185
-14044: DATA: 19500
-14045: DATA: 15352
-14046: DATA: 10736
-14047: DATA: 5990
-14048: DATA: 1339
-14049: DATA: 28896
-14050: DATA: 24228
-14051: DATA: 19573
-14052: DATA: 14952
-14053: DATA: 10669
-14054: DATA: 6034
-14055: DATA: 1360
-14056: DATA: 29536
-14057: DATA: 24933
-14058: DATA: 19668
-14059: DATA: 14980
-14060: DATA: 10409
-14061: DATA: 5712
-14062: DATA: 1141
-14063: DATA: 29191
-14064: DATA: 24692
-14065: DATA: 20417
-14066: DATA: 15871
-14067: DATA: 11229
-14068: DATA: 6576
-14069: DATA: 1861
-14070: DATA: 30037
-14071: DATA: 25381
-14072: DATA: 20858
-14073: DATA: 16138
-14074: DATA: 11522
-14075: DATA: 6969
-14076: DATA: 2348
-14077: DATA: 30579
-14078: DATA: 25941
-14079: DATA: 21307
-14080: DATA: 16699
-14081: DATA: 12071
-14082: DATA: 7460
-14083: DATA: 2869
-14084: DATA: 31041
-14085: DATA: 26430
-14086: DATA: 21791
-14087: DATA: 17168
-14088: DATA: 12640
-14089: DATA: 8045
-14090: DATA: 3389
-14091: DATA: 31609
-14092: DATA: 27062
-14093: DATA: 22418
-14094: DATA: 17888
-14095: DATA: 13276
-14096: DATA: 8247
-14097: DATA: 3604
-14098: DATA: 31868
-14099: DATA: 27165
-14100: DATA: 22663
-14101: DATA: 18060
-14102: DATA: 13510
-14103: DATA: 9504
-14104: DATA: 4694
-14105: DATA: 369
-14106: DATA: 28568
-14107: DATA: 24040
-14108: DATA: 19044
-14109: DATA: 14462
-14110: DATA: 9905
-14111: DATA: 5347
-14112: DATA: 1329
-14113: DATA: 29493
-14114: DATA: 25017
-14115: DATA: 20462
-14116: DATA: 15460
-14117: DATA: 10860
-14118: DATA: 6352
-14119: DATA: 1737
-14120: DATA: 30589
-14121: DATA: 26033
-14122: DATA: 21444
-14123: DATA: 16385
-14124: DATA: 11937
-14125: DATA: 7325
-14126: DATA: 3431
-14127: DATA: 31644
-14128: DATA: 26672
-14129: DATA: 22096
-14130: DATA: 17634
-14131: DATA: 13661
-14132: DATA: 9132
-14133: DATA: 4552
-14134: DATA: 32322
-14135: DATA: 27872
-14136: DATA: 23866
-14137: DATA: 19397
-14138: DATA: 14416
-14139: DATA: 9876
-14140: DATA: 5931
-14141: DATA: 1448
-14142: DATA: 29296
-14143: DATA: 24755
-14144: DATA: 20797
-14145: DATA: 16315
-14146: DATA: 11316
-14147: DATA: 6909
-14148: DATA: 2864
-14149: DATA: 31141
-14150: DATA: 26133
-14151: DATA: 21701
-14152: DATA: 17783
-14153: DATA: 13290
-14154: DATA: 8274
-14155: DATA: 3802
-14156: DATA: 32673
-14157: DATA: 27679
-14158: DATA: 23229
-14159: DATA: 19280
-14160: DATA: 14394
-14161: DATA: 9878
-14162: DATA: 5986
-14163: DATA: 1480
-14164: DATA: 29367
-14165: DATA: 25369
-14166: DATA: 20949
-14167: DATA: 16033
-14168: DATA: 12084
-14169: DATA: 7639
-14170: DATA: 2709
-14171: DATA: 31584
-14172: DATA: 26661
-14173: DATA: 22260
-14174: DATA: 18366
-14175: DATA: 13414
-14176: DATA: 9588
-14177: DATA: 5114
-14178: DATA: 182
-14179: DATA: 28989
-14180: DATA: 24101
-14181: DATA: 19629
-14182: DATA: 15747
-14183: DATA: 10824
-14184: DATA: 7029
-14185: DATA: 2089
-14186: DATA: 30428
-14187: DATA: 26573
-14188: DATA: 21671
-14189: DATA: 17756
-14190: DATA: 12925
-14191: DATA: 8965
-14192: DATA: 4216
-14193: DATA: 32405
-14194: DATA: 28657
-14195: DATA: 23699
-14196: DATA: 19872
-14197: DATA: 14861
-14198: DATA: 11089
-14199: DATA: 6249
-14200: DATA: 2400
-14201: DATA: 30221
-14202: DATA: 26399
-14203: DATA: 21560
-14204: DATA: 17699
-14205: DATA: 12853
-14206: DATA: 9072
-14207: DATA: 4140
-14208: DATA: 315
-14209: DATA: 28192
-14210: DATA: 24432
-14211: DATA: 19513
-14212: DATA: 15659
-14213: DATA: 10787
-14214: DATA: 6999
-14215: DATA: 2065
-14216: DATA: 31028
-14217: DATA: 26230
-14218: DATA: 22341
-14219: DATA: 17502
-14220: DATA: 13748
-14221: DATA: 8856
-14222: DATA: 5107
-14223: DATA: 193
-14224: DATA: 28788
-14225: DATA: 24833
-14226: DATA: 20088
-14227: DATA: 16216
-14228: DATA: 11492
-14229: DATA: 7567
-14230: DATA: 2754
-14231: DATA: 31274
-14232: DATA: 27519
-14233: DATA: 22592
-14234: DATA: 18846
-14235: DATA: 13997
-14236: DATA: 9780
-14237: DATA: 6004
-14238: DATA: 1205
-14239: DATA: 30198
-14240: DATA: 25905
-14241: DATA: 21094
-14242: DATA: 17392
-14243: DATA: 12530
-14244: DATA: 8226
-14245: DATA: 4397
-14246: DATA: 32388
-14247: DATA: 28612
-14248: DATA: 24438
-14249: DATA: 19625
-14250: DATA: 15829
-14251: DATA: 11550
-14252: DATA: 6884
-14253: DATA: 3036
-14254: DATA: 31614
-14255: DATA: 26769
-14256: DATA: 22644
-14257: DATA: 18774
-14258: DATA: 14072
-14259: DATA: 9756
-14260: DATA: 6061
-14261: DATA: 1247
-14262: DATA: 29763
-14263: DATA: 26021
-14264: DATA: 21859
-14265: DATA: 17036
-14266: DATA: 12828
-14267: DATA: 9121
-14268: DATA: 4964
-14269: DATA: 173
-14270: DATA: 28706
-14271: DATA: 25018
-14272: DATA: 20770
-14273: DATA: 16048
-14274: DATA: 11888
-14275: DATA: 8104
-14276: DATA: 3895
-14277: DATA: 31912
-14278: DATA: 27670
-14279: DATA: 23952
-14280: DATA: 19832
-14281: DATA: 15013
-14282: DATA: 10820
-14283: DATA: 7106
-14284: DATA: 3044
-14285: DATA: 31492
-14286: DATA: 26879
-14287: DATA: 22592
-14288: DATA: 18470
-14289: DATA: 14805
-14290: DATA: 10593
-14291: DATA: 5832
-14292: DATA: 1697
-14293: DATA: 30238
-14294: DATA: 26564
-14295: DATA: 22505
-14296: DATA: 18228
-14297: DATA: 13521
-14298: DATA: 9368
-14299: DATA: 5224
-14300: DATA: 1124
-14301: DATA: 30203
-14302: DATA: 26041
-14303: DATA: 21863
-14304: DATA: 17713
-14305: DATA: 13043
-14306: DATA: 8892
-14307: DATA: 4724
-14308: DATA: 545
-14309: DATA: 29694
-14310: DATA: 25552
-14311: DATA: 21334
-14312: DATA: 17265
-14313: DATA: 13088
-14314: DATA: 8413
-14315: DATA: 4301
-14316: DATA: 176
-14317: DATA: 28754
-14318: DATA: 24624
-14319: DATA: 20505
-14320: DATA: 16445
-14321: DATA: 12766
-14322: DATA: 8693
-14323: DATA: 4573
-14324: DATA: 433
-14325: DATA: 29022
-14326: DATA: 24921
-14327: DATA: 20843
-14328: DATA: 16755
-14329: DATA: 12613
-14330: DATA: 8452
-14331: DATA: 4389
-14332: DATA: 289
-14333: DATA: 29053
-14334: DATA: 24884
-14335: DATA: 20784
-14336: DATA: 16694
-14337: DATA: 12583
-14338: DATA: 8505
-14339: DATA: 4398
-14340: DATA: 356
-14341: DATA: 28972
-14342: DATA: 24835
-14343: DATA: 20805
-14344: DATA: 16757
-14345: DATA: 12581
-14346: DATA: 8515
-14347: DATA: 4421
-14348: DATA: 417
-14349: DATA: 29073
-14350: DATA: 25060
-14351: DATA: 20944
-14352: DATA: 16422
-14353: DATA: 12379
-14354: DATA: 8240
-14355: DATA: 4125
-14356: DATA: 133
-14357: DATA: 28877
-14358: DATA: 24768
-14359: DATA: 21284
-14360: DATA: 17255
-14361: DATA: 13142
-14362: DATA: 9105
-14363: DATA: 5098
-14364: DATA: 545
-14365: DATA: 29290
-14366: DATA: 25265
-14367: DATA: 21228
-14368: DATA: 17780
-14369: DATA: 13689
-14370: DATA: 9653
-14371: DATA: 5628
-14372: DATA: 1056
-14373: DATA: 29822
-14374: DATA: 25808
-14375: DATA: 21707
-14376: DATA: 18299
-14377: DATA: 14263
-14378: DATA: 10180
-14379: DATA: 5637
-14380: DATA: 1764
-14381: DATA: 30428
-14382: DATA: 27006
-14383: DATA: 22929
-14384: DATA: 18548
-14385: DATA: 14406
-14386: DATA: 10495
-14387: DATA: 6920
-14388: DATA: 2992
-14389: DATA: 31685
-14390: DATA: 27164
-14391: DATA: 23205
-14392: DATA: 19829
-14393: DATA: 15755
-14394: DATA: 11284
-14395: DATA: 7405
-14396: DATA: 3888
-14397: DATA: 32693
-14398: DATA: 28213
-14399: DATA: 24231
-14400: DATA: 20785
-14401: DATA: 16885
-14402: DATA: 12345
-14403: DATA: 8366
-14404: DATA: 4964
-14405: DATA: 940
-14406: DATA: 29214
-14407: DATA: 25285
-14408: DATA: 21877
-14409: DATA: 17897
-14410: DATA: 13395
-14411: DATA: 9410
-14412: DATA: 6066
-14413: DATA: 1560
-14414: DATA: 30384
-14415: DATA: 26945
-14416: DATA: 22587
-14417: DATA: 18645
-14418: DATA: 15204
-14419: DATA: 11221
-14420: DATA: 6817
-14421: DATA: 3405
-14422: DATA: 32213
-14423: DATA: 27812
-14424: DATA: 24423
-14425: DATA: 20433
-14426: DATA: 16094
-14427: DATA: 12552
-14428: DATA: 8234
-14429: DATA: 4338
-14430: DATA: 930
-14431: DATA: 29281
-14432: DATA: 25916
-14433: DATA: 21904
-14434: DATA: 17571
-14435: DATA: 14194
-14436: DATA: 9777
-14437: DATA: 5881
-14438: DATA: 2456
-14439: DATA: 30753
-14440: DATA: 27505
-14441: DATA: 23076
-14442: DATA: 19139
-14443: DATA: 15769
-14444: DATA: 11472
-14445: DATA: 8041
-14446: DATA: 3682
-14447: DATA: 282
-14448: DATA: 28708
-14449: DATA: 24796
-14450: DATA: 21491
-14451: DATA: 17052
-14452: DATA: 13736
-14453: DATA: 9229
-14454: DATA: 6003
-14455: DATA: 1636
-14456: DATA: 31074
-14457: DATA: 26624
-14458: DATA: 23376
-14459: DATA: 18956
-14460: DATA: 15656
-14461: DATA: 11326
-14462: DATA: 7999
-14463: DATA: 3619
-14464: DATA: 305
-14465: DATA: 28918
-14466: DATA: 25361
-14467: DATA: 21033
-14468: DATA: 17764
-14469: DATA: 13369
-14470: DATA: 10008
-14471: DATA: 5632
-14472: DATA: 2356
-14473: DATA: 30823
-14474: DATA: 27473
-14475: DATA: 23118
-14476: DATA: 19887
-14477: DATA: 15581
-14478: DATA: 12287
-14479: DATA: 7891
-14480: DATA: 4212
-14481: DATA: 769
-14482: DATA: 29304
-14483: DATA: 25940
-14484: DATA: 21687
-14485: DATA: 18381
-14486: DATA: 14033
-14487: DATA: 10281
-14488: DATA: 7031
-14489: DATA: 2634
-14490: DATA: 32134
-14491: DATA: 27880
-14492: DATA: 24168
-14493: DATA: 20797
-14494: DATA: 16548
-14495: DATA: 13309
-14496: DATA: 9521
-14497: DATA: 5223
-14498: DATA: 1973
-14499: DATA: 30397
-14500: DATA: 26669
-14501: DATA: 23422
-14502: DATA: 19152
-14503: DATA: 15812
-14504: DATA: 12084
-14505: DATA: 7862
-14506: DATA: 4573
-14507: DATA: 780
-14508: DATA: 29352
-14509: DATA: 26065
-14510: DATA: 22320
-14511: DATA: 18049
-14512: DATA: 14389
-14513: DATA: 11095
-14514: DATA: 6908
-14515: DATA: 3096
-14516: DATA: 32744
-14517: DATA: 28301
-14518: DATA: 24657
-14519: DATA: 21413
-14520: DATA: 17783
-14521: DATA: 13453
-14522: DATA: 9745
-14523: DATA: 6564
-14524: DATA: 2870
-14525: DATA: 31473
-14526: DATA: 27760
-14527: DATA: 24500
-14528: DATA: 20794
-14529: DATA: 16561
-14530: DATA: 12912
-14531: DATA: 9660
-14532: DATA: 5988
-14533: DATA: 1711
-14534: DATA: 30722
-14535: DATA: 27530
-14536: DATA: 23935
-14537: DATA: 19680
-14538: DATA: 15966
-14539: DATA: 12685
-14540: DATA: 9128
-14541: DATA: 5404
-14542: DATA: 1278
-14543: DATA: 30273
-14544: DATA: 26673
-14545: DATA: 23431
-14546: DATA: 19838
-14547: DATA: 15507
-14548: DATA: 12004
-14549: DATA: 8269
-14550: DATA: 5113
-14551: DATA: 1457
-14552: DATA: 30516
-14553: DATA: 26313
-14554: DATA: 22687
-14555: DATA: 19042
-14556: DATA: 15407
-14557: DATA: 12270
-14558: DATA: 8688
-14559: DATA: 4985
-14560: DATA: 1341
-14561: DATA: 29950
-14562: DATA: 26293
-14563: DATA: 22589
-14564: DATA: 18992
-14565: DATA: 15845
-14566: DATA: 12185
-14567: DATA: 8534
-14568: DATA: 4916
-14569: DATA: 1334
-14570: DATA: 29888
-14571: DATA: 26252
-14572: DATA: 22695
-14573: DATA: 19032
-14574: DATA: 15408
-14575: DATA: 11778
-14576: DATA: 8245
-14577: DATA: 5062
-14578: DATA: 1456
-14579: DATA: 30600
-14580: DATA: 27063
-14581: DATA: 23368
-14582: DATA: 19796
-14583: DATA: 16165
-14584: DATA: 12665
-14585: DATA: 8976
-14586: DATA: 5395
-14587: DATA: 1829
-14588: DATA: 31076
-14589: DATA: 27440
-14590: DATA: 23871
-14591: DATA: 20263
-14592: DATA: 16689
-14593: DATA: 13173
-14594: DATA: 9506
-14595: DATA: 5944
-14596: DATA: 2343
-14597: DATA: 31528
-14598: DATA: 27934
-14599: DATA: 24337
-14600: DATA: 20856
-14601: DATA: 17276
-14602: DATA: 13584
-14603: DATA: 10073
-14604: DATA: 6572
-14605: DATA: 2972
-14606: DATA: 32254
-14607: DATA: 28565
-14608: DATA: 24608
-14609: DATA: 21021
-14610: DATA: 17525
-14611: DATA: 13853
-14612: DATA: 10407
-14613: DATA: 6796
-14614: DATA: 3293
-14615: DATA: 309
-14616: DATA: 29492
-14617: DATA: 25937
-14618: DATA: 22431
-14619: DATA: 18861
-14620: DATA: 14896
-14621: DATA: 11381
-14622: DATA: 7861
-14623: DATA: 4277
-14624: DATA: 1315
-14625: DATA: 30576
-14626: DATA: 27043
-14627: DATA: 23529
-14628: DATA: 19562
-14629: DATA: 15881
-14630: DATA: 12423
-14631: DATA: 8896
-14632: DATA: 5991
-14633: DATA: 2481
-14634: DATA: 31677
-14635: DATA: 27705
-14636: DATA: 24246
-14637: DATA: 20690
-14638: DATA: 17760
-14639: DATA: 14236
-14640: DATA: 10295
-14641: DATA: 6740
-14642: DATA: 3324
-14643: DATA: 349
-14644: DATA: 29575
-14645: DATA: 26060
-14646: DATA: 22086
-14647: DATA: 18656
-14648: DATA: 15740
-14649: DATA: 12209
-14650: DATA: 8216
-14651: DATA: 4772
-14652: DATA: 1847
-14653: DATA: 31229
-14654: DATA: 27172
-14655: DATA: 23712
-14656: DATA: 20794
-14657: DATA: 17339
-14658: DATA: 13365
-14659: DATA: 9905
-14660: DATA: 7012
-14661: DATA: 3518
-14662: DATA: 32284
-14663: DATA: 28810
-14664: DATA: 25956
-14665: DATA: 22496
-14666: DATA: 18499
-14667: DATA: 14989
-14668: DATA: 12192
-14669: DATA: 8216
-14670: DATA: 4853
-14671: DATA: 1861
-14672: DATA: 30769
-14673: DATA: 27271
-14674: DATA: 24368
-14675: DATA: 20936
-14676: DATA: 17066
-14677: DATA: 14089
-14678: DATA: 10709
-14679: DATA: 6839
-14680: DATA: 3955
-14681: DATA: 471
-14682: DATA: 29343
-14683: DATA: 26488
-14684: DATA: 22570
-14685: DATA: 19193
-14686: DATA: 16368
-14687: DATA: 12385
-14688: DATA: 9531
-14689: DATA: 6069
-14690: DATA: 2212
-14691: DATA: 32117
-14692: DATA: 28193
-14693: DATA: 24749
-14694: DATA: 21918
-14695: DATA: 17994
-14696: DATA: 15206
-14697: DATA: 11313
-14698: DATA: 7896
-14699: DATA: 5057
-14700: DATA: 1252
-14701: DATA: 31071
-14702: DATA: 27237
-14703: DATA: 24321
-14704: DATA: 20596
-14705: DATA: 17089
-14706: DATA: 14328
-14707: DATA: 10392
-14708: DATA: 7652
-14709: DATA: 3659
-14710: DATA: 857
-14711: DATA: 29815
-14712: DATA: 26993
-14713: DATA: 23043
-14714: DATA: 20252
-14715: DATA: 16420
-14716: DATA: 13601
-14717: DATA: 9774
-14718: DATA: 7024
-14719: DATA: 3124
-14720: DATA: 294
-14721: DATA: 29232
-14722: DATA: 26480
-14723: DATA: 22588
-14724: DATA: 19752
-14725: DATA: 15905
-14726: DATA: 13136
-14727: DATA: 9220
-14728: DATA: 6502
-14729: DATA: 2666
-14730: DATA: 32581
-14731: DATA: 28739
-14732: DATA: 26016
-14733: DATA: 22237
-14734: DATA: 19428
-14735: DATA: 15578
-14736: DATA: 12404
-14737: DATA: 9497
-14738: DATA: 5753
-14739: DATA: 2906
-14740: DATA: 31916
-14741: DATA: 29081
-14742: DATA: 25232
-14743: DATA: 22076
-14744: DATA: 19323
-14745: DATA: 15440
-14746: DATA: 12674
-14747: DATA: 8877
-14748: DATA: 5684
-14749: DATA: 2940
-14750: DATA: 31908
-14751: DATA: 29181
-14752: DATA: 25978
-14753: DATA: 22032
-14754: DATA: 19390
-14755: DATA: 15602
-14756: DATA: 12342
-14757: DATA: 9593
-14758: DATA: 5784
-14759: DATA: 2976
-14760: DATA: 32615
-14761: DATA: 28842
-14762: DATA: 26053
-14763: DATA: 22809
-14764: DATA: 19116
-14765: DATA: 16311
-14766: DATA: 13126
-14767: DATA: 9364
-14768: DATA: 6177
-14769: DATA: 3417
-14770: DATA: 32484
-14771: DATA: 29277
-14772: DATA: 26504
-14773: DATA: 22722
-14774: DATA: 19539
-14775: DATA: 16878
-14776: DATA: 13716
-14777: DATA: 9916
-14778: DATA: 6687
-14779: DATA: 4024
-14780: DATA: 868
-14781: DATA: 29884
-14782: DATA: 26658
-14783: DATA: 23984
-14784: DATA: 20852
-14785: DATA: 17084
-14786: DATA: 13886
-14787: DATA: 11261
-14788: DATA: 7973
-14789: DATA: 4333
-14790: DATA: 1047
-14791: DATA: 31127
-14792: DATA: 28029
-14793: DATA: 24289
-14794: DATA: 21008
-14795: DATA: 18370
-14796: DATA: 15266
-14797: DATA: 12125
-14798: DATA: 8418
-14799: DATA: 5210
-14800: DATA: 2107
-14801: DATA: 32152
-14802: DATA: 29027
-14803: DATA: 25245
-14804: DATA: 22192
-14805: DATA: 18949
-14806: DATA: 16337
-14807: DATA: 13233
-14808: DATA: 10036
-14809: DATA: 6342
-14810: DATA: 3231
-14811: DATA: 99
-14812: DATA: 29744
-14813: DATA: 27119
-14814: DATA: 23999
-14815: DATA: 20857
-14816: DATA: 17780
-14817: DATA: 14049
-14818: DATA: 10936
-14819: DATA: 7800
-14820: DATA: 4708
-14821: DATA: 2025
-14822: DATA: 31647
-14823: DATA: 28490
-14824: DATA: 25446
-14825: DATA: 22373
-14826: DATA: 18628
-14827: DATA: 15490
-14828: DATA: 12516
-14829: DATA: 9289
-14830: DATA: 6264
-14831: DATA: 3088
-14832: DATA: 116
-14833: DATA: 30147
-14834: DATA: 27121
-14835: DATA: 23944
-14836: DATA: 20904
-14837: DATA: 17753
-14838: DATA: 14622
-14839: DATA: 11535
-14840: DATA: 8478
-14841: DATA: 5425
-14842: DATA: 2328
-14843: DATA: 32040
-14844: DATA: 29028
-14845: DATA: 25915
-14846: DATA: 22844
-14847: DATA: 19770
-14848: DATA: 16699
-14849: DATA: 13607
-14850: DATA: 10608
-14851: DATA: 7474
-14852: DATA: 4386
-14853: DATA: 1389
-14854: DATA: 30980
-14855: DATA: 27917
-14856: DATA: 24957
-14857: DATA: 21878
-14858: DATA: 18704
-14859: DATA: 15711
-14860: DATA: 12715
-14861: DATA: 9618
-14862: DATA: 6653
-14863: DATA: 3477
-14864: DATA: 61
-14865: DATA: 29702
-14866: DATA: 26672
-14867: DATA: 23644
-14868: DATA: 20708
-14869: DATA: 17537
-14870: DATA: 14545
-14871: DATA: 12087
-14872: DATA: 9075
-14873: DATA: 5952
-14874: DATA: 3024
-14875: DATA: 32736
-14876: DATA: 29227
-14877: DATA: 26222
-14878: DATA: 23217
-14879: DATA: 20220
-14880: DATA: 17719
-14881: DATA: 14645
-14882: DATA: 11700
-14883: DATA: 8696
-14884: DATA: 5172
-14885: DATA: 2148
-14886: DATA: 31891
-14887: DATA: 28881
-14888: DATA: 26493
-14889: DATA: 23467
-14890: DATA: 20439
-14891: DATA: 16973
-14892: DATA: 13989
-14893: DATA: 10909
-14894: DATA: 8503
-14895: DATA: 5599
-14896: DATA: 2163
-14897: DATA: 31765
-14898: DATA: 28899
-14899: DATA: 26372
-14900: DATA: 23465
-14901: DATA: 20431
-14902: DATA: 16991
-14903: DATA: 14057
-14904: DATA: 11578
-14905: DATA: 8673
-14906: DATA: 5141
-14907: DATA: 2220
-14908: DATA: 32567
-14909: DATA: 29609
-14910: DATA: 26197
-14911: DATA: 23206
-14912: DATA: 20795
-14913: DATA: 17824
-14914: DATA: 14372
-14915: DATA: 11445
-14916: DATA: 9038
-14917: DATA: 6043
-14918: DATA: 2577
-14919: DATA: 32400
-14920: DATA: 30072
-14921: DATA: 27121
-14922: DATA: 23568
-14923: DATA: 20705
-14924: DATA: 18347
-14925: DATA: 14878
-14926: DATA: 12027
-14927: DATA: 9655
-14928: DATA: 6157
-14929: DATA: 3226
-14930: DATA: 869
-14931: DATA: 30621
-14932: DATA: 27301
-14933: DATA: 24863
-14934: DATA: 21973
-14935: DATA: 18661
-14936: DATA: 16253
-14937: DATA: 13259
-14938: DATA: 9936
-14939: DATA: 7532
-14940: DATA: 4196
-14941: DATA: 1274
-14942: DATA: 31650
-14943: DATA: 28284
-14944: DATA: 25904
-14945: DATA: 22965
-14946: DATA: 19647
-14947: DATA: 17275
-14948: DATA: 13924
-14949: DATA: 11007
-14950: DATA: 8607
-14951: DATA: 5194
-14952: DATA: 2937
-14953: DATA: 32310
-14954: DATA: 29328
-14955: DATA: 27033
-14956: DATA: 23724
-14957: DATA: 21340
-14958: DATA: 18020
-14959: DATA: 15701
-14960: DATA: 12343
-14961: DATA: 9434
-14962: DATA: 7166
-14963: DATA: 3721
-14964: DATA: 1462
-14965: DATA: 30786
-14966: DATA: 28508
-14967: DATA: 25125
-14968: DATA: 22880
-14969: DATA: 19469
-14970: DATA: 17173
-14971: DATA: 13933
-14972: DATA: 11552
-14973: DATA: 8242
-14974: DATA: 5951
-14975: DATA: 2599
-14976: DATA: 372
-14977: DATA: 29729
-14978: DATA: 27455
-14979: DATA: 24189
-14980: DATA: 21808
-14981: DATA: 18469
-14982: DATA: 16149
-14983: DATA: 12869
-14984: DATA: 10594
-14985: DATA: 7268
-14986: DATA: 4933
-14987: DATA: 1601
-14988: DATA: 32176
-14989: DATA: 28883
-14990: DATA: 26522
-14991: DATA: 23231
-14992: DATA: 20480
-14993: DATA: 18205
-14994: DATA: 14965
-14995: DATA: 12573
-14996: DATA: 9378
-14997: DATA: 7041
-14998: DATA: 3807
-14999: DATA: 1066
-15000: DATA: 31590
-15001: DATA: 28165
-15002: DATA: 26015
-15003: DATA: 22763
-15004: DATA: 20068
-15005: DATA: 17769
-15006: DATA: 14520
-15007: DATA: 12284
-15008: DATA: 9511
-15009: DATA: 6197
-15010: DATA: 4002
-15011: DATA: 754
-15012: DATA: 30763
-15013: DATA: 28512
-15014: DATA: 25296
-15015: DATA: 22988
-15016: DATA: 20327
-15017: DATA: 17125
-15018: DATA: 14801
-15019: DATA: 12109
-15020: DATA: 8872
-15021: DATA: 6620
-15022: DATA: 3938
-15023: DATA: 658
-15024: DATA: 30769
-15025: DATA: 28437
-15026: DATA: 25341
-15027: DATA: 22546
-15028: DATA: 20407
-15029: DATA: 17100
-15030: DATA: 14425
-15031: DATA: 12262
-15032: DATA: 9524
-15033: DATA: 6273
-15034: DATA: 3605
-15035: DATA: 1469
-15036: DATA: 31533
-15037: DATA: 28350
-15038: DATA: 25636
-15039: DATA: 23484
-15040: DATA: 20794
-15041: DATA: 17586
-15042: DATA: 14960
-15043: DATA: 12713
-15044: DATA: 10028
-15045: DATA: 6824
-15046: DATA: 4176
-15047: DATA: 1931
-15048: DATA: 32097
-15049: DATA: 28904
-15050: DATA: 26194
-15051: DATA: 24008
-15052: DATA: 21430
-15053: DATA: 18781
-15054: DATA: 15543
-15055: DATA: 12813
-15056: DATA: 10355
-15057: DATA: 8155
-15058: DATA: 5396
-15059: DATA: 2264
-15060: DATA: 32421
-15061: DATA: 29726
-15062: DATA: 27588
-15063: DATA: 25024
-15064: DATA: 22375
-15065: DATA: 19146
-15066: DATA: 16517
-15067: DATA: 13945
-15068: DATA: 11308
-15069: DATA: 9113
-15070: DATA: 6567
-15071: DATA: 3952
-15072: DATA: 1319
-15073: DATA: 30945
-15074: DATA: 28378
-15075: DATA: 25675
-15076: DATA: 23077
-15077: DATA: 20984
-15078: DATA: 18332
-15079: DATA: 15697
-15080: DATA: 13108
-15081: DATA: 10505
-15082: DATA: 7391
-15083: DATA: 4750
-15084: DATA: 2223
-15085: DATA: 32445
-15086: DATA: 29769
-15087: DATA: 27162
-15088: DATA: 24609
-15089: DATA: 22421
-15090: DATA: 19953
-15091: DATA: 17295
-15092: DATA: 14753
-15093: DATA: 12045
-15094: DATA: 9561
-15095: DATA: 7019
-15096: DATA: 4404
-15097: DATA: 1796
-15098: DATA: 32080
-15099: DATA: 29482
-15100: DATA: 26934
-15101: DATA: 24372
-15102: DATA: 21812
-15103: DATA: 19317
-15104: DATA: 16699
-15105: DATA: 14131
-15106: DATA: 11632
-15107: DATA: 9007
-15108: DATA: 6443
-15109: DATA: 3874
-15110: DATA: 1309
-15111: DATA: 31510
-15112: DATA: 28980
-15113: DATA: 26481
-15114: DATA: 23896
-15115: DATA: 21324
-15116: DATA: 18864
-15117: DATA: 16349
-15118: DATA: 13811
-15119: DATA: 11226
-15120: DATA: 8250
-15121: DATA: 5633
-15122: DATA: 3170
-15123: DATA: 594
-15124: DATA: 30888
-15125: DATA: 28365
-15126: DATA: 25796
-15127: DATA: 23853
-15128: DATA: 21361
-15129: DATA: 18693
-15130: DATA: 16276
-15131: DATA: 13794
-15132: DATA: 10795
-15133: DATA: 8303
-15134: DATA: 5872
-15135: DATA: 3297
-15136: DATA: 1339
-15137: DATA: 31541
-15138: DATA: 29092
-15139: DATA: 26613
-15140: DATA: 23585
-15141: DATA: 21037
-15142: DATA: 18566
-15143: DATA: 16068
-15144: DATA: 14177
-15145: DATA: 11689
-15146: DATA: 9156
-15147: DATA: 6211
-15148: DATA: 3790
-15149: DATA: 1207
-15150: DATA: 32068
-15151: DATA: 29597
-15152: DATA: 26673
-15153: DATA: 24085
-15154: DATA: 21750
-15155: DATA: 19729
-15156: DATA: 17323
-15157: DATA: 14786
-15158: DATA: 11842
-15159: DATA: 9381
-15160: DATA: 7547
-15161: DATA: 4995
-15162: DATA: 2128
-15163: DATA: 32441
-15164: DATA: 30508
-15165: DATA: 28084
-15166: DATA: 25123
-15167: DATA: 22773
-15168: DATA: 20774
-15169: DATA: 18362
-15170: DATA: 15423
-15171: DATA: 12976
-15172: DATA: 11108
-15173: DATA: 8612
-15174: DATA: 5635
-15175: DATA: 3269
-15176: DATA: 1397
-15177: DATA: 31653
-15178: DATA: 28764
-15179: DATA: 26316
-15180: DATA: 24502
-15181: DATA: 21530
-15182: DATA: 19189
-15183: DATA: 17173
-15184: DATA: 14393
-15185: DATA: 11930
-15186: DATA: 10083
-15187: DATA: 7644
-15188: DATA: 4781
-15189: DATA: 2830
-15190: DATA: 400
-15191: DATA: 30369
-15192: DATA: 28529
-15193: DATA: 26069
-15194: DATA: 23193
-15195: DATA: 21358
-15196: DATA: 18480
-15197: DATA: 16116
-15198: DATA: 14270
-15199: DATA: 11378
-15200: DATA: 9588
-15201: DATA: 7156
-15202: DATA: 4336
-15203: DATA: 2362
-15204: DATA: 32361
-15205: DATA: 29866
-15206: DATA: 28112
-15207: DATA: 25174
-15208: DATA: 23405
-15209: DATA: 20520
-15210: DATA: 18130
-15211: DATA: 16258
-15212: DATA: 13480
-15213: DATA: 11539
-15214: DATA: 8724
-15215: DATA: 6928
-15216: DATA: 4149
-15217: DATA: 1734
-15218: DATA: 32740
-15219: DATA: 29944
-15220: DATA: 28087
-15221: DATA: 25154
-15222: DATA: 23365
-15223: DATA: 20593
-15224: DATA: 18812
-15225: DATA: 15969
-15226: DATA: 14087
-15227: DATA: 11304
-15228: DATA: 9527
-15229: DATA: 6697
-15230: DATA: 4954
-15231: DATA: 2051
-15232: DATA: 309
-15233: DATA: 30240
-15234: DATA: 28476
-15235: DATA: 25641
-15236: DATA: 23908
-15237: DATA: 21001
-15238: DATA: 19231
-15239: DATA: 16394
-15240: DATA: 14694
-15241: DATA: 12019
-15242: DATA: 10089
-15243: DATA: 7234
-15244: DATA: 5553
-15245: DATA: 2781
-15246: DATA: 995
-15247: DATA: 30913
-15248: DATA: 28725
-15249: DATA: 26907
-15250: DATA: 24180
-15251: DATA: 22301
-15252: DATA: 19622
-15253: DATA: 17800
-15254: DATA: 15062
-15255: DATA: 12842
-15256: DATA: 11110
-15257: DATA: 8256
-15258: DATA: 6608
-15259: DATA: 3833
-15260: DATA: 1580
-15261: DATA: 32632
-15262: DATA: 29936
-15263: DATA: 28145
-15264: DATA: 25915
-15265: DATA: 23162
-15266: DATA: 21410
-15267: DATA: 18621
-15268: DATA: 16432
-15269: DATA: 14690
-15270: DATA: 11984
-15271: DATA: 10193
-15272: DATA: 8060
-15273: DATA: 5280
-15274: DATA: 3472
-15275: DATA: 1307
-15276: DATA: 31397
-15277: DATA: 29640
-15278: DATA: 27516
-15279: DATA: 24705
-15280: DATA: 22639
-15281: DATA: 20757
-15282: DATA: 18169
-15283: DATA: 15881
-15284: DATA: 14308
-15285: DATA: 11461
-15286: DATA: 9297
-15287: DATA: 7670
-15288: DATA: 5428
-15289: DATA: 2692
-15290: DATA: 592
-15291: DATA: 31649
-15292: DATA: 29477
-15293: DATA: 26799
-15294: DATA: 24631
-15295: DATA: 22960
-15296: DATA: 20852
-15297: DATA: 18162
-15298: DATA: 15971
-15299: DATA: 14317
-15300: DATA: 12131
-15301: DATA: 9453
-15302: DATA: 7187
-15303: DATA: 5508
-15304: DATA: 3430
-15305: DATA: 755
-15306: DATA: 31317
-15307: DATA: 29641
-15308: DATA: 27620
-15309: DATA: 25364
-15310: DATA: 22782
-15311: DATA: 20545
-15312: DATA: 18491
-15313: DATA: 16853
-15314: DATA: 14713
-15315: DATA: 11977
-15316: DATA: 9962
-15317: DATA: 7757
-15318: DATA: 6032
-15319: DATA: 3972
-15320: DATA: 1906
-15321: DATA: 31939
-15322: DATA: 29849
-15323: DATA: 27765
-15324: DATA: 25633
-15325: DATA: 24057
-15326: DATA: 22000
-15327: DATA: 19809
-15328: DATA: 17723
-15329: DATA: 15029
-15330: DATA: 12964
-15331: DATA: 10869
-15332: DATA: 8737
-15333: DATA: 7085
-15334: DATA: 4999
-15335: DATA: 2884
-15336: DATA: 888
-15337: DATA: 31529
-15338: DATA: 28816
-15339: DATA: 26755
-15340: DATA: 24737
-15341: DATA: 22620
-15342: DATA: 20578
-15343: DATA: 18517
-15344: DATA: 16416
-15345: DATA: 14813
-15346: DATA: 12789
-15347: DATA: 10717
-15348: DATA: 8608
-15349: DATA: 6466
-15350: DATA: 4447
-15351: DATA: 2423
-15352: DATA: 312
-15353: DATA: 31045
-15354: DATA: 28932
-15355: DATA: 26917
-15356: DATA: 24865
-15357: DATA: 22831
-15358: DATA: 20789
-15359: DATA: 18805
-15360: DATA: 16701
-15361: DATA: 14630
-15362: DATA: 12656
-15363: DATA: 10556
-15364: DATA: 8548
-15365: DATA: 6463
-15366: DATA: 4357
-15367: DATA: 2315
-15368: DATA: 378
-15369: DATA: 31084
-15370: DATA: 29022
-15371: DATA: 26954
-15372: DATA: 25060
-15373: DATA: 22933
-15374: DATA: 20991
-15375: DATA: 18880
-15376: DATA: 16422
-15377: DATA: 14354
-15378: DATA: 12412
-15379: DATA: 10332
-15380: DATA: 8375
-15381: DATA: 6302
-15382: DATA: 4240
-15383: DATA: 2866
-15384: DATA: 892
-15385: DATA: 31564
-15386: DATA: 29587
-15387: DATA: 27621
-15388: DATA: 25188
-15389: DATA: 23155
-15390: DATA: 21173
-15391: DATA: 19171
-15392: DATA: 17713
-15393: DATA: 15719
-15394: DATA: 13808
-15395: DATA: 11758
-15396: DATA: 9249
-15397: DATA: 7272
-15398: DATA: 5277
-15399: DATA: 3286
-15400: DATA: 1844
-15401: DATA: 32689
-15402: DATA: 30687
-15403: DATA: 28237
-15404: DATA: 26294
-15405: DATA: 24264
-15406: DATA: 22910
-15407: DATA: 20949
-15408: DATA: 18491
-15409: DATA: 16448
-15410: DATA: 14564
-15411: DATA: 13149
-15412: DATA: 11179
-15413: DATA: 9163
-15414: DATA: 6672
-15415: DATA: 4854
-15416: DATA: 3445
-15417: DATA: 1419
-15418: DATA: 31764
-15419: DATA: 29923
-15420: DATA: 28494
-15421: DATA: 26583
-15422: DATA: 24068
-15423: DATA: 22205
-15424: DATA: 20785
-15425: DATA: 18933
-15426: DATA: 16438
-15427: DATA: 14513
-15428: DATA: 13099
-15429: DATA: 11170
-15430: DATA: 8706
-15431: DATA: 6853
-15432: DATA: 5499
-15433: DATA: 3555
-15434: DATA: 1040
-15435: DATA: 31961
-15436: DATA: 30636
-15437: DATA: 28180
-15438: DATA: 26339
-15439: DATA: 24853
-15440: DATA: 22566
-15441: DATA: 20634
-15442: DATA: 19327
-15443: DATA: 17360
-15444: DATA: 15076
-15445: DATA: 13572
-15446: DATA: 11715
-15447: DATA: 9445
-15448: DATA: 8053
-15449: DATA: 6021
-15450: DATA: 3740
-15451: DATA: 2412
-15452: DATA: 54
-15453: DATA: 30970
-15454: DATA: 29621
-15455: DATA: 27189
-15456: DATA: 25913
-15457: DATA: 24058
-15458: DATA: 21667
-15459: DATA: 20348
-15460: DATA: 17965
-15461: DATA: 16110
-15462: DATA: 14800
-15463: DATA: 12353
-15464: DATA: 11121
-15465: DATA: 8757
-15466: DATA: 6873
-15467: DATA: 5518
-15468: DATA: 3248
-15469: DATA: 1876
-15470: DATA: 32382
-15471: DATA: 30994
-15472: DATA: 28788
-15473: DATA: 26817
-15474: DATA: 25592
-15475: DATA: 23192
-15476: DATA: 21988
-15477: DATA: 19523
-15478: DATA: 18245
-15479: DATA: 15976
-15480: DATA: 14710
-15481: DATA: 12288
-15482: DATA: 11010
-15483: DATA: 8813
-15484: DATA: 7523
-15485: DATA: 5228
-15486: DATA: 3959
-15487: DATA: 1659
-15488: DATA: 337
-15489: DATA: 30758
-15490: DATA: 29503
-15491: DATA: 27176
-15492: DATA: 25904
-15493: DATA: 23589
-15494: DATA: 22388
-15495: DATA: 19986
-15496: DATA: 18801
-15497: DATA: 16502
-15498: DATA: 15172
-15499: DATA: 12840
-15500: DATA: 11698
-15501: DATA: 9372
-15502: DATA: 8165
-15503: DATA: 5849
-15504: DATA: 4128
-15505: DATA: 2943
-15506: DATA: 582
-15507: DATA: 32092
-15508: DATA: 29873
-15509: DATA: 28545
-15510: DATA: 26308
-15511: DATA: 24677
-15512: DATA: 23384
-15513: DATA: 21066
-15514: DATA: 19859
-15515: DATA: 17638
-15516: DATA: 16070
-15517: DATA: 14660
-15518: DATA: 12479
-15519: DATA: 11232
-15520: DATA: 9588
-15521: DATA: 7284
-15522: DATA: 6050
-15523: DATA: 3832
-15524: DATA: 2148
-15525: DATA: 868
-15526: DATA: 31390
-15527: DATA: 30085
-15528: DATA: 28533
-15529: DATA: 26341
-15530: DATA: 25047
-15531: DATA: 23327
-15532: DATA: 21165
-15533: DATA: 19929
-15534: DATA: 18224
-15535: DATA: 16026
-15536: DATA: 14386
-15537: DATA: 13077
-15538: DATA: 10978
-15539: DATA: 9234
-15540: DATA: 8107
-15541: DATA: 5824
-15542: DATA: 4163
-15543: DATA: 2981
-15544: DATA: 1376
-15545: DATA: 31885
-15546: DATA: 30225
-15547: DATA: 29113
-15548: DATA: 27492
-15549: DATA: 25278
-15550: DATA: 23615
-15551: DATA: 22459
-15552: DATA: 20768
-15553: DATA: 18599
-15554: DATA: 16959
-15555: DATA: 15793
-15556: DATA: 14180
-15557: DATA: 11961
-15558: DATA: 10264
-15559: DATA: 9088
-15560: DATA: 7476
-15561: DATA: 5345
-15562: DATA: 3679
-15563: DATA: 2498
-15564: DATA: 950
-15565: DATA: 32093
-15566: DATA: 29924
-15567: DATA: 28250
-15568: DATA: 26740
-15569: DATA: 25473
-15570: DATA: 23928
-15571: DATA: 21720
-15572: DATA: 20196
-15573: DATA: 18459
-15574: DATA: 17361
-15575: DATA: 15792
-15576: DATA: 14200
-15577: DATA: 11985
-15578: DATA: 10462
-15579: DATA: 8711
-15580: DATA: 7246
-15581: DATA: 6089
-15582: DATA: 4536
-15583: DATA: 2928
-15584: DATA: 1396
-15585: DATA: 31987
-15586: DATA: 30396
-15587: DATA: 28786
-15588: DATA: 27179
-15589: DATA: 26111
-15590: DATA: 24528
-15591: DATA: 22858
-15592: DATA: 21362
-15593: DATA: 19813
-15594: DATA: 17604
-15595: DATA: 16005
-15596: DATA: 14509
-15597: DATA: 12878
-15598: DATA: 11312
-15599: DATA: 9735
-15600: DATA: 8251
-15601: DATA: 7130
-15602: DATA: 5629
-15603: DATA: 4061
-15604: DATA: 2477
-15605: DATA: 862
-15606: DATA: 32016
-15607: DATA: 30564
-15608: DATA: 28980
-15609: DATA: 27401
-15610: DATA: 25873
-15611: DATA: 24383
-15612: DATA: 22819
-15613: DATA: 21304
-15614: DATA: 19824
-15615: DATA: 18232
-15616: DATA: 16699
-15617: DATA: 15142
-15618: DATA: 13617
-15619: DATA: 12084
-15620: DATA: 10535
-15621: DATA: 9069
-15622: DATA: 7444
-15623: DATA: 5888
-15624: DATA: 4452
-15625: DATA: 2924
-15626: DATA: 1363
-15627: DATA: 32601
-15628: DATA: 31149
-15629: DATA: 29587
-15630: DATA: 28151
-15631: DATA: 26517
-15632: DATA: 24608
-15633: DATA: 23069
-15634: DATA: 21621
-15635: DATA: 19997
-15636: DATA: 18602
-15637: DATA: 17048
-15638: DATA: 15581
-15639: DATA: 14631
-15640: DATA: 13169
-15641: DATA: 11607
-15642: DATA: 10192
-15643: DATA: 8618
-15644: DATA: 6768
-15645: DATA: 5178
-15646: DATA: 3838
-15647: DATA: 2192
-15648: DATA: 1338
-15649: DATA: 32634
-15650: DATA: 31138
-15651: DATA: 29673
-15652: DATA: 27692
-15653: DATA: 26121
-15654: DATA: 24725
-15655: DATA: 23236
-15656: DATA: 22375
-15657: DATA: 20913
-15658: DATA: 19381
-15659: DATA: 17438
-15660: DATA: 16043
-15661: DATA: 14536
-15662: DATA: 13668
-15663: DATA: 12189
-15664: DATA: 10334
-15665: DATA: 8803
-15666: DATA: 7409
-15667: DATA: 6408
-15668: DATA: 5032
-15669: DATA: 3545
-15670: DATA: 1552
-15671: DATA: 201
-15672: DATA: 32123
-15673: DATA: 30598
-15674: DATA: 28699
-15675: DATA: 27213
-15676: DATA: 26397
-15677: DATA: 25010
-15678: DATA: 23077
-15679: DATA: 21749
-15680: DATA: 20789
-15681: DATA: 19367
-15682: DATA: 17461
-15683: DATA: 16125
-15684: DATA: 15149
-15685: DATA: 13731
-15686: DATA: 11856
-15687: DATA: 10372
-15688: DATA: 9524
-15689: DATA: 8162
-15690: DATA: 6210
-15691: DATA: 4804
-15692: DATA: 4000
-15693: DATA: 2141
-15694: DATA: 767
-15695: DATA: 32595
-15696: DATA: 30836
-15697: DATA: 29319
-15698: DATA: 28543
-15699: DATA: 27090
-15700: DATA: 25257
-15701: DATA: 24350
-15702: DATA: 22928
-15703: DATA: 21169
-15704: DATA: 20348
-15705: DATA: 18884
-15706: DATA: 17028
-15707: DATA: 16173
-15708: DATA: 14375
-15709: DATA: 13042
-15710: DATA: 12222
-15711: DATA: 10337
-15712: DATA: 9510
-15713: DATA: 8186
-15714: DATA: 6332
-15715: DATA: 5437
-15716: DATA: 3632
-15717: DATA: 2277
-15718: DATA: 1429
-15719: DATA: 32261
-15720: DATA: 31600
-15721: DATA: 29738
-15722: DATA: 28383
-15723: DATA: 27551
-15724: DATA: 25828
-15725: DATA: 24905
-15726: DATA: 23167
-15727: DATA: 22357
-15728: DATA: 20512
-15729: DATA: 19165
-15730: DATA: 18421
-15731: DATA: 16605
-15732: DATA: 15794
-15733: DATA: 13900
-15734: DATA: 13125
-15735: DATA: 11369
-15736: DATA: 10592
-15737: DATA: 8779
-15738: DATA: 8058
-15739: DATA: 6215
-15740: DATA: 5392
-15741: DATA: 3637
-15742: DATA: 2869
-15743: DATA: 1141
-15744: DATA: 306
-15745: DATA: 31289
-15746: DATA: 30527
-15747: DATA: 28722
-15748: DATA: 27958
-15749: DATA: 26221
-15750: DATA: 25375
-15751: DATA: 23555
-15752: DATA: 22836
-15753: DATA: 21105
-15754: DATA: 20312
-15755: DATA: 18500
-15756: DATA: 17847
-15757: DATA: 16093
-15758: DATA: 15330
-15759: DATA: 13530
-15760: DATA: 12347
-15761: DATA: 11544
-15762: DATA: 9776
-15763: DATA: 9044
-15764: DATA: 7351
-15765: DATA: 6605
-15766: DATA: 4817
-15767: DATA: 3685
-15768: DATA: 2936
-15769: DATA: 1092
-15770: DATA: 386
-15771: DATA: 31466
-15772: DATA: 30241
-15773: DATA: 29501
-15774: DATA: 27837
-15775: DATA: 27130
-15776: DATA: 25895
-15777: DATA: 24180
-15778: DATA: 23481
-15779: DATA: 21758
-15780: DATA: 20580
-15781: DATA: 19817
-15782: DATA: 18069
-15783: DATA: 17365
-15784: DATA: 16253
-15785: DATA: 14502
-15786: DATA: 13764
-15787: DATA: 12548
-15788: DATA: 10922
-15789: DATA: 10202
-15790: DATA: 9008
-15791: DATA: 7316
-15792: DATA: 6260
-15793: DATA: 5394
-15794: DATA: 3770
-15795: DATA: 2650
-15796: DATA: 2020
-15797: DATA: 222
-15798: DATA: 31817
-15799: DATA: 31208
-15800: DATA: 30070
-15801: DATA: 28298
-15802: DATA: 27164
-15803: DATA: 26595
-15804: DATA: 25409
-15805: DATA: 23731
-15806: DATA: 22591
-15807: DATA: 21927
-15808: DATA: 20768
-15809: DATA: 19133
-15810: DATA: 18004
-15811: DATA: 17336
-15812: DATA: 16165
-15813: DATA: 14526
-15814: DATA: 13316
-15815: DATA: 12768
-15816: DATA: 11623
-15817: DATA: 9962
-15818: DATA: 8773
-15819: DATA: 8153
-15820: DATA: 7084
-15821: DATA: 6009
-15822: DATA: 4327
-15823: DATA: 3152
-15824: DATA: 2087
-15825: DATA: 1409
-15826: DATA: 282
-15827: DATA: 31467
-15828: DATA: 30373
-15829: DATA: 29208
-15830: DATA: 28636
-15831: DATA: 27569
-15832: DATA: 26420
-15833: DATA: 24809
-15834: DATA: 23711
-15835: DATA: 22638
-15836: DATA: 21551
-15837: DATA: 20766
-15838: DATA: 19849
-15839: DATA: 18810
-15840: DATA: 17697
-15841: DATA: 16053
-15842: DATA: 15025
-15843: DATA: 13935
-15844: DATA: 12833
-15845: DATA: 12205
-15846: DATA: 11161
-15847: DATA: 10059
-15848: DATA: 9012
-15849: DATA: 7972
-15850: DATA: 6288
-15851: DATA: 5258
-15852: DATA: 4278
-15853: DATA: 3156
-15854: DATA: 2164
-15855: DATA: 1109
-15856: DATA: 59
-15857: DATA: 32211
-15858: DATA: 31152
-15859: DATA: 30095
-15860: DATA: 29099
-15861: DATA: 27970
-15862: DATA: 26973
-15863: DATA: 25974
-15864: DATA: 24884
-15865: DATA: 23825
-15866: DATA: 22808
-15867: DATA: 21804
-15868: DATA: 20784
-15869: DATA: 19837
-15870: DATA: 18739
-15871: DATA: 17722
-15872: DATA: 16698
-15873: DATA: 15649
-15874: DATA: 14626
-15875: DATA: 13618
-15876: DATA: 12584
-15877: DATA: 11629
-15878: DATA: 10500
-15879: DATA: 9485
-15880: DATA: 8561
-15881: DATA: 7461
-15882: DATA: 6484
-15883: DATA: 5442
-15884: DATA: 4523
-15885: DATA: 3471
-15886: DATA: 2480
-15887: DATA: 1473
-15888: DATA: 59
-15889: DATA: 31829
-15890: DATA: 30820
-15891: DATA: 29781
-15892: DATA: 28833
-15893: DATA: 27853
-15894: DATA: 26822
-15895: DATA: 26404
-15896: DATA: 25441
-15897: DATA: 24393
-15898: DATA: 23428
-15899: DATA: 22435
-15900: DATA: 21070
-15901: DATA: 19991
-15902: DATA: 19076
-15903: DATA: 18173
-15904: DATA: 17713
-15905: DATA: 16693
-15906: DATA: 15798
-15907: DATA: 14833
-15908: DATA: 13355
-15909: DATA: 12386
-15910: DATA: 11394
-15911: DATA: 10373
-15912: DATA: 10107
-15913: DATA: 9123
-15914: DATA: 8080
-15915: DATA: 6681
-15916: DATA: 5804
-15917: DATA: 4820
-15918: DATA: 4451
-15919: DATA: 3541
-15920: DATA: 2086
-15921: DATA: 1114
-15922: DATA: 255
-15923: DATA: 32528
-15924: DATA: 31716
-15925: DATA: 30660
-15926: DATA: 29251
-15927: DATA: 28325
-15928: DATA: 28021
-15929: DATA: 27077
-15930: DATA: 25628
-15931: DATA: 24748
-15932: DATA: 24374
-15933: DATA: 23482
-15934: DATA: 22069
-15935: DATA: 21237
-15936: DATA: 20793
-15937: DATA: 19898
-15938: DATA: 18467
-15939: DATA: 17596
-15940: DATA: 17197
-15941: DATA: 16302
-15942: DATA: 14928
-15943: DATA: 13953
-15944: DATA: 13681
-15945: DATA: 12789
-15946: DATA: 11353
-15947: DATA: 10446
-15948: DATA: 10160
-15949: DATA: 8724
-15950: DATA: 7934
-15951: DATA: 7506
-15952: DATA: 6260
-15953: DATA: 5249
-15954: DATA: 4984
-15955: DATA: 4056
-15956: DATA: 2788
-15957: DATA: 2307
-15958: DATA: 1477
-15959: DATA: 168
-15960: DATA: 32630
-15961: DATA: 31680
-15962: DATA: 30338
-15963: DATA: 29997
-15964: DATA: 28771
-15965: DATA: 27820
-15966: DATA: 27617
-15967: DATA: 26162
-15968: DATA: 25978
-15969: DATA: 24976
-15970: DATA: 23742
-15971: DATA: 23410
-15972: DATA: 22070
-15973: DATA: 21241
-15974: DATA: 20888
-15975: DATA: 19489
-15976: DATA: 19313
-15977: DATA: 17956
-15978: DATA: 17091
-15979: DATA: 16793
-15980: DATA: 15553
-15981: DATA: 15182
-15982: DATA: 13951
-15983: DATA: 13568
-15984: DATA: 12320
-15985: DATA: 11485
-15986: DATA: 11156
-15987: DATA: 9866
-15988: DATA: 9633
-15989: DATA: 8286
-15990: DATA: 8004
-15991: DATA: 6671
-15992: DATA: 6466
-15993: DATA: 5124
-15994: DATA: 4869
-15995: DATA: 3617
-15996: DATA: 3376
-15997: DATA: 2173
-15998: DATA: 1820
-15999: DATA: 570
-16000: DATA: 311
-16001: DATA: 31806
-16002: DATA: 31696
-16003: DATA: 30212
-16004: DATA: 29995
-16005: DATA: 28728
-16006: DATA: 28496
-16007: DATA: 27140
-16008: DATA: 26982
-16009: DATA: 25696
-16010: DATA: 25360
-16011: DATA: 24132
-16012: DATA: 23978
-16013: DATA: 22749
-16014: DATA: 22513
-16015: DATA: 21141
-16016: DATA: 20531
-16017: DATA: 20231
-16018: DATA: 19065
-16019: DATA: 18777
-16020: DATA: 17636
-16021: DATA: 17282
-16022: DATA: 16086
-16023: DATA: 15461
-16024: DATA: 15206
-16025: DATA: 13898
-16026: DATA: 13727
-16027: DATA: 12512
-16028: DATA: 11831
-16029: DATA: 11581
-16030: DATA: 10404
-16031: DATA: 10237
-16032: DATA: 9525
-16033: DATA: 8289
-16034: DATA: 8176
-16035: DATA: 6910
-16036: DATA: 6187
-16037: DATA: 5987
-16038: DATA: 4740
-16039: DATA: 4567
-16040: DATA: 3963
-16041: DATA: 2729
-16042: DATA: 2448
-16043: DATA: 1817
-16044: DATA: 684
-16045: DATA: 472
-16046: DATA: 32560
-16047: DATA: 31377
-16048: DATA: 30779
-16049: DATA: 30554
-16050: DATA: 29410
-16051: DATA: 28765
-16052: DATA: 28592
-16053: DATA: 27330
-16054: DATA: 26640
-16055: DATA: 26609
-16056: DATA: 25980
-16057: DATA: 24704
-16058: DATA: 24144
-16059: DATA: 23995
-16060: DATA: 23333
-16061: DATA: 22184
-16062: DATA: 21564
-16063: DATA: 21409
-16064: DATA: 20858
-16065: DATA: 19679
-16066: DATA: 19034
-16067: DATA: 18825
-16068: DATA: 18220
-16069: DATA: 17064
-16070: DATA: 16464
-16071: DATA: 16259
-16072: DATA: 15736
-16073: DATA: 14570
-16074: DATA: 13919
-16075: DATA: 13791
-16076: DATA: 13284
-16077: DATA: 12562
-16078: DATA: 11510
-16079: DATA: 10773
-16080: DATA: 10272
-16081: DATA: 10141
-16082: DATA: 9593
-16083: DATA: 8398
-16084: DATA: 7908
-16085: DATA: 7199
-16086: DATA: 7135
-16087: DATA: 6570
-16088: DATA: 6009
-16089: DATA: 4741
-16090: DATA: 4249
-16091: DATA: 3710
-16092: DATA: 3172
-16093: DATA: 3068
-16094: DATA: 2544
-16095: DATA: 1913
-16096: DATA: 1333
-16097: DATA: 231
-16098: DATA: 32439
-16099: DATA: 31864
-16100: DATA: 31332
-16101: DATA: 31200
-16102: DATA: 30623
-16103: DATA: 30038
-16104: DATA: 29557
-16105: DATA: 28972
-16106: DATA: 27859
-16107: DATA: 27341
-16108: DATA: 26784
-16109: DATA: 26200
-16110: DATA: 25696
-16111: DATA: 25116
-16112: DATA: 24631
-16113: DATA: 24513
-16114: DATA: 24057
-16115: DATA: 23443
-16116: DATA: 22947
-16117: DATA: 22285
-16118: DATA: 21841
-16119: DATA: 21285
-16120: DATA: 20787
-16121: DATA: 20303
-16122: DATA: 19799
-16123: DATA: 19309
-16124: DATA: 18743
-16125: DATA: 18212
-16126: DATA: 17725
-16127: DATA: 17207
-16128: DATA: 16699
-16129: DATA: 16185
-16130: DATA: 15742
-16131: DATA: 15192
-16132: DATA: 14634
-16133: DATA: 14114
-16134: DATA: 13570
-16135: DATA: 13073
-16136: DATA: 12668
-16137: DATA: 12032
-16138: DATA: 11587
-16139: DATA: 11074
-16140: DATA: 10673
-16141: DATA: 10121
-16142: DATA: 9720
-16143: DATA: 9137
-16144: DATA: 8227
-16145: DATA: 7696
-16146: DATA: 7267
-16147: DATA: 6729
-16148: DATA: 6350
-16149: DATA: 5819
-16150: DATA: 5329
-16151: DATA: 5424
-16152: DATA: 4984
-16153: DATA: 4433
-16154: DATA: 4048
-16155: DATA: 3521
-16156: DATA: 2603
-16157: DATA: 2174
-16158: DATA: 1723
-16159: DATA: 1045
-16160: DATA: 1293
-16161: DATA: 890
-16162: DATA: 421
-16163: DATA: 32701
-16164: DATA: 31781
-16165: DATA: 31359
-16166: DATA: 30869
-16167: DATA: 30341
-16168: DATA: 30589
-16169: DATA: 30123
-16170: DATA: 29584
-16171: DATA: 28684
-16172: DATA: 28388
-16173: DATA: 27866
-16174: DATA: 28002
-16175: DATA: 27548
-16176: DATA: 26672
-16177: DATA: 26133
-16178: DATA: 25855
-16179: DATA: 25883
-16180: DATA: 25572
-16181: DATA: 25055
-16182: DATA: 24159
-16183: DATA: 23786
-16184: DATA: 23929
-16185: DATA: 23446
-16186: DATA: 22608
-16187: DATA: 22201
-16188: DATA: 22316
-16189: DATA: 21948
-16190: DATA: 21028
-16191: DATA: 20725
-16192: DATA: 20791
-16193: DATA: 20410
-16194: DATA: 19518
-16195: DATA: 19113
-16196: DATA: 19254
-16197: DATA: 18850
-16198: DATA: 17948
-16199: DATA: 17605
-16200: DATA: 17760
-16201: DATA: 17389
-16202: DATA: 16469
-16203: DATA: 16013
-16204: DATA: 16288
-16205: DATA: 15378
-16206: DATA: 15103
-16207: DATA: 15175
-16208: DATA: 14452
-16209: DATA: 13953
-16210: DATA: 14207
-16211: DATA: 13725
-16212: DATA: 12976
-16213: DATA: 13061
-16214: DATA: 12757
-16215: DATA: 12005
-16216: DATA: 12130
-16217: DATA: 11716
-16218: DATA: 10885
-16219: DATA: 11105
-16220: DATA: 10288
-16221: DATA: 9907
-16222: DATA: 10202
-16223: DATA: 9247
-16224: DATA: 9472
-16225: DATA: 9213
-16226: DATA: 8373
-16227: DATA: 8509
-16228: DATA: 7714
-16229: DATA: 7393
-16230: DATA: 7583
-16231: DATA: 6730
-16232: DATA: 7014
-16233: DATA: 6245
-16234: DATA: 5855
-16235: DATA: 6027
-16236: DATA: 5348
-16237: DATA: 5449
-16238: DATA: 4728
-16239: DATA: 4892
-16240: DATA: 4135
-16241: DATA: 3733
-16242: DATA: 4066
-16243: DATA: 3218
-16244: DATA: 3499
-16245: DATA: 2624
-16246: DATA: 2832
-16247: DATA: 2156
-16248: DATA: 2407
-16249: DATA: 1605
-16250: DATA: 1809
-16251: DATA: 1133
-16252: DATA: 1320
-16253: DATA: 572
-16254: DATA: 802
-16255: DATA: 50
-16256: DATA: 305
-16257: DATA: 32373
-16258: DATA: 32573
-16259: DATA: 31794
-16260: DATA: 32055
-16261: DATA: 31276
-16262: DATA: 31513
-16263: DATA: 30726
-16264: DATA: 31028
-16265: DATA: 30305
-16266: DATA: 30549
-16267: DATA: 29789
-16268: DATA: 30125
-16269: DATA: 29342
-16270: DATA: 29668
-16271: DATA: 28892
-16272: DATA: 28730
-16273: DATA: 28946
-16274: DATA: 28208
-16275: DATA: 28508
-16276: DATA: 27876
-16277: DATA: 28106
-16278: DATA: 27291
-16279: DATA: 27234
-16280: DATA: 27444
-16281: DATA: 26710
-16282: DATA: 27017
-16283: DATA: 26336
-16284: DATA: 26150
-16285: DATA: 26482
-16286: DATA: 25788
-16287: DATA: 26043
-16288: DATA: 25937
-16289: DATA: 25211
-16290: DATA: 25535
-16291: DATA: 24815
-16292: DATA: 24624
-16293: DATA: 24933
-16294: DATA: 24308
-16295: DATA: 24512
-16296: DATA: 24437
-16297: DATA: 23734
-16298: DATA: 24004
-16299: DATA: 23912
-16300: DATA: 23223
-16301: DATA: 23506
-16302: DATA: 23397
-16303: DATA: 22657
-16304: DATA: 22588
-16305: DATA: 22847
-16306: DATA: 22214
-16307: DATA: 22044
-16308: DATA: 22449
-16309: DATA: 21697
-16310: DATA: 21572
-16311: DATA: 21925
-16312: DATA: 21848
-16313: DATA: 21130
-16314: DATA: 21011
-16315: DATA: 21414
-16316: DATA: 21446
-16317: DATA: 20612
-16318: DATA: 20543
-16319: DATA: 20896
-16320: DATA: 20852
-16321: DATA: 20148
-16322: DATA: 20002
-16323: DATA: 20408
-16324: DATA: 20324
-16325: DATA: 19620
-16326: DATA: 19486
-16327: DATA: 19909
-16328: DATA: 19829
-16329: DATA: 19109
-16330: DATA: 19031
-16331: DATA: 19423
-16332: DATA: 19373
-16333: DATA: 19225
-16334: DATA: 18608
-16335: DATA: 18522
-16336: DATA: 18482
-16337: DATA: 18901
-16338: DATA: 18786
-16339: DATA: 18130
-16340: DATA: 18091
-16341: DATA: 17920
-16342: DATA: 18371
-16343: DATA: 18405
-16344: DATA: 18272
-16345: DATA: 17613
-16346: DATA: 17553
-16347: DATA: 17529
-16348: DATA: 17508
-16349: DATA: 17918
-16350: DATA: 17855
-16351: DATA: 17787
-16352: DATA: 17696
-16353: DATA: 17127
-16354: DATA: 17087
-16355: DATA: 17009
-16356: DATA: 16996
-16357: DATA: 17401
-16358: DATA: 17304
-16359: DATA: 17216
-16360: DATA: 17204
-16361: DATA: 17185
-16362: DATA: 16607
-16363: DATA: 16514
-16364: DATA: 16566
-16365: DATA: 16413
-16366: DATA: 16484
-16367: DATA: 16410
-16368: DATA: 16500
-16369: DATA: 16833
-16370: DATA: 16888
-16371: DATA: 16792
-16372: DATA: 16868
-16373: DATA: 16731
-16374: DATA: 16721
-16375: DATA: 16752
-16376: DATA: 16760
-16377: DATA: 16657
-16378: DATA: 16734
-16379: DATA: 16711
-16380: DATA: 16718
-16381: DATA: 16649
-16382: DATA: 16696
-16383: DATA: 16688
-16384: DATA: 16756
-16385: DATA: 16691
-16386: DATA: 16700
-16387: DATA: 16690
-16388: DATA: 16683
-16389: DATA: 16703
-16390: DATA: 16720
-16391: DATA: 16650
-16392: DATA: 16754
-16393: DATA: 16677
-16394: DATA: 16708
-16395: DATA: 16709
-16396: DATA: 16813
-16397: DATA: 16782
-16398: DATA: 16816
-16399: DATA: 16839
-16400: DATA: 16443
-16401: DATA: 16410
-16402: DATA: 16509
-16403: DATA: 16413
-16404: DATA: 16557
-16405: DATA: 16542
-16406: DATA: 16528
-16407: DATA: 17188
-16408: DATA: 17204
-16409: DATA: 17225
-16410: DATA: 17297
-16411: DATA: 17407
-16412: DATA: 16931
-16413: DATA: 17016
-16414: DATA: 17136
-16415: DATA: 17144
-16416: DATA: 17723
-16417: DATA: 17766
-16418: DATA: 17841
-16419: DATA: 17908
-16420: DATA: 17447
-16421: DATA: 17453
-16422: DATA: 17556
-16423: DATA: 17600
-16424: DATA: 18276
-16425: DATA: 18348
-16426: DATA: 18387
-16427: DATA: 17945
-16428: DATA: 18093
-16429: DATA: 18131
-16430: DATA: 18807
-16431: DATA: 18901
-16432: DATA: 18464
-16433: DATA: 18525
-16434: DATA: 18677
-16435: DATA: 19293
-16436: DATA: 19370
-16437: DATA: 19416
-16438: DATA: 19037
-16439: DATA: 19175
-16440: DATA: 19825
-16441: DATA: 19863
-16442: DATA: 19536
-16443: DATA: 19690
-16444: DATA: 20336
-16445: DATA: 20474
-16446: DATA: 20094
-16447: DATA: 20176
-16448: DATA: 20794
-16449: DATA: 20922
-16450: DATA: 20514
-16451: DATA: 20649
-16452: DATA: 21292
-16453: DATA: 21449
-16454: DATA: 21013
-16455: DATA: 21124
-16456: DATA: 21863
-16457: DATA: 22001
-16458: DATA: 21557
-16459: DATA: 21726
-16460: DATA: 22443
-16461: DATA: 22024
-16462: DATA: 22244
-16463: DATA: 22877
-16464: DATA: 22608
-16465: DATA: 22658
-16466: DATA: 23413
-16467: DATA: 23502
-16468: DATA: 23216
-16469: DATA: 23911
-16470: DATA: 24038
-16471: DATA: 23716
-16472: DATA: 24417
-16473: DATA: 24521
-16474: DATA: 24196
-16475: DATA: 24877
-16476: DATA: 24584
-16477: DATA: 24818
-16478: DATA: 25523
-16479: DATA: 25214
-16480: DATA: 26068
-16481: DATA: 26060
-16482: DATA: 25791
-16483: DATA: 26472
-16484: DATA: 26212
-16485: DATA: 26348
-16486: DATA: 27010
-16487: DATA: 26688
-16488: DATA: 27444
-16489: DATA: 27180
-16490: DATA: 27358
-16491: DATA: 28109
-16492: DATA: 27813
-16493: DATA: 28445
-16494: DATA: 28279
-16495: DATA: 28935
-16496: DATA: 28733
-16497: DATA: 28881
-16498: DATA: 29616
-16499: DATA: 29330
-16500: DATA: 30114
-16501: DATA: 29709
-16502: DATA: 30530
-16503: DATA: 30314
-16504: DATA: 31099
-16505: DATA: 30728
-16506: DATA: 31491
-16507: DATA: 31341
-16508: DATA: 32048
-16509: DATA: 31797
-16510: DATA: 32561
-16511: DATA: 32289
-16512: DATA: 372
-16513: DATA: 54
-16514: DATA: 831
-16515: DATA: 563
-16516: DATA: 1328
-16517: DATA: 1087
-16518: DATA: 1823
-16519: DATA: 1545
-16520: DATA: 2356
-16521: DATA: 2161
-16522: DATA: 2904
-16523: DATA: 2632
-16524: DATA: 3556
-16525: DATA: 3225
-16526: DATA: 4095
-16527: DATA: 3802
-16528: DATA: 4134
-16529: DATA: 4949
-16530: DATA: 4708
-16531: DATA: 5458
-16532: DATA: 5348
-16533: DATA: 6041
-16534: DATA: 5848
-16535: DATA: 6176
-16536: DATA: 6964
-16537: DATA: 6739
-16538: DATA: 7569
-16539: DATA: 7416
-16540: DATA: 7720
-16541: DATA: 8553
-16542: DATA: 8446
-16543: DATA: 9119
-16544: DATA: 9566
-16545: DATA: 9281
-16546: DATA: 10168
-16547: DATA: 9976
-16548: DATA: 10340
-16549: DATA: 11115
-16550: DATA: 10908
-16551: DATA: 11722
-16552: DATA: 12155
-16553: DATA: 11959
-16554: DATA: 12688
-16555: DATA: 13058
-16556: DATA: 12962
-16557: DATA: 13725
-16558: DATA: 14180
-16559: DATA: 13981
-16560: DATA: 14397
-16561: DATA: 15174
-16562: DATA: 15024
-16563: DATA: 15375
-16564: DATA: 16299
-16565: DATA: 16066
-16566: DATA: 16477
-16567: DATA: 17317
-16568: DATA: 17789
-16569: DATA: 17558
-16570: DATA: 18000
-16571: DATA: 18860
-16572: DATA: 19300
-16573: DATA: 19121
-16574: DATA: 19505
-16575: DATA: 20391
-16576: DATA: 20787
-16577: DATA: 20656
-16578: DATA: 21104
-16579: DATA: 21936
-16580: DATA: 22315
-16581: DATA: 22206
-16582: DATA: 22545
-16583: DATA: 23436
-16584: DATA: 23927
-16585: DATA: 23717
-16586: DATA: 24148
-16587: DATA: 25032
-16588: DATA: 25524
-16589: DATA: 25876
-16590: DATA: 25843
-16591: DATA: 26177
-16592: DATA: 26685
-16593: DATA: 27547
-16594: DATA: 28023
-16595: DATA: 27805
-16596: DATA: 28325
-16597: DATA: 28749
-16598: DATA: 29591
-16599: DATA: 30184
-16600: DATA: 30515
-16601: DATA: 30341
-16602: DATA: 30851
-16603: DATA: 31348
-16604: DATA: 31785
-16605: DATA: 32767
-16606: DATA: 447
-16607: DATA: 889
-16608: DATA: 1402
-16609: DATA: 1168
-16610: DATA: 1726
-16611: DATA: 2162
-16612: DATA: 2614
-16613: DATA: 3577
-16614: DATA: 3992
-16615: DATA: 4385
-16616: DATA: 4977
-16617: DATA: 5412
-16618: DATA: 5315
-16619: DATA: 5785
-16620: DATA: 6337
-16621: DATA: 6734
-16622: DATA: 7295
-16623: DATA: 7680
-16624: DATA: 8224
-16625: DATA: 9181
-16626: DATA: 9620
-16627: DATA: 10122
-16628: DATA: 10657
-16629: DATA: 11102
-16630: DATA: 11588
-16631: DATA: 12047
-16632: DATA: 12610
-16633: DATA: 13060
-16634: DATA: 13573
-16635: DATA: 14113
-16636: DATA: 14640
-16637: DATA: 15229
-16638: DATA: 15644
-16639: DATA: 16186
-16640: DATA: 16695
-16641: DATA: 17214
-16642: DATA: 17875
-16643: DATA: 18180
-16644: DATA: 18731
-16645: DATA: 19256
-16646: DATA: 19792
-16647: DATA: 20228
-16648: DATA: 20838
-16649: DATA: 21344
-16650: DATA: 21776
-16651: DATA: 22340
-16652: DATA: 22954
-16653: DATA: 23517
-16654: DATA: 24049
-16655: DATA: 24469
-16656: DATA: 24627
-16657: DATA: 25095
-16658: DATA: 25721
-16659: DATA: 26201
-16660: DATA: 26852
-16661: DATA: 27266
-16662: DATA: 27862
-16663: DATA: 29029
-16664: DATA: 29542
-16665: DATA: 30026
-16666: DATA: 30623
-16667: DATA: 31200
-16668: DATA: 31287
-16669: DATA: 31805
-16670: DATA: 32420
-16671: DATA: 253
-16672: DATA: 1333
-16673: DATA: 1889
-16674: DATA: 2544
-16675: DATA: 3070
-16676: DATA: 3115
-16677: DATA: 3683
-16678: DATA: 4228
-16679: DATA: 4823
-16680: DATA: 6011
-16681: DATA: 6569
-16682: DATA: 7056
-16683: DATA: 7193
-16684: DATA: 7852
-16685: DATA: 8408
-16686: DATA: 9520
-16687: DATA: 10129
-16688: DATA: 10299
-16689: DATA: 10842
-16690: DATA: 11490
-16691: DATA: 12637
-16692: DATA: 13232
-16693: DATA: 13762
-16694: DATA: 13840
-16695: DATA: 14577
-16696: DATA: 15740
-16697: DATA: 16256
-16698: DATA: 16464
-16699: DATA: 17083
-16700: DATA: 18213
-16701: DATA: 18856
-16702: DATA: 19004
-16703: DATA: 19617
-16704: DATA: 20858
-16705: DATA: 21471
-16706: DATA: 21594
-16707: DATA: 22153
-16708: DATA: 23340
-16709: DATA: 23976
-16710: DATA: 24144
-16711: DATA: 24707
-16712: DATA: 25976
-16713: DATA: 26602
-16714: DATA: 26719
-16715: DATA: 27359
-16716: DATA: 28644
-16717: DATA: 28690
-16718: DATA: 29430
-16719: DATA: 30485
-16720: DATA: 30752
-16721: DATA: 31389
-16722: DATA: 32633
-16723: DATA: 462
-16724: DATA: 740
-16725: DATA: 1823
-16726: DATA: 2527
-16727: DATA: 2730
-16728: DATA: 3961
-16729: DATA: 4485
-16730: DATA: 4761
-16731: DATA: 6014
-16732: DATA: 6244
-16733: DATA: 6908
-16734: DATA: 8176
-16735: DATA: 8313
-16736: DATA: 9525
-16737: DATA: 10215
-16738: DATA: 10423
-16739: DATA: 11640
-16740: DATA: 11876
-16741: DATA: 12512
-16742: DATA: 13727
-16743: DATA: 13910
-16744: DATA: 15221
-16745: DATA: 15404
-16746: DATA: 16083
-16747: DATA: 17357
-16748: DATA: 17568
-16749: DATA: 18776
-16750: DATA: 19040
-16751: DATA: 20252
-16752: DATA: 20535
-16753: DATA: 21185
-16754: DATA: 22521
-16755: DATA: 22675
-16756: DATA: 23971
-16757: DATA: 24077
-16758: DATA: 25412
-16759: DATA: 25709
-16760: DATA: 26993
-16761: DATA: 27205
-16762: DATA: 28446
-16763: DATA: 28728
-16764: DATA: 29993
-16765: DATA: 30271
-16766: DATA: 31541
-16767: DATA: 31783
-16768: DATA: 372
-16769: DATA: 626
-16770: DATA: 1889
-16771: DATA: 2149
-16772: DATA: 3427
-16773: DATA: 3683
-16774: DATA: 4981
-16775: DATA: 5131
-16776: DATA: 6523
-16777: DATA: 6775
-16778: DATA: 8004
-16779: DATA: 8261
-16780: DATA: 9665
-16781: DATA: 9870
-16782: DATA: 11263
-16783: DATA: 11456
-16784: DATA: 12320
-16785: DATA: 13597
-16786: DATA: 13844
-16787: DATA: 15178
-16788: DATA: 15521
-16789: DATA: 16798
-16790: DATA: 17092
-16791: DATA: 18004
-16792: DATA: 19266
-16793: DATA: 19524
-16794: DATA: 20869
-16795: DATA: 21217
-16796: DATA: 22064
-16797: DATA: 23357
-16798: DATA: 23697
-16799: DATA: 25083
-16800: DATA: 25888
-16801: DATA: 26224
-16802: DATA: 27571
-16803: DATA: 27893
-16804: DATA: 28709
-16805: DATA: 30048
-16806: DATA: 30354
-16807: DATA: 31680
-16808: DATA: 32614
-16809: DATA: 85
-16810: DATA: 1513
-16811: DATA: 2306
-16812: DATA: 2737
-16813: DATA: 3997
-16814: DATA: 4977
-16815: DATA: 5255
-16816: DATA: 6193
-16817: DATA: 7445
-16818: DATA: 7929
-16819: DATA: 8723
-16820: DATA: 10212
-16821: DATA: 10457
-16822: DATA: 11352
-16823: DATA: 12768
-16824: DATA: 13620
-16825: DATA: 13956
-16826: DATA: 14878
-16827: DATA: 16313
-16828: DATA: 17185
-16829: DATA: 17598
-16830: DATA: 18488
-16831: DATA: 19892
-16832: DATA: 20793
-16833: DATA: 21175
-16834: DATA: 22069
-16835: DATA: 23471
-16836: DATA: 24420
-16837: DATA: 24761
-16838: DATA: 25631
-16839: DATA: 27077
-16840: DATA: 28021
-16841: DATA: 28325
-16842: DATA: 29271
-16843: DATA: 30687
-16844: DATA: 31661
-16845: DATA: 32537
-16846: DATA: 176
-16847: DATA: 1114
-16848: DATA: 2098
-16849: DATA: 3541
-16850: DATA: 4450
-16851: DATA: 4818
-16852: DATA: 5803
-16853: DATA: 6656
-16854: DATA: 8131
-16855: DATA: 9189
-16856: DATA: 10080
-16857: DATA: 10445
-16858: DATA: 11409
-16859: DATA: 12409
-16860: DATA: 13412
-16861: DATA: 14846
-16862: DATA: 15807
-16863: DATA: 16763
-16864: DATA: 17696
-16865: DATA: 18151
-16866: DATA: 19135
-16867: DATA: 20081
-16868: DATA: 21092
-16869: DATA: 22521
-16870: DATA: 23448
-16871: DATA: 24384
-16872: DATA: 25396
-16873: DATA: 26401
-16874: DATA: 26847
-16875: DATA: 27778
-16876: DATA: 28854
-16877: DATA: 29725
-16878: DATA: 30820
-16879: DATA: 31770
-16880: DATA: 116
-16881: DATA: 1473
-16882: DATA: 2552
-16883: DATA: 3480
-16884: DATA: 4580
-16885: DATA: 5467
-16886: DATA: 6481
-16887: DATA: 7536
-16888: DATA: 8568
-16889: DATA: 9489
-16890: DATA: 10590
-16891: DATA: 11629
-16892: DATA: 12644
-16893: DATA: 13572
-16894: DATA: 14655
-16895: DATA: 15648
-16896: DATA: 16756
-16897: DATA: 17723
-16898: DATA: 18751
-16899: DATA: 19753
-16900: DATA: 20781
-16901: DATA: 21806
-16902: DATA: 22805
-16903: DATA: 23877
-16904: DATA: 24928
-16905: DATA: 25965
-16906: DATA: 26965
-16907: DATA: 27917
-16908: DATA: 29098
-16909: DATA: 30088
-16910: DATA: 31229
-16911: DATA: 32215
-16912: DATA: 49
-16913: DATA: 1031
-16914: DATA: 2096
-16915: DATA: 3098
-16916: DATA: 4342
-16917: DATA: 5343
-16918: DATA: 6295
-16919: DATA: 8037
-16920: DATA: 9085
-16921: DATA: 10070
-16922: DATA: 11216
-16923: DATA: 12270
-16924: DATA: 12837
-16925: DATA: 13935
-16926: DATA: 15014
-16927: DATA: 16112
-16928: DATA: 17712
-16929: DATA: 18741
-16930: DATA: 19897
-16931: DATA: 20979
-16932: DATA: 21552
-16933: DATA: 22626
-16934: DATA: 23760
-16935: DATA: 24785
-16936: DATA: 26492
-16937: DATA: 27552
-16938: DATA: 28560
-16939: DATA: 29186
-16940: DATA: 30390
-16941: DATA: 31455
-16942: DATA: 311
-16943: DATA: 1414
-16944: DATA: 2164
-16945: DATA: 3141
-16946: DATA: 4341
-16947: DATA: 5913
-16948: DATA: 7073
-16949: DATA: 8158
-16950: DATA: 8772
-16951: DATA: 9956
-16952: DATA: 11640
-16953: DATA: 12747
-16954: DATA: 13429
-16955: DATA: 14499
-16956: DATA: 16171
-16957: DATA: 17327
-16958: DATA: 17956
-16959: DATA: 19133
-16960: DATA: 20816
-16961: DATA: 21936
-16962: DATA: 22577
-16963: DATA: 23726
-16964: DATA: 25392
-16965: DATA: 26568
-16966: DATA: 27139
-16967: DATA: 28298
-16968: DATA: 30049
-16969: DATA: 31217
-16970: DATA: 31832
-16971: DATA: 167
-16972: DATA: 1938
-16973: DATA: 2588
-16974: DATA: 3813
-16975: DATA: 5465
-16976: DATA: 6176
-16977: DATA: 7381
-16978: DATA: 9052
-16979: DATA: 10194
-16980: DATA: 10919
-16981: DATA: 12550
-16982: DATA: 13616
-16983: DATA: 14492
-16984: DATA: 16251
-16985: DATA: 17360
-16986: DATA: 18128
-16987: DATA: 19820
-16988: DATA: 20534
-16989: DATA: 21752
-16990: DATA: 23536
-16991: DATA: 24188
-16992: DATA: 25914
-16993: DATA: 27061
-16994: DATA: 27825
-16995: DATA: 29501
-16996: DATA: 30243
-16997: DATA: 31487
-16998: DATA: 409
-16999: DATA: 1089
-17000: DATA: 2868
-17001: DATA: 3626
-17002: DATA: 4822
-17003: DATA: 6605
-17004: DATA: 7350
-17005: DATA: 9042
-17006: DATA: 9855
-17007: DATA: 11544
-17008: DATA: 12327
-17009: DATA: 13461
-17010: DATA: 15332
-17011: DATA: 16021
-17012: DATA: 17829
-17013: DATA: 18521
-17014: DATA: 20240
-17015: DATA: 21094
-17016: DATA: 22907
-17017: DATA: 23563
-17018: DATA: 25348
-17019: DATA: 26175
-17020: DATA: 27947
-17021: DATA: 28721
-17022: DATA: 30576
-17023: DATA: 31265
-17024: DATA: 316
-17025: DATA: 1072
-17026: DATA: 2928
-17027: DATA: 3641
-17028: DATA: 5419
-17029: DATA: 6178
-17030: DATA: 7938
-17031: DATA: 8773
-17032: DATA: 10592
-17033: DATA: 11370
-17034: DATA: 13072
-17035: DATA: 13913
-17036: DATA: 15788
-17037: DATA: 16536
-17038: DATA: 18352
-17039: DATA: 19139
-17040: DATA: 20533
-17041: DATA: 22272
-17042: DATA: 23164
-17043: DATA: 24905
-17044: DATA: 25834
-17045: DATA: 27623
-17046: DATA: 28346
-17047: DATA: 29713
-17048: DATA: 31612
-17049: DATA: 32320
-17050: DATA: 1488
-17051: DATA: 2283
-17052: DATA: 3624
-17053: DATA: 5490
-17054: DATA: 6335
-17055: DATA: 8167
-17056: DATA: 9588
-17057: DATA: 10362
-17058: DATA: 12214
-17059: DATA: 12989
-17060: DATA: 14384
-17061: DATA: 16229
-17062: DATA: 17049
-17063: DATA: 18902
-17064: DATA: 20276
-17065: DATA: 21175
-17066: DATA: 23007
-17067: DATA: 24322
-17068: DATA: 25257
-17069: DATA: 27037
-17070: DATA: 28537
-17071: DATA: 29318
-17072: DATA: 30836
-17073: DATA: 32596
-17074: DATA: 688
-17075: DATA: 2065
-17076: DATA: 4005
-17077: DATA: 4831
-17078: DATA: 6231
-17079: DATA: 8160
-17080: DATA: 9524
-17081: DATA: 10376
-17082: DATA: 11807
-17083: DATA: 13758
-17084: DATA: 15141
-17085: DATA: 16052
-17086: DATA: 17459
-17087: DATA: 19445
-17088: DATA: 20784
-17089: DATA: 21680
-17090: DATA: 23072
-17091: DATA: 25012
-17092: DATA: 26407
-17093: DATA: 27321
-17094: DATA: 28697
-17095: DATA: 30603
-17096: DATA: 32115
-17097: DATA: 165
-17098: DATA: 1617
-17099: DATA: 3469
-17100: DATA: 5091
-17101: DATA: 6480
-17102: DATA: 7351
-17103: DATA: 8725
-17104: DATA: 10279
-17105: DATA: 12172
-17106: DATA: 13693
-17107: DATA: 14559
-17108: DATA: 16043
-17109: DATA: 17409
-17110: DATA: 19358
-17111: DATA: 20928
-17112: DATA: 22394
-17113: DATA: 23242
-17114: DATA: 24706
-17115: DATA: 26233
-17116: DATA: 27692
-17117: DATA: 29593
-17118: DATA: 31157
-17119: DATA: 32628
-17120: DATA: 1319
-17121: DATA: 2273
-17122: DATA: 3796
-17123: DATA: 5226
-17124: DATA: 6689
-17125: DATA: 8702
-17126: DATA: 10116
-17127: DATA: 11567
-17128: DATA: 13122
-17129: DATA: 14628
-17130: DATA: 15557
-17131: DATA: 17025
-17132: DATA: 18608
-17133: DATA: 19997
-17134: DATA: 21596
-17135: DATA: 23066
-17136: DATA: 24631
-17137: DATA: 26590
-17138: DATA: 27922
-17139: DATA: 29604
-17140: DATA: 31147
-17141: DATA: 32600
-17142: DATA: 1296
-17143: DATA: 2916
-17144: DATA: 4454
-17145: DATA: 5888
-17146: DATA: 7504
-17147: DATA: 8996
-17148: DATA: 10538
-17149: DATA: 12157
-17150: DATA: 13617
-17151: DATA: 15221
-17152: DATA: 16691
-17153: DATA: 18215
-17154: DATA: 19769
-17155: DATA: 21305
-17156: DATA: 22884
-17157: DATA: 24354
-17158: DATA: 25878
-17159: DATA: 27461
-17160: DATA: 29030
-17161: DATA: 30570
-17162: DATA: 32095
-17163: DATA: 832
-17164: DATA: 2487
-17165: DATA: 4061
-17166: DATA: 5604
-17167: DATA: 7133
-17168: DATA: 8245
-17169: DATA: 9729
-17170: DATA: 11312
-17171: DATA: 12894
-17172: DATA: 14507
-17173: DATA: 16003
-17174: DATA: 17604
-17175: DATA: 19767
-17176: DATA: 21371
-17177: DATA: 22857
-17178: DATA: 24528
-17179: DATA: 26105
-17180: DATA: 27180
-17181: DATA: 28792
-17182: DATA: 30448
-17183: DATA: 31985
-17184: DATA: 1339
-17185: DATA: 2938
-17186: DATA: 4514
-17187: DATA: 6077
-17188: DATA: 7216
-17189: DATA: 8802
-17190: DATA: 10448
-17191: DATA: 11985
-17192: DATA: 14204
-17193: DATA: 15776
-17194: DATA: 17296
-17195: DATA: 18459
-17196: DATA: 20133
-17197: DATA: 21704
-17198: DATA: 23932
-17199: DATA: 25473
-17200: DATA: 26746
-17201: DATA: 28223
-17202: DATA: 29850
-17203: DATA: 32041
-17204: DATA: 940
-17205: DATA: 2504
-17206: DATA: 3600
-17207: DATA: 5347
-17208: DATA: 7544
-17209: DATA: 9098
-17210: DATA: 10271
-17211: DATA: 11967
-17212: DATA: 14180
-17213: DATA: 15794
-17214: DATA: 16950
-17215: DATA: 18677
-17216: DATA: 20768
-17217: DATA: 22461
-17218: DATA: 23609
-17219: DATA: 25262
-17220: DATA: 27492
-17221: DATA: 29119
-17222: DATA: 30239
-17223: DATA: 31882
-17224: DATA: 1401
-17225: DATA: 2981
-17226: DATA: 4185
-17227: DATA: 5854
-17228: DATA: 8164
-17229: DATA: 9244
-17230: DATA: 10928
-17231: DATA: 13145
-17232: DATA: 14389
-17233: DATA: 16007
-17234: DATA: 18295
-17235: DATA: 19928
-17236: DATA: 21220
-17237: DATA: 23296
-17238: DATA: 25055
-17239: DATA: 26294
-17240: DATA: 28533
-17241: DATA: 30156
-17242: DATA: 31379
-17243: DATA: 813
-17244: DATA: 2080
-17245: DATA: 3832
-17246: DATA: 6048
-17247: DATA: 7292
-17248: DATA: 9527
-17249: DATA: 11233
-17250: DATA: 12473
-17251: DATA: 14707
-17252: DATA: 15907
-17253: DATA: 17581
-17254: DATA: 19844
-17255: DATA: 21069
-17256: DATA: 23409
-17257: DATA: 24677
-17258: DATA: 26334
-17259: DATA: 28568
-17260: DATA: 29865
-17261: DATA: 32095
-17262: DATA: 629
-17263: DATA: 2823
-17264: DATA: 4212
-17265: DATA: 5778
-17266: DATA: 8105
-17267: DATA: 9434
-17268: DATA: 11754
-17269: DATA: 12840
-17270: DATA: 15198
-17271: DATA: 16490
-17272: DATA: 18790
-17273: DATA: 19985
-17274: DATA: 22296
-17275: DATA: 23625
-17276: DATA: 25889
-17277: DATA: 27196
-17278: DATA: 29475
-17279: DATA: 30753
-17280: DATA: 336
-17281: DATA: 1570
-17282: DATA: 3893
-17283: DATA: 5166
-17284: DATA: 7472
-17285: DATA: 8775
-17286: DATA: 11046
-17287: DATA: 12292
-17288: DATA: 14689
-17289: DATA: 15977
-17290: DATA: 18244
-17291: DATA: 19469
-17292: DATA: 21896
-17293: DATA: 23186
-17294: DATA: 25587
-17295: DATA: 26846
-17296: DATA: 28884
-17297: DATA: 31020
-17298: DATA: 32383
-17299: DATA: 1864
-17300: DATA: 3300
-17301: DATA: 5516
-17302: DATA: 6850
-17303: DATA: 8736
-17304: DATA: 11060
-17305: DATA: 12364
-17306: DATA: 14750
-17307: DATA: 16045
-17308: DATA: 17957
-17309: DATA: 20285
-17310: DATA: 21687
-17311: DATA: 24039
-17312: DATA: 25917
-17313: DATA: 27249
-17314: DATA: 29680
-17315: DATA: 30962
-17316: DATA: 34
-17317: DATA: 2349
-17318: DATA: 3714
-17319: DATA: 6090
-17320: DATA: 8059
-17321: DATA: 9384
-17322: DATA: 11715
-17323: DATA: 13645
-17324: DATA: 15024
-17325: DATA: 17365
-17326: DATA: 19313
-17327: DATA: 20609
-17328: DATA: 22644
-17329: DATA: 24918
-17330: DATA: 26367
-17331: DATA: 28179
-17332: DATA: 30640
-17333: DATA: 31967
-17334: DATA: 1119
-17335: DATA: 3561
-17336: DATA: 5428
-17337: DATA: 6801
-17338: DATA: 8728
-17339: DATA: 11176
-17340: DATA: 13156
-17341: DATA: 14521
-17342: DATA: 16447
-17343: DATA: 18874
-17344: DATA: 20774
-17345: DATA: 22261
-17346: DATA: 24100
-17347: DATA: 26546
-17348: DATA: 28516
-17349: DATA: 29881
-17350: DATA: 31768
-17351: DATA: 1408
-17352: DATA: 3380
-17353: DATA: 4851
-17354: DATA: 6737
-17355: DATA: 9176
-17356: DATA: 11176
-17357: DATA: 13065
-17358: DATA: 14526
-17359: DATA: 16447
-17360: DATA: 18526
-17361: DATA: 20897
-17362: DATA: 22904
-17363: DATA: 24280
-17364: DATA: 26340
-17365: DATA: 28171
-17366: DATA: 30684
-17367: DATA: 32682
-17368: DATA: 1915
-17369: DATA: 3287
-17370: DATA: 5328
-17371: DATA: 7266
-17372: DATA: 9250
-17373: DATA: 11709
-17374: DATA: 13732
-17375: DATA: 15741
-17376: DATA: 17725
-17377: DATA: 19174
-17378: DATA: 21232
-17379: DATA: 23151
-17380: DATA: 25131
-17381: DATA: 27618
-17382: DATA: 29597
-17383: DATA: 31493
-17384: DATA: 893
-17385: DATA: 2870
-17386: DATA: 4240
-17387: DATA: 6284
-17388: DATA: 8420
-17389: DATA: 10321
-17390: DATA: 12401
-17391: DATA: 14343
-17392: DATA: 16435
-17393: DATA: 18896
-17394: DATA: 20912
-17395: DATA: 22928
-17396: DATA: 25003
-17397: DATA: 26974
-17398: DATA: 29009
-17399: DATA: 31084
-17400: DATA: 375
-17401: DATA: 2373
-17402: DATA: 4372
-17403: DATA: 6440
-17404: DATA: 8500
-17405: DATA: 10548
-17406: DATA: 12595
-17407: DATA: 14625
-17408: DATA: 16701
-17409: DATA: 18747
-17410: DATA: 20791
-17411: DATA: 22909
-17412: DATA: 24869
-17413: DATA: 26989
-17414: DATA: 29015
-17415: DATA: 31055
-17416: DATA: 307
-17417: DATA: 2341
-17418: DATA: 4419
-17419: DATA: 6484
-17420: DATA: 8617
-17421: DATA: 10655
-17422: DATA: 12799
-17423: DATA: 14809
-17424: DATA: 16506
-17425: DATA: 18544
-17426: DATA: 20606
-17427: DATA: 22610
-17428: DATA: 24758
-17429: DATA: 26777
-17430: DATA: 28888
-17431: DATA: 31553
-17432: DATA: 867
-17433: DATA: 2880
-17434: DATA: 4995
-17435: DATA: 7161
-17436: DATA: 8769
-17437: DATA: 10827
-17438: DATA: 12977
-17439: DATA: 15072
-17440: DATA: 17720
-17441: DATA: 19809
-17442: DATA: 21764
-17443: DATA: 24009
-17444: DATA: 25644
-17445: DATA: 27748
-17446: DATA: 29827
-17447: DATA: 31877
-17448: DATA: 1890
-17449: DATA: 4004
-17450: DATA: 6085
-17451: DATA: 7681
-17452: DATA: 9904
-17453: DATA: 11933
-17454: DATA: 14707
-17455: DATA: 16794
-17456: DATA: 18490
-17457: DATA: 20545
-17458: DATA: 22769
-17459: DATA: 25364
-17460: DATA: 27562
-17461: DATA: 29662
-17462: DATA: 31248
-17463: DATA: 748
-17464: DATA: 3450
-17465: DATA: 5510
-17466: DATA: 7170
-17467: DATA: 9384
-17468: DATA: 12064
-17469: DATA: 14260
-17470: DATA: 15922
-17471: DATA: 18105
-17472: DATA: 20785
-17473: DATA: 23029
-17474: DATA: 24610
-17475: DATA: 26804
-17476: DATA: 29479
-17477: DATA: 31653
-17478: DATA: 533
-17479: DATA: 2710
-17480: DATA: 5429
-17481: DATA: 7589
-17482: DATA: 9232
-17483: DATA: 11517
-17484: DATA: 14253
-17485: DATA: 15889
-17486: DATA: 18165
-17487: DATA: 20806
-17488: DATA: 22644
-17489: DATA: 24730
-17490: DATA: 27510
-17491: DATA: 29597
-17492: DATA: 31395
-17493: DATA: 1282
-17494: DATA: 3548
-17495: DATA: 5281
-17496: DATA: 7988
-17497: DATA: 10180
-17498: DATA: 11934
-17499: DATA: 14697
-17500: DATA: 16484
-17501: DATA: 18669
-17502: DATA: 21436
-17503: DATA: 23156
-17504: DATA: 25888
-17505: DATA: 28156
-17506: DATA: 29886
-17507: DATA: 32616
-17508: DATA: 1577
-17509: DATA: 3757
-17510: DATA: 6547
-17511: DATA: 8266
-17512: DATA: 11133
-17513: DATA: 12843
-17514: DATA: 15043
-17515: DATA: 17869
-17516: DATA: 19639
-17517: DATA: 22344
-17518: DATA: 24162
-17519: DATA: 26887
-17520: DATA: 28731
-17521: DATA: 30912
-17522: DATA: 1022
-17523: DATA: 2713
-17524: DATA: 5604
-17525: DATA: 7252
-17526: DATA: 10079
-17527: DATA: 11888
-17528: DATA: 14648
-17529: DATA: 16453
-17530: DATA: 19217
-17531: DATA: 21027
-17532: DATA: 23840
-17533: DATA: 25725
-17534: DATA: 28452
-17535: DATA: 30269
-17536: DATA: 305
-17537: DATA: 2165
-17538: DATA: 4903
-17539: DATA: 6716
-17540: DATA: 9512
-17541: DATA: 11297
-17542: DATA: 14083
-17543: DATA: 15941
-17544: DATA: 18805
-17545: DATA: 20599
-17546: DATA: 23381
-17547: DATA: 25101
-17548: DATA: 28069
-17549: DATA: 29849
-17550: DATA: 32767
-17551: DATA: 1735
-17552: DATA: 4154
-17553: DATA: 6928
-17554: DATA: 8820
-17555: DATA: 11549
-17556: DATA: 13491
-17557: DATA: 16260
-17558: DATA: 18116
-17559: DATA: 20525
-17560: DATA: 23348
-17561: DATA: 25169
-17562: DATA: 28063
-17563: DATA: 29949
-17564: DATA: 32293
-17565: DATA: 2407
-17566: DATA: 4277
-17567: DATA: 7142
-17568: DATA: 9592
-17569: DATA: 11317
-17570: DATA: 14242
-17571: DATA: 16104
-17572: DATA: 18470
-17573: DATA: 21348
-17574: DATA: 23189
-17575: DATA: 26070
-17576: DATA: 28472
-17577: DATA: 30437
-17578: DATA: 451
-17579: DATA: 2828
-17580: DATA: 4788
-17581: DATA: 7629
-17582: DATA: 10104
-17583: DATA: 11932
-17584: DATA: 14374
-17585: DATA: 17232
-17586: DATA: 19171
-17587: DATA: 21585
-17588: DATA: 24548
-17589: DATA: 26312
-17590: DATA: 28765
-17591: DATA: 31712
-17592: DATA: 1382
-17593: DATA: 3204
-17594: DATA: 5660
-17595: DATA: 8617
-17596: DATA: 11063
-17597: DATA: 13041
-17598: DATA: 15472
-17599: DATA: 18362
-17600: DATA: 20772
-17601: DATA: 22708
-17602: DATA: 25148
-17603: DATA: 28078
-17604: DATA: 30568
-17605: DATA: 32493
-17606: DATA: 2068
-17607: DATA: 5004
-17608: DATA: 7544
-17609: DATA: 9452
-17610: DATA: 11844
-17611: DATA: 14789
-17612: DATA: 17325
-17613: DATA: 19720
-17614: DATA: 21757
-17615: DATA: 24085
-17616: DATA: 26679
-17617: DATA: 29575
-17618: DATA: 32105
-17619: DATA: 1230
-17620: DATA: 3760
-17621: DATA: 6156
-17622: DATA: 9180
-17623: DATA: 11702
-17624: DATA: 14136
-17625: DATA: 16005
-17626: DATA: 18581
-17627: DATA: 21089
-17628: DATA: 23585
-17629: DATA: 26607
-17630: DATA: 29113
-17631: DATA: 31584
-17632: DATA: 1337
-17633: DATA: 3256
-17634: DATA: 5857
-17635: DATA: 8236
-17636: DATA: 10865
-17637: DATA: 13729
-17638: DATA: 16336
-17639: DATA: 18756
-17640: DATA: 21370
-17641: DATA: 23841
-17642: DATA: 25744
-17643: DATA: 28312
-17644: DATA: 30890
-17645: DATA: 594
-17646: DATA: 3186
-17647: DATA: 5633
-17648: DATA: 8245
-17649: DATA: 11228
-17650: DATA: 13822
-17651: DATA: 16276
-17652: DATA: 18865
-17653: DATA: 21312
-17654: DATA: 23838
-17655: DATA: 26368
-17656: DATA: 29048
-17657: DATA: 31488
-17658: DATA: 1297
-17659: DATA: 3899
-17660: DATA: 6433
-17661: DATA: 9026
-17662: DATA: 11542
-17663: DATA: 14112
-17664: DATA: 16697
-17665: DATA: 19255
-17666: DATA: 21820
-17667: DATA: 24372
-17668: DATA: 26922
-17669: DATA: 29482
-17670: DATA: 32080
-17671: DATA: 1796
-17672: DATA: 4454
-17673: DATA: 7018
-17674: DATA: 9541
-17675: DATA: 12099
-17676: DATA: 14752
-17677: DATA: 17373
-17678: DATA: 19961
-17679: DATA: 22491
-17680: DATA: 24692
-17681: DATA: 27137
-17682: DATA: 29816
-17683: DATA: 32344
-17684: DATA: 2276
-17685: DATA: 4745
-17686: DATA: 7377
-17687: DATA: 10551
-17688: DATA: 13183
-17689: DATA: 15691
-17690: DATA: 18325
-17691: DATA: 20990
-17692: DATA: 23095
-17693: DATA: 25726
-17694: DATA: 28295
-17695: DATA: 30972
-17696: DATA: 1312
-17697: DATA: 3965
-17698: DATA: 6591
-17699: DATA: 9192
-17700: DATA: 11312
-17701: DATA: 13869
-17702: DATA: 16529
-17703: DATA: 19077
-17704: DATA: 22375
-17705: DATA: 25002
-17706: DATA: 27589
-17707: DATA: 29727
-17708: DATA: 32423
-17709: DATA: 2264
-17710: DATA: 5424
-17711: DATA: 8090
-17712: DATA: 10290
-17713: DATA: 12821
-17714: DATA: 15612
-17715: DATA: 18708
-17716: DATA: 21411
-17717: DATA: 24005
-17718: DATA: 26180
-17719: DATA: 28841
-17720: DATA: 32052
-17721: DATA: 1948
-17722: DATA: 4127
-17723: DATA: 6840
-17724: DATA: 10084
-17725: DATA: 12725
-17726: DATA: 14897
-17727: DATA: 17571
-17728: DATA: 20785
-17729: DATA: 23541
-17730: DATA: 25650
-17731: DATA: 28344
-17732: DATA: 31527
-17733: DATA: 1442
-17734: DATA: 3613
-17735: DATA: 6272
-17736: DATA: 9524
-17737: DATA: 12269
-17738: DATA: 14431
-17739: DATA: 17117
-17740: DATA: 20385
-17741: DATA: 22545
-17742: DATA: 25333
-17743: DATA: 28486
-17744: DATA: 30759
-17745: DATA: 665
-17746: DATA: 3945
-17747: DATA: 6557
-17748: DATA: 8872
-17749: DATA: 12034
-17750: DATA: 14787
-17751: DATA: 17073
-17752: DATA: 20276
-17753: DATA: 22980
-17754: DATA: 25246
-17755: DATA: 28521
-17756: DATA: 30820
-17757: DATA: 764
-17758: DATA: 4002
-17759: DATA: 6256
-17760: DATA: 9588
-17761: DATA: 12275
-17762: DATA: 14501
-17763: DATA: 17776
-17764: DATA: 20006
-17765: DATA: 22753
-17766: DATA: 26009
-17767: DATA: 28235
-17768: DATA: 31603
-17769: DATA: 1125
-17770: DATA: 3793
-17771: DATA: 7071
-17772: DATA: 9387
-17773: DATA: 12616
-17774: DATA: 14974
-17775: DATA: 18193
-17776: DATA: 20596
-17777: DATA: 23260
-17778: DATA: 26622
-17779: DATA: 28893
-17780: DATA: 32176
-17781: DATA: 1605
-17782: DATA: 4949
-17783: DATA: 7205
-17784: DATA: 10608
-17785: DATA: 12804
-17786: DATA: 16130
-17787: DATA: 18470
-17788: DATA: 21802
-17789: DATA: 24120
-17790: DATA: 27427
-17791: DATA: 29734
-17792: DATA: 378
-17793: DATA: 2642
-17794: DATA: 5942
-17795: DATA: 8242
-17796: DATA: 11574
-17797: DATA: 13882
-17798: DATA: 17169
-17799: DATA: 19479
-17800: DATA: 22896
-17801: DATA: 25089
-17802: DATA: 28498
-17803: DATA: 30796
-17804: DATA: 1447
-17805: DATA: 3734
-17806: DATA: 7055
-17807: DATA: 9459
-17808: DATA: 12321
-17809: DATA: 15640
-17810: DATA: 18034
-17811: DATA: 21329
-17812: DATA: 23725
-17813: DATA: 27011
-17814: DATA: 29399
-17815: DATA: 32357
-17816: DATA: 2933
-17817: DATA: 5207
-17818: DATA: 8607
-17819: DATA: 11000
-17820: DATA: 13866
-17821: DATA: 17273
-17822: DATA: 19696
-17823: DATA: 23036
-17824: DATA: 25914
-17825: DATA: 28213
-17826: DATA: 31652
-17827: DATA: 1269
-17828: DATA: 4129
-17829: DATA: 7469
-17830: DATA: 9876
-17831: DATA: 13252
-17832: DATA: 16230
-17833: DATA: 18606
-17834: DATA: 21982
-17835: DATA: 24840
-17836: DATA: 27319
-17837: DATA: 30670
-17838: DATA: 846
-17839: DATA: 3244
-17840: DATA: 6203
-17841: DATA: 9536
-17842: DATA: 11952
-17843: DATA: 14878
-17844: DATA: 18341
-17845: DATA: 20675
-17846: DATA: 23575
-17847: DATA: 27121
-17848: DATA: 30004
-17849: DATA: 32406
-17850: DATA: 2581
-17851: DATA: 6056
-17852: DATA: 9001
-17853: DATA: 11517
-17854: DATA: 14372
-17855: DATA: 17850
-17856: DATA: 20852
-17857: DATA: 23219
-17858: DATA: 26169
-17859: DATA: 29619
-17860: DATA: 32544
-17861: DATA: 2285
-17862: DATA: 5129
-17863: DATA: 8586
-17864: DATA: 11617
-17865: DATA: 14071
-17866: DATA: 16912
-17867: DATA: 20442
-17868: DATA: 23461
-17869: DATA: 26372
-17870: DATA: 28862
-17871: DATA: 31765
-17872: DATA: 2164
-17873: DATA: 5565
-17874: DATA: 8575
-17875: DATA: 10954
-17876: DATA: 13985
-17877: DATA: 16923
-17878: DATA: 20437
-17879: DATA: 23479
-17880: DATA: 26424
-17881: DATA: 28805
-17882: DATA: 31881
-17883: DATA: 2146
-17884: DATA: 5169
-17885: DATA: 8637
-17886: DATA: 11700
-17887: DATA: 14714
-17888: DATA: 17780
-17889: DATA: 20193
-17890: DATA: 23224
-17891: DATA: 26228
-17892: DATA: 29226
-17893: DATA: 32742
-17894: DATA: 3024
-17895: DATA: 5980
-17896: DATA: 9083
-17897: DATA: 12080
-17898: DATA: 14480
-17899: DATA: 17541
-17900: DATA: 20641
-17901: DATA: 23644
-17902: DATA: 26722
-17903: DATA: 29781
-17904: DATA: 56
-17905: DATA: 3546
-17906: DATA: 6631
-17907: DATA: 9693
-17908: DATA: 12707
-17909: DATA: 15711
-17910: DATA: 18783
-17911: DATA: 21874
-17912: DATA: 24952
-17913: DATA: 27916
-17914: DATA: 31006
-17915: DATA: 1322
-17916: DATA: 4452
-17917: DATA: 7476
-17918: DATA: 10558
-17919: DATA: 13685
-17920: DATA: 16672
-17921: DATA: 19773
-17922: DATA: 22837
-17923: DATA: 25981
-17924: DATA: 28960
-17925: DATA: 32036
-17926: DATA: 2307
-17927: DATA: 5393
-17928: DATA: 8565
-17929: DATA: 11627
-17930: DATA: 14675
-17931: DATA: 17736
-17932: DATA: 20970
-17933: DATA: 24062
-17934: DATA: 27106
-17935: DATA: 30144
-17936: DATA: 58
-17937: DATA: 3198
-17938: DATA: 6265
-17939: DATA: 9299
-17940: DATA: 12466
-17941: DATA: 15496
-17942: DATA: 18627
-17943: DATA: 22321
-17944: DATA: 25469
-17945: DATA: 28482
-17946: DATA: 31633
-17947: DATA: 2041
-17948: DATA: 4641
-17949: DATA: 7692
-17950: DATA: 10880
-17951: DATA: 14068
-17952: DATA: 17722
-17953: DATA: 20860
-17954: DATA: 23987
-17955: DATA: 27126
-17956: DATA: 29729
-17957: DATA: 105
-17958: DATA: 3280
-17959: DATA: 6340
-17960: DATA: 10106
-17961: DATA: 13217
-17962: DATA: 16272
-17963: DATA: 18945
-17964: DATA: 22187
-17965: DATA: 25294
-17966: DATA: 29028
-17967: DATA: 32188
-17968: DATA: 2048
-17969: DATA: 5213
-17970: DATA: 8437
-17971: DATA: 12125
-17972: DATA: 15267
-17973: DATA: 18399
-17974: DATA: 21087
-17975: DATA: 24306
-17976: DATA: 28024
-17977: DATA: 31116
-17978: DATA: 1054
-17979: DATA: 4266
-17980: DATA: 8036
-17981: DATA: 11188
-17982: DATA: 13859
-17983: DATA: 17141
-17984: DATA: 20787
-17985: DATA: 23984
-17986: DATA: 26660
-17987: DATA: 29865
-17988: DATA: 813
-17989: DATA: 4003
-17990: DATA: 6679
-17991: DATA: 9925
-17992: DATA: 13688
-17993: DATA: 16874
-17994: DATA: 19525
-17995: DATA: 22729
-17996: DATA: 26529
-17997: DATA: 29199
-17998: DATA: 32446
-17999: DATA: 3349
-18000: DATA: 6260
-18001: DATA: 9393
-18002: DATA: 13177
-18003: DATA: 16345
-18004: DATA: 19172
-18005: DATA: 22820
-18006: DATA: 26000
-18007: DATA: 28840
-18008: DATA: 32625
-18009: DATA: 3019
-18010: DATA: 5764
-18011: DATA: 9572
-18012: DATA: 12331
-18013: DATA: 15603
-18014: DATA: 19440
-18015: DATA: 22113
-18016: DATA: 25916
-18017: DATA: 29168
-18018: DATA: 31906
-18019: DATA: 2936
-18020: DATA: 5732
-18021: DATA: 8940
-18022: DATA: 12674
-18023: DATA: 15424
-18024: DATA: 19252
-18025: DATA: 22018
-18026: DATA: 25282
-18027: DATA: 29080
-18028: DATA: 31905
-18029: DATA: 2894
-18030: DATA: 5680
-18031: DATA: 9489
-18032: DATA: 12347
-18033: DATA: 15554
-18034: DATA: 19454
-18035: DATA: 22237
-18036: DATA: 26028
-18037: DATA: 28744
-18038: DATA: 32578
-18039: DATA: 2656
-18040: DATA: 6443
-18041: DATA: 9318
-18042: DATA: 13058
-18043: DATA: 15928
-18044: DATA: 19754
-18045: DATA: 22617
-18046: DATA: 26407
-18047: DATA: 29236
-18048: DATA: 317
-18049: DATA: 3105
-18050: DATA: 6996
-18051: DATA: 9781
-18052: DATA: 13613
-18053: DATA: 16425
-18054: DATA: 20245
-18055: DATA: 23136
-18056: DATA: 26993
-18057: DATA: 29796
-18058: DATA: 836
-18059: DATA: 3656
-18060: DATA: 7594
-18061: DATA: 10493
-18062: DATA: 14230
-18063: DATA: 17089
-18064: DATA: 20533
-18065: DATA: 24343
-18066: DATA: 27260
-18067: DATA: 31064
-18068: DATA: 1200
-18069: DATA: 4965
-18070: DATA: 7908
-18071: DATA: 11309
-18072: DATA: 15217
-18073: DATA: 17925
-18074: DATA: 21892
-18075: DATA: 24812
-18076: DATA: 28198
-18077: DATA: 32113
-18078: DATA: 2229
-18079: DATA: 6113
-18080: DATA: 9588
-18081: DATA: 12390
-18082: DATA: 16309
-18083: DATA: 19192
-18084: DATA: 22569
-18085: DATA: 26494
-18086: DATA: 29392
-18087: DATA: 452
-18088: DATA: 3940
-18089: DATA: 6837
-18090: DATA: 10690
-18091: DATA: 14082
-18092: DATA: 17076
-18093: DATA: 20943
-18094: DATA: 24441
-18095: DATA: 27284
-18096: DATA: 30752
-18097: DATA: 1872
-18098: DATA: 4784
-18099: DATA: 8219
-18100: DATA: 12203
-18101: DATA: 15071
-18102: DATA: 18448
-18103: DATA: 22512
-18104: DATA: 25959
-18105: DATA: 28800
-18106: DATA: 32336
-18107: DATA: 3500
-18108: DATA: 6967
-18109: DATA: 9981
-18110: DATA: 13361
-18111: DATA: 17397
-18112: DATA: 20771
-18113: DATA: 23719
-18114: DATA: 27193
-18115: DATA: 31145
-18116: DATA: 1837
-18117: DATA: 4771
-18118: DATA: 8215
-18119: DATA: 12229
-18120: DATA: 15719
-18121: DATA: 18672
-18122: DATA: 22082
-18123: DATA: 26059
-18124: DATA: 29605
-18125: DATA: 286
-18126: DATA: 3317
-18127: DATA: 6677
-18128: DATA: 10294
-18129: DATA: 14208
-18130: DATA: 17764
-18131: DATA: 20637
-18132: DATA: 24237
-18133: DATA: 27678
-18134: DATA: 31632
-18135: DATA: 2480
-18136: DATA: 6010
-18137: DATA: 8899
-18138: DATA: 12447
-18139: DATA: 15999
-18140: DATA: 19504
-18141: DATA: 23528
-18142: DATA: 27070
-18143: DATA: 30580
-18144: DATA: 1312
-18145: DATA: 4336
-18146: DATA: 7868
-18147: DATA: 11364
-18148: DATA: 14948
-18149: DATA: 18927
-18150: DATA: 22428
-18151: DATA: 25924
-18152: DATA: 29562
-18153: DATA: 302
-18154: DATA: 3230
-18155: DATA: 6861
-18156: DATA: 10468
-18157: DATA: 13933
-18158: DATA: 17525
-18159: DATA: 20999
-18160: DATA: 24636
-18161: DATA: 28628
-18162: DATA: 32224
-18163: DATA: 2958
-18164: DATA: 6628
-18165: DATA: 10068
-18166: DATA: 13663
-18167: DATA: 17264
-18168: DATA: 20788
-18169: DATA: 24342
-18170: DATA: 27928
-18171: DATA: 31522
-18172: DATA: 2353
-18173: DATA: 5937
-18174: DATA: 9524
-18175: DATA: 13173
-18176: DATA: 16641
-18177: DATA: 20230
-18178: DATA: 23829
-18179: DATA: 27517
-18180: DATA: 31021
-18181: DATA: 1849
-18182: DATA: 5456
-18183: DATA: 8964
-18184: DATA: 12647
-18185: DATA: 16165
-18186: DATA: 19793
-18187: DATA: 23309
-18188: DATA: 27059
-18189: DATA: 30607
-18190: DATA: 1529
-18191: DATA: 5057
-18192: DATA: 8253
-18193: DATA: 11803
-18194: DATA: 15479
-18195: DATA: 18973
-18196: DATA: 22711
-18197: DATA: 26264
-18198: DATA: 29890
-18199: DATA: 1315
-18200: DATA: 4981
-18201: DATA: 8518
-18202: DATA: 12181
-18203: DATA: 15779
-18204: DATA: 19050
-18205: DATA: 22579
-18206: DATA: 26333
-18207: DATA: 29936
-18208: DATA: 1337
-18209: DATA: 4965
-18210: DATA: 8612
-18211: DATA: 12260
-18212: DATA: 15460
-18213: DATA: 19041
-18214: DATA: 22673
-18215: DATA: 26315
-18216: DATA: 30560
-18217: DATA: 1440
-18218: DATA: 5058
-18219: DATA: 8195
-18220: DATA: 11967
-18221: DATA: 15593
-18222: DATA: 19832
-18223: DATA: 23440
-18224: DATA: 26740
-18225: DATA: 30297
-18226: DATA: 1265
-18227: DATA: 5395
-18228: DATA: 9136
-18229: DATA: 12744
-18230: DATA: 15938
-18231: DATA: 19691
-18232: DATA: 23860
-18233: DATA: 27542
-18234: DATA: 30741
-18235: DATA: 1704
-18236: DATA: 5929
-18237: DATA: 9646
-18238: DATA: 12912
-18239: DATA: 16545
-18240: DATA: 20795
-18241: DATA: 24565
-18242: DATA: 27704
-18243: DATA: 31420
-18244: DATA: 2866
-18245: DATA: 6568
-18246: DATA: 9808
-18247: DATA: 13460
-18248: DATA: 17761
-18249: DATA: 21484
-18250: DATA: 24644
-18251: DATA: 28360
-18252: DATA: 32740
-18253: DATA: 3100
-18254: DATA: 6832
-18255: DATA: 11095
-18256: DATA: 14397
-18257: DATA: 18049
-18258: DATA: 22320
-18259: DATA: 26066
-18260: DATA: 29346
-18261: DATA: 845
-18262: DATA: 4551
-18263: DATA: 7840
-18264: DATA: 12149
-18265: DATA: 15831
-18266: DATA: 19152
-18267: DATA: 23407
-18268: DATA: 26673
-18269: DATA: 30441
-18270: DATA: 2032
-18271: DATA: 5236
-18272: DATA: 9508
-18273: DATA: 13285
-18274: DATA: 16565
-18275: DATA: 20860
-18276: DATA: 24118
-18277: DATA: 27902
-18278: DATA: 32208
-18279: DATA: 2634
-18280: DATA: 7008
-18281: DATA: 10285
-18282: DATA: 14037
-18283: DATA: 18335
-18284: DATA: 21683
-18285: DATA: 25940
-18286: DATA: 29283
-18287: DATA: 784
-18288: DATA: 4212
-18289: DATA: 7891
-18290: DATA: 12261
-18291: DATA: 15507
-18292: DATA: 19879
-18293: DATA: 23129
-18294: DATA: 27481
-18295: DATA: 30826
-18296: DATA: 2426
-18297: DATA: 5636
-18298: DATA: 10012
-18299: DATA: 13411
-18300: DATA: 17764
-18301: DATA: 21117
-18302: DATA: 25369
-18303: DATA: 28705
-18304: DATA: 372
-18305: DATA: 3644
-18306: DATA: 7971
-18307: DATA: 11377
-18308: DATA: 15716
-18309: DATA: 18981
-18310: DATA: 23327
-18311: DATA: 26642
-18312: DATA: 31089
-18313: DATA: 1651
-18314: DATA: 5973
-18315: DATA: 9311
-18316: DATA: 13800
-18317: DATA: 17117
-18318: DATA: 21475
-18319: DATA: 24788
-18320: DATA: 28720
-18321: DATA: 341
-18322: DATA: 3684
-18323: DATA: 8021
-18324: DATA: 11429
-18325: DATA: 15769
-18326: DATA: 19088
-18327: DATA: 23084
-18328: DATA: 27488
-18329: DATA: 30725
-18330: DATA: 2457
-18331: DATA: 5886
-18332: DATA: 9828
-18333: DATA: 14194
-18334: DATA: 17573
-18335: DATA: 21985
-18336: DATA: 25972
-18337: DATA: 29306
-18338: DATA: 950
-18339: DATA: 4285
-18340: DATA: 8235
-18341: DATA: 12644
-18342: DATA: 16028
-18343: DATA: 20363
-18344: DATA: 24339
-18345: DATA: 27817
-18346: DATA: 32209
-18347: DATA: 3331
-18348: DATA: 6832
-18349: DATA: 11224
-18350: DATA: 15202
-18351: DATA: 18587
-18352: DATA: 22567
-18353: DATA: 26977
-18354: DATA: 30456
-18355: DATA: 1560
-18356: DATA: 6116
-18357: DATA: 9409
-18358: DATA: 13393
-18359: DATA: 17899
-18360: DATA: 21856
-18361: DATA: 25216
-18362: DATA: 29186
-18363: DATA: 931
-18364: DATA: 4964
-18365: DATA: 8366
-18366: DATA: 12341
-18367: DATA: 16816
-18368: DATA: 20793
-18369: DATA: 24230
-18370: DATA: 28272
-18371: DATA: 32681
-18372: DATA: 3883
-18373: DATA: 7405
-18374: DATA: 11288
-18375: DATA: 15748
-18376: DATA: 19810
-18377: DATA: 23264
-18378: DATA: 27152
-18379: DATA: 31708
-18380: DATA: 2993
-18381: DATA: 6932
-18382: DATA: 10468
-18383: DATA: 14416
-18384: DATA: 18548
-18385: DATA: 22932
-18386: DATA: 26928
-18387: DATA: 30431
-18388: DATA: 1709
-18389: DATA: 5657
-18390: DATA: 10128
-18391: DATA: 14250
-18392: DATA: 18290
-18393: DATA: 21637
-18394: DATA: 25735
-18395: DATA: 29800
-18396: DATA: 1061
-18397: DATA: 5615
-18398: DATA: 9712
-18399: DATA: 13687
-18400: DATA: 17697
-18401: DATA: 21217
-18402: DATA: 25328
-18403: DATA: 29308
-18404: DATA: 564
-18405: DATA: 5117
-18406: DATA: 9109
-18407: DATA: 13124
-18408: DATA: 17254
-18409: DATA: 21302
-18410: DATA: 24720
-18411: DATA: 28802
-18412: DATA: 176
-18413: DATA: 4181
-18414: DATA: 8309
-18415: DATA: 12295
-18416: DATA: 16419
-18417: DATA: 20956
-18418: DATA: 25059
-18419: DATA: 29080
-18420: DATA: 484
-18421: DATA: 4427
-18422: DATA: 8517
-18423: DATA: 12651
-18424: DATA: 16759
-18425: DATA: 20753
-18426: DATA: 24857
-18427: DATA: 28962
-18428: DATA: 298
-18429: DATA: 4412
-18430: DATA: 8508
-18431: DATA: 12667
-18432: DATA: 16756
-18433: DATA: 20853
-18434: DATA: 24857
-18435: DATA: 28969
-18436: DATA: 356
-18437: DATA: 4388
-18438: DATA: 8451
-18439: DATA: 12613
-18440: DATA: 16763
-18441: DATA: 20835
-18442: DATA: 24918
-18443: DATA: 28941
-18444: DATA: 422
-18445: DATA: 4488
-18446: DATA: 8676
-18447: DATA: 12693
-18448: DATA: 16444
-18449: DATA: 20500
-18450: DATA: 24672
-18451: DATA: 28749
-18452: DATA: 173
-18453: DATA: 4225
-18454: DATA: 8393
-18455: DATA: 13157
-18456: DATA: 17266
-18457: DATA: 21328
-18458: DATA: 25500
-18459: DATA: 29665
-18460: DATA: 612
-18461: DATA: 4722
-18462: DATA: 8886
-18463: DATA: 12981
-18464: DATA: 17723
-18465: DATA: 21884
-18466: DATA: 26044
-18467: DATA: 30131
-18468: DATA: 1103
-18469: DATA: 5217
-18470: DATA: 9369
-18471: DATA: 13521
-18472: DATA: 18228
-18473: DATA: 22441
-18474: DATA: 26577
-18475: DATA: 30211
-18476: DATA: 1712
-18477: DATA: 5848
-18478: DATA: 10594
-18479: DATA: 14747
-18480: DATA: 18435
-18481: DATA: 22625
-18482: DATA: 26872
-18483: DATA: 31512
-18484: DATA: 3044
-18485: DATA: 7105
-18486: DATA: 10833
-18487: DATA: 15083
-18488: DATA: 19808
-18489: DATA: 23936
-18490: DATA: 27650
-18491: DATA: 31907
-18492: DATA: 3940
-18493: DATA: 8110
-18494: DATA: 11829
-18495: DATA: 16048
-18496: DATA: 20793
-18497: DATA: 24998
-18498: DATA: 28784
-18499: DATA: 169
-18500: DATA: 4907
-18501: DATA: 9197
-18502: DATA: 12824
-18503: DATA: 17028
-18504: DATA: 21858
-18505: DATA: 26080
-18506: DATA: 29712
-18507: DATA: 1244
-18508: DATA: 6065
-18509: DATA: 9748
-18510: DATA: 14052
-18511: DATA: 18768
-18512: DATA: 22644
-18513: DATA: 26772
-18514: DATA: 31536
-18515: DATA: 3039
-18516: DATA: 6829
-18517: DATA: 11545
-18518: DATA: 15760
-18519: DATA: 19626
-18520: DATA: 24434
-18521: DATA: 28549
-18522: DATA: 32391
-18523: DATA: 4456
-18524: DATA: 8229
-18525: DATA: 12527
-18526: DATA: 17406
-18527: DATA: 21045
-18528: DATA: 25972
-18529: DATA: 30172
-18530: DATA: 1188
-18531: DATA: 5949
-18532: DATA: 9773
-18533: DATA: 14078
-18534: DATA: 18896
-18535: DATA: 22601
-18536: DATA: 27517
-18537: DATA: 31281
-18538: DATA: 2704
-18539: DATA: 7564
-18540: DATA: 11434
-18541: DATA: 16217
-18542: DATA: 20016
-18543: DATA: 24837
-18544: DATA: 28710
-18545: DATA: 218
-18546: DATA: 5108
-18547: DATA: 8840
-18548: DATA: 13735
-18549: DATA: 17476
-18550: DATA: 22366
-18551: DATA: 26210
-18552: DATA: 31028
-18553: DATA: 2052
-18554: DATA: 6992
-18555: DATA: 10799
-18556: DATA: 15670
-18557: DATA: 19508
-18558: DATA: 24375
-18559: DATA: 28221
-18560: DATA: 288
-18561: DATA: 4213
-18562: DATA: 9020
-18563: DATA: 12852
-18564: DATA: 17699
-18565: DATA: 21541
-18566: DATA: 26372
-18567: DATA: 30283
-18568: DATA: 2327
-18569: DATA: 6246
-18570: DATA: 11089
-18571: DATA: 14915
-18572: DATA: 19945
-18573: DATA: 23721
-18574: DATA: 28664
-18575: DATA: 32476
-18576: DATA: 4135
-18577: DATA: 9045
-18578: DATA: 12915
-18579: DATA: 17756
-18580: DATA: 21674
-18581: DATA: 26573
-18582: DATA: 30425
-18583: DATA: 2102
-18584: DATA: 6964
-18585: DATA: 10819
-18586: DATA: 15749
-18587: DATA: 19681
-18588: DATA: 24104
-18589: DATA: 28989
-18590: DATA: 191
-18591: DATA: 5107
-18592: DATA: 9588
-18593: DATA: 13437
-18594: DATA: 18361
-18595: DATA: 22266
-18596: DATA: 26668
-18597: DATA: 31520
-18598: DATA: 2689
-18599: DATA: 7632
-18600: DATA: 12149
-18601: DATA: 16041
-18602: DATA: 20953
-18603: DATA: 25369
-18604: DATA: 29373
-18605: DATA: 1437
-18606: DATA: 6012
-18607: DATA: 9876
-18608: DATA: 14394
-18609: DATA: 19265
-18610: DATA: 23285
-18611: DATA: 27663
-18612: DATA: 32682
-18613: DATA: 3725
-18614: DATA: 8287
-18615: DATA: 13292
-18616: DATA: 17784
-18617: DATA: 21707
-18618: DATA: 26232
-18619: DATA: 31167
-18620: DATA: 2849
-18621: DATA: 6841
-18622: DATA: 11376
-18623: DATA: 16310
-18624: DATA: 20795
-18625: DATA: 24764
-18626: DATA: 29246
-18627: DATA: 1506
-18628: DATA: 5904
-18629: DATA: 9893
-18630: DATA: 14361
-18631: DATA: 19350
-18632: DATA: 23860
-18633: DATA: 27878
-18634: DATA: 32351
-18635: DATA: 4548
-18636: DATA: 9130
-18637: DATA: 13661
-18638: DATA: 17657
-18639: DATA: 22086
-18640: DATA: 26740
-18641: DATA: 31640
-18642: DATA: 3441
-18643: DATA: 7385
-18644: DATA: 11937
-18645: DATA: 16461
-18646: DATA: 21471
-18647: DATA: 26019
-18648: DATA: 30516
-18649: DATA: 1732
-18650: DATA: 6352
-18651: DATA: 10879
-18652: DATA: 15393
-18653: DATA: 20473
-18654: DATA: 25072
-18655: DATA: 29560
-18656: DATA: 1329
-18657: DATA: 5345
-18658: DATA: 9905
-18659: DATA: 14449
-18660: DATA: 19050
-18661: DATA: 23981
-18662: DATA: 28624
-18663: DATA: 364
-18664: DATA: 4960
-18665: DATA: 9573
-18666: DATA: 13528
-18667: DATA: 18060
-18668: DATA: 22711
-18669: DATA: 27165
-18670: DATA: 31844
-18671: DATA: 3586
-18672: DATA: 8251
-18673: DATA: 13205
-18674: DATA: 17908
-18675: DATA: 22418
-18676: DATA: 27056
-18677: DATA: 31582
-18678: DATA: 3344
-18679: DATA: 8042
-18680: DATA: 12666
-18681: DATA: 17221
-18682: DATA: 21791
-18683: DATA: 26403
-18684: DATA: 31009
-18685: DATA: 2941
-18686: DATA: 7459
-18687: DATA: 12092
-18688: DATA: 16688
-18689: DATA: 21296
-18690: DATA: 25982
-18691: DATA: 30544
-18692: DATA: 2343
-18693: DATA: 6946
-18694: DATA: 11522
-18695: DATA: 16151
-18696: DATA: 20859
-18697: DATA: 25441
-18698: DATA: 30037
-18699: DATA: 1865
-18700: DATA: 6628
-18701: DATA: 11166
-18702: DATA: 15871
-18703: DATA: 20444
-18704: DATA: 24634
-18705: DATA: 29258
-18706: DATA: 1092
-18707: DATA: 5717
-18708: DATA: 10413
-18709: DATA: 15006
-18710: DATA: 19600
-18711: DATA: 24870
-18712: DATA: 29563
-18713: DATA: 1356
-18714: DATA: 6046
-18715: DATA: 10669
-18716: DATA: 14893
-18717: DATA: 19566
-18718: DATA: 24304
-18719: DATA: 28902
-18720: DATA: 1339
-18721: DATA: 6008
-18722: DATA: 10677
-18723: DATA: 15338
-18724: DATA: 19500
-18725: DATA: 24172
-18726: DATA: 28804
-18727: DATA: 645
-18728: DATA: 6007
-18729: DATA: 10666
-18730: DATA: 15298
-18731: DATA: 19487
-18732: DATA: 24235
-18733: DATA: 28889
-18734: DATA: 1397
-18735: DATA: 6033
-18736: DATA: 10362
-18737: DATA: 14869
-18738: DATA: 19632
-18739: DATA: 24884
-18740: DATA: 29616
-18741: DATA: 1421
-18742: DATA: 5720
-18743: DATA: 10468
-18744: DATA: 15719
-18745: DATA: 20421
-18746: DATA: 24593
-18747: DATA: 29421
-18748: DATA: 1840
-18749: DATA: 6575
-18750: DATA: 10809
-18751: DATA: 15540
-18752: DATA: 20794
-18753: DATA: 25522
-18754: DATA: 29756
-18755: DATA: 1720
-18756: DATA: 7012
-18757: DATA: 11682
-18758: DATA: 15902
-18759: DATA: 20677
-18760: DATA: 25979
-18761: DATA: 30699
-18762: DATA: 2133
-18763: DATA: 6797
-18764: DATA: 12215
-18765: DATA: 16404
-18766: DATA: 21236
-18767: DATA: 26448
-18768: DATA: 30842
-18769: DATA: 2815
-18770: DATA: 8035
-18771: DATA: 12757
-18772: DATA: 17069
-18773: DATA: 22275
-18774: DATA: 27081
-18775: DATA: 31461
-18776: DATA: 3959
-18777: DATA: 8650
-18778: DATA: 12953
-18779: DATA: 18275
-18780: DATA: 22531
-18781: DATA: 27337
-18782: DATA: 32696
-18783: DATA: 4220
-18784: DATA: 9511
-18785: DATA: 14261
-18786: DATA: 18611
-18787: DATA: 23922
-18788: DATA: 28205
-18789: DATA: 227
-18790: DATA: 5584
-18791: DATA: 9804
-18792: DATA: 15207
-18793: DATA: 19557
-18794: DATA: 24259
-18795: DATA: 29570
-18796: DATA: 1193
-18797: DATA: 6488
-18798: DATA: 10872
-18799: DATA: 16154
-18800: DATA: 20515
-18801: DATA: 25237
-18802: DATA: 30691
-18803: DATA: 2185
-18804: DATA: 7597
-18805: DATA: 11841
-18806: DATA: 17244
-18807: DATA: 21541
-18808: DATA: 26981
-18809: DATA: 31248
-18810: DATA: 3865
-18811: DATA: 8249
-18812: DATA: 13601
-18813: DATA: 18045
-18814: DATA: 23331
-18815: DATA: 27709
-18816: DATA: 317
-18817: DATA: 4667
-18818: DATA: 10025
-18819: DATA: 14451
-18820: DATA: 19812
-18821: DATA: 24173
-18822: DATA: 29497
-18823: DATA: 1041
-18824: DATA: 6452
-18825: DATA: 10861
-18826: DATA: 16209
-18827: DATA: 20574
-18828: DATA: 26084
-18829: DATA: 30364
-18830: DATA: 2992
-18831: DATA: 7365
-18832: DATA: 12337
-18833: DATA: 17691
-18834: DATA: 22116
-18835: DATA: 27484
-18836: DATA: 31907
-18837: DATA: 4482
-18838: DATA: 8926
-18839: DATA: 13925
-18840: DATA: 19323
-18841: DATA: 23627
-18842: DATA: 29136
-18843: DATA: 738
-18844: DATA: 5674
-18845: DATA: 11128
-18846: DATA: 15600
-18847: DATA: 20966
-18848: DATA: 25917
-18849: DATA: 30321
-18850: DATA: 2997
-18851: DATA: 7347
-18852: DATA: 12360
-18853: DATA: 17774
-18854: DATA: 22175
-18855: DATA: 27595
-18856: DATA: 32631
-18857: DATA: 4260
-18858: DATA: 9670
-18859: DATA: 14600
-18860: DATA: 19172
-18861: DATA: 24542
-18862: DATA: 29567
-18863: DATA: 1180
-18864: DATA: 6202
-18865: DATA: 11618
-18866: DATA: 16068
-18867: DATA: 21013
-18868: DATA: 26541
-18869: DATA: 30942
-18870: DATA: 3088
-18871: DATA: 8678
-18872: DATA: 13691
-18873: DATA: 18060
-18874: DATA: 23070
-18875: DATA: 28653
-18876: DATA: 813
-18877: DATA: 5294
-18878: DATA: 10352
-18879: DATA: 15782
-18880: DATA: 20792
-18881: DATA: 25276
-18882: DATA: 30263
-18883: DATA: 2997
-18884: DATA: 7984
-18885: DATA: 12449
-18886: DATA: 17417
-18887: DATA: 22981
-18888: DATA: 28006
-18889: DATA: 32490
-18890: DATA: 4677
-18891: DATA: 10179
-18892: DATA: 15264
-18893: DATA: 20248
-18894: DATA: 24820
-18895: DATA: 29721
-18896: DATA: 2164
-18897: DATA: 7572
-18898: DATA: 12668
-18899: DATA: 17104
-18900: DATA: 22187
-18901: DATA: 27166
-18902: DATA: 32708
-18903: DATA: 5093
-18904: DATA: 10104
-18905: DATA: 14540
-18906: DATA: 19611
-18907: DATA: 24680
-18908: DATA: 29796
-18909: DATA: 2556
-18910: DATA: 7664
-18911: DATA: 12641
-18912: DATA: 17725
-18913: DATA: 22267
-18914: DATA: 27305
-18915: DATA: 32317
-18916: DATA: 4646
-18917: DATA: 10210
-18918: DATA: 15239
-18919: DATA: 20297
-18920: DATA: 25402
-18921: DATA: 30565
-18922: DATA: 2192
-18923: DATA: 7332
-18924: DATA: 12464
-18925: DATA: 17437
-18926: DATA: 22648
-18927: DATA: 27668
-18928: DATA: 39
-18929: DATA: 5525
-18930: DATA: 10723
-18931: DATA: 15768
-18932: DATA: 20914
-18933: DATA: 25928
-18934: DATA: 31070
-18935: DATA: 3365
-18936: DATA: 8560
-18937: DATA: 13578
-18938: DATA: 18692
-18939: DATA: 23870
-18940: DATA: 29028
-18941: DATA: 1330
-18942: DATA: 6462
-18943: DATA: 11637
-18944: DATA: 16699
-18945: DATA: 21819
-18946: DATA: 26933
-18947: DATA: 32125
-18948: DATA: 4407
-18949: DATA: 9508
-18950: DATA: 14612
-18951: DATA: 19712
-18952: DATA: 24890
-18953: DATA: 29964
-18954: DATA: 2386
-18955: DATA: 7489
-18956: DATA: 12721
-18957: DATA: 17816
-18958: DATA: 22960
-18959: DATA: 28118
-18960: DATA: 59
-18961: DATA: 5148
-18962: DATA: 10366
-18963: DATA: 15484
-18964: DATA: 20624
-18965: DATA: 25733
-18966: DATA: 30937
-18967: DATA: 3894
-18968: DATA: 9012
-18969: DATA: 14150
-18970: DATA: 19359
-18971: DATA: 24548
-18972: DATA: 29226
-18973: DATA: 1597
-18974: DATA: 6841
-18975: DATA: 12006
-18976: DATA: 17780
-18977: DATA: 22904
-18978: DATA: 28081
-18979: DATA: 505
-18980: DATA: 5153
-18981: DATA: 10285
-18982: DATA: 15519
-18983: DATA: 20675
-18984: DATA: 26420
-18985: DATA: 31652
-18986: DATA: 3984
-18987: DATA: 8719
-18988: DATA: 13992
-18989: DATA: 19144
-18990: DATA: 24949
-18991: DATA: 30165
-18992: DATA: 2105
-18993: DATA: 7248
-18994: DATA: 12516
-18995: DATA: 18204
-18996: DATA: 23464
-18997: DATA: 28547
-18998: DATA: 528
-18999: DATA: 5797
-19000: DATA: 11613
-19001: DATA: 16785
-19002: DATA: 21584
-19003: DATA: 26789
-19004: DATA: 32549
-19005: DATA: 5038
-19006: DATA: 9840
-19007: DATA: 15035
-19008: DATA: 20797
-19009: DATA: 26043
-19010: DATA: 30773
-19011: DATA: 3325
-19012: DATA: 8992
-19013: DATA: 14242
-19014: DATA: 18948
-19015: DATA: 24214
-19016: DATA: 30004
-19017: DATA: 2538
-19018: DATA: 7262
-19019: DATA: 12429
-19020: DATA: 18347
-19021: DATA: 23059
-19022: DATA: 28405
-19023: DATA: 1301
-19024: DATA: 6183
-19025: DATA: 11420
-19026: DATA: 17268
-19027: DATA: 22488
-19028: DATA: 27370
-19029: DATA: 359
-19030: DATA: 5572
-19031: DATA: 10400
-19032: DATA: 16248
-19033: DATA: 21440
-19034: DATA: 26240
-19035: DATA: 32098
-19036: DATA: 4150
-19037: DATA: 9449
-19038: DATA: 15285
-19039: DATA: 20071
-19040: DATA: 25884
-19041: DATA: 31169
-19042: DATA: 3256
-19043: DATA: 9076
-19044: DATA: 13879
-19045: DATA: 19117
-19046: DATA: 24963
-19047: DATA: 29768
-19048: DATA: 2933
-19049: DATA: 7721
-19050: DATA: 13020
-19051: DATA: 18893
-19052: DATA: 23712
-19053: DATA: 29528
-19054: DATA: 1638
-19055: DATA: 7452
-19056: DATA: 12343
-19057: DATA: 17616
-19058: DATA: 23472
-19059: DATA: 28309
-19060: DATA: 1445
-19061: DATA: 6238
-19062: DATA: 12048
-19063: DATA: 16996
-19064: DATA: 22836
-19065: DATA: 27655
-19066: DATA: 773
-19067: DATA: 5689
-19068: DATA: 11568
-19069: DATA: 16434
-19070: DATA: 22334
-19071: DATA: 27253
-19072: DATA: 315
-19073: DATA: 5179
-19074: DATA: 11120
-19075: DATA: 15924
-19076: DATA: 21808
-19077: DATA: 26733
-19078: DATA: 32529
-19079: DATA: 4619
-19080: DATA: 10608
-19081: DATA: 15397
-19082: DATA: 21314
-19083: DATA: 26184
-19084: DATA: 32165
-19085: DATA: 4249
-19086: DATA: 10211
-19087: DATA: 14997
-19088: DATA: 20598
-19089: DATA: 26369
-19090: DATA: 31349
-19091: DATA: 4433
-19092: DATA: 9377
-19093: DATA: 15261
-19094: DATA: 20191
-19095: DATA: 25655
-19096: DATA: 31584
-19097: DATA: 3648
-19098: DATA: 9602
-19099: DATA: 14511
-19100: DATA: 20068
-19101: DATA: 25970
-19102: DATA: 30910
-19103: DATA: 4021
-19104: DATA: 9504
-19105: DATA: 14461
-19106: DATA: 20405
-19107: DATA: 25277
-19108: DATA: 30775
-19109: DATA: 3940
-19110: DATA: 8852
-19111: DATA: 14784
-19112: DATA: 20282
-19113: DATA: 25288
-19114: DATA: 31186
-19115: DATA: 3864
-19116: DATA: 8887
-19117: DATA: 14804
-19118: DATA: 20350
-19119: DATA: 25232
-19120: DATA: 30759
-19121: DATA: 3910
-19122: DATA: 8880
-19123: DATA: 14366
-19124: DATA: 20389
-19125: DATA: 25311
-19126: DATA: 30804
-19127: DATA: 4037
-19128: DATA: 9536
-19129: DATA: 14477
-19130: DATA: 19993
-19131: DATA: 26046
-19132: DATA: 31588
-19133: DATA: 3775
-19134: DATA: 9253
-19135: DATA: 15270
-19136: DATA: 20797
-19137: DATA: 25787
-19138: DATA: 31285
-19139: DATA: 4526
-19140: DATA: 10039
-19141: DATA: 15085
-19142: DATA: 20499
-19143: DATA: 26500
-19144: DATA: 32102
-19145: DATA: 4321
-19146: DATA: 9744
-19147: DATA: 15813
-19148: DATA: 21413
-19149: DATA: 26894
-19150: DATA: 31920
-19151: DATA: 4631
-19152: DATA: 10279
-19153: DATA: 16268
-19154: DATA: 21886
-19155: DATA: 26844
-19156: DATA: 32423
-19157: DATA: 5122
-19158: DATA: 11202
-19159: DATA: 16875
-19160: DATA: 22391
-19161: DATA: 27338
-19162: DATA: 157
-19163: DATA: 5679
-19164: DATA: 11364
-19165: DATA: 17389
-19166: DATA: 22946
-19167: DATA: 28540
-19168: DATA: 1338
-19169: DATA: 6369
-19170: DATA: 11957
-19171: DATA: 17529
-19172: DATA: 23140
-19173: DATA: 29156
-19174: DATA: 1950
-19175: DATA: 7429
-19176: DATA: 13158
-19177: DATA: 18720
-19178: DATA: 23764
-19179: DATA: 29389
-19180: DATA: 2219
-19181: DATA: 7763
-19182: DATA: 13360
-19183: DATA: 18970
-19184: DATA: 24634
-19185: DATA: 30672
-19186: DATA: 3504
-19187: DATA: 9102
-19188: DATA: 14765
-19189: DATA: 20297
-19190: DATA: 25941
-19191: DATA: 31531
-19192: DATA: 4375
-19193: DATA: 9994
-19194: DATA: 15618
-19195: DATA: 21295
-19196: DATA: 27001
-19197: DATA: 32521
-19198: DATA: 5432
-19199: DATA: 11068
-19200: DATA: 16679
-19201: DATA: 22389
-19202: DATA: 27961
-19203: DATA: 814
-19204: DATA: 6500
-19205: DATA: 12076
-19206: DATA: 17744
-19207: DATA: 23302
-19208: DATA: 29048
-19209: DATA: 1888
-19210: DATA: 7505
-19211: DATA: 13151
-19212: DATA: 18916
-19213: DATA: 24474
-19214: DATA: 30204
-19215: DATA: 3028
-19216: DATA: 8231
-19217: DATA: 13830
-19218: DATA: 19504
-19219: DATA: 25166
-19220: DATA: 30900
-19221: DATA: 3717
-19222: DATA: 9429
-19223: DATA: 15671
-19224: DATA: 21361
-19225: DATA: 26885
-19226: DATA: 32657
-19227: DATA: 5615
-19228: DATA: 10795
-19229: DATA: 16488
-19230: DATA: 22180
-19231: DATA: 27829
-19232: DATA: 1312
-19233: DATA: 7037
-19234: DATA: 12725
-19235: DATA: 18365
-19236: DATA: 23607
-19237: DATA: 29284
-19238: DATA: 2186
-19239: DATA: 7872
-19240: DATA: 14132
-19241: DATA: 19882
-19242: DATA: 25558
-19243: DATA: 30797
-19244: DATA: 3749
-19245: DATA: 9373
-19246: DATA: 15716
-19247: DATA: 21392
-19248: DATA: 26682
-19249: DATA: 32347
-19250: DATA: 5369
-19251: DATA: 11534
-19252: DATA: 17380
-19253: DATA: 22991
-19254: DATA: 28241
-19255: DATA: 1257
-19256: DATA: 7544
-19257: DATA: 13259
-19258: DATA: 18550
-19259: DATA: 24224
-19260: DATA: 30509
-19261: DATA: 3503
-19262: DATA: 8738
-19263: DATA: 14522
-19264: DATA: 20774
-19265: DATA: 26531
-19266: DATA: 31748
-19267: DATA: 4789
-19268: DATA: 11053
-19269: DATA: 16830
-19270: DATA: 22096
-19271: DATA: 27788
-19272: DATA: 1383
-19273: DATA: 7077
-19274: DATA: 12369
-19275: DATA: 18061
-19276: DATA: 24502
-19277: DATA: 29724
-19278: DATA: 2788
-19279: DATA: 9053
-19280: DATA: 14385
-19281: DATA: 20103
-19282: DATA: 26416
-19283: DATA: 32208
-19284: DATA: 4785
-19285: DATA: 11011
-19286: DATA: 16852
-19287: DATA: 22180
-19288: DATA: 28538
-19289: DATA: 1472
-19290: DATA: 6864
-19291: DATA: 13157
-19292: DATA: 18469
-19293: DATA: 24307
-19294: DATA: 30644
-19295: DATA: 3128
-19296: DATA: 9532
-19297: DATA: 15344
-19298: DATA: 20668
-19299: DATA: 27001
-19300: DATA: 32356
-19301: DATA: 5344
-19302: DATA: 11673
-19303: DATA: 16983
-19304: DATA: 23398
-19305: DATA: 28714
-19306: DATA: 1730
-19307: DATA: 8141
-19308: DATA: 13474
-19309: DATA: 19791
-19310: DATA: 25215
-19311: DATA: 31512
-19312: DATA: 4212
-19313: DATA: 9921
-19314: DATA: 16376
-19315: DATA: 21656
-19316: DATA: 28132
-19317: DATA: 578
-19318: DATA: 6980
-19319: DATA: 12397
-19320: DATA: 18801
-19321: DATA: 24087
-19322: DATA: 30471
-19323: DATA: 3108
-19324: DATA: 9527
-19325: DATA: 14904
-19326: DATA: 21360
-19327: DATA: 26680
-19328: DATA: 309
-19329: DATA: 5682
-19330: DATA: 12094
-19331: DATA: 17460
-19332: DATA: 23842
-19333: DATA: 29220
-19334: DATA: 2835
-19335: DATA: 8192
-19336: DATA: 14714
-19337: DATA: 20081
-19338: DATA: 26384
-19339: DATA: 31835
-19340: DATA: 5541
-19341: DATA: 10888
-19342: DATA: 17404
-19343: DATA: 22721
-19344: DATA: 28788
-19345: DATA: 2311
-19346: DATA: 7807
-19347: DATA: 14162
-19348: DATA: 19625
-19349: DATA: 26051
-19350: DATA: 31376
-19351: DATA: 4709
-19352: DATA: 11075
-19353: DATA: 16461
-19354: DATA: 22929
-19355: DATA: 28409
-19356: DATA: 1636
-19357: DATA: 8008
-19358: DATA: 13443
-19359: DATA: 19920
-19360: DATA: 25972
-19361: DATA: 31350
-19362: DATA: 5055
-19363: DATA: 10472
-19364: DATA: 16424
-19365: DATA: 22889
-19366: DATA: 28368
-19367: DATA: 1996
-19368: DATA: 8032
-19369: DATA: 13541
-19370: DATA: 19904
-19371: DATA: 25858
-19372: DATA: 31415
-19373: DATA: 5070
-19374: DATA: 11129
-19375: DATA: 16535
-19376: DATA: 22584
-19377: DATA: 29004
-19378: DATA: 1712
-19379: DATA: 7701
-19380: DATA: 14245
-19381: DATA: 19675
-19382: DATA: 25685
-19383: DATA: 32186
-19384: DATA: 5400
-19385: DATA: 10902
-19386: DATA: 16900
-19387: DATA: 23487
-19388: DATA: 29477
-19389: DATA: 2227
-19390: DATA: 8247
-19391: DATA: 14768
-19392: DATA: 20852
-19393: DATA: 26295
-19394: DATA: 32319
-19395: DATA: 6066
-19396: DATA: 12079
-19397: DATA: 20042
-19398: DATA: 23588
-19399: DATA: 30093
-19400: DATA: 3441
-19401: DATA: 8869
-19402: DATA: 14931
-19403: DATA: 21442
-19404: DATA: 27570
-19405: DATA: 792
-19406: DATA: 6370
-19407: DATA: 12309
-19408: DATA: 18491
-19409: DATA: 24979
-19410: DATA: 31024
-19411: DATA: 3785
-19412: DATA: 9900
-19413: DATA: 15876
-19414: DATA: 22467
-19415: DATA: 28645
-19416: DATA: 1910
-19417: DATA: 7370
-19418: DATA: 13471
-19419: DATA: 19558
-19420: DATA: 25700
-19421: DATA: 32238
-19422: DATA: 5541
-19423: DATA: 11639
-19424: DATA: 17696
-19425: DATA: 23289
-19426: DATA: 29353
-19427: DATA: 2621
-19428: DATA: 8759
-19429: DATA: 15354
-19430: DATA: 21401
-19431: DATA: 27479
-19432: DATA: 888
-19433: DATA: 6966
-19434: DATA: 12432
-19435: DATA: 18586
-19436: DATA: 24749
-19437: DATA: 30793
-19438: DATA: 4216
-19439: DATA: 10325
-19440: DATA: 16439
-19441: DATA: 23002
-19442: DATA: 29180
-19443: DATA: 2450
-19444: DATA: 8630
-19445: DATA: 14686
-19446: DATA: 20766
-19447: DATA: 26917
-19448: DATA: 308
-19449: DATA: 6444
-19450: DATA: 12548
-19451: DATA: 18797
-19452: DATA: 24877
-19453: DATA: 31022
-19454: DATA: 4464
-19455: DATA: 10529
-19456: DATA: 16701
-19457: DATA: 22817
-19458: DATA: 28988
-19459: DATA: 2360
-19460: DATA: 8480
-19461: DATA: 14701
-19462: DATA: 20818
-19463: DATA: 26916
-19464: DATA: 308
-19465: DATA: 6471
-19466: DATA: 12610
-19467: DATA: 18756
-19468: DATA: 24993
-19469: DATA: 31131
-19470: DATA: 4528
-19471: DATA: 10748
-19472: DATA: 16442
-19473: DATA: 22529
-19474: DATA: 28770
-19475: DATA: 2130
-19476: DATA: 8352
-19477: DATA: 14488
-19478: DATA: 20691
-19479: DATA: 27441
-19480: DATA: 893
-19481: DATA: 6986
-19482: DATA: 13214
-19483: DATA: 19373
-19484: DATA: 25136
-19485: DATA: 31346
-19486: DATA: 4848
-19487: DATA: 10972
-19488: DATA: 17722
-19489: DATA: 23905
-19490: DATA: 30133
-19491: DATA: 3567
-19492: DATA: 9248
-19493: DATA: 15460
-19494: DATA: 21661
-19495: DATA: 27840
-19496: DATA: 1914
-19497: DATA: 8118
-19498: DATA: 14297
-19499: DATA: 19970
-19500: DATA: 26282
-19501: DATA: 32476
-19502: DATA: 6524
-19503: DATA: 12757
-19504: DATA: 18436
-19505: DATA: 24669
-19506: DATA: 30953
-19507: DATA: 4878
-19508: DATA: 11181
-19509: DATA: 17358
-19510: DATA: 23107
-19511: DATA: 29351
-19512: DATA: 3386
-19513: DATA: 9669
-19514: DATA: 15440
-19515: DATA: 21636
-19516: DATA: 28464
-19517: DATA: 2045
-19518: DATA: 7714
-19519: DATA: 14000
-19520: DATA: 20789
-19521: DATA: 27057
-19522: DATA: 35
-19523: DATA: 6375
-19524: DATA: 13134
-19525: DATA: 19399
-19526: DATA: 25122
-19527: DATA: 31360
-19528: DATA: 5495
-19529: DATA: 11744
-19530: DATA: 17502
-19531: DATA: 23769
-19532: DATA: 30692
-19533: DATA: 3612
-19534: DATA: 9972
-19535: DATA: 16707
-19536: DATA: 22581
-19537: DATA: 28827
-19538: DATA: 2931
-19539: DATA: 9176
-19540: DATA: 15031
-19541: DATA: 21837
-19542: DATA: 28121
-19543: DATA: 1195
-19544: DATA: 7988
-19545: DATA: 14284
-19546: DATA: 20126
-19547: DATA: 27001
-19548: DATA: 33
-19549: DATA: 6383
-19550: DATA: 13236
-19551: DATA: 19068
-19552: DATA: 25913
-19553: DATA: 32240
-19554: DATA: 5310
-19555: DATA: 12142
-19556: DATA: 17965
-19557: DATA: 24290
-19558: DATA: 31134
-19559: DATA: 4164
-19560: DATA: 11128
-19561: DATA: 16997
-19562: DATA: 23232
-19563: DATA: 30085
-19564: DATA: 3261
-19565: DATA: 10062
-19566: DATA: 15993
-19567: DATA: 22806
-19568: DATA: 28711
-19569: DATA: 2197
-19570: DATA: 9208
-19571: DATA: 15004
-19572: DATA: 21938
-19573: DATA: 27720
-19574: DATA: 1808
-19575: DATA: 7797
-19576: DATA: 14694
-19577: DATA: 20490
-19578: DATA: 27412
-19579: DATA: 568
-19580: DATA: 7463
-19581: DATA: 13368
-19582: DATA: 20276
-19583: DATA: 26229
-19584: DATA: 306
-19585: DATA: 6196
-19586: DATA: 13091
-19587: DATA: 19006
-19588: DATA: 25901
-19589: DATA: 31779
-19590: DATA: 5905
-19591: DATA: 11793
-19592: DATA: 18813
-19593: DATA: 24683
-19594: DATA: 31575
-19595: DATA: 4647
-19596: DATA: 11700
-19597: DATA: 17551
-19598: DATA: 24565
-19599: DATA: 30417
-19600: DATA: 4157
-19601: DATA: 11030
-19602: DATA: 16996
-19603: DATA: 23892
-19604: DATA: 29867
-19605: DATA: 3971
-19606: DATA: 9923
-19607: DATA: 16485
-19608: DATA: 23413
-19609: DATA: 29255
-19610: DATA: 3487
-19611: DATA: 9464
-19612: DATA: 15920
-19613: DATA: 22845
-19614: DATA: 28836
-19615: DATA: 3069
-19616: DATA: 9521
-19617: DATA: 15413
-19618: DATA: 22454
-19619: DATA: 28392
-19620: DATA: 2090
-19621: DATA: 9065
-19622: DATA: 14993
-19623: DATA: 21960
-19624: DATA: 28529
-19625: DATA: 1707
-19626: DATA: 8644
-19627: DATA: 15116
-19628: DATA: 21160
-19629: DATA: 28110
-19630: DATA: 1840
-19631: DATA: 7834
-19632: DATA: 14386
-19633: DATA: 21269
-19634: DATA: 27391
-19635: DATA: 1032
-19636: DATA: 8118
-19637: DATA: 13965
-19638: DATA: 20549
-19639: DATA: 27627
-19640: DATA: 1405
-19641: DATA: 7315
-19642: DATA: 13845
-19643: DATA: 20927
-19644: DATA: 27447
-19645: DATA: 696
-19646: DATA: 7281
-19647: DATA: 14325
-19648: DATA: 20852
-19649: DATA: 26771
-19650: DATA: 575
-19651: DATA: 7599
-19652: DATA: 14180
-19653: DATA: 20136
-19654: DATA: 26632
-19655: DATA: 900
-19656: DATA: 7545
-19657: DATA: 13557
-19658: DATA: 20060
-19659: DATA: 27080
-19660: DATA: 1000
-19661: DATA: 7543
-19662: DATA: 13561
-19663: DATA: 20059
-19664: DATA: 26656
-19665: DATA: 912
-19666: DATA: 7522
-19667: DATA: 13529
-19668: DATA: 20141
-19669: DATA: 26624
-19670: DATA: 981
-19671: DATA: 7595
-19672: DATA: 14183
-19673: DATA: 20172
-19674: DATA: 26783
-19675: DATA: 611
-19676: DATA: 7205
-19677: DATA: 14321
-19678: DATA: 20976
-19679: DATA: 27493
-19680: DATA: 1340
-19681: DATA: 7404
-19682: DATA: 13987
-19683: DATA: 20596
-19684: DATA: 27175
-19685: DATA: 1534
-19686: DATA: 8144
-19687: DATA: 14678
-19688: DATA: 21361
-19689: DATA: 27936
-19690: DATA: 1245
-19691: DATA: 7838
-19692: DATA: 14564
-19693: DATA: 21065
-19694: DATA: 27775
-19695: DATA: 1621
-19696: DATA: 8228
-19697: DATA: 15303
-19698: DATA: 22005
-19699: DATA: 28569
-19700: DATA: 2477
-19701: DATA: 9038
-19702: DATA: 15684
-19703: DATA: 22309
-19704: DATA: 29024
-19705: DATA: 2829
-19706: DATA: 9489
-19707: DATA: 16185
-19708: DATA: 22884
-19709: DATA: 29481
-19710: DATA: 3384
-19711: DATA: 10032
-19712: DATA: 16756
-19713: DATA: 23328
-19714: DATA: 30014
-19715: DATA: 3892
-19716: DATA: 10546
-19717: DATA: 17192
-19718: DATA: 23810
-19719: DATA: 30486
-19720: DATA: 4465
-19721: DATA: 11045
-19722: DATA: 17753
-19723: DATA: 24414
-19724: DATA: 31208
-19725: DATA: 5085
-19726: DATA: 11761
-19727: DATA: 18369
-19728: DATA: 24692
-19729: DATA: 31260
-19730: DATA: 5220
-19731: DATA: 11854
-19732: DATA: 18660
-19733: DATA: 25247
-19734: DATA: 31967
-19735: DATA: 6442
-19736: DATA: 13152
-19737: DATA: 19721
-19738: DATA: 26576
-19739: DATA: 492
-19740: DATA: 6734
-19741: DATA: 13421
-19742: DATA: 20133
-19743: DATA: 26855
-19744: DATA: 1329
-19745: DATA: 8057
-19746: DATA: 14761
-19747: DATA: 21437
-19748: DATA: 27689
-19749: DATA: 1644
-19750: DATA: 8324
-19751: DATA: 15053
-19752: DATA: 22385
-19753: DATA: 29096
-19754: DATA: 3025
-19755: DATA: 9241
-19756: DATA: 16045
-19757: DATA: 22750
-19758: DATA: 30065
-19759: DATA: 3993
-19760: DATA: 10356
-19761: DATA: 16982
-19762: DATA: 23807
-19763: DATA: 30995
-19764: DATA: 5047
-19765: DATA: 11737
-19766: DATA: 17986
-19767: DATA: 24816
-19768: DATA: 32119
-19769: DATA: 6033
-19770: DATA: 12380
-19771: DATA: 19181
-19772: DATA: 26405
-19773: DATA: 435
-19774: DATA: 6708
-19775: DATA: 13557
-19776: DATA: 20768
-19777: DATA: 27581
-19778: DATA: 1073
-19779: DATA: 7849
-19780: DATA: 15204
-19781: DATA: 21932
-19782: DATA: 28188
-19783: DATA: 2185
-19784: DATA: 9524
-19785: DATA: 16352
-19786: DATA: 22598
-19787: DATA: 29384
-19788: DATA: 4010
-19789: DATA: 10249
-19790: DATA: 17123
-19791: DATA: 24341
-19792: DATA: 30773
-19793: DATA: 4743
-19794: DATA: 12149
-19795: DATA: 18845
-19796: DATA: 25255
-19797: DATA: 32524
-19798: DATA: 6597
-19799: DATA: 12982
-19800: DATA: 20337
-19801: DATA: 27073
-19802: DATA: 720
-19803: DATA: 8047
-19804: DATA: 14397
-19805: DATA: 21181
-19806: DATA: 28580
-19807: DATA: 2173
-19808: DATA: 9521
-19809: DATA: 16287
-19810: DATA: 22713
-19811: DATA: 30067
-19812: DATA: 3632
-19813: DATA: 10472
-19814: DATA: 17794
-19815: DATA: 24132
-19816: DATA: 31607
-19817: DATA: 5169
-19818: DATA: 11993
-19819: DATA: 19330
-19820: DATA: 25770
-19821: DATA: 334
-19822: DATA: 6704
-19823: DATA: 14103
-19824: DATA: 20529
-19825: DATA: 27329
-19826: DATA: 2023
-19827: DATA: 8344
-19828: DATA: 15777
-19829: DATA: 22083
-19830: DATA: 29456
-19831: DATA: 3168
-19832: DATA: 10621
-19833: DATA: 16898
-19834: DATA: 24344
-19835: DATA: 30777
-19836: DATA: 5476
-19837: DATA: 11821
-19838: DATA: 19263
-19839: DATA: 25654
-19840: DATA: 319
-19841: DATA: 6704
-19842: DATA: 14116
-19843: DATA: 20526
-19844: DATA: 28004
-19845: DATA: 1570
-19846: DATA: 8982
-19847: DATA: 15429
-19848: DATA: 22897
-19849: DATA: 29291
-19850: DATA: 3925
-19851: DATA: 10335
-19852: DATA: 17827
-19853: DATA: 24196
-19854: DATA: 31664
-19855: DATA: 5334
-19856: DATA: 12341
-19857: DATA: 19737
-19858: DATA: 26236
-19859: DATA: 856
-19860: DATA: 7328
-19861: DATA: 14797
-19862: DATA: 21138
-19863: DATA: 28215
-19864: DATA: 2929
-19865: DATA: 9282
-19866: DATA: 16793
-19867: DATA: 23294
-19868: DATA: 30256
-19869: DATA: 4984
-19870: DATA: 11426
-19871: DATA: 18918
-19872: DATA: 25974
-19873: DATA: 32315
-19874: DATA: 7130
-19875: DATA: 13531
-19876: DATA: 20529
-19877: DATA: 28031
-19878: DATA: 1668
-19879: DATA: 9165
-19880: DATA: 16241
-19881: DATA: 22711
-19882: DATA: 30173
-19883: DATA: 4354
-19884: DATA: 10934
-19885: DATA: 18392
-19886: DATA: 25404
-19887: DATA: 31957
-19888: DATA: 6205
-19889: DATA: 13633
-19890: DATA: 20144
-19891: DATA: 27150
-19892: DATA: 1953
-19893: DATA: 8392
-19894: DATA: 15453
-19895: DATA: 23030
-19896: DATA: 30004
-19897: DATA: 3729
-19898: DATA: 10776
-19899: DATA: 18348
-19900: DATA: 25392
-19901: DATA: 31997
-19902: DATA: 6183
-19903: DATA: 13757
-19904: DATA: 20797
-19905: DATA: 27321
-19906: DATA: 1589
-19907: DATA: 9213
-19908: DATA: 16176
-19909: DATA: 22693
-19910: DATA: 29717
-19911: DATA: 4549
-19912: DATA: 11640
-19913: DATA: 18154
-19914: DATA: 25159
-19915: DATA: 32712
-19916: DATA: 7094
-19917: DATA: 14173
-19918: DATA: 20706
-19919: DATA: 27728
-19920: DATA: 2099
-19921: DATA: 9628
-19922: DATA: 16739
-19923: DATA: 23241
-19924: DATA: 30369
-19925: DATA: 4639
-19926: DATA: 12227
-19927: DATA: 19429
-19928: DATA: 26468
-19929: DATA: 215
-19930: DATA: 7321
-19931: DATA: 14432
-19932: DATA: 21541
-19933: DATA: 29167
-19934: DATA: 3513
-19935: DATA: 10617
-19936: DATA: 17709
-19937: DATA: 24245
-19938: DATA: 31411
-19939: DATA: 5746
-19940: DATA: 12842
-19941: DATA: 20473
-19942: DATA: 27522
-19943: DATA: 1866
-19944: DATA: 9080
-19945: DATA: 16229
-19946: DATA: 22749
-19947: DATA: 29848
-19948: DATA: 4266
-19949: DATA: 11353
-19950: DATA: 18545
-19951: DATA: 25627
-19952: DATA: 49
-19953: DATA: 7615
-19954: DATA: 14820
-19955: DATA: 21909
-19956: DATA: 29101
-19957: DATA: 3395
-19958: DATA: 10583
-19959: DATA: 17782
-19960: DATA: 24884
-19961: DATA: 32009
-19962: DATA: 6425
-19963: DATA: 13606
-19964: DATA: 20769
-19965: DATA: 28029
-19966: DATA: 2339
-19967: DATA: 9530
-19968: DATA: 16673
-19969: DATA: 23867
-19970: DATA: 31028
-19971: DATA: 5501
-19972: DATA: 12581
-19973: DATA: 19747
-19974: DATA: 26900
-19975: DATA: 1349
-19976: DATA: 8568
-19977: DATA: 15724
-19978: DATA: 22871
-19979: DATA: 30021
-19980: DATA: 4528
-19981: DATA: 11729
-19982: DATA: 18864
-19983: DATA: 26049
-19984: DATA: 60
-19985: DATA: 7184
-19986: DATA: 14384
-19987: DATA: 21589
-19988: DATA: 28845
-19989: DATA: 3210
-19990: DATA: 10456
-19991: DATA: 18208
-19992: DATA: 25447
-19993: DATA: 32593
-19994: DATA: 7120
-19995: DATA: 14335
-19996: DATA: 21025
-19997: DATA: 28282
-19998: DATA: 2745
-19999: DATA: 9958
-20000: DATA: 17696
-20001: DATA: 24944
-20002: DATA: 32162
-20003: DATA: 6589
-20004: DATA: 13420
-20005: DATA: 20601
-20006: DATA: 27800
-20007: DATA: 2240
-20008: DATA: 10036
-20009: DATA: 17334
-20010: DATA: 24543
-20011: DATA: 31296
-20012: DATA: 5799
-20013: DATA: 13020
-20014: DATA: 20860
-20015: DATA: 28057
-20016: DATA: 2097
-20017: DATA: 9297
-20018: DATA: 16560
-20019: DATA: 24415
-20020: DATA: 31649
-20021: DATA: 6084
-20022: DATA: 12887
-20023: DATA: 20205
-20024: DATA: 28000
-20025: DATA: 2445
-20026: DATA: 9338
-20027: DATA: 16575
-20028: DATA: 24353
-20029: DATA: 31674
-20030: DATA: 5689
-20031: DATA: 12966
-20032: DATA: 20768
-20033: DATA: 28080
-20034: DATA: 2082
-20035: DATA: 9471
-20036: DATA: 17261
-20037: DATA: 24557
-20038: DATA: 31257
-20039: DATA: 5782
-20040: DATA: 13620
-20041: DATA: 20976
-20042: DATA: 27715
-20043: DATA: 2248
-20044: DATA: 10144
-20045: DATA: 16989
-20046: DATA: 24292
-20047: DATA: 32090
-20048: DATA: 6260
-20049: DATA: 13462
-20050: DATA: 21375
-20051: DATA: 28627
-20052: DATA: 2736
-20053: DATA: 10527
-20054: DATA: 17887
-20055: DATA: 24745
-20056: DATA: 32564
-20057: DATA: 7116
-20058: DATA: 13982
-20059: DATA: 21881
-20060: DATA: 28705
-20061: DATA: 3311
-20062: DATA: 11188
-20063: DATA: 18044
-20064: DATA: 25913
-20065: DATA: 496
-20066: DATA: 7358
-20067: DATA: 15214
-20068: DATA: 22061
-20069: DATA: 29410
-20070: DATA: 4510
-20071: DATA: 11332
-20072: DATA: 19320
-20073: DATA: 26213
-20074: DATA: 725
-20075: DATA: 8603
-20076: DATA: 15521
-20077: DATA: 23379
-20078: DATA: 30308
-20079: DATA: 5382
-20080: DATA: 12404
-20081: DATA: 19654
-20082: DATA: 27621
-20083: DATA: 1694
-20084: DATA: 9644
-20085: DATA: 16397
-20086: DATA: 24401
-20087: DATA: 31350
-20088: DATA: 6452
-20089: DATA: 13329
-20090: DATA: 21269
-20091: DATA: 28193
-20092: DATA: 3361
-20093: DATA: 10285
-20094: DATA: 18239
-20095: DATA: 25127
-20096: DATA: 288
-20097: DATA: 7220
-20098: DATA: 15140
-20099: DATA: 22068
-20100: DATA: 29995
-20101: DATA: 4131
-20102: DATA: 12126
-20103: DATA: 19055
-20104: DATA: 26910
-20105: DATA: 1092
-20106: DATA: 8976
-20107: DATA: 15941
-20108: DATA: 23997
-20109: DATA: 30861
-20110: DATA: 6143
-20111: DATA: 12993
-20112: DATA: 20540
-20113: DATA: 28432
-20114: DATA: 2660
-20115: DATA: 10580
-20116: DATA: 17575
-20117: DATA: 25484
-20118: DATA: 32476
-20119: DATA: 7269
-20120: DATA: 15207
-20121: DATA: 22096
-20122: DATA: 30099
-20123: DATA: 4325
-20124: DATA: 11876
-20125: DATA: 19817
-20126: DATA: 26805
-20127: DATA: 2041
-20128: DATA: 9521
-20129: DATA: 16485
-20130: DATA: 24511
-20131: DATA: 31471
-20132: DATA: 6192
-20133: DATA: 14188
-20134: DATA: 21124
-20135: DATA: 29132
-20136: DATA: 3963
-20137: DATA: 10923
-20138: DATA: 18832
-20139: DATA: 26377
-20140: DATA: 673
-20141: DATA: 8651
-20142: DATA: 16249
-20143: DATA: 23190
-20144: DATA: 30769
-20145: DATA: 5909
-20146: DATA: 13031
-20147: DATA: 20498
-20148: DATA: 28593
-20149: DATA: 2753
-20150: DATA: 10324
-20151: DATA: 18341
-20152: DATA: 25978
-20153: DATA: 128
-20154: DATA: 7701
-20155: DATA: 15785
-20156: DATA: 23396
-20157: DATA: 30377
-20158: DATA: 5183
-20159: DATA: 13301
-20160: DATA: 20796
-20161: DATA: 27828
-20162: DATA: 2598
-20163: DATA: 10680
-20164: DATA: 18276
-20165: DATA: 25253
-20166: CALL 8083 
-20168: DATA: 15729
-20169: DATA: 22693
-20170: DATA: 30293
-20171: DATA: 5589
-20172: DATA: 13221
-20173: DATA: 20766
-20174: DATA: 27876
-20175: DATA: 2649
-20176: DATA: 10285
-20177: DATA: 18389
-20178: DATA: 25956
-20179: DATA: 202
-20180: DATA: 7851
-20181: DATA: 15463
-20182: DATA: 23508
-20183: DATA: 31136
-20184: DATA: 5991
-20185: DATA: 13009
-20186: DATA: 20633
-20187: DATA: 28259
-20188: DATA: 3109
-20189: DATA: 11241
-20190: DATA: 18873
-20191: DATA: 26490
-20192: DATA: 1338
-20193: DATA: 8422
-20194: DATA: 16126
-20195: DATA: 23613
-20196: DATA: 31332
-20197: DATA: 6594
-20198: DATA: 14238
-20199: DATA: 21824
-20200: DATA: 29492
-20201: DATA: 4385
-20202: DATA: 11477
-20203: DATA: 19102
-20204: DATA: 26800
-20205: DATA: 1620
-20206: DATA: 9342
-20207: DATA: 16916
-20208: DATA: 24608
-20209: DATA: 32732
-20210: DATA: 7679
-20211: DATA: 15251
-20212: DATA: 23012
-20213: DATA: 30554
-20214: DATA: 5471
-20215: DATA: 13168
-20216: DATA: 20856
-20217: DATA: 28417
-20218: DATA: 3408
-20219: DATA: 11055
-20220: DATA: 18721
-20221: DATA: 26493
-20222: DATA: 1317
-20223: DATA: 8998
-20224: DATA: 16689
-20225: DATA: 24369
-20226: DATA: 32112
-20227: DATA: 6954
-20228: DATA: 14636
-20229: DATA: 22312
-20230: DATA: 29982
-20231: DATA: 4933
-20232: DATA: 12640
-20233: DATA: 20333
-20234: DATA: 27989
-20235: DATA: 2829
-20236: DATA: 10657
-20237: DATA: 18324
-20238: DATA: 26103
-20239: DATA: 989
-20240: DATA: 8224
-20241: DATA: 15901
-20242: DATA: 23600
-20243: DATA: 31311
-20244: DATA: 6305
-20245: DATA: 13962
-20246: DATA: 21721
-20247: DATA: 30006
-20248: DATA: 4960
-20249: DATA: 12608
-20250: DATA: 20354
-20251: DATA: 28077
-20252: DATA: 2605
-20253: DATA: 10350
-20254: DATA: 18160
-20255: DATA: 25844
-20256: DATA: 1312
-20257: DATA: 9013
-20258: DATA: 16825
-20259: DATA: 24553
-20260: DATA: 31799
-20261: DATA: 6663
-20262: DATA: 14493
-20263: DATA: 22220
-20264: DATA: 30586
-20265: DATA: 5548
-20266: DATA: 13277
-20267: DATA: 20504
-20268: DATA: 28329
-20269: DATA: 3229
-20270: DATA: 11637
-20271: DATA: 19355
-20272: DATA: 26673
-20273: DATA: 1607
-20274: DATA: 9463
-20275: DATA: 17668
-20276: DATA: 25572
-20277: DATA: 449
-20278: DATA: 7765
-20279: DATA: 15603
-20280: DATA: 23921
-20281: DATA: 31625
-20282: DATA: 6224
-20283: DATA: 14048
-20284: DATA: 22372
-20285: DATA: 30121
-20286: DATA: 4664
-20287: DATA: 12476
-20288: DATA: 20775
-20289: DATA: 28661
-20290: DATA: 3111
-20291: DATA: 10930
-20292: DATA: 19249
-20293: DATA: 27041
-20294: DATA: 1556
-20295: DATA: 9413
-20296: DATA: 17782
-20297: DATA: 25568
-20298: WMEM 7897  16300
-20301: DATA: 23576
-20302: DATA: 31408
-20303: DATA: 6993
-20304: DATA: 14385
-20305: DATA: 22163
-20306: DATA: 30577
-20307: DATA: 5576
-20308: DATA: 12968
-20309: DATA: 21273
-20310: DATA: 29072
-20311: DATA: 3754
-20312: DATA: 12132
-20313: DATA: 19904
-20314: DATA: 27266
-20315: DATA: 2924
-20316: DATA: 10288
-20317: DATA: 18164
-20318: DATA: 26559
-20319: DATA: 1147
-20320: DATA: 9588
-20321: DATA: 17396
-20322: DATA: 24739
-20323: DATA: 366
-20324: DATA: 7729
-20325: DATA: 15584
-20326: DATA: 23961
-20327: DATA: 31307
-20328: DATA: 7027
-20329: DATA: 14437
-20330: DATA: 22212
-20331: DATA: 30597
-20332: DATA: 5281
-20333: DATA: 13597
-20334: DATA: 21093
-20335: DATA: 29446
-20336: DATA: 4145
-20337: DATA: 11975
-20338: DATA: 20378
-20339: DATA: 27797
-20340: DATA: 3493
-20341: DATA: 10846
-20342: DATA: 19216
-20343: DATA: 26731
-20344: DATA: 2427
-20345: DATA: 9797
-20346: DATA: 18183
-20347: DATA: 25644
-20348: DATA: 1341
-20349: DATA: 8829
-20350: DATA: 17188
-20351: DATA: 24634
-20352: DATA: 372
-20353: DATA: 7734
-20354: DATA: 16191
-20355: DATA: 23603
-20356: DATA: 32048
-20357: DATA: 6719
-20358: DATA: 15135
-20359: DATA: 22537
-20360: DATA: 31028
-20361: DATA: 5745
-20362: DATA: 14168
-20363: DATA: 21576
-20364: DATA: 30180
-20365: DATA: 4760
-20366: DATA: 13305
-20367: DATA: 20690
-20368: DATA: 28732
-20369: DATA: 4353
-20370: DATA: 11896
-20371: DATA: 20253
-20372: DATA: 27830
-20373: DATA: 3464
-20374: DATA: 10967
-20375: DATA: 18988
-20376: DATA: 27495
-20377: DATA: 2129
-20378: DATA: 10645
-20379: DATA: 18175
-20380: DATA: 26218
-20381: DATA: 1853
-20382: DATA: 9456
-20383: DATA: 17884
-20384: DATA: 25914
-20385: DATA: 565
-20386: DATA: 9124
-20387: DATA: 16629
-20388: DATA: 24621
-20389: DATA: 382
-20390: DATA: 7888
-20391: DATA: 16342
-20392: DATA: 24445
-20393: DATA: 31921
-20394: DATA: 7621
-20395: DATA: 15628
-20396: DATA: 23216
-20397: DATA: 31700
-20398: DATA: 7039
-20399: DATA: 14491
-20400: DATA: 22648
-20401: DATA: 30997
-20402: DATA: 5860
-20403: DATA: 13845
-20404: DATA: 22433
-20405: DATA: 29837
-20406: DATA: 5188
-20407: DATA: 13792
-20408: DATA: 21880
-20409: DATA: 29312
-20410: DATA: 4608
-20411: DATA: 13218
-20412: DATA: 21302
-20413: DATA: 28841
-20414: DATA: 4149
-20415: DATA: 12711
-20416: DATA: 20830
-20417: DATA: 28326
-20418: DATA: 3640
-20419: DATA: 12210
-20420: DATA: 20273
-20421: DATA: 27809
-20422: DATA: 3092
-20423: DATA: 11717
-20424: DATA: 19815
-20425: DATA: 27360
-20426: DATA: 2654
-20427: DATA: 11209
-20428: DATA: 19428
-20429: DATA: 27401
-20430: DATA: 2296
-20431: DATA: 10320
-20432: DATA: 18548
-20433: DATA: 27008
-20434: DATA: 2403
-20435: DATA: 9944
-20436: DATA: 18102
-20437: DATA: 26189
-20438: DATA: 1988
-20439: DATA: 10154
-20440: DATA: 18228
-20441: DATA: 25796
-20442: DATA: 1232
-20443: DATA: 9341
-20444: DATA: 17462
-20445: DATA: 26104
-20446: DATA: 1459
-20447: DATA: 9594
-20448: DATA: 17722
-20449: DATA: 25331
-20450: DATA: 697
-20451: DATA: 8826
-20452: DATA: 16945
-20453: DATA: 25599
-20454: DATA: 917
-20455: DATA: 9025
-20456: DATA: 17204
-20457: DATA: 25398
-20458: DATA: 209
-20459: DATA: 8331
-20460: DATA: 16545
-20461: DATA: 24605
-20462: DATA: 124
-20463: DATA: 8218
-20464: DATA: 16439
-20465: DATA: 25044
-20466: DATA: 484
-20467: DATA: 8596
-20468: DATA: 16811
-20469: DATA: 24899
-20470: DATA: 272
-20471: DATA: 8548
-20472: DATA: 16743
-20473: DATA: 24901
-20474: DATA: 273
-20475: DATA: 8557
-20476: DATA: 16672
-20477: DATA: 24888
-20478: DATA: 310
-20479: DATA: 8500
-20480: DATA: 16673
-20481: DATA: 24889
-20482: DATA: 292
-20483: DATA: 8563
-20484: DATA: 16718
-20485: DATA: 24903
-20486: DATA: 292
-20487: DATA: 8461
-20488: DATA: 16753
-20489: DATA: 24869
-20490: DATA: 323
-20491: DATA: 8520
-20492: DATA: 16807
-20493: DATA: 24978
-20494: DATA: 510
-20495: DATA: 8657
-20496: DATA: 16500
-20497: DATA: 24593
-20498: DATA: 117
-20499: DATA: 8270
-20500: DATA: 16560
-20501: DATA: 24708
-20502: DATA: 222
-20503: DATA: 8996
-20504: DATA: 17248
-20505: DATA: 25420
-20506: DATA: 927
-20507: DATA: 9187
-20508: DATA: 17000
-20509: DATA: 25149
-20510: DATA: 696
-20511: DATA: 8954
-20512: DATA: 17699
-20513: DATA: 25968
-20514: DATA: 1446
-20515: DATA: 9720
-20516: DATA: 17462
-20517: DATA: 25633
-20518: DATA: 1232
-20519: DATA: 9420
-20520: DATA: 18279
-20521: DATA: 26597
-20522: DATA: 1984
-20523: DATA: 9759
-20524: DATA: 18081
-20525: DATA: 26329
-20526: DATA: 2425
-20527: DATA: 10646
-20528: DATA: 18464
-20529: DATA: 26704
-20530: DATA: 2292
-20531: DATA: 11101
-20532: DATA: 19376
-20533: DATA: 27586
-20534: DATA: 2576
-20535: DATA: 10999
-20536: DATA: 19825
-20537: DATA: 28052
-20538: DATA: 3077
-20539: DATA: 11428
-20540: DATA: 20278
-20541: DATA: 28600
-20542: DATA: 3696
-20543: DATA: 11956
-20544: DATA: 20852
-20545: DATA: 29091
-20546: DATA: 4149
-20547: DATA: 12463
-20548: DATA: 21309
-20549: DATA: 29677
-20550: DATA: 4611
-20551: DATA: 12949
-20552: DATA: 21873
-20553: DATA: 30182
-20554: DATA: 5209
-20555: DATA: 13515
-20556: DATA: 22445
-20557: DATA: 30238
-20558: DATA: 5786
-20559: DATA: 14672
-20560: DATA: 22586
-20561: DATA: 30864
-20562: DATA: 7010
-20563: DATA: 15322
-20564: DATA: 23229
-20565: DATA: 32077
-20566: DATA: 7644
-20567: DATA: 15520
-20568: DATA: 24418
-20569: DATA: 32704
-20570: DATA: 7836
-20571: DATA: 16685
-20572: DATA: 24621
-20573: DATA: 243
-20574: DATA: 9200
-20575: DATA: 16993
-20576: DATA: 25916
-20577: DATA: 1520
-20578: DATA: 9456
-20579: DATA: 18296
-20580: DATA: 26157
-20581: DATA: 1770
-20582: DATA: 10648
-20583: DATA: 18513
-20584: DATA: 27516
-20585: DATA: 2661
-20586: DATA: 10946
-20587: DATA: 19848
-20588: DATA: 27811
-20589: DATA: 3924
-20590: DATA: 11875
-20591: DATA: 20737
-20592: DATA: 28721
-20593: DATA: 4295
-20594: DATA: 13246
-20595: DATA: 21213
-20596: DATA: 30180
-20597: DATA: 5241
-20598: DATA: 14168
-20599: DATA: 22112
-20600: DATA: 31028
-20601: DATA: 6161
-20602: DATA: 15125
-20603: DATA: 23073
-20604: DATA: 32033
-20605: DATA: 7213
-20606: DATA: 16191
-20607: DATA: 24103
-20608: DATA: 288
-20609: DATA: 8240
-20610: DATA: 17186
-20611: DATA: 25213
-20612: DATA: 1321
-20613: DATA: 9272
-20614: DATA: 18179
-20615: DATA: 26129
-20616: DATA: 2356
-20617: DATA: 10353
-20618: DATA: 19281
-20619: DATA: 27206
-20620: DATA: 3489
-20621: DATA: 11485
-20622: DATA: 20471
-20623: DATA: 28359
-20624: DATA: 4145
-20625: DATA: 13076
-20626: DATA: 21092
-20627: DATA: 29981
-20628: DATA: 5287
-20629: DATA: 14220
-20630: DATA: 22210
-20631: DATA: 30752
-20632: DATA: 6964
-20633: DATA: 14929
-20634: DATA: 23967
-20635: DATA: 31879
-20636: DATA: 7719
-20637: DATA: 16754
-20638: DATA: 24766
-20639: DATA: 1011
-20640: DATA: 9533
-20641: DATA: 17511
-20642: DATA: 26557
-20643: DATA: 1725
-20644: DATA: 10288
-20645: DATA: 19301
-20646: DATA: 27281
-20647: DATA: 3537
-20648: DATA: 12084
-20649: DATA: 20145
-20650: DATA: 29144
-20651: DATA: 4868
-20652: DATA: 12983
-20653: DATA: 21917
-20654: DATA: 30581
-20655: DATA: 5787
-20656: DATA: 14385
-20657: DATA: 23367
-20658: DATA: 31479
-20659: DATA: 7172
-20660: DATA: 16356
-20661: DATA: 24257
-20662: DATA: 85
-20663: DATA: 9203
-20664: DATA: 17777
-20665: DATA: 25737
-20666: DATA: 1616
-20667: DATA: 10660
-20668: DATA: 19255
-20669: DATA: 27389
-20670: DATA: 3125
-20671: DATA: 12205
-20672: DATA: 20789
-20673: DATA: 28854
-20674: DATA: 4644
-20675: DATA: 13745
-20676: DATA: 22333
-20677: DATA: 30445
-20678: DATA: 6163
-20679: DATA: 15242
-20680: DATA: 23910
-20681: DATA: 31991
-20682: DATA: 7765
-20683: DATA: 16846
-20684: DATA: 25520
-20685: DATA: 1373
-20686: DATA: 9458
-20687: DATA: 18000
-20688: DATA: 26674
-20689: DATA: 2970
-20690: DATA: 11618
-20691: DATA: 19672
-20692: DATA: 28388
-20693: DATA: 4121
-20694: DATA: 13269
-20695: DATA: 21929
-20696: DATA: 30577
-20697: DATA: 5845
-20698: DATA: 14495
-20699: DATA: 23167
-20700: DATA: 31792
-20701: DATA: 8180
-20702: DATA: 16830
-20703: DATA: 25458
-20704: DATA: 1396
-20705: DATA: 9468
-20706: DATA: 18084
-20707: DATA: 26734
-20708: DATA: 2660
-20709: DATA: 11768
-20710: DATA: 20355
-20711: DATA: 28992
-20712: DATA: 4966
-20713: DATA: 13668
-20714: DATA: 21690
-20715: DATA: 30372
-20716: DATA: 6306
-20717: DATA: 14877
-20718: DATA: 23673
-20719: DATA: 32257
-20720: DATA: 8308
-20721: DATA: 17372
-20722: DATA: 26083
-20723: DATA: 2013
-20724: DATA: 10657
-20725: DATA: 19291
-20726: DATA: 27989
-20727: DATA: 3947
-20728: DATA: 12596
-20729: DATA: 21270
-20730: DATA: 29980
-20731: DATA: 5924
-20732: DATA: 14627
-20733: DATA: 23349
-20734: DATA: 32036
-20735: DATA: 7993
-20736: DATA: 16685
-20737: DATA: 25461
-20738: DATA: 1343
-20739: DATA: 10043
-20740: DATA: 18722
-20741: DATA: 27489
-20742: DATA: 3408
-20743: DATA: 12049
-20744: DATA: 20860
-20745: DATA: 29536
-20746: DATA: 5392
-20747: DATA: 14168
-20748: DATA: 22967
-20749: DATA: 31640
-20750: DATA: 7650
-20751: DATA: 16277
-20752: DATA: 24611
-20753: DATA: 538
-20754: DATA: 9317
-20755: DATA: 18001
-20756: DATA: 26784
-20757: DATA: 2765
-20758: DATA: 11416
-20759: DATA: 20789
-20760: DATA: 29542
-20761: DATA: 5450
-20762: DATA: 14226
-20763: DATA: 23020
-20764: DATA: 31270
-20765: DATA: 7281
-20766: DATA: 16041
-20767: DATA: 24764
-20768: DATA: 1396
-20769: DATA: 10100
-20770: DATA: 18850
-20771: DATA: 27631
-20772: DATA: 3117
-20773: DATA: 11899
-20774: DATA: 20629
-20775: DATA: 29317
-20776: DATA: 6005
-20777: DATA: 14769
-20778: DATA: 23440
-20779: DATA: 31769
-20780: DATA: 7852
-20781: DATA: 16600
-20782: DATA: 25904
-20783: DATA: 1942
-20784: DATA: 10299
-20785: DATA: 19015
-20786: DATA: 27874
-20787: DATA: 4376
-20788: DATA: 13223
-20789: DATA: 21977
-20790: DATA: 30266
-20791: DATA: 6377
-20792: DATA: 15739
-20793: DATA: 24454
-20794: CALL 8889 
-20796: DATA: 18221
-20797: DATA: 27058
-20798: DATA: 2622
-20799: DATA: 11513
-20800: DATA: 20852
-20801: DATA: 29623
-20802: DATA: 5157
-20803: DATA: 13993
-20804: DATA: 23396
-20805: DATA: 32186
-20806: DATA: 7711
-20807: DATA: 16528
-20808: DATA: 25976
-20809: DATA: 2017
-20810: DATA: 10256
-20811: DATA: 19151
-20812: DATA: 28598
-20813: DATA: 4116
-20814: DATA: 13045
-20815: DATA: 22355
-20816: DATA: 30776
-20817: DATA: 6796
-20818: DATA: 16176
-20819: DATA: 25048
-20820: DATA: 700
-20821: DATA: 10013
-20822: DATA: 18901
-20823: DATA: 27319
-20824: DATA: 3965
-20825: DATA: 12736
-20826: DATA: 21150
-20827: DATA: 30574
-20828: DATA: 6177
-20829: DATA: 15037
-20830: DATA: 24497
-20831: DATA: 123
-20832: DATA: 9531
-20833: DATA: 18424
-20834: DATA: 26801
-20835: DATA: 3441
-20836: DATA: 11821
-20837: DATA: 20712
-20838: DATA: 30083
-20839: DATA: 5637
-20840: DATA: 15229
-20841: DATA: 23595
-20842: DATA: 32400
-20843: DATA: 9113
-20844: DATA: 17580
-20845: DATA: 26968
-20846: DATA: 2608
-20847: DATA: 12051
-20848: DATA: 20533
-20849: DATA: 29399
-20850: DATA: 6114
-20851: DATA: 14484
-20852: DATA: 23975
-20853: DATA: 32269
-20854: DATA: 9055
-20855: DATA: 17507
-20856: DATA: 26932
-20857: DATA: 2583
-20858: DATA: 12053
-20859: DATA: 20524
-20860: DATA: 29992
-20861: DATA: 5684
-20862: DATA: 15140
-20863: DATA: 23596
-20864: DATA: 350
-20865: DATA: 8764
-20866: DATA: 18212
-20867: DATA: 26670
-20868: DATA: 3361
-20869: DATA: 11809
-20870: DATA: 21270
-20871: DATA: 29765
-20872: DATA: 6457
-20873: DATA: 14885
-20874: DATA: 24388
-20875: DATA: 69
-20876: DATA: 9645
-20877: DATA: 18062
-20878: DATA: 27568
-20879: DATA: 3292
-20880: DATA: 12327
-20881: DATA: 21849
-20882: DATA: 30256
-20883: DATA: 6994
-20884: DATA: 15522
-20885: DATA: 25037
-20886: DATA: 723
-20887: DATA: 9770
-20888: DATA: 19297
-20889: DATA: 27735
-20890: DATA: 4483
-20891: DATA: 13032
-20892: DATA: 22120
-20893: DATA: 31549
-20894: DATA: 7358
-20895: DATA: 16890
-20896: DATA: 25888
-20897: DATA: 1589
-20898: DATA: 11170
-20899: DATA: 19704
-20900: DATA: 28711
-20901: DATA: 5474
-20902: DATA: 13981
-20903: DATA: 23496
-20904: DATA: 32625
-20905: DATA: 8363
-20906: DATA: 17876
-20907: DATA: 26888
-20908: DATA: 2720
-20909: DATA: 12179
-20910: DATA: 21296
-20911: DATA: 29909
-20912: DATA: 6165
-20913: DATA: 15707
-20914: DATA: 24297
-20915: DATA: 605
-20916: DATA: 10160
-20917: DATA: 18632
-20918: DATA: 27740
-20919: DATA: 4576
-20920: DATA: 13668
-20921: DATA: 22154
-20922: DATA: 31234
-20923: DATA: 8121
-20924: DATA: 17185
-20925: DATA: 25775
-20926: DATA: 2160
-20927: DATA: 11682
-20928: DATA: 20795
-20929: DATA: 29344
-20930: DATA: 5692
-20931: DATA: 15289
-20932: DATA: 24420
-20933: DATA: 163
-20934: DATA: 9237
-20935: DATA: 18816
-20936: DATA: 28016
-20937: DATA: 3749
-20938: DATA: 12868
-20939: DATA: 22466
-20940: DATA: 31716
-20941: DATA: 7945
-20942: DATA: 16629
-20943: DATA: 25670
-20944: DATA: 2080
-20945: DATA: 11775
-20946: DATA: 20836
-20947: DATA: 29397
-20948: DATA: 5793
-20949: DATA: 14925
-20950: DATA: 24533
-20951: DATA: 939
-20952: DATA: 10097
-20953: DATA: 18647
-20954: DATA: 27799
-20955: DATA: 4212
-20956: DATA: 13412
-20957: DATA: 23025
-20958: DATA: 32181
-20959: DATA: 8547
-20960: DATA: 17713
-20961: DATA: 26361
-20962: DATA: 2800
-20963: DATA: 11892
-20964: DATA: 21034
-20965: DATA: 30637
-20966: DATA: 7044
-20967: DATA: 16205
-20968: DATA: 25457
-20969: DATA: 1893
-20970: DATA: 10453
-20971: DATA: 19588
-20972: DATA: 28835
-20973: DATA: 5205
-20974: DATA: 14436
-20975: DATA: 23581
-20976: DATA: 116
-20977: DATA: 9671
-20978: DATA: 18933
-20979: DATA: 28058
-20980: DATA: 4525
-20981: DATA: 13662
-20982: DATA: 22852
-20983: DATA: 32096
-20984: DATA: 8550
-20985: DATA: 17733
-20986: DATA: 26897
-20987: DATA: 3363
-20988: DATA: 12576
-20989: DATA: 21885
-20990: DATA: 31025
-20991: DATA: 7479
-20992: DATA: 16699
-20993: DATA: 25895
-20994: DATA: 2340
-20995: DATA: 11645
-20996: DATA: 20784
-20997: DATA: 29992
-20998: DATA: 6428
-20999: DATA: 15616
-21000: DATA: 24932
-21001: DATA: 1386
-21002: DATA: 10562
-21003: DATA: 19801
-21004: DATA: 29093
-21005: DATA: 5513
-21006: DATA: 14841
-21007: DATA: 24026
-21008: DATA: 58
-21009: DATA: 9301
-21010: DATA: 18553
-21011: DATA: 27739
-21012: DATA: 4324
-21013: DATA: 13444
-21014: DATA: 22724
-21015: DATA: 32613
-21016: DATA: 9085
-21017: DATA: 18262
-21018: DATA: 27600
-21019: DATA: 4067
-21020: DATA: 12843
-21021: DATA: 22121
-21022: DATA: 31450
-21023: DATA: 7920
-21024: DATA: 17708
-21025: DATA: 26996
-21026: DATA: 3507
-21027: DATA: 12777
-21028: DATA: 21544
-21029: DATA: 30836
-21030: DATA: 7376
-21031: DATA: 16582
-21032: DATA: 26491
-21033: DATA: 2999
-21034: DATA: 12226
-21035: DATA: 21000
-21036: DATA: 30375
-21037: DATA: 6857
-21038: DATA: 16702
-21039: DATA: 26111
-21040: DATA: 2142
-21041: DATA: 11361
-21042: DATA: 20728
-21043: DATA: 30484
-21044: DATA: 7095
-21045: DATA: 16269
-21046: DATA: 25154
-21047: DATA: 1760
-21048: DATA: 11621
-21049: DATA: 20880
-21050: DATA: 29721
-21051: DATA: 6335
-21052: DATA: 16161
-21053: DATA: 25529
-21054: DATA: 1648
-21055: DATA: 10917
-21056: DATA: 20774
-21057: DATA: 30128
-21058: DATA: 6195
-21059: DATA: 15540
-21060: DATA: 25399
-21061: DATA: 1956
-21062: DATA: 10783
-21063: DATA: 20107
-21064: DATA: 30004
-21065: DATA: 6636
-21066: DATA: 15453
-21067: DATA: 24797
-21068: DATA: 1960
-21069: DATA: 10772
-21070: DATA: 20213
-21071: DATA: 30022
-21072: DATA: 6260
-21073: DATA: 15489
-21074: DATA: 25464
-21075: DATA: 2012
-21076: DATA: 10928
-21077: DATA: 20813
-21078: DATA: 30148
-21079: DATA: 6317
-21080: DATA: 16241
-21081: DATA: 25477
-21082: DATA: 1683
-21083: DATA: 11618
-21084: DATA: 20522
-21085: DATA: 29947
-21086: DATA: 7097
-21087: DATA: 15975
-21088: DATA: 25913
-21089: DATA: 2548
-21090: DATA: 11428
-21091: DATA: 21364
-21092: DATA: 30251
-21093: DATA: 6883
-21094: DATA: 16848
-21095: DATA: 25672
-21096: DATA: 2929
-21097: DATA: 11814
-21098: DATA: 21208
-21099: DATA: 31116
-21100: DATA: 7338
-21101: DATA: 17236
-21102: DATA: 26211
-21103: DATA: 3352
-21104: DATA: 12404
-21105: DATA: 21698
-21106: DATA: 31743
-21107: DATA: 7816
-21108: DATA: 17832
-21109: DATA: 26697
-21110: DATA: 3856
-21111: DATA: 12903
-21112: DATA: 22897
-21113: DATA: 31813
-21114: DATA: 8966
-21115: DATA: 17960
-21116: DATA: 27958
-21117: DATA: 4132
-21118: DATA: 14170
-21119: DATA: 23094
-21120: DATA: 315
-21121: DATA: 9272
-21122: DATA: 19232
-21123: DATA: 28200
-21124: DATA: 5424
-21125: DATA: 14380
-21126: DATA: 24324
-21127: DATA: 524
-21128: DATA: 10619
-21129: DATA: 19563
-21130: DATA: 29521
-21131: DATA: 5697
-21132: DATA: 15784
-21133: DATA: 24708
-21134: DATA: 1968
-21135: DATA: 10960
-21136: DATA: 20524
-21137: DATA: 30469
-21138: DATA: 6773
-21139: DATA: 16723
-21140: DATA: 25783
-21141: DATA: 2948
-21142: DATA: 11974
-21143: DATA: 21536
-21144: DATA: 31546
-21145: DATA: 7685
-21146: DATA: 17872
-21147: DATA: 26842
-21148: DATA: 3628
-21149: DATA: 13684
-21150: DATA: 22716
-21151: DATA: 32752
-21152: DATA: 9588
-21153: DATA: 18529
-21154: DATA: 28600
-21155: DATA: 4852
-21156: DATA: 14391
-21157: DATA: 24365
-21158: DATA: 647
-21159: DATA: 10698
-21160: DATA: 20321
-21161: DATA: 29353
-21162: DATA: 6612
-21163: DATA: 16205
-21164: DATA: 25256
-21165: DATA: 2516
-21166: DATA: 12155
-21167: DATA: 21136
-21168: DATA: 30776
-21169: DATA: 8012
-21170: DATA: 17072
-21171: DATA: 26643
-21172: DATA: 4011
-21173: DATA: 13017
-21174: DATA: 22544
-21175: DATA: 32743
-21176: DATA: 9585
-21177: DATA: 18629
-21178: DATA: 28177
-21179: DATA: 5539
-21180: DATA: 15204
-21181: DATA: 24244
-21182: DATA: 1059
-21183: DATA: 11174
-21184: DATA: 20769
-21185: DATA: 29872
-21186: DATA: 6768
-21187: DATA: 16827
-21188: DATA: 26411
-21189: DATA: 2751
-21190: DATA: 12368
-21191: DATA: 22409
-21192: DATA: 32117
-21193: DATA: 8439
-21194: DATA: 18007
-21195: DATA: 28104
-21196: DATA: 5097
-21197: DATA: 14711
-21198: DATA: 23779
-21199: DATA: 598
-21200: DATA: 10293
-21201: DATA: 20377
-21202: DATA: 30069
-21203: DATA: 6301
-21204: DATA: 16048
-21205: DATA: 25608
-21206: DATA: 3036
-21207: DATA: 12704
-21208: DATA: 22372
-21209: DATA: 31434
-21210: DATA: 8322
-21211: DATA: 18041
-21212: DATA: 27681
-21213: DATA: 5103
-21214: DATA: 14755
-21215: DATA: 24377
-21216: DATA: 1396
-21217: DATA: 10484
-21218: DATA: 20208
-21219: DATA: 29813
-21220: DATA: 6717
-21221: DATA: 16893
-21222: DATA: 26527
-21223: DATA: 3409
-21224: DATA: 13180
-21225: DATA: 22816
-21226: DATA: 31940
-21227: DATA: 8836
-21228: DATA: 18599
-21229: DATA: 28252
-21230: DATA: 5244
-21231: DATA: 14933
-21232: DATA: 24636
-21233: DATA: 2004
-21234: DATA: 11774
-21235: DATA: 21401
-21236: DATA: 31209
-21237: DATA: 8005
-21238: DATA: 17749
-21239: DATA: 27497
-21240: DATA: 4464
-21241: DATA: 14149
-21242: DATA: 23812
-21243: DATA: 808
-21244: DATA: 10536
-21245: DATA: 20280
-21246: DATA: 29984
-21247: DATA: 6970
-21248: DATA: 16678
-21249: DATA: 26401
-21250: DATA: 3381
-21251: DATA: 13103
-21252: DATA: 22884
-21253: DATA: 32570
-21254: DATA: 9503
-21255: DATA: 19216
-21256: DATA: 29048
-21257: DATA: 5985
-21258: DATA: 15632
-21259: DATA: 25433
-21260: DATA: 2469
-21261: DATA: 12182
-21262: DATA: 22005
-21263: DATA: 31637
-21264: DATA: 8246
-21265: DATA: 17948
-21266: DATA: 27772
-21267: DATA: 4689
-21268: DATA: 14509
-21269: DATA: 24194
-21270: DATA: 1246
-21271: DATA: 11574
-21272: DATA: 21300
-21273: DATA: 31050
-21274: DATA: 8086
-21275: DATA: 17799
-21276: DATA: 27197
-21277: DATA: 4216
-21278: DATA: 14001
-21279: DATA: 23783
-21280: DATA: 1319
-21281: DATA: 11061
-21282: DATA: 20900
-21283: DATA: 30706
-21284: DATA: 7268
-21285: DATA: 17006
-21286: DATA: 26783
-21287: DATA: 3784
-21288: DATA: 14180
-21289: DATA: 23984
-21290: DATA: 964
-21291: DATA: 10248
-21292: DATA: 20196
-21293: DATA: 29897
-21294: DATA: 7544
-21295: DATA: 17296
-21296: DATA: 26740
-21297: DATA: 3655
-21298: DATA: 13557
-21299: DATA: 23822
-21300: DATA: 945
-21301: DATA: 10689
-21302: DATA: 20036
-21303: DATA: 29861
-21304: DATA: 7541
-21305: DATA: 17291
-21306: DATA: 26644
-21307: DATA: 3821
-21308: DATA: 14119
-21309: DATA: 23986
-21310: DATA: 574
-21311: DATA: 10419
-21312: DATA: 20797
-21313: DATA: 30631
-21314: DATA: 7229
-21315: DATA: 17149
-21316: DATA: 27440
-21317: DATA: 4517
-21318: DATA: 13841
-21319: DATA: 23697
-21320: DATA: 1332
-21321: DATA: 11249
-21322: DATA: 20568
-21323: DATA: 30408
-21324: DATA: 8164
-21325: DATA: 17432
-21326: DATA: 27385
-21327: DATA: 4946
-21328: DATA: 14396
-21329: DATA: 24193
-21330: DATA: 1912
-21331: DATA: 11677
-21332: DATA: 21174
-21333: DATA: 31496
-21334: DATA: 8663
-21335: DATA: 18092
-21336: DATA: 28519
-21337: DATA: 5585
-21338: DATA: 14997
-21339: DATA: 25471
-21340: DATA: 2148
-21341: DATA: 12020
-21342: DATA: 22435
-21343: DATA: 31797
-21344: DATA: 9527
-21345: DATA: 19450
-21346: DATA: 28834
-21347: DATA: 6511
-21348: DATA: 15905
-21349: DATA: 25838
-21350: DATA: 3460
-21351: DATA: 12811
-21352: DATA: 23326
-21353: DATA: 79
-21354: DATA: 9977
-21355: DATA: 20363
-21356: DATA: 29924
-21357: DATA: 7492
-21358: DATA: 17023
-21359: DATA: 27392
-21360: DATA: 4212
-21361: DATA: 14035
-21362: DATA: 24569
-21363: DATA: 1171
-21364: DATA: 11680
-21365: DATA: 21005
-21366: DATA: 31561
-21367: DATA: 8298
-21368: DATA: 18785
-21369: DATA: 28183
-21370: DATA: 5891
-21371: DATA: 15400
-21372: DATA: 25896
-21373: DATA: 2619
-21374: DATA: 13168
-21375: DATA: 22561
-21376: DATA: 294
-21377: DATA: 9780
-21378: DATA: 20256
-21379: DATA: 29741
-21380: DATA: 7457
-21381: DATA: 16937
-21382: DATA: 27472
-21383: DATA: 4108
-21384: DATA: 14714
-21385: DATA: 24101
-21386: DATA: 1873
-21387: DATA: 11331
-21388: DATA: 21988
-21389: DATA: 31388
-21390: DATA: 9212
-21391: DATA: 18625
-21392: DATA: 28721
-21393: DATA: 6407
-21394: DATA: 15998
-21395: DATA: 26460
-21396: DATA: 3248
-21397: DATA: 13704
-21398: DATA: 23184
-21399: DATA: 545
-21400: DATA: 11133
-21401: DATA: 20552
-21402: DATA: 31125
-21403: DATA: 7907
-21404: DATA: 17975
-21405: DATA: 28532
-21406: DATA: 5311
-21407: DATA: 15867
-21408: DATA: 25972
-21409: DATA: 2658
-21410: DATA: 13241
-21411: DATA: 22761
-21412: DATA: 44
-21413: DATA: 10541
-21414: DATA: 20126
-21415: DATA: 30666
-21416: DATA: 8032
-21417: DATA: 17581
-21418: DATA: 28121
-21419: DATA: 5379
-21420: DATA: 15011
-21421: DATA: 25501
-21422: DATA: 2930
-21423: DATA: 12416
-21424: DATA: 22560
-21425: DATA: 277
-21426: DATA: 9969
-21427: DATA: 20087
-21428: DATA: 30636
-21429: DATA: 7372
-21430: DATA: 17502
-21431: DATA: 28129
-21432: DATA: 5433
-21433: DATA: 14989
-21434: DATA: 25109
-21435: DATA: 2977
-21436: DATA: 13088
-21437: DATA: 22781
-21438: DATA: 36
-21439: DATA: 10672
-21440: DATA: 20792
-21441: DATA: 30384
-21442: DATA: 7712
-21443: DATA: 18354
-21444: DATA: 28470
-21445: DATA: 5305
-21446: DATA: 15381
-21447: DATA: 26007
-21448: DATA: 3384
-21449: DATA: 12965
-21450: DATA: 23113
-21451: DATA: 962
-21452: DATA: 11185
-21453: DATA: 21341
-21454: DATA: 30951
-21455: DATA: 8284
-21456: DATA: 18488
-21457: DATA: 29081
-21458: DATA: 6448
-21459: DATA: 16083
-21460: DATA: 26273
-21461: DATA: 3592
-21462: DATA: 14292
-21463: DATA: 24549
-21464: DATA: 1888
-21465: DATA: 11466
-21466: DATA: 21712
-21467: DATA: 31848
-21468: DATA: 9276
-21469: DATA: 19945
-21470: DATA: 30114
-21471: DATA: 7540
-21472: DATA: 17719
-21473: DATA: 27361
-21474: DATA: 4848
-21475: DATA: 14953
-21476: DATA: 25132
-21477: DATA: 3048
-21478: DATA: 13264
-21479: DATA: 23366
-21480: DATA: 891
-21481: DATA: 11051
-21482: DATA: 20694
-21483: DATA: 30852
-21484: DATA: 8374
-21485: DATA: 18512
-21486: DATA: 28785
-21487: DATA: 6145
-21488: DATA: 16445
-21489: DATA: 27098
-21490: DATA: 4606
-21491: DATA: 14813
-21492: DATA: 24997
-21493: DATA: 2369
-21494: DATA: 12631
-21495: DATA: 22890
-21496: DATA: 358
-21497: DATA: 10508
-21498: DATA: 20740
-21499: DATA: 31013
-21500: DATA: 8489
-21501: DATA: 18801
-21502: DATA: 29018
-21503: DATA: 6439
-21504: DATA: 16689
-21505: DATA: 26940
-21506: DATA: 4413
-21507: DATA: 14637
-21508: DATA: 24872
-21509: DATA: 2344
-21510: DATA: 12573
-21511: DATA: 22784
-21512: DATA: 378
-21513: DATA: 10609
-21514: DATA: 20752
-21515: DATA: 31044
-21516: DATA: 8624
-21517: DATA: 18909
-21518: DATA: 29183
-21519: DATA: 6619
-21520: DATA: 16500
-21521: DATA: 26648
-21522: DATA: 4223
-21523: DATA: 14415
-21524: DATA: 24737
-21525: DATA: 2253
-21526: DATA: 12480
-21527: DATA: 23338
-21528: DATA: 867
-21529: DATA: 11072
-21530: DATA: 21378
-21531: DATA: 31723
-21532: DATA: 8753
-21533: DATA: 19057
-21534: DATA: 29424
-21535: DATA: 6909
-21536: DATA: 17717
-21537: DATA: 28007
-21538: DATA: 5556
-21539: DATA: 15850
-21540: DATA: 25637
-21541: DATA: 3199
-21542: DATA: 13461
-21543: DATA: 23689
-21544: DATA: 1844
-21545: DATA: 12196
-21546: DATA: 22494
-21547: DATA: 32265
-21548: DATA: 9956
-21549: DATA: 20178
-21550: DATA: 31072
-21551: DATA: 8577
-21552: DATA: 18493
-21553: DATA: 28760
-21554: DATA: 6393
-21555: DATA: 17159
-21556: DATA: 27553
-21557: DATA: 5005
-21558: DATA: 14937
-21559: DATA: 25329
-21560: DATA: 3386
-21561: DATA: 13765
-21562: DATA: 23632
-21563: DATA: 1177
-21564: DATA: 12076
-21565: DATA: 22452
-21566: DATA: 32291
-21567: DATA: 9973
-21568: DATA: 20775
-21569: DATA: 31165
-21570: DATA: 8255
-21571: DATA: 18600
-21572: DATA: 29480
-21573: DATA: 7081
-21574: DATA: 16988
-21575: DATA: 27333
-21576: DATA: 5493
-21577: DATA: 15857
-21578: DATA: 25616
-21579: DATA: 3289
-21580: DATA: 14252
-21581: DATA: 24088
-21582: DATA: 1690
-21583: DATA: 12611
-21584: DATA: 22577
-21585: DATA: 135
-21586: DATA: 11113
-21587: DATA: 21405
-21588: DATA: 31400
-21589: DATA: 9480
-21590: DATA: 19921
-21591: DATA: 29878
-21592: DATA: 8032
-21593: DATA: 18313
-21594: DATA: 28368
-21595: DATA: 6508
-21596: DATA: 16424
-21597: DATA: 26865
-21598: DATA: 5055
-21599: DATA: 14946
-21600: DATA: 25972
-21601: DATA: 3564
-21602: DATA: 13503
-21603: DATA: 24424
-21604: DATA: 1636
-21605: DATA: 12025
-21606: DATA: 22943
-21607: GT   11120 21024 31428
-21611: DATA: 9608
-21612: DATA: 19638
-21613: DATA: 30544
-21614: DATA: 7801
-21615: DATA: 18715
-21616: DATA: 28721
-21617: DATA: 6293
-21618: DATA: 17380
-21619: DATA: 27285
-21620: DATA: 5537
-21621: DATA: 15373
-21622: DATA: 26438
-21623: DATA: 3684
-21624: DATA: 14712
-21625: DATA: 24592
-21626: DATA: 2837
-21627: DATA: 12909
-21628: DATA: 23851
-21629: DATA: 1083
-21630: DATA: 12144
-21631: DATA: 22049
-21632: DATA: 316
-21633: DATA: 10288
-21634: DATA: 21360
-21635: DATA: 31288
-21636: DATA: 9517
-21637: DATA: 19498
-21638: DATA: 30488
-21639: DATA: 7697
-21640: DATA: 18812
-21641: DATA: 28709
-21642: DATA: 6978
-21643: DATA: 16968
-21644: DATA: 28067
-21645: DATA: 5268
-21646: DATA: 16355
-21647: DATA: 26305
-21648: DATA: 4145
-21649: DATA: 15111
-21650: DATA: 25136
-21651: DATA: 3402
-21652: DATA: 13484
-21653: DATA: 24452
-21654: DATA: 1747
-21655: DATA: 12333
-21656: DATA: 23348
-21657: DATA: 594
-21658: DATA: 11679
-21659: DATA: 21752
-21660: DATA: 32296
-21661: DATA: 10617
-21662: DATA: 20698
-21663: DATA: 31741
-21664: DATA: 9525
-21665: DATA: 19555
-21666: DATA: 30645
-21667: DATA: 7869
-21668: DATA: 18470
-21669: DATA: 29544
-21670: DATA: 6805
-21671: DATA: 17867
-21672: DATA: 28468
-21673: DATA: 5796
-21674: DATA: 16851
-21675: DATA: 27406
-21676: DATA: 4769
-21677: DATA: 15821
-21678: DATA: 26468
-21679: DATA: 3728
-21680: DATA: 14384
-21681: DATA: 25365
-21682: DATA: 2802
-21683: DATA: 13316
-21684: DATA: 24548
-21685: DATA: 1753
-21686: DATA: 12376
-21687: DATA: 23520
-21688: DATA: 1332
-21689: DATA: 11409
-21690: DATA: 22037
-21691: DATA: 417
-21692: DATA: 11041
-21693: DATA: 21165
-21694: DATA: 31807
-21695: DATA: 10151
-21696: DATA: 20768
-21697: DATA: 30896
-21698: DATA: 8738
-21699: DATA: 19962
-21700: DATA: 30519
-21701: DATA: 7917
-21702: DATA: 18451
-21703: DATA: 29578
-21704: DATA: 7546
-21705: DATA: 17635
-21706: DATA: 28249
-21707: DATA: 6623
-21708: DATA: 17321
-21709: DATA: 27932
-21710: DATA: 5348
-21711: DATA: 15964
-21712: DATA: 26683
-21713: DATA: 5019
-21714: DATA: 15664
-21715: DATA: 25808
-21716: DATA: 3745
-21717: DATA: 14350
-21718: DATA: 25560
-21719: DATA: 3492
-21720: DATA: 14202
-21721: DATA: 24268
-21722: DATA: 2179
-21723: DATA: 12896
-21724: DATA: 23658
-21725: DATA: 1943
-21726: DATA: 12762
-21727: DATA: 23361
-21728: DATA: 1340
-21729: DATA: 11504
-21730: DATA: 22206
-21731: DATA: 49
-21732: DATA: 10852
-21733: DATA: 22014
-21734: DATA: 32661
-21735: DATA: 10577
-21736: DATA: 21300
-21737: DATA: 32049
-21738: DATA: 9432
-21739: DATA: 20104
-21740: DATA: 30948
-21741: DATA: 8792
-21742: DATA: 19577
-21743: DATA: 30226
-21744: DATA: 8252
-21745: DATA: 19393
-21746: DATA: 30200
-21747: DATA: 8157
-21748: DATA: 18870
-21749: DATA: 29512
-21750: DATA: 7511
-21751: DATA: 18284
-21752: DATA: 29031
-21753: DATA: 6929
-21754: DATA: 17685
-21755: DATA: 28479
-21756: DATA: 6500
-21757: DATA: 17193
-21758: DATA: 27967
-21759: DATA: 6005
-21760: DATA: 16672
-21761: DATA: 27453
-21762: DATA: 5433
-21763: DATA: 16174
-21764: DATA: 26980
-21765: DATA: 4923
-21766: DATA: 15633
-21767: DATA: 26377
-21768: DATA: 4449
-21769: DATA: 15200
-21770: DATA: 25884
-21771: DATA: 3853
-21772: DATA: 14757
-21773: DATA: 25502
-21774: DATA: 3556
-21775: DATA: 14300
-21776: DATA: 24610
-21777: DATA: 2580
-21778: DATA: 13412
-21779: DATA: 24152
-21780: DATA: 2276
-21781: DATA: 12953
-21782: DATA: 23768
-21783: DATA: 2336
-21784: DATA: 13108
-21785: DATA: 23889
-21786: DATA: 1941
-21787: DATA: 12769
-21788: DATA: 23073
-21789: DATA: 1133
-21790: DATA: 11967
-21791: DATA: 22759
-21792: DATA: 1312
-21793: DATA: 12144
-21794: DATA: 22946
-21795: DATA: 945
-21796: DATA: 11364
-21797: DATA: 22124
-21798: DATA: 158
-21799: DATA: 10945
-21800: DATA: 22302
-21801: DATA: 423
-21802: DATA: 11209
-21803: DATA: 21533
-21804: DATA: 32421
-21805: DATA: 10446
-21806: DATA: 21859
-21807: DATA: 32725
-21808: DATA: 10272
-21809: DATA: 21085
-21810: DATA: 31989
-21811: DATA: 10589
-21812: DATA: 21415
-21813: DATA: 32194
-21814: DATA: 9822
-21815: DATA: 20707
-21816: DATA: 32125
-21817: DATA: 10135
-21818: DATA: 20509
-21819: DATA: 31404
-21820: DATA: 10032
-21821: DATA: 20916
-21822: DATA: 31295
-21823: DATA: 9403
-21824: DATA: 20852
-21825: DATA: 31672
-21826: DATA: 9269
-21827: DATA: 20158
-21828: DATA: 31532
-21829: DATA: 9644
-21830: DATA: 19998
-21831: DATA: 30860
-21832: DATA: 9575
-21833: DATA: 20456
-21834: DATA: 30750
-21835: DATA: 8845
-21836: DATA: 20452
-21837: DATA: 30772
-21838: DATA: 8950
-21839: DATA: 20245
-21840: DATA: 30752
-21841: DATA: 8861
-21842: DATA: 20341
-21843: DATA: 31133
-21844: DATA: 8865
-21845: DATA: 20228
-21846: DATA: 31191
-21847: DATA: 8877
-21848: DATA: 20320
-21849: DATA: 31181
-21850: DATA: 8912
-21851: DATA: 20351
-21852: DATA: 30753
-21853: DATA: 8954
-21854: DATA: 20409
-21855: DATA: 30822
-21856: DATA: 9504
-21857: DATA: 20464
-21858: DATA: 30882
-21859: DATA: 9533
-21860: DATA: 20013
-21861: DATA: 30974
-21862: DATA: 9680
-21863: DATA: 20054
-21864: DATA: 31601
-21865: DATA: 9265
-21866: DATA: 20112
-21867: DATA: 31630
-21868: DATA: 9387
-21869: DATA: 20815
-21870: DATA: 31330
-21871: DATA: 10000
-21872: DATA: 20535
-21873: DATA: 31425
-21874: DATA: 10236
-21875: DATA: 20612
-21876: DATA: 32232
-21877: DATA: 9741
-21878: DATA: 21342
-21879: DATA: 31850
-21880: DATA: 10526
-21881: DATA: 20996
-21882: DATA: 32542
-21883: DATA: 10274
-21884: DATA: 21801
-21885: DATA: 32316
-21886: DATA: 11068
-21887: DATA: 21564
-21888: DATA: 305
-21889: DATA: 10790
-21890: DATA: 22384
-21891: DATA: 46
-21892: DATA: 11564
-21893: DATA: 22050
-21894: DATA: 773
-21895: DATA: 11273
-21896: DATA: 22896
-21897: DATA: 549
-21898: DATA: 12114
-21899: DATA: 22600
-21900: DATA: 1508
-21901: DATA: 11928
-21902: DATA: 23528
-21903: DATA: 1221
-21904: DATA: 12337
-21905: DATA: 23815
-21906: DATA: 1657
-21907: DATA: 13144
-21908: DATA: 23722
-21909: DATA: 2446
-21910: DATA: 13013
-21911: DATA: 24097
-21912: DATA: 2872
-21913: DATA: 13317
-21914: DATA: 24978
-21915: DATA: 2808
-21916: DATA: 13872
-21917: DATA: 25405
-21918: DATA: 3250
-21919: DATA: 14832
-21920: DATA: 25891
-21921: DATA: 3700
-21922: DATA: 15266
-21923: DATA: 25848
-21924: DATA: 4196
-21925: DATA: 15648
-21926: DATA: 26320
-21927: DATA: 5068
-21928: DATA: 16242
-21929: DATA: 26853
-21930: DATA: 5593
-21931: DATA: 16665
-21932: DATA: 27364
-21933: DATA: 6100
-21934: DATA: 17251
-21935: DATA: 27861
-21936: DATA: 6183
-21937: DATA: 17744
-21938: DATA: 28388
-21939: DATA: 6749
-21940: DATA: 18349
-21941: DATA: 28867
-21942: DATA: 7251
-21943: DATA: 18922
-21944: DATA: 30054
-21945: DATA: 7831
-21946: DATA: 18965
-21947: DATA: 30638
-21948: DATA: 9008
-21949: DATA: 19633
-21950: DATA: 30761
-21951: DATA: 9721
-21952: DATA: 20852
-21953: DATA: 31393
-21954: DATA: 9784
-21955: DATA: 21432
-21956: DATA: 32590
-21957: DATA: 10403
-21958: DATA: 21535
-21959: DATA: 402
-21960: DATA: 11577
-21961: DATA: 22247
-21962: DATA: 585
-21963: DATA: 12253
-21964: DATA: 23461
-21965: DATA: 1806
-21966: DATA: 12515
-21967: DATA: 23632
-21968: DATA: 2096
-21969: DATA: 13781
-21970: DATA: 24947
-21971: DATA: 2770
-21972: DATA: 13994
-21973: DATA: 25099
-21974: DATA: 4057
-21975: DATA: 15287
-21976: DATA: 26489
-21977: DATA: 4292
-21978: DATA: 15492
-21979: DATA: 26724
-21980: DATA: 5163
-21981: DATA: 16883
-21982: DATA: 28144
-21983: DATA: 6520
-21984: DATA: 17713
-21985: DATA: 28406
-21986: DATA: 6840
-21987: DATA: 18044
-21988: DATA: 29226
-21989: DATA: 8164
-21990: DATA: 19331
-21991: DATA: 30536
-21992: DATA: 9012
-21993: DATA: 20274
-21994: DATA: 30937
-21995: DATA: 9345
-21996: DATA: 20648
-21997: DATA: 31773
-21998: DATA: 10366
-21999: DATA: 21530
-22000: DATA: 32
-22001: DATA: 11669
-22002: DATA: 23008
-22003: DATA: 1423
-22004: DATA: 12715
-22005: DATA: 23897
-22006: DATA: 2389
-22007: DATA: 13670
-22008: DATA: 24928
-22009: DATA: 3397
-22010: DATA: 14601
-22011: DATA: 25890
-22012: DATA: 4401
-22013: DATA: 15740
-22014: DATA: 26970
-22015: DATA: 5471
-22016: DATA: 16667
-22017: DATA: 27955
-22018: DATA: 6512
-22019: DATA: 17726
-22020: DATA: 28971
-22021: DATA: 7480
-22022: DATA: 18690
-22023: DATA: 29974
-22024: DATA: 8561
-22025: DATA: 19753
-22026: DATA: 30992
-22027: DATA: 9566
-22028: DATA: 20909
-22029: DATA: 32147
-22030: DATA: 10739
-22031: DATA: 21968
-22032: DATA: 116
-22033: DATA: 11265
-22034: DATA: 22645
-22035: DATA: 1105
-22036: DATA: 12449
-22037: DATA: 23709
-22038: DATA: 2271
-22039: DATA: 14135
-22040: DATA: 25440
-22041: DATA: 3908
-22042: DATA: 15236
-22043: DATA: 26596
-22044: DATA: 4651
-22045: DATA: 15987
-22046: DATA: 27376
-22047: DATA: 5884
-22048: DATA: 17703
-22049: DATA: 28981
-22050: DATA: 7609
-22051: DATA: 18928
-22052: DATA: 29748
-22053: DATA: 8290
-22054: DATA: 19587
-22055: DATA: 30934
-22056: DATA: 10109
-22057: DATA: 21415
-22058: DATA: 32732
-22059: DATA: 10760
-22060: DATA: 22248
-22061: DATA: 669
-22062: DATA: 12644
-22063: DATA: 23965
-22064: DATA: 2109
-22065: DATA: 13382
-22066: DATA: 24752
-22067: DATA: 3860
-22068: DATA: 15287
-22069: DATA: 26509
-22070: DATA: 4689
-22071: DATA: 16105
-22072: DATA: 28024
-22073: DATA: 6597
-22074: DATA: 17412
-22075: DATA: 28834
-22076: DATA: 7984
-22077: DATA: 19388
-22078: DATA: 30268
-22079: DATA: 8889
-22080: DATA: 20781
-22081: DATA: 32245
-22082: DATA: 10274
-22083: DATA: 21684
-22084: DATA: 800
-22085: DATA: 12196
-22086: DATA: 23059
-22087: DATA: 1680
-22088: DATA: 13688
-22089: DATA: 25066
-22090: DATA: 3141
-22091: DATA: 14558
-22092: DATA: 26602
-22093: DATA: 4730
-22094: DATA: 16122
-22095: DATA: 27994
-22096: DATA: 6177
-22097: DATA: 17543
-22098: DATA: 29566
-22099: DATA: 8156
-22100: DATA: 19112
-22101: DATA: 30681
-22102: DATA: 9718
-22103: DATA: 20652
-22104: DATA: 32614
-22105: DATA: 11200
-22106: DATA: 22166
-22107: DATA: 1377
-22108: DATA: 12333
-22109: DATA: 23800
-22110: DATA: 2979
-22111: DATA: 13877
-22112: DATA: 25891
-22113: DATA: 4592
-22114: DATA: 15522
-22115: DATA: 27512
-22116: DATA: 5732
-22117: DATA: 17144
-22118: DATA: 29059
-22119: DATA: 7244
-22120: DATA: 19322
-22121: DATA: 30242
-22122: DATA: 8848
-22123: DATA: 20889
-22124: DATA: 31916
-22125: DATA: 11092
-22126: DATA: 22115
-22127: DATA: 1365
-22128: DATA: 12336
-22129: DATA: 23744
-22130: DATA: 3043
-22131: DATA: 13961
-22132: DATA: 26045
-22133: DATA: 4109
-22134: DATA: 16223
-22135: DATA: 27241
-22136: DATA: 6512
-22137: DATA: 17477
-22138: DATA: 29466
-22139: DATA: 7714
-22140: DATA: 19761
-22141: DATA: 30767
-22142: DATA: 10046
-22143: DATA: 21044
-22144: DATA: 312
-22145: DATA: 11381
-22146: DATA: 23345
-22147: DATA: 1582
-22148: DATA: 13668
-22149: DATA: 24620
-22150: DATA: 3920
-22151: DATA: 14871
-22152: DATA: 26993
-22153: DATA: 5238
-22154: DATA: 17220
-22155: DATA: 28228
-22156: DATA: 7594
-22157: DATA: 18586
-22158: DATA: 30640
-22159: DATA: 8902
-22160: DATA: 20516
-22161: DATA: 32538
-22162: DATA: 10852
-22163: DATA: 22813
-22164: DATA: 1201
-22165: DATA: 13187
-22166: DATA: 24260
-22167: DATA: 3116
-22168: DATA: 15224
-22169: DATA: 26117
-22170: DATA: 5513
-22171: DATA: 16610
-22172: DATA: 28209
-22173: DATA: 7485
-22174: DATA: 18595
-22175: DATA: 30710
-22176: DATA: 9525
-22177: DATA: 20583
-22178: DATA: 32693
-22179: DATA: 11001
-22180: DATA: 22628
-22181: DATA: 1913
-22182: DATA: 12952
-22183: DATA: 25024
-22184: DATA: 3961
-22185: DATA: 15077
-22186: DATA: 27103
-22187: DATA: 5899
-22188: DATA: 17058
-22189: DATA: 29075
-22190: DATA: 7984
-22191: DATA: 19157
-22192: DATA: 30749
-22193: DATA: 10049
-22194: DATA: 21168
-22195: RMEM 12193 23244
-22198: DATA: 2132
-22199: DATA: 14326
-22200: DATA: 25902
-22201: DATA: 4335
-22202: DATA: 15994
-22203: DATA: 28041
-22204: DATA: 6949
-22205: DATA: 18084
-22206: DATA: 29808
-22207: DATA: 9188
-22208: DATA: 20846
-22209: DATA: 31989
-22210: DATA: 10759
-22211: DATA: 22968
-22212: DATA: 1892
-22213: DATA: 12965
-22214: DATA: 24593
-22215: DATA: 3987
-22216: DATA: 15729
-22217: DATA: 26789
-22218: DATA: 5698
-22219: DATA: 17864
-22220: DATA: 29605
-22221: DATA: 8478
-22222: DATA: 19704
-22223: DATA: 31312
-22224: DATA: 10288
-22225: DATA: 22485
-22226: DATA: 1383
-22227: DATA: 12501
-22228: DATA: 24229
-22229: DATA: 3097
-22230: DATA: 15248
-22231: DATA: 27062
-22232: DATA: 6001
-22233: DATA: 17088
-22234: DATA: 28829
-22235: DATA: 7806
-22236: DATA: 19556
-22237: DATA: 31721
-22238: DATA: 10687
-22239: DATA: 22325
-22240: DATA: 1334
-22241: DATA: 12528
-22242: DATA: 24304
-22243: DATA: 3177
-22244: DATA: 14892
-22245: DATA: 27112
-22246: DATA: 6096
-22247: DATA: 17731
-22248: DATA: 29565
-22249: DATA: 8491
-22250: DATA: 19665
-22251: DATA: 31361
-22252: DATA: 10468
-22253: DATA: 22100
-22254: DATA: 1150
-22255: DATA: 12885
-22256: DATA: 24629
-22257: DATA: 3989
-22258: DATA: 15843
-22259: DATA: 27544
-22260: DATA: 6582
-22261: DATA: 18244
-22262: DATA: 30037
-22263: DATA: 9078
-22264: DATA: 20788
-22265: DATA: 32522
-22266: DATA: 11542
-22267: DATA: 23405
-22268: DATA: 2356
-22269: DATA: 14120
-22270: DATA: 25898
-22271: DATA: 4911
-22272: DATA: 16696
-22273: DATA: 28464
-22274: DATA: 7459
-22275: DATA: 19325
-22276: DATA: 31011
-22277: DATA: 10040
-22278: DATA: 21777
-22279: DATA: 791
-22280: DATA: 12656
-22281: DATA: 24428
-22282: DATA: 3422
-22283: DATA: 15178
-22284: DATA: 27108
-22285: DATA: 6044
-22286: DATA: 17918
-22287: DATA: 29589
-22288: DATA: 8245
-22289: DATA: 19995
-22290: DATA: 31859
-22291: DATA: 10836
-22292: DATA: 22689
-22293: DATA: 1667
-22294: DATA: 13508
-22295: DATA: 25957
-22296: DATA: 4960
-22297: DATA: 16727
-22298: DATA: 28565
-22299: DATA: 7660
-22300: DATA: 18999
-22301: DATA: 30824
-22302: DATA: 9890
-22303: DATA: 21744
-22304: DATA: 1402
-22305: DATA: 13109
-22306: DATA: 25072
-22307: DATA: 4052
-22308: DATA: 15460
-22309: DATA: 27262
-22310: DATA: 6277
-22311: DATA: 18134
-22312: DATA: 30564
-22313: DATA: 9632
-22314: DATA: 21459
-22315: DATA: 25
-22316: DATA: 12004
-22317: DATA: 23760
-22318: DATA: 3455
-22319: DATA: 15238
-22320: DATA: 26656
-22321: DATA: 5653
-22322: DATA: 17649
-22323: DATA: 29977
-22324: DATA: 9138
-22325: DATA: 20936
-22326: DATA: 32350
-22327: DATA: 11505
-22328: DATA: 23905
-22329: DATA: 2967
-22330: DATA: 14357
-22331: DATA: 26303
-22332: DATA: 5943
-22333: DATA: 17917
-22334: DATA: 29239
-22335: DATA: 8380
-22336: DATA: 20770
-22337: DATA: 32688
-22338: DATA: 11376
-22339: DATA: 23208
-22340: DATA: 2868
-22341: DATA: 14829
-22342: DATA: 26140
-22343: DATA: 5258
-22344: DATA: 17786
-22345: DATA: 29666
-22346: DATA: 8208
-22347: DATA: 20175
-22348: DATA: 32673
-22349: DATA: 11291
-22350: DATA: 23295
-22351: DATA: 2887
-22352: DATA: 14385
-22353: DATA: 26325
-22354: DATA: 5988
-22355: DATA: 17877
-22356: DATA: 29357
-22357: DATA: 8990
-22358: DATA: 20880
-22359: DATA: 32437
-22360: DATA: 12155
-22361: DATA: 24012
-22362: DATA: 2718
-22363: DATA: 15225
-22364: DATA: 26728
-22365: DATA: 5821
-22366: DATA: 18354
-22367: DATA: 29792
-22368: DATA: 9504
-22369: DATA: 21429
-22370: DATA: 167
-22371: DATA: 12664
-22372: DATA: 24163
-22373: DATA: 3327
-22374: DATA: 15765
-22375: DATA: 27141
-22376: DATA: 7015
-22377: DATA: 18474
-22378: DATA: 30352
-22379: DATA: 10126
-22380: DATA: 21672
-22381: DATA: 1362
-22382: DATA: 12899
-22383: DATA: 25360
-22384: DATA: 4213
-22385: DATA: 16021
-22386: DATA: 28592
-22387: DATA: 7338
-22388: DATA: 19873
-22389: DATA: 31245
-22390: DATA: 11101
-22391: DATA: 22640
-22392: DATA: 2407
-22393: DATA: 13841
-22394: DATA: 26448
-22395: DATA: 5181
-22396: DATA: 17718
-22397: DATA: 29240
-22398: DATA: 8995
-22399: DATA: 20518
-22400: DATA: 372
-22401: DATA: 11834
-22402: DATA: 24382
-22403: DATA: 3196
-22404: DATA: 15694
-22405: DATA: 27207
-22406: DATA: 6964
-22407: DATA: 18436
-22408: DATA: 31085
-22409: DATA: 9765
-22410: DATA: 22273
-22411: DATA: 1047
-22412: DATA: 13796
-22413: DATA: 25261
-22414: DATA: 5054
-22415: DATA: 16614
-22416: DATA: 28794
-22417: DATA: 8527
-22418: DATA: 20016
-22419: DATA: 32628
-22420: DATA: 11440
-22421: DATA: 24010
-22422: DATA: 2755
-22423: DATA: 14949
-22424: DATA: 27509
-22425: DATA: 6149
-22426: DATA: 18839
-22427: DATA: 30434
-22428: DATA: 9771
-22429: DATA: 22393
-22430: DATA: 1264
-22431: DATA: 13793
-22432: DATA: 25916
-22433: DATA: 4732
-22434: DATA: 17342
-22435: DATA: 28922
-22436: DATA: 8292
-22437: DATA: 20857
-22438: DATA: 32408
-22439: DATA: 12224
-22440: DATA: 24372
-22441: DATA: 3244
-22442: DATA: 15811
-22443: DATA: 27905
-22444: DATA: 6821
-22445: DATA: 19411
-22446: DATA: 31604
-22447: DATA: 10453
-22448: DATA: 22589
-22449: DATA: 2374
-22450: DATA: 14000
-22451: DATA: 26121
-22452: DATA: 6070
-22453: DATA: 17602
-22454: DATA: 29760
-22455: DATA: 9708
-22456: DATA: 21879
-22457: DATA: 644
-22458: DATA: 12828
-22459: DATA: 25571
-22460: DATA: 4964
-22461: DATA: 16637
-22462: DATA: 28679
-22463: DATA: 8624
-22464: DATA: 20852
-22465: DATA: 32422
-22466: DATA: 11832
-22467: DATA: 24498
-22468: DATA: 3889
-22469: DATA: 15521
-22470: DATA: 27668
-22471: DATA: 7621
-22472: DATA: 19836
-22473: DATA: 31460
-22474: DATA: 10822
-22475: DATA: 23496
-22476: DATA: 3044
-22477: DATA: 15131
-22478: DATA: 26879
-22479: DATA: 6234
-22480: DATA: 18480
-22481: DATA: 31189
-22482: DATA: 10614
-22483: DATA: 22226
-22484: DATA: 1718
-22485: DATA: 13901
-22486: DATA: 26567
-22487: DATA: 6048
-22488: DATA: 18289
-22489: DATA: 29902
-22490: DATA: 9347
-22491: DATA: 21548
-22492: DATA: 1102
-22493: DATA: 13719
-22494: DATA: 26004
-22495: DATA: 5492
-22496: DATA: 17709
-22497: DATA: 29365
-22498: DATA: 8930
-22499: DATA: 21031
-22500: DATA: 612
-22501: DATA: 13273
-22502: DATA: 25496
-22503: DATA: 4928
-22504: DATA: 17204
-22505: DATA: 29491
-22506: DATA: 8401
-22507: DATA: 20632
-22508: DATA: 168
-22509: DATA: 12361
-22510: DATA: 24624
-22511: DATA: 4116
-22512: DATA: 16420
-22513: DATA: 29125
-22514: DATA: 8693
-22515: DATA: 20892
-22516: DATA: 438
-22517: DATA: 12638
-22518: DATA: 24848
-22519: DATA: 4465
-22520: DATA: 16763
-22521: DATA: 28997
-22522: DATA: 8466
-22523: DATA: 20776
-22524: DATA: 356
-22525: DATA: 12590
-22526: DATA: 24885
-22527: DATA: 4404
-22528: DATA: 16696
-22529: DATA: 28976
-22530: DATA: 8500
-22531: DATA: 20861
-22532: DATA: 294
-22533: DATA: 12596
-22534: DATA: 24912
-22535: DATA: 4356
-22536: DATA: 16692
-22537: DATA: 29032
-22538: DATA: 8521
-22539: DATA: 20830
-22540: DATA: 432
-22541: DATA: 12696
-22542: DATA: 25058
-22543: DATA: 4572
-22544: DATA: 16443
-22545: DATA: 28672
-22546: DATA: 8291
-22547: DATA: 20509
-22548: DATA: 162
-22549: DATA: 12418
-22550: DATA: 24770
-22551: DATA: 4902
-22552: DATA: 17265
-22553: DATA: 29445
-22554: DATA: 9181
-22555: DATA: 21421
-22556: DATA: 560
-22557: DATA: 12917
-22558: DATA: 25269
-22559: DATA: 4789
-22560: DATA: 17712
-22561: DATA: 30074
-22562: DATA: 9663
-22563: DATA: 21999
-22564: DATA: 1124
-22565: DATA: 13434
-22566: DATA: 25759
-22567: DATA: 5323
-22568: DATA: 18227
-22569: DATA: 30641
-22570: DATA: 10128
-22571: DATA: 22031
-22572: DATA: 1713
-22573: DATA: 14041
-22574: DATA: 26999
-22575: DATA: 6544
-22576: DATA: 18548
-22577: DATA: 30804
-22578: DATA: 10494
-22579: DATA: 23389
-22580: DATA: 2989
-22581: DATA: 15299
-22582: DATA: 27219
-22583: DATA: 6893
-22584: DATA: 19770
-22585: DATA: 32197
-22586: DATA: 11344
-22587: DATA: 23706
-22588: DATA: 3873
-22589: DATA: 16381
-22590: DATA: 28212
-22591: DATA: 7866
-22592: DATA: 20794
-22593: DATA: 498
-22594: DATA: 12324
-22595: DATA: 24829
-22596: DATA: 4908
-22597: DATA: 17324
-22598: DATA: 29190
-22599: DATA: 8832
-22600: DATA: 21812
-22601: DATA: 1521
-22602: DATA: 13400
-22603: DATA: 25800
-22604: DATA: 6116
-22605: DATA: 17935
-22606: DATA: 30453
-22607: DATA: 10566
-22608: DATA: 22587
-22609: DATA: 2176
-22610: DATA: 15202
-22611: DATA: 27614
-22612: DATA: 6817
-22613: DATA: 19742
-22614: DATA: 32144
-22615: DATA: 11441
-22616: DATA: 24443
-22617: DATA: 3973
-22618: DATA: 16018
-22619: DATA: 29025
-22620: DATA: 8235
-22621: DATA: 20714
-22622: DATA: 1008
-22623: DATA: 12924
-22624: DATA: 25888
-22625: DATA: 5557
-22626: DATA: 17599
-22627: DATA: 30573
-22628: DATA: 9761
-22629: DATA: 22243
-22630: DATA: 2524
-22631: DATA: 14341
-22632: DATA: 27509
-22633: DATA: 6699
-22634: DATA: 19156
-22635: DATA: 32205
-22636: DATA: 11405
-22637: DATA: 24349
-22638: DATA: 3687
-22639: DATA: 16666
-22640: DATA: 28705
-22641: DATA: 8409
-22642: DATA: 21492
-22643: DATA: 659
-22644: DATA: 13795
-22645: DATA: 25689
-22646: DATA: 5904
-22647: DATA: 18039
-22648: DATA: 31101
-22649: DATA: 10262
-22650: DATA: 23323
-22651: DATA: 2669
-22652: DATA: 15648
-22653: DATA: 27708
-22654: DATA: 7997
-22655: DATA: 20020
-22656: DATA: 307
-22657: DATA: 12348
-22658: DATA: 25406
-22659: DATA: 4666
-22660: DATA: 17764
-22661: DATA: 29753
-22662: DATA: 10008
-22663: DATA: 22016
-22664: DATA: 2356
-22665: DATA: 14438
-22666: DATA: 27487
-22667: DATA: 6723
-22668: DATA: 19888
-22669: DATA: 31896
-22670: DATA: 12286
-22671: DATA: 24257
-22672: DATA: 4135
-22673: DATA: 17237
-22674: DATA: 29301
-22675: DATA: 9547
-22676: DATA: 21665
-22677: DATA: 1923
-22678: DATA: 13968
-22679: DATA: 26668
-22680: DATA: 7026
-22681: DATA: 18949
-22682: DATA: 32135
-22683: DATA: 11496
-22684: DATA: 24164
-22685: DATA: 4473
-22686: DATA: 16569
-22687: DATA: 29681
-22688: DATA: 9594
-22689: DATA: 21557
-22690: DATA: 2032
-22691: DATA: 14026
-22692: DATA: 26657
-22693: DATA: 6954
-22694: DATA: 19100
-22695: DATA: 32201
-22696: DATA: 12084
-22697: DATA: 24237
-22698: DATA: 4561
-22699: DATA: 17179
-22700: DATA: 29345
-22701: DATA: 9629
-22702: DATA: 22372
-22703: DATA: 1690
-22704: DATA: 14452
-22705: DATA: 27475
-22706: DATA: 6905
-22707: DATA: 19482
-22708: DATA: 32689
-22709: DATA: 11999
-22710: DATA: 24661
-22711: DATA: 5029
-22712: DATA: 17787
-22713: DATA: 29840
-22714: DATA: 9732
-22715: DATA: 23021
-22716: DATA: 2864
-22717: DATA: 15029
-22718: DATA: 27701
-22719: DATA: 8181
-22720: DATA: 20792
-22721: DATA: 186
-22722: DATA: 12851
-22723: DATA: 26038
-22724: DATA: 5988
-22725: DATA: 18080
-22726: DATA: 30741
-22727: DATA: 11142
-22728: DATA: 23932
-22729: DATA: 3300
-22730: DATA: 15966
-22731: DATA: 29124
-22732: DATA: 9143
-22733: DATA: 21776
-22734: DATA: 1214
-22735: DATA: 13887
-22736: DATA: 26718
-22737: DATA: 7089
-22738: DATA: 19825
-22739: DATA: 31940
-22740: DATA: 12004
-22741: DATA: 24670
-22742: DATA: 5002
-22743: DATA: 17893
-22744: DATA: 30528
-22745: DATA: 9933
-22746: DATA: 22677
-22747: DATA: 2605
-22748: DATA: 15392
-22749: DATA: 28658
-22750: DATA: 8639
-22751: DATA: 21351
-22752: DATA: 1396
-22753: DATA: 13537
-22754: DATA: 26303
-22755: DATA: 6205
-22756: DATA: 18992
-22757: DATA: 32229
-22758: DATA: 12181
-22759: DATA: 24837
-22760: DATA: 4962
-22761: DATA: 17700
-22762: DATA: 29893
-22763: DATA: 9857
-22764: DATA: 22704
-22765: DATA: 2589
-22766: DATA: 15480
-22767: DATA: 28180
-22768: DATA: 8231
-22769: DATA: 21397
-22770: DATA: 1521
-22771: DATA: 14301
-22772: DATA: 27050
-22773: DATA: 7000
-22774: DATA: 19805
-22775: DATA: 32615
-22776: DATA: 12657
-22777: DATA: 25367
-22778: DATA: 5456
-22779: DATA: 18222
-22780: DATA: 31013
-22781: DATA: 11055
-22782: DATA: 23846
-22783: DATA: 3888
-22784: DATA: 16688
-22785: DATA: 29557
-22786: DATA: 9529
-22787: DATA: 22323
-22788: DATA: 2352
-22789: DATA: 15138
-22790: DATA: 27984
-22791: DATA: 7948
-22792: DATA: 20832
-22793: DATA: 811
-22794: DATA: 13584
-22795: DATA: 26381
-22796: DATA: 6529
-22797: DATA: 19356
-22798: DATA: 32243
-22799: DATA: 12253
-22800: DATA: 24692
-22801: DATA: 4615
-22802: DATA: 17535
-22803: DATA: 30290
-22804: DATA: 10409
-22805: DATA: 23245
-22806: DATA: 3292
-22807: DATA: 16672
-22808: DATA: 29557
-22809: DATA: 9537
-22810: DATA: 22425
-22811: DATA: 2531
-22812: DATA: 14883
-22813: DATA: 27709
-22814: DATA: 7845
-22815: DATA: 20709
-22816: DATA: 1396
-22817: DATA: 14177
-22818: DATA: 27071
-22819: DATA: 7101
-22820: DATA: 19504
-22821: DATA: 32357
-22822: DATA: 12437
-22823: DATA: 25221
-22824: DATA: 5986
-22825: DATA: 18852
-22826: DATA: 31685
-22827: DATA: 11265
-22828: DATA: 24240
-22829: DATA: 4253
-22830: DATA: 17784
-22831: DATA: 30612
-22832: DATA: 10279
-22833: DATA: 23061
-22834: DATA: 3325
-22835: DATA: 16658
-22836: DATA: 29622
-22837: DATA: 9672
-22838: DATA: 22032
-22839: DATA: 2283
-22840: DATA: 15713
-22841: DATA: 28552
-22842: DATA: 8210
-22843: DATA: 21160
-22844: DATA: 1846
-22845: DATA: 14766
-22846: DATA: 27248
-22847: DATA: 7354
-22848: DATA: 20774
-22849: DATA: 1013
-22850: DATA: 13347
-22851: DATA: 26276
-22852: DATA: 6953
-22853: DATA: 19887
-22854: DATA: 32287
-22855: DATA: 12425
-22856: DATA: 25959
-22857: DATA: 6053
-22858: DATA: 18517
-22859: DATA: 31424
-22860: DATA: 12198
-22861: DATA: 24600
-22862: DATA: 4852
-22863: DATA: 18257
-22864: DATA: 30769
-22865: DATA: 10897
-22866: DATA: 24368
-22867: DATA: 4564
-22868: DATA: 17066
-22869: DATA: 30541
-22870: DATA: 10717
-22871: DATA: 23210
-22872: DATA: 3943
-22873: DATA: 16836
-22874: DATA: 29337
-22875: DATA: 10094
-22876: DATA: 22583
-22877: DATA: 2749
-22878: DATA: 16313
-22879: DATA: 28795
-22880: DATA: 9588
-22881: DATA: 22497
-22882: DATA: 2232
-22883: DATA: 15736
-22884: DATA: 28260
-22885: DATA: 8427
-22886: DATA: 21916
-22887: DATA: 1610
-22888: DATA: 15227
-22889: DATA: 27703
-22890: DATA: 7875
-22891: DATA: 21443
-22892: DATA: 1252
-22893: DATA: 14621
-22894: DATA: 27207
-22895: DATA: 7952
-22896: DATA: 20596
-22897: DATA: 720
-22898: DATA: 14310
-22899: DATA: 26776
-22900: DATA: 7594
-22901: DATA: 19981
-22902: DATA: 854
-22903: DATA: 13418
-22904: DATA: 26977
-22905: DATA: 6667
-22906: DATA: 20244
-22907: DATA: 109
-22908: DATA: 13605
-22909: DATA: 26237
-22910: DATA: 6947
-22911: DATA: 19489
-22912: DATA: 294
-22913: DATA: 12852
-22914: DATA: 26430
-22915: DATA: 6202
-22916: DATA: 19745
-22917: DATA: 32365
-22918: DATA: 13079
-22919: DATA: 25609
-22920: DATA: 6517
-22921: DATA: 19062
-22922: DATA: 32579
-22923: DATA: 12301
-22924: DATA: 26027
-22925: DATA: 5775
-22926: DATA: 19442
-22927: DATA: 31893
-22928: DATA: 12349
-22929: DATA: 25883
-22930: DATA: 5680
-22931: DATA: 19273
-22932: DATA: 31916
-22933: DATA: 12680
-22934: DATA: 25232
-22935: DATA: 5668
-22936: DATA: 19322
-22937: DATA: 31825
-22938: DATA: 12693
-22939: DATA: 25326
-22940: DATA: 5676
-22941: DATA: 19324
-22942: DATA: 31933
-22943: DATA: 12791
-22944: DATA: 25905
-22945: DATA: 5735
-22946: DATA: 19440
-22947: DATA: 31986
-22948: DATA: 12330
-22949: DATA: 25901
-22950: DATA: 5777
-22951: DATA: 19333
-22952: DATA: 32612
-22953: DATA: 12448
-22954: DATA: 26068
-22955: DATA: 6408
-22956: DATA: 19127
-22957: DATA: 32713
-22958: DATA: 13169
-22959: DATA: 25753
-22960: DATA: 6260
-22961: DATA: 19804
-22962: DATA: 32484
-22963: DATA: 12814
-22964: DATA: 26529
-22965: DATA: 6337
-22966: DATA: 19542
-22967: DATA: 421
-22968: DATA: 13688
-22969: DATA: 26244
-22970: DATA: 6674
-22971: DATA: 20392
-22972: DATA: 808
-22973: DATA: 13496
-22974: DATA: 26676
-22975: DATA: 7669
-22976: DATA: 20771
-22977: DATA: 700
-22978: DATA: 13860
-22979: DATA: 27573
-22980: DATA: 8036
-22981: DATA: 20652
-22982: DATA: 1104
-22983: DATA: 14731
-22984: DATA: 28001
-22985: DATA: 7912
-22986: DATA: 21074
-22987: DATA: 1992
-22988: DATA: 15286
-22989: DATA: 28499
-22990: DATA: 8368
-22991: DATA: 21525
-22992: DATA: 2051
-22993: DATA: 15773
-22994: DATA: 29041
-22995: DATA: 8905
-22996: DATA: 22244
-22997: DATA: 2574
-22998: DATA: 16351
-22999: DATA: 29616
-23000: DATA: 10104
-23001: DATA: 22721
-23002: DATA: 3280
-23003: DATA: 16505
-23004: DATA: 29740
-23005: DATA: 10744
-23006: DATA: 23977
-23007: DATA: 4405
-23008: DATA: 17721
-23009: DATA: 30448
-23010: DATA: 10929
-23011: DATA: 24179
-23012: DATA: 4731
-23013: DATA: 18311
-23014: DATA: 31738
-23015: DATA: 12129
-23016: DATA: 25461
-23017: DATA: 5948
-23018: DATA: 18576
-23019: DATA: 31960
-23020: DATA: 12542
-23021: DATA: 25629
-23022: DATA: 6215
-23023: DATA: 19472
-23024: DATA: 116
-23025: DATA: 13779
-23026: DATA: 27129
-23027: DATA: 7571
-23028: DATA: 20901
-23029: DATA: 1345
-23030: DATA: 14684
-23031: DATA: 28028
-23032: DATA: 8500
-23033: DATA: 21767
-23034: DATA: 2309
-23035: DATA: 15652
-23036: DATA: 28968
-23037: DATA: 9513
-23038: DATA: 22896
-23039: DATA: 3360
-23040: DATA: 16676
-23041: DATA: 30069
-23042: DATA: 10532
-23043: DATA: 23861
-23044: DATA: 4385
-23045: DATA: 17773
-23046: DATA: 30995
-23047: DATA: 11530
-23048: DATA: 24929
-23049: DATA: 5495
-23050: DATA: 18769
-23051: DATA: 32074
-23052: DATA: 12705
-23053: DATA: 26077
-23054: DATA: 6628
-23055: DATA: 19930
-23056: DATA: 116
-23057: DATA: 13313
-23058: DATA: 26751
-23059: DATA: 7240
-23060: DATA: 20647
-23061: DATA: 1157
-23062: DATA: 14480
-23063: DATA: 28465
-23064: DATA: 9084
-23065: DATA: 22336
-23066: DATA: 3024
-23067: DATA: 16382
-23068: DATA: 29232
-23069: DATA: 9839
-23070: DATA: 23217
-23071: DATA: 3835
-23072: DATA: 17715
-23073: DATA: 31088
-23074: DATA: 11760
-23075: DATA: 25074
-23076: DATA: 5174
-23077: DATA: 18543
-23078: DATA: 31952
-23079: DATA: 12492
-23080: DATA: 26490
-23081: DATA: 7141
-23082: DATA: 20420
-23083: DATA: 517
-23084: DATA: 13985
-23085: DATA: 27293
-23086: DATA: 8561
-23087: DATA: 21915
-23088: DATA: 2080
-23089: DATA: 15440
-23090: DATA: 28915
-23091: DATA: 10005
-23092: DATA: 23461
-23093: DATA: 4032
-23094: DATA: 16978
-23095: DATA: 30432
-23096: DATA: 11622
-23097: DATA: 25035
-23098: DATA: 5200
-23099: DATA: 18669
-23100: DATA: 32525
-23101: DATA: 13225
-23102: DATA: 26224
-23103: DATA: 6835
-23104: DATA: 20792
-23105: DATA: 1460
-23106: DATA: 14371
-23107: DATA: 27829
-23108: DATA: 8993
-23109: DATA: 22462
-23110: DATA: 2640
-23111: DATA: 16006
-23112: DATA: 30075
-23113: DATA: 10729
-23114: DATA: 23647
-23115: DATA: 4319
-23116: DATA: 18359
-23117: DATA: 31325
-23118: DATA: 12017
-23119: DATA: 25926
-23120: DATA: 6260
-23121: DATA: 19586
-23122: DATA: 885
-23123: DATA: 14237
-23124: DATA: 27303
-23125: DATA: 8460
-23126: DATA: 21954
-23127: DATA: 2231
-23128: DATA: 16237
-23129: DATA: 29573
-23130: DATA: 9881
-23131: DATA: 23929
-23132: DATA: 4196
-23133: DATA: 17659
-23134: DATA: 31650
-23135: DATA: 11898
-23136: DATA: 25913
-23137: DATA: 6581
-23138: DATA: 19618
-23139: DATA: 882
-23140: DATA: 13867
-23141: DATA: 27360
-23142: DATA: 8656
-23143: DATA: 21585
-23144: DATA: 2939
-23145: DATA: 15973
-23146: DATA: 29378
-23147: DATA: 10626
-23148: DATA: 23723
-23149: DATA: 4944
-23150: DATA: 17980
-23151: DATA: 32085
-23152: DATA: 12341
-23153: DATA: 25819
-23154: DATA: 7156
-23155: DATA: 20189
-23156: DATA: 1463
-23157: DATA: 14402
-23158: DATA: 28509
-23159: DATA: 8800
-23160: DATA: 22880
-23161: DATA: 3084
-23162: DATA: 17181
-23163: DATA: 30248
-23164: DATA: 11575
-23165: DATA: 24701
-23166: DATA: 5924
-23167: DATA: 19005
-23168: DATA: 305
-23169: DATA: 13429
-23170: DATA: 27427
-23171: DATA: 7716
-23172: DATA: 21801
-23173: DATA: 2095
-23174: DATA: 16159
-23175: DATA: 29193
-23176: DATA: 10599
-23177: DATA: 23589
-23178: DATA: 4953
-23179: DATA: 17987
-23180: DATA: 32228
-23181: DATA: 12425
-23182: DATA: 26616
-23183: DATA: 6864
-23184: DATA: 20596
-23185: DATA: 1799
-23186: DATA: 14975
-23187: DATA: 29010
-23188: DATA: 9385
-23189: DATA: 23454
-23190: DATA: 3728
-23191: DATA: 17443
-23192: DATA: 31608
-23193: DATA: 11844
-23194: DATA: 25987
-23195: DATA: 6373
-23196: DATA: 20068
-23197: DATA: 1406
-23198: DATA: 14527
-23199: DATA: 28665
-23200: DATA: 9531
-23201: DATA: 22631
-23202: DATA: 4003
-23203: DATA: 17085
-23204: DATA: 30757
-23205: DATA: 12158
-23206: DATA: 25296
-23207: DATA: 6610
-23208: DATA: 20337
-23209: DATA: 681
-23210: DATA: 14812
-23211: DATA: 28483
-23212: DATA: 8932
-23213: DATA: 22941
-23214: DATA: 3929
-23215: DATA: 17025
-23216: DATA: 30836
-23217: DATA: 12102
-23218: DATA: 25337
-23219: DATA: 6160
-23220: DATA: 20404
-23221: DATA: 705
-23222: DATA: 14409
-23223: DATA: 28581
-23224: DATA: 9585
-23225: DATA: 22675
-23226: DATA: 3601
-23227: DATA: 17853
-23228: DATA: 31531
-23229: DATA: 11951
-23230: DATA: 25649
-23231: DATA: 7073
-23232: DATA: 20785
-23233: DATA: 1190
-23234: DATA: 14960
-23235: DATA: 29108
-23236: DATA: 10018
-23237: DATA: 23277
-23238: DATA: 4103
-23239: DATA: 18304
-23240: DATA: 32052
-23241: DATA: 12529
-23242: DATA: 26178
-23243: DATA: 7636
-23244: DATA: 21476
-23245: DATA: 2313
-23246: DATA: 15615
-23247: DATA: 29205
-23248: DATA: 10296
-23249: DATA: 24464
-23250: DATA: 5489
-23251: DATA: 18635
-23252: DATA: 32417
-23253: DATA: 13389
-23254: DATA: 27591
-23255: DATA: 8620
-23256: DATA: 22368
-23257: DATA: 2765
-23258: DATA: 16592
-23259: DATA: 30308
-23260: DATA: 11312
-23261: DATA: 25521
-23262: DATA: 6640
-23263: DATA: 20343
-23264: DATA: 1313
-23265: DATA: 14561
-23266: DATA: 28400
-23267: DATA: 9340
-23268: DATA: 23082
-23269: DATA: 4578
-23270: DATA: 18308
-23271: DATA: 32077
-23272: DATA: 13169
-23273: DATA: 26935
-23274: DATA: 7312
-23275: DATA: 21132
-23276: DATA: 2228
-23277: DATA: 15949
-23278: DATA: 29813
-23279: DATA: 10772
-23280: DATA: 24614
-23281: DATA: 6086
-23282: DATA: 19888
-23283: DATA: 914
-23284: DATA: 14762
-23285: DATA: 28429
-23286: DATA: 9540
-23287: DATA: 23405
-23288: DATA: 4465
-23289: DATA: 18245
-23290: DATA: 32000
-23291: DATA: 13096
-23292: DATA: 26912
-23293: DATA: 7992
-23294: DATA: 21795
-23295: DATA: 2849
-23296: DATA: 16693
-23297: DATA: 30521
-23298: DATA: 11632
-23299: DATA: 25396
-23300: DATA: 6442
-23301: DATA: 20333
-23302: DATA: 1284
-23303: DATA: 15117
-23304: DATA: 29041
-23305: DATA: 10021
-23306: DATA: 23889
-23307: DATA: 4931
-23308: DATA: 18864
-23309: DATA: 32664
-23310: DATA: 13811
-23311: DATA: 27613
-23312: DATA: 8245
-23313: DATA: 22040
-23314: DATA: 3186
-23315: DATA: 16984
-23316: DATA: 30902
-23317: DATA: 11981
-23318: DATA: 25795
-23319: DATA: 7469
-23320: DATA: 21371
-23321: DATA: 2391
-23322: DATA: 16260
-23323: DATA: 30177
-23324: DATA: 10813
-23325: DATA: 24637
-23326: DATA: 5796
-23327: DATA: 19709
-23328: DATA: 1329
-23329: DATA: 15207
-23330: DATA: 29109
-23331: DATA: 10236
-23332: DATA: 23586
-23333: DATA: 4729
-23334: DATA: 18581
-23335: DATA: 32471
-23336: DATA: 14138
-23337: DATA: 28133
-23338: DATA: 9104
-23339: DATA: 22564
-23340: DATA: 3760
-23341: DATA: 17565
-23342: DATA: 32113
-23343: DATA: 13209
-23344: DATA: 26663
-23345: DATA: 7770
-23346: DATA: 21680
-23347: DATA: 3342
-23348: DATA: 17313
-23349: DATA: 31176
-23350: DATA: 11869
-23351: DATA: 25846
-23352: DATA: 7476
-23353: DATA: 21393
-23354: DATA: 2079
-23355: DATA: 16109
-23356: DATA: 30496
-23357: DATA: 11698
-23358: DATA: 25200
-23359: DATA: 6305
-23360: DATA: 20796
-23361: DATA: 1980
-23362: DATA: 15395
-23363: DATA: 29437
-23364: DATA: 11041
-23365: DATA: 25019
-23366: DATA: 5653
-23367: DATA: 19595
-23368: DATA: 1332
-23369: DATA: 15346
-23370: DATA: 28760
-23371: DATA: 9928
-23372: DATA: 24490
-23373: DATA: 5213
-23374: DATA: 19175
-23375: DATA: 848
-23376: DATA: 14452
-23377: DATA: 28295
-23378: DATA: 10101
-23379: DATA: 24009
-23380: DATA: 4785
-23381: DATA: 19231
-23382: DATA: 478
-23383: DATA: 14053
-23384: DATA: 28515
-23385: DATA: 9676
-23386: DATA: 23172
-23387: DATA: 4965
-23388: DATA: 18532
-23389: DATA: 32500
-23390: DATA: 14244
-23391: DATA: 27701
-23392: DATA: 9504
-23393: DATA: 23546
-23394: DATA: 4336
-23395: DATA: 18793
-23396: DATA: 32300
-23397: DATA: 13544
-23398: DATA: 28112
-23399: DATA: 8772
-23400: DATA: 23418
-23401: DATA: 4145
-23402: DATA: 18133
-23403: DATA: 32654
-23404: DATA: 13484
-23405: DATA: 27996
-23406: DATA: 8829
-23407: DATA: 23319
-23408: DATA: 4145
-23409: DATA: 18119
-23410: DATA: 32688
-23411: DATA: 13467
-23412: DATA: 28086
-23413: DATA: 8770
-23414: DATA: 23389
-23415: DATA: 4133
-23416: DATA: 18784
-23417: DATA: 32269
-23418: DATA: 14101
-23419: DATA: 27757
-23420: DATA: 9515
-23421: DATA: 23081
-23422: DATA: 4920
-23423: DATA: 18480
-23424: DATA: 294
-23425: DATA: 13941
-23426: DATA: 28450
-23427: DATA: 9266
-23428: DATA: 23851
-23429: DATA: 4640
-23430: DATA: 19203
-23431: DATA: 75
-23432: DATA: 14622
-23433: DATA: 28175
-23434: DATA: 10100
-23435: DATA: 23628
-23436: DATA: 5565
-23437: DATA: 19165
-23438: DATA: 936
-23439: DATA: 14479
-23440: DATA: 28788
-23441: DATA: 10530
-23442: DATA: 24184
-23443: DATA: 5976
-23444: DATA: 19626
-23445: DATA: 1485
-23446: DATA: 15044
-23447: DATA: 29229
-23448: DATA: 11121
-23449: DATA: 24581
-23450: DATA: 6559
-23451: DATA: 20223
-23452: DATA: 1574
-23453: DATA: 16189
-23454: DATA: 29881
-23455: DATA: 11750
-23456: DATA: 25972
-23457: DATA: 6774
-23458: DATA: 21425
-23459: DATA: 2287
-23460: DATA: 16438
-23461: DATA: 31076
-23462: DATA: 11925
-23463: DATA: 26561
-23464: DATA: 7988
-23465: DATA: 21681
-23466: DATA: 3551
-23467: DATA: 17741
-23468: DATA: 31408
-23469: DATA: 13269
-23470: DATA: 27509
-23471: DATA: 8405
-23472: DATA: 22562
-23473: DATA: 4436
-23474: DATA: 18149
-23475: DATA: 32273
-23476: DATA: 14256
-23477: DATA: 27789
-23478: DATA: 9300
-23479: DATA: 24042
-23480: DATA: 5499
-23481: DATA: 19095
-23482: DATA: 604
-23483: DATA: 15341
-23484: DATA: 29488
-23485: DATA: 10421
-23486: DATA: 24629
-23487: DATA: 6645
-23488: DATA: 20794
-23489: DATA: 1696
-23490: DATA: 15933
-23491: DATA: 30655
-23492: DATA: 12065
-23493: DATA: 25791
-23494: DATA: 7171
-23495: DATA: 21957
-23496: DATA: 3451
-23497: DATA: 17131
-23498: DATA: 31248
-23499: DATA: 13273
-23500: DATA: 27564
-23501: DATA: 8984
-23502: DATA: 22704
-23503: DATA: 4177
-23504: DATA: 18491
-23505: DATA: 410
-23506: DATA: 14690
-23507: DATA: 28317
-23508: DATA: 9890
-23509: DATA: 24065
-23510: DATA: 6097
-23511: DATA: 20406
-23512: DATA: 1916
-23513: DATA: 15493
-23514: DATA: 29842
-23515: DATA: 11361
-23516: DATA: 25637
-23517: DATA: 7678
-23518: DATA: 21947
-23519: DATA: 3385
-23520: DATA: 17780
-23521: DATA: 31476
-23522: DATA: 12990
-23523: DATA: 27257
-23524: DATA: 8804
-23525: DATA: 23545
-23526: DATA: 5016
-23527: DATA: 19264
-23528: DATA: 890
-23529: DATA: 15205
-23530: DATA: 28868
-23531: DATA: 10373
-23532: DATA: 24737
-23533: DATA: 6173
-23534: DATA: 20607
-23535: DATA: 2055
-23536: DATA: 16438
-23537: DATA: 31125
-23538: DATA: 12789
-23539: DATA: 27019
-23540: DATA: 8613
-23541: DATA: 22877
-23542: DATA: 4447
-23543: DATA: 18807
-23544: DATA: 373
-23545: DATA: 14609
-23546: DATA: 28949
-23547: DATA: 10558
-23548: DATA: 24938
-23549: DATA: 6525
-23550: DATA: 20848
-23551: DATA: 2321
-23552: DATA: 16701
-23553: DATA: 31025
-23554: DATA: 12656
-23555: DATA: 26922
-23556: DATA: 8481
-23557: DATA: 22893
-23558: DATA: 4372
-23559: DATA: 18698
-23560: DATA: 308
-23561: DATA: 14710
-23562: DATA: 29023
-23563: DATA: 10560
-23564: DATA: 24993
-23565: DATA: 6537
-23566: DATA: 20984
-23567: DATA: 2524
-23568: DATA: 16442
-23569: DATA: 30738
-23570: DATA: 12336
-23571: DATA: 26698
-23572: DATA: 8374
-23573: DATA: 22658
-23574: DATA: 4318
-23575: DATA: 19234
-23576: DATA: 811
-23577: DATA: 15109
-23578: DATA: 29648
-23579: DATA: 11209
-23580: DATA: 25131
-23581: DATA: 6776
-23582: DATA: 21155
-23583: DATA: 2811
-23584: DATA: 17779
-23585: DATA: 32097
-23586: DATA: 13808
-23587: DATA: 28137
-23588: DATA: 9260
-23589: DATA: 23656
-23590: DATA: 5328
-23591: DATA: 19649
-23592: DATA: 1915
-23593: DATA: 16298
-23594: DATA: 30658
-23595: DATA: 11853
-23596: DATA: 26280
-23597: DATA: 7892
-23598: DATA: 22907
-23599: DATA: 4496
-23600: DATA: 18548
-23601: DATA: 64
-23602: DATA: 14563
-23603: DATA: 29506
-23604: DATA: 11236
-23605: DATA: 25485
-23606: DATA: 6759
-23607: DATA: 21216
-23608: DATA: 3380
-23609: DATA: 17796
-23610: DATA: 31772
-23611: DATA: 13502
-23612: DATA: 28459
-23613: DATA: 10237
-23614: DATA: 24118
-23615: DATA: 5818
-23616: DATA: 20769
-23617: DATA: 2491
-23618: DATA: 16436
-23619: DATA: 30973
-23620: DATA: 13093
-23621: DATA: 27629
-23622: DATA: 8707
-23623: DATA: 23176
-23624: DATA: 5493
-23625: DATA: 19945
-23626: DATA: 1116
-23627: DATA: 15501
-23628: DATA: 30636
-23629: DATA: 11794
-23630: DATA: 26341
-23631: DATA: 8519
-23632: DATA: 22579
-23633: DATA: 4249
-23634: DATA: 19313
-23635: DATA: 974
-23636: DATA: 15031
-23637: DATA: 30029
-23638: DATA: 11742
-23639: DATA: 25760
-23640: DATA: 8053
-23641: DATA: 22487
-23642: DATA: 3792
-23643: DATA: 18809
-23644: DATA: 44
-23645: DATA: 14584
-23646: DATA: 29680
-23647: DATA: 10865
-23648: DATA: 25915
-23649: DATA: 7674
-23650: DATA: 21666
-23651: DATA: 3889
-23652: DATA: 18020
-23653: DATA: 32488
-23654: DATA: 14750
-23655: DATA: 28737
-23656: DATA: 11128
-23657: DATA: 25120
-23658: DATA: 6851
-23659: DATA: 21918
-23660: DATA: 3240
-23661: DATA: 18244
-23662: DATA: 32304
-23663: DATA: 14599
-23664: DATA: 28705
-23665: DATA: 10459
-23666: DATA: 25598
-23667: DATA: 6804
-23668: DATA: 21930
-23669: DATA: 3146
-23670: DATA: 18206
-23671: DATA: 32293
-23672: DATA: 14644
-23673: DATA: 28716
-23674: DATA: 11011
-23675: DATA: 25197
-23676: DATA: 7469
-23677: DATA: 21545
-23678: DATA: 3952
-23679: DATA: 17954
-23680: DATA: 309
-23681: DATA: 14396
-23682: DATA: 29476
-23683: DATA: 10804
-23684: DATA: 25898
-23685: DATA: 7210
-23686: DATA: 22352
-23687: DATA: 3587
-23688: DATA: 18811
-23689: DATA: 119
-23690: DATA: 15120
-23691: DATA: 29278
-23692: DATA: 11691
-23693: DATA: 25744
-23694: DATA: 8181
-23695: DATA: 22209
-23696: DATA: 4156
-23697: DATA: 19228
-23698: DATA: 638
-23699: DATA: 15706
-23700: DATA: 29947
-23701: DATA: 12263
-23702: DATA: 26298
-23703: DATA: 8193
-23704: DATA: 23413
-23705: DATA: 4700
-23706: DATA: 19920
-23707: DATA: 1212
-23708: DATA: 15991
-23709: DATA: 31015
-23710: DATA: 12528
-23711: DATA: 27590
-23712: DATA: 9531
-23713: DATA: 23672
-23714: DATA: 6069
-23715: DATA: 20157
-23716: DATA: 2091
-23717: DATA: 17259
-23718: DATA: 31440
-23719: DATA: 13768
-23720: DATA: 28525
-23721: DATA: 9957
-23722: DATA: 25043
-23723: DATA: 6943
-23724: DATA: 21153
-23725: DATA: 3530
-23726: DATA: 18224
-23727: DATA: 32390
-23728: DATA: 14371
-23729: DATA: 29520
-23730: DATA: 10993
-23731: DATA: 25615
-23732: DATA: 8164
-23733: DATA: 22233
-23734: DATA: 4184
-23735: DATA: 19424
-23736: DATA: 1332
-23737: DATA: 15498
-23738: DATA: 30210
-23739: DATA: 12719
-23740: DATA: 27492
-23741: DATA: 8892
-23742: DATA: 23603
-23743: DATA: 6049
-23744: DATA: 20769
-23745: DATA: 2228
-23746: DATA: 16956
-23747: DATA: 32177
-23748: DATA: 14141
-23749: DATA: 28397
-23750: DATA: 10263
-23751: DATA: 25472
-23752: DATA: 7520
-23753: DATA: 21750
-23754: DATA: 3600
-23755: DATA: 18885
-23756: DATA: 929
-23757: DATA: 15644
-23758: DATA: 29926
-23759: DATA: 11856
-23760: DATA: 26662
-23761: DATA: 9173
-23762: DATA: 23935
-23763: DATA: 5327
-23764: DATA: 20196
-23765: DATA: 2049
-23766: DATA: 17369
-23767: DATA: 32162
-23768: DATA: 14204
-23769: DATA: 28369
-23770: DATA: 10389
-23771: DATA: 25215
-23772: DATA: 7268
-23773: DATA: 22524
-23774: DATA: 4515
-23775: DATA: 19253
-23776: DATA: 1312
-23777: DATA: 15613
-23778: DATA: 30389
-23779: DATA: 12388
-23780: DATA: 27236
-23781: DATA: 9722
-23782: DATA: 24465
-23783: DATA: 6473
-23784: DATA: 21375
-23785: DATA: 3429
-23786: DATA: 17617
-23787: DATA: 32415
-23788: DATA: 14507
-23789: DATA: 29256
-23790: DATA: 11390
-23791: DATA: 26129
-23792: DATA: 8308
-23793: DATA: 23490
-23794: DATA: 5625
-23795: DATA: 20361
-23796: DATA: 2476
-23797: DATA: 17165
-23798: DATA: 32089
-23799: DATA: 14193
-23800: DATA: 28986
-23801: DATA: 11077
-23802: DATA: 25936
-23803: DATA: 7940
-23804: DATA: 22839
-23805: DATA: 4989
-23806: DATA: 19748
-23807: DATA: 1853
-23808: DATA: 16693
-23809: DATA: 31521
-23810: DATA: 13680
-23811: DATA: 28472
-23812: DATA: 10546
-23813: DATA: 25384
-23814: DATA: 7454
-23815: DATA: 22341
-23816: DATA: 4452
-23817: DATA: 19306
-23818: DATA: 1347
-23819: DATA: 16222
-23820: DATA: 31149
-23821: DATA: 13215
-23822: DATA: 28156
-23823: DATA: 10192
-23824: DATA: 24683
-23825: DATA: 6741
-23826: DATA: 21552
-23827: DATA: 3689
-23828: DATA: 18604
-23829: DATA: 648
-23830: DATA: 15561
-23831: DATA: 31077
-23832: DATA: 13159
-23833: DATA: 27972
-23834: DATA: 10121
-23835: DATA: 25005
-23836: DATA: 6704
-23837: DATA: 21621
-23838: DATA: 3761
-23839: DATA: 18657
-23840: DATA: 1396
-23841: DATA: 16252
-23842: DATA: 31158
-23843: DATA: 13245
-23844: DATA: 27696
-23845: DATA: 9829
-23846: DATA: 24725
-23847: DATA: 6876
-23848: DATA: 22324
-23849: DATA: 4530
-23850: DATA: 19409
-23851: DATA: 1025
-23852: DATA: 16047
-23853: DATA: 30877
-23854: DATA: 13668
-23855: DATA: 28573
-23856: DATA: 10278
-23857: DATA: 25178
-23858: DATA: 7397
-23859: DATA: 22810
-23860: DATA: 5036
-23861: DATA: 19853
-23862: DATA: 1619
-23863: DATA: 16608
-23864: DATA: 32102
-23865: DATA: 14225
-23866: DATA: 28689
-23867: DATA: 10916
-23868: DATA: 26410
-23869: DATA: 8701
-23870: DATA: 23074
-23871: DATA: 5306
-23872: DATA: 20795
-23873: DATA: 3000
-23874: DATA: 17443
-23875: DATA: 32509
-23876: DATA: 15158
-23877: DATA: 30120
-23878: DATA: 11776
-23879: DATA: 26752
-23880: DATA: 9589
-23881: DATA: 24561
-23882: DATA: 6229
-23883: DATA: 21193
-23884: DATA: 4008
-23885: DATA: 18436
-23886: DATA: 700
-23887: DATA: 16149
-23888: DATA: 30752
-23889: DATA: 12957
-23890: DATA: 28533
-23891: DATA: 10692
-23892: DATA: 25316
-23893: DATA: 7947
-23894: DATA: 22997
-23895: DATA: 4768
-23896: DATA: 20344
-23897: DATA: 2437
-23898: DATA: 17049
-23899: DATA: 32633
-23900: DATA: 14436
-23901: DATA: 29434
-23902: DATA: 12213
-23903: DATA: 26721
-23904: DATA: 9504
-23905: DATA: 24572
-23906: DATA: 6334
-23907: DATA: 21882
-23908: DATA: 3684
-23909: DATA: 18657
-23910: DATA: 1433
-23911: DATA: 15938
-23912: DATA: 31612
-23913: DATA: 13361
-23914: DATA: 28373
-23915: DATA: 11167
-23916: DATA: 25828
-23917: DATA: 8540
-23918: DATA: 23166
-23919: DATA: 5905
-23920: DATA: 20596
-23921: DATA: 2777
-23922: DATA: 18425
-23923: DATA: 154
-23924: DATA: 15788
-23925: DATA: 30297
-23926: DATA: 13141
-23927: DATA: 27767
-23928: DATA: 10552
-23929: DATA: 25157
-23930: DATA: 7954
-23931: DATA: 22584
-23932: DATA: 5424
-23933: DATA: 20093
-23934: DATA: 2873
-23935: DATA: 17441
-23936: DATA: 372
-23937: DATA: 14896
-23938: DATA: 30502
-23939: DATA: 12344
-23940: DATA: 27946
-23941: DATA: 9785
-23942: DATA: 25349
-23943: DATA: 7172
-23944: DATA: 22904
-23945: DATA: 4713
-23946: DATA: 20297
-23947: DATA: 2061
-23948: DATA: 17838
-23949: DATA: 32392
-23950: DATA: 15331
-23951: DATA: 29889
-23952: DATA: 12404
-23953: DATA: 27920
-23954: DATA: 9830
-23955: DATA: 25436
-23956: DATA: 7348
-23957: DATA: 22914
-23958: DATA: 4802
-23959: DATA: 20004
-23960: DATA: 2912
-23961: DATA: 17472
-23962: DATA: 387
-23963: DATA: 15021
-23964: DATA: 30245
-23965: DATA: 13171
-23966: DATA: 27828
-23967: DATA: 10677
-23968: DATA: 25909
-23969: DATA: 7733
-23970: DATA: 23486
-23971: DATA: 5368
-23972: DATA: 20531
-23973: DATA: 3373
-23974: DATA: 18079
-23975: DATA: 971
-23976: DATA: 16241
-23977: DATA: 30949
-23978: DATA: 13777
-23979: DATA: 28957
-23980: DATA: 10932
-23981: DATA: 26584
-23982: DATA: 9073
-23983: DATA: 23687
-23984: DATA: 6183
-23985: DATA: 21781
-23986: DATA: 3825
-23987: DATA: 18958
-23988: DATA: 2020
-23989: DATA: 16600
-23990: DATA: 31811
-23991: DATA: 14832
-23992: DATA: 30069
-23993: DATA: 11913
-23994: DATA: 27230
-23995: DATA: 10183
-23996: DATA: 25422
-23997: DATA: 7321
-23998: DATA: 22577
-23999: DATA: 5548
-24000: DATA: 20852
-24001: DATA: 2791
-24002: DATA: 18017
-24003: DATA: 999
-24004: DATA: 16228
-24005: DATA: 30851
-24006: DATA: 13343
-24007: DATA: 29074
-24008: DATA: 11572
-24009: DATA: 26316
-24010: DATA: 8720
-24011: DATA: 24526
-24012: DATA: 7077
-24013: DATA: 22291
-24014: DATA: 4272
-24015: DATA: 19539
-24016: DATA: 2097
-24017: DATA: 17808
-24018: DATA: 380
-24019: DATA: 15005
-24020: DATA: 30384
-24021: DATA: 12805
-24022: DATA: 28629
-24023: DATA: 11237
-24024: DATA: 26491
-24025: DATA: 8407
-24026: DATA: 23698
-24027: DATA: 6189
-24028: DATA: 21543
-24029: DATA: 4597
-24030: DATA: 19889
-24031: DATA: 2427
-24032: DATA: 17715
-24033: DATA: 32508
-24034: DATA: 15038
-24035: DATA: 30330
-24036: DATA: 12900
-24037: DATA: 28666
-24038: DATA: 11157
-24039: DATA: 26444
-24040: DATA: 9075
-24041: DATA: 24365
-24042: DATA: 6340
-24043: DATA: 21709
-24044: DATA: 4261
-24045: DATA: 19534
-24046: DATA: 2096
-24047: DATA: 17468
-24048: DATA: 116
-24049: DATA: 15810
-24050: DATA: 31217
-24051: DATA: 13713
-24052: DATA: 29103
-24053: DATA: 11533
-24054: DATA: 26961
-24055: DATA: 9591
-24056: DATA: 24955
-24057: DATA: 7440
-24058: DATA: 22814
-24059: DATA: 5417
-24060: DATA: 20842
-24061: DATA: 3453
-24062: DATA: 18800
-24063: DATA: 1308
-24064: DATA: 16672
-24065: DATA: 32117
-24066: DATA: 14644
-24067: DATA: 30008
-24068: DATA: 12596
-24069: DATA: 27944
-24070: DATA: 10526
-24071: DATA: 25857
-24072: DATA: 8551
-24073: DATA: 23845
-24074: DATA: 6495
-24075: DATA: 21827
-24076: DATA: 4580
-24077: DATA: 19849
-24078: DATA: 2552
-24079: DATA: 17872
-24080: DATA: 116
-24081: DATA: 15380
-24082: DATA: 30818
-24083: DATA: 13400
-24084: DATA: 28837
-24085: DATA: 11469
-24086: DATA: 26781
-24087: DATA: 10085
-24088: DATA: 25440
-24089: DATA: 8013
-24090: DATA: 23445
-24091: DATA: 6061
-24092: DATA: 21031
-24093: DATA: 3701
-24094: DATA: 19121
-24095: DATA: 1787
-24096: DATA: 17715
-24097: DATA: 368
-24098: DATA: 15856
-24099: DATA: 31220
-24100: DATA: 13367
-24101: DATA: 28717
-24102: DATA: 11398
-24103: DATA: 26816
-24104: DATA: 10086
-24105: DATA: 25532
-24106: DATA: 8080
-24107: DATA: 23070
-24108: DATA: 5809
-24109: DATA: 21215
-24110: DATA: 4452
-24111: DATA: 19865
-24112: DATA: 2097
-24113: DATA: 17429
-24114: DATA: 249
-24115: DATA: 16147
-24116: DATA: 31716
-24117: DATA: 14302
-24118: DATA: 29279
-24119: DATA: 12008
-24120: DATA: 28017
-24121: DATA: 10693
-24122: DATA: 25600
-24123: DATA: 8353
-24124: DATA: 24357
-24125: DATA: 7102
-24126: DATA: 22069
-24127: DATA: 4774
-24128: DATA: 20856
-24129: DATA: 3573
-24130: DATA: 18482
-24131: DATA: 1192
-24132: DATA: 17200
-24133: DATA: 32749
-24134: DATA: 14867
-24135: DATA: 30336
-24136: DATA: 13670
-24137: DATA: 29169
-24138: DATA: 11345
-24139: DATA: 26820
-24140: DATA: 10154
-24141: DATA: 25105
-24142: DATA: 7913
-24143: DATA: 23829
-24144: DATA: 6201
-24145: DATA: 21658
-24146: DATA: 4962
-24147: DATA: 20440
-24148: DATA: 2788
-24149: DATA: 18691
-24150: DATA: 1503
-24151: DATA: 16561
-24152: DATA: 32637
-24153: DATA: 15302
-24154: DATA: 30357
-24155: DATA: 13676
-24156: DATA: 28710
-24157: DATA: 11505
-24158: DATA: 27573
-24159: DATA: 9781
-24160: DATA: 25917
-24161: DATA: 8699
-24162: DATA: 23792
-24163: DATA: 7026
-24164: DATA: 22064
-24165: DATA: 4837
-24166: DATA: 20885
-24167: DATA: 3159
-24168: DATA: 19303
-24169: DATA: 1641
-24170: DATA: 17040
-24171: DATA: 392
-24172: DATA: 15543
-24173: DATA: 31565
-24174: DATA: 13941
-24175: DATA: 29974
-24176: DATA: 12349
-24177: DATA: 27860
-24178: DATA: 11260
-24179: DATA: 26257
-24180: DATA: 9661
-24181: DATA: 24589
-24182: DATA: 8007
-24183: DATA: 23149
-24184: DATA: 6513
-24185: DATA: 21515
-24186: DATA: 4944
-24187: DATA: 19972
-24188: DATA: 3428
-24189: DATA: 18474
-24190: DATA: 1841
-24191: DATA: 16953
-24192: DATA: 319
-24193: DATA: 15477
-24194: DATA: 31545
-24195: DATA: 13875
-24196: DATA: 30000
-24197: DATA: 12322
-24198: DATA: 28496
-24199: DATA: 10756
-24200: DATA: 26932
-24201: DATA: 9335
-24202: DATA: 25439
-24203: DATA: 7746
-24204: DATA: 23977
-24205: DATA: 6365
-24206: DATA: 22503
-24207: DATA: 4828
-24208: DATA: 20512
-24209: DATA: 3869
-24210: DATA: 18992
-24211: DATA: 2396
-24212: DATA: 17636
-24213: DATA: 897
-24214: DATA: 16081
-24215: DATA: 31799
-24216: DATA: 15219
-24217: DATA: 30272
-24218: DATA: 13698
-24219: DATA: 28845
-24220: DATA: 11818
-24221: DATA: 28008
-24222: DATA: 10429
-24223: DATA: 26615
-24224: DATA: 9521
-24225: DATA: 24679
-24226: DATA: 8176
-24227: DATA: 23282
-24228: DATA: 6198
-24229: DATA: 22317
-24230: DATA: 4767
-24231: DATA: 20944
-24232: DATA: 3936
-24233: DATA: 19173
-24234: DATA: 2527
-24235: DATA: 18187
-24236: DATA: 740
-24237: DATA: 16860
-24238: DATA: 32560
-24239: DATA: 14983
-24240: DATA: 30779
-24241: DATA: 14170
-24242: DATA: 29437
-24243: DATA: 12381
-24244: DATA: 28585
-24245: DATA: 10956
-24246: DATA: 26690
-24247: DATA: 10222
-24248: DATA: 25969
-24249: DATA: 8321
-24250: DATA: 24144
-24251: DATA: 7658
-24252: DATA: 23406
-24253: DATA: 5882
-24254: DATA: 21630
-24255: DATA: 5109
-24256: DATA: 20852
-24257: DATA: 3205
-24258: DATA: 18997
-24259: DATA: 2479
-24260: DATA: 18220
-24261: DATA: 684
-24262: DATA: 16384
-24263: DATA: 32662
-24264: DATA: 15668
-24265: DATA: 30962
-24266: DATA: 13909
-24267: DATA: 30093
-24268: DATA: 13223
-24269: DATA: 28956
-24270: DATA: 11518
-24271: DATA: 27157
-24272: DATA: 10293
-24273: DATA: 26518
-24274: DATA: 9572
-24275: DATA: 24776
-24276: DATA: 7845
-24277: DATA: 23553
-24278: DATA: 7132
-24279: DATA: 22972
-24280: DATA: 5940
-24281: DATA: 21190
-24282: DATA: 4255
-24283: DATA: 20067
-24284: DATA: 3120
-24285: DATA: 19439
-24286: DATA: 2495
-24287: DATA: 18297
-24288: DATA: 1396
-24289: DATA: 16609
-24290: DATA: 32440
-24291: DATA: 15480
-24292: DATA: 31332
-24293: DATA: 14842
-24294: DATA: 30613
-24295: DATA: 13644
-24296: DATA: 29555
-24297: DATA: 12589
-24298: DATA: 27844
-24299: DATA: 10957
-24300: DATA: 26795
-24301: DATA: 9819
-24302: DATA: 25648
-24303: DATA: 8705
-24304: DATA: 24636
-24305: DATA: 8156
-24306: DATA: 24035
-24307: DATA: 7133
-24308: DATA: 22953
-24309: DATA: 5972
-24310: DATA: 21827
-24311: DATA: 4977
-24312: DATA: 20849
-24313: DATA: 3863
-24314: DATA: 19737
-24315: DATA: 2850
-24316: DATA: 18737
-24317: DATA: 1838
-24318: DATA: 17776
-24319: DATA: 826
-24320: DATA: 16678
-24321: DATA: 32567
-24322: DATA: 15727
-24323: DATA: 31575
-24324: DATA: 14670
-24325: DATA: 30473
-24326: DATA: 13585
-24327: DATA: 29468
-24328: DATA: 12596
-24329: DATA: 28470
-24330: DATA: 11524
-24331: DATA: 27415
-24332: DATA: 10724
-24333: DATA: 26546
-24334: DATA: 9726
-24335: DATA: 25552
-24336: DATA: 8308
-24337: DATA: 24090
-24338: DATA: 7286
-24339: DATA: 23069
-24340: DATA: 6320
-24341: DATA: 22149
-24342: DATA: 5333
-24343: DATA: 21861
-24344: DATA: 4983
-24345: DATA: 20823
-24346: DATA: 3989
-24347: DATA: 19962
-24348: DATA: 2601
-24349: DATA: 18552
-24350: DATA: 1725
-24351: DATA: 17655
-24352: DATA: 1329
-24353: DATA: 17255
-24354: DATA: 419
-24355: DATA: 16317
-24356: DATA: 31795
-24357: DATA: 14956
-24358: DATA: 30851
-24359: DATA: 13957
-24360: DATA: 30563
-24361: DATA: 13732
-24362: DATA: 29662
-24363: DATA: 12297
-24364: DATA: 28321
-24365: DATA: 11471
-24366: DATA: 28025
-24367: DATA: 11163
-24368: DATA: 26675
-24369: DATA: 9749
-24370: DATA: 25828
-24371: DATA: 9493
-24372: DATA: 25505
-24373: DATA: 8589
-24374: DATA: 24130
-24375: DATA: 7402
-24376: DATA: 23931
-24377: DATA: 7048
-24378: DATA: 22531
-24379: DATA: 5869
-24380: DATA: 22320
-24381: DATA: 5554
-24382: DATA: 21044
-24383: DATA: 4276
-24384: DATA: 20781
-24385: DATA: 4085
-24386: DATA: 19505
-24387: DATA: 2739
-24388: DATA: 19232
-24389: DATA: 2541
-24390: DATA: 17939
-24391: DATA: 1161
-24392: DATA: 17781
-24393: DATA: 1004
-24394: DATA: 16477
-24395: DATA: 32456
-24396: DATA: 16288
-24397: DATA: 31837
-24398: DATA: 15076
-24399: DATA: 31581
-24400: DATA: 14389
-24401: DATA: 30337
-24402: DATA: 14128
-24403: DATA: 30153
-24404: DATA: 12972
-24405: DATA: 29448
-24406: DATA: 12688
-24407: DATA: 28331
-24408: DATA: 12129
-24409: DATA: 28104
-24410: DATA: 10898
-24411: DATA: 27496
-24412: DATA: 10294
-24413: DATA: 26350
-24414: DATA: 10224
-24415: DATA: 25722
-24416: DATA: 9530
-24417: DATA: 25525
-24418: DATA: 8356
-24419: DATA: 24949
-24420: DATA: 7713
-24421: DATA: 23725
-24422: DATA: 7572
-24423: DATA: 23114
-24424: DATA: 7035
-24425: DATA: 22583
-24426: DATA: 5776
-24427: DATA: 22411
-24428: DATA: 5288
-24429: DATA: 21852
-24430: DATA: 4707
-24431: DATA: 21277
-24432: DATA: 4145
-24433: DATA: 20177
-24434: DATA: 4016
-24435: DATA: 19594
-24436: DATA: 3500
-24437: DATA: 19012
-24438: DATA: 2884
-24439: DATA: 18528
-24440: DATA: 2356
-24441: DATA: 17924
-24442: DATA: 1795
-24443: DATA: 17517
-24444: DATA: 1324
-24445: DATA: 16952
-24446: DATA: 880
-24447: DATA: 16436
-24448: DATA: 292
-24449: DATA: 15909
-24450: DATA: 32546
-24451: DATA: 15410
-24452: DATA: 32037
-24453: DATA: 14894
-24454: DATA: 31512
-24455: DATA: 14336
-24456: DATA: 31088
-24457: DATA: 13860
-24458: DATA: 30480
-24459: DATA: 13325
-24460: DATA: 30092
-24461: DATA: 12952
-24462: DATA: 29616
-24463: DATA: 12486
-24464: DATA: 28725
-24465: DATA: 12572
-24466: DATA: 28276
-24467: DATA: 12061
-24468: DATA: 27824
-24469: DATA: 11653
-24470: DATA: 27349
-24471: DATA: 10853
-24472: DATA: 27504
-24473: DATA: 10314
-24474: DATA: 27039
-24475: DATA: 9983
-24476: DATA: 26212
-24477: DATA: 10094
-24478: DATA: 25764
-24479: DATA: 9724
-24480: DATA: 25912
-24481: DATA: 8825
-24482: DATA: 25584
-24483: DATA: 8441
-24484: DATA: 24621
-24485: DATA: 8553
-24486: DATA: 24222
-24487: DATA: 8066
-24488: DATA: 24416
-24489: DATA: 7397
-24490: DATA: 24031
-24491: DATA: 7453
-24492: DATA: 23201
-24493: DATA: 7123
-24494: DATA: 23356
-24495: DATA: 6357
-24496: DATA: 22582
-24497: DATA: 6464
-24498: DATA: 22244
-24499: DATA: 5725
-24500: DATA: 22444
-24501: DATA: 5320
-24502: DATA: 21520
-24503: DATA: 5611
-24504: DATA: 21883
-24505: DATA: 4753
-24506: DATA: 21017
-24507: DATA: 5038
-24508: DATA: 21281
-24509: DATA: 4281
-24510: DATA: 20592
-24511: DATA: 4513
-24512: DATA: 20796
-24513: DATA: 3764
-24514: DATA: 20004
-24515: DATA: 4093
-24516: DATA: 20272
-24517: DATA: 3237
-24518: DATA: 19477
-24519: DATA: 3525
-24520: DATA: 19836
-24521: DATA: 2794
-24522: DATA: 19013
-24523: DATA: 3039
-24524: DATA: 19363
-24525: DATA: 2833
-24526: DATA: 18673
-24527: DATA: 2118
-24528: DATA: 18471
-24529: DATA: 2517
-24530: DATA: 18808
-24531: DATA: 1756
-24532: DATA: 18080
-24533: DATA: 1613
-24534: DATA: 18370
-24535: DATA: 1968
-24536: DATA: 18298
-24537: DATA: 1157
-24538: DATA: 17567
-24539: DATA: 1144
-24540: DATA: 17456
-24541: DATA: 1469
-24542: DATA: 17841
-24543: DATA: 1403
-24544: DATA: 17712
-24545: DATA: 693
-24546: DATA: 17078
-24547: DATA: 625
-24548: DATA: 16933
-24549: DATA: 1022
-24550: DATA: 17304
-24551: DATA: 832
-24552: DATA: 17264
-24553: DATA: 869
-24554: DATA: 16594
-24555: DATA: 129
-24556: DATA: 16549
-24557: DATA: 94
-24558: DATA: 16507
-24559: DATA: 91
-24560: DATA: 16500
-24561: DATA: 405
-24562: DATA: 16839
-24563: DATA: 405
-24564: DATA: 16801
-24565: DATA: 323
-24566: DATA: 16656
-24567: DATA: 370
-24568: DATA: 16753
-24569: DATA: 325
-24570: DATA: 16647
-24571: DATA: 296
-24572: DATA: 16682
-24573: DATA: 297
-24574: DATA: 16752
-24575: DATA: 289
-24576: DATA: 16699
-24577: DATA: 373
-24578: DATA: 16691
-24579: DATA: 309
-24580: DATA: 16673
-24581: DATA: 302
-24582: DATA: 16667
-24583: DATA: 325
-24584: DATA: 16763
-24585: DATA: 363
-24586: DATA: 16656
-24587: DATA: 324
-24588: DATA: 16816
-24589: DATA: 465
-24590: DATA: 16816
-24591: DATA: 476
-24592: DATA: 16416
-24593: DATA: 85
-24594: DATA: 16487
-24595: DATA: 92
-24596: DATA: 16567
-24597: DATA: 205
-24598: DATA: 16579
-24599: DATA: 817
-24600: DATA: 17277
-24601: DATA: 841
-24602: DATA: 17308
-24603: DATA: 941
-24604: DATA: 16950
-24605: DATA: 616
-24606: DATA: 17086
-24607: DATA: 763
-24608: DATA: 17725
-24609: DATA: 1403
-24610: DATA: 17847
-24611: DATA: 1469
-24612: DATA: 17448
-24613: DATA: 1124
-24614: DATA: 17563
-24615: DATA: 1216
-24616: DATA: 18228
-24617: DATA: 1964
-24618: DATA: 18372
-24619: DATA: 1613
-24620: DATA: 18085
-24621: DATA: 1745
-24622: DATA: 18791
-24623: DATA: 2452
-24624: DATA: 18477
-24625: DATA: 2118
-24626: DATA: 18608
-24627: DATA: 2841
-24628: DATA: 19371
-24629: DATA: 3016
-24630: DATA: 19011
-24631: DATA: 2731
-24632: DATA: 19764
-24633: DATA: 3525
-24634: DATA: 19488
-24635: DATA: 3240
-24636: DATA: 20278
-24637: DATA: 4021
-24638: DATA: 20017
-24639: DATA: 3749
-24640: DATA: 20775
-24641: DATA: 4597
-24642: DATA: 20536
-24643: DATA: 4280
-24644: DATA: 21348
-24645: DATA: 5028
-24646: DATA: 20995
-24647: DATA: 4805
-24648: DATA: 21875
-24649: DATA: 5610
-24650: DATA: 21593
-24651: DATA: 5315
-24652: DATA: 22435
-24653: DATA: 5725
-24654: DATA: 22269
-24655: DATA: 6484
-24656: DATA: 22576
-24657: DATA: 6346
-24658: DATA: 23344
-24659: DATA: 7069
-24660: DATA: 23181
-24661: DATA: 7435
-24662: DATA: 23952
-24663: DATA: 7339
-24664: DATA: 24443
-24665: DATA: 8145
-24666: DATA: 24284
-24667: DATA: 8493
-24668: DATA: 24627
-24669: DATA: 8437
-24670: DATA: 25529
-24671: DATA: 8822
-24672: DATA: 25916
-24673: DATA: 9653
-24674: DATA: 25780
-24675: DATA: 10098
-24676: DATA: 26212
-24677: DATA: 9978
-24678: DATA: 27029
-24679: DATA: 10245
-24680: DATA: 27514
-24681: DATA: 10784
-24682: DATA: 27349
-24683: DATA: 11657
-24684: DATA: 27876
-24685: DATA: 12105
-24686: DATA: 28287
-24687: DATA: 12629
-24688: DATA: 28725
-24689: DATA: 12485
-24690: DATA: 29664
-24691: DATA: 12952
-24692: DATA: 30117
-24693: DATA: 13406
-24694: DATA: 30549
-24695: DATA: 13887
-24696: DATA: 31028
-24697: DATA: 14353
-24698: DATA: 31512
-24699: DATA: 14888
-24700: DATA: 32100
-24701: DATA: 15417
-24702: DATA: 32575
-24703: DATA: 15930
-24704: DATA: 294
-24705: DATA: 16501
-24706: DATA: 831
-24707: DATA: 16943
-24708: DATA: 1380
-24709: DATA: 17465
-24710: DATA: 1816
-24711: DATA: 17920
-24712: DATA: 2356
-24713: DATA: 18541
-24714: DATA: 2911
-24715: DATA: 19032
-24716: DATA: 3510
-24717: DATA: 19610
-24718: DATA: 4092
-24719: DATA: 20180
-24720: DATA: 4135
-24721: DATA: 21254
-24722: DATA: 4655
-24723: DATA: 21789
-24724: DATA: 5348
-24725: DATA: 22447
-24726: DATA: 5855
-24727: DATA: 22577
-24728: DATA: 7036
-24729: DATA: 23066
-24730: DATA: 7674
-24731: DATA: 23687
-24732: DATA: 7680
-24733: DATA: 24956
-24734: DATA: 8361
-24735: DATA: 25525
-24736: DATA: 9569
-24737: DATA: 25632
-24738: DATA: 10218
-24739: DATA: 26301
-24740: DATA: 10256
-24741: DATA: 27493
-24742: DATA: 10901
-24743: DATA: 28037
-24744: DATA: 12146
-24745: DATA: 28332
-24746: DATA: 12738
-24747: DATA: 29448
-24748: DATA: 12962
-24749: DATA: 30161
-24750: DATA: 14201
-24751: DATA: 30352
-24752: DATA: 14375
-24753: DATA: 31509
-24754: DATA: 15089
-24755: DATA: 31759
-24756: DATA: 16289
-24757: DATA: 32397
-24758: DATA: 16471
-24759: DATA: 992
-24760: DATA: 17760
-24761: DATA: 1169
-24762: DATA: 17945
-24763: DATA: 2467
-24764: DATA: 19235
-24765: DATA: 2813
-24766: DATA: 19491
-24767: DATA: 4000
-24768: DATA: 20775
-24769: DATA: 4261
-24770: DATA: 21049
-24771: DATA: 5566
-24772: DATA: 22317
-24773: DATA: 5794
-24774: DATA: 22533
-24775: DATA: 7062
-24776: DATA: 23866
-24777: DATA: 7333
-24778: DATA: 24080
-24779: DATA: 8674
-24780: DATA: 25514
-24781: DATA: 9496
-24782: DATA: 25776
-24783: DATA: 9818
-24784: DATA: 26674
-24785: DATA: 11221
-24786: DATA: 28004
-24787: DATA: 11477
-24788: DATA: 28321
-24789: DATA: 12288
-24790: DATA: 29584
-24791: DATA: 13737
-24792: DATA: 30587
-24793: DATA: 14026
-24794: DATA: 30875
-24795: DATA: 14952
-24796: DATA: 31776
-24797: DATA: 16317
-24798: DATA: 433
-24799: DATA: 17249
-24800: DATA: 1396
-24801: DATA: 17656
-24802: DATA: 1717
-24803: DATA: 18493
-24804: DATA: 2594
-24805: DATA: 19960
-24806: DATA: 3998
-24807: DATA: 20811
-24808: DATA: 4973
-24809: DATA: 21861
-24810: DATA: 5316
-24811: DATA: 22146
-24812: DATA: 6304
-24813: DATA: 23132
-24814: DATA: 7273
-24815: DATA: 24149
-24816: DATA: 8245
-24817: DATA: 25563
-24818: DATA: 9716
-24819: DATA: 26589
-24820: DATA: 10672
-24821: DATA: 27461
-24822: DATA: 11605
-24823: DATA: 28523
-24824: DATA: 12596
-24825: DATA: 29443
-24826: DATA: 13596
-24827: DATA: 30504
-24828: DATA: 14643
-24829: DATA: 31613
-24830: DATA: 15679
-24831: DATA: 32563
-24832: DATA: 16690
-24833: DATA: 891
-24834: DATA: 17776
-24835: DATA: 1917
-24836: DATA: 18701
-24837: DATA: 2925
-24838: DATA: 19716
-24839: DATA: 3853
-24840: DATA: 20861
-24841: DATA: 4971
-24842: DATA: 21851
-24843: DATA: 5901
-24844: DATA: 22925
-24845: DATA: 7133
-24846: DATA: 24035
-24847: DATA: 8148
-24848: DATA: 24611
-24849: DATA: 8789
-24850: DATA: 25713
-24851: DATA: 9811
-24852: DATA: 26795
-24853: DATA: 10905
-24854: DATA: 27864
-24855: DATA: 12576
-24856: DATA: 29542
-24857: DATA: 13573
-24858: DATA: 30623
-24859: DATA: 14819
-24860: DATA: 31265
-24861: DATA: 15421
-24862: DATA: 32434
-24863: DATA: 16633
-24864: DATA: 1341
-24865: DATA: 18299
-24866: DATA: 2491
-24867: DATA: 19444
-24868: DATA: 3114
-24869: DATA: 20074
-24870: DATA: 4304
-24871: DATA: 21188
-24872: DATA: 5940
-24873: DATA: 22953
-24874: DATA: 7129
-24875: DATA: 23577
-24876: DATA: 7856
-24877: DATA: 24785
-24878: DATA: 9589
-24879: DATA: 26581
-24880: DATA: 10290
-24881: DATA: 27220
-24882: DATA: 11491
-24883: DATA: 28937
-24884: DATA: 13217
-24885: DATA: 30175
-24886: DATA: 13840
-24887: DATA: 30961
-24888: DATA: 15740
-24889: DATA: 32644
-24890: DATA: 16414
-24891: DATA: 749
-24892: DATA: 18225
-24893: DATA: 2478
-24894: DATA: 18981
-24895: DATA: 3252
-24896: DATA: 20792
-24897: DATA: 5115
-24898: DATA: 21616
-24899: DATA: 5885
-24900: DATA: 23307
-24901: DATA: 7615
-24902: DATA: 24144
-24903: DATA: 8338
-24904: DATA: 25973
-24905: DATA: 10230
-24906: DATA: 26640
-24907: DATA: 10948
-24908: DATA: 28592
-24909: DATA: 12381
-24910: DATA: 29425
-24911: DATA: 14101
-24912: DATA: 30776
-24913: DATA: 15004
-24914: DATA: 32612
-24915: DATA: 16841
-24916: DATA: 680
-24917: DATA: 18184
-24918: DATA: 2448
-24919: DATA: 19126
-24920: DATA: 3960
-24921: DATA: 20938
-24922: DATA: 4743
-24923: DATA: 22376
-24924: DATA: 6198
-24925: DATA: 23202
-24926: DATA: 8176
-24927: DATA: 24629
-24928: DATA: 9475
-24929: DATA: 26608
-24930: DATA: 10480
-24931: DATA: 28028
-24932: DATA: 11830
-24933: DATA: 28904
-24934: DATA: 13776
-24935: DATA: 30274
-24936: DATA: 15217
-24937: DATA: 31793
-24938: DATA: 16068
-24939: DATA: 900
-24940: DATA: 17578
-24941: DATA: 2394
-24942: DATA: 18992
-24943: DATA: 3863
-24944: DATA: 20529
-24945: DATA: 4801
-24946: DATA: 22500
-24947: DATA: 6296
-24948: DATA: 23990
-24949: DATA: 7693
-24950: DATA: 25425
-24951: DATA: 9329
-24952: DATA: 26932
-24953: DATA: 10758
-24954: DATA: 28447
-24955: DATA: 12323
-24956: DATA: 30000
-24957: DATA: 13871
-24958: DATA: 31551
-24959: DATA: 15417
-24960: DATA: 312
-24961: DATA: 16956
-24962: DATA: 1854
-24963: DATA: 18490
-24964: DATA: 3428
-24965: DATA: 20025
-24966: DATA: 4888
-24967: DATA: 21504
-24968: DATA: 6452
-24969: DATA: 23154
-24970: DATA: 8021
-24971: DATA: 24644
-24972: DATA: 9635
-24973: DATA: 26261
-24974: DATA: 11236
-24975: DATA: 27797
-24976: DATA: 12347
-24977: DATA: 29971
-24978: DATA: 13872
-24979: DATA: 31561
-24980: DATA: 15532
-24981: DATA: 392
-24982: DATA: 17040
-24983: DATA: 1578
-24984: DATA: 19302
-24985: DATA: 3143
-24986: DATA: 20956
-24987: DATA: 4781
-24988: DATA: 22053
-24989: DATA: 7027
-24990: DATA: 23732
-24991: DATA: 8629
-24992: DATA: 25891
-24993: DATA: 9840
-24994: DATA: 27632
-24995: DATA: 11497
-24996: DATA: 28716
-24997: DATA: 13668
-24998: DATA: 30366
-24999: DATA: 15310
-25000: DATA: 32564
-25001: DATA: 16561
-25002: DATA: 1496
-25003: DATA: 18700
-25004: DATA: 2736
-25005: DATA: 20378
-25006: DATA: 4963
-25007: DATA: 21717
-25008: DATA: 6179
-25009: DATA: 23901
-25010: DATA: 7921
-25011: DATA: 25097
-25012: DATA: 10212
-25013: DATA: 26841
-25014: DATA: 11352
-25015: DATA: 29152
-25016: DATA: 13620
-25017: DATA: 30347
-25018: DATA: 14853
-25019: DATA: 32672
-25020: DATA: 17190
-25021: DATA: 1208
-25022: DATA: 18466
-25023: DATA: 3494
-25024: DATA: 20852
-25025: DATA: 4788
-25026: DATA: 22050
-25027: DATA: 7096
-25028: DATA: 24420
-25029: DATA: 8364
-25030: DATA: 25628
-25031: DATA: 10633
-25032: DATA: 27956
-25033: DATA: 12004
-25034: DATA: 29266
-25035: DATA: 14274
-25036: DATA: 31665
-25037: DATA: 16137
-25038: DATA: 190
-25039: DATA: 17429
-25040: DATA: 2164
-25041: DATA: 19873
-25042: DATA: 4472
-25043: DATA: 21208
-25044: DATA: 5860
-25045: DATA: 23042
-25046: DATA: 8130
-25047: DATA: 25511
-25048: DATA: 10036
-25049: DATA: 26838
-25050: DATA: 11396
-25051: DATA: 28780
-25052: DATA: 13366
-25053: DATA: 31209
-25054: DATA: 15779
-25055: DATA: 309
-25056: DATA: 17717
-25057: DATA: 1761
-25058: DATA: 19184
-25059: DATA: 3689
-25060: DATA: 21036
-25061: DATA: 6120
-25062: DATA: 23504
-25063: DATA: 8018
-25064: DATA: 25457
-25065: DATA: 10028
-25066: DATA: 26839
-25067: DATA: 11397
-25068: DATA: 28848
-25069: DATA: 13341
-25070: DATA: 30844
-25071: DATA: 15380
-25072: DATA: 54
-25073: DATA: 17872
-25074: DATA: 2556
-25075: DATA: 19864
-25076: DATA: 4512
-25077: DATA: 21773
-25078: DATA: 6495
-25079: DATA: 23915
-25080: DATA: 8500
-25081: DATA: 25873
-25082: DATA: 10520
-25083: DATA: 27944
-25084: DATA: 12644
-25085: DATA: 29997
-25086: DATA: 14645
-25087: DATA: 32049
-25088: DATA: 16689
-25089: DATA: 1318
-25090: DATA: 18724
-25091: DATA: 3388
-25092: DATA: 20776
-25093: DATA: 5473
-25094: DATA: 22864
-25095: DATA: 7428
-25096: DATA: 24954
-25097: DATA: 9569
-25098: DATA: 26896
-25099: DATA: 11594
-25100: DATA: 29099
-25101: DATA: 13720
-25102: DATA: 31203
-25103: DATA: 15765
-25104: DATA: 48
-25105: DATA: 17434
-25106: DATA: 2151
-25107: DATA: 19539
-25108: DATA: 4324
-25109: DATA: 21644
-25110: DATA: 6339
-25111: DATA: 24421
-25112: DATA: 9059
-25113: DATA: 26432
-25114: DATA: 11216
-25115: DATA: 28641
-25116: DATA: 12833
-25117: DATA: 30332
-25118: DATA: 15014
-25119: DATA: 32496
-25120: DATA: 17780
-25121: DATA: 2420
-25122: DATA: 19952
-25123: DATA: 4591
-25124: DATA: 21547
-25125: DATA: 6242
-25126: DATA: 23709
-25127: DATA: 8325
-25128: DATA: 26489
-25129: DATA: 11172
-25130: DATA: 28610
-25131: DATA: 12806
-25132: DATA: 30369
-25133: DATA: 15065
-25134: DATA: 304
-25135: DATA: 17874
-25136: DATA: 2169
-25137: DATA: 19474
-25138: DATA: 4284
-25139: DATA: 22365
-25140: DATA: 7089
-25141: DATA: 24541
-25142: DATA: 8720
-25143: DATA: 26340
-25144: DATA: 11623
-25145: DATA: 29125
-25146: DATA: 13319
-25147: DATA: 30888
-25148: DATA: 16228
-25149: DATA: 945
-25150: DATA: 17973
-25151: DATA: 2740
-25152: DATA: 20770
-25153: DATA: 5552
-25154: DATA: 22640
-25155: DATA: 7356
-25156: DATA: 25444
-25157: DATA: 10175
-25158: DATA: 27167
-25159: DATA: 11914
-25160: DATA: 30073
-25161: DATA: 14757
-25162: DATA: 31837
-25163: DATA: 16588
-25164: DATA: 1974
-25165: DATA: 18966
-25166: DATA: 3829
-25167: DATA: 21841
-25168: DATA: 6260
-25169: DATA: 23762
-25170: DATA: 9019
-25171: DATA: 26522
-25172: DATA: 10984
-25173: DATA: 29005
-25174: DATA: 13777
-25175: DATA: 30891
-25176: DATA: 16240
-25177: DATA: 901
-25178: DATA: 18053
-25179: DATA: 3453
-25180: DATA: 20580
-25181: DATA: 5368
-25182: DATA: 23462
-25183: DATA: 7792
-25184: DATA: 25914
-25185: DATA: 10677
-25186: DATA: 27837
-25187: DATA: 13170
-25188: DATA: 30262
-25189: DATA: 15080
-25190: DATA: 464
-25191: DATA: 17476
-25192: DATA: 2919
-25193: DATA: 20069
-25194: DATA: 4807
-25195: DATA: 22920
-25196: DATA: 7396
-25197: DATA: 25425
-25198: DATA: 9845
-25199: DATA: 27924
-25200: DATA: 12322
-25201: DATA: 29904
-25202: DATA: 15280
-25203: DATA: 32412
-25204: DATA: 17892
-25205: DATA: 2143
-25206: DATA: 20319
-25207: DATA: 4714
-25208: DATA: 22905
-25209: DATA: 7237
-25210: DATA: 25373
-25211: DATA: 9772
-25212: DATA: 27958
-25213: DATA: 12342
-25214: DATA: 30517
-25215: DATA: 14897
-25216: DATA: 372
-25217: DATA: 17522
-25218: DATA: 2938
-25219: DATA: 20090
-25220: DATA: 5482
-25221: DATA: 22637
-25222: DATA: 8016
-25223: DATA: 25120
-25224: DATA: 10618
-25225: DATA: 27761
-25226: DATA: 13141
-25227: DATA: 30303
-25228: DATA: 15789
-25229: DATA: 147
-25230: DATA: 18423
-25231: DATA: 2709
-25232: DATA: 20518
-25233: DATA: 5914
-25234: DATA: 23167
-25235: DATA: 8528
-25236: DATA: 25783
-25237: DATA: 11213
-25238: DATA: 28359
-25239: DATA: 13356
-25240: DATA: 31584
-25241: DATA: 15949
-25242: DATA: 1488
-25243: DATA: 18657
-25244: DATA: 3621
-25245: DATA: 21871
-25246: DATA: 6327
-25247: DATA: 24560
-25248: DATA: 9510
-25249: DATA: 26677
-25250: DATA: 12222
-25251: DATA: 29416
-25252: DATA: 14377
-25253: DATA: 32623
-25254: DATA: 17045
-25255: DATA: 2519
-25256: DATA: 20327
-25257: DATA: 4837
-25258: DATA: 23000
-25259: DATA: 7948
-25260: DATA: 25271
-25261: DATA: 10653
-25262: DATA: 28529
-25263: DATA: 13013
-25264: DATA: 30771
-25265: DATA: 16199
-25266: DATA: 757
-25267: DATA: 18460
-25268: DATA: 4016
-25269: DATA: 21192
-25270: DATA: 6210
-25271: DATA: 24485
-25272: DATA: 9585
-25273: DATA: 26755
-25274: DATA: 11798
-25275: DATA: 30120
-25276: DATA: 15143
-25277: DATA: 32425
-25278: DATA: 17534
-25279: DATA: 3039
-25280: DATA: 20830
-25281: DATA: 5265
-25282: DATA: 23089
-25283: DATA: 8612
-25284: DATA: 26468
-25285: DATA: 10997
-25286: DATA: 28745
-25287: DATA: 14303
-25288: DATA: 32052
-25289: DATA: 16576
-25290: DATA: 1606
-25291: DATA: 19912
-25292: DATA: 5046
-25293: DATA: 22788
-25294: DATA: 7344
-25295: DATA: 25178
-25296: DATA: 10298
-25297: DATA: 28566
-25298: DATA: 13685
-25299: DATA: 30877
-25300: DATA: 16045
-25301: DATA: 1027
-25302: DATA: 19344
-25303: DATA: 4516
-25304: DATA: 22324
-25305: DATA: 6850
-25306: DATA: 24706
-25307: DATA: 9832
-25308: DATA: 27685
-25309: DATA: 13289
-25310: DATA: 31216
-25311: DATA: 16226
-25312: DATA: 1340
-25313: DATA: 18684
-25314: DATA: 3772
-25315: DATA: 21624
-25316: DATA: 6760
-25317: DATA: 25005
-25318: DATA: 10143
-25319: DATA: 27979
-25320: DATA: 13169
-25321: DATA: 31077
-25322: DATA: 15583
-25323: DATA: 651
-25324: DATA: 18660
-25325: DATA: 3657
-25326: DATA: 21624
-25327: DATA: 6672
-25328: DATA: 24692
-25329: DATA: 10198
-25330: DATA: 28130
-25331: DATA: 13208
-25332: DATA: 31155
-25333: DATA: 16192
-25334: DATA: 1365
-25335: DATA: 19304
-25336: DATA: 4470
-25337: DATA: 22272
-25338: DATA: 7426
-25339: DATA: 25406
-25340: DATA: 10596
-25341: DATA: 28469
-25342: DATA: 13617
-25343: DATA: 31526
-25344: DATA: 16756
-25345: DATA: 1825
-25346: DATA: 19768
-25347: DATA: 4920
-25348: DATA: 22884
-25349: DATA: 7998
-25350: DATA: 25873
-25351: DATA: 11016
-25352: DATA: 29041
-25353: DATA: 14117
-25354: DATA: 32067
-25355: DATA: 17241
-25356: DATA: 2475
-25357: DATA: 20367
-25358: DATA: 5609
-25359: DATA: 23439
-25360: DATA: 8308
-25361: DATA: 26113
-25362: DATA: 11384
-25363: DATA: 29276
-25364: DATA: 14512
-25365: DATA: 32461
-25366: DATA: 17604
-25367: DATA: 3373
-25368: DATA: 21361
-25369: DATA: 6405
-25370: DATA: 24468
-25371: DATA: 9698
-25372: DATA: 27179
-25373: DATA: 12399
-25374: DATA: 30448
-25375: DATA: 15603
-25376: DATA: 1336
-25377: DATA: 19316
-25378: DATA: 4515
-25379: DATA: 22517
-25380: DATA: 7201
-25381: DATA: 25214
-25382: DATA: 10448
-25383: DATA: 28370
-25384: DATA: 14204
-25385: DATA: 32172
-25386: DATA: 17348
-25387: DATA: 2056
-25388: DATA: 20200
-25389: DATA: 5277
-25390: DATA: 23908
-25391: DATA: 9117
-25392: DATA: 26673
-25393: DATA: 11797
-25394: DATA: 29944
-25395: DATA: 15634
-25396: DATA: 945
-25397: DATA: 18911
-25398: DATA: 3671
-25399: DATA: 21737
-25400: DATA: 7541
-25401: DATA: 25494
-25402: DATA: 10243
-25403: DATA: 28397
-25404: DATA: 14124
-25405: DATA: 32188
-25406: DATA: 16948
-25407: DATA: 2293
-25408: DATA: 20789
-25409: DATA: 6073
-25410: DATA: 23586
-25411: DATA: 8888
-25412: DATA: 27429
-25413: DATA: 12713
-25414: DATA: 30217
-25415: DATA: 15557
-25416: DATA: 1382
-25417: DATA: 19440
-25418: DATA: 4190
-25419: DATA: 22157
-25420: DATA: 8107
-25421: DATA: 25608
-25422: DATA: 10980
-25423: DATA: 29465
-25424: DATA: 14452
-25425: DATA: 32412
-25426: DATA: 18276
-25427: DATA: 3485
-25428: DATA: 21154
-25429: DATA: 6913
-25430: DATA: 25041
-25431: DATA: 9910
-25432: DATA: 28540
-25433: DATA: 13760
-25434: DATA: 31363
-25435: DATA: 17197
-25436: DATA: 2086
-25437: DATA: 20209
-25438: DATA: 6065
-25439: DATA: 23670
-25440: DATA: 9535
-25441: DATA: 27577
-25442: DATA: 12528
-25443: DATA: 31100
-25444: DATA: 15914
-25445: DATA: 1257
-25446: DATA: 19920
-25447: DATA: 4689
-25448: DATA: 23420
-25449: DATA: 8224
-25450: DATA: 26256
-25451: DATA: 12162
-25452: DATA: 29878
-25453: DATA: 15711
-25454: DATA: 560
-25455: DATA: 19216
-25456: DATA: 4130
-25457: DATA: 22228
-25458: DATA: 8160
-25459: DATA: 25746
-25460: DATA: 11702
-25461: DATA: 29260
-25462: DATA: 15172
-25463: DATA: 96
-25464: DATA: 18791
-25465: DATA: 3659
-25466: DATA: 22352
-25467: DATA: 7277
-25468: DATA: 25861
-25469: DATA: 10799
-25470: DATA: 29493
-25471: DATA: 14453
-25472: DATA: 291
-25473: DATA: 17968
-25474: DATA: 3952
-25475: DATA: 21545
-25476: DATA: 7467
-25477: DATA: 25122
-25478: DATA: 11088
-25479: DATA: 28694
-25480: DATA: 14712
-25481: DATA: 32362
-25482: DATA: 18247
-25483: DATA: 3090
-25484: DATA: 21988
-25485: DATA: 6877
-25486: DATA: 25543
-25487: DATA: 10448
-25488: DATA: 28788
-25489: DATA: 14614
-25490: DATA: 32369
-25491: DATA: 18259
-25492: DATA: 3299
-25493: DATA: 21913
-25494: DATA: 6800
-25495: DATA: 25142
-25496: DATA: 11121
-25497: DATA: 28736
-25498: DATA: 14749
-25499: DATA: 32429
-25500: DATA: 17968
-25501: DATA: 3954
-25502: DATA: 21744
-25503: DATA: 7667
-25504: DATA: 25917
-25505: DATA: 10875
-25506: DATA: 29620
-25507: DATA: 14525
-25508: DATA: 37
-25509: DATA: 18733
-25510: DATA: 3719
-25511: DATA: 22468
-25512: DATA: 8045
-25513: DATA: 25829
-25514: DATA: 11716
-25515: DATA: 29954
-25516: DATA: 15076
-25517: DATA: 976
-25518: DATA: 19313
-25519: DATA: 4254
-25520: DATA: 22577
-25521: DATA: 8469
-25522: DATA: 26340
-25523: DATA: 11797
-25524: DATA: 30625
-25525: DATA: 15501
-25526: DATA: 1119
-25527: DATA: 19959
-25528: DATA: 5494
-25529: DATA: 23234
-25530: DATA: 8707
-25531: DATA: 27629
-25532: DATA: 13107
-25533: DATA: 30904
-25534: DATA: 16441
-25535: DATA: 2482
-25536: DATA: 20796
-25537: DATA: 5793
-25538: DATA: 24176
-25539: DATA: 10160
-25540: DATA: 28453
-25541: DATA: 13497
-25542: DATA: 31763
-25543: DATA: 17805
-25544: DATA: 3380
-25545: DATA: 21234
-25546: DATA: 6744
-25547: DATA: 25548
-25548: DATA: 11184
-25549: DATA: 29533
-25550: DATA: 14564
-25551: DATA: 93
-25552: DATA: 18481
-25553: DATA: 4565
-25554: DATA: 22900
-25555: DATA: 7890
-25556: DATA: 26283
-25557: DATA: 11807
-25558: DATA: 30608
-25559: DATA: 16306
-25560: DATA: 1909
-25561: DATA: 19659
-25562: DATA: 5252
-25563: DATA: 23678
-25564: DATA: 9316
-25565: DATA: 28159
-25566: DATA: 13749
-25567: DATA: 32115
-25568: DATA: 17723
-25569: DATA: 2791
-25570: DATA: 21173
-25571: DATA: 6717
-25572: DATA: 25136
-25573: DATA: 11237
-25574: DATA: 29589
-25575: DATA: 15109
-25576: DATA: 892
-25577: DATA: 19242
-25578: DATA: 4293
-25579: DATA: 22687
-25580: DATA: 8355
-25581: DATA: 26705
-25582: DATA: 12401
-25583: DATA: 30726
-25584: DATA: 16423
-25585: DATA: 2453
-25586: DATA: 20962
-25587: DATA: 6536
-25588: DATA: 25002
-25589: DATA: 10590
-25590: DATA: 28944
-25591: DATA: 14698
-25592: DATA: 353
-25593: DATA: 18705
-25594: DATA: 4446
-25595: DATA: 22893
-25596: DATA: 8548
-25597: DATA: 26900
-25598: DATA: 12598
-25599: DATA: 31093
-25600: DATA: 16699
-25601: DATA: 2363
-25602: DATA: 20796
-25603: DATA: 6436
-25604: DATA: 24932
-25605: DATA: 10554
-25606: DATA: 28949
-25607: DATA: 14661
-25608: DATA: 375
-25609: DATA: 18794
-25610: DATA: 4421
-25611: DATA: 22849
-25612: DATA: 8608
-25613: DATA: 27101
-25614: DATA: 12790
-25615: DATA: 31196
-25616: DATA: 16442
-25617: DATA: 2065
-25618: DATA: 20528
-25619: DATA: 6236
-25620: DATA: 24804
-25621: DATA: 10398
-25622: DATA: 28888
-25623: DATA: 15146
-25624: DATA: 870
-25625: DATA: 19281
-25626: DATA: 5013
-25627: DATA: 23551
-25628: DATA: 8804
-25629: DATA: 27247
-25630: DATA: 12991
-25631: DATA: 31456
-25632: DATA: 17696
-25633: DATA: 3440
-25634: DATA: 22000
-25635: DATA: 7657
-25636: DATA: 25644
-25637: DATA: 11391
-25638: DATA: 29855
-25639: DATA: 15568
-25640: DATA: 1907
-25641: DATA: 20397
-25642: DATA: 6032
-25643: DATA: 24089
-25644: DATA: 9900
-25645: DATA: 28376
-25646: DATA: 14640
-25647: DATA: 391
-25648: DATA: 18491
-25649: DATA: 4186
-25650: DATA: 22781
-25651: DATA: 8974
-25652: DATA: 27626
-25653: DATA: 13187
-25654: DATA: 31262
-25655: DATA: 17039
-25656: DATA: 3358
-25657: DATA: 21921
-25658: DATA: 7185
-25659: DATA: 25780
-25660: DATA: 12132
-25661: DATA: 30700
-25662: DATA: 15972
-25663: DATA: 1761
-25664: DATA: 20846
-25665: DATA: 6645
-25666: DATA: 24583
-25667: DATA: 10424
-25668: DATA: 29540
-25669: DATA: 15276
-25670: DATA: 514
-25671: DATA: 19072
-25672: DATA: 5428
-25673: DATA: 24036
-25674: DATA: 9298
-25675: DATA: 27852
-25676: DATA: 14250
-25677: DATA: 32281
-25678: DATA: 18175
-25679: DATA: 4443
-25680: DATA: 22589
-25681: DATA: 8347
-25682: DATA: 27511
-25683: DATA: 13213
-25684: DATA: 31408
-25685: DATA: 17669
-25686: DATA: 3541
-25687: DATA: 21733
-25688: DATA: 8057
-25689: DATA: 26572
-25690: DATA: 11907
-25691: DATA: 31102
-25692: DATA: 16429
-25693: DATA: 2290
-25694: DATA: 21438
-25695: DATA: 6715
-25696: DATA: 25972
-25697: DATA: 11701
-25698: DATA: 29854
-25699: DATA: 16242
-25700: DATA: 1578
-25701: DATA: 20200
-25702: DATA: 6608
-25703: DATA: 24650
-25704: DATA: 11122
-25705: DATA: 29285
-25706: DATA: 15045
-25707: DATA: 1438
-25708: DATA: 19684
-25709: DATA: 5982
-25710: DATA: 24177
-25711: DATA: 10523
-25712: DATA: 28788
-25713: DATA: 14530
-25714: DATA: 1023
-25715: DATA: 19087
-25716: DATA: 5551
-25717: DATA: 23565
-25718: DATA: 10079
-25719: DATA: 28272
-25720: DATA: 14688
-25721: DATA: 69
-25722: DATA: 19204
-25723: DATA: 4645
-25724: DATA: 23841
-25725: DATA: 9341
-25726: DATA: 28451
-25727: DATA: 13882
-25728: DATA: 312
-25729: DATA: 18464
-25730: DATA: 4900
-25731: DATA: 23092
-25732: DATA: 9515
-25733: DATA: 27683
-25734: DATA: 14160
-25735: DATA: 32273
-25736: DATA: 18811
-25737: DATA: 4133
-25738: DATA: 23364
-25739: DATA: 8773
-25740: DATA: 28065
-25741: DATA: 13533
-25742: DATA: 32736
-25743: DATA: 18112
-25744: DATA: 4142
-25745: DATA: 23311
-25746: DATA: 8828
-25747: DATA: 27992
-25748: DATA: 13546
-25749: DATA: 32717
-25750: DATA: 18064
-25751: DATA: 4108
-25752: DATA: 23348
-25753: DATA: 8786
-25754: DATA: 28057
-25755: DATA: 13537
-25756: DATA: 32296
-25757: DATA: 18749
-25758: DATA: 4284
-25759: DATA: 23536
-25760: DATA: 9525
-25761: DATA: 27747
-25762: DATA: 14261
-25763: DATA: 32445
-25764: DATA: 18480
-25765: DATA: 4965
-25766: DATA: 23193
-25767: DATA: 9686
-25768: DATA: 28468
-25769: DATA: 13999
-25770: DATA: 479
-25771: DATA: 19224
-25772: DATA: 4790
-25773: DATA: 24019
-25774: DATA: 10097
-25775: DATA: 28313
-25776: DATA: 14452
-25777: DATA: 861
-25778: DATA: 19189
-25779: DATA: 5135
-25780: DATA: 24481
-25781: DATA: 9869
-25782: DATA: 28740
-25783: DATA: 15338
-25784: DATA: 1332
-25785: DATA: 19597
-25786: DATA: 5653
-25787: DATA: 24993
-25788: DATA: 11060
-25789: DATA: 29437
-25790: DATA: 15414
-25791: DATA: 1952
-25792: DATA: 20768
-25793: DATA: 6304
-25794: DATA: 25122
-25795: DATA: 11704
-25796: DATA: 30564
-25797: DATA: 16044
-25798: DATA: 2068
-25799: DATA: 21395
-25800: DATA: 7537
-25801: DATA: 25835
-25802: DATA: 11844
-25803: DATA: 31192
-25804: DATA: 17334
-25805: DATA: 3352
-25806: DATA: 21730
-25807: DATA: 7750
-25808: DATA: 26744
-25809: DATA: 13269
-25810: DATA: 32100
-25811: DATA: 17621
-25812: DATA: 3755
-25813: DATA: 22552
-25814: DATA: 9175
-25815: DATA: 28077
-25816: DATA: 14132
-25817: DATA: 32492
-25818: DATA: 18640
-25819: DATA: 4716
-25820: DATA: 23593
-25821: DATA: 10173
-25822: DATA: 29118
-25823: DATA: 15226
-25824: DATA: 1312
-25825: DATA: 19637
-25826: DATA: 5795
-25827: DATA: 24680
-25828: DATA: 10806
-25829: DATA: 30184
-25830: DATA: 16336
-25831: DATA: 2386
-25832: DATA: 21372
-25833: DATA: 7460
-25834: DATA: 25796
-25835: DATA: 11981
-25836: DATA: 30892
-25837: DATA: 16984
-25838: DATA: 3196
-25839: DATA: 22021
-25840: DATA: 8308
-25841: DATA: 27612
-25842: DATA: 13796
-25843: DATA: 32733
-25844: DATA: 18867
-25845: DATA: 4932
-25846: DATA: 23900
-25847: DATA: 10089
-25848: DATA: 28980
-25849: DATA: 15106
-25850: DATA: 1305
-25851: DATA: 20283
-25852: DATA: 6433
-25853: DATA: 25459
-25854: DATA: 11632
-25855: DATA: 30581
-25856: DATA: 16659
-25857: DATA: 2874
-25858: DATA: 21823
-25859: DATA: 7993
-25860: DATA: 26980
-25861: DATA: 13089
-25862: DATA: 32005
-25863: DATA: 18182
-25864: DATA: 4479
-25865: DATA: 23332
-25866: DATA: 9476
-25867: DATA: 28492
-25868: DATA: 14758
-25869: DATA: 926
-25870: DATA: 19956
-25871: DATA: 6096
-25872: DATA: 24626
-25873: DATA: 10770
-25874: DATA: 29816
-25875: DATA: 15956
-25876: DATA: 2222
-25877: DATA: 21126
-25878: DATA: 7388
-25879: DATA: 26920
-25880: DATA: 13178
-25881: DATA: 32074
-25882: DATA: 18304
-25883: DATA: 4604
-25884: DATA: 23094
-25885: DATA: 9326
-25886: DATA: 28324
-25887: DATA: 14560
-25888: DATA: 1314
-25889: DATA: 20322
-25890: DATA: 6568
-25891: DATA: 25572
-25892: DATA: 11326
-25893: DATA: 30284
-25894: DATA: 16562
-25895: DATA: 2790
-25896: DATA: 22352
-25897: DATA: 8576
-25898: DATA: 27638
-25899: DATA: 13354
-25900: DATA: 32396
-25901: DATA: 18676
-25902: DATA: 5466
-25903: DATA: 24510
-25904: DATA: 10264
-25905: DATA: 29304
-25906: DATA: 15582
-25907: DATA: 2354
-25908: DATA: 21396
-25909: DATA: 7676
-25910: DATA: 26210
-25911: DATA: 12502
-25912: DATA: 32064
-25913: DATA: 18352
-25914: DATA: 4134
-25915: DATA: 23194
-25916: DATA: 10012
-25917: DATA: 29060
-25918: DATA: 14858
-25919: DATA: 1218
-25920: DATA: 20784
-25921: DATA: 7095
-25922: DATA: 25633
-25923: DATA: 11949
-25924: DATA: 31539
-25925: DATA: 17848
-25926: DATA: 3609
-25927: DATA: 22666
-25928: DATA: 9592
-25929: DATA: 28669
-25930: DATA: 14406
-25931: DATA: 661
-25932: DATA: 20371
-25933: DATA: 6185
-25934: DATA: 25289
-25935: DATA: 12128
-25936: DATA: 30749
-25937: DATA: 17082
-25938: DATA: 3921
-25939: DATA: 23029
-25940: DATA: 8860
-25941: DATA: 28475
-25942: DATA: 14845
-25943: DATA: 711
-25944: DATA: 20339
-25945: DATA: 6602
-25946: DATA: 25332
-25947: DATA: 12129
-25948: DATA: 30763
-25949: DATA: 17138
-25950: DATA: 4027
-25951: DATA: 22545
-25952: DATA: 9532
-25953: DATA: 28656
-25954: DATA: 14524
-25955: DATA: 1389
-25956: DATA: 20039
-25957: DATA: 6372
-25958: DATA: 26014
-25959: DATA: 11859
-25960: DATA: 31504
-25961: DATA: 17457
-25962: DATA: 3793
-25963: DATA: 23430
-25964: DATA: 9377
-25965: DATA: 28985
-25966: DATA: 14964
-25967: DATA: 1799
-25968: DATA: 20539
-25969: DATA: 6853
-25970: DATA: 26515
-25971: DATA: 12424
-25972: DATA: 32183
-25973: DATA: 17992
-25974: DATA: 4880
-25975: DATA: 23557
-25976: DATA: 10516
-25977: DATA: 29285
-25978: DATA: 16240
-25979: DATA: 2125
-25980: DATA: 21828
-25981: DATA: 7773
-25982: DATA: 27472
-25983: DATA: 13397
-25984: DATA: 340
-25985: DATA: 19029
-25986: DATA: 5968
-25987: DATA: 24669
-25988: DATA: 11588
-25989: DATA: 30285
-25990: DATA: 17264
-25991: DATA: 3173
-25992: DATA: 22804
-25993: DATA: 8709
-25994: DATA: 28464
-25995: DATA: 14381
-25996: DATA: 1476
-25997: DATA: 20221
-25998: DATA: 7056
-25999: DATA: 25781
-26000: DATA: 12372
-26001: DATA: 32117
-26002: DATA: 17936
-26003: DATA: 4925
-26004: DATA: 23748
-26005: DATA: 10733
-26006: DATA: 29360
-26007: DATA: 15936
-26008: DATA: 2931
-26009: DATA: 21591
-26010: DATA: 8597
-26011: DATA: 27368
-26012: DATA: 13866
-26013: DATA: 798
-26014: DATA: 19618
-26015: DATA: 6640
-26016: DATA: 25904
-26017: DATA: 11795
-26018: DATA: 31657
-26019: DATA: 17656
-26020: DATA: 4136
-26021: DATA: 23905
-26022: DATA: 9887
-26023: DATA: 29650
-26024: DATA: 16171
-26025: DATA: 2180
-26026: DATA: 21955
-26027: DATA: 8525
-26028: DATA: 27325
-26029: DATA: 14290
-26030: DATA: 869
-26031: DATA: 19669
-26032: DATA: 6193
-26033: DATA: 25947
-26034: DATA: 12004
-26035: DATA: 31256
-26036: DATA: 18358
-26037: DATA: 4237
-26038: DATA: 23620
-26039: DATA: 10733
-26040: DATA: 30065
-26041: DATA: 16069
-26042: DATA: 2562
-26043: DATA: 22434
-26044: DATA: 9003
-26045: DATA: 27824
-26046: DATA: 14460
-26047: DATA: 1525
-26048: DATA: 20768
-26049: DATA: 6845
-26050: DATA: 26165
-26051: DATA: 13309
-26052: DATA: 32567
-26053: DATA: 18612
-26054: DATA: 5149
-26055: DATA: 24967
-26056: DATA: 11643
-26057: DATA: 30441
-26058: DATA: 16912
-26059: DATA: 4034
-26060: DATA: 23466
-26061: DATA: 10077
-26062: DATA: 28900
-26063: DATA: 15453
-26064: DATA: 2097
-26065: DATA: 21973
-26066: DATA: 8566
-26067: DATA: 27345
-26068: DATA: 13995
-26069: DATA: 514
-26070: DATA: 20418
-26071: DATA: 7141
-26072: DATA: 26486
-26073: DATA: 12503
-26074: DATA: 31897
-26075: DATA: 18536
-26076: DATA: 5154
-26077: DATA: 25073
-26078: DATA: 11689
-26079: DATA: 31029
-26080: DATA: 17714
-26081: DATA: 3833
-26082: DATA: 23217
-26083: DATA: 9838
-26084: DATA: 29228
-26085: DATA: 16360
-26086: DATA: 2947
-26087: DATA: 22277
-26088: DATA: 9013
-26089: DATA: 28523
-26090: DATA: 14480
-26091: DATA: 1229
-26092: DATA: 20624
-26093: DATA: 7253
-26094: DATA: 26741
-26095: DATA: 13397
-26096: DATA: 59
-26097: DATA: 19911
-26098: DATA: 6642
-26099: DATA: 26077
-26100: DATA: 12710
-26101: DATA: 32072
-26102: DATA: 18775
-26103: DATA: 5484
-26104: DATA: 24954
-26105: DATA: 11542
-26106: DATA: 31056
-26107: DATA: 17726
-26108: DATA: 4401
-26109: DATA: 23871
-26110: DATA: 10532
-26111: DATA: 30009
-26112: DATA: 16685
-26113: DATA: 3445
-26114: DATA: 22839
-26115: DATA: 9521
-26116: DATA: 28971
-26117: DATA: 15674
-26118: DATA: 2329
-26119: DATA: 21771
-26120: DATA: 8563
-26121: DATA: 27941
-26122: DATA: 14623
-26123: DATA: 1388
-26124: DATA: 20919
-26125: DATA: 7645
-26126: DATA: 27113
-26127: DATA: 13786
-26128: DATA: 33
-26129: DATA: 19541
-26130: DATA: 6261
-26131: DATA: 25683
-26132: DATA: 12464
-26133: DATA: 31880
-26134: DATA: 18626
-26135: DATA: 5989
-26136: DATA: 25440
-26137: DATA: 12109
-26138: DATA: 31637
-26139: DATA: 18349
-26140: DATA: 4662
-26141: DATA: 24178
-26142: DATA: 10943
-26143: DATA: 30456
-26144: DATA: 17784
-26145: DATA: 4405
-26146: DATA: 23972
-26147: DATA: 10741
-26148: DATA: 29729
-26149: DATA: 16429
-26150: DATA: 3231
-26151: DATA: 22743
-26152: DATA: 10102
-26153: DATA: 29669
-26154: DATA: 16338
-26155: DATA: 2591
-26156: DATA: 22189
-26157: DATA: 8920
-26158: DATA: 29046
-26159: DATA: 15769
-26160: DATA: 2093
-26161: DATA: 21525
-26162: DATA: 8438
-26163: DATA: 28433
-26164: DATA: 15269
-26165: DATA: 2014
-26166: DATA: 21080
-26167: DATA: 7904
-26168: DATA: 28007
-26169: DATA: 14789
-26170: DATA: 1072
-26171: DATA: 20707
-26172: DATA: 8036
-26173: DATA: 27645
-26174: DATA: 13828
-26175: DATA: 701
-26176: DATA: 20785
-26177: DATA: 7669
-26178: DATA: 26686
-26179: DATA: 13480
-26180: DATA: 809
-26181: DATA: 20399
-26182: DATA: 6677
-26183: DATA: 26263
-26184: DATA: 13620
-26185: DATA: 490
-26186: DATA: 19550
-26187: DATA: 6285
-26188: DATA: 26544
-26189: DATA: 12821
-26190: DATA: 32501
-26191: DATA: 19733
-26192: DATA: 6194
-26193: DATA: 25753
-26194: DATA: 13183
-26195: DATA: 32722
-26196: DATA: 19126
-26197: DATA: 6477
-26198: DATA: 26054
-26199: DATA: 12460
-26200: DATA: 32630
-26201: DATA: 19415
-26202: DATA: 5777
-26203: DATA: 25977
-26204: DATA: 12321
-26205: DATA: 31982
-26206: DATA: 19440
-26207: DATA: 5734
-26208: DATA: 25888
-26209: DATA: 12775
-26210: DATA: 31921
-26211: DATA: 19315
-26212: DATA: 5667
-26213: DATA: 25320
-26214: DATA: 12700
-26215: DATA: 31836
-26216: DATA: 19252
-26217: DATA: 5671
-26218: DATA: 25301
-26219: DATA: 12675
-26220: DATA: 31905
-26221: DATA: 19292
-26222: DATA: 5732
-26223: DATA: 25885
-26224: DATA: 12404
-26225: DATA: 31948
-26226: DATA: 19455
-26227: DATA: 5768
-26228: DATA: 26038
-26229: DATA: 12301
-26230: DATA: 32598
-26231: DATA: 19040
-26232: DATA: 6513
-26233: DATA: 25617
-26234: DATA: 13150
-26235: DATA: 32338
-26236: DATA: 19812
-26237: DATA: 6269
-26238: DATA: 26372
-26239: DATA: 12861
-26240: DATA: 305
-26241: DATA: 19573
-26242: DATA: 6975
-26243: DATA: 26159
-26244: DATA: 13606
-26245: DATA: 109
-26246: DATA: 20227
-26247: DATA: 6656
-26248: DATA: 26993
-26249: DATA: 13416
-26250: DATA: 835
-26251: DATA: 19981
-26252: DATA: 7600
-26253: DATA: 26770
-26254: DATA: 14256
-26255: DATA: 722
-26256: DATA: 20529
-26257: DATA: 7937
-26258: DATA: 27184
-26259: DATA: 14677
-26260: DATA: 1185
-26261: DATA: 21388
-26262: DATA: 7878
-26263: DATA: 27692
-26264: DATA: 15217
-26265: DATA: 1623
-26266: DATA: 21982
-26267: DATA: 8338
-26268: DATA: 28260
-26269: DATA: 15677
-26270: DATA: 2180
-26271: DATA: 22525
-26272: DATA: 9521
-26273: DATA: 28725
-26274: DATA: 16319
-26275: DATA: 2799
-26276: DATA: 22566
-26277: DATA: 10029
-26278: DATA: 29315
-26279: DATA: 16832
-26280: DATA: 3953
-26281: DATA: 23208
-26282: DATA: 10691
-26283: DATA: 30541
-26284: DATA: 17072
-26285: DATA: 4562
-26286: DATA: 24368
-26287: DATA: 10898
-26288: DATA: 30769
-26289: DATA: 18241
-26290: DATA: 4784
-26291: DATA: 24593
-26292: DATA: 12205
-26293: DATA: 31434
-26294: DATA: 18520
-26295: DATA: 6129
-26296: DATA: 25969
-26297: DATA: 12439
-26298: DATA: 32350
-26299: DATA: 19928
-26300: DATA: 7012
-26301: DATA: 26365
-26302: DATA: 13316
-26303: DATA: 957
-26304: DATA: 20785
-26305: DATA: 7413
-26306: DATA: 27199
-26307: DATA: 14767
-26308: DATA: 1830
-26309: DATA: 21229
-26310: DATA: 8195
-26311: DATA: 28557
-26312: DATA: 15733
-26313: DATA: 2289
-26314: DATA: 22084
-26315: DATA: 9672
-26316: DATA: 29622
-26317: DATA: 16654
-26318: DATA: 3249
-26319: DATA: 23103
-26320: DATA: 10334
-26321: DATA: 30677
-26322: DATA: 17745
-26323: DATA: 4302
-26324: DATA: 24292
-26325: DATA: 11284
-26326: DATA: 31711
-26327: DATA: 18864
-26328: DATA: 5940
-26329: DATA: 25284
-26330: DATA: 12416
-26331: DATA: 32381
-26332: DATA: 19510
-26333: DATA: 7154
-26334: DATA: 27057
-26335: DATA: 14198
-26336: DATA: 1340
-26337: DATA: 20661
-26338: DATA: 7844
-26339: DATA: 27765
-26340: DATA: 14881
-26341: DATA: 2477
-26342: DATA: 22406
-26343: DATA: 9540
-26344: DATA: 29537
-26345: DATA: 16681
-26346: DATA: 3268
-26347: DATA: 23245
-26348: DATA: 10400
-26349: DATA: 30290
-26350: DATA: 17535
-26351: DATA: 4615
-26352: DATA: 24696
-26353: DATA: 12181
-26354: DATA: 32187
-26355: DATA: 19337
-26356: DATA: 6572
-26357: DATA: 26440
-26358: DATA: 13584
-26359: DATA: 875
-26360: DATA: 20833
-26361: DATA: 7944
-26362: DATA: 27922
-26363: DATA: 15144
-26364: DATA: 2358
-26365: DATA: 22397
-26366: DATA: 9535
-26367: DATA: 29499
-26368: DATA: 16756
-26369: DATA: 3873
-26370: DATA: 23864
-26371: DATA: 11064
-26372: DATA: 31076
-26373: DATA: 18235
-26374: DATA: 5393
-26375: DATA: 25360
-26376: DATA: 12664
-26377: DATA: 32625
-26378: DATA: 19728
-26379: DATA: 6985
-26380: DATA: 27051
-26381: DATA: 14226
-26382: DATA: 1506
-26383: DATA: 21397
-26384: DATA: 8242
-26385: DATA: 28185
-26386: DATA: 15473
-26387: DATA: 2638
-26388: DATA: 22700
-26389: DATA: 9864
-26390: DATA: 29891
-26391: DATA: 17765
-26392: DATA: 4982
-26393: DATA: 24905
-26394: DATA: 12177
-26395: DATA: 32238
-26396: DATA: 18991
-26397: DATA: 6195
-26398: DATA: 26361
-26399: DATA: 13493
-26400: DATA: 1396
-26401: DATA: 21313
-26402: DATA: 8632
-26403: DATA: 28664
-26404: DATA: 15460
-26405: DATA: 2658
-26406: DATA: 22658
-26407: DATA: 9927
-26408: DATA: 30516
-26409: DATA: 17824
-26410: DATA: 5062
-26411: DATA: 24588
-26412: DATA: 11956
-26413: DATA: 31954
-26414: DATA: 19810
-26415: DATA: 7060
-26416: DATA: 26656
-26417: DATA: 13904
-26418: DATA: 1251
-26419: DATA: 21853
-26420: DATA: 9131
-26421: DATA: 29144
-26422: DATA: 15940
-26423: DATA: 3237
-26424: DATA: 23931
-26425: DATA: 11139
-26426: DATA: 30800
-26427: DATA: 18100
-26428: DATA: 5931
-26429: DATA: 26024
-26430: DATA: 12834
-26431: DATA: 245
-26432: DATA: 20796
-26433: DATA: 8116
-26434: DATA: 27710
-26435: DATA: 15033
-26436: DATA: 2871
-26437: DATA: 23011
-26438: DATA: 9850
-26439: DATA: 29935
-26440: DATA: 17727
-26441: DATA: 5105
-26442: DATA: 24664
-26443: DATA: 11976
-26444: DATA: 32740
-26445: DATA: 19475
-26446: DATA: 6885
-26447: DATA: 27480
-26448: DATA: 14390
-26449: DATA: 1680
-26450: DATA: 22370
-26451: DATA: 9629
-26452: DATA: 29355
-26453: DATA: 17155
-26454: DATA: 4496
-26455: DATA: 24241
-26456: DATA: 12156
-26457: DATA: 32192
-26458: DATA: 19152
-26459: DATA: 7035
-26460: DATA: 26661
-26461: DATA: 14056
-26462: DATA: 1980
-26463: DATA: 21601
-26464: DATA: 9588
-26465: DATA: 29681
-26466: DATA: 16575
-26467: DATA: 4466
-26468: DATA: 24118
-26469: DATA: 11437
-26470: DATA: 32150
-26471: DATA: 19017
-26472: DATA: 7029
-26473: DATA: 26678
-26474: DATA: 14040
-26475: DATA: 1928
-26476: DATA: 21687
-26477: DATA: 9501
-26478: DATA: 29287
-26479: DATA: 17181
-26480: DATA: 4157
-26481: DATA: 24257
-26482: DATA: 12277
-26483: DATA: 31964
-26484: DATA: 19879
-26485: DATA: 6669
-26486: DATA: 27408
-26487: DATA: 14417
-26488: DATA: 2428
-26489: DATA: 22016
-26490: DATA: 10064
-26491: DATA: 29733
-26492: DATA: 17707
-26493: DATA: 4648
-26494: DATA: 25378
-26495: DATA: 12338
-26496: DATA: 312
-26497: DATA: 20020
-26498: DATA: 7971
-26499: DATA: 27694
-26500: DATA: 15716
-26501: DATA: 2597
-26502: DATA: 23313
-26503: DATA: 10262
-26504: DATA: 31028
-26505: DATA: 18020
-26506: DATA: 5980
-26507: DATA: 25695
-26508: DATA: 13729
-26509: DATA: 668
-26510: DATA: 21492
-26511: DATA: 8396
-26512: DATA: 28788
-26513: DATA: 16647
-26514: DATA: 3685
-26515: DATA: 24403
-26516: DATA: 11492
-26517: DATA: 32130
-26518: DATA: 19141
-26519: DATA: 6705
-26520: DATA: 27450
-26521: DATA: 14341
-26522: DATA: 2512
-26523: DATA: 22212
-26524: DATA: 9776
-26525: DATA: 30525
-26526: DATA: 17590
-26527: DATA: 5625
-26528: DATA: 25909
-26529: DATA: 12902
-26530: DATA: 952
-26531: DATA: 20728
-26532: DATA: 8247
-26533: DATA: 28973
-26534: DATA: 16018
-26535: DATA: 4041
-26536: DATA: 24437
-26537: DATA: 11430
-26538: DATA: 32219
-26539: DATA: 19789
-26540: DATA: 6821
-26541: DATA: 27603
-26542: DATA: 15220
-26543: DATA: 2261
-26544: DATA: 22578
-26545: DATA: 10585
-26546: DATA: 30457
-26547: DATA: 17933
-26548: DATA: 6071
-26549: DATA: 25741
-26550: DATA: 13407
-26551: DATA: 1523
-26552: DATA: 21873
-26553: DATA: 8855
-26554: DATA: 29276
-26555: DATA: 17389
-26556: DATA: 4918
-26557: DATA: 24760
-26558: DATA: 12323
-26559: DATA: 417
-26560: DATA: 20789
-26561: DATA: 7847
-26562: DATA: 28196
-26563: DATA: 16308
-26564: DATA: 3882
-26565: DATA: 23722
-26566: DATA: 11344
-26567: DATA: 32145
-26568: DATA: 19836
-26569: DATA: 6880
-26570: DATA: 27152
-26571: DATA: 15307
-26572: DATA: 2984
-26573: DATA: 23314
-26574: DATA: 10471
-26575: DATA: 30741
-26576: DATA: 18491
-26577: DATA: 6547
-26578: DATA: 26928
-26579: DATA: 14030
-26580: DATA: 1701
-26581: DATA: 22019
-26582: DATA: 10196
-26583: DATA: 30699
-26584: DATA: 18320
-26585: DATA: 5253
-26586: DATA: 25808
-26587: DATA: 13401
-26588: DATA: 1068
-26589: DATA: 22008
-26590: DATA: 9712
-26591: DATA: 30077
-26592: DATA: 17723
-26593: DATA: 4832
-26594: DATA: 25250
-26595: DATA: 12922
-26596: DATA: 552
-26597: DATA: 21484
-26598: DATA: 9091
-26599: DATA: 29526
-26600: DATA: 17204
-26601: DATA: 4908
-26602: DATA: 24771
-26603: DATA: 12493
-26604: DATA: 183
-26605: DATA: 20553
-26606: DATA: 8313
-26607: DATA: 28697
-26608: DATA: 16440
-26609: DATA: 4501
-26610: DATA: 25058
-26611: DATA: 12680
-26612: DATA: 426
-26613: DATA: 20803
-26614: DATA: 8537
-26615: DATA: 29035
-26616: DATA: 16755
-26617: DATA: 4420
-26618: DATA: 24912
-26619: DATA: 12653
-26620: DATA: 269
-26621: DATA: 20777
-26622: DATA: 8560
-26623: DATA: 28979
-26624: DATA: 16696
-26625: DATA: 4404
-26626: DATA: 24867
-26627: DATA: 12597
-26628: DATA: 289
-26629: DATA: 20798
-26630: DATA: 8528
-26631: DATA: 28946
-26632: DATA: 16764
-26633: DATA: 4460
-26634: DATA: 24900
-26635: DATA: 12616
-26636: DATA: 485
-26637: DATA: 20957
-26638: DATA: 8624
-26639: DATA: 29164
-26640: DATA: 16443
-26641: DATA: 4096
-26642: DATA: 24624
-26643: DATA: 12373
-26644: DATA: 161
-26645: DATA: 20620
-26646: DATA: 8386
-26647: DATA: 29541
-26648: DATA: 17269
-26649: DATA: 4869
-26650: DATA: 25491
-26651: DATA: 13281
-26652: DATA: 557
-26653: DATA: 21118
-26654: DATA: 8891
-26655: DATA: 29365
-26656: DATA: 17714
-26657: DATA: 5479
-26658: DATA: 26047
-26659: DATA: 13808
-26660: DATA: 1124
-26661: DATA: 21625
-26662: DATA: 9368
-26663: DATA: 29888
-26664: DATA: 18228
-26665: DATA: 6067
-26666: DATA: 26577
-26667: DATA: 13848
-26668: DATA: 1704
-26669: DATA: 22217
-26670: DATA: 10544
-26671: DATA: 31121
-26672: DATA: 18491
-26673: DATA: 6234
-26674: DATA: 26850
-26675: DATA: 15187
-26676: DATA: 3044
-26677: DATA: 23437
-26678: DATA: 10852
-26679: DATA: 31469
-26680: DATA: 19825
-26681: DATA: 7621
-26682: DATA: 27679
-26683: DATA: 15551
-26684: DATA: 3878
-26685: DATA: 24573
-26686: DATA: 11829
-26687: DATA: 32419
-26688: DATA: 20789
-26689: DATA: 8613
-26690: DATA: 28735
-26691: DATA: 16559
-26692: DATA: 4901
-26693: DATA: 25529
-26694: DATA: 12821
-26695: DATA: 662
-26696: DATA: 21812
-26697: DATA: 9706
-26698: DATA: 29765
-26699: DATA: 17625
-26700: DATA: 6116
-26701: DATA: 26130
-26702: DATA: 14070
-26703: DATA: 2325
-26704: DATA: 22588
-26705: DATA: 10394
-26706: DATA: 31589
-26707: DATA: 19407
-26708: DATA: 6884
-26709: DATA: 27909
-26710: DATA: 15825
-26711: DATA: 3243
-26712: DATA: 24432
-26713: DATA: 12246
-26714: DATA: 32478
-26715: DATA: 20743
-26716: DATA: 8270
-26717: DATA: 28826
-26718: DATA: 17297
-26719: DATA: 4710
-26720: DATA: 25972
-26721: DATA: 13804
-26722: DATA: 1215
-26723: DATA: 22376
-26724: DATA: 9828
-26725: DATA: 30344
-26726: DATA: 18844
-26727: DATA: 6208
-26728: DATA: 27509
-26729: DATA: 14899
-26730: DATA: 2773
-26731: DATA: 24040
-26732: DATA: 11425
-26733: DATA: 32595
-26734: DATA: 20068
-26735: DATA: 8464
-26736: DATA: 28710
-26737: DATA: 16611
-26738: DATA: 5040
-26739: DATA: 25225
-26740: DATA: 13740
-26741: DATA: 1096
-26742: DATA: 22288
-26743: DATA: 9847
-26744: DATA: 31099
-26745: DATA: 18442
-26746: DATA: 6941
-26747: DATA: 27233
-26748: DATA: 15716
-26749: DATA: 3113
-26750: DATA: 24376
-26751: DATA: 11824
-26752: DATA: 372
-26753: DATA: 20538
-26754: DATA: 8994
-26755: DATA: 29247
-26756: DATA: 17764
-26757: DATA: 5160
-26758: DATA: 26374
-26759: DATA: 13828
-26760: DATA: 2404
-26761: DATA: 22634
-26762: DATA: 11074
-26763: DATA: 31308
-26764: DATA: 19888
-26765: DATA: 7320
-26766: DATA: 28643
-26767: DATA: 16021
-26768: DATA: 4155
-26769: DATA: 25344
-26770: DATA: 12900
-26771: DATA: 1309
-26772: DATA: 21675
-26773: DATA: 10123
-26774: DATA: 30352
-26775: DATA: 18492
-26776: DATA: 7035
-26777: DATA: 27216
-26778: DATA: 15746
-26779: DATA: 3245
-26780: DATA: 24108
-26781: DATA: 12668
-26782: DATA: 190
-26783: DATA: 21489
-26784: DATA: 9511
-26785: DATA: 29748
-26786: DATA: 18416
-26787: DATA: 5821
-26788: DATA: 26637
-26789: DATA: 15225
-26790: DATA: 2768
-26791: DATA: 24023
-26792: DATA: 12145
-26793: DATA: 32424
-26794: DATA: 20945
-26795: DATA: 8985
-26796: DATA: 29345
-26797: DATA: 17871
-26798: DATA: 6009
-26799: DATA: 26260
-26800: DATA: 14392
-26801: DATA: 2908
-26802: DATA: 23274
-26803: DATA: 11288
-26804: DATA: 32695
-26805: DATA: 20109
-26806: DATA: 8287
-26807: DATA: 29675
-26808: DATA: 17716
-26809: DATA: 5260
-26810: DATA: 26116
-26811: DATA: 14782
-26812: DATA: 2916
-26813: DATA: 23213
-26814: DATA: 11317
-26815: DATA: 32689
-26816: DATA: 20785
-26817: DATA: 8358
-26818: DATA: 29220
-26819: DATA: 17852
-26820: DATA: 5928
-26821: DATA: 26339
-26822: DATA: 14458
-26823: DATA: 3055
-26824: DATA: 23822
-26825: DATA: 11473
-26826: DATA: 32344
-26827: DATA: 20936
-26828: DATA: 9188
-26829: DATA: 29963
-26830: DATA: 17649
-26831: DATA: 5696
-26832: DATA: 26680
-26833: DATA: 15233
-26834: DATA: 3376
-26835: DATA: 23769
-26836: DATA: 11947
-26837: PUSH 21442
-26839: DATA: 9701
-26840: DATA: 30589
-26841: DATA: 18134
-26842: DATA: 6352
-26843: DATA: 27262
-26844: DATA: 15393
-26845: DATA: 4092
-26846: DATA: 25020
-26847: DATA: 13168
-26848: DATA: 1328
-26849: DATA: 21691
-26850: DATA: 9946
-26851: DATA: 30765
-26852: DATA: 11624
-26853: DATA: 31389
-26854: DATA: 2285
-26855: DATA: 9853
-26856: DATA: 29727
-26857: DATA: 600
-26858: DATA: 21412
-26859: DATA: 25075
-26860: DATA: 16273
-26861: DATA: 19761
-26862: DATA: 6925
-26863: DATA: 10622
-26864: DATA: 18264
-26865: DATA: 5357
-26866: DATA: 8843
-26867: DATA: 28906
-26868: DATA: 3793
-26869: DATA: 23589
-26870: DATA: 27172
-26871: DATA: 14360
-26872: DATA: 22040
-26873: DATA: 25716
-26874: DATA: 12903
-26875: DATA: 16475
-26876: DATA: 7708
-26877: DATA: 11334
-26878: DATA: 31303
-26879: DATA: 2121
-26880: DATA: 9801
-26881: DATA: 29709
-26882: DATA: 577
-26883: DATA: 20566
-26884: DATA: 28166
-26885: DATA: 15381
-26886: DATA: 19024
-26887: DATA: 6220
-26888: DATA: 13839
-26889: DATA: 17468
-26890: DATA: 4614
-26891: DATA: 8207
-26892: DATA: 32464
-26893: DATA: 3296
-26894: DATA: 23177
-26895: DATA: 26788
-26896: DATA: 1882
-26897: DATA: 21887
-26898: DATA: 25442
-26899: DATA: 12623
-26900: DATA: 10438
-26901: DATA: 25133
-26902: DATA: 21624
-26903: DATA: 8519
-26904: DATA: 31235
-26905: DATA: 19511
-26906: DATA: 6129
-26907: DATA: 28846
-26908: DATA: 14917
-26909: DATA: 1296
-26910: DATA: 24274
-26911: DATA: 10540
-26912: DATA: 7403
-26913: DATA: 22295
-26914: DATA: 8396
-26915: DATA: 29328
-26916: DATA: 19526
-26917: DATA: 1062
-26918: DATA: 27329
-26919: DATA: 17063
-26920: DATA: 7733
-26921: DATA: 24786
-26922: DATA: 15282
-26923: DATA: 5776
-26924: DATA: 17856
-26925: DATA: 12479
-26926: DATA: 3126
-26927: DATA: 24290
-26928: DATA: 10326
-26929: DATA: 24997
-26930: DATA: 22281
-26931: DATA: 8575
-26932: DATA: 31471
-26933: DATA: 19596
-26934: DATA: 5681
-26935: DATA: 29924
-26936: DATA: 15637
-26937: DATA: 1749
-26938: DATA: 24690
-26939: DATA: 12169
-26940: DATA: 6669
-26941: DATA: 23007
-26942: DATA: 9066
-26943: DATA: 30176
-26944: DATA: 20821
-26945: DATA: 15982
-26946: DATA: 29777
-26947: DATA: 20461
-26948: DATA: 6982
-26949: DATA: 29607
-26950: DATA: 8223
-26951: DATA: 4327
-26952: DATA: 27684
-26953: DATA: 16058
-26954: DATA: 2099
-26955: DATA: 17821
-26956: DATA: 12531
-26957: DATA: 8003
-26958: DATA: 21139
-26959: DATA: 11791
-26960: DATA: 28957
-26961: DATA: 17329
-26962: DATA: 7954
-26963: DATA: 28402
-26964: DATA: 23885
-26965: DATA: 5999
-26966: DATA: 30309
-26967: DATA: 9499
-26968: DATA: 3862
-26969: DATA: 26846
-26970: DATA: 15311
-26971: DATA: 1800
-26972: DATA: 30763
-26973: DATA: 2795
-26974: DATA: 24492
-26975: DATA: 28823
-26976: DATA: 1491
-26977: DATA: 30608
-26978: DATA: 16879
-26979: DATA: 5203
-26980: DATA: 26391
-26981: DATA: 18901
-26982: DATA: 7341
-26983: DATA: 26150
-26984: DATA: 7104
-26985: DATA: 11423
-26986: DATA: 32336
-26987: DATA: 13294
-26988: DATA: 3479
-26989: DATA: 20596
-26990: DATA: 9054
-26991: DATA: 32630
-26992: DATA: 29049
-26993: DATA: 902
-26994: DATA: 22185
-26995: DATA: 18686
-26996: DATA: 5261
-26997: DATA: 26467
-26998: DATA: 19043
-26999: DATA: 5121
-27000: DATA: 18655
-27001: DATA: 7092
-27002: DATA: 11943
-27003: DATA: 16785
-27004: DATA: 13632
-27005: DATA: 3898
-27006: DATA: 21000
-27007: DATA: 9500
-27008: DATA: 2082
-27009: DATA: 21078
-27010: DATA: 1401
-27011: DATA: 23154
-27012: DATA: 28529
-27013: DATA: 7758
-27014: DATA: 31277
-27015: DATA: 19719
-27016: DATA: 4189
-27017: DATA: 27137
-27018: DATA: 7678
-27019: DATA: 13049
-27020: DATA: 18206
-27021: DATA: 5154
-27022: DATA: 2964
-27023: DATA: 21977
-27024: DATA: 14618
-27025: DATA: 3110
-27026: DATA: 24422
-27027: DATA: 11070
-27028: DATA: 24552
-27029: DATA: 29407
-27030: DATA: 391
-27031: DATA: 30278
-27032: DATA: 16967
-27033: DATA: 5483
-27034: DATA: 30871
-27035: DATA: 17036
-27036: DATA: 13761
-27037: DATA: 27420
-27038: DATA: 13721
-27039: DATA: 4500
-27040: DATA: 18054
-27041: DATA: 13844
-27042: DATA: 665
-27043: DATA: 23711
-27044: DATA: 5211
-27045: DATA: 8488
-27046: DATA: 22258
-27047: DATA: 8950
-27048: DATA: 30298
-27049: DATA: 20679
-27050: DATA: 283
-27051: DATA: 24029
-27052: DATA: 19142
-27053: DATA: 5693
-27054: DATA: 31316
-27055: DATA: 17655
-27056: DATA: 15537
-27057: DATA: 18911
-27058: DATA: 16018
-27059: DATA: 6918
-27060: DATA: 28225
-27061: DATA: 14511
-27062: DATA: 10543
-27063: DATA: 17569
-27064: DATA: 13590
-27065: DATA: 3941
-27066: DATA: 21498
-27067: DATA: 12239
-27068: DATA: 9951
-27069: DATA: 29053
-27070: DATA: 10322
-27071: DATA: 29776
-27072: DATA: 22747
-27073: DATA: 8919
-27074: DATA: 20724
-27075: DATA: 28020
-27076: DATA: 8006
-27077: DATA: 31047
-27078: DATA: 19940
-27079: DATA: 6631
-27080: DATA: 19071
-27081: DATA: 6644
-27082: DATA: 4658
-27083: DATA: 28212
-27084: DATA: 12875
-27085: DATA: 3961
-27086: DATA: 18483
-27087: DATA: 7324
-27088: DATA: 8443
-27089: DATA: 30017
-27090: DATA: 12564
-27091: DATA: 2850
-27092: DATA: 24400
-27093: DATA: 9161
-27094: DATA: 30238
-27095: DATA: 21440
-27096: DATA: 9759
-27097: DATA: 31146
-27098: DATA: 19939
-27099: DATA: 8468
-27100: DATA: 30043
-27101: DATA: 18840
-27102: DATA: 7632
-27103: DATA: 28949
-27104: DATA: 17748
-27105: DATA: 5781
-27106: DATA: 27344
-27107: DATA: 15900
-27108: DATA: 15139
-27109: DATA: 26508
-27110: DATA: 12905
-27111: DATA: 3879
-27112: DATA: 19178
-27113: DATA: 7494
-27114: DATA: 2226
-27115: DATA: 21828
-27116: DATA: 14685
-27117: DATA: 1084
-27118: DATA: 29337
-27119: DATA: 11380
-27120: DATA: 2544
-27121: DATA: 21943
-27122: DATA: 726
-27123: DATA: 22196
-27124: DATA: 20934
-27125: DATA: 11422
-27126: DATA: 28841
-27127: DATA: 19716
-27128: DATA: 2794
-27129: DATA: 30052
-27130: DATA: 16606
-27131: DATA: 7500
-27132: DATA: 23644
-27133: DATA: 17756
-27134: DATA: 4333
-27135: DATA: 27988
-27136: DATA: 27795
-27137: DATA: 5460
-27138: DATA: 24808
-27139: DATA: 15710
-27140: DATA: 16187
-27141: DATA: 19401
-27142: DATA: 6137
-27143: DATA: 3430
-27144: DATA: 26835
-27145: DATA: 15561
-27146: DATA: 225
-27147: DATA: 23855
-27148: DATA: 7768
-27149: DATA: 10844
-27150: DATA: 22930
-27151: DATA: 9335
-27152: DATA: 2437
-27153: DATA: 21623
-27154: DATA: 6320
-27155: DATA: 19608
-27156: DATA: 20678
-27157: DATA: 11567
-27158: DATA: 29030
-27159: DATA: 20294
-27160: DATA: 4758
-27161: DATA: 18093
-27162: DATA: 31358
-27163: DATA: 8078
-27164: DATA: 31647
-27165: DATA: 20447
-27166: DATA: 4870
-27167: DATA: 28310
-27168: DATA: 30538
-27169: DATA: 11057
-27170: DATA: 24570
-27171: DATA: 16798
-27172: DATA: 7583
-27173: DATA: 25025
-27174: DATA: 13601
-27175: DATA: 4263
-27176: DATA: 21554
-27177: DATA: 2281
-27178: DATA: 4018
-27179: DATA: 27533
-27180: DATA: 16149
-27181: DATA: 2751
-27182: DATA: 21872
-27183: DATA: 403
-27184: DATA: 2134
-27185: DATA: 21968
-27186: DATA: 14667
-27187: DATA: 1919
-27188: DATA: 28342
-27189: DATA: 6869
-27190: DATA: 562
-27191: DATA: 24431
-27192: DATA: 9460
-27193: DATA: 487
-27194: DATA: 25113
-27195: DATA: 7842
-27196: DATA: 32582
-27197: DATA: 23090
-27198: DATA: 12213
-27199: DATA: 31447
-27200: DATA: 26538
-27201: DATA: 4817
-27202: DATA: 30802
-27203: DATA: 17705
-27204: DATA: 10926
-27205: DATA: 30670
-27206: DATA: 29227
-27207: DATA: 9860
-27208: DATA: 19827
-27209: DATA: 18822
-27210: DATA: 5582
-27211: DATA: 31042
-27212: DATA: 20029
-27213: DATA: 6780
-27214: DATA: 22453
-27215: DATA: 17716
-27216: DATA: 4512
-27217: DATA: 27895
-27218: DATA: 31409
-27219: DATA: 11802
-27220: DATA: 27334
-27221: DATA: 19282
-27222: DATA: 7236
-27223: DATA: 26823
-27224: DATA: 1325
-27225: DATA: 10651
-27226: DATA: 26354
-27227: DATA: 14085
-27228: DATA: 6739
-27229: DATA: 25758
-27230: DATA: 258
-27231: DATA: 13506
-27232: DATA: 24457
-27233: DATA: 14742
-27234: DATA: 1757
-27235: DATA: 26881
-27236: DATA: 15431
-27237: DATA: 2702
-27238: DATA: 23198
-27239: DATA: 3926
-27240: DATA: 12397
-27241: DATA: 24134
-27242: DATA: 14498
-27243: DATA: 972
-27244: DATA: 22220
-27245: DATA: 13118
-27246: DATA: 14992
-27247: DATA: 25075
-27248: DATA: 3295
-27249: DATA: 1206
-27250: DATA: 20918
-27251: DATA: 9456
-27252: DATA: 3991
-27253: DATA: 22574
-27254: DATA: 4655
-27255: DATA: 16160
-27256: DATA: 25662
-27257: DATA: 11366
-27258: DATA: 2419
-27259: DATA: 23633
-27260: DATA: 10095
-27261: DATA: 89
-27262: DATA: 27372
-27263: DATA: 6039
-27264: DATA: 15507
-27265: DATA: 27032
-27266: DATA: 11092
-27267: DATA: 29781
-27268: DATA: 24421
-27269: DATA: 8829
-27270: DATA: 30055
-27271: DATA: 21089
-27272: DATA: 6005
-27273: DATA: 16994
-27274: DATA: 27996
-27275: DATA: 6239
-27276: DATA: 32192
-27277: DATA: 23280
-27278: DATA: 11702
-27279: DATA: 28800
-27280: DATA: 23112
-27281: DATA: 10102
-27282: DATA: 17683
-27283: DATA: 28212
-27284: DATA: 7115
-27285: DATA: 31726
-27286: DATA: 17570
-27287: DATA: 11903
-27288: DATA: 28981
-27289: DATA: 20006
-27290: DATA: 6736
-27291: DATA: 18219
-27292: DATA: 29167
-27293: DATA: 9502
-27294: DATA: 29383
-27295: DATA: 17829
-27296: DATA: 12139
-27297: DATA: 30737
-27298: DATA: 4079
-27299: DATA: 25304
-27300: DATA: 14350
-27301: DATA: 3933
-27302: DATA: 8948
-27303: DATA: 29625
-27304: DATA: 17697
-27305: DATA: 10369
-27306: DATA: 29595
-27307: DATA: 20329
-27308: DATA: 25125
-27309: DATA: 14682
-27310: DATA: 4092
-27311: DATA: 25095
-27312: DATA: 30800
-27313: DATA: 17684
-27314: DATA: 10410
-27315: DATA: 29236
-27316: DATA: 17908
-27317: DATA: 8878
-27318: DATA: 14774
-27319: DATA: 3593
-27320: DATA: 25734
-27321: DATA: 30950
-27322: DATA: 17494
-27323: DATA: 12163
-27324: DATA: 29041
-27325: DATA: 20190
-27326: DATA: 26218
-27327: DATA: 14741
-27328: DATA: 4881
-27329: DATA: 9430
-27330: DATA: 28795
-27331: DATA: 23449
-27332: DATA: 11962
-27333: DATA: 31438
-27334: DATA: 4775
-27335: DATA: 25912
-27336: DATA: 16374
-27337: DATA: 20614
-27338: DATA: 11264
-27339: DATA: 30692
-27340: DATA: 23035
-27341: DATA: 10622
-27342: DATA: 16357
-27343: DATA: 4430
-27344: DATA: 27604
-27345: DATA: 32758
-27346: DATA: 24357
-27347: DATA: 8947
-27348: DATA: 29824
-27349: DATA: 21615
-27350: DATA: 28577
-27351: DATA: 17874
-27352: DATA: 22294
-27353: DATA: 8351
-27354: DATA: 2745
-27355: DATA: 22028
-27356: DATA: 26803
-27357: DATA: 924
-27358: DATA: 21442
-27359: DATA: 12055
-27360: DATA: 16597
-27361: DATA: 7452
-27362: DATA: 11986
-27363: DATA: 3648
-27364: DATA: 20505
-27365: DATA: 12687
-27366: DATA: 16893
-27367: DATA: 6964
-27368: DATA: 13078
-27369: DATA: 807
-27370: DATA: 22226
-27371: DATA: 13038
-27372: DATA: 20157
-27373: DATA: 6208
-27374: DATA: 29330
-27375: DATA: 2678
-27376: DATA: 27187
-27377: DATA: 15826
-27378: DATA: 2039
-27379: DATA: 25597
-27380: DATA: 14788
-27381: DATA: 3901
-27382: DATA: 28508
-27383: DATA: 12661
-27384: DATA: 7008
-27385: DATA: 27933
-27386: DATA: 14092
-27387: DATA: 6605
-27388: DATA: 25536
-27389: DATA: 13781
-27390: DATA: 8156
-27391: DATA: 25029
-27392: DATA: 19392
-27393: DATA: 7629
-27394: DATA: 26612
-27395: DATA: 18933
-27396: DATA: 5080
-27397: DATA: 26093
-27398: DATA: 17783
-27399: DATA: 32306
-27400: DATA: 5198
-27401: DATA: 8794
-27402: DATA: 30804
-27403: DATA: 5701
-27404: DATA: 11433
-27405: DATA: 31375
-27406: DATA: 30103
-27407: DATA: 18200
-27408: DATA: 11200
-27409: DATA: 31600
-27410: DATA: 16690
-27411: DATA: 12149
-27412: DATA: 30052
-27413: DATA: 17181
-27414: DATA: 9377
-27415: DATA: 15536
-27416: DATA: 4796
-27417: DATA: 26802
-27418: DATA: 15982
-27419: DATA: 5126
-27420: DATA: 27547
-27421: DATA: 16774
-27422: DATA: 5952
-27423: DATA: 27978
-27424: DATA: 17618
-27425: DATA: 6789
-27426: DATA: 28762
-27427: DATA: 17986
-27428: DATA: 7647
-27429: DATA: 29597
-27430: DATA: 18736
-27431: DATA: 8016
-27432: DATA: 14082
-27433: DATA: 28260
-27434: DATA: 39
-27435: DATA: 23520
-27436: DATA: 27932
-27437: DATA: 1846
-27438: DATA: 24205
-27439: DATA: 28776
-27440: DATA: 2956
-27441: DATA: 23971
-27442: DATA: 30471
-27443: DATA: 3749
-27444: DATA: 8271
-27445: DATA: 31264
-27446: DATA: 3499
-27447: DATA: 10005
-27448: DATA: 32460
-27449: DATA: 4212
-27450: DATA: 11260
-27451: DATA: 32080
-27452: DATA: 5329
-27453: DATA: 11787
-27454: DATA: 16802
-27455: DATA: 30927
-27456: DATA: 4140
-27457: DATA: 26355
-27458: DATA: 15690
-27459: DATA: 5062
-27460: DATA: 27224
-27461: DATA: 16600
-27462: DATA: 6001
-27463: DATA: 28087
-27464: DATA: 17417
-27465: DATA: 6801
-27466: DATA: 29026
-27467: DATA: 18358
-27468: DATA: 7896
-27469: DATA: 30075
-27470: DATA: 19335
-27471: DATA: 8757
-27472: DATA: 31043
-27473: DATA: 20468
-27474: DATA: 9750
-27475: DATA: 31983
-27476: DATA: 21470
-27477: DATA: 10874
-27478: DATA: 176
-27479: DATA: 22482
-27480: DATA: 11868
-27481: DATA: 1245
-27482: DATA: 6849
-27483: DATA: 27316
-27484: DATA: 20884
-27485: DATA: 1801
-27486: DATA: 28239
-27487: DATA: 21899
-27488: DATA: 15491
-27489: DATA: 25105
-27490: DATA: 18688
-27491: DATA: 12440
-27492: DATA: 26586
-27493: DATA: 19737
-27494: DATA: 13413
-27495: DATA: 7079
-27496: DATA: 17047
-27497: DATA: 10689
-27498: DATA: 7969
-27499: DATA: 18035
-27500: DATA: 11600
-27501: DATA: 5366
-27502: DATA: 31680
-27503: DATA: 8945
-27504: DATA: 2518
-27505: DATA: 32572
-27506: DATA: 9792
-27507: DATA: 3370
-27508: DATA: 29788
-27509: DATA: 23480
-27510: DATA: 684
-27511: DATA: 27013
-27512: DATA: 20675
-27513: DATA: 1973
-27514: DATA: 28390
-27515: DATA: 21970
-27516: DATA: 15558
-27517: DATA: 25485
-27518: DATA: 19145
-27519: DATA: 12747
-27520: DATA: 6359
-27521: DATA: 20433
-27522: DATA: 14034
-27523: DATA: 7640
-27524: DATA: 17623
-27525: DATA: 11209
-27526: DATA: 4841
-27527: DATA: 31226
-27528: DATA: 8330
-27529: DATA: 6022
-27530: DATA: 32494
-27531: DATA: 9687
-27532: DATA: 5180
-27533: DATA: 19452
-27534: DATA: 25234
-27535: DATA: 14775
-27536: DATA: 20818
-27537: DATA: 26642
-27538: DATA: 16221
-27539: DATA: 22128
-27540: DATA: 28144
-27541: DATA: 1263
-27542: DATA: 23464
-27543: DATA: 29448
-27544: DATA: 2580
-27545: DATA: 8489
-27546: DATA: 30948
-27547: DATA: 4032
-27548: DATA: 10052
-27549: DATA: 32277
-27550: DATA: 5583
-27551: DATA: 11421
-27552: DATA: 17493
-27553: DATA: 6913
-27554: DATA: 12957
-27555: DATA: 18903
-27556: DATA: 24901
-27557: DATA: 14351
-27558: DATA: 20466
-27559: DATA: 26275
-27560: DATA: 15966
-27561: DATA: 21896
-27562: DATA: 27817
-27563: DATA: 1135
-27564: DATA: 23433
-27565: DATA: 29365
-27566: DATA: 2565
-27567: DATA: 8697
-27568: DATA: 31060
-27569: DATA: 4145
-27570: DATA: 10131
-27571: DATA: 32629
-27572: DATA: 5769
-27573: DATA: 11700
-27574: DATA: 17717
-27575: DATA: 7309
-27576: DATA: 13401
-27577: DATA: 19450
-27578: DATA: 25458
-27579: DATA: 15055
-27580: DATA: 21060
-27581: DATA: 27036
-27582: DATA: 285
-27583: DATA: 22743
-27584: DATA: 28747
-27585: DATA: 1944
-27586: DATA: 24388
-27587: DATA: 30431
-27588: DATA: 3676
-27589: DATA: 9600
-27590: DATA: 32112
-27591: DATA: 5353
-27592: DATA: 11264
-27593: DATA: 17352
-27594: DATA: 7034
-27595: DATA: 12972
-27596: DATA: 19142
-27597: DATA: 25215
-27598: DATA: 14742
-27599: DATA: 20856
-27600: DATA: 26885
-27601: DATA: 235
-27602: DATA: 22536
-27603: DATA: 28594
-27604: DATA: 1987
-27605: DATA: 24421
-27606: DATA: 30398
-27607: DATA: 3804
-27608: DATA: 9799
-27609: DATA: 32239
-27610: DATA: 5565
-27611: DATA: 11592
-27612: DATA: 17754
-27613: DATA: 7301
-27614: DATA: 13534
-27615: DATA: 19472
-27616: DATA: 25625
-27617: DATA: 15257
-27618: DATA: 21454
-27619: DATA: 27472
-27620: DATA: 782
-27621: DATA: 23180
-27622: DATA: 29426
-27623: DATA: 2599
-27624: DATA: 8722
-27625: DATA: 31240
-27626: DATA: 4542
-27627: DATA: 10728
-27628: DATA: 16840
-27629: DATA: 6457
-27630: DATA: 12559
-27631: DATA: 18751
-27632: DATA: 24848
-27633: DATA: 14584
-27634: DATA: 20617
-27635: DATA: 26879
-27636: DATA: 137
-27637: DATA: 22565
-27638: DATA: 28709
-27639: DATA: 2057
-27640: DATA: 8212
-27641: DATA: 30817
-27642: DATA: 4211
-27643: DATA: 10309
-27644: DATA: 16393
-27645: DATA: 6211
-27646: DATA: 12370
-27647: DATA: 18517
-27648: DATA: 24668
-27649: DATA: 14412
-27650: DATA: 20565
-27651: DATA: 26713
-27652: DATA: 71
-27653: DATA: 22599
-27654: DATA: 28733
-27655: DATA: 2171
-27656: DATA: 8201
-27657: DATA: 30733
-27658: DATA: 4158
-27659: DATA: 10281
-27660: DATA: 16591
-27661: DATA: 6393
-27662: DATA: 12446
-27663: DATA: 18678
-27664: DATA: 24883
-27665: DATA: 14719
-27666: DATA: 20754
-27667: DATA: 26970
-27668: DATA: 393
-27669: DATA: 22944
-27670: DATA: 29060
-27671: DATA: 2631
-27672: DATA: 8716
-27673: DATA: 31336
-27674: DATA: 4848
-27675: DATA: 10881
-27676: DATA: 17232
-27677: DATA: 6992
-27678: DATA: 13210
-27679: DATA: 19359
-27680: DATA: 25686
-27681: DATA: 15448
-27682: DATA: 21633
-27683: DATA: 27797
-27684: DATA: 1361
-27685: DATA: 23817
-27686: DATA: 30185
-27687: DATA: 3574
-27688: DATA: 9822
-27689: DATA: 32392
-27690: DATA: 5801
-27691: DATA: 12143
-27692: DATA: 18313
-27693: DATA: 8100
-27694: DATA: 14351
-27695: DATA: 20729
-27696: DATA: 26959
-27697: DATA: 317
-27698: DATA: 22929
-27699: DATA: 29232
-27700: DATA: 2752
-27701: DATA: 8878
-27702: DATA: 31613
-27703: DATA: 5020
-27704: DATA: 11281
-27705: DATA: 17641
-27706: DATA: 7529
-27707: DATA: 13696
-27708: DATA: 20045
-27709: DATA: 26329
-27710: DATA: 16207
-27711: DATA: 22493
-27712: DATA: 28762
-27713: DATA: 2252
-27714: DATA: 8532
-27715: DATA: 31199
-27716: DATA: 4679
-27717: DATA: 10880
-27718: DATA: 17205
-27719: DATA: 7163
-27720: DATA: 13324
-27721: DATA: 19595
-27722: DATA: 25909
-27723: DATA: 15840
-27724: DATA: 22216
-27725: DATA: 28515
-27726: DATA: 2013
-27727: DATA: 8319
-27728: DATA: 31070
-27729: DATA: 4599
-27730: DATA: 10845
-27731: DATA: 17063
-27732: DATA: 7116
-27733: DATA: 13427
-27734: DATA: 19625
-27735: DATA: 25999
-27736: DATA: 15952
-27737: DATA: 22244
-27738: DATA: 28605
-27739: DATA: 2063
-27740: DATA: 8539
-27741: DATA: 31184
-27742: DATA: 4804
-27743: DATA: 11031
-27744: DATA: 17484
-27745: DATA: 7384
-27746: DATA: 13776
-27747: DATA: 19985
-27748: DATA: 26448
-27749: DATA: 16320
-27750: DATA: 22768
-27751: DATA: 28973
-27752: DATA: 2571
-27753: DATA: 9037
-27754: DATA: 31665
-27755: DATA: 5369
-27756: DATA: 11657
-27757: DATA: 18039
-27758: DATA: 8001
-27759: DATA: 14461
-27760: DATA: 20801
-27761: DATA: 27057
-27762: DATA: 649
-27763: DATA: 23470
-27764: DATA: 29838
-27765: DATA: 3424
-27766: DATA: 9845
-27767: DATA: 32539
-27768: DATA: 6156
-27769: DATA: 12651
-27770: DATA: 19061
-27771: DATA: 25344
-27772: DATA: 15432
-27773: DATA: 21827
-27774: DATA: 28189
-27775: DATA: 1823
-27776: DATA: 8270
-27777: DATA: 31069
-27778: DATA: 4686
-27779: DATA: 11076
-27780: DATA: 17422
-27781: DATA: 7433
-27782: DATA: 13875
-27783: DATA: 20226
-27784: DATA: 26640
-27785: DATA: 262
-27786: DATA: 23083
-27787: DATA: 29514
-27788: DATA: 3209
-27789: DATA: 9648
-27790: DATA: 32425
-27791: DATA: 6071
-27792: DATA: 12569
-27793: DATA: 19051
-27794: DATA: 25368
-27795: DATA: 15413
-27796: DATA: 21897
-27797: DATA: 28404
-27798: DATA: 1973
-27799: DATA: 8525
-27800: DATA: 31321
-27801: DATA: 4907
-27802: DATA: 11506
-27803: DATA: 17806
-27804: DATA: 8029
-27805: DATA: 14357
-27806: DATA: 20947
-27807: DATA: 27276
-27808: DATA: 1098
-27809: DATA: 23896
-27810: DATA: 30418
-27811: DATA: 3990
-27812: DATA: 10505
-27813: DATA: 16921
-27814: DATA: 7154
-27815: DATA: 13501
-27816: DATA: 19979
-27817: DATA: 26504
-27818: DATA: 180
-27819: DATA: 23150
-27820: DATA: 29663
-27821: DATA: 3253
-27822: DATA: 9747
-27823: DATA: 32748
-27824: DATA: 6486
-27825: DATA: 12842
-27826: DATA: 19332
-27827: DATA: 25916
-27828: DATA: 16009
-27829: DATA: 22445
-27830: DATA: 28984
-27831: DATA: 2714
-27832: DATA: 9244
-27833: DATA: 32228
-27834: DATA: 5988
-27835: DATA: 12416
-27836: DATA: 18958
-27837: DATA: 25561
-27838: DATA: 15699
-27839: DATA: 22222
-27840: DATA: 28702
-27841: DATA: 2454
-27842: DATA: 9015
-27843: DATA: 31940
-27844: DATA: 5704
-27845: DATA: 12235
-27846: DATA: 18808
-27847: DATA: 25218
-27848: DATA: 15449
-27849: DATA: 21960
-27850: DATA: 28420
-27851: DATA: 2223
-27852: DATA: 8924
-27853: DATA: 31792
-27854: DATA: 5520
-27855: DATA: 12089
-27856: DATA: 18752
-27857: DATA: 25272
-27858: DATA: 15450
-27859: DATA: 21924
-27860: DATA: 28616
-27861: DATA: 2411
-27862: DATA: 8888
-27863: DATA: 31880
-27864: DATA: 5701
-27865: DATA: 12193
-27866: DATA: 18921
-27867: DATA: 25349
-27868: DATA: 15684
-27869: DATA: 22222
-27870: DATA: 28826
-27871: DATA: 2648
-27872: DATA: 9233
-27873: DATA: 32139
-27874: DATA: 6088
-27875: DATA: 12563
-27876: DATA: 19265
-27877: DATA: 25792
-27878: DATA: 16124
-27879: DATA: 22587
-27880: DATA: 29273
-27881: DATA: 3087
-27882: DATA: 9641
-27883: DATA: 32737
-27884: DATA: 6594
-27885: DATA: 13109
-27886: DATA: 19805
-27887: DATA: 26484
-27888: DATA: 344
-27889: DATA: 23210
-27890: DATA: 29850
-27891: DATA: 3829
-27892: DATA: 10377
-27893: DATA: 16946
-27894: DATA: 7218
-27895: DATA: 13835
-27896: DATA: 20498
-27897: DATA: 27183
-27898: DATA: 1076
-27899: DATA: 24078
-27900: DATA: 30755
-27901: DATA: 4692
-27902: DATA: 11343
-27903: DATA: 18007
-27904: DATA: 24649
-27905: DATA: 14898
-27906: DATA: 21533
-27907: DATA: 28176
-27908: DATA: 2173
-27909: DATA: 8783
-27910: DATA: 31805
-27911: DATA: 5740
-27912: DATA: 12299
-27913: DATA: 18951
-27914: DATA: 25645
-27915: DATA: 15968
-27916: DATA: 22746
-27917: DATA: 29439
-27918: DATA: 3216
-27919: DATA: 9917
-27920: DATA: 16717
-27921: DATA: 7024
-27922: DATA: 13588
-27923: DATA: 20286
-27924: DATA: 27086
-27925: DATA: 928
-27926: DATA: 23988
-27927: DATA: 30790
-27928: DATA: 4697
-27929: DATA: 11313
-27930: DATA: 18162
-27931: DATA: 24725
-27932: DATA: 15195
-27933: DATA: 21840
-27934: DATA: 28628
-27935: DATA: 2454
-27936: DATA: 9295
-27937: DATA: 32285
-27938: DATA: 6355
-27939: DATA: 12932
-27940: DATA: 19782
-27941: DATA: 26386
-27942: DATA: 484
-27943: DATA: 23524
-27944: DATA: 30297
-27945: DATA: 4305
-27946: DATA: 10930
-27947: DATA: 17781
-27948: DATA: 8073
-27949: DATA: 14781
-27950: DATA: 21532
-27951: DATA: 28385
-27952: DATA: 2329
-27953: DATA: 9087
-27954: DATA: 32153
-27955: DATA: 6242
-27956: DATA: 12998
-27957: DATA: 19632
-27958: DATA: 26493
-27959: DATA: 468
-27960: DATA: 23568
-27961: DATA: 30460
-27962: DATA: 4472
-27963: DATA: 11213
-27964: DATA: 17943
-27965: DATA: 24727
-27966: DATA: 15123
-27967: DATA: 21938
-27968: DATA: 28748
-27969: DATA: 2763
-27970: DATA: 9560
-27971: DATA: 32698
-27972: DATA: 6665
-27973: DATA: 13440
-27974: DATA: 20292
-27975: DATA: 27111
-27976: DATA: 1036
-27977: DATA: 24264
-27978: DATA: 31024
-27979: DATA: 5025
-27980: DATA: 11984
-27981: DATA: 18736
-27982: DATA: 25500
-27983: DATA: 15931
-27984: DATA: 22861
-27985: DATA: 29681
-27986: DATA: 3595
-27987: DATA: 10417
-27988: DATA: 17373
-27989: DATA: 7781
-27990: DATA: 14589
-27991: DATA: 21447
-27992: DATA: 28171
-27993: DATA: 2280
-27994: DATA: 9202
-27995: DATA: 32276
-27996: DATA: 6465
-27997: DATA: 13205
-27998: DATA: 20175
-27999: DATA: 26895
-28000: DATA: 1104
-28001: DATA: 24203
-28002: DATA: 31192
-28003: DATA: 5200
-28004: DATA: 12104
-28005: DATA: 18832
-28006: DATA: 25837
-28007: DATA: 16164
-28008: DATA: 23040
-28009: DATA: 29960
-28010: DATA: 4028
-28011: DATA: 10990
-28012: DATA: 17801
-28013: DATA: 24633
-28014: DATA: 15113
-28015: DATA: 22141
-28016: DATA: 29012
-28017: DATA: 3064
-28018: DATA: 9866
-28019: DATA: 16889
-28020: DATA: 7389
-28021: DATA: 14120
-28022: DATA: 21117
-28023: DATA: 27983
-28024: DATA: 2060
-28025: DATA: 9083
-28026: DATA: 32376
-28027: DATA: 6400
-28028: DATA: 13333
-28029: DATA: 20313
-28030: DATA: 27209
-28031: DATA: 1373
-28032: DATA: 8276
-28033: DATA: 31494
-28034: DATA: 5658
-28035: DATA: 12574
-28036: DATA: 19491
-28037: DATA: 18013
-28038: DATA: 27463
-28039: DATA: 13412
-28040: DATA: 4367
-28041: DATA: 31257
-28042: DATA: 18302
-28043: DATA: 8234
-28044: DATA: 3524
-28045: DATA: 22245
-28046: DATA: 13211
-28047: DATA: 7349
-28048: DATA: 30798
-28049: DATA: 17780
-28050: DATA: 11788
-28051: DATA: 2858
-28052: DATA: 21648
-28053: DATA: 12681
-28054: DATA: 21175
-28055: DATA: 14575
-28056: DATA: 7563
-28057: DATA: 29360
-28058: DATA: 22379
-28059: DATA: 3101
-28060: DATA: 24724
-28061: DATA: 17897
-28062: DATA: 11467
-28063: DATA: 14523
-28064: DATA: 21580
-28065: DATA: 3863
-28066: DATA: 10887
-28067: DATA: 17817
-28068: DATA: 24918
-28069: DATA: 7199
-28070: DATA: 14247
-28071: DATA: 21180
-28072: DATA: 3596
-28073: DATA: 10642
-28074: DATA: 17588
-28075: DATA: 24687
-28076: DATA: 7120
-28077: DATA: 13986
-28078: DATA: 21063
-28079: DATA: 3563
-28080: DATA: 10583
-28081: DATA: 17447
-28082: DATA: 32650
-28083: DATA: 6954
-28084: DATA: 14043
-28085: DATA: 20927
-28086: DATA: 3381
-28087: DATA: 10391
-28088: DATA: 17485
-28089: DATA: 32664
-28090: DATA: 10873
-28091: DATA: 12785
-28092: DATA: 21838
-28093: DATA: 2762
-28094: DATA: 11864
-28095: DATA: 17373
-28096: DATA: 26441
-28097: DATA: 7369
-28098: DATA: 12294
-28099: DATA: 21935
-28100: DATA: 16230
-28101: DATA: 2159
-28102: DATA: 25828
-28103: DATA: 16747
-28104: DATA: 15823
-28105: DATA: 5661
-28106: DATA: 29354
-28107: DATA: 12088
-28108: DATA: 2840
-28109: DATA: 26610
-28110: DATA: 16459
-28111: DATA: 15528
-28112: DATA: 6342
-28113: DATA: 30048
-28114: DATA: 20879
-28115: DATA: 2662
-28116: DATA: 26187
-28117: DATA: 17150
-28118: DATA: 16170
-28119: DATA: 6986
-28120: DATA: 30671
-28121: DATA: 20535
-28122: DATA: 3173
-28123: DATA: 26838
-28124: DATA: 17606
-28125: DATA: 8457
-28126: DATA: 7518
-28127: DATA: 31132
-28128: DATA: 21903
-28129: DATA: 3614
-28130: DATA: 27210
-28131: DATA: 18053
-28132: DATA: 8916
-28133: DATA: 8024
-28134: DATA: 31489
-28135: DATA: 18183
-28136: DATA: 29870
-28137: DATA: 10441
-28138: DATA: 3878
-28139: DATA: 25390
-28140: DATA: 18244
-28141: DATA: 15295
-28142: DATA: 8093
-28143: DATA: 29617
-28144: DATA: 22467
-28145: DATA: 2678
-28146: DATA: 28181
-28147: DATA: 17015
-28148: DATA: 9801
-28149: DATA: 6826
-28150: DATA: 32499
-28151: DATA: 21138
-28152: DATA: 13983
-28153: DATA: 27367
-28154: DATA: 20199
-28155: DATA: 8846
-28156: DATA: 1742
-28157: DATA: 31440
-28158: DATA: 24211
-28159: DATA: 13007
-28160: DATA: 5848
-28161: DATA: 19139
-28162: DATA: 11969
-28163: DATA: 670
-28164: DATA: 26327
-28165: DATA: 23247
-28166: DATA: 16112
-28167: DATA: 4845
-28168: DATA: 30425
-28169: DATA: 10988
-28170: DATA: 22801
-28171: DATA: 16663
-28172: DATA: 26056
-28173: DATA: 6635
-28174: DATA: 15827
-28175: DATA: 20919
-28176: DATA: 29765
-28177: DATA: 10355
-28178: DATA: 19485
-28179: DATA: 24697
-28180: DATA: 1235
-28181: DATA: 14510
-28182: DATA: 23712
-28183: DATA: 29523
-28184: DATA: 5893
-28185: DATA: 19235
-28186: DATA: 28595
-28187: DATA: 902
-28188: DATA: 9800
-28189: DATA: 23049
-28190: DATA: 32403
-28191: DATA: 4738
-28192: DATA: 12632
-28193: DATA: 21846
-28194: DATA: 2502
-28195: DATA: 11661
-28196: DATA: 16450
-28197: DATA: 25678
-28198: DATA: 6375
-28199: DATA: 15534
-28200: DATA: 21270
-28201: DATA: 30674
-28202: DATA: 11261
-28203: DATA: 19972
-28204: DATA: 5851
-28205: DATA: 25624
-28206: DATA: 18307
-28207: DATA: 15228
-28208: DATA: 7816
-28209: DATA: 29345
-28210: DATA: 22029
-28211: DATA: 2551
-28212: DATA: 27997
-28213: DATA: 16753
-28214: DATA: 9390
-28215: DATA: 6172
-28216: DATA: 31629
-28217: DATA: 24439
-28218: DATA: 12972
-28219: DATA: 5716
-28220: DATA: 18905
-28221: DATA: 11605
-28222: DATA: 201
-28223: DATA: 25671
-28224: DATA: 18312
-28225: DATA: 15179
-28226: DATA: 7893
-28227: DATA: 29185
-28228: DATA: 21977
-28229: DATA: 2321
-28230: DATA: 27883
-28231: DATA: 16491
-28232: DATA: 9117
-28233: DATA: 1820
-28234: DATA: 31458
-28235: DATA: 24155
-28236: DATA: 10234
-28237: DATA: 29120
-28238: DATA: 11526
-28239: DATA: 20130
-28240: DATA: 27609
-28241: DATA: 1902
-28242: DATA: 8322
-28243: DATA: 23590
-28244: DATA: 31070
-28245: DATA: 6835
-28246: DATA: 13857
-28247: DATA: 21333
-28248: DATA: 3274
-28249: DATA: 10287
-28250: DATA: 17766
-28251: DATA: 26262
-28252: DATA: 922
-28253: DATA: 16148
-28254: DATA: 22607
-28255: DATA: 30087
-28256: DATA: 5830
-28257: DATA: 12875
-28258: DATA: 28481
-28259: DATA: 2181
-28260: DATA: 9626
-28261: DATA: 16668
-28262: DATA: 25184
-28263: DATA: 8126
-28264: DATA: 14538
-28265: DATA: 21972
-28266: DATA: 28968
-28267: DATA: 4659
-28268: DATA: 20302
-28269: DATA: 26795
-28270: DATA: 1419
-28271: DATA: 9899
-28272: DATA: 17370
-28273: DATA: 32554
-28274: DATA: 6173
-28275: DATA: 13680
-28276: DATA: 22107
-28277: DATA: 29620
-28278: DATA: 11435
-28279: DATA: 18828
-28280: DATA: 27275
-28281: DATA: 2018
-28282: DATA: 8445
-28283: DATA: 23967
-28284: DATA: 32410
-28285: DATA: 7130
-28286: DATA: 13505
-28287: DATA: 20958
-28288: DATA: 29322
-28289: DATA: 12248
-28290: DATA: 18635
-28291: DATA: 26054
-28292: DATA: 1664
-28293: DATA: 9145
-28294: DATA: 23684
-28295: DATA: 31163
-28296: DATA: 6858
-28297: DATA: 14299
-28298: DATA: 20718
-28299: DATA: 32302
-28300: DATA: 29552
-28301: DATA: 17590
-28302: DATA: 13992
-28303: DATA: 29342
-28304: DATA: 15269
-28305: DATA: 17540
-28306: DATA: 25010
-28307: DATA: 681
-28308: DATA: 12106
-28309: DATA: 18486
-28310: DATA: 5439
-28311: DATA: 14303
-28312: DATA: 20612
-28313: DATA: 32187
-28314: DATA: 7723
-28315: DATA: 15128
-28316: DATA: 17872
-28317: DATA: 26258
-28318: DATA: 846
-28319: DATA: 11342
-28320: DATA: 20160
-28321: DATA: 27528
-28322: DATA: 13323
-28323: DATA: 20754
-28324: DATA: 29655
-28325: DATA: 7327
-28326: DATA: 14712
-28327: DATA: 23166
-28328: DATA: 25742
-28329: DATA: 336
-28330: DATA: 8751
-28331: DATA: 19638
-28332: DATA: 26964
-28333: DATA: 2595
-28334: DATA: 21646
-28335: DATA: 29054
-28336: DATA: 5007
-28337: DATA: 15545
-28338: DATA: 22794
-28339: DATA: 31722
-28340: DATA: 1108
-28341: DATA: 8511
-28342: DATA: 17317
-28343: DATA: 27673
-28344: DATA: 3777
-28345: DATA: 11028
-28346: DATA: 30081
-28347: DATA: 32216
-28348: DATA: 13156
-28349: DATA: 24257
-28350: DATA: 31813
-28351: DATA: 7125
-28352: DATA: 14592
-28353: DATA: 17605
-28354: DATA: 25163
-28355: DATA: 454
-28356: DATA: 12098
-28357: DATA: 19097
-28358: DATA: 26733
-28359: DATA: 14306
-28360: DATA: 21824
-28361: DATA: 28829
-28362: DATA: 7723
-28363: DATA: 15802
-28364: DATA: 23515
-28365: DATA: 31084
-28366: DATA: 1152
-28367: DATA: 8815
-28368: DATA: 16426
-28369: DATA: 2030
-28370: DATA: 22326
-28371: DATA: 29357
-28372: DATA: 11470
-28373: DATA: 20018
-28374: DATA: 27049
-28375: DATA: 3027
-28376: DATA: 9477
-28377: DATA: 16574
-28378: DATA: 25263
-28379: DATA: 7179
-28380: DATA: 15956
-28381: DATA: 22935
-28382: DATA: 31709
-28383: DATA: 5401
-28384: DATA: 14158
-28385: DATA: 21126
-28386: DATA: 3273
-28387: DATA: 11842
-28388: DATA: 18508
-28389: DATA: 27520
-28390: DATA: 1510
-28391: DATA: 10030
-28392: DATA: 16642
-28393: DATA: 25428
-28394: DATA: 7848
-28395: DATA: 14514
-28396: DATA: 23193
-28397: DATA: 17982
-28398: DATA: 2140
-28399: DATA: 32170
-28400: DATA: 20808
-28401: DATA: 16262
-28402: DATA: 31831
-28403: DATA: 6712
-28404: DATA: 14414
-28405: DATA: 22182
-28406: DATA: 29941
-28407: DATA: 4756
-28408: DATA: 12441
-28409: DATA: 20197
-28410: DATA: 27829
-28411: DATA: 2780
-28412: DATA: 10432
-28413: DATA: 18138
-28414: DATA: 25817
-28415: DATA: 725
-28416: DATA: 8389
-28417: DATA: 32414
-28418: DATA: 7317
-28419: DATA: 15000
-28420: DATA: 22769
-28421: DATA: 30413
-28422: DATA: 5351
-28423: DATA: 13032
-28424: DATA: 20624
-28425: DATA: 28304
-28426: DATA: 3238
-28427: DATA: 10984
-28428: DATA: 18504
-28429: DATA: 26220
-28430: DATA: 1106
-28431: DATA: 8739
-28432: DATA: 16785
-28433: DATA: 8163
-28434: DATA: 15770
-28435: DATA: 23477
-28436: DATA: 31044
-28437: DATA: 5928
-28438: DATA: 13630
-28439: DATA: 21705
-28440: DATA: 29343
-28441: DATA: 4260
-28442: DATA: 11829
-28443: DATA: 19463
-28444: DATA: 27591
-28445: DATA: 2520
-28446: DATA: 10070
-28447: DATA: 17695
-28448: DATA: 25813
-28449: DATA: 661
-28450: DATA: 8202
-28451: DATA: 32370
-28452: DATA: 7595
-28453: DATA: 23093
-28454: DATA: 18136
-28455: DATA: 26811
-28456: DATA: 2320
-28457: DATA: 11156
-28458: DATA: 19879
-28459: DATA: 28277
-28460: DATA: 4313
-28461: DATA: 12960
-28462: DATA: 21313
-28463: DATA: 30205
-28464: DATA: 5706
-28465: DATA: 14385
-28466: DATA: 23187
-28467: DATA: 31532
-28468: DATA: 7641
-28469: DATA: 16317
-28470: DATA: 24623
-28471: DATA: 640
-28472: DATA: 8960
-28473: DATA: 17894
-28474: DATA: 26223
-28475: DATA: 2204
-28476: DATA: 10562
-28477: DATA: 19397
-28478: DATA: 27733
-28479: DATA: 3788
-28480: DATA: 12037
-28481: DATA: 20939
-28482: DATA: 29256
-28483: DATA: 5312
-28484: DATA: 13595
-28485: DATA: 22428
-28486: DATA: 30753
-28487: DATA: 6877
-28488: DATA: 15121
-28489: DATA: 24020
-28490: DATA: 32306
-28491: DATA: 8377
-28492: DATA: 16848
-28493: DATA: 25185
-28494: DATA: 1170
-28495: DATA: 9572
-28496: DATA: 18001
-28497: DATA: 26859
-28498: DATA: 2369
-28499: DATA: 11183
-28500: DATA: 19677
-28501: DATA: 28025
-28502: DATA: 4004
-28503: DATA: 12486
-28504: DATA: 20805
-28505: DATA: 29601
-28506: DATA: 5361
-28507: DATA: 13661
-28508: DATA: 22079
-28509: DATA: 30950
-28510: DATA: 26602
-28511: DATA: 20266
-28512: DATA: 11869
-28513: DATA: 2182
-28514: DATA: 27537
-28515: DATA: 18967
-28516: DATA: 5454
-28517: DATA: 30667
-28518: DATA: 22270
-28519: DATA: 12578
-28520: DATA: 4100
-28521: DATA: 29510
-28522: DATA: 24054
-28523: DATA: 15615
-28524: DATA: 8141
-28525: DATA: 32379
-28526: DATA: 22800
-28527: DATA: 14458
-28528: DATA: 7004
-28529: DATA: 26039
-28530: DATA: 17622
-28531: DATA: 10216
-28532: DATA: 1741
-28533: DATA: 24870
-28534: DATA: 16435
-28535: DATA: 8983
-28536: DATA: 538
-28537: DATA: 28010
-28538: DATA: 19576
-28539: DATA: 12108
-28540: DATA: 3586
-28541: DATA: 26959
-28542: DATA: 18521
-28543: DATA: 11027
-28544: DATA: 2626
-28545: DATA: 21830
-28546: DATA: 13378
-28547: DATA: 5915
-28548: DATA: 30294
-28549: DATA: 20803
-28550: DATA: 12403
-28551: DATA: 4899
-28552: DATA: 29213
-28553: DATA: 23818
-28554: DATA: 15418
-28555: DATA: 8043
-28556: DATA: 32459
-28557: DATA: 23029
-28558: DATA: 14466
-28559: DATA: 7100
-28560: DATA: 31506
-28561: DATA: 23157
-28562: DATA: 9503
-28563: DATA: 1065
-28564: DATA: 26577
-28565: DATA: 18175
-28566: DATA: 8696
-28567: DATA: 297
-28568: DATA: 24696
-28569: DATA: 18492
-28570: DATA: 22977
-28571: DATA: 30346
-28572: DATA: 5721
-28573: DATA: 14165
-28574: DATA: 21716
-28575: DATA: 30100
-28576: DATA: 5467
-28577: DATA: 12821
-28578: DATA: 21452
-28579: DATA: 28885
-28580: DATA: 4181
-28581: DATA: 12554
-28582: DATA: 28397
-28583: DATA: 4031
-28584: DATA: 12124
-28585: DATA: 19649
-28586: DATA: 28089
-28587: DATA: 3435
-28588: DATA: 10968
-28589: DATA: 19376
-28590: DATA: 27402
-28591: DATA: 2291
-28592: DATA: 10258
-28593: DATA: 18775
-28594: DATA: 26354
-28595: DATA: 30308
-28596: DATA: 20206
-28597: DATA: 11697
-28598: DATA: 3382
-28599: DATA: 27862
-28600: DATA: 19459
-28601: DATA: 11257
-28602: DATA: 2934
-28603: DATA: 27341
-28604: DATA: 19026
-28605: DATA: 10638
-28606: DATA: 2394
-28607: DATA: 26825
-28608: DATA: 18514
-28609: DATA: 14292
-28610: DATA: 5891
-28611: DATA: 30402
-28612: DATA: 22102
-28613: DATA: 13776
-28614: DATA: 5495
-28615: DATA: 29939
-28616: DATA: 21525
-28617: DATA: 13208
-28618: DATA: 4973
-28619: DATA: 29396
-28620: DATA: 21181
-28621: DATA: 11095
-28622: DATA: 444
-28623: DATA: 24879
-28624: DATA: 16724
-28625: DATA: 8359
-28626: DATA: 23
-28627: DATA: 28589
-28628: DATA: 20369
-28629: DATA: 12150
-28630: DATA: 3754
-28631: DATA: 28356
-28632: DATA: 20033
-28633: DATA: 11683
-28634: DATA: 3568
-28635: DATA: 27914
-28636: DATA: 19796
-28637: DATA: 11464
-28638: DATA: 3282
-28639: DATA: 27656
-28640: DATA: 19520
-28641: DATA: 11156
-28642: DATA: 2949
-28643: DATA: 27420
-28644: DATA: 19294
-28645: DATA: 10968
-28646: DATA: 2785
-28647: DATA: 27199
-28648: DATA: 19009
-28649: DATA: 10823
-28650: DATA: 2476
-28651: DATA: 27116
-28652: DATA: 18905
-28653: DATA: 10600
-28654: DATA: 2321
-28655: DATA: 26984
-28656: DATA: 18756
-28657: DATA: 10464
-28658: DATA: 2182
-28659: DATA: 26855
-28660: DATA: 18648
-28661: DATA: 10294
-28662: DATA: 2155
-28663: DATA: 26746
-28664: DATA: 16666
-28665: DATA: 16323
-28666: DATA: 8160
-28667: DATA: 32711
-28668: DATA: 24475
-28669: DATA: 16338
-28670: DATA: 8131
-28671: DATA: 32715
-28672: DATA: 24520
-28673: DATA: 16335
-28674: DATA: 8079
-28675: DATA: 32726
-28676: DATA: 24531
-28677: DATA: 16343
-28678: DATA: 8111
-28679: DATA: 24955
-28680: DATA: 27868
-28681: DATA: 3204
-28682: DATA: 11446
-28683: DATA: 19633
-28684: DATA: 27715
-28685: DATA: 3125
-28686: DATA: 11276
-28687: DATA: 19509
-28688: DATA: 28121
-28689: DATA: 3517
-28690: DATA: 11668
-28691: DATA: 19888
-28692: DATA: 27978
-28693: DATA: 3441
-28694: DATA: 11573
-28695: DATA: 20162
-28696: DATA: 28303
-28697: DATA: 3769
-28698: DATA: 11832
-28699: DATA: 19978
-28700: DATA: 28636
-28701: DATA: 3984
-28702: DATA: 12118
-28703: DATA: 20317
-28704: DATA: 26831
-28705: DATA: 2193
-28706: DATA: 10327
-28707: DATA: 18433
-28708: DATA: 27010
-28709: DATA: 2543
-28710: DATA: 1202
-28711: DATA: 13571
-28712: DATA: 5760
-28713: DATA: 30210
-28714: DATA: 22062
-28715: DATA: 14309
-28716: DATA: 5974
-28717: DATA: 30586
-28718: DATA: 22663
-28719: DATA: 14462
-28720: DATA: 6610
-28721: DATA: 31153
-28722: DATA: 22802
-28723: DATA: 15034
-28724: DATA: 6743
-28725: DATA: 31266
-28726: DATA: 23474
-28727: DATA: 15170
-28728: DATA: 7327
-28729: DATA: 31843
-28730: DATA: 24036
-28731: DATA: 15710
-28732: DATA: 7811
-28733: DATA: 32345
-28734: DATA: 24536
-28735: DATA: 16219
-28736: DATA: 221
-28737: DATA: 24606
-28738: DATA: 16791
-28739: DATA: 8526
-28740: DATA: 715
-28741: DATA: 25167
-28742: DATA: 17390
-28743: DATA: 8994
-28744: DATA: 1170
-28745: DATA: 25616
-28746: DATA: 17842
-28747: DATA: 9578
-28748: DATA: 1602
-28749: DATA: 26614
-28750: DATA: 18203
-28751: DATA: 10482
-28752: DATA: 2497
-28753: DATA: 26999
-28754: DATA: 19099
-28755: DATA: 10815
-28756: DATA: 2882
-28757: DATA: 27897
-28758: DATA: 19506
-28759: DATA: 11590
-28760: DATA: 3795
-28761: DATA: 28205
-28762: DATA: 20345
-28763: DATA: 20638
-28764: DATA: 12748
-28765: DATA: 4442
-28766: DATA: 29251
-28767: DATA: 21402
-28768: DATA: 13526
-28769: DATA: 5202
-28770: DATA: 30033
-28771: DATA: 22166
-28772: DATA: 14284
-28773: DATA: 5893
-28774: DATA: 30821
-28775: DATA: 23020
-28776: DATA: 15097
-28777: DATA: 18951
-28778: DATA: 23186
-28779: DATA: 32253
-28780: DATA: 7303
-28781: DATA: 16167
-28782: DATA: 24092
-28783: DATA: 24931
-28784: DATA: 23
-28785: DATA: 8358
-28786: DATA: 17311
-28787: DATA: 25343
-28788: DATA: 1476
-28789: DATA: 9259
-28790: DATA: 18291
-28791: DATA: 26130
-28792: DATA: 2335
-28793: DATA: 10339
-28794: DATA: 19251
-28795: DATA: 27202
-28796: DATA: 3398
-28797: DATA: 11341
-28798: DATA: 20295
-28799: DATA: 28182
-28800: DATA: 29012
-28801: DATA: 4185
-28802: DATA: 13146
-28803: DATA: 21072
-28804: DATA: 29963
-28805: DATA: 5134
-28806: DATA: 14186
-28807: DATA: 22121
-28808: DATA: 30978
-28809: DATA: 6214
-28810: DATA: 15163
-28811: DATA: 23083
-28812: DATA: 32198
-28813: DATA: 7404
-28814: DATA: 16339
-28815: DATA: 24247
-28816: DATA: 24599
-28817: DATA: 885
-28818: DATA: 8735
-28819: DATA: 17719
-28820: DATA: 25796
-28821: DATA: 2021
-28822: DATA: 9971
-28823: DATA: 18496
-28824: DATA: 27397
-28825: DATA: 2601
-28826: DATA: 11774
-28827: DATA: 19662
-28828: DATA: 28243
-28829: DATA: 28950
-28830: DATA: 4310
-28831: DATA: 13270
-28832: DATA: 21849
-28833: DATA: 29721
-28834: DATA: 6081
-28835: DATA: 13962
-28836: DATA: 22607
-28837: DATA: 31566
-28838: DATA: 6903
-28839: DATA: 15785
-28840: DATA: 24344
-28841: DATA: 32468
-28842: DATA: 509
-28843: DATA: 8964
-28844: DATA: 12909
-28845: DATA: 7433
-28846: DATA: 32709
-28847: DATA: 24179
-28848: DATA: 12501
-28849: DATA: 5042
-28850: DATA: 29188
-28851: DATA: 21734
-28852: DATA: 14166
-28853: DATA: 5693
-28854: DATA: 2281
-28855: DATA: 27472
-28856: DATA: 19844
-28857: DATA: 11388
-28858: DATA: 3808
-28859: DATA: 24923
-28860: DATA: 17349
-28861: DATA: 8794
-28862: DATA: 1226
-28863: DATA: 26446
-28864: DATA: 22984
-28865: DATA: 14403
-28866: DATA: 6789
-28867: DATA: 32094
-28868: DATA: 24542
-28869: DATA: 15953
-28870: DATA: 4326
-28871: DATA: 29557
-28872: DATA: 21953
-28873: DATA: 13337
-28874: DATA: 5814
-28875: DATA: 2424
-28876: DATA: 27457
-28877: DATA: 19962
-28878: DATA: 11274
-28879: DATA: 3754
-28880: DATA: 24772
-28881: DATA: 17251
-28882: DATA: 9617
-28883: DATA: 1069
-28884: DATA: 26197
-28885: DATA: 22712
-28886: DATA: 15148
-28887: DATA: 7518
-28888: DATA: 32661
-28889: DATA: 24127
-28890: DATA: 12325
-28891: DATA: 4737
-28892: DATA: 29918
-28893: DATA: 22301
-28894: DATA: 18775
-28895: DATA: 11200
-28896: DATA: 3532
-28897: DATA: 27657
-28898: DATA: 20043
-28899: DATA: 8332
-28900: DATA: 651
-28901: DATA: 25970
-28902: DATA: 18191
-28903: DATA: 14832
-28904: DATA: 7105
-28905: DATA: 32146
-28906: DATA: 23568
-28907: DATA: 15990
-28908: DATA: 4164
-28909: DATA: 29371
-28910: DATA: 21648
-28911: DATA: 14049
-28912: DATA: 10445
-28913: DATA: 2912
-28914: DATA: 27926
-28915: DATA: 20333
-28916: DATA: 8517
-28917: DATA: 940
-28918: DATA: 26028
-28919: DATA: 18334
-28920: DATA: 14726
-28921: DATA: 7088
-28922: DATA: 32225
-28923: DATA: 24541
-28924: DATA: 12741
-28925: DATA: 5069
-28926: DATA: 30150
-28927: DATA: 22484
-28928: DATA: 18884
-28929: DATA: 11204
-28930: DATA: 3460
-28931: DATA: 28552
-28932: DATA: 16785
-28933: DATA: 9195
-28934: DATA: 1521
-28935: DATA: 26609
-28936: DATA: 22931
-28937: DATA: 15236
-28938: DATA: 7596
-28939: DATA: 32694
-28940: DATA: 20822
-28941: DATA: 13096
-28942: DATA: 5382
-28943: DATA: 30511
-28944: DATA: 26831
-28945: DATA: 19174
-28946: DATA: 11404
-28947: DATA: 3770
-28948: DATA: 24668
-28949: DATA: 17017
-28950: DATA: 9265
-28951: DATA: 6617
-28952: DATA: 31630
-28953: DATA: 23998
-28954: DATA: 16165
-28955: DATA: 4360
-28956: DATA: 29379
-28957: DATA: 21639
-28958: DATA: 13894
-28959: DATA: 10245
-28960: DATA: 3538
-28961: DATA: 28563
-28962: DATA: 16644
-28963: DATA: 9032
-28964: DATA: 1169
-28965: DATA: 26301
-28966: DATA: 22646
-28967: DATA: 14884
-28968: DATA: 8072
-28969: DATA: 29021
-28970: DATA: 21284
-28971: DATA: 13548
-28972: DATA: 5716
-28973: DATA: 2092
-28974: DATA: 28101
-28975: DATA: 20340
-28976: DATA: 8392
-28977: DATA: 685
-28978: DATA: 25600
-28979: DATA: 22952
-28980: DATA: 15173
-28981: DATA: 7479
-28982: DATA: 32485
-28983: DATA: 20499
-28984: DATA: 13710
-28985: DATA: 6013
-28986: DATA: 2293
-28987: DATA: 27220
-28988: DATA: 20436
-28989: DATA: 8540
-28990: DATA: 716
-28991: DATA: 25679
-28992: DATA: 22991
-28993: DATA: 15130
-28994: DATA: 7301
-28995: DATA: 32281
-28996: DATA: 21393
-28997: DATA: 13658
-28998: DATA: 5868
-28999: DATA: 2172
-29000: DATA: 28045
-29001: DATA: 20249
-29002: DATA: 8362
-29003: DATA: 566
-29004: DATA: 26385
-29005: DATA: 22769
-29006: DATA: 14848
-29007: DATA: 8097
-29008: DATA: 28883
-29009: DATA: 21107
-29010: DATA: 14283
-29011: DATA: 10602
-29012: DATA: 2619
-29013: DATA: 28562
-29014: DATA: 18770
-29015: DATA: 24168
-29016: DATA: 31631
-29017: DATA: 1316
-29018: DATA: 9764
-29019: DATA: 17294
-29020: DATA: 27857
-29021: DATA: 3586
-29022: DATA: 11073
-29023: DATA: 13505
-29024: DATA: 20949
-29025: DATA: 29457
-29026: DATA: 7172
-29027: DATA: 14726
-29028: DATA: 23262
-29029: DATA: 25689
-29030: DATA: 357
-29031: DATA: 8945
-29032: DATA: 20371
-29033: DATA: 26832
-29034: DATA: 2602
-29035: DATA: 6013
-29036: DATA: 12361
-29037: DATA: 24041
-29038: DATA: 32390
-29039: DATA: 7140
-29040: DATA: 9409
-29041: DATA: 17954
-29042: DATA: 25356
-29043: DATA: 3113
-29044: DATA: 10567
-29045: DATA: 19120
-29046: DATA: 22448
-29047: DATA: 28825
-29048: DATA: 7616
-29049: DATA: 16112
-29050: DATA: 23460
-29051: DATA: 25802
-29052: DATA: 476
-29053: DATA: 8896
-29054: DATA: 20419
-29055: DATA: 26825
-29056: DATA: 30164
-29057: DATA: 5761
-29058: DATA: 13260
-29059: DATA: 23756
-29060: DATA: 31185
-29061: DATA: 6877
-29062: DATA: 10213
-29063: DATA: 16626
-29064: DATA: 28040
-29065: DATA: 3732
-29066: DATA: 11242
-29067: DATA: 13561
-29068: DATA: 20752
-29069: DATA: 29277
-29070: DATA: 7948
-29071: DATA: 14372
-29072: DATA: 17536
-29073: DATA: 25069
-29074: DATA: 645
-29075: DATA: 12218
-29076: DATA: 18500
-29077: DATA: 21817
-29078: DATA: 30256
-29079: DATA: 4825
-29080: DATA: 16265
-29081: DATA: 22719
-29082: DATA: 25955
-29083: DATA: 1625
-29084: DATA: 8905
-29085: DATA: 20358
-29086: DATA: 26705
-29087: DATA: 30017
-29088: DATA: 4562
-29089: DATA: 12932
-29090: DATA: 24393
-29091: DATA: 30732
-29092: DATA: 1245
-29093: DATA: 8603
-29094: DATA: 16993
-29095: DATA: 28451
-29096: DATA: 3008
-29097: DATA: 5208
-29098: DATA: 12599
-29099: DATA: 23993
-29100: DATA: 32337
-29101: DATA: 6954
-29102: DATA: 10128
-29103: DATA: 16488
-29104: DATA: 27862
-29105: DATA: 2464
-29106: DATA: 10768
-29107: DATA: 14048
-29108: DATA: 21342
-29109: DATA: 31806
-29110: DATA: 6372
-29111: DATA: 9477
-29112: DATA: 16776
-29113: DATA: 25200
-29114: DATA: 3824
-29115: DATA: 11033
-29116: DATA: 14276
-29117: DATA: 20556
-29118: DATA: 31944
-29119: DATA: 6468
-29120: DATA: 9680
-29121: DATA: 17998
-29122: DATA: 25302
-29123: DATA: 3933
-29124: DATA: 11221
-29125: DATA: 13387
-29126: DATA: 20650
-29127: DATA: 32063
-29128: DATA: 6606
-29129: DATA: 14929
-29130: DATA: 18086
-29131: DATA: 25388
-29132: DATA: 3908
-29133: DATA: 11177
-29134: DATA: 13322
-29135: DATA: 20654
-29136: DATA: 31959
-29137: DATA: 6433
-29138: DATA: 9629
-29139: DATA: 17958
-29140: DATA: 25157
-29141: DATA: 3769
-29142: DATA: 11047
-29143: DATA: 14160
-29144: DATA: 21390
-29145: DATA: 31862
-29146: DATA: 6256
-29147: DATA: 9433
-29148: DATA: 16598
-29149: DATA: 27904
-29150: DATA: 2378
-29151: DATA: 5509
-29152: DATA: 12672
-29153: DATA: 21000
-29154: DATA: 32336
-29155: DATA: 6857
-29156: DATA: 9937
-29157: DATA: 17175
-29158: DATA: 28541
-29159: DATA: 2982
-29160: DATA: 6024
-29161: DATA: 13268
-29162: DATA: 23606
-29163: DATA: 30844
-29164: DATA: 1040
-29165: DATA: 8352
-29166: DATA: 19594
-29167: DATA: 26785
-29168: DATA: 29913
-29169: DATA: 4398
-29170: DATA: 15633
-29171: DATA: 22907
-29172: DATA: 25872
-29173: DATA: 425
-29174: DATA: 11685
-29175: DATA: 18834
-29176: DATA: 21899
-29177: DATA: 29119
-29178: DATA: 7588
-29179: DATA: 14745
-29180: DATA: 17891
-29181: DATA: 25030
-29182: DATA: 3529
-29183: DATA: 10692
-29184: DATA: 13775
-29185: DATA: 20943
-29186: DATA: 32193
-29187: DATA: 6537
-29188: DATA: 9667
-29189: DATA: 16860
-29190: DATA: 28129
-29191: DATA: 2556
-29192: DATA: 5523
-29193: DATA: 12753
-29194: DATA: 23984
-29195: DATA: 31158
-29196: DATA: 1296
-29197: DATA: 8545
-29198: DATA: 19717
-29199: DATA: 26935
-29200: DATA: 29893
-29201: DATA: 4257
-29202: DATA: 15488
-29203: DATA: 22715
-29204: DATA: 25681
-29205: DATA: 110
-29206: DATA: 11306
-29207: DATA: 19345
-29208: DATA: 22401
-29209: DATA: 29681
-29210: DATA: 8041
-29211: DATA: 15132
-29212: DATA: 18115
-29213: DATA: 25242
-29214: DATA: 3653
-29215: DATA: 10758
-29216: DATA: 12741
-29217: DATA: 24001
-29218: DATA: 31053
-29219: DATA: 1287
-29220: DATA: 8336
-29221: DATA: 19597
-29222: DATA: 26732
-29223: DATA: 29748
-29224: DATA: 5056
-29225: DATA: 16194
-29226: DATA: 23333
-29227: DATA: 26359
-29228: DATA: 596
-29229: DATA: 11881
-29230: DATA: 13708
-29231: DATA: 20836
-29232: DATA: 31954
-29233: DATA: 6308
-29234: DATA: 9310
-29235: DATA: 17283
-29236: DATA: 28474
-29237: DATA: 2937
-29238: DATA: 5860
-29239: DATA: 12881
-29240: DATA: 22976
-29241: DATA: 4582
-29242: DATA: 16302
-29243: DATA: 18031
-29244: DATA: 27713
-29245: DATA: 9031
-29246: DATA: 4267
-29247: DATA: 31790
-29248: DATA: 18412
-29249: DATA: 9040
-29250: DATA: 3713
-29251: DATA: 27214
-29252: DATA: 30160
-29253: DATA: 20827
-29254: DATA: 15592
-29255: DATA: 6266
-29256: DATA: 25494
-29257: DATA: 20308
-29258: DATA: 10933
-29259: DATA: 13875
-29260: DATA: 4373
-29261: DATA: 31998
-29262: DATA: 22528
-29263: DATA: 9133
-29264: DATA: 3787
-29265: DATA: 27178
-29266: DATA: 30145
-29267: DATA: 20844
-29268: DATA: 15457
-29269: DATA: 2036
-29270: DATA: 25380
-29271: DATA: 19988
-29272: DATA: 10632
-29273: DATA: 13617
-29274: DATA: 4210
-29275: DATA: 31631
-29276: DATA: 18132
-29277: DATA: 8715
-29278: DATA: 3396
-29279: DATA: 26820
-29280: DATA: 29650
-29281: DATA: 24325
-29282: DATA: 14930
-29283: DATA: 1412
-29284: DATA: 24784
-29285: DATA: 19471
-29286: DATA: 22305
-29287: DATA: 12981
-29288: DATA: 7570
-29289: DATA: 30933
-29290: DATA: 17464
-29291: DATA: 12082
-29292: DATA: 2581
-29293: DATA: 5612
-29294: DATA: 28856
-29295: DATA: 23531
-29296: DATA: 9936
-29297: DATA: 612
-29298: DATA: 27925
-29299: DATA: 18541
-29300: DATA: 21342
-29301: DATA: 16057
-29302: DATA: 6625
-29303: DATA: 25749
-29304: DATA: 20421
-29305: DATA: 10992
-29306: DATA: 13796
-29307: DATA: 4313
-29308: DATA: 31685
-29309: DATA: 18060
-29310: DATA: 8643
-29311: DATA: 3286
-29312: DATA: 6080
-29313: DATA: 29381
-29314: DATA: 24021
-29315: DATA: 14532
-29316: DATA: 917
-29317: DATA: 28381
-29318: DATA: 18927
-29319: DATA: 21744
-29320: DATA: 16325
-29321: DATA: 6802
-29322: DATA: 26020
-29323: DATA: 16569
-29324: DATA: 11097
-29325: DATA: 13868
-29326: DATA: 4359
-29327: DATA: 31789
-29328: DATA: 18135
-29329: DATA: 8681
-29330: DATA: 3213
-29331: DATA: 6069
-29332: DATA: 29205
-29333: DATA: 23931
-29334: DATA: 14387
-29335: DATA: 731
-29336: DATA: 28048
-29337: DATA: 18618
-29338: DATA: 21349
-29339: DATA: 15897
-29340: DATA: 6353
-29341: DATA: 25548
-29342: DATA: 20040
-29343: DATA: 10506
-29344: DATA: 13189
-29345: DATA: 7830
-29346: DATA: 31044
-29347: DATA: 17421
-29348: DATA: 11993
-29349: DATA: 2453
-29350: DATA: 5237
-29351: DATA: 32557
-29352: DATA: 22981
-29353: DATA: 9301
-29354: DATA: 3890
-29355: DATA: 27068
-29356: DATA: 29761
-29357: DATA: 24356
-29358: DATA: 14724
-29359: DATA: 1060
-29360: DATA: 28352
-29361: DATA: 18850
-29362: DATA: 21511
-29363: DATA: 16105
-29364: DATA: 6486
-29365: DATA: 25640
-29366: DATA: 20146
-29367: DATA: 10580
-29368: DATA: 13194
-29369: DATA: 7794
-29370: DATA: 30881
-29371: DATA: 17224
-29372: DATA: 11741
-29373: DATA: 2121
-29374: DATA: 4737
-29375: DATA: 32080
-29376: DATA: 18368
-29377: DATA: 8776
-29378: DATA: 3268
-29379: DATA: 5980
-29380: DATA: 29146
-29381: DATA: 23630
-29382: DATA: 9973
-29383: DATA: 373
-29384: DATA: 27537
-29385: DATA: 30237
-29386: DATA: 20654
-29387: DATA: 15154
-29388: DATA: 1301
-29389: DATA: 28667
-29390: DATA: 18948
-29391: DATA: 21669
-29392: DATA: 16087
-29393: DATA: 6436
-29394: DATA: 25486
-29395: DATA: 20010
-29396: DATA: 10323
-29397: DATA: 12978
-29398: DATA: 7499
-29399: DATA: 26430
-29400: DATA: 22404
-29401: DATA: 22931
-29402: DATA: 17319
-29403: DATA: 25865
-29404: DATA: 3911
-29405: DATA: 12440
-29406: DATA: 23238
-29407: DATA: 31756
-29408: DATA: 26180
-29409: DATA: 2951
-29410: DATA: 11659
-29411: DATA: 22346
-29412: DATA: 31062
-29413: DATA: 25238
-29414: DATA: 1250
-29415: DATA: 11825
-29416: DATA: 20503
-29417: DATA: 31296
-29418: DATA: 8104
-29419: DATA: 500
-29420: DATA: 11226
-29421: DATA: 19753
-29422: DATA: 30535
-29423: DATA: 6516
-29424: DATA: 844
-29425: DATA: 9387
-29426: DATA: 20100
-29427: DATA: 28911
-29428: DATA: 6803
-29429: DATA: 15411
-29430: DATA: 9780
-29431: DATA: 18514
-29432: DATA: 29203
-29433: DATA: 5216
-29434: DATA: 15976
-29435: DATA: 8272
-29436: DATA: 19030
-29437: DATA: 27721
-29438: DATA: 5715
-29439: DATA: 14407
-29440: DATA: 8775
-29441: DATA: 17410
-29442: DATA: 28238
-29443: DATA: 4164
-29444: DATA: 14919
-29445: DATA: 23637
-29446: DATA: 17959
-29447: DATA: 26731
-29448: DATA: 4620
-29449: DATA: 13319
-29450: DATA: 24117
-29451: DATA: 16506
-29452: DATA: 27358
-29453: DATA: 3299
-29454: DATA: 13961
-29455: DATA: 22694
-29456: DATA: 17177
-29457: DATA: 25864
-29458: DATA: 3949
-29459: DATA: 12650
-29460: DATA: 23443
-29461: DATA: 32184
-29462: DATA: 26506
-29463: DATA: 3675
-29464: DATA: 12304
-29465: DATA: 23089
-29466: DATA: 31974
-29467: DATA: 26262
-29468: DATA: 2394
-29469: DATA: 13064
-29470: DATA: 21973
-29471: DATA: 32643
-29472: DATA: 26199
-29473: DATA: 2059
-29474: DATA: 13000
-29475: DATA: 21636
-29476: DATA: 32531
-29477: DATA: 24862
-29478: DATA: 3042
-29479: DATA: 11686
-29480: DATA: 21510
-29481: DATA: 32465
-29482: DATA: 24755
-29483: DATA: 2943
-29484: DATA: 11735
-29485: DATA: 22507
-29486: DATA: 32327
-29487: DATA: 24738
-29488: DATA: 2914
-29489: DATA: 11552
-29490: DATA: 22408
-29491: DATA: 32376
-29492: DATA: 24775
-29493: DATA: 2739
-29494: DATA: 11561
-29495: DATA: 22421
-29496: DATA: 32323
-29497: DATA: 24806
-29498: DATA: 2914
-29499: DATA: 11734
-29500: DATA: 21590
-29501: DATA: 32474
-29502: DATA: 24904
-29503: DATA: 3024
-29504: DATA: 12887
-29505: DATA: 21699
-29506: DATA: 32595
-29507: DATA: 25027
-29508: DATA: 2140
-29509: DATA: 13012
-29510: DATA: 21798
-29511: DATA: 32688
-29512: DATA: 26217
-29513: DATA: 2296
-29514: DATA: 13065
-29515: DATA: 21941
-29516: DATA: 31943
-29517: DATA: 26466
-29518: DATA: 2446
-29519: DATA: 12332
-29520: DATA: 23364
-29521: DATA: 32162
-29522: DATA: 25602
-29523: DATA: 3750
-29524: DATA: 12736
-29525: DATA: 22655
-29526: DATA: 17127
-29527: DATA: 26049
-29528: DATA: 3078
-29529: DATA: 14007
-29530: DATA: 23018
-29531: DATA: 16393
-29532: DATA: 27411
-29533: DATA: 3486
-29534: DATA: 13512
-29535: DATA: 24386
-29536: DATA: 17995
-29537: DATA: 26755
-29538: DATA: 5079
-29539: DATA: 14874
-29540: DATA: 23894
-29541: DATA: 18324
-29542: DATA: 28329
-29543: DATA: 4440
-29544: DATA: 14441
-29545: DATA: 16432
-29546: DATA: 32658
-29547: DATA: 22265
-29548: DATA: 11722
-29549: DATA: 1126
-29550: DATA: 6922
-29551: DATA: 29293
-29552: DATA: 18779
-29553: DATA: 12199
-29554: DATA: 1693
-29555: DATA: 7655
-29556: DATA: 29899
-29557: DATA: 19251
-29558: DATA: 8811
-29559: DATA: 14602
-29560: DATA: 4103
-29561: DATA: 30587
-29562: DATA: 20011
-29563: DATA: 9538
-29564: DATA: 15450
-29565: DATA: 4938
-29566: DATA: 27214
-29567: DATA: 16734
-29568: DATA: 22592
-29569: DATA: 16220
-29570: DATA: 5727
-29571: DATA: 27971
-29572: DATA: 17485
-29573: DATA: 23319
-29574: DATA: 12843
-29575: DATA: 2366
-29576: DATA: 24622
-29577: DATA: 18189
-29578: DATA: 24171
-29579: DATA: 13615
-29580: DATA: 3280
-29581: DATA: 25587
-29582: DATA: 31435
-29583: DATA: 20925
-29584: DATA: 10591
-29585: DATA: 103
-29586: DATA: 26393
-29587: DATA: 32295
-29588: DATA: 21971
-29589: DATA: 11446
-29590: DATA: 959
-29591: DATA: 6998
-29592: DATA: 29213
-29593: DATA: 18737
-29594: DATA: 8446
-29595: DATA: 1937
-29596: DATA: 8023
-29597: DATA: 30278
-29598: DATA: 19935
-29599: DATA: 9351
-29600: DATA: 15426
-29601: DATA: 4875
-29602: DATA: 27275
-29603: DATA: 16775
-29604: DATA: 22865
-29605: DATA: 12306
-29606: DATA: 6059
-29607: DATA: 28333
-29608: DATA: 17951
-29609: DATA: 24031
-29610: DATA: 13480
-29611: DATA: 3187
-29612: DATA: 25491
-29613: DATA: 31462
-29614: DATA: 21010
-29615: DATA: 10721
-29616: DATA: 346
-29617: DATA: 6254
-29618: DATA: 32671
-29619: DATA: 22382
-29620: DATA: 11990
-29621: DATA: 1464
-29622: DATA: 7456
-29623: DATA: 29918
-29624: DATA: 19478
-29625: DATA: 9201
-29626: DATA: 15230
-29627: DATA: 4758
-29628: DATA: 27212
-29629: DATA: 16835
-29630: DATA: 22862
-29631: DATA: 12430
-29632: DATA: 2126
-29633: DATA: 28558
-29634: DATA: 18267
-29635: DATA: 24263
-29636: DATA: 13899
-29637: DATA: 3522
-29638: DATA: 25966
-29639: DATA: 31980
-29640: DATA: 21505
-29641: DATA: 11230
-29642: DATA: 802
-29643: DATA: 6840
-29644: DATA: 29343
-29645: DATA: 19058
-29646: DATA: 8579
-29647: DATA: 14635
-29648: DATA: 4367
-29649: DATA: 26877
-29650: DATA: 16415
-29651: DATA: 10151
-29652: DATA: 16333
-29653: DATA: 5989
-29654: DATA: 28389
-29655: DATA: 18064
-29656: DATA: 24129
-29657: DATA: 13780
-29658: DATA: 3457
-29659: DATA: 25942
-29660: DATA: 32031
-29661: DATA: 21702
-29662: DATA: 11403
-29663: DATA: 23830
-29664: DATA: 15733
-29665: DATA: 23161
-29666: DATA: 660
-29667: DATA: 31300
-29668: DATA: 19499
-29669: DATA: 26082
-29670: DATA: 7636
-29671: DATA: 13606
-29672: DATA: 11525
-29673: DATA: 17733
-29674: DATA: 32423
-29675: DATA: 5800
-29676: DATA: 3776
-29677: DATA: 9848
-29678: DATA: 24083
-29679: DATA: 30325
-29680: DATA: 28230
-29681: DATA: 2032
-29682: DATA: 16280
-29683: DATA: 22519
-29684: DATA: 20428
-29685: DATA: 26413
-29686: DATA: 7995
-29687: DATA: 14100
-29688: DATA: 12034
-29689: DATA: 18220
-29690: DATA: 32565
-29691: DATA: 5969
-29692: DATA: 3918
-29693: DATA: 10061
-29694: DATA: 24341
-29695: DATA: 30550
-29696: DATA: 28504
-29697: DATA: 1886
-29698: DATA: 16209
-29699: DATA: 22296
-29700: DATA: 20312
-29701: DATA: 26439
-29702: DATA: 8032
-29703: DATA: 14194
-29704: DATA: 12034
-29705: DATA: 18181
-29706: DATA: 32569
-29707: DATA: 5934
-29708: DATA: 3969
-29709: DATA: 10234
-29710: DATA: 24468
-29711: DATA: 30643
-29712: DATA: 28250
-29713: DATA: 1584
-29714: DATA: 15898
-29715: DATA: 22070
-29716: DATA: 20097
-29717: DATA: 26363
-29718: DATA: 7866
-29719: DATA: 13644
-29720: DATA: 11544
-29721: DATA: 17700
-29722: DATA: 32181
-29723: DATA: 5519
-29724: DATA: 3155
-29725: DATA: 9239
-29726: DATA: 23744
-29727: DATA: 29854
-29728: DATA: 27477
-29729: DATA: 848
-29730: DATA: 15316
-29731: DATA: 21398
-29732: DATA: 19013
-29733: DATA: 25160
-29734: DATA: 6900
-29735: DATA: 13024
-29736: DATA: 10525
-29737: DATA: 16841
-29738: DATA: 31137
-29739: DATA: 4220
-29740: DATA: 2253
-29741: DATA: 8381
-29742: DATA: 22357
-29743: DATA: 20468
-29744: DATA: 26200
-29745: DATA: 7715
-29746: DATA: 13978
-29747: DATA: 11626
-29748: DATA: 17864
-29749: DATA: 32173
-29750: DATA: 5179
-29751: DATA: 3220
-29752: DATA: 8980
-29753: DATA: 23524
-29754: DATA: 29243
-29755: DATA: 27298
-29756: DATA: 299
-29757: DATA: 5989
-29758: DATA: 31341
-29759: DATA: 25310
-29760: DATA: 21829
-29761: DATA: 15761
-29762: DATA: 9299
-29763: DATA: 3288
-29764: DATA: 30554
-29765: DATA: 24524
-29766: DATA: 17972
-29767: DATA: 12008
-29768: DATA: 4382
-29769: DATA: 31125
-29770: DATA: 24635
-29771: DATA: 18665
-29772: DATA: 13268
-29773: DATA: 6769
-29774: DATA: 657
-29775: DATA: 30065
-29776: DATA: 23645
-29777: DATA: 17656
-29778: DATA: 12038
-29779: DATA: 6059
-29780: DATA: 32463
-29781: DATA: 24955
-29782: DATA: 18936
-29783: DATA: 12417
-29784: DATA: 6929
-29785: DATA: 943
-29786: DATA: 27376
-29787: DATA: 23881
-29788: DATA: 17497
-29789: DATA: 11414
-29790: DATA: 6081
-29791: DATA: 32337
-29792: DATA: 24899
-29793: DATA: 18836
-29794: DATA: 12497
-29795: DATA: 7001
-29796: DATA: 601
-29797: DATA: 27270
-29798: DATA: 24033
-29799: DATA: 17459
-29800: DATA: 12035
-29801: DATA: 5700
-29802: DATA: 32440
-29803: DATA: 25071
-29804: DATA: 18560
-29805: DATA: 13118
-29806: DATA: 6677
-29807: DATA: 3435
-29808: DATA: 29785
-29809: DATA: 23743
-29810: DATA: 18323
-29811: DATA: 11961
-29812: DATA: 4546
-29813: DATA: 30760
-29814: DATA: 25399
-29815: DATA: 18954
-29816: DATA: 15710
-29817: DATA: 9249
-29818: DATA: 3892
-29819: DATA: 30315
-29820: DATA: 22869
-29821: DATA: 16461
-29822: DATA: 11028
-29823: DATA: 4678
-29824: DATA: 1361
-29825: DATA: 27736
-29826: DATA: 22336
-29827: DATA: 15896
-29828: DATA: 8448
-29829: DATA: 2057
-29830: DATA: 29533
-29831: DATA: 23157
-29832: DATA: 19792
-29833: DATA: 13325
-29834: DATA: 7995
-29835: DATA: 1574
-29836: DATA: 27083
-29837: DATA: 20714
-29838: DATA: 15316
-29839: DATA: 8893
-29840: DATA: 5209
-29841: DATA: 32634
-29842: DATA: 26129
-29843: DATA: 18809
-29844: DATA: 12499
-29845: DATA: 7142
-29846: DATA: 697
-29847: DATA: 29764
-29848: DATA: 24351
-29849: DATA: 17967
-29850: DATA: 10737
-29851: DATA: 4297
-29852: DATA: 31319
-29853: DATA: 27915
-29854: DATA: 21723
-29855: DATA: 16261
-29856: DATA: 8533
-29857: DATA: 2129
-29858: DATA: 29659
-29859: DATA: 23191
-29860: DATA: 19456
-29861: DATA: 14096
-29862: DATA: 7931
-29863: DATA: 436
-29864: DATA: 27394
-29865: DATA: 21121
-29866: DATA: 17842
-29867: DATA: 12136
-29868: DATA: 5827
-29869: DATA: 31164
-29870: DATA: 25428
-29871: DATA: 19174
-29872: DATA: 15448
-29873: DATA: 10040
-29874: DATA: 3736
-29875: DATA: 28796
-29876: DATA: 23424
-29877: DATA: 17072
-29878: DATA: 13371
-29879: DATA: 8084
-29880: DATA: 336
-29881: DATA: 26870
-29882: DATA: 21105
-29883: DATA: 17883
-29884: DATA: 12101
-29885: DATA: 5785
-29886: DATA: 30785
-29887: DATA: 25567
-29888: DATA: 21843
-29889: DATA: 15582
-29890: DATA: 9818
-29891: DATA: 2506
-29892: DATA: 29507
-29893: DATA: 23232
-29894: DATA: 19579
-29895: DATA: 14324
-29896: DATA: 6403
-29897: DATA: 193
-29898: DATA: 27195
-29899: DATA: 23975
-29900: DATA: 18304
-29901: DATA: 10605
-29902: DATA: 4252
-29903: DATA: 31284
-29904: DATA: 27664
-29905: DATA: 22515
-29906: DATA: 14609
-29907: DATA: 8376
-29908: DATA: 2755
-29909: DATA: 31841
-29910: DATA: 26613
-29911: DATA: 18817
-29912: DATA: 13136
-29913: DATA: 6805
-29914: DATA: 3324
-29915: DATA: 30235
-29916: DATA: 22607
-29917: DATA: 17292
-29918: DATA: 13779
-29919: DATA: 7961
-29920: DATA: 272
-29921: DATA: 26757
-29922: DATA: 21212
-29923: DATA: 17436
-29924: DATA: 11776
-29925: DATA: 4484
-29926: DATA: 31741
-29927: DATA: 27955
-29928: DATA: 22274
-29929: DATA: 14670
-29930: DATA: 8358
-29931: DATA: 2725
-29932: DATA: 31872
-29933: DATA: 26144
-29934: DATA: 18459
-29935: DATA: 12900
-29936: DATA: 9232
-29937: DATA: 4002
-29938: DATA: 29073
-29939: DATA: 23548
-29940: DATA: 19840
-29941: DATA: 14187
-29942: DATA: 7475
-29943: DATA: 12503
-29944: DATA: 29132
-29945: DATA: 23154
-29946: DATA: 17687
-29947: DATA: 6145
-29948: DATA: 11786
-29949: DATA: 13376
-29950: DATA: 23133
-29951: DATA: 24649
-29952: DATA: 30299
-29953: DATA: 7244
-29954: DATA: 8786
-29955: DATA: 18518
-29956: DATA: 24142
-29957: DATA: 25603
-29958: DATA: 2679
-29959: DATA: 4197
-29960: DATA: 9818
-29961: DATA: 19464
-29962: DATA: 21046
-29963: DATA: 30754
-29964: DATA: 3800
-29965: DATA: 5360
-29966: DATA: 14993
-29967: DATA: 16570
-29968: DATA: 22358
-29969: DATA: 32059
-29970: DATA: 785
-29971: DATA: 10557
-29972: DATA: 16266
-29973: DATA: 17914
-29974: DATA: 27569
-29975: DATA: 32350
-29976: DATA: 1032
-29977: DATA: 10859
-29978: DATA: 12536
-29979: DATA: 18060
-29980: DATA: 27992
-29981: DATA: 29462
-29982: DATA: 6614
-29983: DATA: 12190
-29984: DATA: 12891
-29985: DATA: 22559
-29986: DATA: 28304
-29987: DATA: 29945
-29988: DATA: 6944
-29989: DATA: 8480
-29990: DATA: 14321
-29991: DATA: 23973
-29992: DATA: 24605
-29993: DATA: 30425
-29994: DATA: 7359
-29995: DATA: 9079
-29996: DATA: 18911
-29997: DATA: 24511
-29998: DATA: 25119
-29999: DATA: 2287
-30000: DATA: 8019
-30001: DATA: 9524
-30002: DATA: 19344
-30003: DATA: 24160
-30004: DATA: 25745
-30005: DATA: 2787
-30006: DATA: 4391
-30007: DATA: 10116
-30008: DATA: 18959
-30009: DATA: 20651
-30010: DATA: 26486
-30011: DATA: 3522
-30012: DATA: 4188
-30013: DATA: 9942
-30014: DATA: 19742
-30015: DATA: 21449
-30016: DATA: 26207
-30017: DATA: 3290
-30018: DATA: 4957
-30019: DATA: 14811
-30020: DATA: 19535
-30021: DATA: 21191
-30022: DATA: 31038
-30023: DATA: 4095
-30024: DATA: 4626
-30025: DATA: 14478
-30026: DATA: 20350
-30027: DATA: 21926
-30028: DATA: 30916
-30029: DATA: 3959
-30030: DATA: 5598
-30031: DATA: 14388
-30032: DATA: 20316
-30033: DATA: 21947
-30034: DATA: 30730
-30035: DATA: 3771
-30036: DATA: 5583
-30037: DATA: 14371
-30038: DATA: 20157
-30039: DATA: 21955
-30040: DATA: 30747
-30041: DATA: 3751
-30042: DATA: 5618
-30043: DATA: 14342
-30044: DATA: 20292
-30045: DATA: 21908
-30046: DATA: 30939
-30047: DATA: 3930
-30048: DATA: 4656
-30049: DATA: 14577
+1744:  CALL sub_2125
+1746:  POP  r1
+1748:  WMEM r1    r0
+1751:  ADD  r1    r1    1
+1755:  EQ   r0    30050 r1
+1759:  JF   r0    loc_1730
+1762:  POP  r1
+1764:  POP  r0
+1766:  RET
+1767:  DATA 2, 32768, 2, 32770, 2, 32771, 2, 32772
+1775:  DATA 2, 32773, 9, 32770, 32769, 32768, 1, 32768
+1783:  DATA 32769, 1, 32773, 0, 9, 32768, 32768, 1
+1791:  DATA 5, 32771, 32768, 32770, 7, 32771, 1816, 20
+1799:  DATA 32772, 4, 32771, 32772, 10, 7, 32771, 1816
+1807:  DATA 16, 32768, 32772, 9, 32773, 32773, 1, 6
+1815:  DATA 1787, 16, 32769, 32773, 4, 32771, 32772, 10
+1823:  DATA 7, 32771, 1830, 20, 32772, 6, 1819, 3
+1831:  DATA 32773, 3, 32772, 3, 32771, 3, 32770, 3
+1839:  DATA 32768, 18, 2, 32771, 2, 32772, 2, 32773
+1847:  DATA 2, 32774, 1, 32774, 1, 9, 32772, 32771
+1855:  DATA 32774, 15, 32772, 32772, 9, 32773, 6125, 32774
+1863:  DATA 16, 32773, 32772, 9, 32774, 32774, 1, 15
+1871:  DATA 32773, 6125, 5, 32772, 32774, 32773, 8, 32772
+1879:  DATA 1852, 1, 32771, 0, 1, 32772, 0, 15
+1887:  DATA 32773, 6125, 11, 32773, 32772, 32773, 9, 32773
+1895:  DATA 32773, 6125, 9, 32773, 32773, 1, 15, 32774
+1903:  DATA 32773, 10, 32774, 32774, 5249, 9, 32774, 32774
+1911:  DATA 12345, 16, 32773, 32774, 2, 32768, 2, 32769
+1919:  DATA 1, 32769, 32774, 17, 2125, 1, 32774, 32768
+1927:  DATA 3, 32769, 3, 32768, 15, 32773, 32769, 11
+1935:  DATA 32774, 32774, 32773, 9, 32774, 32774, 1, 5
+1943:  DATA 32773, 32774, 32770, 7, 32773, 1952, 1, 32771
+1951:  DATA 1, 9, 32774, 32774, 32769, 15, 32774, 32774
+1959:  DATA 9, 32772, 32772, 1, 9, 32773, 32772, 6129
+1967:  DATA 16, 32773, 32774, 15, 32773, 6129, 4, 32773
+1975:  DATA 32772, 32773, 8, 32773, 1886, 8, 32771, 1880
+1983:  DATA 2, 32768, 1, 32768, 6129, 17, 1518, 3
+1991:  DATA 32768, 3, 32774, 3, 32773, 3, 32772, 3
+1999:  DATA 32771, 18, 2, 32768, 2, 32769, 2, 32770
+2007:  DATA 2, 32771, 2, 32772, 2, 32773, 1, 32770
+2015:  DATA 1, 1, 32773, 0, 8, 32768, 2092, 4
+2023:  DATA 32772, 32770, 10000, 1, 32771, 32768, 7, 32772
+2031:  DATA 2040, 10, 32769, 32770, 10, 11, 32771, 32768
+2039:  DATA 32769, 1, 32772, 0, 10, 32770, 32770, 32767
+2047:  DATA 8, 32771, 2060, 9, 32772, 32772, 1, 9
+2055:  DATA 32771, 32771, 32770, 6, 2047, 10, 32770, 32770
+2063:  DATA 32767, 10, 32771, 32772, 32770, 10, 32771, 32771
+2071:  DATA 32767, 9, 32768, 32768, 32771, 9, 32772, 32772
+2079:  DATA 48, 10, 32770, 32770, 10, 9, 32773, 32773
+2087:  DATA 1, 2, 32772, 6, 2019, 7, 32773, 2099
+2095:  DATA 19, 48, 6, 2112, 8, 32773, 2112, 3
+2103:  DATA 32768, 19, 32768, 9, 32773, 32773, 32767, 6
+2111:  DATA 2099, 3, 32773, 3, 32772, 3, 32771, 3
+2119:  DATA 32770, 3, 32769, 3, 32768, 18
+
+sub_2125:
+2125:  PUSH r1
+2127:  PUSH r2
+2129:  AND  r2    r0    r1
+2133:  NOT  r2    r2
+2136:  OR   r0    r0    r1
+2140:  AND  r0    r0    r2
+2144:  POP  r2
+2146:  POP  r1
+2148:  RET
+2149:  DATA 9, 32768, 32768, 32769, 5, 32769, 32769, 32768
+2157:  DATA 18, 2, 32770, 5, 32770, 32769, 32768, 10
+2165:  DATA 32769, 32769, 32767, 9, 32768, 32768, 32769, 1
+2173:  DATA 32769, 32770, 3, 32770, 18, 8, 32768, 2241
+2181:  DATA 8, 32769, 2241, 2, 32770, 2, 32771, 5
+2189:  DATA 32770, 32769, 32768, 7, 32770, 2204, 1, 32770
+2197:  DATA 32768, 1, 32768, 32769, 1, 32769, 32770, 1
+2205:  DATA 32770, 32768, 1, 32768, 0, 9, 32768, 32768
+2213:  DATA 32769, 5, 32771, 32769, 32768, 7, 32771, 2233
+2221:  DATA 9, 32770, 32770, 32767, 7, 32770, 2210, 1
+2229:  DATA 32769, 0, 6, 2236, 1, 32769, 1, 3
+2237:  DATA 32771, 3, 32770, 18, 1, 32768, 0, 1
+2245:  DATA 32769, 0, 18, 2, 32769, 2, 32770, 8
+2253:  DATA 32769, 2276, 9, 32769, 32769, 32767, 12, 32770
+2261:  DATA 32768, 16384, 10, 32768, 32768, 2, 8, 32770
+2269:  DATA 2252, 13, 32768, 32768, 1, 6, 2252, 3
+2277:  DATA 32770, 3, 32769, 18, 2, 32769, 5, 32769
+2285:  DATA 32768, 14, 7, 32769, 2309, 1, 32769, 32768
+2293:  DATA 1, 32768, 1, 8, 32769, 2312, 9, 32769
+2301:  DATA 32769, 32767, 10, 32768, 32768, 2, 6, 2296
+2309:  DATA 1, 32768, 32767, 3, 32769, 18, 6, 2734
+2317:  DATA 6142, 6152, 26900, 26903, 0, 6350, 6360, 26906
+2325:  DATA 26908, 0, 6441, 6451, 26910, 26913, 0, 6597
+2333:  DATA 6607, 26916, 26919, 0, 6711, 6721, 26922, 26925
+2341:  DATA 0, 6922, 6934, 26928, 26931, 0, 7070, 7095
+2349:  DATA 26934, 26936, 0, 7270, 7282, 26938, 26941, 0
+2357:  DATA 7502, 7514, 26944, 26946, 0, 7616, 7628, 26948
+2365:  DATA 26951, 0, 7799, 7807, 26954, 26958, 0, 8007
+2373:  DATA 26962, 26965, 26968, 0, 8163, 8179, 26971, 26977
+2381:  DATA 3742, 8332, 8348, 26983, 26987, 3746, 8421, 8437
+2389:  DATA 26991, 26995, 3756, 8510, 8526, 26999, 27004, 3766
+2397:  DATA 8673, 8689, 27009, 27013, 3776, 8762, 8778, 27017
+2405:  DATA 27022, 3786, 8932, 8948, 27027, 27031, 3796, 9021
+2413:  DATA 9037, 27035, 27037, 3806, 9098, 9114, 27039, 27041
+2421:  DATA 0, 9175, 9191, 27043, 27046, 3656, 9259, 9272
+2429:  DATA 27049, 27052, 3656, 9397, 9410, 27055, 27058, 3656
+2437:  DATA 9455, 9468, 27061, 27064, 3656, 9513, 9526, 27067
+2445:  DATA 27070, 3656, 9637, 9643, 27073, 27076, 0, 9903
+2453:  DATA 9909, 27079, 27082, 0, 10103, 10109, 27085, 27090
+2461:  DATA 0, 0, 10425, 10431, 27107, 27109, 3893, 10605
+2469:  DATA 10611, 27111, 27114, 0, 10760, 10766, 27117, 27119
+2477:  DATA 0, 10892, 10898, 27121, 27124, 0, 11086, 11092
+2485:  DATA 27127, 27129, 0, 11267, 11288, 27131, 27133, 0
+2493:  DATA 11552, 11573, 27135, 27137, 0, 11726, 11732, 27139
+2501:  DATA 27143, 0, 11919, 11925, 27147, 27150, 0, 12199
+2509:  DATA 12205, 27153, 27156, 0, 12459, 12475, 27159, 27163
+2517:  DATA 0, 12691, 12707, 27167, 27171, 0, 12847, 12863
+2525:  DATA 27175, 27178, 0, 13106, 13122, 27181, 27184, 0
+2533:  DATA 13420, 13436, 27187, 27190, 0, 13694, 13708, 27193
+2541:  DATA 27196, 0, 13941, 13955, 27199, 27202, 0, 14090
+2549:  DATA 14104, 27205, 27209, 0, 14444, 14465, 27213, 27215
+2557:  DATA 0, 14634, 14648, 27217, 27220, 4611, 14765, 14776
+2565:  DATA 27223, 27226, 3958, 14916, 14927, 27229, 27233, 3975
+2573:  DATA 15074, 15085, 27237, 27241, 3992, 15230, 15241, 27245
+2581:  DATA 27249, 4009, 15505, 15516, 27253, 27257, 4028, 15664
+2589:  DATA 15675, 27261, 27266, 4045, 15826, 15837, 27271, 27276
+2597:  DATA 4062, 15991, 16002, 27281, 27285, 4079, 16148, 16159
+2605:  DATA 27289, 27293, 4096, 16305, 16316, 27297, 27302, 4113
+2613:  DATA 16469, 16480, 27307, 27312, 4130, 16631, 16642, 27317
+2621:  DATA 27321, 4147, 16791, 16809, 27325, 27329, 4164, 16971
+2629:  DATA 16982, 27333, 27337, 4167, 17127, 17138, 27341, 27345
+2637:  DATA 4184, 17285, 17296, 27349, 27352, 4201, 17436, 17442
+2645:  DATA 27355, 27357, 4690, 17661, 17693, 27359, 27362, 0
+2653:  DATA 17806, 17838, 27365, 27368, 0, 17949, 17967, 27371
+2661:  DATA 27375, 0, 18055, 18061, 27379, 27380, 3701, 18062
+2669:  DATA 18069, 2317, 4720, 18206, 18220, 2357, 0, 18344
+2677:  DATA 18352, 32767, 4885, 18468, 18480, 32767, 4931, 18568
+2685:  DATA 18572, 2417, 4799, 18618, 18627, 2452, 5360, 18691
+2693:  DATA 18705, 2473, 5377, 18769, 18780, 2483, 5394, 18852
+2701:  DATA 18865, 2468, 5411, 18953, 18963, 2478, 5428, 19029
+2709:  DATA 19040, 2463, 5445, 19113, 19127, 2488, 0, 19192
+2717:  DATA 19196, 2623, 0, 19258, 19265, 2643, 5721, 19384
+2725:  DATA 19397, 2488, 0, 22093, 22101, 2553, 0, 2317
+2733:  DATA 0, 2, 32768, 2, 32769, 2, 32770, 2
+2741:  DATA 32771, 15, 32769, 2732, 15, 32768, 2733, 4
+2749:  DATA 32768, 32768, 32769, 7, 32768, 2770, 15, 32768
+2757:  DATA 2732, 9, 32768, 32768, 4, 15, 32768, 32768
+2765:  DATA 8, 32768, 2770, 17, 32768, 15, 32769, 2732
+2773:  DATA 15, 32768, 2733, 4, 32768, 32768, 32769, 7
+2781:  DATA 32768, 2791, 1, 32768, 25974, 16, 32768, 0
+2789:  DATA 17, 2964, 16, 2733, 32769, 2, 32768, 2
+2797:  DATA 32769, 2, 32770, 1, 32768, 27414, 1, 32769
+2805:  DATA 1531, 9, 32770, 6407, 10488, 17, 1458, 3
+2813:  DATA 32770, 3, 32769, 3, 32768, 1, 32768, 32
+2821:  DATA 1, 32769, 25974, 17, 1767, 19, 10, 19
+2829:  DATA 10, 1, 32768, 25974, 1, 32769, 32, 17
+2837:  DATA 1571, 4, 32769, 32768, 32767, 8, 32769, 2848
+2845:  DATA 15, 32768, 25974, 1, 32770, 32768, 15, 32769
+2853:  DATA 25974, 2, 32769, 16, 25974, 32770, 1, 32768
+2861:  DATA 27398, 1, 32769, 25974, 17, 1588, 3, 32769
+2869:  DATA 16, 25974, 32769, 4, 32769, 32768, 32767, 8
+2877:  DATA 32769, 2885, 1, 32768, 0, 1, 32770, 0
+2885:  DATA 9, 32769, 27406, 1, 9, 32769, 32769, 32768
+2893:  DATA 15, 32769, 32769, 15, 32771, 25974, 4, 32771
+2901:  DATA 32771, 32770, 7, 32771, 2944, 10, 32768, 32770
+2909:  DATA 32767, 15, 32771, 25974, 9, 32771, 32768, 32771
+2917:  DATA 8, 32770, 2924, 9, 32771, 32771, 32767, 11
+2925:  DATA 32771, 32771, 32, 9, 32768, 25974, 32770, 8
+2933:  DATA 32770, 2939, 9, 32768, 32768, 1, 16, 32768
+2941:  DATA 32771, 6, 2950, 1, 32768, 25974, 16, 32768
+2949:  DATA 0, 17, 32769, 7, 32769, 2742, 3, 32771
+2957:  DATA 3, 32770, 3, 32769, 3, 32768, 18, 2
+2965:  DATA 32768, 2, 32769, 2, 32770, 15, 32769, 32768
+2973:  DATA 8, 32769, 3032, 17, 5921, 8, 32768, 3006
+2981:  DATA 2, 32768, 17, 5990, 1, 32769, 32768, 3
+2989:  DATA 32768, 8, 32769, 3006, 9, 32769, 32768, 1
+2997:  DATA 15, 32768, 32769, 17, 1518, 19, 10, 6
+3005:  DATA 3238, 2, 32768, 2, 32769, 2, 32770, 1
+3013:  DATA 32768, 27432, 1, 32769, 1531, 9, 32770, 4492
+3021:  DATA 21100, 17, 1458, 3, 32770, 3, 32769, 3
+3029:  DATA 32768, 6, 3238, 15, 32768, 2732, 2, 32768
+3037:  DATA 19, 61, 19, 61, 19, 32, 9, 32768
+3045:  DATA 32768, 0, 15, 32768, 32768, 17, 1518, 19
+3053:  DATA 32, 19, 61, 19, 61, 19, 10, 3
+3061:  DATA 32768, 2, 32768, 9, 32768, 32768, 1, 15
+3069:  DATA 32768, 32768, 15, 32769, 32768, 4, 32769, 32769
+3077:  DATA 2, 8, 32769, 3104, 2, 32768, 1, 32768
+3085:  DATA 2680, 17, 5990, 1, 32769, 32768, 3, 32768
+3093:  DATA 9, 32768, 32768, 1, 9, 32768, 32768, 32769
+3101:  DATA 15, 32768, 32768, 17, 1518, 19, 10, 3
+3109:  DATA 32768, 2, 32768, 17, 5823, 8, 32768, 3146
+3117:  DATA 2, 32768, 2, 32769, 2, 32770, 1, 32768
+3125:  DATA 27455, 1, 32769, 1531, 9, 32770, 4024, 12730
+3133:  DATA 17, 1458, 3, 32770, 3, 32769, 3, 32768
+3141:  DATA 15, 32770, 2732, 17, 5876, 3, 32768, 2
+3149:  DATA 32768, 9, 32768, 32768, 2, 15, 32768, 32768
+3157:  DATA 15, 32768, 32768, 4, 32770, 32768, 1, 19
+3165:  DATA 10, 19, 84, 19, 104, 19, 101, 19
+3173:  DATA 114, 19, 101, 19, 32, 7, 32770, 3189
+3181:  DATA 19, 97, 19, 114, 19, 101, 6, 3193
+3189:  DATA 19, 105, 19, 115, 19, 32, 17, 2001
+3197:  DATA 19, 32, 19, 101, 19, 120, 19, 105
+3205:  DATA 19, 116, 4, 32770, 32768, 1, 7, 32770
+3213:  DATA 3216, 19, 115, 19, 58, 19, 10, 3
+3221:  DATA 32768, 2, 32768, 9, 32768, 32768, 2, 15
+3229:  DATA 32768, 32768, 1, 32769, 5814, 17, 1458, 3
+3237:  DATA 32768, 3, 32770, 3, 32769, 3, 32768, 18
+3245:  DATA 2, 32768, 2, 32769, 2, 32770, 1, 32769
+3253:  DATA 32768, 15, 32768, 2732, 9, 32768, 32768, 2
+3261:  DATA 15, 32768, 32768, 17, 1588, 4, 32770, 32768
+3269:  DATA 32767, 7, 32770, 3302, 15, 32770, 2732, 9
+3277:  DATA 32770, 32770, 3, 15, 32770, 32770, 9, 32770
+3285:  DATA 32770, 1, 9, 32770, 32770, 32768, 15, 32770
+3293:  DATA 32770, 16, 2732, 32770, 16, 2733, 0, 6
+3301:  DATA 3326, 2, 32768, 2, 32769, 2, 32770, 1
+3309:  DATA 32768, 27482, 1, 32769, 1531, 9, 32770, 1864
+3317:  DATA 4776, 17, 1458, 3, 32770, 3, 32769, 3
+3325:  DATA 32768, 3, 32770, 3, 32769, 3, 32768, 18
+3333:  DATA 2, 32768, 2, 32768, 2, 32769, 2, 32770
+3341:  DATA 1, 32768, 27532, 1, 32769, 1531, 9, 32770
+3349:  DATA 3699, 4858, 17, 1458, 3, 32770, 3, 32769
+3357:  DATA 3, 32768, 3, 32768, 18, 2, 32768, 2
+3365:  DATA 32770, 2, 32768, 2, 32769, 2, 32770, 1
+3373:  DATA 32768, 28037, 1, 32769, 1531, 9, 32770, 4075
+3381:  DATA 14467, 17, 1458, 3, 32770, 3, 32769, 3
+3389:  DATA 32768, 1, 32770, 0, 17, 5876, 3, 32770
+3397:  DATA 3, 32768, 18, 2, 32768, 2, 32769, 2
+3405:  DATA 32770, 17, 5921, 8, 32768, 3457, 9, 32769
+3413:  DATA 32768, 2, 15, 32768, 32769, 15, 32770, 2732
+3421:  DATA 4, 32770, 32768, 32770, 8, 32770, 3457, 16
+3429:  DATA 32769, 0, 2, 32768, 2, 32769, 2, 32770
+3437:  DATA 1, 32768, 28054, 1, 32769, 1531, 9, 32770
+3445:  DATA 973, 4913, 17, 1458, 3, 32770, 3, 32769
+3453:  DATA 3, 32768, 6, 3481, 2, 32768, 2, 32769
+3461:  DATA 2, 32770, 1, 32768, 28062, 1, 32769, 1531
+3469:  DATA 9, 32770, 11382, 1281, 17, 1458, 3, 32770
+3477:  DATA 3, 32769, 3, 32768, 3, 32770, 3, 32769
+3485:  DATA 3, 32768, 18, 2, 32768, 2, 32769, 17
+3493:  DATA 5921, 8, 32768, 3539, 9, 32769, 32768, 2
+3501:  DATA 15, 32768, 32769, 7, 32768, 3539, 15, 32768
+3509:  DATA 2732, 16, 32769, 32768, 2, 32768, 2, 32769
+3517:  DATA 2, 32770, 1, 32768, 28090, 1, 32769, 1531
+3525:  DATA 9, 32770, 4134, 9810, 17, 1458, 3, 32770
+3533:  DATA 3, 32769, 3, 32768, 6, 3563, 2, 32768
+3541:  DATA 2, 32769, 2, 32770, 1, 32768, 28100, 1
+3549:  DATA 32769, 1531, 9, 32770, 3164, 1183, 17, 1458
+3557:  DATA 3, 32770, 3, 32769, 3, 32768, 3, 32769
+3565:  DATA 3, 32768, 18, 2, 32768, 2, 32769, 17
+3573:  DATA 5921, 8, 32768, 3601, 9, 32769, 32768, 2
+3581:  DATA 15, 32769, 32769, 7, 32769, 3601, 9, 32769
+3589:  DATA 32768, 3, 15, 32769, 32769, 8, 32769, 3627
+3597:  DATA 17, 32769, 6, 3651, 2, 32768, 2, 32769
+3605:  DATA 2, 32770, 1, 32768, 28135, 1, 32769, 1531
+3613:  DATA 9, 32770, 8926, 13573, 17, 1458, 3, 32770
+3621:  DATA 3, 32769, 3, 32768, 6, 3651, 2, 32768
+3629:  DATA 2, 32769, 2, 32770, 1, 32768, 28170, 1
+3637:  DATA 32769, 1531, 9, 32770, 15871, 13924, 17, 1458
+3645:  DATA 3, 32770, 3, 32769, 3, 32768, 3, 32769
+3653:  DATA 3, 32768, 18, 2, 32768, 2, 32769, 2
+3661:  DATA 32770, 1, 32768, 2680, 17, 5990, 7, 32768
+3669:  DATA 3694, 9, 32768, 2676, 2, 16, 32768, 32767
+3677:  DATA 9, 32768, 2680, 2, 16, 32768, 32767, 9
+3685:  DATA 32768, 2672, 2, 16, 32768, 32767, 16, 2732
+3693:  DATA 2648, 3, 32770, 3, 32769, 3, 32768, 18
+3701:  DATA 2, 32768, 2, 32769, 2, 32770, 1, 32768
+3709:  DATA 28204, 1, 32769, 1531, 9, 32770, 2240, 3644
+3717:  DATA 17, 1458, 3, 32770, 3, 32769, 3, 32768
+3725:  DATA 0, 0, 2, 32769, 15, 32769, 3726, 13
+3733:  DATA 32769, 32769, 32768, 16, 3726, 32769, 3, 32769
+3741:  DATA 18, 16, 3726, 0, 18, 2, 32768, 1
+3749:  DATA 32768, 1, 17, 3727, 3, 32768, 18, 2
+3757:  DATA 32768, 1, 32768, 2, 17, 3727, 3, 32768
+3765:  DATA 18, 2, 32768, 1, 32768, 4, 17, 3727
+3773:  DATA 3, 32768, 18, 2, 32768, 1, 32768, 8
+3781:  DATA 17, 3727, 3, 32768, 18, 2, 32768, 1
+3789:  DATA 32768, 16, 17, 3727, 3, 32768, 18, 2
+3797:  DATA 32768, 1, 32768, 32, 17, 3727, 3, 32768
+3805:  DATA 18, 2, 32768, 2, 32769, 2, 32770, 2
+3813:  DATA 32771, 1, 32768, 64, 17, 3727, 2, 32768
+3821:  DATA 2, 32769, 2, 32770, 1, 32768, 28236, 1
+3829:  DATA 32769, 1531, 9, 32770, 20974, 8720, 17, 1458
+3837:  DATA 3, 32770, 3, 32769, 3, 32768, 15, 32768
+3845:  DATA 3726, 1, 32769, 25866, 1, 32770, 32767, 1
+3853:  DATA 32771, 28299, 17, 1841, 2, 32768, 2, 32769
+3861:  DATA 2, 32770, 1, 32768, 28303, 1, 32769, 1531
+3869:  DATA 9, 32770, 24489, 3154, 17, 1458, 3, 32770
+3877:  DATA 3, 32769, 3, 32768, 16, 2732, 2417, 3
+3885:  DATA 32771, 3, 32770, 3, 32769, 3, 32768, 18
+3893:  DATA 2, 32768, 2, 32769, 15, 32768, 2462, 15
+3901:  DATA 32769, 27101, 4, 32768, 32768, 32769, 7, 32768
+3909:  DATA 3940, 2, 32768, 2, 32769, 2, 32770, 1
+3917:  DATA 32768, 28347, 1, 32769, 1531, 9, 32770, 11851
+3925:  DATA 14889, 17, 1458, 3, 32770, 3, 32769, 3
+3933:  DATA 32768, 16, 2732, 2457, 16, 2733, 2457, 3
+3941:  DATA 32769, 3, 32768, 18, 26007, 26013, 26017, 2149
+3949:  DATA 2158, 2178, 0, 22, 0, 0, 0, 0
+3957:  DATA 0, 2, 32768, 2, 32769, 1, 32768, 2
+3965:  DATA 1, 32769, 0, 17, 4218, 3, 32769, 3
+3973:  DATA 32768, 18, 2, 32768, 2, 32769, 1, 32768
+3981:  DATA 8, 1, 32769, 1, 17, 4279, 3, 32769
+3989:  DATA 3, 32768, 18, 2, 32768, 2, 32769, 1
+3997:  DATA 32768, 1, 1, 32769, 2, 17, 4218, 3
+4005:  DATA 32769, 3, 32768, 18, 2, 32768, 2, 32769
+4013:  DATA 1, 32768, 1, 1, 32769, 3, 17, 4279
+4021:  DATA 17, 4533, 3, 32769, 3, 32768, 18, 2
+4029:  DATA 32768, 2, 32769, 1, 32768, 4, 1, 32769
+4037:  DATA 4, 17, 4279, 3, 32769, 3, 32768, 18
+4045:  DATA 2, 32768, 2, 32769, 1, 32768, 2, 1
+4053:  DATA 32769, 5, 17, 4218, 3, 32769, 3, 32768
+4061:  DATA 18, 2, 32768, 2, 32769, 1, 32768, 11
+4069:  DATA 1, 32769, 6, 17, 4279, 3, 32769, 3
+4077:  DATA 32768, 18, 2, 32768, 2, 32769, 1, 32768
+4085:  DATA 2, 1, 32769, 7, 17, 4218, 3, 32769
+4093:  DATA 3, 32768, 18, 2, 32768, 2, 32769, 1
+4101:  DATA 32768, 0, 1, 32769, 8, 17, 4218, 3
+4109:  DATA 32769, 3, 32768, 18, 2, 32768, 2, 32769
+4117:  DATA 1, 32768, 4, 1, 32769, 9, 17, 4279
+4125:  DATA 3, 32769, 3, 32768, 18, 2, 32768, 2
+4133:  DATA 32769, 1, 32768, 1, 1, 32769, 10, 17
+4141:  DATA 4218, 3, 32769, 3, 32768, 18, 2, 32768
+4149:  DATA 2, 32769, 1, 32768, 18, 1, 32769, 11
+4157:  DATA 17, 4279, 3, 32769, 3, 32768, 18, 17
+4165:  DATA 4611, 18, 2, 32768, 2, 32769, 1, 32768
+4173:  DATA 1, 1, 32769, 12, 17, 4218, 3, 32769
+4181:  DATA 3, 32768, 18, 2, 32768, 2, 32769, 1
+4189:  DATA 32768, 9, 1, 32769, 13, 17, 4279, 3
+4197:  DATA 32769, 3, 32768, 18, 2, 32768, 2, 32769
+4205:  DATA 1, 32768, 2, 1, 32769, 14, 17, 4218
+4213:  DATA 3, 32769, 3, 32768, 18, 2, 32768, 2
+4221:  DATA 32769, 2, 32770, 9, 32770, 2716, 2, 15
+4229:  DATA 32770, 32770, 7, 32770, 4272, 17, 4405, 16
+4237:  DATA 3951, 32768, 9, 32769, 32768, 3945, 15, 32769
+4245:  DATA 32769, 1, 32768, 26024, 17, 1518, 1, 32768
+4253:  DATA 32769, 17, 1518, 1, 32768, 26088, 17, 1518
+4261:  DATA 1, 32768, 32769, 17, 1518, 19, 46, 19
+4269:  DATA 10, 19, 10, 3, 32770, 3, 32769, 3
+4277:  DATA 32768, 18, 2, 32768, 2, 32769, 2, 32770
+4285:  DATA 9, 32770, 2716, 2, 15, 32770, 32770, 7
+4293:  DATA 32770, 4398, 17, 4405, 2, 32768, 15, 32768
+4301:  DATA 3951, 9, 32769, 32768, 3945, 15, 32769, 32769
+4309:  DATA 1, 32768, 26122, 17, 1518, 1, 32768, 32769
+4317:  DATA 17, 1518, 1, 32768, 26170, 17, 1518, 3
+4325:  DATA 32768, 1, 32769, 32768, 15, 32768, 3952, 15
+4333:  DATA 32770, 3951, 9, 32770, 32770, 3948, 15, 32770
+4341:  DATA 32770, 17, 32770, 7, 32769, 4391, 15, 32769
+4349:  DATA 3952, 16, 3952, 32768, 5, 32770, 32768, 32769
+4357:  DATA 8, 32770, 4369, 2, 32768, 1, 32768, 26235
+4365:  DATA 17, 1518, 3, 32768, 5, 32770, 32769, 32768
+4373:  DATA 8, 32770, 4385, 2, 32768, 1, 32768, 26267
+4381:  DATA 17, 1518, 3, 32768, 19, 10, 19, 10
+4389:  DATA 6, 4398, 17, 4660, 1, 32768, 26299, 17
+4397:  DATA 1518, 3, 32770, 3, 32769, 3, 32768, 18
+4405:  DATA 2, 32768, 2, 32769, 2, 32770, 2, 32771
+4413:  DATA 2, 32772, 2, 32773, 15, 32773, 3953, 5
+4421:  DATA 32771, 32773, 29999, 7, 32771, 4434, 9, 32773
+4429:  DATA 32773, 1, 16, 3953, 32773, 1, 32771, 32768
+4437:  DATA 1, 32772, 32769, 9, 32768, 32773, 2, 17
+4445:  DATA 2281, 15, 32769, 3954, 13, 32768, 32769, 32768
+4453:  DATA 1, 32769, 32772, 17, 2248, 16, 3954, 32768
+4461:  DATA 1, 32768, 3955, 9, 32769, 32773, 2, 1
+4469:  DATA 32770, 32772, 17, 4515, 1, 32768, 3956, 10
+4477:  DATA 32769, 32773, 32773, 10, 32770, 32772, 32772, 17
+4485:  DATA 4515, 1, 32768, 3957, 1, 32769, 13, 10
+4493:  DATA 32770, 32771, 9, 10, 32770, 32770, 32770, 17
+4501:  DATA 4515, 3, 32773, 3, 32772, 3, 32771, 3
+4509:  DATA 32770, 3, 32769, 3, 32768, 18, 2, 32768
+4517:  DATA 15, 32768, 32768, 17, 2248, 1, 32769, 32770
+4525:  DATA 17, 2125, 3, 32769, 16, 32769, 32768, 18
+4533:  DATA 2, 32768, 9, 32768, 2716, 2, 15, 32768
+4541:  DATA 32768, 7, 32768, 4608, 1, 32768, 26321, 17
+4549:  DATA 1518, 15, 32768, 3952, 4, 32768, 32768, 30
+4557:  DATA 7, 32768, 4574, 1, 32768, 26354, 17, 1518
+4565:  DATA 1, 32768, 26398, 17, 1518, 17, 4660, 6
+4573:  DATA 4608, 1, 32768, 26440, 17, 1518, 15, 32768
+4581:  DATA 3954, 9, 32768, 32768, 1, 7, 32768, 4596
+4589:  DATA 1, 32768, 26484, 17, 1518, 6, 4565, 1
+4597:  DATA 32768, 26584, 17, 1518, 9, 32768, 2716, 2
+4605:  DATA 16, 32768, 32767, 3, 32768, 18, 2, 32768
+4613:  DATA 9, 32768, 2716, 2, 15, 32768, 32768, 7
+4621:  DATA 32768, 4657, 1, 32768, 26717, 17, 1518, 15
+4629:  DATA 32768, 2732, 4, 32768, 32768, 2623, 7, 32768
+4637:  DATA 4645, 1, 32768, 26725, 17, 1518, 6, 4650
+4645:  DATA 1, 32768, 26731, 17, 1518, 1, 32768, 26737
+4653:  DATA 17, 1518, 17, 4660, 3, 32768, 18, 2
+4661:  DATA 32768, 16, 3952, 22, 16, 3953, 0, 16
+4669:  DATA 3954, 0, 16, 3955, 0, 16, 3956, 0
+4677:  DATA 16, 3957, 0, 9, 32768, 2716, 2, 16
+4685:  DATA 32768, 2623, 3, 32768, 18, 2, 32768, 9
+4693:  DATA 32768, 2716, 2, 15, 32768, 32768, 4, 32768
+4701:  DATA 32768, 32767, 7, 32768, 4717, 1, 32768, 26824
+4709:  DATA 17, 1518, 16, 2732, 2578, 16, 2733, 2578
+4717:  DATA 3, 32768, 18, 2, 32768, 2, 32769, 2
+4725:  DATA 32770, 2, 32771, 2, 32768, 2, 32769, 2
+4733:  DATA 32770, 1, 32768, 28369, 1, 32769, 1531, 9
+4741:  DATA 32770, 11257, 1670, 17, 1458, 3, 32770, 3
+4749:  DATA 32769, 3, 32768, 1, 32768, 4242, 1, 32769
+4757:  DATA 25866, 1, 32770, 32767, 1, 32771, 28397, 17
+4765:  DATA 1841, 2, 32768, 2, 32769, 2, 32770, 1
+4773:  DATA 32768, 28401, 1, 32769, 1531, 9, 32770, 4295
+4781:  DATA 20766, 17, 1458, 3, 32770, 3, 32769, 3
+4789:  DATA 32768, 3, 32771, 3, 32770, 3, 32769, 3
+4797:  DATA 32768, 18, 2, 32768, 9, 32768, 2672, 2
+4805:  DATA 15, 32768, 32768, 7, 32768, 4858, 9, 32768
+4813:  DATA 2684, 2, 16, 32768, 32767, 9, 32768, 2672
+4821:  DATA 2, 16, 32768, 32767, 9, 32768, 2676, 2
+4829:  DATA 16, 32768, 0, 2, 32768, 2, 32769, 2
+4837:  DATA 32770, 1, 32768, 28453, 1, 32769, 1531, 9
+4845:  DATA 32770, 18845, 13524, 17, 1458, 3, 32770, 3
+4853:  DATA 32769, 3, 32768, 6, 4882, 2, 32768, 2
+4861:  DATA 32769, 2, 32770, 1, 32768, 28510, 1, 32769
+4869:  DATA 1531, 9, 32770, 2056, 862, 17, 1458, 3
+4877:  DATA 32770, 3, 32769, 3, 32768, 3, 32768, 18
+4885:  DATA 2, 32768, 9, 32768, 2676, 2, 16, 32768
+4893:  DATA 32767, 9, 32768, 2680, 2, 16, 32768, 0
+4901:  DATA 2, 32768, 2, 32769, 2, 32770, 1, 32768
+4909:  DATA 28569, 1, 32769, 1531, 9, 32770, 187, 28589
+4917:  DATA 17, 1458, 3, 32770, 3, 32769, 3, 32768
+4925:  DATA 16, 2733, 0, 3, 32768, 18, 2, 32768
+4933:  DATA 9, 32768, 2676, 2, 16, 32768, 0, 9
+4941:  DATA 32768, 2680, 2, 16, 32768, 32767, 2, 32768
+4949:  DATA 2, 32769, 2, 32770, 1, 32768, 28595, 1
+4957:  DATA 32769, 1531, 9, 32770, 5267, 1248, 17, 1458
+4965:  DATA 3, 32770, 3, 32769, 3, 32768, 16, 2733
+4973:  DATA 0, 3, 32768, 18, 2, 32770, 2, 32771
+4981:  DATA 15, 32770, 2732, 4, 32770, 32770, 2457, 7
+4989:  DATA 32770, 5017, 2, 32768, 2, 32769, 2, 32770
+4997:  DATA 1, 32768, 28621, 1, 32769, 1531, 9, 32770
+5005:  DATA 1605, 816, 17, 1458, 3, 32770, 3, 32769
+5013:  DATA 3, 32768, 6, 5336, 9, 32770, 32768, 2
+5021:  DATA 16, 32770, 32767, 15, 32770, 2462, 9, 32770
+5029:  DATA 32770, 27095, 9, 32770, 32770, 1, 15, 32770
+5037:  DATA 32770, 9, 32771, 2457, 1, 15, 32771, 32771
+5045:  DATA 9, 32771, 32771, 32770, 9, 32770, 32769, 48
+5053:  DATA 16, 32771, 32770, 15, 32770, 2462, 9, 32770
+5061:  DATA 32770, 27101, 9, 32770, 32770, 1, 16, 32770
+5069:  DATA 32769, 2, 32768, 2, 32768, 2, 32769, 2
+5077:  DATA 32770, 1, 32768, 28664, 1, 32769, 1531, 9
+5085:  DATA 32770, 5946, 1989, 17, 1458, 3, 32770, 3
+5093:  DATA 32769, 3, 32768, 3, 32768, 2, 32768, 9
+5101:  DATA 32770, 32768, 0, 15, 32768, 32770, 17, 1518
+5109:  DATA 3, 32768, 2, 32768, 2, 32768, 2, 32769
+5117:  DATA 2, 32770, 1, 32768, 28679, 1, 32769, 1531
+5125:  DATA 9, 32770, 6158, 5594, 17, 1458, 3, 32770
+5133:  DATA 3, 32769, 3, 32768, 3, 32768, 15, 32770
+5141:  DATA 2462, 9, 32770, 32770, 1, 16, 2462, 32770
+5149:  DATA 15, 32771, 27101, 4, 32771, 32770, 32771, 8
+5157:  DATA 32771, 5336, 1, 32768, 0, 9, 32769, 27101
+5165:  DATA 1, 15, 32769, 32769, 9, 32768, 32768, 32769
+5173:  DATA 9, 32769, 27101, 2, 15, 32769, 32769, 9
+5181:  DATA 32770, 27101, 3, 15, 32770, 32770, 10, 32770
+5189:  DATA 32770, 32770, 10, 32769, 32769, 32770, 9, 32768
+5197:  DATA 32768, 32769, 9, 32769, 27101, 4, 15, 32769
+5205:  DATA 32769, 10, 32770, 32769, 32769, 10, 32770, 32770
+5213:  DATA 32769, 9, 32768, 32768, 32770, 9, 32769, 27101
+5221:  DATA 5, 15, 32769, 32769, 10, 32769, 32769, 32767
+5229:  DATA 9, 32768, 32768, 32769, 4, 32769, 32768, 399
+5237:  DATA 7, 32769, 5312, 9, 32770, 2688, 2, 16
+5245:  DATA 32770, 2457, 9, 32770, 2692, 2, 16, 32770
+5253:  DATA 2457, 9, 32770, 2696, 2, 16, 32770, 2457
+5261:  DATA 9, 32770, 2700, 2, 16, 32770, 2457, 9
+5269:  DATA 32770, 2704, 2, 16, 32770, 2457, 16, 2462
+5277:  DATA 0, 1, 32768, 27095, 1, 32769, 5341, 17
+5285:  DATA 1458, 2, 32768, 2, 32769, 2, 32770, 1
+5293:  DATA 32768, 28710, 1, 32769, 1531, 9, 32770, 8818
+5301:  DATA 12149, 17, 1458, 3, 32770, 3, 32769, 3
+5309:  DATA 32768, 6, 5336, 2, 32768, 2, 32769, 2
+5317:  DATA 32770, 1, 32768, 28777, 1, 32769, 1531, 9
+5325:  DATA 32770, 14300, 14471, 17, 1458, 3, 32770, 3
+5333:  DATA 32769, 3, 32768, 3, 32771, 3, 32770, 18
+5341:  DATA 2, 32770, 9, 32770, 2457, 1, 15, 32770
+5349:  DATA 32770, 9, 32770, 32770, 32768, 16, 32770, 95
+5357:  DATA 3, 32770, 18, 2, 32768, 2, 32769, 1
+5365:  DATA 32768, 2688, 1, 32769, 2, 17, 4977, 3
+5373:  DATA 32769, 3, 32768, 18, 2, 32768, 2, 32769
+5381:  DATA 1, 32768, 2692, 1, 32769, 3, 17, 4977
+5389:  DATA 3, 32769, 3, 32768, 18, 2, 32768, 2
+5397:  DATA 32769, 1, 32768, 2696, 1, 32769, 5, 17
+5405:  DATA 4977, 3, 32769, 3, 32768, 18, 2, 32768
+5413:  DATA 2, 32769, 1, 32768, 2700, 1, 32769, 7
+5421:  DATA 17, 4977, 3, 32769, 3, 32768, 18, 2
+5429:  DATA 32768, 2, 32769, 1, 32768, 2704, 1, 32769
+5437:  DATA 9, 17, 4977, 3, 32769, 3, 32768, 18
+5445:  DATA 2, 32768, 2, 32769, 2, 32770, 8, 32775
+5453:  DATA 5605, 2, 32768, 2, 32769, 2, 32770, 1
+5461:  DATA 32768, 28844, 1, 32769, 1531, 9, 32770, 2256
+5469:  DATA 37, 17, 1458, 3, 32770, 3, 32769, 3
+5477:  DATA 32768, 21, 21, 21, 21, 21, 1, 32768
+5485:  DATA 4, 1, 32769, 1, 17, 6027, 4, 32769
+5493:  DATA 32768, 6, 8, 32769, 5579, 2, 32768, 2
+5501:  DATA 32769, 2, 32770, 1, 32768, 29014, 1, 32769
+5509:  DATA 1531, 9, 32770, 6359, 23581, 17, 1458, 3
+5517:  DATA 32770, 3, 32769, 3, 32768, 1, 32768, 32775
+5525:  DATA 1, 32769, 25866, 1, 32770, 32767, 2, 32771
+5533:  DATA 1, 32771, 29241, 17, 1841, 3, 32771, 2
+5541:  DATA 32768, 2, 32769, 2, 32770, 1, 32768, 29245
+5549:  DATA 1, 32769, 1531, 9, 32770, 5293, 580, 17
+5557:  DATA 1458, 3, 32770, 3, 32769, 3, 32768, 16
+5565:  DATA 2732, 2498, 16, 2733, 0, 9, 32769, 2708
+5573:  DATA 2, 16, 32769, 32767, 6, 5714, 2, 32768
+5581:  DATA 2, 32769, 2, 32770, 1, 32768, 29400, 1
+5589:  DATA 32769, 1531, 9, 32770, 9791, 15672, 17, 1458
+5597:  DATA 3, 32770, 3, 32769, 3, 32768, 6, 5714
+5605:  DATA 2, 32768, 2, 32769, 2, 32770, 1, 32768
+5613:  DATA 29545, 1, 32769, 1531, 9, 32770, 4216, 18691
+5621:  DATA 17, 1458, 3, 32770, 3, 32769, 3, 32768
+5629:  DATA 1, 32768, 0, 9, 32770, 1, 27101, 15
+5637:  DATA 32769, 32770, 9, 32768, 32768, 32769, 10, 32768
+5645:  DATA 32768, 31660, 17, 2125, 15, 32769, 27101, 9
+5653:  DATA 32769, 32769, 27101, 9, 32770, 32770, 1, 5
+5661:  DATA 32769, 32770, 32769, 8, 32769, 5636, 1, 32769
+5669:  DATA 25866, 1, 32770, 32767, 2, 32771, 1, 32771
+5677:  DATA 29663, 17, 1841, 3, 32771, 2, 32768, 2
+5685:  DATA 32769, 2, 32770, 1, 32768, 29667, 1, 32769
+5693:  DATA 1531, 9, 32770, 2802, 9075, 17, 1458, 3
+5701:  DATA 32770, 3, 32769, 3, 32768, 16, 2732, 2488
+5709:  DATA 16, 2733, 0, 6, 5714, 3, 32770, 3
+5717:  DATA 32769, 3, 32768, 18, 2, 32768, 2, 32769
+5725:  DATA 2, 32770, 2, 32771, 2, 32768, 2, 32769
+5733:  DATA 2, 32770, 1, 32768, 29757, 1, 32769, 1531
+5741:  DATA 9, 32770, 812, 312, 17, 1458, 3, 32770
+5749:  DATA 3, 32769, 3, 32768, 15, 32768, 3955, 15
+5757:  DATA 32769, 3956, 17, 2125, 15, 32769, 3957, 17
+5765:  DATA 2125, 1, 32769, 25919, 1, 32770, 4, 2
+5773:  DATA 32771, 1, 32771, 29942, 17, 1841, 3, 32771
+5781:  DATA 2, 32768, 2, 32769, 2, 32770, 1, 32768
+5789:  DATA 29946, 1, 32769, 1531, 9, 32770, 13860, 330
+5797:  DATA 17, 1458, 3, 32770, 3, 32769, 3, 32768
+5805:  DATA 3, 32771, 3, 32770, 3, 32769, 3, 32768
+5813:  DATA 18, 19, 45, 19, 32, 17, 1518, 19
+5821:  DATA 10, 18, 2, 32769, 2, 32770, 1, 32768
+5829:  DATA 27381, 1, 32769, 5846, 1, 32770, 0, 17
+5837:  DATA 1458, 1, 32768, 32770, 3, 32770, 3, 32769
+5845:  DATA 18, 2, 32771, 2, 32772, 15, 32771, 2732
+5853:  DATA 9, 32772, 32768, 2, 15, 32772, 32772, 4
+5861:  DATA 32771, 32771, 32772, 8, 32771, 5871, 9, 32770
+5869:  DATA 32770, 1, 3, 32772, 3, 32771, 18, 2
+5877:  DATA 32768, 2, 32769, 1, 32768, 27381, 1, 32769
+5885:  DATA 5893, 17, 1458, 3, 32769, 3, 32768, 18
+5893:  DATA 2, 32771, 9, 32771, 32768, 2, 15, 32771
+5901:  DATA 32771, 4, 32771, 32770, 32771, 8, 32771, 5918
+5909:  DATA 9, 32768, 32768, 0, 15, 32768, 32768, 17
+5917:  DATA 5814, 3, 32771, 18, 2, 32769, 2, 32770
+5925:  DATA 1, 32770, 32768, 1, 32768, 27381, 1, 32769
+5933:  DATA 5964, 17, 1543, 4, 32769, 32768, 32767, 7
+5941:  DATA 32769, 5956, 9, 32769, 27381, 32768, 9, 32769
+5949:  DATA 32769, 1, 15, 32768, 32769, 6, 5959, 1
+5957:  DATA 32768, 0, 3, 32770, 3, 32769, 18, 2
+5965:  DATA 32769, 1, 32769, 32770, 9, 32768, 32768, 0
+5973:  DATA 15, 32768, 32768, 17, 1667, 3, 32769, 8
+5981:  DATA 32768, 5989, 1, 32770, 32769, 1, 32769, 32767
+5989:  DATA 18, 2, 32769, 2, 32770, 9, 32768, 32768
+5997:  DATA 2, 15, 32768, 32768, 8, 32768, 6019, 15
+6005:  DATA 32769, 2732, 4, 32769, 32768, 32769, 7, 32769
+6013:  DATA 6019, 1, 32768, 0, 6, 6022, 1, 32768
+6021:  DATA 1, 3, 32770, 3, 32769, 18, 7, 32768
+6029:  DATA 6035, 9, 32768, 32769, 1, 18, 7, 32769
+6037:  DATA 6048, 9, 32768, 32768, 32767, 1, 32769, 32775
+6045:  DATA 17, 6027, 18, 2, 32768, 9, 32769, 32769
+6053:  DATA 32767, 17, 6027, 1, 32769, 32768, 3, 32768
+6061:  DATA 9, 32768, 32768, 32767, 17, 6027, 18, 6095
+6069:  DATA 17625, 29781, 9718, 21856, 709, 12803, 25529, 4918
+6077:  DATA 16564, 28734, 8626, 20806, 32422, 11829, 24497, 3874
+6085:  DATA 15584, 27652, 7552, 19815, 31473, 10768, 23531, 2949
+6093:  DATA 15156, 26844, 6256, 18448, 31188, 10545, 22189, 1764
+6101:  DATA 13836, 26588, 6057, 18228, 29905, 9365, 21630, 1072
+6109:  DATA 13806, 26096, 5477, 17717, 29414, 8867, 21015, 588
+6117:  DATA 13294, 25503, 4936, 17252, 29481, 8405, 20633, 161
+6125:  DATA 12350, 24592, 4213, 16468, 29113, 8592, 20989, 452
+6133:  DATA 12589, 24880, 4357, 16660, 29029, 8560, 20813, 324
+6141:  DATA 12637, 24921, 4371, 16699, 28986, 8484, 20789, 301
+6149:  DATA 12577, 24860, 4374, 16803, 29020, 8543, 20824, 484
+6157:  DATA 12699, 25081, 4571, 16432, 28757, 8297, 20562, 177
+6165:  DATA 12447, 24771, 4896, 17272, 29507, 9168, 21502, 560
+6173:  DATA 12924, 25278, 4849, 17725, 30075, 9655, 21949, 1061
+6181:  DATA 13433, 25808, 5329, 18300, 30624, 10128, 22031, 1701
+6189:  DATA 14030, 26997, 6613, 18491, 30803, 10416, 23324, 2986
+6197:  DATA 15245, 27221, 6891, 19835, 32151, 11293, 23714, 3889
+6205:  DATA 16302, 28272, 7864, 20795, 416, 12350, 24745, 4901
+6213:  DATA 17316, 29214, 8907, 21812, 1445, 13425, 25817, 6116
+6221:  DATA 17940, 30436, 10566, 22644, 2199, 15217, 27598, 6817
+6229:  DATA 19789, 32196, 11434, 24372, 4049, 16024, 29032, 8292
+6237:  DATA 20723, 959, 12903, 25888, 5629, 17660, 30525, 9776
+6245:  DATA 22245, 2453, 14423, 27505, 6757, 19161, 32158, 11492
+6253:  DATA 24412, 3632, 16664, 28725, 8390, 21475, 660, 13746
+6261:  DATA 25672, 5904, 18017, 31099, 10250, 23298, 2618, 15653
+6269:  DATA 27684, 8062, 20085, 372, 12308, 25456, 4654, 17709
+6277:  DATA 29738, 10014, 22085, 2426, 14432, 27473, 6751, 19878
+6285:  DATA 31876, 12208, 24263, 4145, 17172, 29300, 9550, 21732
+6293:  DATA 1999, 14075, 26656, 7025, 19029, 32208, 11490, 24113
+6301:  DATA 4457, 16625, 29621, 9588, 21585, 1973, 14075, 26669
+6309:  DATA 7011, 19097, 32209, 12145, 24233, 4553, 17229, 29354
+6317:  DATA 9682, 22320, 1665, 14374, 27472, 6897, 19470, 32689
+6325:  DATA 11999, 24661, 5029, 17763, 29836, 9732, 22949, 2861
+6333:  DATA 15027, 27761, 8183, 20819, 177, 12863, 26034, 5942
+6341:  DATA 18106, 30737, 11164, 23825, 3318, 15967, 29144, 9136
+6349:  DATA 21781, 1177, 13939, 26683, 7066, 19812, 31957, 11949
+6357:  DATA 24577, 5084, 17846, 30558, 9956, 22659, 2605, 15421
+6365:  DATA 28658, 8613, 21301, 1334, 13552, 26295, 6260, 18986
+6373:  DATA 32173, 12164, 24906, 4916, 17705, 29909, 9868, 22706
+6381:  DATA 2648, 15420, 28245, 8237, 21466, 1509, 14301, 27042
+6389:  DATA 6984, 19797, 32617, 12596, 25361, 5400, 18216, 31076
+6397:  DATA 11048, 23842, 3890, 16689, 29557, 9526, 22322, 2358
+6405:  DATA 15213, 27921, 7937, 20834, 864, 13662, 26457, 6577
+6413:  DATA 19343, 32245, 12181, 24612, 4608, 17532, 30289, 10413
+6421:  DATA 23171, 3287, 16741, 29549, 9546, 22405, 2477, 14886
+6429:  DATA 27772, 7859, 20734, 1402, 14139, 27134, 7064, 19498
+6437:  DATA 32354, 12418, 25297, 6012, 18892, 31732, 11276, 24246
+6445:  DATA 4310, 17712, 30614, 10293, 23107, 3317, 16888, 29584
+6453:  DATA 9669, 22105, 2294, 15668, 28566, 8213, 21160, 1833
+6461:  DATA 14766, 27248, 7329, 20795, 1013, 13362, 26296, 7012
+6469:  DATA 19897, 32280, 12416, 25908, 6120, 18527, 31448, 12208
+6477:  DATA 24597, 4784, 18266, 30770, 10965, 24433, 4509, 17056
+6485:  DATA 30472, 10709, 23221, 3892, 16838, 29329, 10107, 22561
+6493:  DATA 2739, 16368, 28725, 9493, 22502, 2288, 15716, 28203
+6501:  DATA 8440, 21968, 1621, 15217, 27680, 7874, 21453, 1194
+6509:  DATA 14674, 27234, 7937, 20540, 661, 14329, 26771, 7600
+6517:  DATA 20034, 784, 13425, 27004, 6656, 20304, 41, 13605
+6525:  DATA 26159, 6971, 19515, 305, 12838, 26403, 6257, 19812
+6533:  DATA 32308, 13087, 25616, 6452, 19057, 32600, 12356, 26026
+6541:  DATA 5782, 19376, 31948, 12347, 25856, 5680, 19285, 31905
+6549:  DATA 12684, 25282, 5733, 19296, 31821, 12693, 25261, 5665
+6557:  DATA 19326, 31928, 12794, 25905, 5734, 19440, 31986, 12322
+6565:  DATA 25901, 5778, 19396, 32608, 12470, 26000, 6409, 19105
+6573:  DATA 32728, 13152, 25744, 6182, 19733, 32487, 12820, 26544
+6581:  DATA 6341, 19545, 491, 13626, 26336, 6686, 20386, 822
+6589:  DATA 13481, 26680, 7632, 20775, 698, 13861, 27561, 7980
+6597:  DATA 20676, 1076, 14724, 28006, 7918, 21008, 1998, 15269
+6605:  DATA 28427, 8437, 21614, 2048, 15773, 29045, 8861, 22183
+6613:  DATA 2572, 16326, 29600, 10036, 22732, 3203, 16429, 29751
+6621:  DATA 10738, 23997, 4464, 17699, 30461, 10929, 24169, 4708
+6629:  DATA 18403, 31633, 12119, 25446, 5930, 18631, 31949, 12460
+6637:  DATA 25688, 6242, 19472, 120, 13717, 27121, 7571, 20896
+6645:  DATA 1293, 14660, 28013, 8561, 21829, 2332, 15652, 28963
+6653:  DATA 9525, 22820, 3445, 16690, 29991, 10559, 23856, 4452
+6661:  DATA 17721, 31000, 11520, 24884, 5473, 18783, 32066, 12726
+6669:  DATA 25994, 6641, 19916, 116, 13313, 26751, 7197, 20656
+6677:  DATA 1157, 14549, 28517, 9063, 22346, 2949, 16377, 29228
+6685:  DATA 9789, 23225, 3814, 17780, 31076, 11685, 25076, 5168
+6693:  DATA 18536, 31952, 12481, 26493, 7080, 20382, 616, 13994
+6701:  DATA 27346, 8546, 21889, 2108, 15408, 28899, 10002, 23473
+6709:  DATA 4057, 16984, 30348, 11600, 24964, 5122, 18598, 32612
+6717:  DATA 13246, 26161, 6819, 20785, 1390, 14340, 27829, 8993
+6725:  DATA 22509, 2579, 16004, 30050, 10720, 23568, 4300, 18343
+6733:  DATA 31250, 12005, 25926, 6176, 19612, 883, 14286, 27364
+6741:  DATA 8457, 21954, 2212, 16249, 29636, 9860, 23908, 4135
+6749:  DATA 17660, 31676, 11897, 25901, 6581, 19635, 885, 13861
+6757:  DATA 27363, 8599, 21568, 2868, 15908, 29379, 10701, 23741
+6765:  DATA 4946, 18021, 32085, 12338, 25820, 7166, 20121, 1508
+6773:  DATA 14420, 28511, 8816, 22886, 3094, 17173, 30241, 11554
+6781:  DATA 24701, 5937, 18977, 372, 13364, 27504, 7729, 21793
+6789:  DATA 2090, 16148, 29184, 10548, 23652, 4946, 17986, 32178
+6797:  DATA 12440, 26544, 6868, 20596, 1817, 14961, 29007, 9379
+6805:  DATA 23432, 3728, 17446, 31612, 11844, 25987, 6368, 20074
+6813:  DATA 1341, 14576, 28609, 9532, 22640, 4002, 17144, 30820
+6821:  DATA 12132, 25219, 6533, 20342, 676, 14786, 28424, 8872
+6829:  DATA 22980, 3888, 17040, 30778, 12122, 25317, 6170, 20396
+6837:  DATA 653, 14428, 28652, 9587, 22669, 3588, 17901, 31532
+6845:  DATA 11960, 25634, 7088, 20852, 1185, 14911, 29181, 10026
+6853:  DATA 23202, 4100, 18316, 32119, 12512, 26128, 7628, 21476
+6861:  DATA 2319, 15615, 29253, 10289, 24533, 5490, 18639, 32429
+6869:  DATA 13321, 27607, 8608, 22324, 2761, 16533, 30316, 11296
+6877:  DATA 25588, 6590, 20338, 1396, 14586, 28325, 9321, 23140
+6885:  DATA 4580, 18334, 32081, 13179, 26981, 7364, 21125, 2209
+6893:  DATA 15901, 29812, 10772, 24614, 6110, 19888, 920, 14761
+6901:  DATA 28509, 9540, 23404, 4474, 18176, 32003, 13118, 26986
+6909:  DATA 8027, 21810, 2855, 16701, 30513, 11575, 25400, 6465
+6917:  DATA 20286, 1311, 15120, 29024, 10093, 23867, 4991, 18859
+6925:  DATA 32653, 13813, 27541, 8246, 22023, 3193, 16985, 30883
+6933:  DATA 11912, 25801, 7441, 21372, 2380, 16259, 30125, 10806
+6941:  DATA 24690, 5792, 19696, 1396, 15223, 29090, 10228, 23584
+6949:  DATA 4714, 18581, 32389, 14199, 28087, 9173, 22540, 3759
+6957:  DATA 17614, 32048, 13204, 26663, 7701, 21737, 3346, 17329
+6965:  DATA 31117, 11847, 25828, 7544, 21390, 2128, 16044, 30504
+6973:  DATA 11698, 25150, 6322, 20852, 1980, 15396, 29427, 11108
+6981:  DATA 25069, 5673, 19594, 1377, 15269, 28753, 9951, 24481
+6989:  DATA 5139, 19127, 833, 14452, 28294, 10085, 24015, 4769
+6997:  DATA 19277, 472, 13994, 28515, 9605, 23199, 4961, 18464
+7005:  DATA 32445, 14265, 27745, 9588, 23548, 4259, 18737, 32356
+7013:  DATA 13538, 28034, 8709, 23395, 4141, 18133, 32665, 13484
+7021:  DATA 27992, 8802, 23381, 4157, 18113, 32688, 13470, 28069
+7029:  DATA 8771, 23312, 4192, 18786, 32256, 14110, 27757, 9527
+7037:  DATA 23080, 4896, 18469, 315, 13863, 28452, 9341, 23869
+7045:  DATA 4642, 19205, 23, 14644, 28274, 10069, 23620, 5539
+7053:  DATA 19093, 996, 14491, 28764, 10518, 24191, 5971, 19632
+7061:  DATA 1412, 15070, 29232, 11121, 24609, 6546, 20204, 1575
+7069:  DATA 16246, 29896, 11731, 25909, 6777, 21436, 2292, 16426
+7077:  DATA 31082, 11984, 26577, 8060, 21687, 3551, 17688, 31395
+7085:  DATA 13269, 27440, 8321, 22588, 4432, 18096, 32284, 14253
+7093:  DATA 27871, 9233, 23852, 5461, 19094, 592, 15284, 29483
+7101:  DATA 10408, 24688, 6582, 20795, 1723, 15908, 30644, 12074
+7109:  DATA 25784, 7189, 21957, 3445, 17129, 31327, 13251, 27555
+7117:  DATA 9053, 22756, 4189, 18481, 469, 14706, 28367, 9901
+7125:  DATA 24073, 6103, 20384, 1848, 15493, 29849, 11385, 25700
+7133:  DATA 7662, 21950, 3444, 17700, 31462, 13041, 27197, 8804
+7141:  DATA 23508, 5023, 19280, 820, 15153, 28866, 10388, 24804
+7149:  DATA 6217, 20607, 2133, 16435, 31175, 12785, 27039, 8676
+7157:  DATA 22873, 4440, 18784, 308, 14599, 28930, 10532, 24864
+7165:  DATA 6458, 20789, 2425, 16756, 31031, 12581, 26921, 8548
+7173:  DATA 22820, 4356, 18757, 369, 14707, 29009, 10569, 24993
+7181:  DATA 6542, 20912, 2508, 16443, 30720, 12386, 26653, 8355
+7189:  DATA 22687, 4305, 19254, 868, 15109, 29593, 11235, 25188
+7197:  DATA 6761, 21176, 2800, 17780, 32113, 13745, 28143, 9263
+7205:  DATA 23651, 5269, 19670, 1895, 16363, 30608, 11853, 26269
+7213:  DATA 7890, 22885, 4565, 18485, 71, 14581, 29533, 11188
+7221:  DATA 25537, 6725, 21224, 3449, 17792, 31748, 13476, 28458
+7229:  DATA 10170, 24176, 5796, 20769, 2492, 16435, 30902, 13096
+7237:  DATA 27572, 8784, 23169, 5499, 19954, 1118, 15578, 30629
+7245:  DATA 11791, 26356, 8469, 22589, 4251, 19300, 978, 15076
+7253:  DATA 29977, 11736, 25760, 7988, 22470, 3736, 18796, 55
+7261:  DATA 14576, 29694, 10811, 25978, 7569, 21684, 3954, 17971
+7269:  DATA 32483, 14843, 28776, 11131, 25142, 6851, 21965, 3239
+7277:  DATA 18268, 32358, 14608, 28710, 10459, 25409, 6820, 21931
+7285:  DATA 3160, 18192, 32356, 14694, 28672, 11088, 25150, 7472
+7293:  DATA 21564, 3902, 17969, 317, 14395, 29495, 10877, 25901
+7301:  DATA 7203, 22352, 3588, 18740, 105, 15185, 29279, 11683
+7309:  DATA 25752, 8112, 22230, 4149, 19203, 629, 15695, 29866
+7317:  DATA 12237, 26326, 8240, 23416, 4681, 19920, 1250, 15906
+7325:  DATA 31037, 12466, 27644, 9531, 23673, 6053, 20208, 2093
+7333:  DATA 17251, 31381, 13782, 28535, 9888, 25054, 6937, 21220
+7341:  DATA 3536, 18303, 32390, 14375, 29467, 10928, 25693, 8077
+7349:  DATA 22233, 4112, 19432, 1377, 15510, 30212, 12781, 27436
+7357:  DATA 8892, 23590, 6064, 20852, 2231, 16930, 32178, 14127
+7365:  DATA 28328, 10270, 25541, 7533, 21738, 3653, 18911, 996
+7373:  DATA 15643, 29937, 11865, 26680, 9172, 23856, 5277, 20112
+7381:  DATA 2053, 17365, 32229, 14199, 28356, 10374, 25192, 7222
+7389:  DATA 22515, 4592, 19312, 1324, 15585, 30389, 12403, 27168
+7397:  DATA 9726, 24528, 6481, 21371, 3429, 17604, 32389, 14497
+7405:  DATA 29213, 11381, 26132, 8231, 23489, 5552, 20380, 2474
+7413:  DATA 17225, 32016, 14194, 29041, 11030, 25860, 8054, 22884
+7421:  DATA 4924, 19748, 1909, 16672, 31549, 13621, 28541, 10547
+7429:  DATA 25384, 7427, 22289, 4404, 19296, 1374, 16201, 31208
+7437:  DATA 13277, 28137, 10202, 24609, 6741, 21604, 3669, 18605
+7445:  DATA 643, 15579, 31077, 13165, 27978, 10117, 25005, 6711
+7453:  DATA 21624, 3765, 18613, 1333, 16181, 31136, 13308, 27703
+7461:  DATA 9854, 24721, 6850, 22385, 4581, 19420, 1032, 16037
+7469:  DATA 30937, 13689, 28571, 10291, 25109, 7423, 22792, 5040
+7477:  DATA 19853, 1631, 16611, 32052, 14225, 28696, 10920, 26468
+7485:  DATA 8638, 23089, 5283, 20785, 2983, 17470, 32499, 15168
+7493:  DATA 30138, 11797, 26774, 9568, 24449, 6229, 21196, 4023
+7501:  DATA 18441, 667, 16248, 30779, 12934, 28515, 10653, 25255
+7509:  DATA 7948, 22982, 4768, 20326, 2507, 17040, 32596, 14379
+7517:  DATA 29416, 12272, 26740, 9510, 24560, 6384, 21870, 3632
+7525:  DATA 18668, 1438, 15937, 31613, 13355, 28375, 11213, 25773
+7533:  DATA 8531, 23088, 5908, 20596, 2777, 18417, 143, 15779
+7541:  DATA 30280, 13072, 27750, 10613, 25107, 7957, 22591, 5418
+7549:  DATA 20093, 2870, 17440, 312, 14905, 30576, 12338, 27938
+7557:  DATA 9837, 25362, 7180, 22907, 4713, 20293, 2112, 17837
+7565:  DATA 32403, 15349, 29894, 12343, 27920, 9854, 25417, 7396
+7573:  DATA 22912, 4831, 20022, 2919, 17419, 464, 15021, 30224
+7581:  DATA 13173, 27829, 10677, 25911, 7796, 23462, 5368, 20534
+7589:  DATA 3427, 18128, 960, 16236, 30897, 13781, 28931, 10912
+7597:  DATA 26574, 9008, 23681, 6203, 21781, 3812, 18965, 1953
+7605:  DATA 16525, 31815, 14816, 30055, 11921, 27230, 10185, 25395
+7613:  DATA 7352, 22563, 5537, 20831, 2712, 17983, 942, 16183
+7621:  DATA 30957, 13331, 29060, 11618, 26336, 8770, 24515, 7001
+7629:  DATA 22308, 4351, 19520, 2164, 17812, 354, 15064, 30436
+7637:  DATA 12830, 28612, 11172, 26490, 8385, 23705, 6243, 21539
+7645:  DATA 4541, 19897, 2427, 17780, 32500, 15088, 30321, 12837
+7653:  DATA 28671, 11159, 26432, 9012, 24358, 6353, 21659, 4257
+7661:  DATA 19535, 2174, 17493, 50, 15808, 31228, 13713, 29156
+7669:  DATA 11586, 26966, 9509, 24950, 7436, 22815, 5409, 20785
+7677:  DATA 3376, 18745, 1339, 16689, 32038, 14643, 30008, 12586
+7685:  DATA 27961, 10576, 25864, 8571, 23926, 6467, 21763, 4580
+7693:  DATA 19933, 2500, 17885, 49, 15445, 30835, 13404, 28850
+7701:  DATA 11400, 26818, 10027, 25396, 8000, 23432, 6137, 21025
+7709:  DATA 3699, 19124, 1766, 17780, 353, 15807, 31165, 13360
+7717:  DATA 28773, 11413, 26757, 10097, 25508, 8131, 23065, 5866
+7725:  DATA 21149, 4400, 19873, 2108, 17488, 226, 16152, 31716
+7733:  DATA 14276, 29251, 11941, 28021, 10693, 25619, 8383, 24353
+7741:  DATA 7083, 22073, 4774, 20785, 3573, 18489, 1203, 17252
+7749:  DATA 32697, 14872, 30336, 13620, 29175, 11359, 26830, 10159
+7757:  DATA 25102, 7856, 23874, 6204, 21660, 4979, 20437, 2788
+7765:  DATA 18690, 1472, 16544, 32634, 15318, 30416, 13668, 28714
+7773:  DATA 11497, 27583, 9781, 25909, 8629, 23712, 7036, 22071
+7781:  DATA 4862, 20881, 3138, 19313, 1643, 17076, 392, 15525
+7789:  DATA 31566, 13924, 30066, 12324, 27860, 11235, 26254, 9637
+7797:  DATA 24650, 8021, 23042, 6468, 21508, 4867, 20030, 3365
+7805:  DATA 18490, 1845, 17125, 269, 15418, 31525, 13949, 29989
+7813:  DATA 12351, 28437, 10821, 27005, 9323, 25360, 7756, 24036
+7821:  DATA 6302, 22498, 4816, 20514, 3868, 19043, 2392, 17636
+7829:  DATA 898, 16094, 31845, 15200, 30285, 13717, 28845, 11827
+7837:  DATA 28024, 10403, 26593, 9588, 24674, 8113, 23281, 6184
+7845:  DATA 22317, 4767, 20931, 3892, 19121, 2520, 18184, 740
+7853:  DATA 16848, 32639, 14982, 30759, 14101, 29427, 12316, 28594
+7861:  DATA 10952, 26690, 10219, 25914, 8389, 24144, 7564, 23396
+7869:  DATA 5817, 21553, 5031, 20799, 3317, 18976, 2492, 18231
+7877:  DATA 702, 16401, 32642, 15729, 30885, 13916, 30152, 13221
+7885:  DATA 28953, 11491, 27157, 10290, 26496, 9570, 24777, 7852
+7893:  DATA 23560, 7106, 23013, 5987, 21184, 4227, 20089, 3178
+7901:  DATA 19389, 2544, 18241, 1340, 16624, 32418, 15480, 31332
+7909:  DATA 14820, 30595, 13573, 29557, 12645, 27868, 10892, 26784
+7917:  DATA 9817, 25717, 8711, 24692, 8157, 24053, 7055, 22945
+7925:  DATA 5901, 21831, 4973, 20861, 3846, 19736, 2925, 18728
+7933:  DATA 1848, 17713, 817, 16679, 32629, 15668, 31538, 14643
+7941:  DATA 30499, 13648, 29452, 12666, 28529, 11615, 27405, 10661
+7949:  DATA 26589, 9699, 25560, 8245, 24089, 7292, 23128, 6326
+7957:  DATA 22209, 5264, 21800, 4987, 20822, 3971, 19872, 2594
+7965:  DATA 18548, 1724, 17657, 1329, 17265, 496, 16382, 31781
+7973:  DATA 14971, 30869, 14039, 30586, 13797, 29650, 12296, 28328
+7981:  DATA 11474, 28007, 11227, 26706, 9814, 25841, 9483, 25505
+7989:  DATA 8671, 24158, 7299, 23928, 7044, 22548, 5801, 22305
+7997:  DATA 5551, 21080, 4273, 20789, 4007, 19515, 2739, 19233
+8005:  DATA 2494, 17923, 1250, 17732, 996, 16451, 32478, 16293
+8013:  DATA 31770, 15093, 31500, 14365, 30337, 14128, 30164, 12983
+8021:  DATA 29517, 12736, 28332, 12128, 28102, 10904, 27437, 10278
+8029:  DATA 26353, 10161, 25718, 9535, 25531, 8432, 24893, 7709
+8037:  DATA 23778, 7557, 23045, 7029, 22583, 5845, 22477, 5288
+8045:  DATA 21844, 4731, 21264, 4152, 20172, 4016, 19593, 3499
+8053:  DATA 18957, 2898, 18528, 2356, 17920, 1809, 17465, 1313
+8061:  DATA 16947, 880, 16439, 301, 15989, 32561, 15485, 32035
+8069:  DATA 14911, 31493, 14336, 31034, 13902, 30569, 13378, 30129
+8077:  DATA 13021, 29686, 12496, 28721, 12569, 28208, 12105, 27820
+8085:  DATA 11660, 27332, 10853, 27501, 10314, 27013, 9983, 26212
+8093:  DATA 10097, 25785, 9714, 25916, 8801, 25584, 8430, 24619
+8101:  DATA 8568, 24194, 8134, 24433, 7397, 24025, 7454, 23268
+8109:  DATA 7120, 23423, 6279, 22577, 6421, 22244, 5653, 22437
+8117:  DATA 5315, 21520, 5622, 21857, 4739, 21014, 5028, 21287
+8125:  DATA 4276, 20533, 4539, 20768, 3829, 20004, 4018, 20324
+8133:  DATA 3238, 19477, 3456, 19812, 2725, 19031, 3039, 19377
+8141:  DATA 2840, 18659, 2069, 18485, 2434, 18801, 1732, 18154
+8149:  DATA 1637, 18387, 1962, 18298, 1233, 17561, 1123, 17457
+8157:  DATA 1528, 17876, 1399, 17717, 758, 17083, 530, 16912
+8165:  DATA 1018, 17305, 854, 17248, 828, 16528, 157, 16549
+8173:  DATA 78, 16483, 20, 16435, 464, 16867, 390, 16797
+8181:  DATA 322, 16709, 293, 16757, 279, 16661, 365, 16685
+8189:  DATA 307, 16752, 308, 16756, 312, 16689, 295, 16673
+8197:  DATA 365, 16671, 259, 16692, 369, 16711, 324, 16823
+8205:  DATA 393, 16873, 405, 16440, 28, 16484, 73, 16552
+8213:  DATA 136, 16528, 821, 17269, 854, 17283, 1004, 16931
+8221:  DATA 632, 17059, 697, 17780, 1396, 17852, 1521, 17508
+8229:  DATA 1129, 17561, 1224, 18296, 1980, 18320, 1537, 18093
+8237:  DATA 1737, 18736, 2455, 18477, 2069, 18685, 2834, 19382
+8245:  DATA 3016, 18960, 2791, 19837, 3466, 19484, 3256, 20265
+8253:  DATA 4020, 20030, 3760, 20775, 4534, 20533, 4275, 21296
+8261:  DATA 5101, 21021, 4746, 21863, 5622, 21534, 5261, 22500
+8269:  DATA 5673, 22264, 6480, 22566, 6288, 23344, 7124, 23223
+8277:  DATA 7501, 24017, 7397, 24440, 8132, 24212, 8553, 24609
+8285:  DATA 8431, 25584, 8829, 25905, 9703, 25781, 10045, 26152
+8293:  DATA 9960, 27025, 10305, 27517, 10795, 27351, 11725, 27825
+8301:  DATA 12109, 28222, 12659, 28728, 12500, 29684, 12953, 30113
+8309:  DATA 13407, 30517, 13931, 31099, 14359, 31492, 14885, 32065
+8317:  DATA 15406, 32575, 15904, 288, 16445, 852, 16952, 1317
+8325:  DATA 17470, 1796, 18017, 2403, 18528, 2883, 19033, 3531
+8333:  DATA 19625, 4071, 20188, 4135, 21249, 4713, 21789, 5300
+8341:  DATA 22412, 5827, 22582, 7029, 23106, 7573, 23806, 7795
+8349:  DATA 24900, 8383, 25568, 9588, 25716, 10146, 26360, 10340
+8357:  DATA 27492, 10910, 28037, 12149, 28389, 12740, 29466, 12973
+8365:  DATA 30158, 14180, 30348, 14452, 31576, 15089, 31751, 16289
+8373:  DATA 32397, 16479, 995, 17716, 1161, 17945, 2489, 19248
+8381:  DATA 2737, 19509, 4085, 20772, 4276, 21027, 5550, 22309
+8389:  DATA 5802, 22549, 7062, 23864, 7333, 24145, 8641, 25512
+8397:  DATA 9565, 25841, 9817, 26685, 11166, 28021, 11411, 28353
+8405:  DATA 12291, 29663, 13751, 30560, 14029, 30965, 14974, 31787
+8413:  DATA 16360, 420, 17277, 1360, 17634, 1717, 18542, 2608
+8421:  DATA 19842, 4004, 20818, 4989, 21814, 5316, 22164, 6372
+8429:  DATA 23117, 7281, 24070, 8231, 25556, 9719, 26520, 10679
+8437:  DATA 27418, 11625, 28522, 12641, 29509, 13585, 30527, 14625
+8445:  DATA 31613, 15673, 32571, 16756, 820, 17776, 1840, 18725
+8453:  DATA 2871, 19733, 3909, 20859, 4963, 21776, 5953, 22957
+8461:  DATA 7049, 24036, 8153, 24625, 8789, 25700, 9802, 26797
+8469:  DATA 10910, 27844, 12604, 29492, 13653, 30609, 14846, 31287
+8477:  DATA 15484, 32439, 16624, 1319, 18233, 2544, 19452, 3112
+8485:  DATA 20065, 4304, 21188, 6008, 22956, 7131, 23560, 7914
+8493:  DATA 24760, 9598, 26522, 10278, 27201, 11512, 29048, 13239
+8501:  DATA 30146, 13893, 30961, 15740, 32737, 16405, 684, 18231
+8509:  DATA 2473, 19039, 3201, 20771, 5052, 21539, 5801, 23357
+8517:  DATA 7661, 24064, 8324, 25959, 10230, 26705, 10954, 28577
+8525:  DATA 12302, 29420, 14188, 30779, 14976, 32560, 16860, 694
+8533:  DATA 18184, 2448, 19116, 3962, 20869, 4753, 22317, 6185
+8541:  DATA 23292, 8106, 24688, 9588, 26618, 10422, 27965, 11813
+8549:  DATA 28897, 13721, 30286, 15217, 31845, 16092, 900, 17584
+8557:  DATA 2377, 19068, 3856, 20596, 4805, 22513, 6286, 23991
+8565:  DATA 7756, 25431, 9312, 26983, 10825, 28496, 12332, 29992
+8573:  DATA 13873, 31600, 15393, 291, 16956, 1827, 18473, 3389
+8581:  DATA 20067, 4986, 21615, 6464, 23149, 8021, 24589, 9652
+8589:  DATA 26268, 11235, 27846, 12341, 29970, 13941, 31517, 15536
+8597:  DATA 386, 17040, 1585, 19324, 3136, 20944, 4840, 22053
+8605:  DATA 7022, 23716, 8629, 25912, 9850, 27583, 11510, 28727
+8613:  DATA 13613, 30342, 15296, 32614, 16572, 1424, 18697, 2725
+8621:  DATA 20431, 4987, 21710, 6260, 23884, 7935, 25096, 10212
+8629:  DATA 26841, 11352, 29164, 13690, 30350, 14928, 32692, 17195
+8637:  DATA 1192, 18544, 3517, 20785, 4788, 22050, 7165, 24357
+8645:  DATA 8429, 25655, 10647, 28001, 12000, 29214, 14248, 31658
+8653:  DATA 16146, 226, 17473, 2108, 19952, 4451, 21202, 5809
+8661:  DATA 23065, 8152, 25537, 10083, 26816, 11395, 28793, 13376
+8669:  DATA 31224, 15793, 358, 17696, 1690, 19076, 3690, 21037
+8677:  DATA 6142, 23428, 8028, 25396, 10037, 26833, 11422, 28855
+8685:  DATA 13404, 30839, 15376, 39, 17794, 2505, 19858, 4529
+8693:  DATA 21773, 6481, 23927, 8561, 25925, 10521, 27939, 12644
+8701:  DATA 30012, 14704, 32057, 16701, 1313, 18724, 3377, 20769
+8709:  DATA 5485, 22813, 7428, 24942, 9568, 26896, 11586, 29090
+8717:  DATA 13789, 31204, 15810, 61, 17414, 2148, 19524, 4324
+8725:  DATA 21661, 6353, 24374, 9063, 26436, 11159, 28648, 12855
+8733:  DATA 30257, 15088, 32500, 17720, 2425, 19952, 4604, 21544
+8741:  DATA 6244, 23707, 8384, 26426, 11200, 28638, 12802, 30390
+8749:  DATA 15049, 376, 17904, 2087, 19546, 4325, 22281, 7084
+8757:  DATA 24489, 8789, 26340, 11623, 29073, 13439, 30873, 16179
+8765:  DATA 948, 17955, 2721, 20781, 5621, 22560, 7356, 25399
+8773:  DATA 10174, 27153, 11906, 30065, 14838, 31923, 16628, 1963
+8781:  DATA 18952, 3760, 21844, 6182, 23696, 9008, 26580, 10922
+8789:  DATA 29005, 13777, 30949, 16224, 978, 18073, 3454, 20528
+8797:  DATA 5348, 23536, 7796, 25912, 10748, 27835, 13176, 30308
+8805:  DATA 15074, 406, 17413, 2936, 20012, 4804, 22937, 7336
+8813:  DATA 25432, 9776, 27909, 12341, 29894, 15331, 32412, 17827
+8821:  DATA 2120, 20291, 4649, 22836, 7172, 25372, 9761, 28004
+8829:  DATA 12336, 30513, 14895, 305, 17531, 2906, 20055, 5392
+8837:  DATA 22565, 7957, 25157, 10609, 27748, 13123, 30297, 15844
+8845:  DATA 141, 18417, 2758, 20519, 5908, 23159, 8536, 25828
+8853:  DATA 11148, 28352, 13365, 31601, 15940, 1410, 18686, 3684
+8861:  DATA 21867, 6325, 24551, 9517, 26677, 12212, 29436, 14390
+8869:  DATA 32614, 17099, 2437, 20333, 4778, 22981, 8013, 25250
+8877:  DATA 10712, 28533, 12953, 30836, 16217, 761, 18454, 4001
+8885:  DATA 21185, 6217, 24485, 9568, 26762, 11856, 30127, 15137
+8893:  DATA 32509, 17461, 2996, 20768, 5296, 23102, 8701, 26406
+8901:  DATA 10932, 28752, 14212, 32052, 16578, 1602, 19928, 5025
+8909:  DATA 22867, 7317, 25179, 10299, 28551, 13668, 30933, 16065
+8917:  DATA 1054, 19423, 4528, 22368, 6861, 24820, 9850, 27681
+8925:  DATA 13294, 31140, 16145, 1329, 18676, 3747, 21609, 6731
+8933:  DATA 25049, 10119, 27980, 13159, 31025, 15561, 717, 18612
+8941:  DATA 3676, 21603, 6662, 24629, 10194, 28149, 13198, 31219
+8949:  DATA 16244, 1375, 19312, 4404, 22276, 7426, 25384, 10596
+8957:  DATA 28468, 13630, 31605, 16693, 1909, 19773, 4924, 22846
+8965:  DATA 7976, 25936, 11018, 29042, 14117, 32081, 17217, 2477
+8973:  DATA 20374, 5621, 23445, 8224, 26114, 11385, 29262, 14512
+8981:  DATA 32404, 17552, 3381, 21365, 6486, 24451, 9708, 27171
+8989:  DATA 12408, 30371, 15545, 1396, 19316, 4540, 22513, 7268
+8997:  DATA 25185, 10393, 28369, 14176, 32169, 17365, 2115, 20161
+9005:  DATA 5331, 23935, 9095, 26656, 11869, 29844, 15640, 933
+9013:  DATA 18910, 3652, 21632, 7527, 25482, 10245, 28345, 14124
+9021:  DATA 32210, 16900, 2210, 20797, 6054, 23588, 8868, 27492
+9029:  DATA 12733, 30225, 15510, 1383, 19428, 4183, 22216, 8119
+9037:  DATA 25674, 10953, 29530, 14369, 32469, 18289, 3535, 21153
+9045:  DATA 6989, 25049, 9899, 28468, 13764, 31440, 17248, 2085
+9053:  DATA 20199, 6069, 23605, 9531, 27635, 12528, 31081, 15923
+9061:  DATA 1252, 19843, 4689, 23405, 8293, 26332, 12164, 29872
+9069:  DATA 15689, 636, 19216, 4212, 22213, 8177, 25742, 11703
+9077:  DATA 29260, 15191, 96, 18791, 3657, 22352, 7212, 25896
+9085:  DATA 10801, 29552, 14388, 312, 17980, 3899, 21560, 7530
+9093:  DATA 25161, 11015, 28672, 14695, 32369, 18239, 3193, 21939
+9101:  DATA 6804, 25571, 10433, 28717, 14677, 32352, 18268, 3255
+9109:  DATA 21918, 6865, 25122, 11121, 28758, 14791, 32468, 17963
+9117:  DATA 3944, 21744, 7668, 25894, 10864, 29680, 14580, 42
+9125:  DATA 18733, 3729, 22405, 8057, 25764, 11722, 29960, 15076
+9133:  DATA 978, 19318, 4309, 22560, 8514, 26361, 11790, 30640
+9141:  DATA 15572, 1040, 19945, 5501, 23185, 8708, 27553, 13089
+9149:  DATA 30973, 16416, 2484, 20775, 5798, 24113, 10170, 28449
+9157:  DATA 13502, 31836, 17861, 3445, 21225, 6748, 25485, 11173
+9165:  DATA 29457, 14585, 94, 18481, 4571, 22804, 7882, 26273
+9173:  DATA 11806, 30660, 16330, 1856, 19666, 5273, 23678, 9264
+9181:  DATA 28132, 13808, 32101, 17717, 2790, 21155, 6780, 25123
+9189:  DATA 11240, 29571, 15122, 845, 19242, 4293, 22733, 8357
+9197:  DATA 26703, 12405, 30805, 16445, 2523, 20912, 6556, 25060
+9205:  DATA 10585, 28999, 14700, 359, 18705, 4361, 22893, 8489
+9213:  DATA 26940, 12586, 31024, 16756, 2362, 20790, 6525, 24872
+9221:  DATA 10532, 28932, 14609, 376, 18784, 4368, 22877, 8613
+9229:  DATA 27022, 12771, 31188, 16435, 2064, 20579, 6161, 24804
+9237:  DATA 10380, 28892, 15145, 820, 19268, 5020, 23524, 8751
+9245:  DATA 27256, 13054, 31376, 17722, 3450, 21922, 7657, 25644
+9253:  DATA 11272, 29827, 15562, 1889, 20401, 6104, 24161, 9856
+9261:  DATA 28380, 14690, 414, 18548, 4165, 22769, 8974, 27575
+9269:  DATA 13260, 31319, 17120, 3430, 21948, 7199, 25784, 12132
+9277:  DATA 30652, 15906, 1712, 20852, 6588, 24638, 10493, 29477
+9285:  DATA 15341, 542, 19076, 5478, 24055, 9311, 27866, 14308
+9293:  DATA 32269, 18161, 4422, 22567, 8340, 27511, 13272, 31466
+9301:  DATA 17741, 3472, 21649, 8060, 26560, 11906, 31080, 16484
+9309:  DATA 2292, 21411, 6709, 25904, 11764, 29858, 16246, 1578
+9317:  DATA 20200, 6531, 24662, 11060, 29233, 15071, 1485, 19632
+9325:  DATA 5973, 24181, 10581, 28707, 14544, 995, 19081, 5608
+9333:  DATA 23565, 10066, 28272, 14688, 69, 19209, 4642, 23857
+9341:  DATA 9341, 28467, 13876, 314, 18549, 4914, 23100, 9526
+9349:  DATA 27688, 14108, 32284, 18740, 4214, 23381, 8776, 28132
+9357:  DATA 13468, 32688, 18130, 4152, 23322, 8807, 27988, 13482
+9365:  DATA 32650, 18064, 4138, 23396, 8768, 28062, 13540, 32298
+9373:  DATA 18810, 4336, 23521, 9531, 27701, 14244, 32501, 18465
+9381:  DATA 4909, 23189, 9668, 28519, 14001, 414, 19305, 4787
+9389:  DATA 24024, 10083, 28289, 14416, 848, 19185, 5134, 24496
+9397:  DATA 9889, 28788, 15332, 1382, 19598, 5712, 25021, 11045
+9405:  DATA 29358, 15395, 1972, 20787, 6320, 25202, 11652, 30507
+9413:  DATA 16056, 2128, 21380, 7526, 25824, 11792, 31172, 17322
+9421:  DATA 3421, 21745, 7701, 26672, 13204, 32098, 17622, 3816
+9429:  DATA 22605, 9182, 28068, 14182, 32471, 18591, 4730, 23652
+9437:  DATA 10221, 29105, 15206, 1319, 19700, 5815, 24696, 10858
+9445:  DATA 30089, 16277, 2372, 21351, 7473, 25780, 11930, 30881
+9453:  DATA 16974, 3172, 22137, 8208, 27604, 13794, 32662, 18916
+9461:  DATA 4957, 23889, 10102, 29031, 15108, 1303, 20264, 6502
+9469:  DATA 25348, 11583, 30496, 16756, 2868, 21794, 7992, 26980
+9477:  DATA 13092, 32030, 18245, 4469, 23333, 9556, 28492, 14774
+9485:  DATA 918, 19900, 6037, 24634, 10772, 29794, 15951, 2219
+9493:  DATA 21146, 7312, 26933, 13173, 32086, 18307, 4588, 23075
+9501:  DATA 9336, 28414, 14481, 1329, 20340, 6563, 25577, 11328
+9509:  DATA 30330, 16533, 2774, 22368, 8649, 27636, 13324, 32438
+9517:  DATA 18646, 5424, 24453, 10293, 29254, 15587, 2332, 21411
+9525:  DATA 7624, 26196, 12508, 32123, 18320, 4176, 23212, 10038
+9533:  DATA 29112, 14960, 1212, 20794, 7157, 25649, 12029, 31520
+9541:  DATA 17836, 3586, 22670, 9528, 28581, 14430, 716, 20406
+9549:  DATA 6159, 25343, 12098, 30836, 17029, 3953, 22990, 8887
+9557:  DATA 28428, 14807, 672, 20282, 6533, 25296, 12121, 30763
+9565:  DATA 17085, 4004, 22653, 9521, 28597, 14503, 1400, 20023
+9573:  DATA 6393, 26076, 11781, 31597, 17450, 3781, 23501, 9399
+9581:  DATA 29005, 14975, 1793, 20596, 6854, 26623, 12432, 32161
+9589:  DATA 17933, 4934, 23648, 10611, 29184, 16132, 2092, 21808
+9597:  DATA 7732, 27455, 13371, 372, 18978, 5944, 24632, 11574
+9605:  DATA 30248, 17232, 3089, 22908, 8800, 28432, 14429, 1445
+9613:  DATA 20110, 7139, 25812, 12339, 32016, 17968, 4952, 23740
+9621:  DATA 10653, 29393, 15915, 2928, 21590, 8670, 27273, 13857
+9629:  DATA 892, 19619, 6625, 25936, 11874, 31669, 17646, 4144
+9637:  DATA 23816, 9890, 29648, 16253, 2219, 21955, 8597, 27293
+9645:  DATA 14290, 869, 19669, 6183, 25921, 12017, 31251, 18336
+9653:  DATA 4237, 23641, 10731, 30004, 16004, 2640, 22433, 8997
+9661:  DATA 27823, 14391, 1456, 20852, 6838, 26161, 13227, 32545
+9669:  DATA 18623, 5150, 25029, 11619, 30444, 16964, 4037, 23524
+9677:  DATA 10012, 28848, 15453, 2081, 21906, 8565, 27293, 14006
+9685:  DATA 536, 20441, 7083, 26420, 12497, 31903, 18477, 5168
+9693:  DATA 25077, 11701, 31029, 17722, 3834, 23202, 9833, 29228
+9701:  DATA 16289, 3024, 22346, 9058, 28448, 14530, 1162, 20662
+9709:  DATA 7250, 26727, 13339, 116, 19927, 6633, 26077, 12724
+9717:  DATA 32065, 18769, 5483, 24928, 11589, 31004, 17700, 4386
+9725:  DATA 23864, 10622, 30069, 16756, 3329, 22840, 9528, 28982
+9733:  DATA 15656, 2384, 21772, 8551, 27941, 14673, 1293, 20904
+9741:  DATA 7580, 27106, 13778, 49, 19541, 6243, 25673, 12459
+9749:  DATA 31875, 18645, 5989, 25461, 12119, 31635, 18405, 4659
+9757:  DATA 24188, 10921, 30389, 17696, 4474, 24048, 10729, 29740
+9765:  DATA 16488, 3280, 22731, 10107, 29623, 16324, 2565, 22244
+9773:  DATA 8924, 29043, 15745, 2109, 21595, 8439, 28509, 15269
+9781:  DATA 2014, 21008, 7921, 28028, 14720, 1104, 20649, 7979
+9789:  DATA 27570, 13858, 674, 20789, 7596, 26736, 13481, 811
+9797:  DATA 20461, 6660, 26253, 13681, 421, 19522, 6360, 26541
+9805:  DATA 12819, 32501, 19793, 6260, 25750, 13183, 32720, 19124
+9813:  DATA 6401, 26069, 12477, 32570, 19333, 5840, 25932, 12388
+9821:  DATA 31998, 19362, 5744, 25890, 12796, 31923, 19320, 5732
+9829:  DATA 25316, 12702, 31749, 19296, 5677, 25301, 12749, 31926
+9837:  DATA 19282, 5747, 25886, 12404, 31937, 19455, 5853, 26032
+9845:  DATA 12357, 32597, 18981, 6513, 25604, 13059, 32313, 19812
+9853:  DATA 6193, 26421, 12852, 304, 19494, 7024, 26153, 13611
+9861:  DATA 109, 20241, 6667, 26932, 13412, 860, 20044, 7606
+9869:  DATA 26768, 14329, 731, 20531, 7961, 27241, 14621, 1184
+9877:  DATA 21388, 7874, 27694, 15156, 1621, 21905, 8446, 28215
+9885:  DATA 15740, 2231, 22512, 9507, 28788, 16297, 2739, 22592
+9893:  DATA 10088, 29329, 16854, 3936, 23232, 10718, 30466, 17078
+9901:  DATA 4553, 24440, 10992, 30726, 18240, 4857, 24595, 12215
+9909:  DATA 31256, 18537, 6122, 25953, 12485, 32273, 19903, 6945
+9917:  DATA 26365, 13369, 955, 20852, 7329, 27192, 14776, 1892
+9925:  DATA 21154, 8222, 28550, 15729, 2216, 22111, 9693, 29617
+9933:  DATA 16657, 3317, 23131, 10272, 30677, 17782, 4306, 24253
+9941:  DATA 11272, 31682, 18917, 6011, 25283, 12496, 32364, 19556
+9949:  DATA 7152, 27057, 14182, 1319, 20732, 7846, 27768, 14948
+9957:  DATA 2559, 22405, 9548, 29562, 16672, 3284, 23245, 10407
+9965:  DATA 30290, 17533, 4613, 24632, 12240, 32232, 19411, 6628
+9973:  DATA 26381, 13668, 877, 20849, 7959, 27925, 15213, 2349
+9981:  DATA 22318, 9584, 29492, 16756, 3889, 23871, 11058, 31030
+9989:  DATA 18285, 5380, 25354, 12596, 32625, 19800, 6984, 27108
+9997:  DATA 14222, 1535, 21440, 8224, 28189, 15408, 2641, 22689
+10005: DATA 9868, 29908, 17708, 4986, 24898, 12240, 32249, 18987
+10013: DATA 6205, 26276, 13565, 1329, 21301, 8639, 28651, 15393
+10021: DATA 2687, 22679, 9943, 30587, 17842, 5060, 24581, 12004
+10029: DATA 31954, 19813, 7041, 26663, 13916, 1268, 21784, 9188
+10037: DATA 29132, 15966, 3297, 23860, 11158, 30724, 18092, 5933
+10045: DATA 26031, 12835, 245, 20768, 8122, 27760, 15017, 2860
+10053: DATA 22952, 9808, 29835, 17787, 5111, 24644, 11973, 32740
+10061: DATA 19466, 6904, 27484, 14391, 1693, 22320, 9681, 29345
+10069: DATA 17164, 4564, 24293, 12157, 32203, 19076, 7010, 26724
+10077: DATA 14076, 2032, 21625, 9525, 29671, 16567, 4472, 24118
+10085: DATA 11437, 32152, 19012, 7032, 26665, 13982, 2024, 21674
+10093: DATA 9554, 29282, 17153, 4156, 24240, 12259, 31890, 19889
+10101: DATA 6745, 27480, 14336, 2374, 22032, 10009, 29731, 17719
+10109: DATA 4984, 25353, 12346, 289, 20085, 7971, 27689, 15653
+10117: DATA 2595, 23316, 10309, 31101, 18027, 5904, 25689, 13740
+10125: DATA 664, 21424, 8408, 28725, 16646, 3683, 24404, 11442
+10133: DATA 32136, 19088, 6694, 27505, 14411, 2436, 22271, 9765
+10141: DATA 30577, 17648, 5629, 25909, 12921, 956, 20669, 8235
+10149: DATA 29035, 16080, 4049, 24444, 11424, 32195, 19720, 6884
+10157: DATA 27599, 15205, 2204, 22586, 10566, 30398, 18013, 6116
+10165: DATA 25849, 13400, 1504, 21812, 8850, 29201, 17313, 4904
+10173: DATA 24750, 12400, 436, 20774, 7856, 28272, 16318, 3894
+10181: DATA 23736, 11293, 32135, 19832, 6892, 27230, 15306, 3048
+10189: DATA 23389, 10481, 30811, 18480, 6613, 26982, 14040, 1699
+10197: DATA 22024, 10180, 30628, 18272, 5324, 25759, 13411, 1124
+10205: DATA 22005, 9649, 30054, 17780, 4854, 25276, 12920, 549
+10213: DATA 21503, 9116, 29532, 17204, 4913, 24785, 12422, 161
+10221: DATA 20563, 8240, 28698, 16418, 4560, 25058, 12755, 484
+10229: DATA 20749, 8546, 29034, 16763, 4360, 24835, 12653, 293
+10237: DATA 20783, 8501, 29045, 16693, 4385, 24868, 12604, 295
+10245: DATA 20773, 8469, 28929, 16692, 4460, 24926, 12557, 421
+10253: DATA 20881, 8700, 29077, 16432, 4124, 24674, 12376, 167
+10261: DATA 20633, 8409, 29482, 17274, 4950, 25566, 13229, 612
+10269: DATA 21065, 8888, 29424, 17702, 5488, 26096, 13812, 1079
+10277: DATA 21549, 9361, 29829, 18279, 6065, 26562, 13836, 1706
+10285: DATA 22234, 10613, 31189, 18489, 6234, 26878, 15112, 2985
+10293: DATA 23496, 10846, 31473, 19764, 7564, 27678, 15597, 3888
+10301: DATA 24501, 11829, 32501, 20791, 8624, 28734, 16553, 4897
+10309: DATA 25535, 12880, 650, 21874, 9637, 29764, 17605, 6049
+10317: DATA 26205, 14072, 2388, 22584, 10393, 31536, 19402, 6829
+10325: DATA 27929, 15832, 3301, 24439, 12236, 32386, 20846, 8241
+10333: DATA 28913, 17329, 4711, 25972, 13798, 1212, 22386, 9776
+10341: DATA 30462, 18896, 6212, 27514, 14881, 2704, 23960, 11434
+10349: DATA 32584, 20067, 8448, 28725, 16601, 5040, 25230, 13757
+10357: DATA 1088, 22354, 9834, 31096, 18454, 7006, 27245, 15716
+10365: DATA 3092, 24356, 11893, 294, 20528, 9009, 29241, 17719
+10373: DATA 5239, 26490, 13935, 2379, 22565, 11035, 31245, 19867
+10381: DATA 7389, 28602, 16021, 4107, 25387, 12834, 1309, 21743
+10389: DATA 10189, 30447, 18459, 6951, 27141, 15837, 3245, 24091
+10397: DATA 12605, 237, 21429, 9575, 29740, 18409, 5784, 26666
+10405: DATA 15202, 2690, 24017, 12156, 32448, 20931, 8962, 29361
+10413: DATA 17865, 6008, 26353, 14385, 2900, 23267, 11273, 32704
+10421: DATA 20186, 8277, 29686, 17760, 5344, 26146, 14776, 2861
+10429: DATA 23219, 11299, 32626, 20758, 8368, 29235, 17852, 5937
+10437: DATA 26302, 14357, 3013, 23933, 11505, 32272, 20933, 9125
+10445: DATA 29966, 17584, 5719, 26673, 15248, 3454, 23709, 11959
+10453: DATA 2, 21392, 9650, 30577, 18121, 6300, 27168, 15412
+10461: DATA 4079, 25023, 13153, 1329, 21750, 9892, 30840, 18976
+10469: DATA 7585, 28624, 16721, 4988, 25900, 13507, 1741, 22710
+10477: DATA 10834, 31871, 19992, 8308, 29661, 17905, 6031, 27040
+10485: DATA 15169, 3401, 24357, 12647, 781, 21791, 10042, 31031
+10493: DATA 19325, 7459, 28476, 16691, 4923, 25891, 14205, 2347
+10501: DATA 23339, 11600, 32513, 20849, 9062, 30033, 18260, 6634
+10509: DATA 27613, 15792, 4065, 24636, 12816, 1072, 22090, 10405
+10517: DATA 31361, 19676, 8502, 29492, 17732, 6018, 27112, 14948
+10525: DATA 3198, 24255, 12515, 1329, 22375, 10677, 31737, 19556
+10533: DATA 7780, 28830, 17029, 6001, 27049, 15313, 3087, 24235
+10541: DATA 12495, 1393, 22401, 10289, 31253, 19709, 8456, 29622
+10549: DATA 17868, 5724, 26870, 15668, 3972, 24606, 12969, 1892
+10557: DATA 22969, 10805, 31926, 20795, 9127, 29745, 18089, 6945
+10565: DATA 28073, 15952, 4242, 25981, 14321, 2136, 23181, 12212
+10573: DATA 15, 21237, 10070, 30781, 19098, 8037, 29134, 17124
+10581: DATA 5888, 27093, 15025, 3957, 25033, 12931, 1837, 22565
+10589: DATA 10995, 32692, 20533, 9511, 30689, 18623, 7539, 28193
+10597: DATA 16638, 5598, 26144, 15207, 3114, 24261, 13209, 1196
+10605: DATA 22840, 10818, 32512, 20541, 8923, 30691, 18551, 7581
+10613: DATA 28226, 17221, 5157, 26983, 14865, 3857, 24611, 13600
+10621: DATA 1661, 23353, 11323, 372, 21026, 10040, 30780, 19760
+10629: DATA 7789, 29443, 17408, 6513, 27240, 16195, 4109, 26032
+10637: DATA 13970, 2992, 23773, 12341, 1283, 22133, 11037, 31915
+10645: DATA 20867, 8915, 30240, 19252, 7239, 29077, 17128, 5674
+10653: DATA 27453, 15537, 4533, 25904, 13948, 3006, 23796, 12330
+10661: DATA 1386, 22224, 11213, 32629, 20649, 9692, 31062, 19172
+10669: DATA 8159, 29538, 17562, 6207, 27984, 16126, 4701, 26544
+10677: DATA 14540, 3154, 25065, 13681, 1686, 23120, 12204, 810
+10685: DATA 21689, 10352, 32165, 20795, 8865, 30244, 19384, 7990
+10693: DATA 28852, 17488, 6532, 28006, 16096, 4624, 26590, 15271
+10701: DATA 3868, 24804, 13377, 2097, 23943, 12661, 729, 22244
+10709: DATA 10760, 32710, 21408, 10086, 30940, 19591, 8293, 29729
+10717: DATA 18927, 7605, 28987, 17780, 5813, 27281, 15933, 4663
+10725: DATA 26617, 15249, 3916, 25446, 14118, 2257, 23710, 12449
+10733: DATA 1053, 22648, 11280, 38, 21968, 10672, 32145, 20897
+10741: DATA 9548, 31060, 19830, 8500, 29953, 18719, 7482, 28970
+10749: DATA 17779, 6484, 27953, 16699, 5410, 26942, 15705, 4403
+10757: DATA 25896, 14595, 3345, 24849, 13655, 2373, 23876, 12714
+10765: DATA 1422, 23018, 11745, 60, 21532, 10339, 31773, 20663
+10773: DATA 9352, 30933, 20264, 9063, 30469, 19332, 8162, 29284
+10781: DATA 18047, 6837, 28341, 17717, 6453, 28091, 16884, 5168
+10789: DATA 26734, 15512, 4288, 26490, 15358, 3984, 25113, 13996
+10797: DATA 2776, 24930, 13712, 2164, 23636, 12514, 1816, 23524
+10805: DATA 12239, 578, 22252, 11639, 398, 21584, 10430, 32560
+10813: DATA 21426, 9766, 31408, 20775, 9717, 30769, 19635, 8992
+10821: DATA 30701, 18947, 7821, 30065, 18921, 7238, 28872, 18359
+10829: DATA 6749, 28401, 17753, 6203, 27803, 17271, 6045, 27312
+10837: DATA 16645, 5589, 26853, 16227, 5060, 26268, 15713, 4202
+10845: DATA 25789, 15344, 3664, 25890, 14832, 3234, 25444, 13872
+10853: DATA 2789, 24985, 13387, 2931, 24165, 13016, 2440, 23734
+10861: DATA 13144, 1584, 23837, 12341, 1222, 23472, 11931, 1445
+10869: DATA 22593, 12124, 608, 22906, 11333, 793, 22051, 11568
+10877: DATA 50, 22384, 10801, 317, 21542, 11042, 32312, 21812
+10885: DATA 10284, 32537, 21015, 10554, 31751, 21317, 9821, 32193
+10893: DATA 20655, 10213, 31452, 20538, 9990, 31395, 20836, 9387
+10901: DATA 31640, 20112, 9251, 31613, 20043, 9620, 30893, 20029
+10909: DATA 9586, 30885, 20455, 9511, 30832, 20412, 8955, 30820
+10917: DATA 20324, 8862, 31109, 20323, 8877, 31185, 20249, 8932
+10925: DATA 31178, 20337, 8838, 30836, 20314, 8958, 30750, 20385
+10933: DATA 8845, 30788, 20461, 9585, 30917, 19996, 9636, 31538
+10941: DATA 20148, 9278, 31666, 20852, 9380, 31269, 20924, 10038
+10949: DATA 31417, 20501, 10135, 32103, 20645, 9814, 32194, 21430
+10957: DATA 10589, 31972, 21085, 10289, 32725, 21875, 10450, 32425
+10965: DATA 21533, 11228, 416, 22380, 10891, 208, 22061, 11273
+10973: DATA 1020, 22974, 12140, 1396, 22758, 11965, 1148, 23080
+10981: DATA 12769, 1941, 23895, 13108, 2359, 23775, 12930, 2217
+10989: DATA 24142, 13360, 2562, 24636, 14300, 3571, 25493, 14820
+10997: DATA 3906, 25950, 15206, 4465, 26437, 15640, 4908, 26912
+11005: DATA 16253, 5415, 27444, 16696, 5945, 27939, 17277, 6448
+11013: DATA 28450, 17744, 6913, 29053, 18291, 7513, 29513, 18849
+11021: DATA 8157, 30180, 19421, 8241, 30232, 19504, 8787, 30891
+11029: DATA 20122, 9360, 32041, 21365, 10588, 32720, 21988, 10794
+11037: DATA 61, 22196, 11516, 1319, 23412, 12706, 2031, 23589
+11045: DATA 12916, 2270, 24197, 14132, 3473, 25560, 14344, 3766
+11053: DATA 25816, 15664, 5020, 26663, 15893, 5361, 27997, 17335
+11061: DATA 6617, 28241, 17644, 7526, 29574, 18449, 7870, 30497
+11069: DATA 19965, 8741, 30885, 20852, 10173, 31797, 21167, 11041
+11077: DATA 483, 22130, 11408, 1380, 23425, 12373, 1740, 24503
+11085: DATA 13321, 2709, 25447, 14369, 3740, 26494, 15822, 4717
+11093: DATA 27449, 16856, 5804, 28519, 17797, 6791, 29548, 18487
+11101: DATA 7869, 30652, 19578, 9530, 31730, 20720, 10620, 32291
+11109: DATA 21730, 11728, 580, 23348, 12329, 1745, 24475, 13485
+11117: DATA 3406, 25208, 15189, 4128, 26333, 16354, 5266, 28074
+11125: DATA 16968, 6928, 28791, 18811, 7690, 30493, 19555, 9572
+11133: DATA 31357, 21268, 10279, 317, 22064, 12084, 1136, 23857
+11141: DATA 12861, 2896, 24579, 14715, 3696, 26462, 15449, 5541
+11149: DATA 27284, 17406, 6342, 28788, 18708, 7806, 30553, 19684
+11157: DATA 9614, 31426, 21040, 11129, 71, 22940, 12004, 1578
+11165: DATA 24442, 13552, 3558, 25888, 14964, 5028, 26856, 16417
+11173: DATA 6526, 28368, 18377, 8061, 29867, 19925, 9549, 31408
+11181: DATA 21461, 11125, 213, 22563, 12628, 1788, 24081, 14263
+11189: DATA 3201, 25616, 15844, 5498, 27265, 16976, 7097, 29484
+11197: DATA 18616, 8304, 31158, 20789, 9895, 32294, 22456, 12064
+11205: DATA 1261, 23555, 13713, 3451, 25323, 14933, 5005, 27568
+11213: DATA 17173, 6370, 28762, 18490, 8592, 31024, 20180, 9898
+11221: DATA 32333, 22468, 12205, 1905, 23685, 13459, 3176, 25642
+11229: DATA 15849, 5557, 28007, 17780, 6906, 29366, 19005, 8752
+11237: DATA 31717, 21397, 11013, 870, 23338, 12511, 2176, 24804
+11245: DATA 14420, 4195, 26709, 16434, 6612, 29180, 18833, 8621
+11253: DATA 31043, 20823, 10533, 373, 22805, 12561, 2367, 24880
+11261: DATA 14707, 4436, 26929, 16699, 6434, 28990, 18761, 8471
+11269: DATA 31028, 20766, 10500, 375, 22890, 12610, 2317, 24972
+11277: DATA 14744, 4593, 27089, 16421, 6144, 28785, 18511, 8368
+11285: DATA 30856, 20674, 11062, 1003, 23420, 13215, 3064, 25188
+11293: DATA 14958, 4772, 27380, 17722, 7537, 30192, 19956, 9258
+11301: DATA 31789, 21636, 11469, 1905, 24549, 14300, 3586, 26278
+11309: DATA 16095, 6505, 29141, 18491, 8275, 30896, 21258, 11180
+11317: DATA 972, 23108, 12965, 3445, 26005, 15360, 5288, 28453
+11325: DATA 18351, 7715, 30453, 20768, 10682, 112, 22719, 13089
+11333: DATA 3053, 25105, 15045, 5478, 28128, 17489, 7361, 30632
+11341: DATA 19972, 9904, 339, 22561, 12443, 2864, 25549, 15016
+11349: DATA 5388, 28115, 17568, 7988, 30673, 20127, 10541, 51
+11357: DATA 22770, 13218, 2686, 25973, 15797, 5360, 28494, 17957
+11365: DATA 7913, 31132, 20572, 11064, 613, 23236, 13701, 3233
+11373: DATA 26447, 15989, 6485, 28720, 18650, 9205, 31374, 21930
+11381: DATA 11274, 1860, 24101, 14695, 4096, 27413, 16928, 7524
+11389: DATA 29737, 20287, 9845, 310, 22576, 13168, 2620, 25898
+11397: DATA 15412, 5919, 28171, 18801, 8229, 31569, 21087, 11691
+11405: DATA 1160, 24574, 14033, 4212, 27412, 16996, 7453, 29872
+11413: DATA 20357, 9941, 101, 23417, 12874, 3485, 25832, 15914
+11421: DATA 6505, 28924, 19381, 9511, 31866, 22512, 12004, 2091
+11429: DATA 25464, 15056, 5576, 28533, 18094, 8661, 31565, 21157
+11437: DATA 11677, 1918, 24218, 14368, 4944, 27312, 17417, 8107
+11445: DATA 30349, 20563, 11236, 1400, 23689, 13904, 4537, 27436
+11453: DATA 17080, 7229, 30709, 20792, 10420, 548, 23992, 14134
+11461: DATA 3811, 26704, 17349, 7488, 29933, 20053, 10637, 934
+11469: DATA 23826, 13567, 3678, 26663, 17309, 7541, 29905, 20130
+11477: DATA 10317, 984, 23968, 14182, 3776, 26832, 16993, 7211
+11485: DATA 30706, 20923, 11110, 1396, 23801, 14009, 4214, 27169
+11493: DATA 17837, 8089, 31057, 21300, 11560, 1241, 24202, 14508
+11501: DATA 4681, 27696, 17949, 8245, 31683, 22005, 12253, 2487
+11509: DATA 25410, 15709, 5984, 29024, 19213, 9497, 32547, 22819
+11517: DATA 13181, 3385, 26427, 16672, 6960, 29986, 20280, 10551
+11525: DATA 825, 23833, 14091, 4467, 27429, 17753, 8003, 31204
+11533: DATA 21396, 11748, 1945, 24692, 14849, 5240, 28242, 18609
+11541: DATA 8842, 31960, 22891, 13075, 3402, 26501, 16889, 6711
+11549: DATA 29812, 20148, 10480, 1344, 24390, 14761, 5107, 27685
+11557: DATA 18030, 8351, 31447, 22324, 12685, 3029, 25612, 16032
+11565: DATA 6348, 30053, 20372, 10278, 577, 23797, 14607, 5047
+11573: DATA 27964, 18041, 8433, 32051, 22422, 12368, 2732, 26468
+11581: DATA 16810, 6705, 29863, 20793, 11257, 1136, 24238, 15153
+11589: DATA 5539, 28190, 18588, 9524, 32737, 22609, 13012, 4069
+11597: DATA 26717, 17072, 8034, 30780, 21148, 12156, 2520, 25316
+11605: DATA 16153, 6616, 29344, 20276, 10695, 642, 24424, 14369
+11613: DATA 4839, 28597, 18485, 9522, 32743, 22719, 13680, 3684
+11621: DATA 26817, 17809, 7758, 31601, 21605, 12021, 2975, 25773
+11629: DATA 16728, 6704, 30492, 20519, 10901, 2035, 24728, 15798
+11637: DATA 5721, 29521, 19564, 10618, 521, 24329, 14445, 5430
+11645: DATA 28216, 19254, 9255, 305, 23078, 14136, 4148, 27946
+11653: DATA 17962, 9052, 31813, 22893, 12906, 3909, 26637, 17824
+11661: DATA 7826, 31742, 21650, 12320, 3413, 26211, 17240, 7329
+11669: DATA 31181, 21201, 11819, 2925, 25681, 16792, 6884, 30250
+11677: DATA 21370, 11504, 2557, 25905, 15975, 7093, 29885, 20528
+11685: DATA 11621, 1681, 25553, 16180, 6322, 30169, 20737, 10920
+11693: DATA 1949, 25464, 15504, 6200, 30021, 20144, 10756, 1963
+11701: DATA 24792, 15376, 6642, 30077, 20113, 10776, 2029, 25405
+11709: DATA 15538, 6181, 30119, 20852, 10916, 1573, 25528, 16183
+11717: DATA 6329, 29790, 20963, 11645, 1771, 25155, 16324, 7072
+11725: DATA 30488, 20629, 11383, 2097, 26004, 16755, 6869, 30318
+11733: DATA 21049, 12248, 2988, 26471, 16517, 7321, 30846, 21604
+11741: DATA 12796, 3568, 26982, 17717, 7931, 31412, 22116, 12900
+11749: DATA 4079, 27541, 18244, 9079, 32557, 22672, 13444, 4266
+11757: DATA 27677, 18545, 9301, 55, 24026, 14822, 5528, 29156
+11765: DATA 19778, 10590, 1317, 24935, 15626, 6429, 29992, 20836
+11773: DATA 11561, 2338, 25914, 16676, 7484, 31027, 21820, 12584
+11781: DATA 3437, 26905, 17686, 8568, 32100, 22878, 13641, 4586
+11789: DATA 28125, 18864, 9724, 32, 23637, 14457, 5198, 28900
+11797: DATA 19615, 10449, 1836, 25466, 16204, 7070, 30698, 21098
+11805: DATA 11837, 2800, 26305, 17724, 8560, 32240, 23026, 13351
+11813: DATA 4200, 27793, 18635, 10036, 940, 24515, 14925, 5808
+11821: DATA 29394, 20784, 11660, 2107, 25664, 16610, 8029, 31671
+11829: DATA 22466, 12869, 3825, 28028, 18889, 9296, 172, 24362
+11837: DATA 15289, 5744, 29373, 20785, 11700, 2086, 25764, 17252
+11845: DATA 8107, 31263, 22153, 13693, 4580, 27735, 18632, 10212
+11853: DATA 532, 24291, 15637, 6176, 29850, 21296, 12228, 2731
+11861: DATA 26904, 17858, 8421, 32634, 23498, 13954, 5497, 28716
+11869: DATA 19622, 11248, 1633, 25916, 16880, 7408, 31615, 22049
+11877: DATA 13036, 4499, 27725, 19252, 9760, 712, 24985, 15521
+11885: DATA 6995, 30324, 21766, 12404, 3266, 27637, 18062, 9648
+11893: DATA 13, 24401, 14955, 6512, 29765, 21269, 11820, 3383
+11901: DATA 26665, 18302, 8785, 291, 23600, 15139, 5673, 30016
+11909: DATA 20520, 12049, 2582, 26976, 17408, 9054, 32322, 23990
+11917: DATA 14473, 6136, 29360, 20502, 12048, 2673, 26974, 17580
+11925: DATA 8939, 32484, 23597, 15229, 5718, 30160, 20708, 11831
+11933: DATA 3389, 26801, 18357, 9511, 116, 24510, 15097, 6205
+11941: DATA 30509, 21138, 12736, 3957, 27302, 18904, 10061, 685
+11949: DATA 25043, 16176, 6804, 30836, 22358, 13055, 4107, 28577
+11957: DATA 19085, 10335, 2027, 25908, 16534, 7711, 32160, 23329
+11965: DATA 14077, 5156, 29607, 20795, 11429, 2617, 27070, 18213
+11973: DATA 8865, 80, 24460, 15719, 6377, 30289, 21955, 13216
+11981: DATA 4435, 27824, 18965, 10269, 1921, 25904, 16596, 7863
+11989: DATA 31821, 23490, 14756, 6013, 29387, 20633, 11875, 3107
+11997: DATA 27571, 18928, 10037, 1280, 24826, 16112, 7268, 31275
+12005: DATA 23032, 14210, 5381, 29539, 20768, 11459, 2713, 26852
+12013: DATA 18004, 9315, 597, 24629, 16347, 7600, 31640, 22953
+12021: DATA 14159, 5457, 29547, 20863, 12040, 3349, 27427, 18736
+12029: DATA 10109, 1343, 25395, 16756, 7969, 32056, 23352, 14692
+12037: DATA 5934, 29983, 21267, 12657, 3877, 27975, 19269, 10669
+12045: DATA 1950, 26104, 17301, 8248, 32282, 23679, 14934, 6327
+12053: DATA 30413, 21700, 13610, 4987, 28933, 20355, 11769, 2593
+12061: DATA 26744, 18080, 9397, 1312, 25466, 16880, 8190, 31784
+12069: DATA 23140, 14493, 5831, 30522, 21989, 13200, 4153, 28332
+12077: DATA 19672, 11568, 2967, 26673, 18004, 9459, 1301, 25572
+12085: DATA 16840, 7752, 31985, 23921, 15243, 6164, 30398, 22372
+12093: DATA 13737, 4671, 28917, 20768, 12221, 3125, 27389, 19233
+12101: DATA 10668, 1539, 25745, 17720, 9125, 81, 24259, 16288
+12109: DATA 7261, 31460, 23389, 14385, 5767, 30581, 21917, 12973
+12117: DATA 4894, 29072, 20129, 12145, 3531, 27267, 19304, 10340
+12125: DATA 1787, 26559, 17529, 9533, 1012, 24759, 16760, 7780
+12133: DATA 31993, 23967, 14853, 7008, 30765, 22229, 14285, 5290
+12141: DATA 30034, 21090, 13057, 4156, 28315, 20400, 11485, 3472
+12149: DATA 27205, 19285, 10277, 2427, 26118, 18197, 9260, 1322
+12157: DATA 25213, 17188, 8250, 372, 24097, 16184, 7224, 32100
+12165: DATA 23102, 15135, 6160, 31072, 22125, 14096, 5214, 30113
+12173: DATA 21144, 13309, 4294, 28788, 20736, 11902, 3924, 27818
+12181: DATA 19867, 10969, 2609, 27517, 18507, 10647, 1699, 26176
+12189: DATA 18296, 9393, 1510, 25888, 16912, 9150, 242, 24630
+12197: DATA 16761, 7832, 32672, 24406, 15520, 7633, 32014, 23212
+12205: DATA 15183, 6980, 30877, 22589, 14662, 5808, 30228, 22455
+12213: DATA 13453, 5201, 30117, 21863, 12932, 4638, 29609, 21309
+12221: DATA 12541, 4146, 29104, 20789, 11958, 3640, 28669, 20269
+12229: DATA 11427, 3152, 28036, 19764, 10982, 2655, 27611, 19361
+12237: DATA 11101, 2303, 26715, 18548, 10630, 2431, 26320, 18081
+12245: DATA 9805, 1988, 26551, 18299, 9429, 1177, 25710, 17445
+12253: DATA 9713, 1520, 25980, 17703, 8953, 689, 25203, 16928
+12261: DATA 9123, 976, 25349, 17245, 9009, 144, 24708, 16567
+12269: DATA 8221, 98, 24596, 16445, 8667, 505, 24979, 16803
+12277: DATA 8451, 272, 24869, 16704, 8461, 277, 24941, 16695
+12285: DATA 8489, 309, 24880, 16676, 8565, 307, 24882, 16690
+12293: DATA 8488, 336, 24832, 16761, 8551, 337, 24899, 16815
+12301: DATA 8592, 501, 25051, 16416, 8277, 100, 24658, 16612
+12309: DATA 8340, 223, 25392, 17254, 8965, 917, 25580, 16951
+12317: DATA 8809, 752, 25335, 17720, 9594, 1459, 26102, 17463
+12325: DATA 9261, 1161, 25802, 18273, 10167, 1936, 26141, 18085
+12333: DATA 9929, 2424, 27097, 18548, 10324, 2302, 27417, 19428
+12341: DATA 11225, 2648, 27360, 19764, 11658, 3091, 27816, 20261
+12349: DATA 12211, 3696, 28322, 20789, 12705, 4149, 28847, 21303
+12357: DATA 13293, 4632, 29312, 21862, 13792, 5136, 29889, 22443
+12365: DATA 13842, 5883, 30997, 22561, 14491, 7011, 31708, 23202
+12373: DATA 15624, 7582, 31973, 24372, 16369, 7832, 360, 24676
+12381: DATA 16639, 9141, 628, 25911, 17917, 9456, 1912, 26172
+12389: DATA 18169, 10645, 2123, 27504, 18998, 10896, 3481, 27819
+12397: DATA 20253, 11876, 4381, 28721, 20629, 13287, 4760, 30135
+12405: DATA 21593, 14108, 5669, 31093, 22539, 15124, 6765, 32048
+12413: DATA 23605, 16181, 7719, 305, 24693, 17209, 8750, 1380
+12421: DATA 25641, 18197, 9739, 2407, 26720, 19216, 10827, 3499
+12429: DATA 27793, 20473, 11988, 4147, 29456, 21040, 13641, 5291
+12437: DATA 30669, 22212, 14381, 7025, 31237, 23966, 15586, 7734
+12445: DATA 361, 24760, 17339, 9552, 1122, 26549, 18158, 10288
+12453: DATA 2824, 27294, 19914, 12134, 3761, 29144, 21346, 12944
+12461: DATA 5583, 30591, 22149, 14397, 6998, 31473, 23569, 16356
+12469: DATA 7908, 67, 25577, 17781, 9355, 1556, 26891, 19216
+12477: DATA 10933, 3125, 28661, 20792, 12468, 4642, 30138, 22305
+12485: DATA 14061, 6148, 31639, 23921, 15584, 7747, 397, 25516
+12493: DATA 17688, 9442, 1616, 26740, 19334, 11637, 3288, 28329
+12501: DATA 20557, 13252, 5546, 30516, 22215, 14485, 6701, 31796
+12509: DATA 24559, 16831, 9057, 1329, 25846, 18084, 10356, 2602
+12517: DATA 28138, 20432, 12636, 4987, 30000, 21648, 13963, 6326
+12525: DATA 31314, 23677, 15957, 8224, 989, 26101, 18397, 10678
+12533: DATA 2892, 27993, 20331, 12602, 4933, 30032, 22284, 14647
+12541: DATA 7037, 32041, 24378, 16673, 9077, 1312, 26408, 18743
+12549: DATA 11045, 3408, 28433, 20860, 13175, 5471, 30552, 22947
+12557: DATA 15253, 7600, 32705, 24636, 16912, 9264, 1608, 26794
+12565: DATA 19081, 11477, 4407, 29555, 21847, 14239, 6650, 31280
+12573: DATA 23669, 16124, 8373, 1325, 26490, 18853, 11197, 3111
+12581: DATA 28268, 20638, 12933, 6012, 31136, 23505, 15391, 7908
+12589: DATA 223, 25977, 18311, 10288, 2630, 27824, 20766, 13228
+12597: DATA 5572, 30274, 22773, 15741, 8075, 23, 25325, 18219
+12605: DATA 10667, 2613, 27815, 20796, 13232, 5169, 30393, 23402
+12613: DATA 15853, 7760, 177, 25980, 18400, 10306, 2760, 28644
+12621: DATA 20500, 13027, 5909, 30773, 23253, 16227, 8649, 673
+12629: DATA 26376, 18880, 10981, 3942, 29130, 21139, 14182, 6244
+12637: DATA 31483, 24497, 16502, 9521, 1973, 26788, 19826, 11876
+12645: DATA 4340, 30111, 22096, 15206, 7269, 32455, 25480, 17591
+12653: DATA 10569, 2608, 28439, 20536, 13018, 6131, 30870, 23981
+12661: DATA 15939, 9047, 1061, 26989, 18954, 12037, 4159, 30052
+12669: DATA 22061, 15153, 7201, 316, 25211, 18261, 10291, 3371
+12677: DATA 28223, 21252, 13325, 6417, 31350, 24415, 16472, 9648
+12685: DATA 1685, 27540, 19664, 12341, 5382, 30308, 23346, 15504
+12693: DATA 8607, 735, 26165, 19325, 11334, 4497, 29409, 22116
+12701: DATA 15188, 7331, 505, 25909, 18043, 11188, 3303, 28688
+12709: DATA 21861, 13973, 7045, 32625, 24740, 17859, 10521, 2788
+12717: DATA 28632, 21373, 13463, 6197, 32091, 24315, 16912, 10145
+12725: DATA 2243, 27716, 20901, 13691, 5763, 31312, 24505, 17196
+12733: DATA 9400, 2160, 28086, 20795, 12963, 5685, 31741, 24368
+12741: DATA 16546, 9223, 2432, 28006, 20214, 12816, 6082, 31666
+12749: DATA 24344, 16610, 9237, 2093, 28058, 20837, 12947, 5860
+12757: DATA 31309, 24569, 17329, 10036, 2261, 27778, 20578, 13344
+12765: DATA 6632, 32179, 24944, 17703, 9909, 2737, 28221, 21047
+12773: DATA 14304, 7057, 32585, 25464, 18277, 10439, 3212, 28848
+12781: DATA 21592, 14434, 7187, 53, 26073, 18940, 11741, 4524
+12789: DATA 30024, 22850, 15712, 8500, 1298, 26904, 19748, 12583
+12797: DATA 5429, 31088, 23862, 16693, 9510, 2355, 27964, 20768
+12805: DATA 13608, 6403, 32069, 24945, 17789, 10579, 3396, 29104
+12813: DATA 21912, 14836, 7641, 45, 25685, 18553, 11347, 4272
+12821: DATA 29826, 22672, 16164, 9012, 1877, 27551, 20450, 12840
+12829: DATA 5683, 31445, 24315, 17723, 10599, 3492, 29173, 21569
+12837: DATA 14462, 7327, 208, 26464, 19373, 12212, 4634, 30369
+12845: DATA 23246, 16740, 9722, 2048, 27719, 20735, 14093, 7085
+12853: DATA 32718, 25169, 18153, 11572, 4524, 29699, 22689, 16165
+12861: DATA 9139, 1588, 27187, 20736, 13757, 6197, 31997, 25377
+12869: DATA 18336, 10770, 3716, 30074, 23022, 15453, 8392, 1962
+12877: DATA 27145, 20144, 13658, 6194, 31957, 25444, 18389, 10913
+12885: DATA 4429, 30163, 22698, 16226, 9152, 1744, 28014, 20523
+12893: DATA 13552, 7093, 32309, 25888, 18938, 11445, 4986, 30252
+12901: DATA 23272, 16770, 9221, 2940, 28192, 21186, 14728, 7396
+12909: DATA 841, 26239, 19797, 12333, 5338, 31717, 24207, 17892
+12917: DATA 10312, 3921, 29302, 22880, 15429, 8977, 1571, 27936
+12925: DATA 20605, 14119, 6704, 295, 25633, 19326, 11901, 5476
+12933: DATA 30735, 24341, 16913, 10595, 3168, 29525, 22083, 15844
+12941: DATA 8329, 2040, 27344, 20519, 14096, 6704, 329, 25765
+12949: DATA 19329, 11996, 5221, 31590, 24138, 17811, 10470, 3684
+12957: DATA 30075, 22705, 16374, 9521, 2150, 28668, 21181, 14384
+12965: DATA 8037, 661, 27095, 20337, 13029, 6617, 32542, 25316
+12973: DATA 18908, 12080, 4763, 30773, 24391, 17122, 10258, 4019
+12981: DATA 29313, 22544, 16362, 9570, 2176, 28162, 21930, 15158
+12989: DATA 7858, 1063, 27579, 20852, 13477, 6705, 425, 26412
+12997: DATA 19181, 12316, 6016, 32117, 24801, 18009, 11715, 5027
+13005: DATA 31069, 23806, 16986, 10278, 3969, 30072, 22675, 16100
+13013: DATA 9293, 3049, 29098, 22369, 14981, 8344, 1640, 27685
+13021: DATA 21487, 14832, 8034, 1333, 26851, 20149, 13422, 6756
+13029: DATA 481, 26513, 19797, 13156, 6444, 31966, 25226, 18660
+13037: DATA 11848, 5216, 31317, 24635, 18395, 11696, 5020, 31204
+13045: DATA 24399, 17749, 11108, 4471, 30477, 23888, 17209, 10540
+13053: DATA 3887, 30015, 23328, 16691, 10045, 3440, 29481, 22828
+13061: DATA 16168, 9552, 2817, 29041, 22379, 15683, 9032, 2532
+13069: DATA 28555, 22005, 15314, 8241, 1537, 27761, 21065, 14509
+13077: DATA 7810, 1246, 28005, 21344, 14666, 8144, 1524, 27179
+13085: DATA 20584, 13986, 7349, 1319, 27514, 20901, 14313, 7212
+13093: DATA 547, 26869, 20171, 14203, 7607, 964, 26629, 20161
+13101: DATA 13518, 7551, 896, 26656, 20061, 13471, 7465, 950
+13109: DATA 27074, 20032, 13548, 7543, 900, 26652, 20205, 14093
+13117: DATA 7598, 572, 26804, 20794, 14257, 7501, 644, 27435
+13125: DATA 20920, 13904, 7300, 1382, 27616, 20496, 14018, 8106
+13133: DATA 1117, 27377, 21269, 14394, 7828, 1890, 28111, 21163
+13141: DATA 15130, 8592, 1717, 28533, 21969, 15000, 9005, 2086
+13149: DATA 28408, 22436, 15458, 9521, 3056, 28862, 22845, 15920
+13157: DATA 9466, 3487, 29189, 23399, 16433, 9941, 3976, 29876
+13165: DATA 23837, 16994, 11034, 4151, 30430, 24496, 17563, 11685
+13173: DATA 4686, 31573, 24694, 18740, 11794, 5912, 31780, 25895
+13181: DATA 18997, 13168, 6201, 315, 26170, 20283, 13437, 7464
+13189: DATA 548, 27419, 20480, 14644, 7793, 1880, 27720, 21949
+13197: DATA 15069, 9208, 2260, 28706, 22800, 15920, 10079, 3233
+13205: DATA 30088, 23262, 16997, 11132, 4160, 31106, 24296, 18020
+13213: DATA 12155, 5311, 32231, 25972, 19041, 13240, 6386, 49
+13221: DATA 27006, 20113, 14283, 8048, 1206, 28048, 21762, 15010
+13229: DATA 9117, 2921, 28816, 22581, 16711, 9955, 3667, 30692
+13237: DATA 23693, 17506, 11748, 5501, 31371, 25168, 19385, 13110
+13245: DATA 6324, 51, 27070, 20792, 14000, 7715, 2045, 28448
+13253: DATA 21666, 15367, 9611, 3380, 29425, 23128, 17375, 11179
+13261: DATA 4872, 30967, 24669, 18548, 12673, 6520, 32472, 26340
+13269: DATA 19995, 14293, 8098, 1905, 27857, 21649, 15481, 9261
+13277: DATA 3570, 30142, 23861, 17717, 11003, 4788, 31293, 25129
+13285: DATA 19426, 13187, 6998, 824, 27493, 20689, 14467, 8352
+13293: DATA 2077, 28772, 22557, 16422, 10714, 4581, 31130, 25004
+13301: DATA 18701, 12612, 6509, 369, 26949, 20764, 14632, 8485
+13309: DATA 2347, 28981, 22822, 16756, 10540, 4415, 31016, 24932
+13317: DATA 18734, 12561, 6411, 308, 26986, 20819, 14670, 8613
+13325: DATA 2446, 29177, 23002, 16442, 10260, 4220, 30801, 24765
+13333: DATA 18637, 12483, 6944, 881, 27397, 21393, 15277, 8759
+13341: DATA 2673, 29369, 23267, 17713, 11623, 5616, 32242, 25634
+13349: DATA 19501, 13468, 7372, 1907, 28589, 22468, 15949, 9900
+13357: DATA 3784, 31102, 24977, 18470, 12368, 6388, 782, 27620
+13365: DATA 21442, 14934, 8869, 3442, 30080, 23573, 17593, 12132
+13373: DATA 6076, 32306, 26298, 20770, 14768, 8304, 2212, 29483
+13381: DATA 23480, 16976, 10898, 5500, 32224, 25666, 19656, 14308
+13389: DATA 7689, 1784, 29008, 22644, 16519, 11135, 5086, 31407
+13397: DATA 25933, 19911, 13476, 8056, 1993, 28291, 22829, 16417
+13405: DATA 10483, 5044, 31291, 25937, 19963, 13503, 8047, 1584
+13413: DATA 28389, 23029, 16470, 11131, 4656, 31428, 25989, 19659
+13421: DATA 14185, 7778, 2330, 28708, 22748, 17395, 10908, 5544
+13429: DATA 31757, 26489, 20086, 14712, 8196, 2846, 29225, 23985
+13437: DATA 17417, 12088, 5680, 372, 26683, 21297, 14895, 9526
+13445: DATA 3106, 30471, 24133, 18788, 12388, 6980, 581, 28132
+13453: DATA 21646, 16380, 9946, 4132, 31504, 25187, 19741, 13472
+13461: DATA 8066, 1735, 28715, 23395, 16964, 11650, 5353, 32356
+13469: DATA 26985, 20671, 15285, 9504, 3197, 30645, 24253, 18474
+13477: DATA 13154, 6786, 1489, 28540, 22245, 16849, 11011, 4768
+13485: DATA 32157, 26492, 20112, 14389, 9041, 2787, 29789, 24496
+13493: DATA 18114, 12304, 7153, 1404, 27776, 22096, 16800, 11051
+13501: DATA 4776, 31780, 26557, 20852, 14522, 8758, 3581, 30501
+13509: DATA 24301, 18435, 13192, 7541, 1257, 28252, 22925, 17319
+13517: DATA 11548, 5350, 32336, 26746, 21461, 15664, 9468, 3812
+13525: DATA 30750, 25561, 19874, 14202, 7813, 2206, 29288, 23589
+13533: DATA 18415, 12722, 7020, 1396, 27879, 22197, 16508, 10784
+13541: DATA 5630, 32720, 26887, 21312, 15671, 9429, 3724, 30903
+13549: DATA 25160, 19554, 13840, 8308, 3043, 30193, 24456, 18856
+13557: DATA 13145, 7440, 1860, 29047, 23302, 17685, 12094, 6455
+13565: DATA 895, 28028, 22389, 16694, 11040, 5412, 32637, 26912
+13573: DATA 21284, 15638, 9987, 4465, 31607, 25941, 20291, 14768
+13581: DATA 9181, 3576, 30676, 24634, 18961, 13415, 7759, 2221
+13589: DATA 29337, 23769, 18731, 13171, 7429, 1944, 29164, 23095
+13597: DATA 17469, 11955, 6375, 1339, 28518, 22947, 17400, 11296
+13605: DATA 5677, 132, 27341, 22397, 16822, 11152, 5122, 32433
+13613: DATA 26825, 21808, 16276, 10298, 4689, 31920, 26890, 21430
+13621: DATA 15812, 9796, 4337, 32113, 26507, 20560, 15087, 9992
+13629: DATA 4540, 31289, 25767, 20852, 15290, 9270, 3837, 31500
+13637: DATA 26018, 19970, 14487, 9597, 4071, 30812, 25288, 20452
+13645: DATA 14384, 8959, 3931, 30759, 25217, 20341, 14799, 8933
+13653: DATA 3917, 31120, 25220, 20344, 14793, 8912, 3939, 30763
+13661: DATA 25331, 20477, 14437, 9533, 4071, 30897, 25961, 20001
+13669: DATA 14590, 9680, 3662, 31601, 25632, 20160, 15309, 9387
+13677: DATA 4424, 31332, 26452, 20598, 15003, 10133, 4243, 32171
+13685: DATA 26207, 21316, 15469, 10513, 4630, 32543, 26680, 21808
+13693: DATA 15925, 11101, 5121, 294, 27194, 22304, 16436, 11559
+13701: DATA 5676, 796, 27717, 22871, 16996, 12102, 6216, 1304
+13709: DATA 28324, 23551, 17600, 12404, 7430, 1636, 29532, 23722
+13717: DATA 18825, 12944, 7716, 2912, 29701, 24964, 19173, 13857
+13725: DATA 9021, 3253, 31227, 25888, 20071, 15281, 9459, 4135
+13733: DATA 32104, 26320, 21457, 16251, 10469, 5585, 333, 27306
+13741: DATA 22492, 17252, 11392, 6182, 1364, 28412, 23133, 18343
+13749: DATA 12492, 7238, 2528, 30004, 24210, 18968, 14244, 8999
+13757: DATA 3253, 30832, 26041, 20795, 15034, 9787, 5038, 32612
+13765: DATA 26785, 21529, 16782, 11633, 5797, 601, 28633, 23524
+13773: DATA 18197, 12529, 7238, 2106, 30162, 24932, 19101, 13990
+13781: DATA 8712, 4053, 31659, 26420, 20691, 15513, 10366, 5165
+13789: DATA 489, 28085, 22897, 17780, 12028, 6846, 1597, 29237
+13797: DATA 24568, 19353, 14161, 9073, 3941, 30915, 25730, 20649
+13805: DATA 15448, 10288, 5121, 61, 28120, 23029, 17875, 12772
+13813: DATA 7437, 2428, 30060, 24947, 19725, 14596, 9581, 4404
+13821: DATA 32050, 26917, 21799, 16679, 11637, 6457, 1331, 29028
+13829: DATA 23865, 18712, 13591, 8571, 3440, 31063, 25925, 20964
+13837: DATA 15753, 10744, 5584, 116, 27674, 22624, 17496, 12458
+13845: DATA 7300, 2270, 30498, 25396, 20305, 15263, 10157, 4656
+13853: DATA 32373, 27317, 22197, 17703, 12666, 7589, 2537, 29740
+13861: DATA 24609, 19664, 14546, 10108, 5036, 32732, 27144, 22244
+13869: DATA 17115, 12665, 7559, 2097, 29779, 24828, 20244, 15265
+13877: DATA 10206, 4624, 32489, 28029, 22914, 17432, 12473, 8036
+13885: DATA 2985, 30264, 25264, 20852, 15781, 10289, 5289, 812
+13893: DATA 28653, 23062, 18064, 13670, 8689, 3160, 30920, 26550
+13901: DATA 21085, 16121, 11611, 6176, 1178, 29488, 24521, 19116
+13909: DATA 14600, 9616, 4262, 32629, 27603, 22165, 17709, 12336
+13917: DATA 7410, 3056, 30305, 25916, 20976, 15600, 11123, 5675
+13925: DATA 767, 29060, 23629, 19258, 13888, 8926, 4482, 31926
+13933: DATA 27465, 22136, 17776, 12327, 7386, 3045, 30345, 26028
+13941: DATA 20512, 16228, 10871, 6523, 1045, 29465, 24110, 19749
+13949: DATA 14385, 10096, 4630, 309, 27683, 23349, 17959, 13570
+13957: DATA 8228, 3842, 31232, 26994, 21609, 17241, 11848, 7607
+13965: DATA 2269, 30691, 25305, 20539, 16130, 10876, 6468, 1252
+13973: DATA 29577, 24258, 19500, 15218, 9809, 5584, 236, 28214
+13981: DATA 23922, 18597, 14331, 9520, 4149, 32681, 27378, 22577
+13989: DATA 18221, 12945, 8651, 3952, 31461, 27100, 22276, 17059
+13997: DATA 12757, 8036, 2773, 30752, 26461, 21237, 16477, 12208
+14005: DATA 6872, 2142, 30699, 25969, 20617, 15964, 11757, 6963
+14013: DATA 1717, 29753, 25526, 20796, 15605, 10787, 6584, 1825
+14021: DATA 29344, 24579, 20421, 15712, 10474, 5648, 1482, 29601
+14029: DATA 24841, 19632, 14935, 10278, 6044, 1399, 28885, 24240
+14037: DATA 19464, 15298, 10725, 5984, 714, 28880, 24185, 19500
+14045: DATA 15352, 10736, 5990, 1339, 28896, 24228, 19573, 14952
+14053: DATA 10669, 6034, 1360, 29536, 24933, 19668, 14980, 10409
+14061: DATA 5712, 1141, 29191, 24692, 20417, 15871, 11229, 6576
+14069: DATA 1861, 30037, 25381, 20858, 16138, 11522, 6969, 2348
+14077: DATA 30579, 25941, 21307, 16699, 12071, 7460, 2869, 31041
+14085: DATA 26430, 21791, 17168, 12640, 8045, 3389, 31609, 27062
+14093: DATA 22418, 17888, 13276, 8247, 3604, 31868, 27165, 22663
+14101: DATA 18060, 13510, 9504, 4694, 369, 28568, 24040, 19044
+14109: DATA 14462, 9905, 5347, 1329, 29493, 25017, 20462, 15460
+14117: DATA 10860, 6352, 1737, 30589, 26033, 21444, 16385, 11937
+14125: DATA 7325, 3431, 31644, 26672, 22096, 17634, 13661, 9132
+14133: DATA 4552, 32322, 27872, 23866, 19397, 14416, 9876, 5931
+14141: DATA 1448, 29296, 24755, 20797, 16315, 11316, 6909, 2864
+14149: DATA 31141, 26133, 21701, 17783, 13290, 8274, 3802, 32673
+14157: DATA 27679, 23229, 19280, 14394, 9878, 5986, 1480, 29367
+14165: DATA 25369, 20949, 16033, 12084, 7639, 2709, 31584, 26661
+14173: DATA 22260, 18366, 13414, 9588, 5114, 182, 28989, 24101
+14181: DATA 19629, 15747, 10824, 7029, 2089, 30428, 26573, 21671
+14189: DATA 17756, 12925, 8965, 4216, 32405, 28657, 23699, 19872
+14197: DATA 14861, 11089, 6249, 2400, 30221, 26399, 21560, 17699
+14205: DATA 12853, 9072, 4140, 315, 28192, 24432, 19513, 15659
+14213: DATA 10787, 6999, 2065, 31028, 26230, 22341, 17502, 13748
+14221: DATA 8856, 5107, 193, 28788, 24833, 20088, 16216, 11492
+14229: DATA 7567, 2754, 31274, 27519, 22592, 18846, 13997, 9780
+14237: DATA 6004, 1205, 30198, 25905, 21094, 17392, 12530, 8226
+14245: DATA 4397, 32388, 28612, 24438, 19625, 15829, 11550, 6884
+14253: DATA 3036, 31614, 26769, 22644, 18774, 14072, 9756, 6061
+14261: DATA 1247, 29763, 26021, 21859, 17036, 12828, 9121, 4964
+14269: DATA 173, 28706, 25018, 20770, 16048, 11888, 8104, 3895
+14277: DATA 31912, 27670, 23952, 19832, 15013, 10820, 7106, 3044
+14285: DATA 31492, 26879, 22592, 18470, 14805, 10593, 5832, 1697
+14293: DATA 30238, 26564, 22505, 18228, 13521, 9368, 5224, 1124
+14301: DATA 30203, 26041, 21863, 17713, 13043, 8892, 4724, 545
+14309: DATA 29694, 25552, 21334, 17265, 13088, 8413, 4301, 176
+14317: DATA 28754, 24624, 20505, 16445, 12766, 8693, 4573, 433
+14325: DATA 29022, 24921, 20843, 16755, 12613, 8452, 4389, 289
+14333: DATA 29053, 24884, 20784, 16694, 12583, 8505, 4398, 356
+14341: DATA 28972, 24835, 20805, 16757, 12581, 8515, 4421, 417
+14349: DATA 29073, 25060, 20944, 16422, 12379, 8240, 4125, 133
+14357: DATA 28877, 24768, 21284, 17255, 13142, 9105, 5098, 545
+14365: DATA 29290, 25265, 21228, 17780, 13689, 9653, 5628, 1056
+14373: DATA 29822, 25808, 21707, 18299, 14263, 10180, 5637, 1764
+14381: DATA 30428, 27006, 22929, 18548, 14406, 10495, 6920, 2992
+14389: DATA 31685, 27164, 23205, 19829, 15755, 11284, 7405, 3888
+14397: DATA 32693, 28213, 24231, 20785, 16885, 12345, 8366, 4964
+14405: DATA 940, 29214, 25285, 21877, 17897, 13395, 9410, 6066
+14413: DATA 1560, 30384, 26945, 22587, 18645, 15204, 11221, 6817
+14421: DATA 3405, 32213, 27812, 24423, 20433, 16094, 12552, 8234
+14429: DATA 4338, 930, 29281, 25916, 21904, 17571, 14194, 9777
+14437: DATA 5881, 2456, 30753, 27505, 23076, 19139, 15769, 11472
+14445: DATA 8041, 3682, 282, 28708, 24796, 21491, 17052, 13736
+14453: DATA 9229, 6003, 1636, 31074, 26624, 23376, 18956, 15656
+14461: DATA 11326, 7999, 3619, 305, 28918, 25361, 21033, 17764
+14469: DATA 13369, 10008, 5632, 2356, 30823, 27473, 23118, 19887
+14477: DATA 15581, 12287, 7891, 4212, 769, 29304, 25940, 21687
+14485: DATA 18381, 14033, 10281, 7031, 2634, 32134, 27880, 24168
+14493: DATA 20797, 16548, 13309, 9521, 5223, 1973, 30397, 26669
+14501: DATA 23422, 19152, 15812, 12084, 7862, 4573, 780, 29352
+14509: DATA 26065, 22320, 18049, 14389, 11095, 6908, 3096, 32744
+14517: DATA 28301, 24657, 21413, 17783, 13453, 9745, 6564, 2870
+14525: DATA 31473, 27760, 24500, 20794, 16561, 12912, 9660, 5988
+14533: DATA 1711, 30722, 27530, 23935, 19680, 15966, 12685, 9128
+14541: DATA 5404, 1278, 30273, 26673, 23431, 19838, 15507, 12004
+14549: DATA 8269, 5113, 1457, 30516, 26313, 22687, 19042, 15407
+14557: DATA 12270, 8688, 4985, 1341, 29950, 26293, 22589, 18992
+14565: DATA 15845, 12185, 8534, 4916, 1334, 29888, 26252, 22695
+14573: DATA 19032, 15408, 11778, 8245, 5062, 1456, 30600, 27063
+14581: DATA 23368, 19796, 16165, 12665, 8976, 5395, 1829, 31076
+14589: DATA 27440, 23871, 20263, 16689, 13173, 9506, 5944, 2343
+14597: DATA 31528, 27934, 24337, 20856, 17276, 13584, 10073, 6572
+14605: DATA 2972, 32254, 28565, 24608, 21021, 17525, 13853, 10407
+14613: DATA 6796, 3293, 309, 29492, 25937, 22431, 18861, 14896
+14621: DATA 11381, 7861, 4277, 1315, 30576, 27043, 23529, 19562
+14629: DATA 15881, 12423, 8896, 5991, 2481, 31677, 27705, 24246
+14637: DATA 20690, 17760, 14236, 10295, 6740, 3324, 349, 29575
+14645: DATA 26060, 22086, 18656, 15740, 12209, 8216, 4772, 1847
+14653: DATA 31229, 27172, 23712, 20794, 17339, 13365, 9905, 7012
+14661: DATA 3518, 32284, 28810, 25956, 22496, 18499, 14989, 12192
+14669: DATA 8216, 4853, 1861, 30769, 27271, 24368, 20936, 17066
+14677: DATA 14089, 10709, 6839, 3955, 471, 29343, 26488, 22570
+14685: DATA 19193, 16368, 12385, 9531, 6069, 2212, 32117, 28193
+14693: DATA 24749, 21918, 17994, 15206, 11313, 7896, 5057, 1252
+14701: DATA 31071, 27237, 24321, 20596, 17089, 14328, 10392, 7652
+14709: DATA 3659, 857, 29815, 26993, 23043, 20252, 16420, 13601
+14717: DATA 9774, 7024, 3124, 294, 29232, 26480, 22588, 19752
+14725: DATA 15905, 13136, 9220, 6502, 2666, 32581, 28739, 26016
+14733: DATA 22237, 19428, 15578, 12404, 9497, 5753, 2906, 31916
+14741: DATA 29081, 25232, 22076, 19323, 15440, 12674, 8877, 5684
+14749: DATA 2940, 31908, 29181, 25978, 22032, 19390, 15602, 12342
+14757: DATA 9593, 5784, 2976, 32615, 28842, 26053, 22809, 19116
+14765: DATA 16311, 13126, 9364, 6177, 3417, 32484, 29277, 26504
+14773: DATA 22722, 19539, 16878, 13716, 9916, 6687, 4024, 868
+14781: DATA 29884, 26658, 23984, 20852, 17084, 13886, 11261, 7973
+14789: DATA 4333, 1047, 31127, 28029, 24289, 21008, 18370, 15266
+14797: DATA 12125, 8418, 5210, 2107, 32152, 29027, 25245, 22192
+14805: DATA 18949, 16337, 13233, 10036, 6342, 3231, 99, 29744
+14813: DATA 27119, 23999, 20857, 17780, 14049, 10936, 7800, 4708
+14821: DATA 2025, 31647, 28490, 25446, 22373, 18628, 15490, 12516
+14829: DATA 9289, 6264, 3088, 116, 30147, 27121, 23944, 20904
+14837: DATA 17753, 14622, 11535, 8478, 5425, 2328, 32040, 29028
+14845: DATA 25915, 22844, 19770, 16699, 13607, 10608, 7474, 4386
+14853: DATA 1389, 30980, 27917, 24957, 21878, 18704, 15711, 12715
+14861: DATA 9618, 6653, 3477, 61, 29702, 26672, 23644, 20708
+14869: DATA 17537, 14545, 12087, 9075, 5952, 3024, 32736, 29227
+14877: DATA 26222, 23217, 20220, 17719, 14645, 11700, 8696, 5172
+14885: DATA 2148, 31891, 28881, 26493, 23467, 20439, 16973, 13989
+14893: DATA 10909, 8503, 5599, 2163, 31765, 28899, 26372, 23465
+14901: DATA 20431, 16991, 14057, 11578, 8673, 5141, 2220, 32567
+14909: DATA 29609, 26197, 23206, 20795, 17824, 14372, 11445, 9038
+14917: DATA 6043, 2577, 32400, 30072, 27121, 23568, 20705, 18347
+14925: DATA 14878, 12027, 9655, 6157, 3226, 869, 30621, 27301
+14933: DATA 24863, 21973, 18661, 16253, 13259, 9936, 7532, 4196
+14941: DATA 1274, 31650, 28284, 25904, 22965, 19647, 17275, 13924
+14949: DATA 11007, 8607, 5194, 2937, 32310, 29328, 27033, 23724
+14957: DATA 21340, 18020, 15701, 12343, 9434, 7166, 3721, 1462
+14965: DATA 30786, 28508, 25125, 22880, 19469, 17173, 13933, 11552
+14973: DATA 8242, 5951, 2599, 372, 29729, 27455, 24189, 21808
+14981: DATA 18469, 16149, 12869, 10594, 7268, 4933, 1601, 32176
+14989: DATA 28883, 26522, 23231, 20480, 18205, 14965, 12573, 9378
+14997: DATA 7041, 3807, 1066, 31590, 28165, 26015, 22763, 20068
+15005: DATA 17769, 14520, 12284, 9511, 6197, 4002, 754, 30763
+15013: DATA 28512, 25296, 22988, 20327, 17125, 14801, 12109, 8872
+15021: DATA 6620, 3938, 658, 30769, 28437, 25341, 22546, 20407
+15029: DATA 17100, 14425, 12262, 9524, 6273, 3605, 1469, 31533
+15037: DATA 28350, 25636, 23484, 20794, 17586, 14960, 12713, 10028
+15045: DATA 6824, 4176, 1931, 32097, 28904, 26194, 24008, 21430
+15053: DATA 18781, 15543, 12813, 10355, 8155, 5396, 2264, 32421
+15061: DATA 29726, 27588, 25024, 22375, 19146, 16517, 13945, 11308
+15069: DATA 9113, 6567, 3952, 1319, 30945, 28378, 25675, 23077
+15077: DATA 20984, 18332, 15697, 13108, 10505, 7391, 4750, 2223
+15085: DATA 32445, 29769, 27162, 24609, 22421, 19953, 17295, 14753
+15093: DATA 12045, 9561, 7019, 4404, 1796, 32080, 29482, 26934
+15101: DATA 24372, 21812, 19317, 16699, 14131, 11632, 9007, 6443
+15109: DATA 3874, 1309, 31510, 28980, 26481, 23896, 21324, 18864
+15117: DATA 16349, 13811, 11226, 8250, 5633, 3170, 594, 30888
+15125: DATA 28365, 25796, 23853, 21361, 18693, 16276, 13794, 10795
+15133: DATA 8303, 5872, 3297, 1339, 31541, 29092, 26613, 23585
+15141: DATA 21037, 18566, 16068, 14177, 11689, 9156, 6211, 3790
+15149: DATA 1207, 32068, 29597, 26673, 24085, 21750, 19729, 17323
+15157: DATA 14786, 11842, 9381, 7547, 4995, 2128, 32441, 30508
+15165: DATA 28084, 25123, 22773, 20774, 18362, 15423, 12976, 11108
+15173: DATA 8612, 5635, 3269, 1397, 31653, 28764, 26316, 24502
+15181: DATA 21530, 19189, 17173, 14393, 11930, 10083, 7644, 4781
+15189: DATA 2830, 400, 30369, 28529, 26069, 23193, 21358, 18480
+15197: DATA 16116, 14270, 11378, 9588, 7156, 4336, 2362, 32361
+15205: DATA 29866, 28112, 25174, 23405, 20520, 18130, 16258, 13480
+15213: DATA 11539, 8724, 6928, 4149, 1734, 32740, 29944, 28087
+15221: DATA 25154, 23365, 20593, 18812, 15969, 14087, 11304, 9527
+15229: DATA 6697, 4954, 2051, 309, 30240, 28476, 25641, 23908
+15237: DATA 21001, 19231, 16394, 14694, 12019, 10089, 7234, 5553
+15245: DATA 2781, 995, 30913, 28725, 26907, 24180, 22301, 19622
+15253: DATA 17800, 15062, 12842, 11110, 8256, 6608, 3833, 1580
+15261: DATA 32632, 29936, 28145, 25915, 23162, 21410, 18621, 16432
+15269: DATA 14690, 11984, 10193, 8060, 5280, 3472, 1307, 31397
+15277: DATA 29640, 27516, 24705, 22639, 20757, 18169, 15881, 14308
+15285: DATA 11461, 9297, 7670, 5428, 2692, 592, 31649, 29477
+15293: DATA 26799, 24631, 22960, 20852, 18162, 15971, 14317, 12131
+15301: DATA 9453, 7187, 5508, 3430, 755, 31317, 29641, 27620
+15309: DATA 25364, 22782, 20545, 18491, 16853, 14713, 11977, 9962
+15317: DATA 7757, 6032, 3972, 1906, 31939, 29849, 27765, 25633
+15325: DATA 24057, 22000, 19809, 17723, 15029, 12964, 10869, 8737
+15333: DATA 7085, 4999, 2884, 888, 31529, 28816, 26755, 24737
+15341: DATA 22620, 20578, 18517, 16416, 14813, 12789, 10717, 8608
+15349: DATA 6466, 4447, 2423, 312, 31045, 28932, 26917, 24865
+15357: DATA 22831, 20789, 18805, 16701, 14630, 12656, 10556, 8548
+15365: DATA 6463, 4357, 2315, 378, 31084, 29022, 26954, 25060
+15373: DATA 22933, 20991, 18880, 16422, 14354, 12412, 10332, 8375
+15381: DATA 6302, 4240, 2866, 892, 31564, 29587, 27621, 25188
+15389: DATA 23155, 21173, 19171, 17713, 15719, 13808, 11758, 9249
+15397: DATA 7272, 5277, 3286, 1844, 32689, 30687, 28237, 26294
+15405: DATA 24264, 22910, 20949, 18491, 16448, 14564, 13149, 11179
+15413: DATA 9163, 6672, 4854, 3445, 1419, 31764, 29923, 28494
+15421: DATA 26583, 24068, 22205, 20785, 18933, 16438, 14513, 13099
+15429: DATA 11170, 8706, 6853, 5499, 3555, 1040, 31961, 30636
+15437: DATA 28180, 26339, 24853, 22566, 20634, 19327, 17360, 15076
+15445: DATA 13572, 11715, 9445, 8053, 6021, 3740, 2412, 54
+15453: DATA 30970, 29621, 27189, 25913, 24058, 21667, 20348, 17965
+15461: DATA 16110, 14800, 12353, 11121, 8757, 6873, 5518, 3248
+15469: DATA 1876, 32382, 30994, 28788, 26817, 25592, 23192, 21988
+15477: DATA 19523, 18245, 15976, 14710, 12288, 11010, 8813, 7523
+15485: DATA 5228, 3959, 1659, 337, 30758, 29503, 27176, 25904
+15493: DATA 23589, 22388, 19986, 18801, 16502, 15172, 12840, 11698
+15501: DATA 9372, 8165, 5849, 4128, 2943, 582, 32092, 29873
+15509: DATA 28545, 26308, 24677, 23384, 21066, 19859, 17638, 16070
+15517: DATA 14660, 12479, 11232, 9588, 7284, 6050, 3832, 2148
+15525: DATA 868, 31390, 30085, 28533, 26341, 25047, 23327, 21165
+15533: DATA 19929, 18224, 16026, 14386, 13077, 10978, 9234, 8107
+15541: DATA 5824, 4163, 2981, 1376, 31885, 30225, 29113, 27492
+15549: DATA 25278, 23615, 22459, 20768, 18599, 16959, 15793, 14180
+15557: DATA 11961, 10264, 9088, 7476, 5345, 3679, 2498, 950
+15565: DATA 32093, 29924, 28250, 26740, 25473, 23928, 21720, 20196
+15573: DATA 18459, 17361, 15792, 14200, 11985, 10462, 8711, 7246
+15581: DATA 6089, 4536, 2928, 1396, 31987, 30396, 28786, 27179
+15589: DATA 26111, 24528, 22858, 21362, 19813, 17604, 16005, 14509
+15597: DATA 12878, 11312, 9735, 8251, 7130, 5629, 4061, 2477
+15605: DATA 862, 32016, 30564, 28980, 27401, 25873, 24383, 22819
+15613: DATA 21304, 19824, 18232, 16699, 15142, 13617, 12084, 10535
+15621: DATA 9069, 7444, 5888, 4452, 2924, 1363, 32601, 31149
+15629: DATA 29587, 28151, 26517, 24608, 23069, 21621, 19997, 18602
+15637: DATA 17048, 15581, 14631, 13169, 11607, 10192, 8618, 6768
+15645: DATA 5178, 3838, 2192, 1338, 32634, 31138, 29673, 27692
+15653: DATA 26121, 24725, 23236, 22375, 20913, 19381, 17438, 16043
+15661: DATA 14536, 13668, 12189, 10334, 8803, 7409, 6408, 5032
+15669: DATA 3545, 1552, 201, 32123, 30598, 28699, 27213, 26397
+15677: DATA 25010, 23077, 21749, 20789, 19367, 17461, 16125, 15149
+15685: DATA 13731, 11856, 10372, 9524, 8162, 6210, 4804, 4000
+15693: DATA 2141, 767, 32595, 30836, 29319, 28543, 27090, 25257
+15701: DATA 24350, 22928, 21169, 20348, 18884, 17028, 16173, 14375
+15709: DATA 13042, 12222, 10337, 9510, 8186, 6332, 5437, 3632
+15717: DATA 2277, 1429, 32261, 31600, 29738, 28383, 27551, 25828
+15725: DATA 24905, 23167, 22357, 20512, 19165, 18421, 16605, 15794
+15733: DATA 13900, 13125, 11369, 10592, 8779, 8058, 6215, 5392
+15741: DATA 3637, 2869, 1141, 306, 31289, 30527, 28722, 27958
+15749: DATA 26221, 25375, 23555, 22836, 21105, 20312, 18500, 17847
+15757: DATA 16093, 15330, 13530, 12347, 11544, 9776, 9044, 7351
+15765: DATA 6605, 4817, 3685, 2936, 1092, 386, 31466, 30241
+15773: DATA 29501, 27837, 27130, 25895, 24180, 23481, 21758, 20580
+15781: DATA 19817, 18069, 17365, 16253, 14502, 13764, 12548, 10922
+15789: DATA 10202, 9008, 7316, 6260, 5394, 3770, 2650, 2020
+15797: DATA 222, 31817, 31208, 30070, 28298, 27164, 26595, 25409
+15805: DATA 23731, 22591, 21927, 20768, 19133, 18004, 17336, 16165
+15813: DATA 14526, 13316, 12768, 11623, 9962, 8773, 8153, 7084
+15821: DATA 6009, 4327, 3152, 2087, 1409, 282, 31467, 30373
+15829: DATA 29208, 28636, 27569, 26420, 24809, 23711, 22638, 21551
+15837: DATA 20766, 19849, 18810, 17697, 16053, 15025, 13935, 12833
+15845: DATA 12205, 11161, 10059, 9012, 7972, 6288, 5258, 4278
+15853: DATA 3156, 2164, 1109, 59, 32211, 31152, 30095, 29099
+15861: DATA 27970, 26973, 25974, 24884, 23825, 22808, 21804, 20784
+15869: DATA 19837, 18739, 17722, 16698, 15649, 14626, 13618, 12584
+15877: DATA 11629, 10500, 9485, 8561, 7461, 6484, 5442, 4523
+15885: DATA 3471, 2480, 1473, 59, 31829, 30820, 29781, 28833
+15893: DATA 27853, 26822, 26404, 25441, 24393, 23428, 22435, 21070
+15901: DATA 19991, 19076, 18173, 17713, 16693, 15798, 14833, 13355
+15909: DATA 12386, 11394, 10373, 10107, 9123, 8080, 6681, 5804
+15917: DATA 4820, 4451, 3541, 2086, 1114, 255, 32528, 31716
+15925: DATA 30660, 29251, 28325, 28021, 27077, 25628, 24748, 24374
+15933: DATA 23482, 22069, 21237, 20793, 19898, 18467, 17596, 17197
+15941: DATA 16302, 14928, 13953, 13681, 12789, 11353, 10446, 10160
+15949: DATA 8724, 7934, 7506, 6260, 5249, 4984, 4056, 2788
+15957: DATA 2307, 1477, 168, 32630, 31680, 30338, 29997, 28771
+15965: DATA 27820, 27617, 26162, 25978, 24976, 23742, 23410, 22070
+15973: DATA 21241, 20888, 19489, 19313, 17956, 17091, 16793, 15553
+15981: DATA 15182, 13951, 13568, 12320, 11485, 11156, 9866, 9633
+15989: DATA 8286, 8004, 6671, 6466, 5124, 4869, 3617, 3376
+15997: DATA 2173, 1820, 570, 311, 31806, 31696, 30212, 29995
+16005: DATA 28728, 28496, 27140, 26982, 25696, 25360, 24132, 23978
+16013: DATA 22749, 22513, 21141, 20531, 20231, 19065, 18777, 17636
+16021: DATA 17282, 16086, 15461, 15206, 13898, 13727, 12512, 11831
+16029: DATA 11581, 10404, 10237, 9525, 8289, 8176, 6910, 6187
+16037: DATA 5987, 4740, 4567, 3963, 2729, 2448, 1817, 684
+16045: DATA 472, 32560, 31377, 30779, 30554, 29410, 28765, 28592
+16053: DATA 27330, 26640, 26609, 25980, 24704, 24144, 23995, 23333
+16061: DATA 22184, 21564, 21409, 20858, 19679, 19034, 18825, 18220
+16069: DATA 17064, 16464, 16259, 15736, 14570, 13919, 13791, 13284
+16077: DATA 12562, 11510, 10773, 10272, 10141, 9593, 8398, 7908
+16085: DATA 7199, 7135, 6570, 6009, 4741, 4249, 3710, 3172
+16093: DATA 3068, 2544, 1913, 1333, 231, 32439, 31864, 31332
+16101: DATA 31200, 30623, 30038, 29557, 28972, 27859, 27341, 26784
+16109: DATA 26200, 25696, 25116, 24631, 24513, 24057, 23443, 22947
+16117: DATA 22285, 21841, 21285, 20787, 20303, 19799, 19309, 18743
+16125: DATA 18212, 17725, 17207, 16699, 16185, 15742, 15192, 14634
+16133: DATA 14114, 13570, 13073, 12668, 12032, 11587, 11074, 10673
+16141: DATA 10121, 9720, 9137, 8227, 7696, 7267, 6729, 6350
+16149: DATA 5819, 5329, 5424, 4984, 4433, 4048, 3521, 2603
+16157: DATA 2174, 1723, 1045, 1293, 890, 421, 32701, 31781
+16165: DATA 31359, 30869, 30341, 30589, 30123, 29584, 28684, 28388
+16173: DATA 27866, 28002, 27548, 26672, 26133, 25855, 25883, 25572
+16181: DATA 25055, 24159, 23786, 23929, 23446, 22608, 22201, 22316
+16189: DATA 21948, 21028, 20725, 20791, 20410, 19518, 19113, 19254
+16197: DATA 18850, 17948, 17605, 17760, 17389, 16469, 16013, 16288
+16205: DATA 15378, 15103, 15175, 14452, 13953, 14207, 13725, 12976
+16213: DATA 13061, 12757, 12005, 12130, 11716, 10885, 11105, 10288
+16221: DATA 9907, 10202, 9247, 9472, 9213, 8373, 8509, 7714
+16229: DATA 7393, 7583, 6730, 7014, 6245, 5855, 6027, 5348
+16237: DATA 5449, 4728, 4892, 4135, 3733, 4066, 3218, 3499
+16245: DATA 2624, 2832, 2156, 2407, 1605, 1809, 1133, 1320
+16253: DATA 572, 802, 50, 305, 32373, 32573, 31794, 32055
+16261: DATA 31276, 31513, 30726, 31028, 30305, 30549, 29789, 30125
+16269: DATA 29342, 29668, 28892, 28730, 28946, 28208, 28508, 27876
+16277: DATA 28106, 27291, 27234, 27444, 26710, 27017, 26336, 26150
+16285: DATA 26482, 25788, 26043, 25937, 25211, 25535, 24815, 24624
+16293: DATA 24933, 24308, 24512, 24437, 23734, 24004, 23912, 23223
+16301: DATA 23506, 23397, 22657, 22588, 22847, 22214, 22044, 22449
+16309: DATA 21697, 21572, 21925, 21848, 21130, 21011, 21414, 21446
+16317: DATA 20612, 20543, 20896, 20852, 20148, 20002, 20408, 20324
+16325: DATA 19620, 19486, 19909, 19829, 19109, 19031, 19423, 19373
+16333: DATA 19225, 18608, 18522, 18482, 18901, 18786, 18130, 18091
+16341: DATA 17920, 18371, 18405, 18272, 17613, 17553, 17529, 17508
+16349: DATA 17918, 17855, 17787, 17696, 17127, 17087, 17009, 16996
+16357: DATA 17401, 17304, 17216, 17204, 17185, 16607, 16514, 16566
+16365: DATA 16413, 16484, 16410, 16500, 16833, 16888, 16792, 16868
+16373: DATA 16731, 16721, 16752, 16760, 16657, 16734, 16711, 16718
+16381: DATA 16649, 16696, 16688, 16756, 16691, 16700, 16690, 16683
+16389: DATA 16703, 16720, 16650, 16754, 16677, 16708, 16709, 16813
+16397: DATA 16782, 16816, 16839, 16443, 16410, 16509, 16413, 16557
+16405: DATA 16542, 16528, 17188, 17204, 17225, 17297, 17407, 16931
+16413: DATA 17016, 17136, 17144, 17723, 17766, 17841, 17908, 17447
+16421: DATA 17453, 17556, 17600, 18276, 18348, 18387, 17945, 18093
+16429: DATA 18131, 18807, 18901, 18464, 18525, 18677, 19293, 19370
+16437: DATA 19416, 19037, 19175, 19825, 19863, 19536, 19690, 20336
+16445: DATA 20474, 20094, 20176, 20794, 20922, 20514, 20649, 21292
+16453: DATA 21449, 21013, 21124, 21863, 22001, 21557, 21726, 22443
+16461: DATA 22024, 22244, 22877, 22608, 22658, 23413, 23502, 23216
+16469: DATA 23911, 24038, 23716, 24417, 24521, 24196, 24877, 24584
+16477: DATA 24818, 25523, 25214, 26068, 26060, 25791, 26472, 26212
+16485: DATA 26348, 27010, 26688, 27444, 27180, 27358, 28109, 27813
+16493: DATA 28445, 28279, 28935, 28733, 28881, 29616, 29330, 30114
+16501: DATA 29709, 30530, 30314, 31099, 30728, 31491, 31341, 32048
+16509: DATA 31797, 32561, 32289, 372, 54, 831, 563, 1328
+16517: DATA 1087, 1823, 1545, 2356, 2161, 2904, 2632, 3556
+16525: DATA 3225, 4095, 3802, 4134, 4949, 4708, 5458, 5348
+16533: DATA 6041, 5848, 6176, 6964, 6739, 7569, 7416, 7720
+16541: DATA 8553, 8446, 9119, 9566, 9281, 10168, 9976, 10340
+16549: DATA 11115, 10908, 11722, 12155, 11959, 12688, 13058, 12962
+16557: DATA 13725, 14180, 13981, 14397, 15174, 15024, 15375, 16299
+16565: DATA 16066, 16477, 17317, 17789, 17558, 18000, 18860, 19300
+16573: DATA 19121, 19505, 20391, 20787, 20656, 21104, 21936, 22315
+16581: DATA 22206, 22545, 23436, 23927, 23717, 24148, 25032, 25524
+16589: DATA 25876, 25843, 26177, 26685, 27547, 28023, 27805, 28325
+16597: DATA 28749, 29591, 30184, 30515, 30341, 30851, 31348, 31785
+16605: DATA 32767, 447, 889, 1402, 1168, 1726, 2162, 2614
+16613: DATA 3577, 3992, 4385, 4977, 5412, 5315, 5785, 6337
+16621: DATA 6734, 7295, 7680, 8224, 9181, 9620, 10122, 10657
+16629: DATA 11102, 11588, 12047, 12610, 13060, 13573, 14113, 14640
+16637: DATA 15229, 15644, 16186, 16695, 17214, 17875, 18180, 18731
+16645: DATA 19256, 19792, 20228, 20838, 21344, 21776, 22340, 22954
+16653: DATA 23517, 24049, 24469, 24627, 25095, 25721, 26201, 26852
+16661: DATA 27266, 27862, 29029, 29542, 30026, 30623, 31200, 31287
+16669: DATA 31805, 32420, 253, 1333, 1889, 2544, 3070, 3115
+16677: DATA 3683, 4228, 4823, 6011, 6569, 7056, 7193, 7852
+16685: DATA 8408, 9520, 10129, 10299, 10842, 11490, 12637, 13232
+16693: DATA 13762, 13840, 14577, 15740, 16256, 16464, 17083, 18213
+16701: DATA 18856, 19004, 19617, 20858, 21471, 21594, 22153, 23340
+16709: DATA 23976, 24144, 24707, 25976, 26602, 26719, 27359, 28644
+16717: DATA 28690, 29430, 30485, 30752, 31389, 32633, 462, 740
+16725: DATA 1823, 2527, 2730, 3961, 4485, 4761, 6014, 6244
+16733: DATA 6908, 8176, 8313, 9525, 10215, 10423, 11640, 11876
+16741: DATA 12512, 13727, 13910, 15221, 15404, 16083, 17357, 17568
+16749: DATA 18776, 19040, 20252, 20535, 21185, 22521, 22675, 23971
+16757: DATA 24077, 25412, 25709, 26993, 27205, 28446, 28728, 29993
+16765: DATA 30271, 31541, 31783, 372, 626, 1889, 2149, 3427
+16773: DATA 3683, 4981, 5131, 6523, 6775, 8004, 8261, 9665
+16781: DATA 9870, 11263, 11456, 12320, 13597, 13844, 15178, 15521
+16789: DATA 16798, 17092, 18004, 19266, 19524, 20869, 21217, 22064
+16797: DATA 23357, 23697, 25083, 25888, 26224, 27571, 27893, 28709
+16805: DATA 30048, 30354, 31680, 32614, 85, 1513, 2306, 2737
+16813: DATA 3997, 4977, 5255, 6193, 7445, 7929, 8723, 10212
+16821: DATA 10457, 11352, 12768, 13620, 13956, 14878, 16313, 17185
+16829: DATA 17598, 18488, 19892, 20793, 21175, 22069, 23471, 24420
+16837: DATA 24761, 25631, 27077, 28021, 28325, 29271, 30687, 31661
+16845: DATA 32537, 176, 1114, 2098, 3541, 4450, 4818, 5803
+16853: DATA 6656, 8131, 9189, 10080, 10445, 11409, 12409, 13412
+16861: DATA 14846, 15807, 16763, 17696, 18151, 19135, 20081, 21092
+16869: DATA 22521, 23448, 24384, 25396, 26401, 26847, 27778, 28854
+16877: DATA 29725, 30820, 31770, 116, 1473, 2552, 3480, 4580
+16885: DATA 5467, 6481, 7536, 8568, 9489, 10590, 11629, 12644
+16893: DATA 13572, 14655, 15648, 16756, 17723, 18751, 19753, 20781
+16901: DATA 21806, 22805, 23877, 24928, 25965, 26965, 27917, 29098
+16909: DATA 30088, 31229, 32215, 49, 1031, 2096, 3098, 4342
+16917: DATA 5343, 6295, 8037, 9085, 10070, 11216, 12270, 12837
+16925: DATA 13935, 15014, 16112, 17712, 18741, 19897, 20979, 21552
+16933: DATA 22626, 23760, 24785, 26492, 27552, 28560, 29186, 30390
+16941: DATA 31455, 311, 1414, 2164, 3141, 4341, 5913, 7073
+16949: DATA 8158, 8772, 9956, 11640, 12747, 13429, 14499, 16171
+16957: DATA 17327, 17956, 19133, 20816, 21936, 22577, 23726, 25392
+16965: DATA 26568, 27139, 28298, 30049, 31217, 31832, 167, 1938
+16973: DATA 2588, 3813, 5465, 6176, 7381, 9052, 10194, 10919
+16981: DATA 12550, 13616, 14492, 16251, 17360, 18128, 19820, 20534
+16989: DATA 21752, 23536, 24188, 25914, 27061, 27825, 29501, 30243
+16997: DATA 31487, 409, 1089, 2868, 3626, 4822, 6605, 7350
+17005: DATA 9042, 9855, 11544, 12327, 13461, 15332, 16021, 17829
+17013: DATA 18521, 20240, 21094, 22907, 23563, 25348, 26175, 27947
+17021: DATA 28721, 30576, 31265, 316, 1072, 2928, 3641, 5419
+17029: DATA 6178, 7938, 8773, 10592, 11370, 13072, 13913, 15788
+17037: DATA 16536, 18352, 19139, 20533, 22272, 23164, 24905, 25834
+17045: DATA 27623, 28346, 29713, 31612, 32320, 1488, 2283, 3624
+17053: DATA 5490, 6335, 8167, 9588, 10362, 12214, 12989, 14384
+17061: DATA 16229, 17049, 18902, 20276, 21175, 23007, 24322, 25257
+17069: DATA 27037, 28537, 29318, 30836, 32596, 688, 2065, 4005
+17077: DATA 4831, 6231, 8160, 9524, 10376, 11807, 13758, 15141
+17085: DATA 16052, 17459, 19445, 20784, 21680, 23072, 25012, 26407
+17093: DATA 27321, 28697, 30603, 32115, 165, 1617, 3469, 5091
+17101: DATA 6480, 7351, 8725, 10279, 12172, 13693, 14559, 16043
+17109: DATA 17409, 19358, 20928, 22394, 23242, 24706, 26233, 27692
+17117: DATA 29593, 31157, 32628, 1319, 2273, 3796, 5226, 6689
+17125: DATA 8702, 10116, 11567, 13122, 14628, 15557, 17025, 18608
+17133: DATA 19997, 21596, 23066, 24631, 26590, 27922, 29604, 31147
+17141: DATA 32600, 1296, 2916, 4454, 5888, 7504, 8996, 10538
+17149: DATA 12157, 13617, 15221, 16691, 18215, 19769, 21305, 22884
+17157: DATA 24354, 25878, 27461, 29030, 30570, 32095, 832, 2487
+17165: DATA 4061, 5604, 7133, 8245, 9729, 11312, 12894, 14507
+17173: DATA 16003, 17604, 19767, 21371, 22857, 24528, 26105, 27180
+17181: DATA 28792, 30448, 31985, 1339, 2938, 4514, 6077, 7216
+17189: DATA 8802, 10448, 11985, 14204, 15776, 17296, 18459, 20133
+17197: DATA 21704, 23932, 25473, 26746, 28223, 29850, 32041, 940
+17205: DATA 2504, 3600, 5347, 7544, 9098, 10271, 11967, 14180
+17213: DATA 15794, 16950, 18677, 20768, 22461, 23609, 25262, 27492
+17221: DATA 29119, 30239, 31882, 1401, 2981, 4185, 5854, 8164
+17229: DATA 9244, 10928, 13145, 14389, 16007, 18295, 19928, 21220
+17237: DATA 23296, 25055, 26294, 28533, 30156, 31379, 813, 2080
+17245: DATA 3832, 6048, 7292, 9527, 11233, 12473, 14707, 15907
+17253: DATA 17581, 19844, 21069, 23409, 24677, 26334, 28568, 29865
+17261: DATA 32095, 629, 2823, 4212, 5778, 8105, 9434, 11754
+17269: DATA 12840, 15198, 16490, 18790, 19985, 22296, 23625, 25889
+17277: DATA 27196, 29475, 30753, 336, 1570, 3893, 5166, 7472
+17285: DATA 8775, 11046, 12292, 14689, 15977, 18244, 19469, 21896
+17293: DATA 23186, 25587, 26846, 28884, 31020, 32383, 1864, 3300
+17301: DATA 5516, 6850, 8736, 11060, 12364, 14750, 16045, 17957
+17309: DATA 20285, 21687, 24039, 25917, 27249, 29680, 30962, 34
+17317: DATA 2349, 3714, 6090, 8059, 9384, 11715, 13645, 15024
+17325: DATA 17365, 19313, 20609, 22644, 24918, 26367, 28179, 30640
+17333: DATA 31967, 1119, 3561, 5428, 6801, 8728, 11176, 13156
+17341: DATA 14521, 16447, 18874, 20774, 22261, 24100, 26546, 28516
+17349: DATA 29881, 31768, 1408, 3380, 4851, 6737, 9176, 11176
+17357: DATA 13065, 14526, 16447, 18526, 20897, 22904, 24280, 26340
+17365: DATA 28171, 30684, 32682, 1915, 3287, 5328, 7266, 9250
+17373: DATA 11709, 13732, 15741, 17725, 19174, 21232, 23151, 25131
+17381: DATA 27618, 29597, 31493, 893, 2870, 4240, 6284, 8420
+17389: DATA 10321, 12401, 14343, 16435, 18896, 20912, 22928, 25003
+17397: DATA 26974, 29009, 31084, 375, 2373, 4372, 6440, 8500
+17405: DATA 10548, 12595, 14625, 16701, 18747, 20791, 22909, 24869
+17413: DATA 26989, 29015, 31055, 307, 2341, 4419, 6484, 8617
+17421: DATA 10655, 12799, 14809, 16506, 18544, 20606, 22610, 24758
+17429: DATA 26777, 28888, 31553, 867, 2880, 4995, 7161, 8769
+17437: DATA 10827, 12977, 15072, 17720, 19809, 21764, 24009, 25644
+17445: DATA 27748, 29827, 31877, 1890, 4004, 6085, 7681, 9904
+17453: DATA 11933, 14707, 16794, 18490, 20545, 22769, 25364, 27562
+17461: DATA 29662, 31248, 748, 3450, 5510, 7170, 9384, 12064
+17469: DATA 14260, 15922, 18105, 20785, 23029, 24610, 26804, 29479
+17477: DATA 31653, 533, 2710, 5429, 7589, 9232, 11517, 14253
+17485: DATA 15889, 18165, 20806, 22644, 24730, 27510, 29597, 31395
+17493: DATA 1282, 3548, 5281, 7988, 10180, 11934, 14697, 16484
+17501: DATA 18669, 21436, 23156, 25888, 28156, 29886, 32616, 1577
+17509: DATA 3757, 6547, 8266, 11133, 12843, 15043, 17869, 19639
+17517: DATA 22344, 24162, 26887, 28731, 30912, 1022, 2713, 5604
+17525: DATA 7252, 10079, 11888, 14648, 16453, 19217, 21027, 23840
+17533: DATA 25725, 28452, 30269, 305, 2165, 4903, 6716, 9512
+17541: DATA 11297, 14083, 15941, 18805, 20599, 23381, 25101, 28069
+17549: DATA 29849, 32767, 1735, 4154, 6928, 8820, 11549, 13491
+17557: DATA 16260, 18116, 20525, 23348, 25169, 28063, 29949, 32293
+17565: DATA 2407, 4277, 7142, 9592, 11317, 14242, 16104, 18470
+17573: DATA 21348, 23189, 26070, 28472, 30437, 451, 2828, 4788
+17581: DATA 7629, 10104, 11932, 14374, 17232, 19171, 21585, 24548
+17589: DATA 26312, 28765, 31712, 1382, 3204, 5660, 8617, 11063
+17597: DATA 13041, 15472, 18362, 20772, 22708, 25148, 28078, 30568
+17605: DATA 32493, 2068, 5004, 7544, 9452, 11844, 14789, 17325
+17613: DATA 19720, 21757, 24085, 26679, 29575, 32105, 1230, 3760
+17621: DATA 6156, 9180, 11702, 14136, 16005, 18581, 21089, 23585
+17629: DATA 26607, 29113, 31584, 1337, 3256, 5857, 8236, 10865
+17637: DATA 13729, 16336, 18756, 21370, 23841, 25744, 28312, 30890
+17645: DATA 594, 3186, 5633, 8245, 11228, 13822, 16276, 18865
+17653: DATA 21312, 23838, 26368, 29048, 31488, 1297, 3899, 6433
+17661: DATA 9026, 11542, 14112, 16697, 19255, 21820, 24372, 26922
+17669: DATA 29482, 32080, 1796, 4454, 7018, 9541, 12099, 14752
+17677: DATA 17373, 19961, 22491, 24692, 27137, 29816, 32344, 2276
+17685: DATA 4745, 7377, 10551, 13183, 15691, 18325, 20990, 23095
+17693: DATA 25726, 28295, 30972, 1312, 3965, 6591, 9192, 11312
+17701: DATA 13869, 16529, 19077, 22375, 25002, 27589, 29727, 32423
+17709: DATA 2264, 5424, 8090, 10290, 12821, 15612, 18708, 21411
+17717: DATA 24005, 26180, 28841, 32052, 1948, 4127, 6840, 10084
+17725: DATA 12725, 14897, 17571, 20785, 23541, 25650, 28344, 31527
+17733: DATA 1442, 3613, 6272, 9524, 12269, 14431, 17117, 20385
+17741: DATA 22545, 25333, 28486, 30759, 665, 3945, 6557, 8872
+17749: DATA 12034, 14787, 17073, 20276, 22980, 25246, 28521, 30820
+17757: DATA 764, 4002, 6256, 9588, 12275, 14501, 17776, 20006
+17765: DATA 22753, 26009, 28235, 31603, 1125, 3793, 7071, 9387
+17773: DATA 12616, 14974, 18193, 20596, 23260, 26622, 28893, 32176
+17781: DATA 1605, 4949, 7205, 10608, 12804, 16130, 18470, 21802
+17789: DATA 24120, 27427, 29734, 378, 2642, 5942, 8242, 11574
+17797: DATA 13882, 17169, 19479, 22896, 25089, 28498, 30796, 1447
+17805: DATA 3734, 7055, 9459, 12321, 15640, 18034, 21329, 23725
+17813: DATA 27011, 29399, 32357, 2933, 5207, 8607, 11000, 13866
+17821: DATA 17273, 19696, 23036, 25914, 28213, 31652, 1269, 4129
+17829: DATA 7469, 9876, 13252, 16230, 18606, 21982, 24840, 27319
+17837: DATA 30670, 846, 3244, 6203, 9536, 11952, 14878, 18341
+17845: DATA 20675, 23575, 27121, 30004, 32406, 2581, 6056, 9001
+17853: DATA 11517, 14372, 17850, 20852, 23219, 26169, 29619, 32544
+17861: DATA 2285, 5129, 8586, 11617, 14071, 16912, 20442, 23461
+17869: DATA 26372, 28862, 31765, 2164, 5565, 8575, 10954, 13985
+17877: DATA 16923, 20437, 23479, 26424, 28805, 31881, 2146, 5169
+17885: DATA 8637, 11700, 14714, 17780, 20193, 23224, 26228, 29226
+17893: DATA 32742, 3024, 5980, 9083, 12080, 14480, 17541, 20641
+17901: DATA 23644, 26722, 29781, 56, 3546, 6631, 9693, 12707
+17909: DATA 15711, 18783, 21874, 24952, 27916, 31006, 1322, 4452
+17917: DATA 7476, 10558, 13685, 16672, 19773, 22837, 25981, 28960
+17925: DATA 32036, 2307, 5393, 8565, 11627, 14675, 17736, 20970
+17933: DATA 24062, 27106, 30144, 58, 3198, 6265, 9299, 12466
+17941: DATA 15496, 18627, 22321, 25469, 28482, 31633, 2041, 4641
+17949: DATA 7692, 10880, 14068, 17722, 20860, 23987, 27126, 29729
+17957: DATA 105, 3280, 6340, 10106, 13217, 16272, 18945, 22187
+17965: DATA 25294, 29028, 32188, 2048, 5213, 8437, 12125, 15267
+17973: DATA 18399, 21087, 24306, 28024, 31116, 1054, 4266, 8036
+17981: DATA 11188, 13859, 17141, 20787, 23984, 26660, 29865, 813
+17989: DATA 4003, 6679, 9925, 13688, 16874, 19525, 22729, 26529
+17997: DATA 29199, 32446, 3349, 6260, 9393, 13177, 16345, 19172
+18005: DATA 22820, 26000, 28840, 32625, 3019, 5764, 9572, 12331
+18013: DATA 15603, 19440, 22113, 25916, 29168, 31906, 2936, 5732
+18021: DATA 8940, 12674, 15424, 19252, 22018, 25282, 29080, 31905
+18029: DATA 2894, 5680, 9489, 12347, 15554, 19454, 22237, 26028
+18037: DATA 28744, 32578, 2656, 6443, 9318, 13058, 15928, 19754
+18045: DATA 22617, 26407, 29236, 317, 3105, 6996, 9781, 13613
+18053: DATA 16425, 20245, 23136, 26993, 29796, 836, 3656, 7594
+18061: DATA 10493, 14230, 17089, 20533, 24343, 27260, 31064, 1200
+18069: DATA 4965, 7908, 11309, 15217, 17925, 21892, 24812, 28198
+18077: DATA 32113, 2229, 6113, 9588, 12390, 16309, 19192, 22569
+18085: DATA 26494, 29392, 452, 3940, 6837, 10690, 14082, 17076
+18093: DATA 20943, 24441, 27284, 30752, 1872, 4784, 8219, 12203
+18101: DATA 15071, 18448, 22512, 25959, 28800, 32336, 3500, 6967
+18109: DATA 9981, 13361, 17397, 20771, 23719, 27193, 31145, 1837
+18117: DATA 4771, 8215, 12229, 15719, 18672, 22082, 26059, 29605
+18125: DATA 286, 3317, 6677, 10294, 14208, 17764, 20637, 24237
+18133: DATA 27678, 31632, 2480, 6010, 8899, 12447, 15999, 19504
+18141: DATA 23528, 27070, 30580, 1312, 4336, 7868, 11364, 14948
+18149: DATA 18927, 22428, 25924, 29562, 302, 3230, 6861, 10468
+18157: DATA 13933, 17525, 20999, 24636, 28628, 32224, 2958, 6628
+18165: DATA 10068, 13663, 17264, 20788, 24342, 27928, 31522, 2353
+18173: DATA 5937, 9524, 13173, 16641, 20230, 23829, 27517, 31021
+18181: DATA 1849, 5456, 8964, 12647, 16165, 19793, 23309, 27059
+18189: DATA 30607, 1529, 5057, 8253, 11803, 15479, 18973, 22711
+18197: DATA 26264, 29890, 1315, 4981, 8518, 12181, 15779, 19050
+18205: DATA 22579, 26333, 29936, 1337, 4965, 8612, 12260, 15460
+18213: DATA 19041, 22673, 26315, 30560, 1440, 5058, 8195, 11967
+18221: DATA 15593, 19832, 23440, 26740, 30297, 1265, 5395, 9136
+18229: DATA 12744, 15938, 19691, 23860, 27542, 30741, 1704, 5929
+18237: DATA 9646, 12912, 16545, 20795, 24565, 27704, 31420, 2866
+18245: DATA 6568, 9808, 13460, 17761, 21484, 24644, 28360, 32740
+18253: DATA 3100, 6832, 11095, 14397, 18049, 22320, 26066, 29346
+18261: DATA 845, 4551, 7840, 12149, 15831, 19152, 23407, 26673
+18269: DATA 30441, 2032, 5236, 9508, 13285, 16565, 20860, 24118
+18277: DATA 27902, 32208, 2634, 7008, 10285, 14037, 18335, 21683
+18285: DATA 25940, 29283, 784, 4212, 7891, 12261, 15507, 19879
+18293: DATA 23129, 27481, 30826, 2426, 5636, 10012, 13411, 17764
+18301: DATA 21117, 25369, 28705, 372, 3644, 7971, 11377, 15716
+18309: DATA 18981, 23327, 26642, 31089, 1651, 5973, 9311, 13800
+18317: DATA 17117, 21475, 24788, 28720, 341, 3684, 8021, 11429
+18325: DATA 15769, 19088, 23084, 27488, 30725, 2457, 5886, 9828
+18333: DATA 14194, 17573, 21985, 25972, 29306, 950, 4285, 8235
+18341: DATA 12644, 16028, 20363, 24339, 27817, 32209, 3331, 6832
+18349: DATA 11224, 15202, 18587, 22567, 26977, 30456, 1560, 6116
+18357: DATA 9409, 13393, 17899, 21856, 25216, 29186, 931, 4964
+18365: DATA 8366, 12341, 16816, 20793, 24230, 28272, 32681, 3883
+18373: DATA 7405, 11288, 15748, 19810, 23264, 27152, 31708, 2993
+18381: DATA 6932, 10468, 14416, 18548, 22932, 26928, 30431, 1709
+18389: DATA 5657, 10128, 14250, 18290, 21637, 25735, 29800, 1061
+18397: DATA 5615, 9712, 13687, 17697, 21217, 25328, 29308, 564
+18405: DATA 5117, 9109, 13124, 17254, 21302, 24720, 28802, 176
+18413: DATA 4181, 8309, 12295, 16419, 20956, 25059, 29080, 484
+18421: DATA 4427, 8517, 12651, 16759, 20753, 24857, 28962, 298
+18429: DATA 4412, 8508, 12667, 16756, 20853, 24857, 28969, 356
+18437: DATA 4388, 8451, 12613, 16763, 20835, 24918, 28941, 422
+18445: DATA 4488, 8676, 12693, 16444, 20500, 24672, 28749, 173
+18453: DATA 4225, 8393, 13157, 17266, 21328, 25500, 29665, 612
+18461: DATA 4722, 8886, 12981, 17723, 21884, 26044, 30131, 1103
+18469: DATA 5217, 9369, 13521, 18228, 22441, 26577, 30211, 1712
+18477: DATA 5848, 10594, 14747, 18435, 22625, 26872, 31512, 3044
+18485: DATA 7105, 10833, 15083, 19808, 23936, 27650, 31907, 3940
+18493: DATA 8110, 11829, 16048, 20793, 24998, 28784, 169, 4907
+18501: DATA 9197, 12824, 17028, 21858, 26080, 29712, 1244, 6065
+18509: DATA 9748, 14052, 18768, 22644, 26772, 31536, 3039, 6829
+18517: DATA 11545, 15760, 19626, 24434, 28549, 32391, 4456, 8229
+18525: DATA 12527, 17406, 21045, 25972, 30172, 1188, 5949, 9773
+18533: DATA 14078, 18896, 22601, 27517, 31281, 2704, 7564, 11434
+18541: DATA 16217, 20016, 24837, 28710, 218, 5108, 8840, 13735
+18549: DATA 17476, 22366, 26210, 31028, 2052, 6992, 10799, 15670
+18557: DATA 19508, 24375, 28221, 288, 4213, 9020, 12852, 17699
+18565: DATA 21541, 26372, 30283, 2327, 6246, 11089, 14915, 19945
+18573: DATA 23721, 28664, 32476, 4135, 9045, 12915, 17756, 21674
+18581: DATA 26573, 30425, 2102, 6964, 10819, 15749, 19681, 24104
+18589: DATA 28989, 191, 5107, 9588, 13437, 18361, 22266, 26668
+18597: DATA 31520, 2689, 7632, 12149, 16041, 20953, 25369, 29373
+18605: DATA 1437, 6012, 9876, 14394, 19265, 23285, 27663, 32682
+18613: DATA 3725, 8287, 13292, 17784, 21707, 26232, 31167, 2849
+18621: DATA 6841, 11376, 16310, 20795, 24764, 29246, 1506, 5904
+18629: DATA 9893, 14361, 19350, 23860, 27878, 32351, 4548, 9130
+18637: DATA 13661, 17657, 22086, 26740, 31640, 3441, 7385, 11937
+18645: DATA 16461, 21471, 26019, 30516, 1732, 6352, 10879, 15393
+18653: DATA 20473, 25072, 29560, 1329, 5345, 9905, 14449, 19050
+18661: DATA 23981, 28624, 364, 4960, 9573, 13528, 18060, 22711
+18669: DATA 27165, 31844, 3586, 8251, 13205, 17908, 22418, 27056
+18677: DATA 31582, 3344, 8042, 12666, 17221, 21791, 26403, 31009
+18685: DATA 2941, 7459, 12092, 16688, 21296, 25982, 30544, 2343
+18693: DATA 6946, 11522, 16151, 20859, 25441, 30037, 1865, 6628
+18701: DATA 11166, 15871, 20444, 24634, 29258, 1092, 5717, 10413
+18709: DATA 15006, 19600, 24870, 29563, 1356, 6046, 10669, 14893
+18717: DATA 19566, 24304, 28902, 1339, 6008, 10677, 15338, 19500
+18725: DATA 24172, 28804, 645, 6007, 10666, 15298, 19487, 24235
+18733: DATA 28889, 1397, 6033, 10362, 14869, 19632, 24884, 29616
+18741: DATA 1421, 5720, 10468, 15719, 20421, 24593, 29421, 1840
+18749: DATA 6575, 10809, 15540, 20794, 25522, 29756, 1720, 7012
+18757: DATA 11682, 15902, 20677, 25979, 30699, 2133, 6797, 12215
+18765: DATA 16404, 21236, 26448, 30842, 2815, 8035, 12757, 17069
+18773: DATA 22275, 27081, 31461, 3959, 8650, 12953, 18275, 22531
+18781: DATA 27337, 32696, 4220, 9511, 14261, 18611, 23922, 28205
+18789: DATA 227, 5584, 9804, 15207, 19557, 24259, 29570, 1193
+18797: DATA 6488, 10872, 16154, 20515, 25237, 30691, 2185, 7597
+18805: DATA 11841, 17244, 21541, 26981, 31248, 3865, 8249, 13601
+18813: DATA 18045, 23331, 27709, 317, 4667, 10025, 14451, 19812
+18821: DATA 24173, 29497, 1041, 6452, 10861, 16209, 20574, 26084
+18829: DATA 30364, 2992, 7365, 12337, 17691, 22116, 27484, 31907
+18837: DATA 4482, 8926, 13925, 19323, 23627, 29136, 738, 5674
+18845: DATA 11128, 15600, 20966, 25917, 30321, 2997, 7347, 12360
+18853: DATA 17774, 22175, 27595, 32631, 4260, 9670, 14600, 19172
+18861: DATA 24542, 29567, 1180, 6202, 11618, 16068, 21013, 26541
+18869: DATA 30942, 3088, 8678, 13691, 18060, 23070, 28653, 813
+18877: DATA 5294, 10352, 15782, 20792, 25276, 30263, 2997, 7984
+18885: DATA 12449, 17417, 22981, 28006, 32490, 4677, 10179, 15264
+18893: DATA 20248, 24820, 29721, 2164, 7572, 12668, 17104, 22187
+18901: DATA 27166, 32708, 5093, 10104, 14540, 19611, 24680, 29796
+18909: DATA 2556, 7664, 12641, 17725, 22267, 27305, 32317, 4646
+18917: DATA 10210, 15239, 20297, 25402, 30565, 2192, 7332, 12464
+18925: DATA 17437, 22648, 27668, 39, 5525, 10723, 15768, 20914
+18933: DATA 25928, 31070, 3365, 8560, 13578, 18692, 23870, 29028
+18941: DATA 1330, 6462, 11637, 16699, 21819, 26933, 32125, 4407
+18949: DATA 9508, 14612, 19712, 24890, 29964, 2386, 7489, 12721
+18957: DATA 17816, 22960, 28118, 59, 5148, 10366, 15484, 20624
+18965: DATA 25733, 30937, 3894, 9012, 14150, 19359, 24548, 29226
+18973: DATA 1597, 6841, 12006, 17780, 22904, 28081, 505, 5153
+18981: DATA 10285, 15519, 20675, 26420, 31652, 3984, 8719, 13992
+18989: DATA 19144, 24949, 30165, 2105, 7248, 12516, 18204, 23464
+18997: DATA 28547, 528, 5797, 11613, 16785, 21584, 26789, 32549
+19005: DATA 5038, 9840, 15035, 20797, 26043, 30773, 3325, 8992
+19013: DATA 14242, 18948, 24214, 30004, 2538, 7262, 12429, 18347
+19021: DATA 23059, 28405, 1301, 6183, 11420, 17268, 22488, 27370
+19029: DATA 359, 5572, 10400, 16248, 21440, 26240, 32098, 4150
+19037: DATA 9449, 15285, 20071, 25884, 31169, 3256, 9076, 13879
+19045: DATA 19117, 24963, 29768, 2933, 7721, 13020, 18893, 23712
+19053: DATA 29528, 1638, 7452, 12343, 17616, 23472, 28309, 1445
+19061: DATA 6238, 12048, 16996, 22836, 27655, 773, 5689, 11568
+19069: DATA 16434, 22334, 27253, 315, 5179, 11120, 15924, 21808
+19077: DATA 26733, 32529, 4619, 10608, 15397, 21314, 26184, 32165
+19085: DATA 4249, 10211, 14997, 20598, 26369, 31349, 4433, 9377
+19093: DATA 15261, 20191, 25655, 31584, 3648, 9602, 14511, 20068
+19101: DATA 25970, 30910, 4021, 9504, 14461, 20405, 25277, 30775
+19109: DATA 3940, 8852, 14784, 20282, 25288, 31186, 3864, 8887
+19117: DATA 14804, 20350, 25232, 30759, 3910, 8880, 14366, 20389
+19125: DATA 25311, 30804, 4037, 9536, 14477, 19993, 26046, 31588
+19133: DATA 3775, 9253, 15270, 20797, 25787, 31285, 4526, 10039
+19141: DATA 15085, 20499, 26500, 32102, 4321, 9744, 15813, 21413
+19149: DATA 26894, 31920, 4631, 10279, 16268, 21886, 26844, 32423
+19157: DATA 5122, 11202, 16875, 22391, 27338, 157, 5679, 11364
+19165: DATA 17389, 22946, 28540, 1338, 6369, 11957, 17529, 23140
+19173: DATA 29156, 1950, 7429, 13158, 18720, 23764, 29389, 2219
+19181: DATA 7763, 13360, 18970, 24634, 30672, 3504, 9102, 14765
+19189: DATA 20297, 25941, 31531, 4375, 9994, 15618, 21295, 27001
+19197: DATA 32521, 5432, 11068, 16679, 22389, 27961, 814, 6500
+19205: DATA 12076, 17744, 23302, 29048, 1888, 7505, 13151, 18916
+19213: DATA 24474, 30204, 3028, 8231, 13830, 19504, 25166, 30900
+19221: DATA 3717, 9429, 15671, 21361, 26885, 32657, 5615, 10795
+19229: DATA 16488, 22180, 27829, 1312, 7037, 12725, 18365, 23607
+19237: DATA 29284, 2186, 7872, 14132, 19882, 25558, 30797, 3749
+19245: DATA 9373, 15716, 21392, 26682, 32347, 5369, 11534, 17380
+19253: DATA 22991, 28241, 1257, 7544, 13259, 18550, 24224, 30509
+19261: DATA 3503, 8738, 14522, 20774, 26531, 31748, 4789, 11053
+19269: DATA 16830, 22096, 27788, 1383, 7077, 12369, 18061, 24502
+19277: DATA 29724, 2788, 9053, 14385, 20103, 26416, 32208, 4785
+19285: DATA 11011, 16852, 22180, 28538, 1472, 6864, 13157, 18469
+19293: DATA 24307, 30644, 3128, 9532, 15344, 20668, 27001, 32356
+19301: DATA 5344, 11673, 16983, 23398, 28714, 1730, 8141, 13474
+19309: DATA 19791, 25215, 31512, 4212, 9921, 16376, 21656, 28132
+19317: DATA 578, 6980, 12397, 18801, 24087, 30471, 3108, 9527
+19325: DATA 14904, 21360, 26680, 309, 5682, 12094, 17460, 23842
+19333: DATA 29220, 2835, 8192, 14714, 20081, 26384, 31835, 5541
+19341: DATA 10888, 17404, 22721, 28788, 2311, 7807, 14162, 19625
+19349: DATA 26051, 31376, 4709, 11075, 16461, 22929, 28409, 1636
+19357: DATA 8008, 13443, 19920, 25972, 31350, 5055, 10472, 16424
+19365: DATA 22889, 28368, 1996, 8032, 13541, 19904, 25858, 31415
+19373: DATA 5070, 11129, 16535, 22584, 29004, 1712, 7701, 14245
+19381: DATA 19675, 25685, 32186, 5400, 10902, 16900, 23487, 29477
+19389: DATA 2227, 8247, 14768, 20852, 26295, 32319, 6066, 12079
+19397: DATA 20042, 23588, 30093, 3441, 8869, 14931, 21442, 27570
+19405: DATA 792, 6370, 12309, 18491, 24979, 31024, 3785, 9900
+19413: DATA 15876, 22467, 28645, 1910, 7370, 13471, 19558, 25700
+19421: DATA 32238, 5541, 11639, 17696, 23289, 29353, 2621, 8759
+19429: DATA 15354, 21401, 27479, 888, 6966, 12432, 18586, 24749
+19437: DATA 30793, 4216, 10325, 16439, 23002, 29180, 2450, 8630
+19445: DATA 14686, 20766, 26917, 308, 6444, 12548, 18797, 24877
+19453: DATA 31022, 4464, 10529, 16701, 22817, 28988, 2360, 8480
+19461: DATA 14701, 20818, 26916, 308, 6471, 12610, 18756, 24993
+19469: DATA 31131, 4528, 10748, 16442, 22529, 28770, 2130, 8352
+19477: DATA 14488, 20691, 27441, 893, 6986, 13214, 19373, 25136
+19485: DATA 31346, 4848, 10972, 17722, 23905, 30133, 3567, 9248
+19493: DATA 15460, 21661, 27840, 1914, 8118, 14297, 19970, 26282
+19501: DATA 32476, 6524, 12757, 18436, 24669, 30953, 4878, 11181
+19509: DATA 17358, 23107, 29351, 3386, 9669, 15440, 21636, 28464
+19517: DATA 2045, 7714, 14000, 20789, 27057, 35, 6375, 13134
+19525: DATA 19399, 25122, 31360, 5495, 11744, 17502, 23769, 30692
+19533: DATA 3612, 9972, 16707, 22581, 28827, 2931, 9176, 15031
+19541: DATA 21837, 28121, 1195, 7988, 14284, 20126, 27001, 33
+19549: DATA 6383, 13236, 19068, 25913, 32240, 5310, 12142, 17965
+19557: DATA 24290, 31134, 4164, 11128, 16997, 23232, 30085, 3261
+19565: DATA 10062, 15993, 22806, 28711, 2197, 9208, 15004, 21938
+19573: DATA 27720, 1808, 7797, 14694, 20490, 27412, 568, 7463
+19581: DATA 13368, 20276, 26229, 306, 6196, 13091, 19006, 25901
+19589: DATA 31779, 5905, 11793, 18813, 24683, 31575, 4647, 11700
+19597: DATA 17551, 24565, 30417, 4157, 11030, 16996, 23892, 29867
+19605: DATA 3971, 9923, 16485, 23413, 29255, 3487, 9464, 15920
+19613: DATA 22845, 28836, 3069, 9521, 15413, 22454, 28392, 2090
+19621: DATA 9065, 14993, 21960, 28529, 1707, 8644, 15116, 21160
+19629: DATA 28110, 1840, 7834, 14386, 21269, 27391, 1032, 8118
+19637: DATA 13965, 20549, 27627, 1405, 7315, 13845, 20927, 27447
+19645: DATA 696, 7281, 14325, 20852, 26771, 575, 7599, 14180
+19653: DATA 20136, 26632, 900, 7545, 13557, 20060, 27080, 1000
+19661: DATA 7543, 13561, 20059, 26656, 912, 7522, 13529, 20141
+19669: DATA 26624, 981, 7595, 14183, 20172, 26783, 611, 7205
+19677: DATA 14321, 20976, 27493, 1340, 7404, 13987, 20596, 27175
+19685: DATA 1534, 8144, 14678, 21361, 27936, 1245, 7838, 14564
+19693: DATA 21065, 27775, 1621, 8228, 15303, 22005, 28569, 2477
+19701: DATA 9038, 15684, 22309, 29024, 2829, 9489, 16185, 22884
+19709: DATA 29481, 3384, 10032, 16756, 23328, 30014, 3892, 10546
+19717: DATA 17192, 23810, 30486, 4465, 11045, 17753, 24414, 31208
+19725: DATA 5085, 11761, 18369, 24692, 31260, 5220, 11854, 18660
+19733: DATA 25247, 31967, 6442, 13152, 19721, 26576, 492, 6734
+19741: DATA 13421, 20133, 26855, 1329, 8057, 14761, 21437, 27689
+19749: DATA 1644, 8324, 15053, 22385, 29096, 3025, 9241, 16045
+19757: DATA 22750, 30065, 3993, 10356, 16982, 23807, 30995, 5047
+19765: DATA 11737, 17986, 24816, 32119, 6033, 12380, 19181, 26405
+19773: DATA 435, 6708, 13557, 20768, 27581, 1073, 7849, 15204
+19781: DATA 21932, 28188, 2185, 9524, 16352, 22598, 29384, 4010
+19789: DATA 10249, 17123, 24341, 30773, 4743, 12149, 18845, 25255
+19797: DATA 32524, 6597, 12982, 20337, 27073, 720, 8047, 14397
+19805: DATA 21181, 28580, 2173, 9521, 16287, 22713, 30067, 3632
+19813: DATA 10472, 17794, 24132, 31607, 5169, 11993, 19330, 25770
+19821: DATA 334, 6704, 14103, 20529, 27329, 2023, 8344, 15777
+19829: DATA 22083, 29456, 3168, 10621, 16898, 24344, 30777, 5476
+19837: DATA 11821, 19263, 25654, 319, 6704, 14116, 20526, 28004
+19845: DATA 1570, 8982, 15429, 22897, 29291, 3925, 10335, 17827
+19853: DATA 24196, 31664, 5334, 12341, 19737, 26236, 856, 7328
+19861: DATA 14797, 21138, 28215, 2929, 9282, 16793, 23294, 30256
+19869: DATA 4984, 11426, 18918, 25974, 32315, 7130, 13531, 20529
+19877: DATA 28031, 1668, 9165, 16241, 22711, 30173, 4354, 10934
+19885: DATA 18392, 25404, 31957, 6205, 13633, 20144, 27150, 1953
+19893: DATA 8392, 15453, 23030, 30004, 3729, 10776, 18348, 25392
+19901: DATA 31997, 6183, 13757, 20797, 27321, 1589, 9213, 16176
+19909: DATA 22693, 29717, 4549, 11640, 18154, 25159, 32712, 7094
+19917: DATA 14173, 20706, 27728, 2099, 9628, 16739, 23241, 30369
+19925: DATA 4639, 12227, 19429, 26468, 215, 7321, 14432, 21541
+19933: DATA 29167, 3513, 10617, 17709, 24245, 31411, 5746, 12842
+19941: DATA 20473, 27522, 1866, 9080, 16229, 22749, 29848, 4266
+19949: DATA 11353, 18545, 25627, 49, 7615, 14820, 21909, 29101
+19957: DATA 3395, 10583, 17782, 24884, 32009, 6425, 13606, 20769
+19965: DATA 28029, 2339, 9530, 16673, 23867, 31028, 5501, 12581
+19973: DATA 19747, 26900, 1349, 8568, 15724, 22871, 30021, 4528
+19981: DATA 11729, 18864, 26049, 60, 7184, 14384, 21589, 28845
+19989: DATA 3210, 10456, 18208, 25447, 32593, 7120, 14335, 21025
+19997: DATA 28282, 2745, 9958, 17696, 24944, 32162, 6589, 13420
+20005: DATA 20601, 27800, 2240, 10036, 17334, 24543, 31296, 5799
+20013: DATA 13020, 20860, 28057, 2097, 9297, 16560, 24415, 31649
+20021: DATA 6084, 12887, 20205, 28000, 2445, 9338, 16575, 24353
+20029: DATA 31674, 5689, 12966, 20768, 28080, 2082, 9471, 17261
+20037: DATA 24557, 31257, 5782, 13620, 20976, 27715, 2248, 10144
+20045: DATA 16989, 24292, 32090, 6260, 13462, 21375, 28627, 2736
+20053: DATA 10527, 17887, 24745, 32564, 7116, 13982, 21881, 28705
+20061: DATA 3311, 11188, 18044, 25913, 496, 7358, 15214, 22061
+20069: DATA 29410, 4510, 11332, 19320, 26213, 725, 8603, 15521
+20077: DATA 23379, 30308, 5382, 12404, 19654, 27621, 1694, 9644
+20085: DATA 16397, 24401, 31350, 6452, 13329, 21269, 28193, 3361
+20093: DATA 10285, 18239, 25127, 288, 7220, 15140, 22068, 29995
+20101: DATA 4131, 12126, 19055, 26910, 1092, 8976, 15941, 23997
+20109: DATA 30861, 6143, 12993, 20540, 28432, 2660, 10580, 17575
+20117: DATA 25484, 32476, 7269, 15207, 22096, 30099, 4325, 11876
+20125: DATA 19817, 26805, 2041, 9521, 16485, 24511, 31471, 6192
+20133: DATA 14188, 21124, 29132, 3963, 10923, 18832, 26377, 673
+20141: DATA 8651, 16249, 23190, 30769, 5909, 13031, 20498, 28593
+20149: DATA 2753, 10324, 18341, 25978, 128, 7701, 15785, 23396
+20157: DATA 30377, 5183, 13301, 20796, 27828, 2598, 10680, 18276
+20165: DATA 25253, 17, 8083, 15729, 22693, 30293, 5589, 13221
+20173: DATA 20766, 27876, 2649, 10285, 18389, 25956, 202, 7851
+20181: DATA 15463, 23508, 31136, 5991, 13009, 20633, 28259, 3109
+20189: DATA 11241, 18873, 26490, 1338, 8422, 16126, 23613, 31332
+20197: DATA 6594, 14238, 21824, 29492, 4385, 11477, 19102, 26800
+20205: DATA 1620, 9342, 16916, 24608, 32732, 7679, 15251, 23012
+20213: DATA 30554, 5471, 13168, 20856, 28417, 3408, 11055, 18721
+20221: DATA 26493, 1317, 8998, 16689, 24369, 32112, 6954, 14636
+20229: DATA 22312, 29982, 4933, 12640, 20333, 27989, 2829, 10657
+20237: DATA 18324, 26103, 989, 8224, 15901, 23600, 31311, 6305
+20245: DATA 13962, 21721, 30006, 4960, 12608, 20354, 28077, 2605
+20253: DATA 10350, 18160, 25844, 1312, 9013, 16825, 24553, 31799
+20261: DATA 6663, 14493, 22220, 30586, 5548, 13277, 20504, 28329
+20269: DATA 3229, 11637, 19355, 26673, 1607, 9463, 17668, 25572
+20277: DATA 449, 7765, 15603, 23921, 31625, 6224, 14048, 22372
+20285: DATA 30121, 4664, 12476, 20775, 28661, 3111, 10930, 19249
+20293: DATA 27041, 1556, 9413, 17782, 25568, 16, 7897, 16300
+20301: DATA 23576, 31408, 6993, 14385, 22163, 30577, 5576, 12968
+20309: DATA 21273, 29072, 3754, 12132, 19904, 27266, 2924, 10288
+20317: DATA 18164, 26559, 1147, 9588, 17396, 24739, 366, 7729
+20325: DATA 15584, 23961, 31307, 7027, 14437, 22212, 30597, 5281
+20333: DATA 13597, 21093, 29446, 4145, 11975, 20378, 27797, 3493
+20341: DATA 10846, 19216, 26731, 2427, 9797, 18183, 25644, 1341
+20349: DATA 8829, 17188, 24634, 372, 7734, 16191, 23603, 32048
+20357: DATA 6719, 15135, 22537, 31028, 5745, 14168, 21576, 30180
+20365: DATA 4760, 13305, 20690, 28732, 4353, 11896, 20253, 27830
+20373: DATA 3464, 10967, 18988, 27495, 2129, 10645, 18175, 26218
+20381: DATA 1853, 9456, 17884, 25914, 565, 9124, 16629, 24621
+20389: DATA 382, 7888, 16342, 24445, 31921, 7621, 15628, 23216
+20397: DATA 31700, 7039, 14491, 22648, 30997, 5860, 13845, 22433
+20405: DATA 29837, 5188, 13792, 21880, 29312, 4608, 13218, 21302
+20413: DATA 28841, 4149, 12711, 20830, 28326, 3640, 12210, 20273
+20421: DATA 27809, 3092, 11717, 19815, 27360, 2654, 11209, 19428
+20429: DATA 27401, 2296, 10320, 18548, 27008, 2403, 9944, 18102
+20437: DATA 26189, 1988, 10154, 18228, 25796, 1232, 9341, 17462
+20445: DATA 26104, 1459, 9594, 17722, 25331, 697, 8826, 16945
+20453: DATA 25599, 917, 9025, 17204, 25398, 209, 8331, 16545
+20461: DATA 24605, 124, 8218, 16439, 25044, 484, 8596, 16811
+20469: DATA 24899, 272, 8548, 16743, 24901, 273, 8557, 16672
+20477: DATA 24888, 310, 8500, 16673, 24889, 292, 8563, 16718
+20485: DATA 24903, 292, 8461, 16753, 24869, 323, 8520, 16807
+20493: DATA 24978, 510, 8657, 16500, 24593, 117, 8270, 16560
+20501: DATA 24708, 222, 8996, 17248, 25420, 927, 9187, 17000
+20509: DATA 25149, 696, 8954, 17699, 25968, 1446, 9720, 17462
+20517: DATA 25633, 1232, 9420, 18279, 26597, 1984, 9759, 18081
+20525: DATA 26329, 2425, 10646, 18464, 26704, 2292, 11101, 19376
+20533: DATA 27586, 2576, 10999, 19825, 28052, 3077, 11428, 20278
+20541: DATA 28600, 3696, 11956, 20852, 29091, 4149, 12463, 21309
+20549: DATA 29677, 4611, 12949, 21873, 30182, 5209, 13515, 22445
+20557: DATA 30238, 5786, 14672, 22586, 30864, 7010, 15322, 23229
+20565: DATA 32077, 7644, 15520, 24418, 32704, 7836, 16685, 24621
+20573: DATA 243, 9200, 16993, 25916, 1520, 9456, 18296, 26157
+20581: DATA 1770, 10648, 18513, 27516, 2661, 10946, 19848, 27811
+20589: DATA 3924, 11875, 20737, 28721, 4295, 13246, 21213, 30180
+20597: DATA 5241, 14168, 22112, 31028, 6161, 15125, 23073, 32033
+20605: DATA 7213, 16191, 24103, 288, 8240, 17186, 25213, 1321
+20613: DATA 9272, 18179, 26129, 2356, 10353, 19281, 27206, 3489
+20621: DATA 11485, 20471, 28359, 4145, 13076, 21092, 29981, 5287
+20629: DATA 14220, 22210, 30752, 6964, 14929, 23967, 31879, 7719
+20637: DATA 16754, 24766, 1011, 9533, 17511, 26557, 1725, 10288
+20645: DATA 19301, 27281, 3537, 12084, 20145, 29144, 4868, 12983
+20653: DATA 21917, 30581, 5787, 14385, 23367, 31479, 7172, 16356
+20661: DATA 24257, 85, 9203, 17777, 25737, 1616, 10660, 19255
+20669: DATA 27389, 3125, 12205, 20789, 28854, 4644, 13745, 22333
+20677: DATA 30445, 6163, 15242, 23910, 31991, 7765, 16846, 25520
+20685: DATA 1373, 9458, 18000, 26674, 2970, 11618, 19672, 28388
+20693: DATA 4121, 13269, 21929, 30577, 5845, 14495, 23167, 31792
+20701: DATA 8180, 16830, 25458, 1396, 9468, 18084, 26734, 2660
+20709: DATA 11768, 20355, 28992, 4966, 13668, 21690, 30372, 6306
+20717: DATA 14877, 23673, 32257, 8308, 17372, 26083, 2013, 10657
+20725: DATA 19291, 27989, 3947, 12596, 21270, 29980, 5924, 14627
+20733: DATA 23349, 32036, 7993, 16685, 25461, 1343, 10043, 18722
+20741: DATA 27489, 3408, 12049, 20860, 29536, 5392, 14168, 22967
+20749: DATA 31640, 7650, 16277, 24611, 538, 9317, 18001, 26784
+20757: DATA 2765, 11416, 20789, 29542, 5450, 14226, 23020, 31270
+20765: DATA 7281, 16041, 24764, 1396, 10100, 18850, 27631, 3117
+20773: DATA 11899, 20629, 29317, 6005, 14769, 23440, 31769, 7852
+20781: DATA 16600, 25904, 1942, 10299, 19015, 27874, 4376, 13223
+20789: DATA 21977, 30266, 6377, 15739, 24454, 17, 8889, 18221
+20797: DATA 27058, 2622, 11513, 20852, 29623, 5157, 13993, 23396
+20805: DATA 32186, 7711, 16528, 25976, 2017, 10256, 19151, 28598
+20813: DATA 4116, 13045, 22355, 30776, 6796, 16176, 25048, 700
+20821: DATA 10013, 18901, 27319, 3965, 12736, 21150, 30574, 6177
+20829: DATA 15037, 24497, 123, 9531, 18424, 26801, 3441, 11821
+20837: DATA 20712, 30083, 5637, 15229, 23595, 32400, 9113, 17580
+20845: DATA 26968, 2608, 12051, 20533, 29399, 6114, 14484, 23975
+20853: DATA 32269, 9055, 17507, 26932, 2583, 12053, 20524, 29992
+20861: DATA 5684, 15140, 23596, 350, 8764, 18212, 26670, 3361
+20869: DATA 11809, 21270, 29765, 6457, 14885, 24388, 69, 9645
+20877: DATA 18062, 27568, 3292, 12327, 21849, 30256, 6994, 15522
+20885: DATA 25037, 723, 9770, 19297, 27735, 4483, 13032, 22120
+20893: DATA 31549, 7358, 16890, 25888, 1589, 11170, 19704, 28711
+20901: DATA 5474, 13981, 23496, 32625, 8363, 17876, 26888, 2720
+20909: DATA 12179, 21296, 29909, 6165, 15707, 24297, 605, 10160
+20917: DATA 18632, 27740, 4576, 13668, 22154, 31234, 8121, 17185
+20925: DATA 25775, 2160, 11682, 20795, 29344, 5692, 15289, 24420
+20933: DATA 163, 9237, 18816, 28016, 3749, 12868, 22466, 31716
+20941: DATA 7945, 16629, 25670, 2080, 11775, 20836, 29397, 5793
+20949: DATA 14925, 24533, 939, 10097, 18647, 27799, 4212, 13412
+20957: DATA 23025, 32181, 8547, 17713, 26361, 2800, 11892, 21034
+20965: DATA 30637, 7044, 16205, 25457, 1893, 10453, 19588, 28835
+20973: DATA 5205, 14436, 23581, 116, 9671, 18933, 28058, 4525
+20981: DATA 13662, 22852, 32096, 8550, 17733, 26897, 3363, 12576
+20989: DATA 21885, 31025, 7479, 16699, 25895, 2340, 11645, 20784
+20997: DATA 29992, 6428, 15616, 24932, 1386, 10562, 19801, 29093
+21005: DATA 5513, 14841, 24026, 58, 9301, 18553, 27739, 4324
+21013: DATA 13444, 22724, 32613, 9085, 18262, 27600, 4067, 12843
+21021: DATA 22121, 31450, 7920, 17708, 26996, 3507, 12777, 21544
+21029: DATA 30836, 7376, 16582, 26491, 2999, 12226, 21000, 30375
+21037: DATA 6857, 16702, 26111, 2142, 11361, 20728, 30484, 7095
+21045: DATA 16269, 25154, 1760, 11621, 20880, 29721, 6335, 16161
+21053: DATA 25529, 1648, 10917, 20774, 30128, 6195, 15540, 25399
+21061: DATA 1956, 10783, 20107, 30004, 6636, 15453, 24797, 1960
+21069: DATA 10772, 20213, 30022, 6260, 15489, 25464, 2012, 10928
+21077: DATA 20813, 30148, 6317, 16241, 25477, 1683, 11618, 20522
+21085: DATA 29947, 7097, 15975, 25913, 2548, 11428, 21364, 30251
+21093: DATA 6883, 16848, 25672, 2929, 11814, 21208, 31116, 7338
+21101: DATA 17236, 26211, 3352, 12404, 21698, 31743, 7816, 17832
+21109: DATA 26697, 3856, 12903, 22897, 31813, 8966, 17960, 27958
+21117: DATA 4132, 14170, 23094, 315, 9272, 19232, 28200, 5424
+21125: DATA 14380, 24324, 524, 10619, 19563, 29521, 5697, 15784
+21133: DATA 24708, 1968, 10960, 20524, 30469, 6773, 16723, 25783
+21141: DATA 2948, 11974, 21536, 31546, 7685, 17872, 26842, 3628
+21149: DATA 13684, 22716, 32752, 9588, 18529, 28600, 4852, 14391
+21157: DATA 24365, 647, 10698, 20321, 29353, 6612, 16205, 25256
+21165: DATA 2516, 12155, 21136, 30776, 8012, 17072, 26643, 4011
+21173: DATA 13017, 22544, 32743, 9585, 18629, 28177, 5539, 15204
+21181: DATA 24244, 1059, 11174, 20769, 29872, 6768, 16827, 26411
+21189: DATA 2751, 12368, 22409, 32117, 8439, 18007, 28104, 5097
+21197: DATA 14711, 23779, 598, 10293, 20377, 30069, 6301, 16048
+21205: DATA 25608, 3036, 12704, 22372, 31434, 8322, 18041, 27681
+21213: DATA 5103, 14755, 24377, 1396, 10484, 20208, 29813, 6717
+21221: DATA 16893, 26527, 3409, 13180, 22816, 31940, 8836, 18599
+21229: DATA 28252, 5244, 14933, 24636, 2004, 11774, 21401, 31209
+21237: DATA 8005, 17749, 27497, 4464, 14149, 23812, 808, 10536
+21245: DATA 20280, 29984, 6970, 16678, 26401, 3381, 13103, 22884
+21253: DATA 32570, 9503, 19216, 29048, 5985, 15632, 25433, 2469
+21261: DATA 12182, 22005, 31637, 8246, 17948, 27772, 4689, 14509
+21269: DATA 24194, 1246, 11574, 21300, 31050, 8086, 17799, 27197
+21277: DATA 4216, 14001, 23783, 1319, 11061, 20900, 30706, 7268
+21285: DATA 17006, 26783, 3784, 14180, 23984, 964, 10248, 20196
+21293: DATA 29897, 7544, 17296, 26740, 3655, 13557, 23822, 945
+21301: DATA 10689, 20036, 29861, 7541, 17291, 26644, 3821, 14119
+21309: DATA 23986, 574, 10419, 20797, 30631, 7229, 17149, 27440
+21317: DATA 4517, 13841, 23697, 1332, 11249, 20568, 30408, 8164
+21325: DATA 17432, 27385, 4946, 14396, 24193, 1912, 11677, 21174
+21333: DATA 31496, 8663, 18092, 28519, 5585, 14997, 25471, 2148
+21341: DATA 12020, 22435, 31797, 9527, 19450, 28834, 6511, 15905
+21349: DATA 25838, 3460, 12811, 23326, 79, 9977, 20363, 29924
+21357: DATA 7492, 17023, 27392, 4212, 14035, 24569, 1171, 11680
+21365: DATA 21005, 31561, 8298, 18785, 28183, 5891, 15400, 25896
+21373: DATA 2619, 13168, 22561, 294, 9780, 20256, 29741, 7457
+21381: DATA 16937, 27472, 4108, 14714, 24101, 1873, 11331, 21988
+21389: DATA 31388, 9212, 18625, 28721, 6407, 15998, 26460, 3248
+21397: DATA 13704, 23184, 545, 11133, 20552, 31125, 7907, 17975
+21405: DATA 28532, 5311, 15867, 25972, 2658, 13241, 22761, 44
+21413: DATA 10541, 20126, 30666, 8032, 17581, 28121, 5379, 15011
+21421: DATA 25501, 2930, 12416, 22560, 277, 9969, 20087, 30636
+21429: DATA 7372, 17502, 28129, 5433, 14989, 25109, 2977, 13088
+21437: DATA 22781, 36, 10672, 20792, 30384, 7712, 18354, 28470
+21445: DATA 5305, 15381, 26007, 3384, 12965, 23113, 962, 11185
+21453: DATA 21341, 30951, 8284, 18488, 29081, 6448, 16083, 26273
+21461: DATA 3592, 14292, 24549, 1888, 11466, 21712, 31848, 9276
+21469: DATA 19945, 30114, 7540, 17719, 27361, 4848, 14953, 25132
+21477: DATA 3048, 13264, 23366, 891, 11051, 20694, 30852, 8374
+21485: DATA 18512, 28785, 6145, 16445, 27098, 4606, 14813, 24997
+21493: DATA 2369, 12631, 22890, 358, 10508, 20740, 31013, 8489
+21501: DATA 18801, 29018, 6439, 16689, 26940, 4413, 14637, 24872
+21509: DATA 2344, 12573, 22784, 378, 10609, 20752, 31044, 8624
+21517: DATA 18909, 29183, 6619, 16500, 26648, 4223, 14415, 24737
+21525: DATA 2253, 12480, 23338, 867, 11072, 21378, 31723, 8753
+21533: DATA 19057, 29424, 6909, 17717, 28007, 5556, 15850, 25637
+21541: DATA 3199, 13461, 23689, 1844, 12196, 22494, 32265, 9956
+21549: DATA 20178, 31072, 8577, 18493, 28760, 6393, 17159, 27553
+21557: DATA 5005, 14937, 25329, 3386, 13765, 23632, 1177, 12076
+21565: DATA 22452, 32291, 9973, 20775, 31165, 8255, 18600, 29480
+21573: DATA 7081, 16988, 27333, 5493, 15857, 25616, 3289, 14252
+21581: DATA 24088, 1690, 12611, 22577, 135, 11113, 21405, 31400
+21589: DATA 9480, 19921, 29878, 8032, 18313, 28368, 6508, 16424
+21597: DATA 26865, 5055, 14946, 25972, 3564, 13503, 24424, 1636
+21605: DATA 12025, 22943, 5, 11120, 21024, 31428, 9608, 19638
+21613: DATA 30544, 7801, 18715, 28721, 6293, 17380, 27285, 5537
+21621: DATA 15373, 26438, 3684, 14712, 24592, 2837, 12909, 23851
+21629: DATA 1083, 12144, 22049, 316, 10288, 21360, 31288, 9517
+21637: DATA 19498, 30488, 7697, 18812, 28709, 6978, 16968, 28067
+21645: DATA 5268, 16355, 26305, 4145, 15111, 25136, 3402, 13484
+21653: DATA 24452, 1747, 12333, 23348, 594, 11679, 21752, 32296
+21661: DATA 10617, 20698, 31741, 9525, 19555, 30645, 7869, 18470
+21669: DATA 29544, 6805, 17867, 28468, 5796, 16851, 27406, 4769
+21677: DATA 15821, 26468, 3728, 14384, 25365, 2802, 13316, 24548
+21685: DATA 1753, 12376, 23520, 1332, 11409, 22037, 417, 11041
+21693: DATA 21165, 31807, 10151, 20768, 30896, 8738, 19962, 30519
+21701: DATA 7917, 18451, 29578, 7546, 17635, 28249, 6623, 17321
+21709: DATA 27932, 5348, 15964, 26683, 5019, 15664, 25808, 3745
+21717: DATA 14350, 25560, 3492, 14202, 24268, 2179, 12896, 23658
+21725: DATA 1943, 12762, 23361, 1340, 11504, 22206, 49, 10852
+21733: DATA 22014, 32661, 10577, 21300, 32049, 9432, 20104, 30948
+21741: DATA 8792, 19577, 30226, 8252, 19393, 30200, 8157, 18870
+21749: DATA 29512, 7511, 18284, 29031, 6929, 17685, 28479, 6500
+21757: DATA 17193, 27967, 6005, 16672, 27453, 5433, 16174, 26980
+21765: DATA 4923, 15633, 26377, 4449, 15200, 25884, 3853, 14757
+21773: DATA 25502, 3556, 14300, 24610, 2580, 13412, 24152, 2276
+21781: DATA 12953, 23768, 2336, 13108, 23889, 1941, 12769, 23073
+21789: DATA 1133, 11967, 22759, 1312, 12144, 22946, 945, 11364
+21797: DATA 22124, 158, 10945, 22302, 423, 11209, 21533, 32421
+21805: DATA 10446, 21859, 32725, 10272, 21085, 31989, 10589, 21415
+21813: DATA 32194, 9822, 20707, 32125, 10135, 20509, 31404, 10032
+21821: DATA 20916, 31295, 9403, 20852, 31672, 9269, 20158, 31532
+21829: DATA 9644, 19998, 30860, 9575, 20456, 30750, 8845, 20452
+21837: DATA 30772, 8950, 20245, 30752, 8861, 20341, 31133, 8865
+21845: DATA 20228, 31191, 8877, 20320, 31181, 8912, 20351, 30753
+21853: DATA 8954, 20409, 30822, 9504, 20464, 30882, 9533, 20013
+21861: DATA 30974, 9680, 20054, 31601, 9265, 20112, 31630, 9387
+21869: DATA 20815, 31330, 10000, 20535, 31425, 10236, 20612, 32232
+21877: DATA 9741, 21342, 31850, 10526, 20996, 32542, 10274, 21801
+21885: DATA 32316, 11068, 21564, 305, 10790, 22384, 46, 11564
+21893: DATA 22050, 773, 11273, 22896, 549, 12114, 22600, 1508
+21901: DATA 11928, 23528, 1221, 12337, 23815, 1657, 13144, 23722
+21909: DATA 2446, 13013, 24097, 2872, 13317, 24978, 2808, 13872
+21917: DATA 25405, 3250, 14832, 25891, 3700, 15266, 25848, 4196
+21925: DATA 15648, 26320, 5068, 16242, 26853, 5593, 16665, 27364
+21933: DATA 6100, 17251, 27861, 6183, 17744, 28388, 6749, 18349
+21941: DATA 28867, 7251, 18922, 30054, 7831, 18965, 30638, 9008
+21949: DATA 19633, 30761, 9721, 20852, 31393, 9784, 21432, 32590
+21957: DATA 10403, 21535, 402, 11577, 22247, 585, 12253, 23461
+21965: DATA 1806, 12515, 23632, 2096, 13781, 24947, 2770, 13994
+21973: DATA 25099, 4057, 15287, 26489, 4292, 15492, 26724, 5163
+21981: DATA 16883, 28144, 6520, 17713, 28406, 6840, 18044, 29226
+21989: DATA 8164, 19331, 30536, 9012, 20274, 30937, 9345, 20648
+21997: DATA 31773, 10366, 21530, 32, 11669, 23008, 1423, 12715
+22005: DATA 23897, 2389, 13670, 24928, 3397, 14601, 25890, 4401
+22013: DATA 15740, 26970, 5471, 16667, 27955, 6512, 17726, 28971
+22021: DATA 7480, 18690, 29974, 8561, 19753, 30992, 9566, 20909
+22029: DATA 32147, 10739, 21968, 116, 11265, 22645, 1105, 12449
+22037: DATA 23709, 2271, 14135, 25440, 3908, 15236, 26596, 4651
+22045: DATA 15987, 27376, 5884, 17703, 28981, 7609, 18928, 29748
+22053: DATA 8290, 19587, 30934, 10109, 21415, 32732, 10760, 22248
+22061: DATA 669, 12644, 23965, 2109, 13382, 24752, 3860, 15287
+22069: DATA 26509, 4689, 16105, 28024, 6597, 17412, 28834, 7984
+22077: DATA 19388, 30268, 8889, 20781, 32245, 10274, 21684, 800
+22085: DATA 12196, 23059, 1680, 13688, 25066, 3141, 14558, 26602
+22093: DATA 4730, 16122, 27994, 6177, 17543, 29566, 8156, 19112
+22101: DATA 30681, 9718, 20652, 32614, 11200, 22166, 1377, 12333
+22109: DATA 23800, 2979, 13877, 25891, 4592, 15522, 27512, 5732
+22117: DATA 17144, 29059, 7244, 19322, 30242, 8848, 20889, 31916
+22125: DATA 11092, 22115, 1365, 12336, 23744, 3043, 13961, 26045
+22133: DATA 4109, 16223, 27241, 6512, 17477, 29466, 7714, 19761
+22141: DATA 30767, 10046, 21044, 312, 11381, 23345, 1582, 13668
+22149: DATA 24620, 3920, 14871, 26993, 5238, 17220, 28228, 7594
+22157: DATA 18586, 30640, 8902, 20516, 32538, 10852, 22813, 1201
+22165: DATA 13187, 24260, 3116, 15224, 26117, 5513, 16610, 28209
+22173: DATA 7485, 18595, 30710, 9525, 20583, 32693, 11001, 22628
+22181: DATA 1913, 12952, 25024, 3961, 15077, 27103, 5899, 17058
+22189: DATA 29075, 7984, 19157, 30749, 10049, 21168, 15, 12193
+22197: DATA 23244, 2132, 14326, 25902, 4335, 15994, 28041, 6949
+22205: DATA 18084, 29808, 9188, 20846, 31989, 10759, 22968, 1892
+22213: DATA 12965, 24593, 3987, 15729, 26789, 5698, 17864, 29605
+22221: DATA 8478, 19704, 31312, 10288, 22485, 1383, 12501, 24229
+22229: DATA 3097, 15248, 27062, 6001, 17088, 28829, 7806, 19556
+22237: DATA 31721, 10687, 22325, 1334, 12528, 24304, 3177, 14892
+22245: DATA 27112, 6096, 17731, 29565, 8491, 19665, 31361, 10468
+22253: DATA 22100, 1150, 12885, 24629, 3989, 15843, 27544, 6582
+22261: DATA 18244, 30037, 9078, 20788, 32522, 11542, 23405, 2356
+22269: DATA 14120, 25898, 4911, 16696, 28464, 7459, 19325, 31011
+22277: DATA 10040, 21777, 791, 12656, 24428, 3422, 15178, 27108
+22285: DATA 6044, 17918, 29589, 8245, 19995, 31859, 10836, 22689
+22293: DATA 1667, 13508, 25957, 4960, 16727, 28565, 7660, 18999
+22301: DATA 30824, 9890, 21744, 1402, 13109, 25072, 4052, 15460
+22309: DATA 27262, 6277, 18134, 30564, 9632, 21459, 25, 12004
+22317: DATA 23760, 3455, 15238, 26656, 5653, 17649, 29977, 9138
+22325: DATA 20936, 32350, 11505, 23905, 2967, 14357, 26303, 5943
+22333: DATA 17917, 29239, 8380, 20770, 32688, 11376, 23208, 2868
+22341: DATA 14829, 26140, 5258, 17786, 29666, 8208, 20175, 32673
+22349: DATA 11291, 23295, 2887, 14385, 26325, 5988, 17877, 29357
+22357: DATA 8990, 20880, 32437, 12155, 24012, 2718, 15225, 26728
+22365: DATA 5821, 18354, 29792, 9504, 21429, 167, 12664, 24163
+22373: DATA 3327, 15765, 27141, 7015, 18474, 30352, 10126, 21672
+22381: DATA 1362, 12899, 25360, 4213, 16021, 28592, 7338, 19873
+22389: DATA 31245, 11101, 22640, 2407, 13841, 26448, 5181, 17718
+22397: DATA 29240, 8995, 20518, 372, 11834, 24382, 3196, 15694
+22405: DATA 27207, 6964, 18436, 31085, 9765, 22273, 1047, 13796
+22413: DATA 25261, 5054, 16614, 28794, 8527, 20016, 32628, 11440
+22421: DATA 24010, 2755, 14949, 27509, 6149, 18839, 30434, 9771
+22429: DATA 22393, 1264, 13793, 25916, 4732, 17342, 28922, 8292
+22437: DATA 20857, 32408, 12224, 24372, 3244, 15811, 27905, 6821
+22445: DATA 19411, 31604, 10453, 22589, 2374, 14000, 26121, 6070
+22453: DATA 17602, 29760, 9708, 21879, 644, 12828, 25571, 4964
+22461: DATA 16637, 28679, 8624, 20852, 32422, 11832, 24498, 3889
+22469: DATA 15521, 27668, 7621, 19836, 31460, 10822, 23496, 3044
+22477: DATA 15131, 26879, 6234, 18480, 31189, 10614, 22226, 1718
+22485: DATA 13901, 26567, 6048, 18289, 29902, 9347, 21548, 1102
+22493: DATA 13719, 26004, 5492, 17709, 29365, 8930, 21031, 612
+22501: DATA 13273, 25496, 4928, 17204, 29491, 8401, 20632, 168
+22509: DATA 12361, 24624, 4116, 16420, 29125, 8693, 20892, 438
+22517: DATA 12638, 24848, 4465, 16763, 28997, 8466, 20776, 356
+22525: DATA 12590, 24885, 4404, 16696, 28976, 8500, 20861, 294
+22533: DATA 12596, 24912, 4356, 16692, 29032, 8521, 20830, 432
+22541: DATA 12696, 25058, 4572, 16443, 28672, 8291, 20509, 162
+22549: DATA 12418, 24770, 4902, 17265, 29445, 9181, 21421, 560
+22557: DATA 12917, 25269, 4789, 17712, 30074, 9663, 21999, 1124
+22565: DATA 13434, 25759, 5323, 18227, 30641, 10128, 22031, 1713
+22573: DATA 14041, 26999, 6544, 18548, 30804, 10494, 23389, 2989
+22581: DATA 15299, 27219, 6893, 19770, 32197, 11344, 23706, 3873
+22589: DATA 16381, 28212, 7866, 20794, 498, 12324, 24829, 4908
+22597: DATA 17324, 29190, 8832, 21812, 1521, 13400, 25800, 6116
+22605: DATA 17935, 30453, 10566, 22587, 2176, 15202, 27614, 6817
+22613: DATA 19742, 32144, 11441, 24443, 3973, 16018, 29025, 8235
+22621: DATA 20714, 1008, 12924, 25888, 5557, 17599, 30573, 9761
+22629: DATA 22243, 2524, 14341, 27509, 6699, 19156, 32205, 11405
+22637: DATA 24349, 3687, 16666, 28705, 8409, 21492, 659, 13795
+22645: DATA 25689, 5904, 18039, 31101, 10262, 23323, 2669, 15648
+22653: DATA 27708, 7997, 20020, 307, 12348, 25406, 4666, 17764
+22661: DATA 29753, 10008, 22016, 2356, 14438, 27487, 6723, 19888
+22669: DATA 31896, 12286, 24257, 4135, 17237, 29301, 9547, 21665
+22677: DATA 1923, 13968, 26668, 7026, 18949, 32135, 11496, 24164
+22685: DATA 4473, 16569, 29681, 9594, 21557, 2032, 14026, 26657
+22693: DATA 6954, 19100, 32201, 12084, 24237, 4561, 17179, 29345
+22701: DATA 9629, 22372, 1690, 14452, 27475, 6905, 19482, 32689
+22709: DATA 11999, 24661, 5029, 17787, 29840, 9732, 23021, 2864
+22717: DATA 15029, 27701, 8181, 20792, 186, 12851, 26038, 5988
+22725: DATA 18080, 30741, 11142, 23932, 3300, 15966, 29124, 9143
+22733: DATA 21776, 1214, 13887, 26718, 7089, 19825, 31940, 12004
+22741: DATA 24670, 5002, 17893, 30528, 9933, 22677, 2605, 15392
+22749: DATA 28658, 8639, 21351, 1396, 13537, 26303, 6205, 18992
+22757: DATA 32229, 12181, 24837, 4962, 17700, 29893, 9857, 22704
+22765: DATA 2589, 15480, 28180, 8231, 21397, 1521, 14301, 27050
+22773: DATA 7000, 19805, 32615, 12657, 25367, 5456, 18222, 31013
+22781: DATA 11055, 23846, 3888, 16688, 29557, 9529, 22323, 2352
+22789: DATA 15138, 27984, 7948, 20832, 811, 13584, 26381, 6529
+22797: DATA 19356, 32243, 12253, 24692, 4615, 17535, 30290, 10409
+22805: DATA 23245, 3292, 16672, 29557, 9537, 22425, 2531, 14883
+22813: DATA 27709, 7845, 20709, 1396, 14177, 27071, 7101, 19504
+22821: DATA 32357, 12437, 25221, 5986, 18852, 31685, 11265, 24240
+22829: DATA 4253, 17784, 30612, 10279, 23061, 3325, 16658, 29622
+22837: DATA 9672, 22032, 2283, 15713, 28552, 8210, 21160, 1846
+22845: DATA 14766, 27248, 7354, 20774, 1013, 13347, 26276, 6953
+22853: DATA 19887, 32287, 12425, 25959, 6053, 18517, 31424, 12198
+22861: DATA 24600, 4852, 18257, 30769, 10897, 24368, 4564, 17066
+22869: DATA 30541, 10717, 23210, 3943, 16836, 29337, 10094, 22583
+22877: DATA 2749, 16313, 28795, 9588, 22497, 2232, 15736, 28260
+22885: DATA 8427, 21916, 1610, 15227, 27703, 7875, 21443, 1252
+22893: DATA 14621, 27207, 7952, 20596, 720, 14310, 26776, 7594
+22901: DATA 19981, 854, 13418, 26977, 6667, 20244, 109, 13605
+22909: DATA 26237, 6947, 19489, 294, 12852, 26430, 6202, 19745
+22917: DATA 32365, 13079, 25609, 6517, 19062, 32579, 12301, 26027
+22925: DATA 5775, 19442, 31893, 12349, 25883, 5680, 19273, 31916
+22933: DATA 12680, 25232, 5668, 19322, 31825, 12693, 25326, 5676
+22941: DATA 19324, 31933, 12791, 25905, 5735, 19440, 31986, 12330
+22949: DATA 25901, 5777, 19333, 32612, 12448, 26068, 6408, 19127
+22957: DATA 32713, 13169, 25753, 6260, 19804, 32484, 12814, 26529
+22965: DATA 6337, 19542, 421, 13688, 26244, 6674, 20392, 808
+22973: DATA 13496, 26676, 7669, 20771, 700, 13860, 27573, 8036
+22981: DATA 20652, 1104, 14731, 28001, 7912, 21074, 1992, 15286
+22989: DATA 28499, 8368, 21525, 2051, 15773, 29041, 8905, 22244
+22997: DATA 2574, 16351, 29616, 10104, 22721, 3280, 16505, 29740
+23005: DATA 10744, 23977, 4405, 17721, 30448, 10929, 24179, 4731
+23013: DATA 18311, 31738, 12129, 25461, 5948, 18576, 31960, 12542
+23021: DATA 25629, 6215, 19472, 116, 13779, 27129, 7571, 20901
+23029: DATA 1345, 14684, 28028, 8500, 21767, 2309, 15652, 28968
+23037: DATA 9513, 22896, 3360, 16676, 30069, 10532, 23861, 4385
+23045: DATA 17773, 30995, 11530, 24929, 5495, 18769, 32074, 12705
+23053: DATA 26077, 6628, 19930, 116, 13313, 26751, 7240, 20647
+23061: DATA 1157, 14480, 28465, 9084, 22336, 3024, 16382, 29232
+23069: DATA 9839, 23217, 3835, 17715, 31088, 11760, 25074, 5174
+23077: DATA 18543, 31952, 12492, 26490, 7141, 20420, 517, 13985
+23085: DATA 27293, 8561, 21915, 2080, 15440, 28915, 10005, 23461
+23093: DATA 4032, 16978, 30432, 11622, 25035, 5200, 18669, 32525
+23101: DATA 13225, 26224, 6835, 20792, 1460, 14371, 27829, 8993
+23109: DATA 22462, 2640, 16006, 30075, 10729, 23647, 4319, 18359
+23117: DATA 31325, 12017, 25926, 6260, 19586, 885, 14237, 27303
+23125: DATA 8460, 21954, 2231, 16237, 29573, 9881, 23929, 4196
+23133: DATA 17659, 31650, 11898, 25913, 6581, 19618, 882, 13867
+23141: DATA 27360, 8656, 21585, 2939, 15973, 29378, 10626, 23723
+23149: DATA 4944, 17980, 32085, 12341, 25819, 7156, 20189, 1463
+23157: DATA 14402, 28509, 8800, 22880, 3084, 17181, 30248, 11575
+23165: DATA 24701, 5924, 19005, 305, 13429, 27427, 7716, 21801
+23173: DATA 2095, 16159, 29193, 10599, 23589, 4953, 17987, 32228
+23181: DATA 12425, 26616, 6864, 20596, 1799, 14975, 29010, 9385
+23189: DATA 23454, 3728, 17443, 31608, 11844, 25987, 6373, 20068
+23197: DATA 1406, 14527, 28665, 9531, 22631, 4003, 17085, 30757
+23205: DATA 12158, 25296, 6610, 20337, 681, 14812, 28483, 8932
+23213: DATA 22941, 3929, 17025, 30836, 12102, 25337, 6160, 20404
+23221: DATA 705, 14409, 28581, 9585, 22675, 3601, 17853, 31531
+23229: DATA 11951, 25649, 7073, 20785, 1190, 14960, 29108, 10018
+23237: DATA 23277, 4103, 18304, 32052, 12529, 26178, 7636, 21476
+23245: DATA 2313, 15615, 29205, 10296, 24464, 5489, 18635, 32417
+23253: DATA 13389, 27591, 8620, 22368, 2765, 16592, 30308, 11312
+23261: DATA 25521, 6640, 20343, 1313, 14561, 28400, 9340, 23082
+23269: DATA 4578, 18308, 32077, 13169, 26935, 7312, 21132, 2228
+23277: DATA 15949, 29813, 10772, 24614, 6086, 19888, 914, 14762
+23285: DATA 28429, 9540, 23405, 4465, 18245, 32000, 13096, 26912
+23293: DATA 7992, 21795, 2849, 16693, 30521, 11632, 25396, 6442
+23301: DATA 20333, 1284, 15117, 29041, 10021, 23889, 4931, 18864
+23309: DATA 32664, 13811, 27613, 8245, 22040, 3186, 16984, 30902
+23317: DATA 11981, 25795, 7469, 21371, 2391, 16260, 30177, 10813
+23325: DATA 24637, 5796, 19709, 1329, 15207, 29109, 10236, 23586
+23333: DATA 4729, 18581, 32471, 14138, 28133, 9104, 22564, 3760
+23341: DATA 17565, 32113, 13209, 26663, 7770, 21680, 3342, 17313
+23349: DATA 31176, 11869, 25846, 7476, 21393, 2079, 16109, 30496
+23357: DATA 11698, 25200, 6305, 20796, 1980, 15395, 29437, 11041
+23365: DATA 25019, 5653, 19595, 1332, 15346, 28760, 9928, 24490
+23373: DATA 5213, 19175, 848, 14452, 28295, 10101, 24009, 4785
+23381: DATA 19231, 478, 14053, 28515, 9676, 23172, 4965, 18532
+23389: DATA 32500, 14244, 27701, 9504, 23546, 4336, 18793, 32300
+23397: DATA 13544, 28112, 8772, 23418, 4145, 18133, 32654, 13484
+23405: DATA 27996, 8829, 23319, 4145, 18119, 32688, 13467, 28086
+23413: DATA 8770, 23389, 4133, 18784, 32269, 14101, 27757, 9515
+23421: DATA 23081, 4920, 18480, 294, 13941, 28450, 9266, 23851
+23429: DATA 4640, 19203, 75, 14622, 28175, 10100, 23628, 5565
+23437: DATA 19165, 936, 14479, 28788, 10530, 24184, 5976, 19626
+23445: DATA 1485, 15044, 29229, 11121, 24581, 6559, 20223, 1574
+23453: DATA 16189, 29881, 11750, 25972, 6774, 21425, 2287, 16438
+23461: DATA 31076, 11925, 26561, 7988, 21681, 3551, 17741, 31408
+23469: DATA 13269, 27509, 8405, 22562, 4436, 18149, 32273, 14256
+23477: DATA 27789, 9300, 24042, 5499, 19095, 604, 15341, 29488
+23485: DATA 10421, 24629, 6645, 20794, 1696, 15933, 30655, 12065
+23493: DATA 25791, 7171, 21957, 3451, 17131, 31248, 13273, 27564
+23501: DATA 8984, 22704, 4177, 18491, 410, 14690, 28317, 9890
+23509: DATA 24065, 6097, 20406, 1916, 15493, 29842, 11361, 25637
+23517: DATA 7678, 21947, 3385, 17780, 31476, 12990, 27257, 8804
+23525: DATA 23545, 5016, 19264, 890, 15205, 28868, 10373, 24737
+23533: DATA 6173, 20607, 2055, 16438, 31125, 12789, 27019, 8613
+23541: DATA 22877, 4447, 18807, 373, 14609, 28949, 10558, 24938
+23549: DATA 6525, 20848, 2321, 16701, 31025, 12656, 26922, 8481
+23557: DATA 22893, 4372, 18698, 308, 14710, 29023, 10560, 24993
+23565: DATA 6537, 20984, 2524, 16442, 30738, 12336, 26698, 8374
+23573: DATA 22658, 4318, 19234, 811, 15109, 29648, 11209, 25131
+23581: DATA 6776, 21155, 2811, 17779, 32097, 13808, 28137, 9260
+23589: DATA 23656, 5328, 19649, 1915, 16298, 30658, 11853, 26280
+23597: DATA 7892, 22907, 4496, 18548, 64, 14563, 29506, 11236
+23605: DATA 25485, 6759, 21216, 3380, 17796, 31772, 13502, 28459
+23613: DATA 10237, 24118, 5818, 20769, 2491, 16436, 30973, 13093
+23621: DATA 27629, 8707, 23176, 5493, 19945, 1116, 15501, 30636
+23629: DATA 11794, 26341, 8519, 22579, 4249, 19313, 974, 15031
+23637: DATA 30029, 11742, 25760, 8053, 22487, 3792, 18809, 44
+23645: DATA 14584, 29680, 10865, 25915, 7674, 21666, 3889, 18020
+23653: DATA 32488, 14750, 28737, 11128, 25120, 6851, 21918, 3240
+23661: DATA 18244, 32304, 14599, 28705, 10459, 25598, 6804, 21930
+23669: DATA 3146, 18206, 32293, 14644, 28716, 11011, 25197, 7469
+23677: DATA 21545, 3952, 17954, 309, 14396, 29476, 10804, 25898
+23685: DATA 7210, 22352, 3587, 18811, 119, 15120, 29278, 11691
+23693: DATA 25744, 8181, 22209, 4156, 19228, 638, 15706, 29947
+23701: DATA 12263, 26298, 8193, 23413, 4700, 19920, 1212, 15991
+23709: DATA 31015, 12528, 27590, 9531, 23672, 6069, 20157, 2091
+23717: DATA 17259, 31440, 13768, 28525, 9957, 25043, 6943, 21153
+23725: DATA 3530, 18224, 32390, 14371, 29520, 10993, 25615, 8164
+23733: DATA 22233, 4184, 19424, 1332, 15498, 30210, 12719, 27492
+23741: DATA 8892, 23603, 6049, 20769, 2228, 16956, 32177, 14141
+23749: DATA 28397, 10263, 25472, 7520, 21750, 3600, 18885, 929
+23757: DATA 15644, 29926, 11856, 26662, 9173, 23935, 5327, 20196
+23765: DATA 2049, 17369, 32162, 14204, 28369, 10389, 25215, 7268
+23773: DATA 22524, 4515, 19253, 1312, 15613, 30389, 12388, 27236
+23781: DATA 9722, 24465, 6473, 21375, 3429, 17617, 32415, 14507
+23789: DATA 29256, 11390, 26129, 8308, 23490, 5625, 20361, 2476
+23797: DATA 17165, 32089, 14193, 28986, 11077, 25936, 7940, 22839
+23805: DATA 4989, 19748, 1853, 16693, 31521, 13680, 28472, 10546
+23813: DATA 25384, 7454, 22341, 4452, 19306, 1347, 16222, 31149
+23821: DATA 13215, 28156, 10192, 24683, 6741, 21552, 3689, 18604
+23829: DATA 648, 15561, 31077, 13159, 27972, 10121, 25005, 6704
+23837: DATA 21621, 3761, 18657, 1396, 16252, 31158, 13245, 27696
+23845: DATA 9829, 24725, 6876, 22324, 4530, 19409, 1025, 16047
+23853: DATA 30877, 13668, 28573, 10278, 25178, 7397, 22810, 5036
+23861: DATA 19853, 1619, 16608, 32102, 14225, 28689, 10916, 26410
+23869: DATA 8701, 23074, 5306, 20795, 3000, 17443, 32509, 15158
+23877: DATA 30120, 11776, 26752, 9589, 24561, 6229, 21193, 4008
+23885: DATA 18436, 700, 16149, 30752, 12957, 28533, 10692, 25316
+23893: DATA 7947, 22997, 4768, 20344, 2437, 17049, 32633, 14436
+23901: DATA 29434, 12213, 26721, 9504, 24572, 6334, 21882, 3684
+23909: DATA 18657, 1433, 15938, 31612, 13361, 28373, 11167, 25828
+23917: DATA 8540, 23166, 5905, 20596, 2777, 18425, 154, 15788
+23925: DATA 30297, 13141, 27767, 10552, 25157, 7954, 22584, 5424
+23933: DATA 20093, 2873, 17441, 372, 14896, 30502, 12344, 27946
+23941: DATA 9785, 25349, 7172, 22904, 4713, 20297, 2061, 17838
+23949: DATA 32392, 15331, 29889, 12404, 27920, 9830, 25436, 7348
+23957: DATA 22914, 4802, 20004, 2912, 17472, 387, 15021, 30245
+23965: DATA 13171, 27828, 10677, 25909, 7733, 23486, 5368, 20531
+23973: DATA 3373, 18079, 971, 16241, 30949, 13777, 28957, 10932
+23981: DATA 26584, 9073, 23687, 6183, 21781, 3825, 18958, 2020
+23989: DATA 16600, 31811, 14832, 30069, 11913, 27230, 10183, 25422
+23997: DATA 7321, 22577, 5548, 20852, 2791, 18017, 999, 16228
+24005: DATA 30851, 13343, 29074, 11572, 26316, 8720, 24526, 7077
+24013: DATA 22291, 4272, 19539, 2097, 17808, 380, 15005, 30384
+24021: DATA 12805, 28629, 11237, 26491, 8407, 23698, 6189, 21543
+24029: DATA 4597, 19889, 2427, 17715, 32508, 15038, 30330, 12900
+24037: DATA 28666, 11157, 26444, 9075, 24365, 6340, 21709, 4261
+24045: DATA 19534, 2096, 17468, 116, 15810, 31217, 13713, 29103
+24053: DATA 11533, 26961, 9591, 24955, 7440, 22814, 5417, 20842
+24061: DATA 3453, 18800, 1308, 16672, 32117, 14644, 30008, 12596
+24069: DATA 27944, 10526, 25857, 8551, 23845, 6495, 21827, 4580
+24077: DATA 19849, 2552, 17872, 116, 15380, 30818, 13400, 28837
+24085: DATA 11469, 26781, 10085, 25440, 8013, 23445, 6061, 21031
+24093: DATA 3701, 19121, 1787, 17715, 368, 15856, 31220, 13367
+24101: DATA 28717, 11398, 26816, 10086, 25532, 8080, 23070, 5809
+24109: DATA 21215, 4452, 19865, 2097, 17429, 249, 16147, 31716
+24117: DATA 14302, 29279, 12008, 28017, 10693, 25600, 8353, 24357
+24125: DATA 7102, 22069, 4774, 20856, 3573, 18482, 1192, 17200
+24133: DATA 32749, 14867, 30336, 13670, 29169, 11345, 26820, 10154
+24141: DATA 25105, 7913, 23829, 6201, 21658, 4962, 20440, 2788
+24149: DATA 18691, 1503, 16561, 32637, 15302, 30357, 13676, 28710
+24157: DATA 11505, 27573, 9781, 25917, 8699, 23792, 7026, 22064
+24165: DATA 4837, 20885, 3159, 19303, 1641, 17040, 392, 15543
+24173: DATA 31565, 13941, 29974, 12349, 27860, 11260, 26257, 9661
+24181: DATA 24589, 8007, 23149, 6513, 21515, 4944, 19972, 3428
+24189: DATA 18474, 1841, 16953, 319, 15477, 31545, 13875, 30000
+24197: DATA 12322, 28496, 10756, 26932, 9335, 25439, 7746, 23977
+24205: DATA 6365, 22503, 4828, 20512, 3869, 18992, 2396, 17636
+24213: DATA 897, 16081, 31799, 15219, 30272, 13698, 28845, 11818
+24221: DATA 28008, 10429, 26615, 9521, 24679, 8176, 23282, 6198
+24229: DATA 22317, 4767, 20944, 3936, 19173, 2527, 18187, 740
+24237: DATA 16860, 32560, 14983, 30779, 14170, 29437, 12381, 28585
+24245: DATA 10956, 26690, 10222, 25969, 8321, 24144, 7658, 23406
+24253: DATA 5882, 21630, 5109, 20852, 3205, 18997, 2479, 18220
+24261: DATA 684, 16384, 32662, 15668, 30962, 13909, 30093, 13223
+24269: DATA 28956, 11518, 27157, 10293, 26518, 9572, 24776, 7845
+24277: DATA 23553, 7132, 22972, 5940, 21190, 4255, 20067, 3120
+24285: DATA 19439, 2495, 18297, 1396, 16609, 32440, 15480, 31332
+24293: DATA 14842, 30613, 13644, 29555, 12589, 27844, 10957, 26795
+24301: DATA 9819, 25648, 8705, 24636, 8156, 24035, 7133, 22953
+24309: DATA 5972, 21827, 4977, 20849, 3863, 19737, 2850, 18737
+24317: DATA 1838, 17776, 826, 16678, 32567, 15727, 31575, 14670
+24325: DATA 30473, 13585, 29468, 12596, 28470, 11524, 27415, 10724
+24333: DATA 26546, 9726, 25552, 8308, 24090, 7286, 23069, 6320
+24341: DATA 22149, 5333, 21861, 4983, 20823, 3989, 19962, 2601
+24349: DATA 18552, 1725, 17655, 1329, 17255, 419, 16317, 31795
+24357: DATA 14956, 30851, 13957, 30563, 13732, 29662, 12297, 28321
+24365: DATA 11471, 28025, 11163, 26675, 9749, 25828, 9493, 25505
+24373: DATA 8589, 24130, 7402, 23931, 7048, 22531, 5869, 22320
+24381: DATA 5554, 21044, 4276, 20781, 4085, 19505, 2739, 19232
+24389: DATA 2541, 17939, 1161, 17781, 1004, 16477, 32456, 16288
+24397: DATA 31837, 15076, 31581, 14389, 30337, 14128, 30153, 12972
+24405: DATA 29448, 12688, 28331, 12129, 28104, 10898, 27496, 10294
+24413: DATA 26350, 10224, 25722, 9530, 25525, 8356, 24949, 7713
+24421: DATA 23725, 7572, 23114, 7035, 22583, 5776, 22411, 5288
+24429: DATA 21852, 4707, 21277, 4145, 20177, 4016, 19594, 3500
+24437: DATA 19012, 2884, 18528, 2356, 17924, 1795, 17517, 1324
+24445: DATA 16952, 880, 16436, 292, 15909, 32546, 15410, 32037
+24453: DATA 14894, 31512, 14336, 31088, 13860, 30480, 13325, 30092
+24461: DATA 12952, 29616, 12486, 28725, 12572, 28276, 12061, 27824
+24469: DATA 11653, 27349, 10853, 27504, 10314, 27039, 9983, 26212
+24477: DATA 10094, 25764, 9724, 25912, 8825, 25584, 8441, 24621
+24485: DATA 8553, 24222, 8066, 24416, 7397, 24031, 7453, 23201
+24493: DATA 7123, 23356, 6357, 22582, 6464, 22244, 5725, 22444
+24501: DATA 5320, 21520, 5611, 21883, 4753, 21017, 5038, 21281
+24509: DATA 4281, 20592, 4513, 20796, 3764, 20004, 4093, 20272
+24517: DATA 3237, 19477, 3525, 19836, 2794, 19013, 3039, 19363
+24525: DATA 2833, 18673, 2118, 18471, 2517, 18808, 1756, 18080
+24533: DATA 1613, 18370, 1968, 18298, 1157, 17567, 1144, 17456
+24541: DATA 1469, 17841, 1403, 17712, 693, 17078, 625, 16933
+24549: DATA 1022, 17304, 832, 17264, 869, 16594, 129, 16549
+24557: DATA 94, 16507, 91, 16500, 405, 16839, 405, 16801
+24565: DATA 323, 16656, 370, 16753, 325, 16647, 296, 16682
+24573: DATA 297, 16752, 289, 16699, 373, 16691, 309, 16673
+24581: DATA 302, 16667, 325, 16763, 363, 16656, 324, 16816
+24589: DATA 465, 16816, 476, 16416, 85, 16487, 92, 16567
+24597: DATA 205, 16579, 817, 17277, 841, 17308, 941, 16950
+24605: DATA 616, 17086, 763, 17725, 1403, 17847, 1469, 17448
+24613: DATA 1124, 17563, 1216, 18228, 1964, 18372, 1613, 18085
+24621: DATA 1745, 18791, 2452, 18477, 2118, 18608, 2841, 19371
+24629: DATA 3016, 19011, 2731, 19764, 3525, 19488, 3240, 20278
+24637: DATA 4021, 20017, 3749, 20775, 4597, 20536, 4280, 21348
+24645: DATA 5028, 20995, 4805, 21875, 5610, 21593, 5315, 22435
+24653: DATA 5725, 22269, 6484, 22576, 6346, 23344, 7069, 23181
+24661: DATA 7435, 23952, 7339, 24443, 8145, 24284, 8493, 24627
+24669: DATA 8437, 25529, 8822, 25916, 9653, 25780, 10098, 26212
+24677: DATA 9978, 27029, 10245, 27514, 10784, 27349, 11657, 27876
+24685: DATA 12105, 28287, 12629, 28725, 12485, 29664, 12952, 30117
+24693: DATA 13406, 30549, 13887, 31028, 14353, 31512, 14888, 32100
+24701: DATA 15417, 32575, 15930, 294, 16501, 831, 16943, 1380
+24709: DATA 17465, 1816, 17920, 2356, 18541, 2911, 19032, 3510
+24717: DATA 19610, 4092, 20180, 4135, 21254, 4655, 21789, 5348
+24725: DATA 22447, 5855, 22577, 7036, 23066, 7674, 23687, 7680
+24733: DATA 24956, 8361, 25525, 9569, 25632, 10218, 26301, 10256
+24741: DATA 27493, 10901, 28037, 12146, 28332, 12738, 29448, 12962
+24749: DATA 30161, 14201, 30352, 14375, 31509, 15089, 31759, 16289
+24757: DATA 32397, 16471, 992, 17760, 1169, 17945, 2467, 19235
+24765: DATA 2813, 19491, 4000, 20775, 4261, 21049, 5566, 22317
+24773: DATA 5794, 22533, 7062, 23866, 7333, 24080, 8674, 25514
+24781: DATA 9496, 25776, 9818, 26674, 11221, 28004, 11477, 28321
+24789: DATA 12288, 29584, 13737, 30587, 14026, 30875, 14952, 31776
+24797: DATA 16317, 433, 17249, 1396, 17656, 1717, 18493, 2594
+24805: DATA 19960, 3998, 20811, 4973, 21861, 5316, 22146, 6304
+24813: DATA 23132, 7273, 24149, 8245, 25563, 9716, 26589, 10672
+24821: DATA 27461, 11605, 28523, 12596, 29443, 13596, 30504, 14643
+24829: DATA 31613, 15679, 32563, 16690, 891, 17776, 1917, 18701
+24837: DATA 2925, 19716, 3853, 20861, 4971, 21851, 5901, 22925
+24845: DATA 7133, 24035, 8148, 24611, 8789, 25713, 9811, 26795
+24853: DATA 10905, 27864, 12576, 29542, 13573, 30623, 14819, 31265
+24861: DATA 15421, 32434, 16633, 1341, 18299, 2491, 19444, 3114
+24869: DATA 20074, 4304, 21188, 5940, 22953, 7129, 23577, 7856
+24877: DATA 24785, 9589, 26581, 10290, 27220, 11491, 28937, 13217
+24885: DATA 30175, 13840, 30961, 15740, 32644, 16414, 749, 18225
+24893: DATA 2478, 18981, 3252, 20792, 5115, 21616, 5885, 23307
+24901: DATA 7615, 24144, 8338, 25973, 10230, 26640, 10948, 28592
+24909: DATA 12381, 29425, 14101, 30776, 15004, 32612, 16841, 680
+24917: DATA 18184, 2448, 19126, 3960, 20938, 4743, 22376, 6198
+24925: DATA 23202, 8176, 24629, 9475, 26608, 10480, 28028, 11830
+24933: DATA 28904, 13776, 30274, 15217, 31793, 16068, 900, 17578
+24941: DATA 2394, 18992, 3863, 20529, 4801, 22500, 6296, 23990
+24949: DATA 7693, 25425, 9329, 26932, 10758, 28447, 12323, 30000
+24957: DATA 13871, 31551, 15417, 312, 16956, 1854, 18490, 3428
+24965: DATA 20025, 4888, 21504, 6452, 23154, 8021, 24644, 9635
+24973: DATA 26261, 11236, 27797, 12347, 29971, 13872, 31561, 15532
+24981: DATA 392, 17040, 1578, 19302, 3143, 20956, 4781, 22053
+24989: DATA 7027, 23732, 8629, 25891, 9840, 27632, 11497, 28716
+24997: DATA 13668, 30366, 15310, 32564, 16561, 1496, 18700, 2736
+25005: DATA 20378, 4963, 21717, 6179, 23901, 7921, 25097, 10212
+25013: DATA 26841, 11352, 29152, 13620, 30347, 14853, 32672, 17190
+25021: DATA 1208, 18466, 3494, 20852, 4788, 22050, 7096, 24420
+25029: DATA 8364, 25628, 10633, 27956, 12004, 29266, 14274, 31665
+25037: DATA 16137, 190, 17429, 2164, 19873, 4472, 21208, 5860
+25045: DATA 23042, 8130, 25511, 10036, 26838, 11396, 28780, 13366
+25053: DATA 31209, 15779, 309, 17717, 1761, 19184, 3689, 21036
+25061: DATA 6120, 23504, 8018, 25457, 10028, 26839, 11397, 28848
+25069: DATA 13341, 30844, 15380, 54, 17872, 2556, 19864, 4512
+25077: DATA 21773, 6495, 23915, 8500, 25873, 10520, 27944, 12644
+25085: DATA 29997, 14645, 32049, 16689, 1318, 18724, 3388, 20776
+25093: DATA 5473, 22864, 7428, 24954, 9569, 26896, 11594, 29099
+25101: DATA 13720, 31203, 15765, 48, 17434, 2151, 19539, 4324
+25109: DATA 21644, 6339, 24421, 9059, 26432, 11216, 28641, 12833
+25117: DATA 30332, 15014, 32496, 17780, 2420, 19952, 4591, 21547
+25125: DATA 6242, 23709, 8325, 26489, 11172, 28610, 12806, 30369
+25133: DATA 15065, 304, 17874, 2169, 19474, 4284, 22365, 7089
+25141: DATA 24541, 8720, 26340, 11623, 29125, 13319, 30888, 16228
+25149: DATA 945, 17973, 2740, 20770, 5552, 22640, 7356, 25444
+25157: DATA 10175, 27167, 11914, 30073, 14757, 31837, 16588, 1974
+25165: DATA 18966, 3829, 21841, 6260, 23762, 9019, 26522, 10984
+25173: DATA 29005, 13777, 30891, 16240, 901, 18053, 3453, 20580
+25181: DATA 5368, 23462, 7792, 25914, 10677, 27837, 13170, 30262
+25189: DATA 15080, 464, 17476, 2919, 20069, 4807, 22920, 7396
+25197: DATA 25425, 9845, 27924, 12322, 29904, 15280, 32412, 17892
+25205: DATA 2143, 20319, 4714, 22905, 7237, 25373, 9772, 27958
+25213: DATA 12342, 30517, 14897, 372, 17522, 2938, 20090, 5482
+25221: DATA 22637, 8016, 25120, 10618, 27761, 13141, 30303, 15789
+25229: DATA 147, 18423, 2709, 20518, 5914, 23167, 8528, 25783
+25237: DATA 11213, 28359, 13356, 31584, 15949, 1488, 18657, 3621
+25245: DATA 21871, 6327, 24560, 9510, 26677, 12222, 29416, 14377
+25253: DATA 32623, 17045, 2519, 20327, 4837, 23000, 7948, 25271
+25261: DATA 10653, 28529, 13013, 30771, 16199, 757, 18460, 4016
+25269: DATA 21192, 6210, 24485, 9585, 26755, 11798, 30120, 15143
+25277: DATA 32425, 17534, 3039, 20830, 5265, 23089, 8612, 26468
+25285: DATA 10997, 28745, 14303, 32052, 16576, 1606, 19912, 5046
+25293: DATA 22788, 7344, 25178, 10298, 28566, 13685, 30877, 16045
+25301: DATA 1027, 19344, 4516, 22324, 6850, 24706, 9832, 27685
+25309: DATA 13289, 31216, 16226, 1340, 18684, 3772, 21624, 6760
+25317: DATA 25005, 10143, 27979, 13169, 31077, 15583, 651, 18660
+25325: DATA 3657, 21624, 6672, 24692, 10198, 28130, 13208, 31155
+25333: DATA 16192, 1365, 19304, 4470, 22272, 7426, 25406, 10596
+25341: DATA 28469, 13617, 31526, 16756, 1825, 19768, 4920, 22884
+25349: DATA 7998, 25873, 11016, 29041, 14117, 32067, 17241, 2475
+25357: DATA 20367, 5609, 23439, 8308, 26113, 11384, 29276, 14512
+25365: DATA 32461, 17604, 3373, 21361, 6405, 24468, 9698, 27179
+25373: DATA 12399, 30448, 15603, 1336, 19316, 4515, 22517, 7201
+25381: DATA 25214, 10448, 28370, 14204, 32172, 17348, 2056, 20200
+25389: DATA 5277, 23908, 9117, 26673, 11797, 29944, 15634, 945
+25397: DATA 18911, 3671, 21737, 7541, 25494, 10243, 28397, 14124
+25405: DATA 32188, 16948, 2293, 20789, 6073, 23586, 8888, 27429
+25413: DATA 12713, 30217, 15557, 1382, 19440, 4190, 22157, 8107
+25421: DATA 25608, 10980, 29465, 14452, 32412, 18276, 3485, 21154
+25429: DATA 6913, 25041, 9910, 28540, 13760, 31363, 17197, 2086
+25437: DATA 20209, 6065, 23670, 9535, 27577, 12528, 31100, 15914
+25445: DATA 1257, 19920, 4689, 23420, 8224, 26256, 12162, 29878
+25453: DATA 15711, 560, 19216, 4130, 22228, 8160, 25746, 11702
+25461: DATA 29260, 15172, 96, 18791, 3659, 22352, 7277, 25861
+25469: DATA 10799, 29493, 14453, 291, 17968, 3952, 21545, 7467
+25477: DATA 25122, 11088, 28694, 14712, 32362, 18247, 3090, 21988
+25485: DATA 6877, 25543, 10448, 28788, 14614, 32369, 18259, 3299
+25493: DATA 21913, 6800, 25142, 11121, 28736, 14749, 32429, 17968
+25501: DATA 3954, 21744, 7667, 25917, 10875, 29620, 14525, 37
+25509: DATA 18733, 3719, 22468, 8045, 25829, 11716, 29954, 15076
+25517: DATA 976, 19313, 4254, 22577, 8469, 26340, 11797, 30625
+25525: DATA 15501, 1119, 19959, 5494, 23234, 8707, 27629, 13107
+25533: DATA 30904, 16441, 2482, 20796, 5793, 24176, 10160, 28453
+25541: DATA 13497, 31763, 17805, 3380, 21234, 6744, 25548, 11184
+25549: DATA 29533, 14564, 93, 18481, 4565, 22900, 7890, 26283
+25557: DATA 11807, 30608, 16306, 1909, 19659, 5252, 23678, 9316
+25565: DATA 28159, 13749, 32115, 17723, 2791, 21173, 6717, 25136
+25573: DATA 11237, 29589, 15109, 892, 19242, 4293, 22687, 8355
+25581: DATA 26705, 12401, 30726, 16423, 2453, 20962, 6536, 25002
+25589: DATA 10590, 28944, 14698, 353, 18705, 4446, 22893, 8548
+25597: DATA 26900, 12598, 31093, 16699, 2363, 20796, 6436, 24932
+25605: DATA 10554, 28949, 14661, 375, 18794, 4421, 22849, 8608
+25613: DATA 27101, 12790, 31196, 16442, 2065, 20528, 6236, 24804
+25621: DATA 10398, 28888, 15146, 870, 19281, 5013, 23551, 8804
+25629: DATA 27247, 12991, 31456, 17696, 3440, 22000, 7657, 25644
+25637: DATA 11391, 29855, 15568, 1907, 20397, 6032, 24089, 9900
+25645: DATA 28376, 14640, 391, 18491, 4186, 22781, 8974, 27626
+25653: DATA 13187, 31262, 17039, 3358, 21921, 7185, 25780, 12132
+25661: DATA 30700, 15972, 1761, 20846, 6645, 24583, 10424, 29540
+25669: DATA 15276, 514, 19072, 5428, 24036, 9298, 27852, 14250
+25677: DATA 32281, 18175, 4443, 22589, 8347, 27511, 13213, 31408
+25685: DATA 17669, 3541, 21733, 8057, 26572, 11907, 31102, 16429
+25693: DATA 2290, 21438, 6715, 25972, 11701, 29854, 16242, 1578
+25701: DATA 20200, 6608, 24650, 11122, 29285, 15045, 1438, 19684
+25709: DATA 5982, 24177, 10523, 28788, 14530, 1023, 19087, 5551
+25717: DATA 23565, 10079, 28272, 14688, 69, 19204, 4645, 23841
+25725: DATA 9341, 28451, 13882, 312, 18464, 4900, 23092, 9515
+25733: DATA 27683, 14160, 32273, 18811, 4133, 23364, 8773, 28065
+25741: DATA 13533, 32736, 18112, 4142, 23311, 8828, 27992, 13546
+25749: DATA 32717, 18064, 4108, 23348, 8786, 28057, 13537, 32296
+25757: DATA 18749, 4284, 23536, 9525, 27747, 14261, 32445, 18480
+25765: DATA 4965, 23193, 9686, 28468, 13999, 479, 19224, 4790
+25773: DATA 24019, 10097, 28313, 14452, 861, 19189, 5135, 24481
+25781: DATA 9869, 28740, 15338, 1332, 19597, 5653, 24993, 11060
+25789: DATA 29437, 15414, 1952, 20768, 6304, 25122, 11704, 30564
+25797: DATA 16044, 2068, 21395, 7537, 25835, 11844, 31192, 17334
+25805: DATA 3352, 21730, 7750, 26744, 13269, 32100, 17621, 3755
+25813: DATA 22552, 9175, 28077, 14132, 32492, 18640, 4716, 23593
+25821: DATA 10173, 29118, 15226, 1312, 19637, 5795, 24680, 10806
+25829: DATA 30184, 16336, 2386, 21372, 7460, 25796, 11981, 30892
+25837: DATA 16984, 3196, 22021, 8308, 27612, 13796, 32733, 18867
+25845: DATA 4932, 23900, 10089, 28980, 15106, 1305, 20283, 6433
+25853: DATA 25459, 11632, 30581, 16659, 2874, 21823, 7993, 26980
+25861: DATA 13089, 32005, 18182, 4479, 23332, 9476, 28492, 14758
+25869: DATA 926, 19956, 6096, 24626, 10770, 29816, 15956, 2222
+25877: DATA 21126, 7388, 26920, 13178, 32074, 18304, 4604, 23094
+25885: DATA 9326, 28324, 14560, 1314, 20322, 6568, 25572, 11326
+25893: DATA 30284, 16562, 2790, 22352, 8576, 27638, 13354, 32396
+25901: DATA 18676, 5466, 24510, 10264, 29304, 15582, 2354, 21396
+25909: DATA 7676, 26210, 12502, 32064, 18352, 4134, 23194, 10012
+25917: DATA 29060, 14858, 1218, 20784, 7095, 25633, 11949, 31539
+25925: DATA 17848, 3609, 22666, 9592, 28669, 14406, 661, 20371
+25933: DATA 6185, 25289, 12128, 30749, 17082, 3921, 23029, 8860
+25941: DATA 28475, 14845, 711, 20339, 6602, 25332, 12129, 30763
+25949: DATA 17138, 4027, 22545, 9532, 28656, 14524, 1389, 20039
+25957: DATA 6372, 26014, 11859, 31504, 17457, 3793, 23430, 9377
+25965: DATA 28985, 14964, 1799, 20539, 6853, 26515, 12424, 32183
+25973: DATA 17992, 4880, 23557, 10516, 29285, 16240, 2125, 21828
+25981: DATA 7773, 27472, 13397, 340, 19029, 5968, 24669, 11588
+25989: DATA 30285, 17264, 3173, 22804, 8709, 28464, 14381, 1476
+25997: DATA 20221, 7056, 25781, 12372, 32117, 17936, 4925, 23748
+26005: DATA 10733, 29360, 15936, 2931, 21591, 8597, 27368, 13866
+26013: DATA 798, 19618, 6640, 25904, 11795, 31657, 17656, 4136
+26021: DATA 23905, 9887, 29650, 16171, 2180, 21955, 8525, 27325
+26029: DATA 14290, 869, 19669, 6193, 25947, 12004, 31256, 18358
+26037: DATA 4237, 23620, 10733, 30065, 16069, 2562, 22434, 9003
+26045: DATA 27824, 14460, 1525, 20768, 6845, 26165, 13309, 32567
+26053: DATA 18612, 5149, 24967, 11643, 30441, 16912, 4034, 23466
+26061: DATA 10077, 28900, 15453, 2097, 21973, 8566, 27345, 13995
+26069: DATA 514, 20418, 7141, 26486, 12503, 31897, 18536, 5154
+26077: DATA 25073, 11689, 31029, 17714, 3833, 23217, 9838, 29228
+26085: DATA 16360, 2947, 22277, 9013, 28523, 14480, 1229, 20624
+26093: DATA 7253, 26741, 13397, 59, 19911, 6642, 26077, 12710
+26101: DATA 32072, 18775, 5484, 24954, 11542, 31056, 17726, 4401
+26109: DATA 23871, 10532, 30009, 16685, 3445, 22839, 9521, 28971
+26117: DATA 15674, 2329, 21771, 8563, 27941, 14623, 1388, 20919
+26125: DATA 7645, 27113, 13786, 33, 19541, 6261, 25683, 12464
+26133: DATA 31880, 18626, 5989, 25440, 12109, 31637, 18349, 4662
+26141: DATA 24178, 10943, 30456, 17784, 4405, 23972, 10741, 29729
+26149: DATA 16429, 3231, 22743, 10102, 29669, 16338, 2591, 22189
+26157: DATA 8920, 29046, 15769, 2093, 21525, 8438, 28433, 15269
+26165: DATA 2014, 21080, 7904, 28007, 14789, 1072, 20707, 8036
+26173: DATA 27645, 13828, 701, 20785, 7669, 26686, 13480, 809
+26181: DATA 20399, 6677, 26263, 13620, 490, 19550, 6285, 26544
+26189: DATA 12821, 32501, 19733, 6194, 25753, 13183, 32722, 19126
+26197: DATA 6477, 26054, 12460, 32630, 19415, 5777, 25977, 12321
+26205: DATA 31982, 19440, 5734, 25888, 12775, 31921, 19315, 5667
+26213: DATA 25320, 12700, 31836, 19252, 5671, 25301, 12675, 31905
+26221: DATA 19292, 5732, 25885, 12404, 31948, 19455, 5768, 26038
+26229: DATA 12301, 32598, 19040, 6513, 25617, 13150, 32338, 19812
+26237: DATA 6269, 26372, 12861, 305, 19573, 6975, 26159, 13606
+26245: DATA 109, 20227, 6656, 26993, 13416, 835, 19981, 7600
+26253: DATA 26770, 14256, 722, 20529, 7937, 27184, 14677, 1185
+26261: DATA 21388, 7878, 27692, 15217, 1623, 21982, 8338, 28260
+26269: DATA 15677, 2180, 22525, 9521, 28725, 16319, 2799, 22566
+26277: DATA 10029, 29315, 16832, 3953, 23208, 10691, 30541, 17072
+26285: DATA 4562, 24368, 10898, 30769, 18241, 4784, 24593, 12205
+26293: DATA 31434, 18520, 6129, 25969, 12439, 32350, 19928, 7012
+26301: DATA 26365, 13316, 957, 20785, 7413, 27199, 14767, 1830
+26309: DATA 21229, 8195, 28557, 15733, 2289, 22084, 9672, 29622
+26317: DATA 16654, 3249, 23103, 10334, 30677, 17745, 4302, 24292
+26325: DATA 11284, 31711, 18864, 5940, 25284, 12416, 32381, 19510
+26333: DATA 7154, 27057, 14198, 1340, 20661, 7844, 27765, 14881
+26341: DATA 2477, 22406, 9540, 29537, 16681, 3268, 23245, 10400
+26349: DATA 30290, 17535, 4615, 24696, 12181, 32187, 19337, 6572
+26357: DATA 26440, 13584, 875, 20833, 7944, 27922, 15144, 2358
+26365: DATA 22397, 9535, 29499, 16756, 3873, 23864, 11064, 31076
+26373: DATA 18235, 5393, 25360, 12664, 32625, 19728, 6985, 27051
+26381: DATA 14226, 1506, 21397, 8242, 28185, 15473, 2638, 22700
+26389: DATA 9864, 29891, 17765, 4982, 24905, 12177, 32238, 18991
+26397: DATA 6195, 26361, 13493, 1396, 21313, 8632, 28664, 15460
+26405: DATA 2658, 22658, 9927, 30516, 17824, 5062, 24588, 11956
+26413: DATA 31954, 19810, 7060, 26656, 13904, 1251, 21853, 9131
+26421: DATA 29144, 15940, 3237, 23931, 11139, 30800, 18100, 5931
+26429: DATA 26024, 12834, 245, 20796, 8116, 27710, 15033, 2871
+26437: DATA 23011, 9850, 29935, 17727, 5105, 24664, 11976, 32740
+26445: DATA 19475, 6885, 27480, 14390, 1680, 22370, 9629, 29355
+26453: DATA 17155, 4496, 24241, 12156, 32192, 19152, 7035, 26661
+26461: DATA 14056, 1980, 21601, 9588, 29681, 16575, 4466, 24118
+26469: DATA 11437, 32150, 19017, 7029, 26678, 14040, 1928, 21687
+26477: DATA 9501, 29287, 17181, 4157, 24257, 12277, 31964, 19879
+26485: DATA 6669, 27408, 14417, 2428, 22016, 10064, 29733, 17707
+26493: DATA 4648, 25378, 12338, 312, 20020, 7971, 27694, 15716
+26501: DATA 2597, 23313, 10262, 31028, 18020, 5980, 25695, 13729
+26509: DATA 668, 21492, 8396, 28788, 16647, 3685, 24403, 11492
+26517: DATA 32130, 19141, 6705, 27450, 14341, 2512, 22212, 9776
+26525: DATA 30525, 17590, 5625, 25909, 12902, 952, 20728, 8247
+26533: DATA 28973, 16018, 4041, 24437, 11430, 32219, 19789, 6821
+26541: DATA 27603, 15220, 2261, 22578, 10585, 30457, 17933, 6071
+26549: DATA 25741, 13407, 1523, 21873, 8855, 29276, 17389, 4918
+26557: DATA 24760, 12323, 417, 20789, 7847, 28196, 16308, 3882
+26565: DATA 23722, 11344, 32145, 19836, 6880, 27152, 15307, 2984
+26573: DATA 23314, 10471, 30741, 18491, 6547, 26928, 14030, 1701
+26581: DATA 22019, 10196, 30699, 18320, 5253, 25808, 13401, 1068
+26589: DATA 22008, 9712, 30077, 17723, 4832, 25250, 12922, 552
+26597: DATA 21484, 9091, 29526, 17204, 4908, 24771, 12493, 183
+26605: DATA 20553, 8313, 28697, 16440, 4501, 25058, 12680, 426
+26613: DATA 20803, 8537, 29035, 16755, 4420, 24912, 12653, 269
+26621: DATA 20777, 8560, 28979, 16696, 4404, 24867, 12597, 289
+26629: DATA 20798, 8528, 28946, 16764, 4460, 24900, 12616, 485
+26637: DATA 20957, 8624, 29164, 16443, 4096, 24624, 12373, 161
+26645: DATA 20620, 8386, 29541, 17269, 4869, 25491, 13281, 557
+26653: DATA 21118, 8891, 29365, 17714, 5479, 26047, 13808, 1124
+26661: DATA 21625, 9368, 29888, 18228, 6067, 26577, 13848, 1704
+26669: DATA 22217, 10544, 31121, 18491, 6234, 26850, 15187, 3044
+26677: DATA 23437, 10852, 31469, 19825, 7621, 27679, 15551, 3878
+26685: DATA 24573, 11829, 32419, 20789, 8613, 28735, 16559, 4901
+26693: DATA 25529, 12821, 662, 21812, 9706, 29765, 17625, 6116
+26701: DATA 26130, 14070, 2325, 22588, 10394, 31589, 19407, 6884
+26709: DATA 27909, 15825, 3243, 24432, 12246, 32478, 20743, 8270
+26717: DATA 28826, 17297, 4710, 25972, 13804, 1215, 22376, 9828
+26725: DATA 30344, 18844, 6208, 27509, 14899, 2773, 24040, 11425
+26733: DATA 32595, 20068, 8464, 28710, 16611, 5040, 25225, 13740
+26741: DATA 1096, 22288, 9847, 31099, 18442, 6941, 27233, 15716
+26749: DATA 3113, 24376, 11824, 372, 20538, 8994, 29247, 17764
+26757: DATA 5160, 26374, 13828, 2404, 22634, 11074, 31308, 19888
+26765: DATA 7320, 28643, 16021, 4155, 25344, 12900, 1309, 21675
+26773: DATA 10123, 30352, 18492, 7035, 27216, 15746, 3245, 24108
+26781: DATA 12668, 190, 21489, 9511, 29748, 18416, 5821, 26637
+26789: DATA 15225, 2768, 24023, 12145, 32424, 20945, 8985, 29345
+26797: DATA 17871, 6009, 26260, 14392, 2908, 23274, 11288, 32695
+26805: DATA 20109, 8287, 29675, 17716, 5260, 26116, 14782, 2916
+26813: DATA 23213, 11317, 32689, 20785, 8358, 29220, 17852, 5928
+26821: DATA 26339, 14458, 3055, 23822, 11473, 32344, 20936, 9188
+26829: DATA 29963, 17649, 5696, 26680, 15233, 3376, 23769, 11947
+26837: DATA 2, 21442, 9701, 30589, 18134, 6352, 27262, 15393
+26845: DATA 4092, 25020, 13168, 1328, 21691, 9946, 30765, 11624
+26853: DATA 31389, 2285, 9853, 29727, 600, 21412, 25075, 16273
+26861: DATA 19761, 6925, 10622, 18264, 5357, 8843, 28906, 3793
+26869: DATA 23589, 27172, 14360, 22040, 25716, 12903, 16475, 7708
+26877: DATA 11334, 31303, 2121, 9801, 29709, 577, 20566, 28166
+26885: DATA 15381, 19024, 6220, 13839, 17468, 4614, 8207, 32464
+26893: DATA 3296, 23177, 26788, 1882, 21887, 25442, 12623, 10438
+26901: DATA 25133, 21624, 8519, 31235, 19511, 6129, 28846, 14917
+26909: DATA 1296, 24274, 10540, 7403, 22295, 8396, 29328, 19526
+26917: DATA 1062, 27329, 17063, 7733, 24786, 15282, 5776, 17856
+26925: DATA 12479, 3126, 24290, 10326, 24997, 22281, 8575, 31471
+26933: DATA 19596, 5681, 29924, 15637, 1749, 24690, 12169, 6669
+26941: DATA 23007, 9066, 30176, 20821, 15982, 29777, 20461, 6982
+26949: DATA 29607, 8223, 4327, 27684, 16058, 2099, 17821, 12531
+26957: DATA 8003, 21139, 11791, 28957, 17329, 7954, 28402, 23885
+26965: DATA 5999, 30309, 9499, 3862, 26846, 15311, 1800, 30763
+26973: DATA 2795, 24492, 28823, 1491, 30608, 16879, 5203, 26391
+26981: DATA 18901, 7341, 26150, 7104, 11423, 32336, 13294, 3479
+26989: DATA 20596, 9054, 32630, 29049, 902, 22185, 18686, 5261
+26997: DATA 26467, 19043, 5121, 18655, 7092, 11943, 16785, 13632
+27005: DATA 3898, 21000, 9500, 2082, 21078, 1401, 23154, 28529
+27013: DATA 7758, 31277, 19719, 4189, 27137, 7678, 13049, 18206
+27021: DATA 5154, 2964, 21977, 14618, 3110, 24422, 11070, 24552
+27029: DATA 29407, 391, 30278, 16967, 5483, 30871, 17036, 13761
+27037: DATA 27420, 13721, 4500, 18054, 13844, 665, 23711, 5211
+27045: DATA 8488, 22258, 8950, 30298, 20679, 283, 24029, 19142
+27053: DATA 5693, 31316, 17655, 15537, 18911, 16018, 6918, 28225
+27061: DATA 14511, 10543, 17569, 13590, 3941, 21498, 12239, 9951
+27069: DATA 29053, 10322, 29776, 22747, 8919, 20724, 28020, 8006
+27077: DATA 31047, 19940, 6631, 19071, 6644, 4658, 28212, 12875
+27085: DATA 3961, 18483, 7324, 8443, 30017, 12564, 2850, 24400
+27093: DATA 9161, 30238, 21440, 9759, 31146, 19939, 8468, 30043
+27101: DATA 18840, 7632, 28949, 17748, 5781, 27344, 15900, 15139
+27109: DATA 26508, 12905, 3879, 19178, 7494, 2226, 21828, 14685
+27117: DATA 1084, 29337, 11380, 2544, 21943, 726, 22196, 20934
+27125: DATA 11422, 28841, 19716, 2794, 30052, 16606, 7500, 23644
+27133: DATA 17756, 4333, 27988, 27795, 5460, 24808, 15710, 16187
+27141: DATA 19401, 6137, 3430, 26835, 15561, 225, 23855, 7768
+27149: DATA 10844, 22930, 9335, 2437, 21623, 6320, 19608, 20678
+27157: DATA 11567, 29030, 20294, 4758, 18093, 31358, 8078, 31647
+27165: DATA 20447, 4870, 28310, 30538, 11057, 24570, 16798, 7583
+27173: DATA 25025, 13601, 4263, 21554, 2281, 4018, 27533, 16149
+27181: DATA 2751, 21872, 403, 2134, 21968, 14667, 1919, 28342
+27189: DATA 6869, 562, 24431, 9460, 487, 25113, 7842, 32582
+27197: DATA 23090, 12213, 31447, 26538, 4817, 30802, 17705, 10926
+27205: DATA 30670, 29227, 9860, 19827, 18822, 5582, 31042, 20029
+27213: DATA 6780, 22453, 17716, 4512, 27895, 31409, 11802, 27334
+27221: DATA 19282, 7236, 26823, 1325, 10651, 26354, 14085, 6739
+27229: DATA 25758, 258, 13506, 24457, 14742, 1757, 26881, 15431
+27237: DATA 2702, 23198, 3926, 12397, 24134, 14498, 972, 22220
+27245: DATA 13118, 14992, 25075, 3295, 1206, 20918, 9456, 3991
+27253: DATA 22574, 4655, 16160, 25662, 11366, 2419, 23633, 10095
+27261: DATA 89, 27372, 6039, 15507, 27032, 11092, 29781, 24421
+27269: DATA 8829, 30055, 21089, 6005, 16994, 27996, 6239, 32192
+27277: DATA 23280, 11702, 28800, 23112, 10102, 17683, 28212, 7115
+27285: DATA 31726, 17570, 11903, 28981, 20006, 6736, 18219, 29167
+27293: DATA 9502, 29383, 17829, 12139, 30737, 4079, 25304, 14350
+27301: DATA 3933, 8948, 29625, 17697, 10369, 29595, 20329, 25125
+27309: DATA 14682, 4092, 25095, 30800, 17684, 10410, 29236, 17908
+27317: DATA 8878, 14774, 3593, 25734, 30950, 17494, 12163, 29041
+27325: DATA 20190, 26218, 14741, 4881, 9430, 28795, 23449, 11962
+27333: DATA 31438, 4775, 25912, 16374, 20614, 11264, 30692, 23035
+27341: DATA 10622, 16357, 4430, 27604, 32758, 24357, 8947, 29824
+27349: DATA 21615, 28577, 17874, 22294, 8351, 2745, 22028, 26803
+27357: DATA 924, 21442, 12055, 16597, 7452, 11986, 3648, 20505
+27365: DATA 12687, 16893, 6964, 13078, 807, 22226, 13038, 20157
+27373: DATA 6208, 29330, 2678, 27187, 15826, 2039, 25597, 14788
+27381: DATA 3901, 28508, 12661, 7008, 27933, 14092, 6605, 25536
+27389: DATA 13781, 8156, 25029, 19392, 7629, 26612, 18933, 5080
+27397: DATA 26093, 17783, 32306, 5198, 8794, 30804, 5701, 11433
+27405: DATA 31375, 30103, 18200, 11200, 31600, 16690, 12149, 30052
+27413: DATA 17181, 9377, 15536, 4796, 26802, 15982, 5126, 27547
+27421: DATA 16774, 5952, 27978, 17618, 6789, 28762, 17986, 7647
+27429: DATA 29597, 18736, 8016, 14082, 28260, 39, 23520, 27932
+27437: DATA 1846, 24205, 28776, 2956, 23971, 30471, 3749, 8271
+27445: DATA 31264, 3499, 10005, 32460, 4212, 11260, 32080, 5329
+27453: DATA 11787, 16802, 30927, 4140, 26355, 15690, 5062, 27224
+27461: DATA 16600, 6001, 28087, 17417, 6801, 29026, 18358, 7896
+27469: DATA 30075, 19335, 8757, 31043, 20468, 9750, 31983, 21470
+27477: DATA 10874, 176, 22482, 11868, 1245, 6849, 27316, 20884
+27485: DATA 1801, 28239, 21899, 15491, 25105, 18688, 12440, 26586
+27493: DATA 19737, 13413, 7079, 17047, 10689, 7969, 18035, 11600
+27501: DATA 5366, 31680, 8945, 2518, 32572, 9792, 3370, 29788
+27509: DATA 23480, 684, 27013, 20675, 1973, 28390, 21970, 15558
+27517: DATA 25485, 19145, 12747, 6359, 20433, 14034, 7640, 17623
+27525: DATA 11209, 4841, 31226, 8330, 6022, 32494, 9687, 5180
+27533: DATA 19452, 25234, 14775, 20818, 26642, 16221, 22128, 28144
+27541: DATA 1263, 23464, 29448, 2580, 8489, 30948, 4032, 10052
+27549: DATA 32277, 5583, 11421, 17493, 6913, 12957, 18903, 24901
+27557: DATA 14351, 20466, 26275, 15966, 21896, 27817, 1135, 23433
+27565: DATA 29365, 2565, 8697, 31060, 4145, 10131, 32629, 5769
+27573: DATA 11700, 17717, 7309, 13401, 19450, 25458, 15055, 21060
+27581: DATA 27036, 285, 22743, 28747, 1944, 24388, 30431, 3676
+27589: DATA 9600, 32112, 5353, 11264, 17352, 7034, 12972, 19142
+27597: DATA 25215, 14742, 20856, 26885, 235, 22536, 28594, 1987
+27605: DATA 24421, 30398, 3804, 9799, 32239, 5565, 11592, 17754
+27613: DATA 7301, 13534, 19472, 25625, 15257, 21454, 27472, 782
+27621: DATA 23180, 29426, 2599, 8722, 31240, 4542, 10728, 16840
+27629: DATA 6457, 12559, 18751, 24848, 14584, 20617, 26879, 137
+27637: DATA 22565, 28709, 2057, 8212, 30817, 4211, 10309, 16393
+27645: DATA 6211, 12370, 18517, 24668, 14412, 20565, 26713, 71
+27653: DATA 22599, 28733, 2171, 8201, 30733, 4158, 10281, 16591
+27661: DATA 6393, 12446, 18678, 24883, 14719, 20754, 26970, 393
+27669: DATA 22944, 29060, 2631, 8716, 31336, 4848, 10881, 17232
+27677: DATA 6992, 13210, 19359, 25686, 15448, 21633, 27797, 1361
+27685: DATA 23817, 30185, 3574, 9822, 32392, 5801, 12143, 18313
+27693: DATA 8100, 14351, 20729, 26959, 317, 22929, 29232, 2752
+27701: DATA 8878, 31613, 5020, 11281, 17641, 7529, 13696, 20045
+27709: DATA 26329, 16207, 22493, 28762, 2252, 8532, 31199, 4679
+27717: DATA 10880, 17205, 7163, 13324, 19595, 25909, 15840, 22216
+27725: DATA 28515, 2013, 8319, 31070, 4599, 10845, 17063, 7116
+27733: DATA 13427, 19625, 25999, 15952, 22244, 28605, 2063, 8539
+27741: DATA 31184, 4804, 11031, 17484, 7384, 13776, 19985, 26448
+27749: DATA 16320, 22768, 28973, 2571, 9037, 31665, 5369, 11657
+27757: DATA 18039, 8001, 14461, 20801, 27057, 649, 23470, 29838
+27765: DATA 3424, 9845, 32539, 6156, 12651, 19061, 25344, 15432
+27773: DATA 21827, 28189, 1823, 8270, 31069, 4686, 11076, 17422
+27781: DATA 7433, 13875, 20226, 26640, 262, 23083, 29514, 3209
+27789: DATA 9648, 32425, 6071, 12569, 19051, 25368, 15413, 21897
+27797: DATA 28404, 1973, 8525, 31321, 4907, 11506, 17806, 8029
+27805: DATA 14357, 20947, 27276, 1098, 23896, 30418, 3990, 10505
+27813: DATA 16921, 7154, 13501, 19979, 26504, 180, 23150, 29663
+27821: DATA 3253, 9747, 32748, 6486, 12842, 19332, 25916, 16009
+27829: DATA 22445, 28984, 2714, 9244, 32228, 5988, 12416, 18958
+27837: DATA 25561, 15699, 22222, 28702, 2454, 9015, 31940, 5704
+27845: DATA 12235, 18808, 25218, 15449, 21960, 28420, 2223, 8924
+27853: DATA 31792, 5520, 12089, 18752, 25272, 15450, 21924, 28616
+27861: DATA 2411, 8888, 31880, 5701, 12193, 18921, 25349, 15684
+27869: DATA 22222, 28826, 2648, 9233, 32139, 6088, 12563, 19265
+27877: DATA 25792, 16124, 22587, 29273, 3087, 9641, 32737, 6594
+27885: DATA 13109, 19805, 26484, 344, 23210, 29850, 3829, 10377
+27893: DATA 16946, 7218, 13835, 20498, 27183, 1076, 24078, 30755
+27901: DATA 4692, 11343, 18007, 24649, 14898, 21533, 28176, 2173
+27909: DATA 8783, 31805, 5740, 12299, 18951, 25645, 15968, 22746
+27917: DATA 29439, 3216, 9917, 16717, 7024, 13588, 20286, 27086
+27925: DATA 928, 23988, 30790, 4697, 11313, 18162, 24725, 15195
+27933: DATA 21840, 28628, 2454, 9295, 32285, 6355, 12932, 19782
+27941: DATA 26386, 484, 23524, 30297, 4305, 10930, 17781, 8073
+27949: DATA 14781, 21532, 28385, 2329, 9087, 32153, 6242, 12998
+27957: DATA 19632, 26493, 468, 23568, 30460, 4472, 11213, 17943
+27965: DATA 24727, 15123, 21938, 28748, 2763, 9560, 32698, 6665
+27973: DATA 13440, 20292, 27111, 1036, 24264, 31024, 5025, 11984
+27981: DATA 18736, 25500, 15931, 22861, 29681, 3595, 10417, 17373
+27989: DATA 7781, 14589, 21447, 28171, 2280, 9202, 32276, 6465
+27997: DATA 13205, 20175, 26895, 1104, 24203, 31192, 5200, 12104
+28005: DATA 18832, 25837, 16164, 23040, 29960, 4028, 10990, 17801
+28013: DATA 24633, 15113, 22141, 29012, 3064, 9866, 16889, 7389
+28021: DATA 14120, 21117, 27983, 2060, 9083, 32376, 6400, 13333
+28029: DATA 20313, 27209, 1373, 8276, 31494, 5658, 12574, 19491
+28037: DATA 18013, 27463, 13412, 4367, 31257, 18302, 8234, 3524
+28045: DATA 22245, 13211, 7349, 30798, 17780, 11788, 2858, 21648
+28053: DATA 12681, 21175, 14575, 7563, 29360, 22379, 3101, 24724
+28061: DATA 17897, 11467, 14523, 21580, 3863, 10887, 17817, 24918
+28069: DATA 7199, 14247, 21180, 3596, 10642, 17588, 24687, 7120
+28077: DATA 13986, 21063, 3563, 10583, 17447, 32650, 6954, 14043
+28085: DATA 20927, 3381, 10391, 17485, 32664, 10873, 12785, 21838
+28093: DATA 2762, 11864, 17373, 26441, 7369, 12294, 21935, 16230
+28101: DATA 2159, 25828, 16747, 15823, 5661, 29354, 12088, 2840
+28109: DATA 26610, 16459, 15528, 6342, 30048, 20879, 2662, 26187
+28117: DATA 17150, 16170, 6986, 30671, 20535, 3173, 26838, 17606
+28125: DATA 8457, 7518, 31132, 21903, 3614, 27210, 18053, 8916
+28133: DATA 8024, 31489, 18183, 29870, 10441, 3878, 25390, 18244
+28141: DATA 15295, 8093, 29617, 22467, 2678, 28181, 17015, 9801
+28149: DATA 6826, 32499, 21138, 13983, 27367, 20199, 8846, 1742
+28157: DATA 31440, 24211, 13007, 5848, 19139, 11969, 670, 26327
+28165: DATA 23247, 16112, 4845, 30425, 10988, 22801, 16663, 26056
+28173: DATA 6635, 15827, 20919, 29765, 10355, 19485, 24697, 1235
+28181: DATA 14510, 23712, 29523, 5893, 19235, 28595, 902, 9800
+28189: DATA 23049, 32403, 4738, 12632, 21846, 2502, 11661, 16450
+28197: DATA 25678, 6375, 15534, 21270, 30674, 11261, 19972, 5851
+28205: DATA 25624, 18307, 15228, 7816, 29345, 22029, 2551, 27997
+28213: DATA 16753, 9390, 6172, 31629, 24439, 12972, 5716, 18905
+28221: DATA 11605, 201, 25671, 18312, 15179, 7893, 29185, 21977
+28229: DATA 2321, 27883, 16491, 9117, 1820, 31458, 24155, 10234
+28237: DATA 29120, 11526, 20130, 27609, 1902, 8322, 23590, 31070
+28245: DATA 6835, 13857, 21333, 3274, 10287, 17766, 26262, 922
+28253: DATA 16148, 22607, 30087, 5830, 12875, 28481, 2181, 9626
+28261: DATA 16668, 25184, 8126, 14538, 21972, 28968, 4659, 20302
+28269: DATA 26795, 1419, 9899, 17370, 32554, 6173, 13680, 22107
+28277: DATA 29620, 11435, 18828, 27275, 2018, 8445, 23967, 32410
+28285: DATA 7130, 13505, 20958, 29322, 12248, 18635, 26054, 1664
+28293: DATA 9145, 23684, 31163, 6858, 14299, 20718, 32302, 29552
+28301: DATA 17590, 13992, 29342, 15269, 17540, 25010, 681, 12106
+28309: DATA 18486, 5439, 14303, 20612, 32187, 7723, 15128, 17872
+28317: DATA 26258, 846, 11342, 20160, 27528, 13323, 20754, 29655
+28325: DATA 7327, 14712, 23166, 25742, 336, 8751, 19638, 26964
+28333: DATA 2595, 21646, 29054, 5007, 15545, 22794, 31722, 1108
+28341: DATA 8511, 17317, 27673, 3777, 11028, 30081, 32216, 13156
+28349: DATA 24257, 31813, 7125, 14592, 17605, 25163, 454, 12098
+28357: DATA 19097, 26733, 14306, 21824, 28829, 7723, 15802, 23515
+28365: DATA 31084, 1152, 8815, 16426, 2030, 22326, 29357, 11470
+28373: DATA 20018, 27049, 3027, 9477, 16574, 25263, 7179, 15956
+28381: DATA 22935, 31709, 5401, 14158, 21126, 3273, 11842, 18508
+28389: DATA 27520, 1510, 10030, 16642, 25428, 7848, 14514, 23193
+28397: DATA 17982, 2140, 32170, 20808, 16262, 31831, 6712, 14414
+28405: DATA 22182, 29941, 4756, 12441, 20197, 27829, 2780, 10432
+28413: DATA 18138, 25817, 725, 8389, 32414, 7317, 15000, 22769
+28421: DATA 30413, 5351, 13032, 20624, 28304, 3238, 10984, 18504
+28429: DATA 26220, 1106, 8739, 16785, 8163, 15770, 23477, 31044
+28437: DATA 5928, 13630, 21705, 29343, 4260, 11829, 19463, 27591
+28445: DATA 2520, 10070, 17695, 25813, 661, 8202, 32370, 7595
+28453: DATA 23093, 18136, 26811, 2320, 11156, 19879, 28277, 4313
+28461: DATA 12960, 21313, 30205, 5706, 14385, 23187, 31532, 7641
+28469: DATA 16317, 24623, 640, 8960, 17894, 26223, 2204, 10562
+28477: DATA 19397, 27733, 3788, 12037, 20939, 29256, 5312, 13595
+28485: DATA 22428, 30753, 6877, 15121, 24020, 32306, 8377, 16848
+28493: DATA 25185, 1170, 9572, 18001, 26859, 2369, 11183, 19677
+28501: DATA 28025, 4004, 12486, 20805, 29601, 5361, 13661, 22079
+28509: DATA 30950, 26602, 20266, 11869, 2182, 27537, 18967, 5454
+28517: DATA 30667, 22270, 12578, 4100, 29510, 24054, 15615, 8141
+28525: DATA 32379, 22800, 14458, 7004, 26039, 17622, 10216, 1741
+28533: DATA 24870, 16435, 8983, 538, 28010, 19576, 12108, 3586
+28541: DATA 26959, 18521, 11027, 2626, 21830, 13378, 5915, 30294
+28549: DATA 20803, 12403, 4899, 29213, 23818, 15418, 8043, 32459
+28557: DATA 23029, 14466, 7100, 31506, 23157, 9503, 1065, 26577
+28565: DATA 18175, 8696, 297, 24696, 18492, 22977, 30346, 5721
+28573: DATA 14165, 21716, 30100, 5467, 12821, 21452, 28885, 4181
+28581: DATA 12554, 28397, 4031, 12124, 19649, 28089, 3435, 10968
+28589: DATA 19376, 27402, 2291, 10258, 18775, 26354, 30308, 20206
+28597: DATA 11697, 3382, 27862, 19459, 11257, 2934, 27341, 19026
+28605: DATA 10638, 2394, 26825, 18514, 14292, 5891, 30402, 22102
+28613: DATA 13776, 5495, 29939, 21525, 13208, 4973, 29396, 21181
+28621: DATA 11095, 444, 24879, 16724, 8359, 23, 28589, 20369
+28629: DATA 12150, 3754, 28356, 20033, 11683, 3568, 27914, 19796
+28637: DATA 11464, 3282, 27656, 19520, 11156, 2949, 27420, 19294
+28645: DATA 10968, 2785, 27199, 19009, 10823, 2476, 27116, 18905
+28653: DATA 10600, 2321, 26984, 18756, 10464, 2182, 26855, 18648
+28661: DATA 10294, 2155, 26746, 16666, 16323, 8160, 32711, 24475
+28669: DATA 16338, 8131, 32715, 24520, 16335, 8079, 32726, 24531
+28677: DATA 16343, 8111, 24955, 27868, 3204, 11446, 19633, 27715
+28685: DATA 3125, 11276, 19509, 28121, 3517, 11668, 19888, 27978
+28693: DATA 3441, 11573, 20162, 28303, 3769, 11832, 19978, 28636
+28701: DATA 3984, 12118, 20317, 26831, 2193, 10327, 18433, 27010
+28709: DATA 2543, 1202, 13571, 5760, 30210, 22062, 14309, 5974
+28717: DATA 30586, 22663, 14462, 6610, 31153, 22802, 15034, 6743
+28725: DATA 31266, 23474, 15170, 7327, 31843, 24036, 15710, 7811
+28733: DATA 32345, 24536, 16219, 221, 24606, 16791, 8526, 715
+28741: DATA 25167, 17390, 8994, 1170, 25616, 17842, 9578, 1602
+28749: DATA 26614, 18203, 10482, 2497, 26999, 19099, 10815, 2882
+28757: DATA 27897, 19506, 11590, 3795, 28205, 20345, 20638, 12748
+28765: DATA 4442, 29251, 21402, 13526, 5202, 30033, 22166, 14284
+28773: DATA 5893, 30821, 23020, 15097, 18951, 23186, 32253, 7303
+28781: DATA 16167, 24092, 24931, 23, 8358, 17311, 25343, 1476
+28789: DATA 9259, 18291, 26130, 2335, 10339, 19251, 27202, 3398
+28797: DATA 11341, 20295, 28182, 29012, 4185, 13146, 21072, 29963
+28805: DATA 5134, 14186, 22121, 30978, 6214, 15163, 23083, 32198
+28813: DATA 7404, 16339, 24247, 24599, 885, 8735, 17719, 25796
+28821: DATA 2021, 9971, 18496, 27397, 2601, 11774, 19662, 28243
+28829: DATA 28950, 4310, 13270, 21849, 29721, 6081, 13962, 22607
+28837: DATA 31566, 6903, 15785, 24344, 32468, 509, 8964, 12909
+28845: DATA 7433, 32709, 24179, 12501, 5042, 29188, 21734, 14166
+28853: DATA 5693, 2281, 27472, 19844, 11388, 3808, 24923, 17349
+28861: DATA 8794, 1226, 26446, 22984, 14403, 6789, 32094, 24542
+28869: DATA 15953, 4326, 29557, 21953, 13337, 5814, 2424, 27457
+28877: DATA 19962, 11274, 3754, 24772, 17251, 9617, 1069, 26197
+28885: DATA 22712, 15148, 7518, 32661, 24127, 12325, 4737, 29918
+28893: DATA 22301, 18775, 11200, 3532, 27657, 20043, 8332, 651
+28901: DATA 25970, 18191, 14832, 7105, 32146, 23568, 15990, 4164
+28909: DATA 29371, 21648, 14049, 10445, 2912, 27926, 20333, 8517
+28917: DATA 940, 26028, 18334, 14726, 7088, 32225, 24541, 12741
+28925: DATA 5069, 30150, 22484, 18884, 11204, 3460, 28552, 16785
+28933: DATA 9195, 1521, 26609, 22931, 15236, 7596, 32694, 20822
+28941: DATA 13096, 5382, 30511, 26831, 19174, 11404, 3770, 24668
+28949: DATA 17017, 9265, 6617, 31630, 23998, 16165, 4360, 29379
+28957: DATA 21639, 13894, 10245, 3538, 28563, 16644, 9032, 1169
+28965: DATA 26301, 22646, 14884, 8072, 29021, 21284, 13548, 5716
+28973: DATA 2092, 28101, 20340, 8392, 685, 25600, 22952, 15173
+28981: DATA 7479, 32485, 20499, 13710, 6013, 2293, 27220, 20436
+28989: DATA 8540, 716, 25679, 22991, 15130, 7301, 32281, 21393
+28997: DATA 13658, 5868, 2172, 28045, 20249, 8362, 566, 26385
+29005: DATA 22769, 14848, 8097, 28883, 21107, 14283, 10602, 2619
+29013: DATA 28562, 18770, 24168, 31631, 1316, 9764, 17294, 27857
+29021: DATA 3586, 11073, 13505, 20949, 29457, 7172, 14726, 23262
+29029: DATA 25689, 357, 8945, 20371, 26832, 2602, 6013, 12361
+29037: DATA 24041, 32390, 7140, 9409, 17954, 25356, 3113, 10567
+29045: DATA 19120, 22448, 28825, 7616, 16112, 23460, 25802, 476
+29053: DATA 8896, 20419, 26825, 30164, 5761, 13260, 23756, 31185
+29061: DATA 6877, 10213, 16626, 28040, 3732, 11242, 13561, 20752
+29069: DATA 29277, 7948, 14372, 17536, 25069, 645, 12218, 18500
+29077: DATA 21817, 30256, 4825, 16265, 22719, 25955, 1625, 8905
+29085: DATA 20358, 26705, 30017, 4562, 12932, 24393, 30732, 1245
+29093: DATA 8603, 16993, 28451, 3008, 5208, 12599, 23993, 32337
+29101: DATA 6954, 10128, 16488, 27862, 2464, 10768, 14048, 21342
+29109: DATA 31806, 6372, 9477, 16776, 25200, 3824, 11033, 14276
+29117: DATA 20556, 31944, 6468, 9680, 17998, 25302, 3933, 11221
+29125: DATA 13387, 20650, 32063, 6606, 14929, 18086, 25388, 3908
+29133: DATA 11177, 13322, 20654, 31959, 6433, 9629, 17958, 25157
+29141: DATA 3769, 11047, 14160, 21390, 31862, 6256, 9433, 16598
+29149: DATA 27904, 2378, 5509, 12672, 21000, 32336, 6857, 9937
+29157: DATA 17175, 28541, 2982, 6024, 13268, 23606, 30844, 1040
+29165: DATA 8352, 19594, 26785, 29913, 4398, 15633, 22907, 25872
+29173: DATA 425, 11685, 18834, 21899, 29119, 7588, 14745, 17891
+29181: DATA 25030, 3529, 10692, 13775, 20943, 32193, 6537, 9667
+29189: DATA 16860, 28129, 2556, 5523, 12753, 23984, 31158, 1296
+29197: DATA 8545, 19717, 26935, 29893, 4257, 15488, 22715, 25681
+29205: DATA 110, 11306, 19345, 22401, 29681, 8041, 15132, 18115
+29213: DATA 25242, 3653, 10758, 12741, 24001, 31053, 1287, 8336
+29221: DATA 19597, 26732, 29748, 5056, 16194, 23333, 26359, 596
+29229: DATA 11881, 13708, 20836, 31954, 6308, 9310, 17283, 28474
+29237: DATA 2937, 5860, 12881, 22976, 4582, 16302, 18031, 27713
+29245: DATA 9031, 4267, 31790, 18412, 9040, 3713, 27214, 30160
+29253: DATA 20827, 15592, 6266, 25494, 20308, 10933, 13875, 4373
+29261: DATA 31998, 22528, 9133, 3787, 27178, 30145, 20844, 15457
+29269: DATA 2036, 25380, 19988, 10632, 13617, 4210, 31631, 18132
+29277: DATA 8715, 3396, 26820, 29650, 24325, 14930, 1412, 24784
+29285: DATA 19471, 22305, 12981, 7570, 30933, 17464, 12082, 2581
+29293: DATA 5612, 28856, 23531, 9936, 612, 27925, 18541, 21342
+29301: DATA 16057, 6625, 25749, 20421, 10992, 13796, 4313, 31685
+29309: DATA 18060, 8643, 3286, 6080, 29381, 24021, 14532, 917
+29317: DATA 28381, 18927, 21744, 16325, 6802, 26020, 16569, 11097
+29325: DATA 13868, 4359, 31789, 18135, 8681, 3213, 6069, 29205
+29333: DATA 23931, 14387, 731, 28048, 18618, 21349, 15897, 6353
+29341: DATA 25548, 20040, 10506, 13189, 7830, 31044, 17421, 11993
+29349: DATA 2453, 5237, 32557, 22981, 9301, 3890, 27068, 29761
+29357: DATA 24356, 14724, 1060, 28352, 18850, 21511, 16105, 6486
+29365: DATA 25640, 20146, 10580, 13194, 7794, 30881, 17224, 11741
+29373: DATA 2121, 4737, 32080, 18368, 8776, 3268, 5980, 29146
+29381: DATA 23630, 9973, 373, 27537, 30237, 20654, 15154, 1301
+29389: DATA 28667, 18948, 21669, 16087, 6436, 25486, 20010, 10323
+29397: DATA 12978, 7499, 26430, 22404, 22931, 17319, 25865, 3911
+29405: DATA 12440, 23238, 31756, 26180, 2951, 11659, 22346, 31062
+29413: DATA 25238, 1250, 11825, 20503, 31296, 8104, 500, 11226
+29421: DATA 19753, 30535, 6516, 844, 9387, 20100, 28911, 6803
+29429: DATA 15411, 9780, 18514, 29203, 5216, 15976, 8272, 19030
+29437: DATA 27721, 5715, 14407, 8775, 17410, 28238, 4164, 14919
+29445: DATA 23637, 17959, 26731, 4620, 13319, 24117, 16506, 27358
+29453: DATA 3299, 13961, 22694, 17177, 25864, 3949, 12650, 23443
+29461: DATA 32184, 26506, 3675, 12304, 23089, 31974, 26262, 2394
+29469: DATA 13064, 21973, 32643, 26199, 2059, 13000, 21636, 32531
+29477: DATA 24862, 3042, 11686, 21510, 32465, 24755, 2943, 11735
+29485: DATA 22507, 32327, 24738, 2914, 11552, 22408, 32376, 24775
+29493: DATA 2739, 11561, 22421, 32323, 24806, 2914, 11734, 21590
+29501: DATA 32474, 24904, 3024, 12887, 21699, 32595, 25027, 2140
+29509: DATA 13012, 21798, 32688, 26217, 2296, 13065, 21941, 31943
+29517: DATA 26466, 2446, 12332, 23364, 32162, 25602, 3750, 12736
+29525: DATA 22655, 17127, 26049, 3078, 14007, 23018, 16393, 27411
+29533: DATA 3486, 13512, 24386, 17995, 26755, 5079, 14874, 23894
+29541: DATA 18324, 28329, 4440, 14441, 16432, 32658, 22265, 11722
+29549: DATA 1126, 6922, 29293, 18779, 12199, 1693, 7655, 29899
+29557: DATA 19251, 8811, 14602, 4103, 30587, 20011, 9538, 15450
+29565: DATA 4938, 27214, 16734, 22592, 16220, 5727, 27971, 17485
+29573: DATA 23319, 12843, 2366, 24622, 18189, 24171, 13615, 3280
+29581: DATA 25587, 31435, 20925, 10591, 103, 26393, 32295, 21971
+29589: DATA 11446, 959, 6998, 29213, 18737, 8446, 1937, 8023
+29597: DATA 30278, 19935, 9351, 15426, 4875, 27275, 16775, 22865
+29605: DATA 12306, 6059, 28333, 17951, 24031, 13480, 3187, 25491
+29613: DATA 31462, 21010, 10721, 346, 6254, 32671, 22382, 11990
+29621: DATA 1464, 7456, 29918, 19478, 9201, 15230, 4758, 27212
+29629: DATA 16835, 22862, 12430, 2126, 28558, 18267, 24263, 13899
+29637: DATA 3522, 25966, 31980, 21505, 11230, 802, 6840, 29343
+29645: DATA 19058, 8579, 14635, 4367, 26877, 16415, 10151, 16333
+29653: DATA 5989, 28389, 18064, 24129, 13780, 3457, 25942, 32031
+29661: DATA 21702, 11403, 23830, 15733, 23161, 660, 31300, 19499
+29669: DATA 26082, 7636, 13606, 11525, 17733, 32423, 5800, 3776
+29677: DATA 9848, 24083, 30325, 28230, 2032, 16280, 22519, 20428
+29685: DATA 26413, 7995, 14100, 12034, 18220, 32565, 5969, 3918
+29693: DATA 10061, 24341, 30550, 28504, 1886, 16209, 22296, 20312
+29701: DATA 26439, 8032, 14194, 12034, 18181, 32569, 5934, 3969
+29709: DATA 10234, 24468, 30643, 28250, 1584, 15898, 22070, 20097
+29717: DATA 26363, 7866, 13644, 11544, 17700, 32181, 5519, 3155
+29725: DATA 9239, 23744, 29854, 27477, 848, 15316, 21398, 19013
+29733: DATA 25160, 6900, 13024, 10525, 16841, 31137, 4220, 2253
+29741: DATA 8381, 22357, 20468, 26200, 7715, 13978, 11626, 17864
+29749: DATA 32173, 5179, 3220, 8980, 23524, 29243, 27298, 299
+29757: DATA 5989, 31341, 25310, 21829, 15761, 9299, 3288, 30554
+29765: DATA 24524, 17972, 12008, 4382, 31125, 24635, 18665, 13268
+29773: DATA 6769, 657, 30065, 23645, 17656, 12038, 6059, 32463
+29781: DATA 24955, 18936, 12417, 6929, 943, 27376, 23881, 17497
+29789: DATA 11414, 6081, 32337, 24899, 18836, 12497, 7001, 601
+29797: DATA 27270, 24033, 17459, 12035, 5700, 32440, 25071, 18560
+29805: DATA 13118, 6677, 3435, 29785, 23743, 18323, 11961, 4546
+29813: DATA 30760, 25399, 18954, 15710, 9249, 3892, 30315, 22869
+29821: DATA 16461, 11028, 4678, 1361, 27736, 22336, 15896, 8448
+29829: DATA 2057, 29533, 23157, 19792, 13325, 7995, 1574, 27083
+29837: DATA 20714, 15316, 8893, 5209, 32634, 26129, 18809, 12499
+29845: DATA 7142, 697, 29764, 24351, 17967, 10737, 4297, 31319
+29853: DATA 27915, 21723, 16261, 8533, 2129, 29659, 23191, 19456
+29861: DATA 14096, 7931, 436, 27394, 21121, 17842, 12136, 5827
+29869: DATA 31164, 25428, 19174, 15448, 10040, 3736, 28796, 23424
+29877: DATA 17072, 13371, 8084, 336, 26870, 21105, 17883, 12101
+29885: DATA 5785, 30785, 25567, 21843, 15582, 9818, 2506, 29507
+29893: DATA 23232, 19579, 14324, 6403, 193, 27195, 23975, 18304
+29901: DATA 10605, 4252, 31284, 27664, 22515, 14609, 8376, 2755
+29909: DATA 31841, 26613, 18817, 13136, 6805, 3324, 30235, 22607
+29917: DATA 17292, 13779, 7961, 272, 26757, 21212, 17436, 11776
+29925: DATA 4484, 31741, 27955, 22274, 14670, 8358, 2725, 31872
+29933: DATA 26144, 18459, 12900, 9232, 4002, 29073, 23548, 19840
+29941: DATA 14187, 7475, 12503, 29132, 23154, 17687, 6145, 11786
+29949: DATA 13376, 23133, 24649, 30299, 7244, 8786, 18518, 24142
+29957: DATA 25603, 2679, 4197, 9818, 19464, 21046, 30754, 3800
+29965: DATA 5360, 14993, 16570, 22358, 32059, 785, 10557, 16266
+29973: DATA 17914, 27569, 32350, 1032, 10859, 12536, 18060, 27992
+29981: DATA 29462, 6614, 12190, 12891, 22559, 28304, 29945, 6944
+29989: DATA 8480, 14321, 23973, 24605, 30425, 7359, 9079, 18911
+29997: DATA 24511, 25119, 2287, 8019, 9524, 19344, 24160, 25745
+30005: DATA 2787, 4391, 10116, 18959, 20651, 26486, 3522, 4188
+30013: DATA 9942, 19742, 21449, 26207, 3290, 4957, 14811, 19535
+30021: DATA 21191, 31038, 4095, 4626, 14478, 20350, 21926, 30916
+30029: DATA 3959, 5598, 14388, 20316, 21947, 30730, 3771, 5583
+30037: DATA 14371, 20157, 21955, 30747, 3751, 5618, 14342, 20292
+30045: DATA 21908, 30939, 3930, 4656, 14577
@@ -1,74 +1,53 @@
 #!/usr/bin/env python3
+import sys
+import argparse
 from python_vm import VirtualMachine
-from python_vm.opcode import Opcode
+from python_vm.disassembler import disassemble, listing
+from python_vm.profiler import Profile
+from python_vm.script import read_script
+from python_vm.savefile import load_state, SUFFIX
 
-
-opcode_args = {
-    Opcode.HALT: 0,
-    Opcode.SET: 2,
-    Opcode.PUSH: 1,
-    Opcode.POP: 1,
-    Opcode.EQ: 3,
-    Opcode.GT: 3,
-    Opcode.JMP: 1,
-    Opcode.JT: 2,
-    Opcode.JF: 2,
-    Opcode.ADD: 3,
-    Opcode.MULT: 3,
-    Opcode.MOD: 3,
-    Opcode.AND_: 3,
-    Opcode.OR_: 3,
-    Opcode.NOT_: 2,
-    Opcode.RMEM: 2,
-    Opcode.WMEM: 2,
-    Opcode.CALL: 1,
-    Opcode.RET: 0,
-    Opcode.OUT: 1,
-    Opcode.IN_: 1,
-    Opcode.NOOP: 0
-}
-
-
-def sanitize_val(val: int):
-    if val < 32768:
-        ret = str(val)
-    elif 32768 <= val <= 32775:
-        ret = 'r{}'.format(val % 32768)
-    else:
-        raise ValueError("Invalid value in binary: {}".format(val))
-    return ret
+DEFAULT_BIN_PATH = 'challenge.bin'
+DEFAULT_OUTPUT_PATH = 'data/bin_source.asm'
 
 
 def main():
-    vm = VirtualMachine('challenge.bin')
-    with open('data/bin_source.asm', 'w') as f:
-        curr_idx = 0
-        while curr_idx < len(vm._bin):
-            val = vm.get_byte(curr_idx)
-            try:
-                opcode = Opcode(val)
-            except ValueError:
-                f.write("{:6} DATA: {}\n".format(str(curr_idx) + ':', val))
-                curr_idx += 1
-                continue
-
-            num_args = opcode_args[opcode]
-            args = [vm.get_byte(curr_idx + i) for i in range(1, num_args + 1)]
-            args = [sanitize_val(arg) for arg in args]
-
-            line = "{:6} {:4}".format(
-                str(curr_idx) + ':', str(opcode.name.strip('_')))
-            for arg in args:
-                if opcode.value == 19:
-                    try:
-                        line += " {}".format(repr(chr(int(arg))))
-                    except ValueError:
-                        line += " {}".format(arg)
-                else:
-                    line += " {:5}".format(arg)
+    parser = argparse.ArgumentParser(
+        description="Disassemble challenge.bin, or a memory image saved from it")
+    parser.add_argument('--snapshot', default=DEFAULT_BIN_PATH,
+                        help="memory image to disassemble, such as data/<name>.sav from `save`")
+    parser.add_argument('--script', action='append', default=[],
+                        help="play this script first and disassemble memory as it is "
+                             "afterwards, starting from every subroutine it called")
+    parser.add_argument('--entry', type=int, action='append', default=[],
+                        help="additional address to start decoding code from")
+    parser.add_argument('--linear', action='store_true',
+                        help="decode every word from address 0 in turn instead")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH,
+                        help="file to write the listing to, or - for stdout")
+    args = parser.parse_args()
+
+    if args.snapshot.endswith(SUFFIX):
+        vm = VirtualMachine.from_snapshot(load_state(args.snapshot), engine='dispatch')
+    else:
+        vm = VirtualMachine(args.snapshot, engine='dispatch')
+    entries = [0] + args.entry
+    if args.script:
+        profile = Profile()
+        vm.run_script(read_script(*args.script), profile)
+        entries.append(vm._curr_idx)
+        entries.extend(target for target in profile.summary() if target is not None)
+
+    if args.linear:
+        lines = (line for _, line in listing(vm._bin))
+    else:
+        lines = disassemble(vm._bin, entries)
 
-            f.write(line + '\n')
-            curr_idx += num_args + 1
+    if args.output == '-':
+        sys.stdout.writelines(line + '\n' for line in lines)
+        return
+    with open(args.output, 'w') as f:
+        f.writelines(line + '\n' for line in lines)
 
 
 if __name__ == '__main__':
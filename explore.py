@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import argparse
+from python_vm import VirtualMachine
+from python_vm.explorer import Explorer, CODE
+from python_vm.script import read_script
+from python_vm.virtual_machine import ENGINES
+
+DEFAULT_BIN_PATH = 'challenge.bin'
+
+
+def report(kind: str, name: str, path: tuple):
+    print("{:5} {:30} {}".format(kind, name, ', '.join(path) or '(start)'))
+    sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Explore the text adventure in challenge.bin automatically")
+    parser.add_argument('--script', action='append', default=[],
+                        help="play this script before exploring from where it ends")
+    parser.add_argument('--engine', choices=ENGINES, default='dispatch')
+    parser.add_argument('--processes', type=int, default=os.cpu_count(),
+                        help="number of worker processes (1 to explore in this process)")
+    parser.add_argument('--max-depth', type=int,
+                        help="number of commands to search beyond the start")
+    parser.add_argument('--max-states', type=int, default=10000,
+                        help="number of distinct states to stop after")
+    args = parser.parse_args()
+
+    vm = VirtualMachine(DEFAULT_BIN_PATH, engine=args.engine)
+    transcript = vm.run_script(read_script(*args.script))
+    for code in CODE.findall(transcript):
+        report('code', code, ())
+
+    explorer = Explorer(vm, args.processes, report)
+    start = time.perf_counter()
+    states = explorer.explore(args.max_depth, args.max_states)
+    print("\nExplored {} states in {:.1f}s: {} rooms, {} items, {} codes, {} dead ends".format(
+        states, time.perf_counter() - start, len(explorer.rooms),
+        len(explorer.items), len(explorer.codes), len(explorer.dead_ends)),
+        file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,14 @@
 
 import sys
 import json
+import argparse
 from python_vm import VirtualMachine
+from python_vm.virtual_machine import ENGINES
+from python_vm.script import read_script
+from python_vm.profiler import Profile, Sampler
+from python_vm.boot import boot
+from python_vm.backends import PipeBackend
+from python_vm.savefile import load_state, SUFFIX
 
 DEFAULT_BIN_PATH = 'challenge.bin'
 
@@ -11,29 +18,86 @@ def main():
 
     def exit_and_print_usage():
         sys.exit(
-            "Usage:\n./main.py <path to saved binary> <path to saved json>\n")
+            "Usage:\n./main.py [--script <path> ...] [--engine {}] [--profile <path> [--sample]] [--trace <n>] [--no-boot-cache] [--pipe] [<path to save file> | <path to saved binary> <path to saved json>]\n".format(
+                '|'.join(ENGINES)))
 
-    if len(sys.argv) == 3:
-        if not(sys.argv[1].endswith('bin')) or not(sys.argv[2].endswith('.json')):
+    parser = argparse.ArgumentParser(usage=argparse.SUPPRESS, add_help=False)
+    parser.add_argument('saved', nargs='*')
+    parser.add_argument('--script', action='append', default=[])
+    parser.add_argument('--engine', choices=ENGINES, default='dispatch')
+    parser.add_argument('--profile')
+    parser.add_argument('--sample', action='store_true')
+    parser.add_argument('--trace', type=int, default=0)
+    parser.add_argument('--no-boot-cache', action='store_true')
+    parser.add_argument('--pipe', action='store_true')
+    args, unknown = parser.parse_known_args()
+    if unknown:
+        exit_and_print_usage()
+
+    if len(args.saved) == 1:
+        if not args.saved[0].endswith(SUFFIX):
+            exit_and_print_usage()
+        try:
+            snapshot = load_state(args.saved[0])
+        except ValueError as e:
+            sys.exit("Cannot load {}: {}".format(args.saved[0], e))
+        vm = VirtualMachine.from_snapshot(snapshot, engine=args.engine,
+                                          trace=args.trace)
+
+    elif len(args.saved) == 2:
+        if not(args.saved[0].endswith('bin')) or not(args.saved[1].endswith('.json')):
             exit_and_print_usage()
-        bin_path = sys.argv[1]
-        with open(sys.argv[2]) as f:
+        bin_path = args.saved[0]
+        with open(args.saved[1]) as f:
             tmp = json.load(f)
 
         registers = tmp['registers']
         stack = tmp['stack']
         curr_idx = tmp['curr_idx']
         vm = VirtualMachine(bin_path, registers=registers,
-                            stack=stack, curr_idx=curr_idx)
+                            stack=stack, curr_idx=curr_idx, engine=args.engine,
+                            trace=args.trace)
 
-    elif len(sys.argv) == 1:
+    elif len(args.saved) == 0:
         bin_path = DEFAULT_BIN_PATH
-        vm = VirtualMachine(bin_path)
+        if args.no_boot_cache or args.profile:
+            vm = VirtualMachine(bin_path, engine=args.engine, trace=args.trace)
+        else:
+            # start from the first prompt, replaying what the boot printed
+            vm, transcript = boot(bin_path, engine=args.engine,
+                                  trace=args.trace)
+            sys.stdout.write(transcript)
 
     else:
         exit_and_print_usage()
 
-    vm.execute()
+    if args.sample and not args.profile:
+        exit_and_print_usage()
+    profile = None
+    if args.profile:
+        profile = Sampler() if args.sample else Profile()
+
+    if args.pipe:
+        # read commands from stdin in bulk and write straight to stdout, with
+        # no prompt, for when either is redirected
+        sys.stdout.flush()
+        vm.attach(PipeBackend(sys.stdin, sys.stdout))
+
+    try:
+        if args.script:
+            # headless mode: play through the scripts and print the transcript
+            sys.stdout.write(vm.run_script(
+                read_script(*args.script), profile))
+            return
+
+        try:
+            vm.execute(profile)
+        except EOFError:
+            print("\n\nExiting program...")
+    finally:
+        if profile is not None:
+            with open(args.profile, 'w') as f:
+                profile.dump(vm._bin, f)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,534 @@
+import os
+import py_compile
+import importlib.util
+from array import array
+from functools import partial
+from .opcode import NUM_OPERANDS, WRITE_SLOTS, REGISTER_BASE, VALUE_LIMIT, Opcode
+from .disassembler import _decode, _trace
+from .dispatch import DispatchEngine
+from .exceptions import InvalidNumberError, EmptyStackError
+from .xref import image_hash
+from .savefile import write_file
+
+# bumped whenever the generated code changes, so stale modules are ignored
+VERSION = 2
+DEFAULT_CACHE_DIR = 'data/aot'
+
+# how deep compiled functions call each other natively before a call goes
+# back through the dispatch loop, which keeps clear of Python's recursion limit
+MAX_DEPTH = 100
+
+# how many instructions are decoded into handlers, rather than run as
+# compiled code, before the image is compiled again
+RECOMPILE_AFTER = 256
+
+HALT, JMP, JT, JF = Opcode.HALT.value, Opcode.JMP.value, Opcode.JT.value, Opcode.JF.value
+CALL, RET, OUT, IN = Opcode.CALL.value, Opcode.RET.value, Opcode.OUT.value, Opcode.IN_.value
+
+# opcodes after which a block does not carry on to the next instruction
+_ENDS = frozenset((HALT, JMP, CALL, RET, IN))
+
+# module objects already loaded in this process, by path
+_loaded = {}
+
+
+def _body(memory, entry: int):
+    """
+    Finds the instructions of the function at `entry`: everything reachable
+    from it through fall-throughs and literal jumps, but not through calls.
+
+    Returns them as `address: (opcode, operands)`, with None for words which
+    have to run in the interpreter (invalid instructions and instructions
+    writing into a literal operand slot), along with the addresses blocks
+    start at and the literal addresses called.
+    """
+    instructions = {}
+    starts = {entry}
+    calls = set()
+    pending = [entry]
+    while pending:
+        pc = pending.pop()
+        while pc not in instructions:
+            decoded = _decode(memory, pc)
+            if decoded is not None and not DispatchEngine._is_plain(*decoded):
+                # runs through `Operations`, then carries on after it
+                instructions[pc] = None
+                pc += 1 + len(decoded[1])
+                starts.add(pc)
+                continue
+            instructions[pc] = decoded
+            if decoded is None:
+                break
+            op, args = decoded
+            nxt = pc + 1 + len(args)
+            if op in (JMP, JT, JF) and args[-1] < REGISTER_BASE:
+                starts.add(args[-1])
+                pending.append(args[-1])
+            if op == CALL and args[0] < REGISTER_BASE:
+                calls.add(args[0])
+            if op in (HALT, JMP, RET):
+                break
+            if op in (CALL, IN):
+                # where the dispatch loop carries on after a `ret` or input
+                starts.add(nxt)
+            pc = nxt
+    return instructions, starts, calls
+
+
+def discover(memory, entries) -> dict:
+    """
+    Finds the functions of `memory` reachable from `entries`, as
+    `entry: (instructions, block starts)` (see `_body`). Functions are the
+    entries themselves, the subroutines `trace_code` finds and anything else
+    called with a literal address from them.
+    """
+    _, functions, _, _ = _trace(memory, entries, True)
+    pending = sorted(set(functions) | set(entries))
+    found = {}
+    while pending:
+        entry = pending.pop()
+        if entry in found or not 0 <= entry < len(memory):
+            continue
+        instructions, starts, calls = _body(memory, entry)
+        found[entry] = (instructions, starts)
+        pending.extend(calls - found.keys())
+    return found
+
+
+class _FunctionWriter:
+    """
+    Writes the Python source of one function of the binary, as a closure
+    inside `link` which takes the address to start at and its depth of
+    native calls, and returns the address the dispatch loop carries on from.
+
+    Registers are kept in locals, loaded on entry and after anything which
+    could change them behind the function's back, and stored back into the
+    value table before anything which could look at them. Blocks are picked
+    by a binary search over their start addresses, so moving from one to
+    the next costs a few comparisons rather than a dispatch.
+    """
+
+    def __init__(self, entry: int, instructions: dict, starts: set):
+        self.entry = entry
+        self._instructions = instructions
+        self._starts = sorted(starts & instructions.keys())
+        used = set()
+        written = set()
+        for decoded in instructions.values():
+            if decoded is None:
+                continue
+            op, args = decoded
+            for slot, arg in enumerate(args, 1):
+                if arg >= REGISTER_BASE:
+                    used.add(arg - REGISTER_BASE)
+                    if slot in WRITE_SLOTS[op]:
+                        written.add(arg - REGISTER_BASE)
+        self._load = ''.join(f'r{reg} = V[{REGISTER_BASE + reg}]; '
+                             for reg in sorted(used))
+        self._flush = ''.join(f'V[{REGISTER_BASE + reg}] = r{reg}; '
+                              for reg in sorted(written))
+
+    def entries(self) -> list:
+        """The block starts the dispatch loop may enter the function at"""
+        return [start for start in self._starts
+                if self._instructions[start] is not None
+                and self._instructions[start][0] not in (HALT, IN)]
+
+    def source(self) -> str:
+        lines = [f'def f_{self.entry}(pc, depth):']
+        if self._load:
+            lines.append('    ' + self._load.rstrip('; '))
+        lines.append('    while True:')
+        lines.extend(self._tree(self._starts, ' ' * 8))
+        return '\n'.join('    ' + line for line in lines) + '\n'
+
+    def _tree(self, starts: list, indent: str) -> list:
+        if len(starts) == 1:
+            return [indent + line for line in self._block(starts[0])]
+        mid = len(starts) // 2
+        return ([f'{indent}if pc < {starts[mid]}:']
+                + self._tree(starts[:mid], indent + '    ')
+                + [f'{indent}else:']
+                + self._tree(starts[mid:], indent + '    '))
+
+    @staticmethod
+    def _read(arg: int) -> str:
+        return str(arg) if arg < REGISTER_BASE else f'r{arg - REGISTER_BASE}'
+
+    def _goto(self, target) -> str:
+        if isinstance(target, int) and target in self._instructions \
+                and target in self._starts:
+            return f'pc = {target}; continue'
+        return f'{self._flush}return {target}'
+
+    def _block(self, start: int) -> list:
+        lines = []
+        chars = []
+        # values known to be on the stack since the start of the block
+        depth = 0
+        pc = start
+        while True:
+            if pc != start and pc in self._starts:
+                # falls through into the next block
+                decoded = None
+            else:
+                decoded = self._instructions[pc]
+                if decoded is not None and decoded[0] == OUT and decoded[1][0] < REGISTER_BASE:
+                    # runs of literal `out`s are how the binary prints text
+                    chars.append(chr(decoded[1][0]))
+                    pc += 2
+                    continue
+            if chars:
+                lines.append(f"write({''.join(chars)!r})")
+                chars = []
+            if pc != start and pc in self._starts:
+                lines.append(self._goto(pc))
+                break
+            if decoded is None or decoded[0] in (HALT, IN):
+                lines.append(f'{self._flush}return {pc}')
+                break
+            op, args = decoded
+            if op == 2:
+                depth += 1
+            elif op in (3, RET):
+                if depth == 0:
+                    failure = ('raise EmptyStackError("Attempting to pop from empty stack")'
+                               if op == 3 else 'halt(override=True)')
+                    lines.append(f'if not stack: {self._flush}at({pc}); {failure}')
+                else:
+                    depth -= 1
+            nxt = pc + 1 + len(args)
+            lines.extend(self._instruction(pc, op, args, nxt))
+            if op in _ENDS:
+                break
+            pc = nxt
+        return lines
+
+    def _instruction(self, pc: int, op: int, args: tuple, nxt: int) -> list:
+        r = self._read
+        if op == 1:
+            return [f'{r(args[0])} = {r(args[1])}']
+        if op == 2:
+            return [f'push({r(args[0])})']
+        if op == 3:
+            return [f'{r(args[0])} = pop()']
+        if op in (4, 5, 9, 10, 11, 12, 13):
+            template = {
+                4: '1 if {} == {} else 0',
+                5: '1 if {} > {} else 0',
+                9: '({} + {}) % 32768',
+                10: '({} * {}) % 32768',
+                11: '{} % {}',
+                12: '{} & {}',
+                13: '{} | {}',
+            }[op]
+            return [f'{r(args[0])} = ' + template.format(r(args[1]), r(args[2]))]
+        if op == 14:
+            return [f'{r(args[0])} = (~{r(args[1])}) % 32768']
+        if op == 15:
+            # a register code stored in memory reads the register itself
+            return [f't = mem[{r(args[1])}]',
+                    f'if t >= {REGISTER_BASE}: {self._flush}t = value({pc}, t)',
+                    f'{r(args[0])} = t']
+        if op == 16:
+            return [f'val = {r(args[1])}',
+                    f'addr = {r(args[0])}',
+                    't = mem[addr]',
+                    f'if {REGISTER_BASE} <= t < {VALUE_LIMIT}:',
+                    f'    {self._flush}V[t] = val; {self._load.rstrip("; ")}',
+                    'else:',
+                    '    mem[addr] = val',
+                    '    if covered[addr] is not None: '
+                    f'{self._flush}invalidate(addr); return {nxt}',
+                    '    clear(addr)']
+        if op == JMP:
+            return [self._goto(r(args[0]) if args[0] >= REGISTER_BASE else args[0])]
+        if op in (JT, JF):
+            test = '!=' if op == JT else '=='
+            target = r(args[1]) if args[1] >= REGISTER_BASE else args[1]
+            return [f'if {r(args[0])} {test} 0: {self._goto(target)}']
+        if op == CALL:
+            return [f't = {r(args[0])}',
+                    'f = F.get(t)',
+                    f'if f is None or depth > {MAX_DEPTH}:',
+                    f'    {self._flush}pc = call(t, {nxt})',
+                    f'    if pc != {nxt}: return pc',
+                    f'    {self._load}pc = {nxt}; continue',
+                    f'push({nxt}); {self._flush}pc = f(t, depth + 1)',
+                    f'if pc != {nxt} or {self.entry} not in F: return pc',
+                    f'{self._load}pc = {nxt}; continue']
+        if op == RET:
+            return [f'{self._flush}return pop()']
+        if op == OUT:
+            return [f'put({r(args[0])})']
+        # noop
+        return []
+
+
+def compile_image(memory, entries=(0,)) -> str:
+    """
+    Compiles the functions of `memory` reachable from `entries` into the
+    source of a Python module.
+
+    The module defines `link(...)`, which binds the functions to the state
+    of an `AotEngine` and returns them by entry address, `BLOCKS`, the
+    functions each block start can be entered through, and `COVERED`, the
+    addresses each function was compiled from.
+    """
+    functions = discover(memory, entries)
+    writers = [_FunctionWriter(entry, *functions[entry]) for entry in sorted(functions)]
+    lines = [
+        '# Generated by python_vm.aot; do not edit.',
+        f'VERSION = {VERSION}',
+        '',
+        '',
+        'def link(V, mem, stack, F, covered, invalidate, clear, call, value, at,',
+        '         halt, put, write, EmptyStackError):',
+        '    push = stack.append',
+        '    pop = stack.pop',
+        '',
+    ]
+    blocks = {}
+    covered = {}
+    for writer in writers:
+        lines.append(writer.source())
+        for start in writer.entries():
+            blocks.setdefault(start, []).append(writer.entry)
+        covered[writer.entry] = _ranges(
+            _span(memory, pc) for pc in functions[writer.entry][0])
+    lines.append('    return {' + ', '.join(
+        f'{writer.entry}: f_{writer.entry}' for writer in writers) + '}')
+    lines.append('')
+    # a function's own entry comes first among those a block can go through
+    blocks = {start: tuple(sorted(owners, key=lambda entry: entry != start))
+              for start, owners in sorted(blocks.items())}
+    lines.append(f'BLOCKS = {blocks!r}')
+    lines.append(f'COVERED = {covered!r}')
+    return '\n'.join(lines) + '\n'
+
+
+def _span(memory, pc: int) -> tuple:
+    """The addresses the instruction at `pc` takes up, as `(start, end)`"""
+    if pc >= len(memory):
+        return pc, pc
+    op = memory[pc]
+    end = pc + 1 + (NUM_OPERANDS[op] if op < len(NUM_OPERANDS) else 0)
+    return pc, min(end, len(memory))
+
+
+def _ranges(spans) -> tuple:
+    """Merges `(start, end)` spans into as few disjoint ranges as there can be"""
+    merged = []
+    for lo, hi in sorted(spans):
+        if merged and lo <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    return tuple((lo, hi) for lo, hi in merged)
+
+
+def load_module(memory, entries=(0,), cache_dir: str = DEFAULT_CACHE_DIR):
+    """
+    Returns the compiled module for `memory` from `entries`, loading it from
+    `cache_dir` if it was compiled before and compiling it there otherwise.
+    Modules are named after a hash of the image, the entries and `VERSION`,
+    and Python keeps their bytecode in `__pycache__` beside them.
+    """
+    key = image_hash(memory, repr(sorted(entries)), str(VERSION))
+    path = os.path.join(cache_dir, f'image_{key}.py')
+    module = _loaded.get(path)
+    if module is not None:
+        return module
+    if not os.path.exists(path):
+        write_file(path, compile_image(memory, entries).encode('utf-8'))
+        # compile it straight away, rather than leaving it to the first
+        # import, which may not write bytecode
+        py_compile.compile(path, doraise=True)
+    spec = importlib.util.spec_from_file_location(f'image_{key}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _loaded[path] = module
+    return module
+
+
+def entries_of(memory, pc: int, stack, called=()) -> list:
+    """
+    The addresses to compile `memory` from when execution is at `pc` with
+    `stack`: the start of memory, `pc`, the return addresses on the stack
+    and any addresses in `called` which were seen to be called at run time
+    """
+    entries = {0, pc}
+    entries.update(address for address in stack
+                   if 2 <= address < len(memory) and memory[address - 2] == CALL)
+    entries.update(address for address in called if 0 <= address < len(memory))
+    return sorted(entries)
+
+
+class AotEngine(DispatchEngine):
+    """
+    Execution engine which runs code compiled ahead of time into a Python
+    module by `compile_image`, from the memory image the virtual machine
+    has when the engine is created. Modules are cached on disk by a hash of
+    the image, in the machine's `aot_cache_dir` or `DEFAULT_CACHE_DIR`, so
+    an image is only ever compiled once.
+
+    Every function of the binary becomes a Python function holding the
+    registers in locals, and calls between them are native calls for as
+    long as the return address they pushed is the one their `ret` pops.
+    Anything the compiler could not resolve (jumps to computed addresses,
+    returns to somewhere else, `in`, `halt`, unusual operands and code
+    which was not found ahead of time) goes back to the dispatch loop and
+    its handlers. A function is dropped for good once memory it was compiled
+    from is written with a different value, so code patched or decrypted at
+    run time runs through the handlers instead; and they are all set aside
+    while breakpoints or watchpoints are set, or for addresses with an
+    intrinsic.
+
+    Code only reached through addresses computed at run time, such as the
+    command handlers the binary looks up in tables, is picked up by
+    recompiling the image as it is then, along with every address called
+    that had no function, once `RECOMPILE_AFTER` instructions have been
+    decoded into handlers since the last time. That only happens while
+    waiting for input, where the image is the same from one run to the next
+    and so is usually cached already.
+
+    Each entry into compiled code counts as one step against a budget, and
+    a budget can only stop execution between them.
+    """
+
+    def __init__(self, vm):
+        super().__init__(vm)
+        self._cache_dir = vm._aot_cache_dir or DEFAULT_CACHE_DIR
+        # addresses called which had no compiled function
+        self._called = set()
+        # the address a compiled function failed at, which the dispatch loop
+        # cannot know about
+        self._fault = None
+        self._load(vm._curr_idx)
+
+    def _load(self, pc: int):
+        """Loads the module compiled from memory as it is, running from `pc`"""
+        self._image = array('H', self._mem)
+        self._module = load_module(
+            self._image, entries_of(self._image, pc, self._stack, self._called),
+            self._cache_dir)
+        self._covered = [None] * len(self._mem)
+        for entry, ranges in self._module.COVERED.items():
+            for lo, hi in ranges:
+                for address in range(lo, min(hi, len(self._mem))):
+                    owners = self._covered[address]
+                    self._covered[address] = (entry,) if owners is None else owners + (entry,)
+        self._functions = {}
+        self._compiled = self._module.link(
+            self._values, self._mem, self._stack, self._functions,
+            self._covered, self._invalidate, super()._invalidate, self._call,
+            self._value, self._at, self._ops.halt, self._output.put,
+            self._output.write, EmptyStackError)
+        self._starts = {}
+        for start, owners in self._module.BLOCKS.items():
+            for entry in owners:
+                self._starts.setdefault(entry, []).append(start)
+        self._dead = set()
+        self._misses = 0
+        self._code[:] = [None] * len(self._code)
+        self._relink()
+
+    def _relink(self):
+        """Makes the functions which are still valid available to each other"""
+        self._functions.clear()
+        if self._watch:
+            return
+        intrinsics = self._vm._intrinsics
+        self._functions.update(
+            (entry, function) for entry, function in self._compiled.items()
+            if entry not in self._dead and entry not in intrinsics)
+
+    def _kill(self, entries):
+        code = self._code
+        for entry in entries:
+            if entry in self._dead:
+                continue
+            self._dead.add(entry)
+            self._functions.pop(entry, None)
+            for start in self._starts.get(entry, ()):
+                code[start] = None
+
+    def _invalidate(self, address: int):
+        super()._invalidate(address)
+        owners = self._covered[address]
+        if owners is not None and self._mem[address] != self._image[address]:
+            self._kill(owners)
+
+    def _invalidate_range(self, start: int, end: int):
+        super()._invalidate_range(start, end)
+        mem = self._mem
+        image = self._image
+        for address in range(start, end):
+            if self._covered[address] is not None and mem[address] != image[address]:
+                self._kill(self._covered[address])
+
+    def _invalidate_all(self):
+        super()._invalidate_all()
+        # memory may have been written behind the engine's back
+        self._invalidate_range(0, len(self._mem))
+        self._relink()
+
+    def _call(self, target: int, nxt: int) -> int:
+        """A call to an address with no compiled function, or one too deep"""
+        intrinsic = self._vm._intrinsics.get(target)
+        if intrinsic is None:
+            self._called.add(target)
+            self._stack.append(nxt)
+            return target
+        self._run_intrinsic(intrinsic)
+        return nxt
+
+    def _value(self, pc: int, code: int) -> int:
+        if code >= VALUE_LIMIT:
+            self._at(pc)
+            raise InvalidNumberError("Encountered invalid number {}", code)
+        return self._values[code]
+
+    def _at(self, pc: int):
+        self._fault = pc
+
+    def _decode(self, pc: int):
+        owners = self._module.BLOCKS.get(pc)
+        if owners is not None and not self._watch:
+            for entry in owners:
+                function = self._functions.get(entry)
+                if function is not None:
+                    return partial(function, pc, 0)
+        self._misses += 1
+        return super()._decode(pc)
+
+    def _decode_call(self, pc, a):
+        handler = super()._decode_call(pc, a)
+        if a < REGISTER_BASE:
+            self._called.add(a)
+            return handler
+        V = self._values
+        called = self._called
+
+        def traced():
+            called.add(V[a])
+            return handler()
+        return traced
+
+    def _decode_in_(self, pc, a):
+        in_ = super()._decode_in_(pc, a)
+
+        def handler():
+            if self._misses >= RECOMPILE_AFTER and not self._watch:
+                self._load(pc)
+            return in_()
+        return handler
+
+    def run(self, budget: int = None):
+        self._fault = None
+        try:
+            super().run(budget)
+        finally:
+            if self._fault is not None:
+                self._vm._curr_idx = self._fault
+                self._fault = None
@@ -0,0 +1,171 @@
+import os
+import sys
+from collections import deque
+from typing import Iterable, Union
+
+
+class Backend:
+    """
+    Where a virtual machine's input comes from and where its output goes.
+
+    Both directions work on bytes in bulk: the machine asks for a whole line
+    of input at a time, and its `OutputBuffer` hands over what the program
+    wrote a line (or a chunk of `threshold` characters) at a time.
+    """
+
+    def read_line(self) -> bytes:
+        """
+        Returns the next line of input without its newline, raising
+        `EOFError` once there is no more.
+        """
+        raise NotImplementedError
+
+    def write(self, data: bytes):
+        """Writes a chunk of output"""
+        raise NotImplementedError
+
+    def flush(self):
+        """Pushes out anything written so far"""
+
+
+class TerminalBackend(Backend):
+    """
+    Reads lines typed at the terminal after a prompt, and writes to whatever
+    `sys.stdout` is at the time of writing.
+    """
+
+    def __init__(self, prompt: str = '> '):
+        self._prompt = prompt
+
+    def read_line(self) -> bytes:
+        return input(self._prompt).encode('utf-8')
+
+    def write(self, data: bytes):
+        sys.stdout.write(data.decode('utf-8', 'replace'))
+
+    def flush(self):
+        sys.stdout.flush()
+
+
+class BufferBackend(Backend):
+    """
+    Keeps everything in memory: input is taken from `lines`, which may be
+    generated lazily, and then from the lines passed to `feed`; output is
+    collected into a buffer to be read with `getvalue` or `drain`.
+    """
+
+    def __init__(self, lines: Iterable[Union[str, bytes]] = ()):
+        self._source = iter(lines)
+        self._lines = deque()
+        self._data = bytearray()
+
+    def feed(self, line: Union[str, bytes]):
+        """Queues a line of input, without its newline"""
+        self._lines.append(line)
+
+    def read_line(self) -> bytes:
+        if self._lines:
+            line = self._lines.popleft()
+        else:
+            line = next(self._source, None)
+            if line is None:
+                raise EOFError
+        return line.encode('utf-8') if isinstance(line, str) else line
+
+    def pending(self) -> list:
+        """Returns the lines passed to `feed` which have not been read yet"""
+        return list(self._lines)
+
+    def write(self, data: bytes):
+        self._data += data
+
+    def tell(self) -> int:
+        """Returns the number of bytes written so far"""
+        return len(self._data)
+
+    def getvalue(self, start: int = 0) -> bytes:
+        """Returns the output from byte `start` onwards"""
+        return bytes(self._data[start:])
+
+    def drain(self) -> bytes:
+        """Returns the output written since the last call, and forgets it"""
+        data = bytes(self._data)
+        self._data.clear()
+        return data
+
+
+class FileBackend(Backend):
+    """
+    Replays input from the lines of a file and writes output to another,
+    where either may be a path or a file opened in binary mode. Output is
+    thrown away if there is no `sink`.
+    """
+
+    def __init__(self, source, sink=None):
+        self._opened = []
+        self._source = self._open(source, 'rb')
+        self._sink = self._open(sink, 'ab') if sink is not None else None
+
+    def _open(self, file, mode: str):
+        if isinstance(file, (str, os.PathLike)):
+            file = open(file, mode)
+            self._opened.append(file)
+        return file
+
+    def read_line(self) -> bytes:
+        line = self._source.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip(b'\r\n')
+
+    def write(self, data: bytes):
+        if self._sink is not None:
+            self._sink.write(data)
+
+    def flush(self):
+        if self._sink is not None:
+            self._sink.flush()
+
+    def close(self):
+        """Closes the files this backend opened itself"""
+        for file in self._opened:
+            file.close()
+        self._opened = []
+
+
+class PipeBackend(Backend):
+    """
+    Reads from and writes to file descriptors directly, such as the ends of
+    a pipe or the standard streams when they are redirected. Input is read a
+    chunk of up to `chunk_size` bytes at a time, however many lines that
+    holds, and output is written without any buffering of its own.
+    """
+
+    def __init__(self, source=0, sink=1, chunk_size: int = 65536):
+        self._source = source if isinstance(source, int) else source.fileno()
+        self._sink = sink if isinstance(sink, int) else sink.fileno()
+        self._chunk_size = chunk_size
+        self._pending = bytearray()
+
+    def read_line(self) -> bytes:
+        pending = self._pending
+        end = pending.find(b'\n')
+        while end < 0:
+            chunk = os.read(self._source, self._chunk_size)
+            if not chunk:
+                if not pending:
+                    raise EOFError
+                # the last line had no newline
+                end = len(pending)
+                break
+            start = len(pending)
+            pending += chunk
+            end = pending.find(b'\n', start)
+        line = bytes(pending[:end])
+        del pending[:end + 1]
+        return line.rstrip(b'\r')
+
+    def write(self, data: bytes):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._sink, view):]
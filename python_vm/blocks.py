@@ -0,0 +1,269 @@
+from .opcode import NUM_OPERANDS, REGISTER_BASE, VALUE_LIMIT
+from .dispatch import DispatchEngine
+from .exceptions import InvalidNumberError, EmptyStackError
+from .snapshot import PAGE_SHIFT
+
+
+# opcodes which end a basic block after being translated
+TERMINATORS = frozenset((6, 7, 8, 17, 18))
+
+# opcodes which are never translated and always run on their own
+STANDALONE = frozenset((0, 20))
+
+MAX_BLOCK_LENGTH = 256
+
+
+class BlockEngine(DispatchEngine):
+    """
+    Execution engine which translates straight-line runs of instructions, up to
+    and including the next JMP/JT/JF/CALL/RET, into a single compiled Python
+    function, so that a whole basic block runs per dispatch.
+
+    Every translated block records the addresses it was built from. A write
+    into any of them (from `wmem` or from an instruction delegated to
+    `Operations`) discards the affected blocks, and a block which overwrites
+    translated code returns to the dispatch loop straight away, so the binary
+    can decrypt and patch itself freely. HALT, IN, calls which may hit an
+    intrinsic, instructions which may hit a breakpoint or watchpoint and
+    instructions with unusual operands run on their own through the
+    `DispatchEngine` handlers.
+    """
+
+    def __init__(self, vm):
+        super().__init__(vm)
+        self._covered = [None] * len(self._mem)
+        self._compiled = {}
+        self._namespace = {
+            'V': self._values,
+            'mem': self._mem,
+            'stack': self._stack,
+            'push': self._stack.append,
+            'pop': self._stack.pop,
+            'covered': self._covered,
+            'invalidate': self._invalidate,
+            'dirty': self._dirty,
+            'halt': self._ops.halt,
+            'put': self._output.put,
+            'write': self._output.write,
+            'EmptyStackError': EmptyStackError,
+            'InvalidNumberError': InvalidNumberError,
+        }
+
+    def _invalidate(self, address: int):
+        self._dirty.add(address >> PAGE_SHIFT)
+        starts = self._covered[address]
+        if starts is not None:
+            self._covered[address] = None
+            code = self._code
+            for start in starts:
+                code[start] = None
+
+    def _invalidate_range(self, start: int, end: int):
+        for address in range(start, end):
+            self._invalidate(address)
+
+    def _invalidate_all(self):
+        super()._invalidate_all()
+        self._covered[:] = [None] * len(self._covered)
+
+    def _decode(self, pc: int):
+        handler, end = self._translate(pc)
+        if handler is None:
+            handler = super()._decode(pc)
+            end = pc + 1 + NUM_OPERANDS[self._mem[pc]]
+        covered = self._covered
+        for address in range(pc, min(end, len(covered))):
+            # a set, so that translating the same block again after it was
+            # discarded does not record its start twice
+            if covered[address] is None:
+                covered[address] = {pc}
+            else:
+                covered[address].add(pc)
+        return handler
+
+    def _calls_intrinsic(self, op: int, args: list) -> bool:
+        """
+        Checks whether the instruction is a `call` which may be replaced by an
+        intrinsic, in which case it runs on its own
+        """
+        intrinsics = self._vm._intrinsics
+        if op != 17 or not intrinsics:
+            return False
+        return args[0] >= REGISTER_BASE or args[0] in intrinsics
+
+    def _translate(self, start: int):
+        """
+        Translates the basic block beginning at `start`, returning the compiled
+        function and the address just past the block, or `(None, None)` if the
+        first instruction has to run on its own.
+        """
+        mem = self._mem
+        block = _BlockWriter(start)
+        pc = start
+        terminated = False
+        while block.count < MAX_BLOCK_LENGTH and pc < len(mem):
+            op = mem[pc]
+            if (op >= len(NUM_OPERANDS) or op in STANDALONE
+                    or pc + NUM_OPERANDS[op] >= len(mem)):
+                break
+            args = self._operands(pc, op)
+            if (not self._is_plain(op, args) or self._calls_intrinsic(op, args)
+                    or self._watch and self._is_watched(pc, op, args)):
+                break
+            block.emit(pc, op, args)
+            pc += 1 + len(args)
+            if op in TERMINATORS:
+                terminated = True
+                break
+        if block.count == 0:
+            return None, None
+        if not terminated:
+            block.exit(pc)
+
+        source = block.source()
+        code = self._compiled.get(source)
+        if code is None:
+            code = compile(source, f'<block {start}>', 'exec')
+            self._compiled[source] = code
+        namespace = dict(self._namespace)
+        exec(code, namespace)
+        return namespace['block'], pc
+
+
+class _BlockWriter:
+    """
+    Accumulates the Python source for one basic block.
+
+    Registers live in local variables for the duration of the block: those read
+    before being written are loaded on entry, and those written so far are
+    stored back into the value table before every exit. Instructions which can
+    fail at runtime raise only when they start the block; anywhere else the
+    block exits just before them, so errors are reported against the right
+    address and always see the registers in the value table.
+    """
+
+    def __init__(self, start: int):
+        self._start = start
+        self._loads = set()
+        self._written = set()
+        self._lines = []
+        self._chars = []
+        self._depth = 0
+        self.count = 0
+
+    def _read(self, arg: int) -> str:
+        if arg < REGISTER_BASE:
+            return str(arg)
+        reg = arg - REGISTER_BASE
+        if reg not in self._written:
+            self._loads.add(reg)
+        return f'r{reg}'
+
+    def _write(self, arg: int) -> str:
+        reg = arg - REGISTER_BASE
+        self._written.add(reg)
+        return f'r{reg}'
+
+    def _flush(self) -> str:
+        return ''.join(f'V[{REGISTER_BASE + reg}] = r{reg}; '
+                       for reg in sorted(self._written))
+
+    def _flush_chars(self):
+        if self._chars:
+            self._lines.append(f"write({''.join(self._chars)!r})")
+            self._chars = []
+
+    def _guard(self, condition: str, first: bool, failure: str, pc: int):
+        if first:
+            self._lines.append(f"if {condition}: {failure}")
+        else:
+            self._lines.append(f"if {condition}: {self._flush()}return {pc}")
+
+    def exit(self, target):
+        self._flush_chars()
+        self._lines.append(f"{self._flush()}return {target}")
+
+    def source(self) -> str:
+        loads = [f'r{reg} = V[{REGISTER_BASE + reg}]'
+                 for reg in sorted(self._loads)]
+        return 'def block():\n    ' + '\n    '.join(loads + self._lines) + '\n'
+
+    def emit(self, pc: int, op: int, args: list):
+        first = pc == self._start
+        nxt = pc + 1 + len(args)
+        self.count += 1
+        if op == 19 and args[0] < REGISTER_BASE:
+            self._chars.append(chr(args[0]))
+            return
+        self._flush_chars()
+        lines = self._lines
+        r = self._read
+        w = self._write
+
+        if op == 1:
+            src = r(args[1])
+            lines.append(f"{w(args[0])} = {src}")
+        elif op == 2:
+            lines.append(f"push({r(args[0])})")
+            self._depth += 1
+        elif op == 3:
+            if self._depth == 0:
+                self._guard('not stack', first,
+                            'raise EmptyStackError("Attempting to pop from empty stack")', pc)
+            else:
+                self._depth -= 1
+            lines.append(f"{w(args[0])} = pop()")
+        elif op in (4, 5, 9, 10, 11, 12, 13):
+            template = {
+                4: "1 if {} == {} else 0",
+                5: "1 if {} > {} else 0",
+                9: "({} + {}) % 32768",
+                10: "({} * {}) % 32768",
+                11: "{} % {}",
+                12: "{} & {}",
+                13: "{} | {}",
+            }[op]
+            expr = template.format(r(args[1]), r(args[2]))
+            lines.append(f"{w(args[0])} = {expr}")
+        elif op == 14:
+            src = r(args[1])
+            lines.append(f"{w(args[0])} = (~{src}) % 32768")
+        elif op == 15:
+            lines.append(f"t = mem[{r(args[1])}]")
+            if first:
+                lines.append(
+                    f"if t >= {VALUE_LIMIT}: "
+                    'raise InvalidNumberError("Encountered invalid number {}", t)')
+                lines.append(f"{w(args[0])} = V[t]")
+            else:
+                # a register code stored in memory reads the register itself,
+                # which is only up to date in the value table on entry
+                self._guard(f't >= {REGISTER_BASE}', False, None, pc)
+                lines.append(f"{w(args[0])} = t")
+        elif op == 16:
+            lines.append(f"val = {r(args[1])}")
+            lines.append(f"addr = {r(args[0])}")
+            lines.append("t = mem[addr]")
+            lines.append(f"if {REGISTER_BASE} <= t < {VALUE_LIMIT}: "
+                         f"{self._flush()}V[t] = val; return {nxt}")
+            lines.append("mem[addr] = val")
+            lines.append(f"dirty.add(addr >> {PAGE_SHIFT})")
+            lines.append("if covered[addr] is not None: "
+                         f"{self._flush()}invalidate(addr); return {nxt}")
+        elif op == 6:
+            self.exit(r(args[0]))
+        elif op == 7:
+            self.exit(f"{r(args[1])} if {r(args[0])} != 0 else {nxt}")
+        elif op == 8:
+            self.exit(f"{r(args[1])} if {r(args[0])} == 0 else {nxt}")
+        elif op == 17:
+            lines.append(f"push({nxt})")
+            self.exit(r(args[0]))
+        elif op == 18:
+            if self._depth == 0:
+                self._guard('not stack', first, 'halt(override=True)', pc)
+            self.exit('pop()')
+        elif op == 19:
+            lines.append(f"put({r(args[0])})")
+        elif op != 21:
+            raise ValueError(f"Opcode {op} cannot be translated")
@@ -0,0 +1,65 @@
+import os
+from typing import Optional, Tuple
+from .virtual_machine import VirtualMachine
+from .savefile import save_state, read_state, base_image
+from .opcode import Opcode
+
+DEFAULT_CACHE_DIR = 'data/boot'
+
+
+def binary_hash(path: str) -> str:
+    return base_image(path)[0].hex()
+
+
+def save_boot_image(path: str, vm: VirtualMachine, transcript: str,
+                    base: Optional[str] = None):
+    """
+    Writes the state of `vm` and the output it produced to get there into a
+    single save file (see `python_vm.savefile`), with memory stored against
+    the binary at `base` if given.
+    """
+    save_state(path, vm.snapshot(), base, transcript=transcript)
+
+
+def load_boot_image(path: str, base: Optional[str] = None,
+                    **kwargs) -> Tuple[VirtualMachine, str]:
+    """
+    Reads a file written by `save_boot_image` against the binary at `base`,
+    returning a virtual machine in the saved state, created with `kwargs`,
+    and the saved transcript. Raises ValueError if the file is not a save
+    file of this version, or was saved against a different binary.
+    """
+    snapshot, transcript = read_state(path, base)
+    return VirtualMachine.from_snapshot(snapshot, **kwargs), transcript
+
+
+def boot(binary: str, cache_dir: str = DEFAULT_CACHE_DIR,
+         **kwargs) -> Tuple[VirtualMachine, str]:
+    """
+    Returns a virtual machine for the binary at path `binary`, created with
+    `kwargs`, which has run up to the point where it first asks for input,
+    along with everything it wrote on the way.
+
+    The first time a binary is booted, the state it reaches is saved into
+    `cache_dir` under the hash of the binary, and later boots restore it
+    instead of running the program again. A changed binary hashes
+    differently, so it is simply booted and cached afresh.
+    """
+    path = None
+    try:
+        path = os.path.join(cache_dir, binary_hash(binary) + '.boot')
+        return load_boot_image(path, binary, **kwargs)
+    except (OSError, ValueError):
+        pass
+
+    vm = VirtualMachine(binary, **kwargs)
+    transcript = vm.run_script([])
+    # only cache a machine that is waiting for input; one that halted or
+    # failed during boot has nothing worth restoring
+    if path is not None and vm._bin[vm._curr_idx] == Opcode.IN_.value \
+            and not vm._ops._input_cache:
+        try:
+            save_boot_image(path, vm, transcript, binary)
+        except OSError:
+            pass
+    return vm, transcript
@@ -0,0 +1,218 @@
+import re
+import ast
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+# an equation with a blank for every coin, such as the one on the monument in
+# the ruins: `_ + _ * _^2 + _^3 - _ = 399`
+EQUATION = re.compile(r'^([\d\s()+\-*^]*_[_\d\s()+\-*^]*)=\s*(-?\d+)[ \t]*$', re.M)
+COIN = re.compile(r'^- (.+ coin)$', re.M)
+MARKING = re.compile(r'It has (?:an? )?(\w+)(?: dots?)? on one side')
+
+NUMBERS = {word: value for value, word in enumerate(
+    ['zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight',
+     'nine', 'ten', 'eleven', 'twelve'])}
+SHAPES = {'triangle': 3, 'square': 4, 'pentagon': 5, 'hexagon': 6,
+          'heptagon': 7, 'octagon': 8, 'nonagon': 9, 'decagon': 10}
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Pow)
+
+
+def parse(template: str) -> Tuple[ast.expr, int, int]:
+    """
+    Parses an equation such as `_ + _ * _^2 = 399` into the expression on
+    the left, with the blanks numbered from left to right as names `_0`,
+    `_1` and so on, the number of blanks and the value on the right. Only
+    `+`, `-`, `*` and powers by a constant are allowed, and `^` is a power
+    rather than exclusive or.
+    """
+    left, equals, right = template.partition('=')
+    if not equals:
+        raise ValueError("No value to solve for in {!r}".format(template))
+    names = iter(range(left.count('_')))
+    source = re.sub('_', lambda _: '_{}'.format(next(names)), left)
+    try:
+        expression = ast.parse(source.replace('^', '**').strip(), mode='eval').body
+        target = int(right)
+    except (SyntaxError, ValueError) as e:
+        raise ValueError("Cannot parse {!r}".format(template)) from e
+    for node in ast.walk(expression):
+        if isinstance(node, ast.BinOp):
+            if not isinstance(node.op, _OPERATORS):
+                raise ValueError("Unsupported operator in {!r}".format(template))
+            if isinstance(node.op, ast.Pow) and not (
+                    isinstance(node.right, ast.Constant) and node.right.value >= 0):
+                raise ValueError("Exponents must be constant in {!r}".format(template))
+        elif isinstance(node, ast.UnaryOp):
+            if not isinstance(node.op, ast.USub):
+                raise ValueError("Unsupported operator in {!r}".format(template))
+        elif isinstance(node, ast.Name):
+            if not re.fullmatch(r'_\d+', node.id):
+                raise ValueError("Unknown name in {!r}".format(template))
+        elif isinstance(node, ast.Constant):
+            if type(node.value) is not int:
+                raise ValueError("Constants must be integers in {!r}".format(template))
+        elif not isinstance(node, (ast.Load, ast.operator, ast.unaryop)):
+            raise ValueError("Unsupported expression in {!r}".format(template))
+    return expression, left.count('_'), target
+
+
+def _evaluate(node: ast.expr, blanks: dict):
+    """Evaluates `node` with arrays of values for the blanks, element-wise"""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        return blanks[node.id]
+    if isinstance(node, ast.UnaryOp):
+        return -_evaluate(node.operand, blanks)
+    left = _evaluate(node.left, blanks)
+    if isinstance(node.op, ast.Pow):
+        return left ** node.right.value
+    right = _evaluate(node.right, blanks)
+    if isinstance(node.op, ast.Add):
+        return left + right
+    if isinstance(node.op, ast.Sub):
+        return left - right
+    return left * right
+
+
+def _bounds(node: ast.expr, blanks: dict) -> tuple:
+    """
+    Evaluates `node` over intervals, where each blank is a (lowest, highest)
+    pair of arrays, returning the lowest and highest values it can take.
+    """
+    import numpy as np
+
+    if isinstance(node, ast.Constant):
+        return node.value, node.value
+    if isinstance(node, ast.Name):
+        return blanks[node.id]
+    if isinstance(node, ast.UnaryOp):
+        low, high = _bounds(node.operand, blanks)
+        return -high, -low
+    low, high = _bounds(node.left, blanks)
+    if isinstance(node.op, ast.Pow):
+        power = node.right.value
+        if power % 2:
+            return low ** power, high ** power
+        # an even power is smallest at the value nearest zero
+        nearest = np.where(low > 0, low, np.where(high < 0, -high, 0))
+        return nearest ** power, np.maximum(low ** power, high ** power)
+    right_low, right_high = _bounds(node.right, blanks)
+    if isinstance(node.op, ast.Add):
+        return low + right_low, high + right_high
+    if isinstance(node.op, ast.Sub):
+        return low - right_high, high - right_low
+    corners = [low * right_low, low * right_high,
+               high * right_low, high * right_high]
+    return np.minimum.reduce(corners), np.maximum.reduce(corners)
+
+
+def _slot_order(expression: ast.expr, slots: int, values) -> list:
+    """
+    Orders the blanks so that those with the most influence on the result,
+    such as the bases of powers, are filled in first, which lets the bounds
+    prune the most partial assignments.
+    """
+    middle = values[len(values) // 2]
+    lowest, highest = values[0], values[-1]
+    widths = []
+    for slot in range(slots):
+        blanks = {'_{}'.format(i): (middle, middle) for i in range(slots)}
+        blanks['_{}'.format(slot)] = (lowest, highest)
+        low, high = _bounds(expression, blanks)
+        widths.append(high - low)
+    return sorted(range(slots), key=lambda slot: -widths[slot])
+
+
+def solve(template: str, values: Iterable[int]) -> List[tuple]:
+    """
+    Returns every way of filling in the blanks of the equation `template`
+    with distinct items of `values`, as tuples of the values for the blanks
+    from left to right, in ascending order.
+
+    Blanks are filled in one at a time, for every partial assignment at once
+    as rows of an array. After each blank, the equation is bounded by letting
+    each remaining blank range over the values not yet used in its row, and
+    rows which cannot reach the target are dropped, so only a small part of
+    all the permutations is ever built when there are many values.
+    """
+    import numpy as np
+
+    expression, slots, target = parse(template)
+    values = np.array(sorted(values), dtype=np.int64)
+    count = len(values)
+    if slots > count:
+        return []
+    order = _slot_order(expression, slots, values)
+    names = ['_{}'.format(slot) for slot in order]
+
+    # the indices into `values` chosen so far in each row, and which are used
+    rows = np.zeros((1, 0), dtype=np.intp)
+    used = np.zeros((1, count), dtype=bool)
+    for depth in range(slots):
+        parents = np.repeat(np.arange(len(rows)), count)
+        choices = np.tile(np.arange(count), len(rows))
+        fresh = ~used[parents, choices]
+        parents, choices = parents[fresh], choices[fresh]
+        rows = np.column_stack([rows[parents], choices])
+        used = used[parents]
+        used[np.arange(len(used)), choices] = True
+        if depth + 1 == slots:
+            break
+
+        unused = ~used
+        lowest = values[np.argmax(unused, axis=1)]
+        highest = values[count - 1 - np.argmax(unused[:, ::-1], axis=1)]
+        blanks = {name: (lowest, highest) for name in names}
+        for position, name in enumerate(names[:depth + 1]):
+            chosen = values[rows[:, position]]
+            blanks[name] = (chosen, chosen)
+        low, high = _bounds(expression, blanks)
+        keep = (low <= target) & (target <= high)
+        rows, used = rows[keep], used[keep]
+        if not len(rows):
+            return []
+
+    chosen = {name: values[rows[:, position]] for position, name in enumerate(names)}
+    rows = rows[_evaluate(expression, chosen) == target]
+    # put the values back in the order of the blanks, merging the solutions
+    # which only differ in which of two equal values went where
+    solutions = np.empty((len(rows), slots), dtype=np.int64)
+    solutions[:, order] = values[rows]
+    return [tuple(row) for row in np.unique(solutions, axis=0).tolist()]
+
+
+def coin_value(description: str):
+    """Returns the value marked on a coin from its description, if it has one"""
+    match = MARKING.search(description)
+    if match is None:
+        return None
+    marking = match.group(1).lower()
+    return NUMBERS.get(marking, SHAPES.get(marking))
+
+
+def play(output: Callable[[], str]) -> Iterator[str]:
+    """
+    Yields the commands which solve the coin equation in the current room,
+    where `output()` returns what the game wrote in reply to the command
+    yielded last: it looks for the equation, examines every coin in the
+    inventory and then uses the coins in the order of the first solution.
+    Nothing more is yielded if there is no equation or no solution.
+    """
+    yield 'look'
+    match = EQUATION.search(output())
+    if match is None:
+        return
+    yield 'inv'
+    coins = {}
+    for coin in COIN.findall(output()):
+        yield 'look ' + coin
+        value = coin_value(output())
+        if value is not None:
+            coins.setdefault(value, []).append(coin)
+    values = [value for value, names in coins.items() for _ in names]
+    solutions = solve(match.group(0), values)
+    if not solutions:
+        return
+    for value in solutions[0]:
+        yield 'use ' + coins[value].pop()
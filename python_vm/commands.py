@@ -0,0 +1,65 @@
+from typing import Callable, Dict, List
+from . import teleporter
+
+
+def save(vm, args: List[str]):
+    """
+    `save <name>`: writes the memory, registers, stack, instruction pointer
+    and pending input to `data/<name>.sav`, in the format of
+    `python_vm.savefile`.
+    """
+    if not args:
+        vm._output.write(
+            "Please provide a file name. State will be saved into <filename>.sav inside data/\n\n")
+        return
+    vm._save_state(args[-1])
+
+
+def rewire_teleporter(vm, args: List[str]):
+    """
+    `rewire teleporter`: sets the eighth register to the energy level the
+    teleporter expects and skips the confirmation routine, which would take
+    far too long to run, by patching the check at 5483..5491:
+
+        5483: SET  r0 4     ->  SET  r0 6
+        5489: CALL 6027     ->  NOOP NOOP
+    """
+    vm._registers[7] = teleporter.energy_level()
+    vm._write_to_mem(teleporter.EXPECTED, 5485)
+    vm._write_to_mem(21, 5489)
+    vm._write_to_mem(21, 5490)
+    vm._output.write('Teleporter settings altered!\n\n')
+
+
+# commands which act on the virtual machine itself instead of being typed
+# into the game; each maps to a function taking the machine and the words
+# which follow the command
+COMMANDS = {
+    'save': save,
+    'rewire teleporter': rewire_teleporter,
+}
+
+
+class Commands:
+    """
+    The meta-commands of a virtual machine, which sit between its input and
+    the `in` operation: every line read is offered to `__call__` first, and
+    only reaches the program if it is not one of `handlers`.
+
+    Commands are matched on the leading words of a line, so `save game`
+    saves, while `use saved note` is passed on to the game.
+    """
+
+    def __init__(self, vm, commands: Dict[str, Callable] = COMMANDS):
+        self._vm = vm
+        self.handlers = dict(commands)
+
+    def __call__(self, line: str) -> bool:
+        """Runs the meta-command on `line` if there is one, returning whether it did"""
+        words = line.split()
+        for end in range(len(words), 0, -1):
+            handler = self.handlers.get(' '.join(words[:end]))
+            if handler is not None:
+                handler(self._vm, words[end:])
+                return True
+        return False
@@ -0,0 +1,300 @@
+from typing import Iterator, Tuple
+from .opcode import Opcode, NUM_OPERANDS, WRITE_SLOTS, REGISTER_BASE, VALUE_LIMIT
+
+
+def format_value(val: int) -> str:
+    """Formats an operand as a literal number or a register name"""
+    if val < REGISTER_BASE:
+        return str(val)
+    elif val < VALUE_LIMIT:
+        return 'r{}'.format(val - REGISTER_BASE)
+    raise ValueError("Invalid value in binary: {}".format(val))
+
+
+def format_instruction(memory, address: int) -> Tuple[str, int]:
+    """
+    Returns the listing line for the word at `address`, decoded as an
+    instruction if it is a valid opcode and as data otherwise, along with the
+    number of words it takes up.
+    """
+    val = memory[address]
+    try:
+        opcode = Opcode(val)
+    except ValueError:
+        return "{:6} DATA: {}".format(str(address) + ':', val), 1
+
+    num_args = NUM_OPERANDS[val]
+    args = [memory[address + i] for i in range(1, num_args + 1)
+            if address + i < len(memory)]
+    args = [format_value(arg) for arg in args]
+
+    line = "{:6} {:4}".format(str(address) + ':', str(opcode.name.strip('_')))
+    for arg in args:
+        if opcode is Opcode.OUT:
+            try:
+                line += " {}".format(repr(chr(int(arg))))
+            except ValueError:
+                line += " {}".format(arg)
+        else:
+            line += " {:5}".format(arg)
+    return line, num_args + 1
+
+
+def listing(memory) -> Iterator[Tuple[int, str]]:
+    """
+    Decodes `memory` linearly from address 0, yielding the address and
+    listing line of each instruction or data word in turn.
+    """
+    address = 0
+    while address < len(memory):
+        try:
+            line, size = format_instruction(memory, address)
+        except ValueError:
+            line, size = "{:6} DATA: {}".format(
+                str(address) + ':', memory[address]), 1
+        yield address, line
+        address += size
+
+
+# instructions after which execution does not carry on to the next address
+_NO_FALLTHROUGH = (Opcode.HALT.value, Opcode.JMP.value, Opcode.RET.value)
+# operand slot holding the target address of each branching instruction
+_TARGET_SLOTS = {
+    Opcode.JMP.value: 1,
+    Opcode.JT.value: 2,
+    Opcode.JF.value: 2,
+    Opcode.CALL.value: 1,
+}
+_PRINTABLE = frozenset(range(32, 127)) | {10}
+_DATA_PER_LINE = 8
+
+
+def _decode(memory, address: int):
+    """
+    Returns the opcode and operands of the instruction at `address`, or None
+    if the words there do not form a valid instruction.
+    """
+    if not 0 <= address < len(memory):
+        return None
+    op = memory[address]
+    if op >= len(NUM_OPERANDS):
+        return None
+    end = address + 1 + NUM_OPERANDS[op]
+    if end > len(memory):
+        return None
+    args = tuple(memory[address + 1:end])
+    if any(arg >= VALUE_LIMIT for arg in args):
+        return None
+    return op, args
+
+
+def _follow(memory, code: dict, functions: set, labels: set,
+            pending: list, pointers: set, targets: dict, strict: bool = False):
+    """
+    Decodes everything reachable from the addresses in `pending` into `code`,
+    collecting call and jump targets into `functions` and `labels`, and the
+    target of each branch that could be resolved into `targets`. Literals
+    held in registers at a `call` are added to `pointers`.
+
+    A path which runs into words that are not an instruction ends there, and
+    the other pending addresses are still followed. Returns whether every
+    path decoded cleanly; with `strict`, gives up on the first that does not.
+    """
+    clean = True
+    while pending:
+        address = pending.pop()
+        # registers set to a literal earlier in this straight run of code,
+        # which resolves targets such as `set r0 1287; call r0`
+        known = {}
+        while address not in code:
+            decoded = _decode(memory, address)
+            if decoded is None:
+                if strict:
+                    return False
+                clean = False
+                break
+            code[address] = decoded
+            op, args = decoded
+            slot = _TARGET_SLOTS.get(op)
+            if slot is not None:
+                target = known.get(args[slot - 1], args[slot - 1])
+                if target < REGISTER_BASE:
+                    (functions if op == Opcode.CALL.value else labels).add(target)
+                    targets[address] = target
+                    pending.append(target)
+            if op == Opcode.CALL.value:
+                pointers.update(known.values())
+                # the subroutine may change any register
+                known.clear()
+            elif WRITE_SLOTS[op]:
+                if op == Opcode.SET.value and args[1] < REGISTER_BASE:
+                    known[args[0]] = args[1]
+                else:
+                    known.pop(args[0], None)
+            if op in _NO_FALLTHROUGH:
+                break
+            address += 1 + len(args)
+    return clean
+
+
+def trace_code(memory, entries=(0,), pointers: bool = True) -> Tuple[dict, set, set]:
+    """
+    Finds the instructions reachable from `entries` by following execution
+    through fall-throughs and the literal targets of `jmp`, `jt`, `jf` and
+    `call`, including targets held in a register which was set to a literal
+    just before.
+
+    With `pointers`, literals passed to a subroutine in registers are taken
+    to be function pointers too, as long as the code they lead to decodes
+    cleanly and does not start with `halt`.
+
+    Returns the instructions found, as `address: (opcode, operands)`, the
+    addresses called as functions and the other addresses jumped to. Other
+    targets computed at run time cannot be followed, so code only reached
+    that way has to be given in `entries` to be decoded.
+    """
+    return _trace(memory, entries, pointers)[:3]
+
+
+def _trace(memory, entries, pointers: bool) -> tuple:
+    """`trace_code`, also returning the target of each resolved branch"""
+    code = {}
+    functions = set()
+    labels = set()
+    candidates = set()
+    targets = {}
+    _follow(memory, code, functions, labels, list(entries), candidates, targets)
+    tried = set()
+    while pointers and candidates - tried:
+        address = min(candidates - tried)
+        tried.add(address)
+        if address in code or address >= len(memory) or memory[address] == 0:
+            continue
+        # decode into scratch copies, keeping them only if all of it is code
+        trial = (dict(code), set(functions), set(labels), set(candidates),
+                 dict(targets))
+        if _follow(memory, *trial[:3], [address], *trial[3:], strict=True):
+            code, functions, labels, candidates, targets = trial
+            functions.add(address)
+    labels -= functions
+    return code, functions, labels, targets
+
+
+def _label(address: int, functions: set, labels: set) -> str:
+    if address in functions:
+        return 'sub_{}'.format(address)
+    if address in labels:
+        return 'loc_{}'.format(address)
+    return str(address)
+
+
+def _string(text) -> str:
+    return '"{}"'.format(''.join(chr(ordinal) for ordinal in text).encode(
+        'unicode_escape').decode('ascii').replace('"', '\\"'))
+
+
+def string_at(memory, address: int, end: int):
+    """
+    Returns the characters of the string stored at `address` as a length
+    followed by that many printable characters, if there is one ending before
+    `end`, and None otherwise.
+    """
+    length = memory[address]
+    if length < 2 or address + length >= end:
+        return None
+    text = memory[address + 1:address + 1 + length]
+    if all(ordinal in _PRINTABLE for ordinal in text):
+        return text
+    return None
+
+
+def data_regions(memory, code: dict) -> Iterator[Tuple[int, int]]:
+    """Yields the start and end of each run of words not covered by `code`"""
+    address = 0
+    while address < len(memory):
+        if address in code:
+            address += 1 + len(code[address][1])
+            continue
+        end = address + 1
+        while end < len(memory) and end not in code:
+            end += 1
+        yield address, end
+        address = end
+
+
+def _data_lines(memory, start: int, end: int) -> Iterator[str]:
+    """
+    Yields lines for the data words in `start..end`, picking out strings
+    stored as a length followed by that many printable characters.
+    """
+    address = start
+    words = []
+    while address < end:
+        text = string_at(memory, address, end)
+        if text is not None:
+            if words:
+                yield "{:6} DATA {}".format(
+                    str(address - len(words)) + ':', ', '.join(map(str, words)))
+                words = []
+            yield "{:6} STR  {}".format(str(address) + ':', _string(text))
+            address += 1 + len(text)
+            continue
+        words.append(memory[address])
+        address += 1
+        if len(words) == _DATA_PER_LINE or address == end:
+            yield "{:6} DATA {}".format(
+                str(address - len(words)) + ':', ', '.join(map(str, words)))
+            words = []
+
+
+def disassemble(memory, entries=(0,)) -> Iterator[str]:
+    """
+    Disassembles `memory`, which may be the challenge binary or a snapshot of
+    memory taken later on, yielding the listing one line at a time.
+
+    Code is found by `trace_code` starting from `entries`, and everything
+    else is listed as data. Functions and jump targets are labelled, and
+    each run of `out` instructions with literal operands is shown as a
+    single string.
+    """
+    code, functions, labels = trace_code(memory, entries)
+    out = Opcode.OUT.value
+    address = 0
+    while address < len(memory):
+        if address not in code:
+            end = address + 1
+            while end < len(memory) and end not in code:
+                end += 1
+            yield from _data_lines(memory, address, end)
+            address = end
+            continue
+
+        if address in functions:
+            yield ''
+        if address in functions or address in labels:
+            yield _label(address, functions, labels) + ':'
+
+        op, args = code[address]
+        if op == out and args[0] < REGISTER_BASE:
+            start = address
+            text = []
+            while address in code and code[address][0] == out \
+                    and code[address][1][0] < REGISTER_BASE \
+                    and (address == start or (address not in functions
+                                              and address not in labels)):
+                text.append(code[address][1][0])
+                address += 2
+            yield "{:6} OUT  {}".format(str(start) + ':', _string(text))
+            continue
+
+        slot = _TARGET_SLOTS.get(op)
+        operands = []
+        for index, arg in enumerate(args, 1):
+            if index == slot and arg < REGISTER_BASE:
+                operands.append(_label(arg, functions, labels))
+            else:
+                operands.append(format_value(arg))
+        line = "{:6} {:4}".format(
+            str(address) + ':', Opcode(op).name.strip('_'))
+        yield (line + ''.join(" {:5}".format(arg) for arg in operands)).rstrip()
+        address += 1 + len(args)
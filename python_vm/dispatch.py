@@ -0,0 +1,512 @@
+import sys
+from itertools import repeat
+from operator import length_hint
+from .opcode import (
+    NUM_OPERANDS, OPERATION_NAMES, WRITE_SLOTS, REGISTER_BASE, VALUE_LIMIT
+)
+from .exceptions import (
+    InvalidNumberError, EmptyStackError, InvalidOpcodeError, WatchpointHit
+)
+from .watch import Hit
+from .snapshot import PAGE_SHIFT
+
+
+# shared by every value table so that the int objects are only created once
+_LITERALS = tuple(range(REGISTER_BASE))
+
+
+class DispatchEngine:
+    """
+    Execution engine which decodes each instruction of the image into a handler
+    with its operands already bound, and stores it in a flat table indexed by
+    address.
+
+    Operands are resolved through a value table in which indices 0..32767 map
+    to themselves and indices 32768..32775 hold the registers, so reading any
+    operand is a single subscript. Entries are decoded the first time their
+    address is executed and are discarded whenever memory underneath them is
+    written, which keeps self-modifying code correct.
+
+    Anything unusual (input, invalid operands, writes into a literal operand
+    slot) is delegated to the reference `Operations` instance of the virtual
+    machine, so error reporting and side effects match `VirtualMachine.execute`.
+
+    Breakpoints and watchpoints are checked by wrapping the handlers of just
+    the instructions which could hit them as they are decoded, so the rest
+    run exactly as they do when none are set.
+    """
+
+    def __init__(self, vm):
+        self._vm = vm
+        self._mem = vm._bin
+        self._stack = vm._stack
+        self._ops = vm._ops
+        self._output = vm._output
+        self._values = list(_LITERALS)
+        self._values.extend(vm._registers)
+        self._code = [None] * len(self._mem)
+        self._watch = vm._watchpoints
+        # pages of memory written since the last snapshot
+        self._dirty = vm._dirty
+        # the breakpoint execution stopped at, which lets it run when resumed
+        self._resume_at = None
+
+    def _load_registers(self):
+        self._values[REGISTER_BASE:VALUE_LIMIT] = self._vm._registers
+
+    def _store_registers(self):
+        registers = self._vm._registers
+        for reg, val in enumerate(self._values[REGISTER_BASE:VALUE_LIMIT]):
+            registers[reg] = val
+
+    def _invalidate(self, address: int):
+        self._dirty.add(address >> PAGE_SHIFT)
+        lo = address - 3 if address > 3 else 0
+        self._code[lo:address + 1] = [None] * (address + 1 - lo)
+
+    def _invalidate_all(self):
+        self._code[:] = [None] * len(self._code)
+
+    def execute(self):
+        try:
+            self.run()
+        except (InvalidNumberError, EmptyStackError, InvalidOpcodeError) as e:
+            sys.exit(f"Error in binary at index {self._vm._curr_idx}: {e}")
+        except KeyboardInterrupt:
+            self._output.flush()
+            print(f"\n\nExiting program...")
+            sys.exit(0)
+
+    def run(self, budget: int = None):
+        """
+        Runs from the current instruction of the virtual machine, leaving its
+        state ready to carry on from wherever this stops, and keeping decoded
+        handlers for the next call.
+
+        This ends by raising `SystemExit` on halt, `EOFError` when input runs
+        out, `WatchpointHit` when a breakpoint or watchpoint stops it, or the
+        error an instruction hit, or by returning once `budget`
+        handlers have run (one per instruction, or per translated block for
+        `BlockEngine`). Either way, `steps` is set to the number of handlers
+        which completed.
+        """
+        if budget is None:
+            budget = sys.maxsize
+        code = self._code
+        pc = self._vm._curr_idx
+        # the iterator knows how many turns it has left, so the loop does not
+        # need a counter of its own
+        turns = repeat(None, budget)
+        if self._resume_at != pc:
+            self._resume_at = None
+        self._load_registers()
+        try:
+            while True:
+                try:
+                    for _ in turns:
+                        pc = code[pc]()
+                    break
+                except TypeError:
+                    if code[pc] is not None:
+                        raise
+                    code[pc] = self._decode(pc)
+                    turns = repeat(None, length_hint(turns) + 1)
+        except WatchpointHit as e:
+            if e.hit.kind == 'break':
+                # the instruction has not run yet
+                self._resume_at = pc
+                turns = repeat(None, length_hint(turns) + 1)
+            else:
+                pc = e.resume
+            raise
+        except BaseException:
+            # the handler which raised did not complete
+            turns = repeat(None, length_hint(turns) + 1)
+            raise
+        finally:
+            self.steps = budget - length_hint(turns)
+            self._vm._curr_idx = pc
+            self._store_registers()
+            self._output.flush()
+
+    def _invalidate_range(self, start: int, end: int):
+        """Discards the handlers covering any address in `start`..`end` - 1"""
+        lo = start - 3 if start > 3 else 0
+        self._code[lo:end] = [None] * (end - lo)
+
+    def _decode(self, pc: int):
+        op = self._mem[pc]
+        if op >= len(NUM_OPERANDS):
+            raise InvalidOpcodeError(f"{op} is not listed as a valid opcode")
+        args = self._operands(pc, op)
+        if not self._is_plain(op, args):
+            handler = self._delegate(pc, op)
+        else:
+            handler = getattr(self, '_decode_' + OPERATION_NAMES[op])(pc, *args)
+        if self._watch and self._is_watched(pc, op, args):
+            return self._watched(pc, op, args, handler)
+        return handler
+
+    def _operands(self, pc: int, op: int) -> list:
+        mem = self._mem
+        return [mem[pc + i] for i in range(1, NUM_OPERANDS[op] + 1)]
+
+    @staticmethod
+    def _is_plain(op: int, args: list) -> bool:
+        """
+        Checks that every operand read is a literal or register and every
+        operand written is a register, i.e. that the instruction can run
+        without going through `Operations`.
+        """
+        writes = WRITE_SLOTS[op]
+        for slot, arg in enumerate(args, 1):
+            if slot in writes:
+                if not REGISTER_BASE <= arg < VALUE_LIMIT:
+                    return False
+            elif arg >= VALUE_LIMIT:
+                return False
+        return True
+
+    def _is_watched(self, pc: int, op: int, args: list) -> bool:
+        """Checks whether the instruction could hit a breakpoint or watchpoint"""
+        watch = self._watch
+        if pc in watch.breaks:
+            return True
+        if op == 16:
+            return bool(watch.memory)
+        if op == 17:
+            return args[0] in watch.calls or (
+                args[0] >= REGISTER_BASE and bool(watch.calls))
+        if WRITE_SLOTS[op]:
+            if REGISTER_BASE <= args[0] < VALUE_LIMIT:
+                return args[0] - REGISTER_BASE in watch.registers
+            # written through the operand slot itself
+            return pc + 1 in watch.memory
+        return False
+
+    def _watched(self, pc: int, op: int, args: list, handler):
+        """Wraps `handler` in the checks for the watchpoints it could hit"""
+        watch = self._watch
+        V = self._values
+        mem = self._mem
+        if op == 16:
+            a = args[0]
+            handler = self._watch_writes(
+                pc, 'memory', watch.memory, lambda: V[a], mem, 0, handler)
+        elif op == 17:
+            handler = self._watch_calls(pc, args[0], handler)
+        elif WRITE_SLOTS[op]:
+            a = args[0]
+            if REGISTER_BASE <= a < VALUE_LIMIT:
+                handler = self._watch_writes(
+                    pc, 'register', watch.registers, lambda: a - REGISTER_BASE,
+                    V, REGISTER_BASE, handler)
+            else:
+                handler = self._watch_writes(
+                    pc, 'memory', watch.memory, lambda: pc + 1, mem, 0, handler)
+        breaks = watch.breaks.get(pc)
+        if breaks is not None:
+            handler = self._watch_break(pc, breaks, handler)
+        return handler
+
+    def _watch_writes(self, pc: int, kind: str, points: dict, locate, cells,
+                      base: int, inner):
+        """
+        Wraps `inner`, an instruction writing the memory cell or register
+        `locate()` returns, which is held at `base` onwards of `cells`
+        """
+        def handler():
+            target = locate()
+            watched = points.get(target)
+            if watched is None:
+                return inner()
+            old = cells[base + target]
+            nxt = inner()
+            self._hit(Hit(kind, target, pc, old, cells[base + target]),
+                      watched, nxt)
+            return nxt
+        return handler
+
+    def _watch_calls(self, pc: int, a: int, inner):
+        V = self._values
+        points = self._watch.calls
+
+        def handler():
+            target = V[a]
+            nxt = inner()
+            watched = points.get(target)
+            if watched is not None:
+                self._hit(Hit('call', target, pc), watched, nxt)
+            return nxt
+        return handler
+
+    def _watch_break(self, pc: int, points: list, inner):
+        def handler():
+            if self._resume_at == pc:
+                self._resume_at = None
+            else:
+                self._hit(Hit('break', pc, pc), points, pc)
+            return inner()
+        return handler
+
+    def _hit(self, hit: Hit, points: list, resume: int):
+        """
+        Runs the watchpoints `points` for `hit`, with the state of the
+        virtual machine up to date, and stops at `resume` if they ask to
+        """
+        self._store_registers()
+        self._vm._curr_idx = hit.address
+        try:
+            stop = self._watch.triggered(points, hit)
+        finally:
+            self._load_registers()
+        if stop:
+            raise WatchpointHit(hit, resume)
+
+    def _delegate(self, pc: int, op: int):
+        """
+        Builds a handler which runs the instruction at `pc` through the
+        reference `Operations`, synchronising registers around the call.
+        """
+        operation = getattr(self._ops, OPERATION_NAMES[op])
+        vm = self._vm
+        mem = self._mem
+        writes_operand = bool(WRITE_SLOTS[op])
+
+        def handler():
+            self._store_registers()
+            vm._curr_idx = pc
+            try:
+                nxt = operation(pc)
+            finally:
+                self._load_registers()
+            if writes_operand and not REGISTER_BASE <= mem[pc + 1] < VALUE_LIMIT:
+                self._invalidate(pc + 1)
+            return nxt
+        return handler
+
+    def _decode_halt(self, pc):
+        return self._ops.halt
+
+    def _decode_set(self, pc, a, b):
+        V = self._values
+        nxt = pc + 3
+
+        def handler():
+            V[a] = V[b]
+            return nxt
+        return handler
+
+    def _decode_push(self, pc, a):
+        V = self._values
+        push = self._stack.append
+        nxt = pc + 2
+
+        def handler():
+            push(V[a])
+            return nxt
+        return handler
+
+    def _decode_pop(self, pc, a):
+        V = self._values
+        stack = self._stack
+        nxt = pc + 2
+
+        def handler():
+            if not stack:
+                raise EmptyStackError("Attempting to pop from empty stack")
+            V[a] = stack.pop()
+            return nxt
+        return handler
+
+    def _decode_eq(self, pc, a, b, c):
+        V = self._values
+        nxt = pc + 4
+
+        def handler():
+            V[a] = 1 if V[b] == V[c] else 0
+            return nxt
+        return handler
+
+    def _decode_gt(self, pc, a, b, c):
+        V = self._values
+        nxt = pc + 4
+
+        def handler():
+            V[a] = 1 if V[b] > V[c] else 0
+            return nxt
+        return handler
+
+    def _decode_jmp(self, pc, a):
+        if a < REGISTER_BASE:
+            return lambda: a
+        V = self._values
+        return lambda: V[a]
+
+    def _decode_jt(self, pc, a, b):
+        V = self._values
+        nxt = pc + 3
+
+        def handler():
+            return V[b] if V[a] != 0 else nxt
+        return handler
+
+    def _decode_jf(self, pc, a, b):
+        V = self._values
+        nxt = pc + 3
+
+        def handler():
+            return V[b] if V[a] == 0 else nxt
+        return handler
+
+    def _decode_add(self, pc, a, b, c):
+        V = self._values
+        nxt = pc + 4
+
+        def handler():
+            V[a] = (V[b] + V[c]) % 32768
+            return nxt
+        return handler
+
+    def _decode_mult(self, pc, a, b, c):
+        V = self._values
+        nxt = pc + 4
+
+        def handler():
+            V[a] = (V[b] * V[c]) % 32768
+            return nxt
+        return handler
+
+    def _decode_mod(self, pc, a, b, c):
+        V = self._values
+        nxt = pc + 4
+
+        def handler():
+            V[a] = V[b] % V[c]
+            return nxt
+        return handler
+
+    def _decode_and_(self, pc, a, b, c):
+        V = self._values
+        nxt = pc + 4
+
+        def handler():
+            V[a] = V[b] & V[c]
+            return nxt
+        return handler
+
+    def _decode_or_(self, pc, a, b, c):
+        V = self._values
+        nxt = pc + 4
+
+        def handler():
+            V[a] = V[b] | V[c]
+            return nxt
+        return handler
+
+    def _decode_not_(self, pc, a, b):
+        V = self._values
+        nxt = pc + 3
+
+        def handler():
+            V[a] = (~V[b]) % 32768
+            return nxt
+        return handler
+
+    def _decode_rmem(self, pc, a, b):
+        V = self._values
+        mem = self._mem
+        nxt = pc + 3
+
+        def handler():
+            val = mem[V[b]]
+            if val >= VALUE_LIMIT:
+                raise InvalidNumberError("Encountered invalid number {}", val)
+            V[a] = V[val]
+            return nxt
+        return handler
+
+    def _decode_wmem(self, pc, a, b):
+        V = self._values
+        mem = self._mem
+        invalidate = self._invalidate
+        nxt = pc + 3
+
+        def handler():
+            val = V[b]
+            address = V[a]
+            if REGISTER_BASE <= mem[address] < VALUE_LIMIT:
+                V[mem[address]] = val
+            else:
+                mem[address] = val
+                invalidate(address)
+            return nxt
+        return handler
+
+    def _decode_call(self, pc, a):
+        V = self._values
+        push = self._stack.append
+        intrinsics = self._vm._intrinsics
+        nxt = pc + 2
+
+        if a < REGISTER_BASE and a in intrinsics:
+            intrinsic = intrinsics[a]
+
+            def handler():
+                self._run_intrinsic(intrinsic)
+                return nxt
+        elif a >= REGISTER_BASE and intrinsics:
+            def handler():
+                intrinsic = intrinsics.get(V[a])
+                if intrinsic is None:
+                    push(nxt)
+                    return V[a]
+                self._run_intrinsic(intrinsic)
+                return nxt
+        else:
+            def handler():
+                push(nxt)
+                return V[a]
+        return handler
+
+    def _run_intrinsic(self, intrinsic):
+        self._store_registers()
+        try:
+            intrinsic()
+        finally:
+            self._load_registers()
+
+    def _decode_ret(self, pc):
+        stack = self._stack
+        halt = self._ops.halt
+
+        def handler():
+            if not stack:
+                halt(override=True)
+            return stack.pop()
+        return handler
+
+    def _decode_out(self, pc, a):
+        V = self._values
+        put = self._output.put
+        nxt = pc + 2
+
+        def handler():
+            put(V[a])
+            return nxt
+        return handler
+
+    def _decode_in_(self, pc, a):
+        in_ = self._delegate(pc, 20)
+
+        def handler():
+            nxt = in_()
+            if nxt == pc:
+                # meta-commands such as `rewire teleporter` patch memory
+                self._invalidate_all()
+            return nxt
+        return handler
+
+    def _decode_noop(self, pc):
+        nxt = pc + 1
+        return lambda: nxt
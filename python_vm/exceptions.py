@@ -9,3 +9,21 @@ class InvalidNumberError(Exception):
 class EmptyStackError(Exception):
     """Raised when attempting to pop an element from an empty stack."""
     pass
+
+
+class InvalidOpcodeError(Exception):
+    """Raised when a word which is not a valid opcode is executed."""
+    pass
+
+
+class WatchpointHit(Exception):
+    """
+    Raised when a breakpoint or watchpoint stops execution; `resume` is the
+    address execution carries on from.
+    """
+
+    def __init__(self, hit, resume: int):
+        super().__init__("Stopped by {} watchpoint on {} at index {}".format(
+            hit.kind, hit.target, hit.address))
+        self.hit = hit
+        self.resume = resume
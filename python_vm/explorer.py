@@ -0,0 +1,193 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from .virtual_machine import VirtualMachine
+from .snapshot import Snapshot, PAGE_SIZE
+from .opcode import Opcode
+from .coins import EQUATION
+
+ROOM = re.compile(r'^== (.+) ==$', re.M)
+ITEMS = re.compile(r'^Things of interest here:\n((?:- .*\n)*)', re.M)
+EXITS = re.compile(r'^There (?:is|are) \d+ exits?:\n((?:- .*\n)*)', re.M)
+INVENTORY = re.compile(r'^Your inventory:\n((?:- .*\n)*)', re.M)
+# codes are twelve letters of mixed case, such as `dyGyPzbAEYtZ`
+CODE = re.compile(r'\b(?=[A-Za-z]*[a-z])(?=[A-Za-z]*[A-Z][A-Za-z]*[A-Z])[A-Za-z]{12}\b')
+
+# commands which leave the game as it was, used to find the memory the game
+# uses as scratch space for reading input
+NEUTRAL_COMMANDS = ('look', 'inv', 'x' * 40)
+
+# the machine each worker process restores states into
+_worker_vm = None
+
+
+def _listing(pattern, text: str) -> list:
+    matches = pattern.findall(text)
+    if not matches:
+        return []
+    return [line[2:] for line in matches[-1].splitlines()]
+
+
+def _awaiting_input(vm: VirtualMachine) -> bool:
+    return vm._bin[vm._curr_idx] == Opcode.IN_.value
+
+
+def _expand(snapshot: Snapshot, engine: str) -> tuple:
+    """
+    Looks around in the state captured by `snapshot` and tries every exit and
+    item there from it. Returns the text of `look` and `inv`, and for each
+    command tried, the command, its output, the resulting state as changes
+    against `snapshot`, and whether the game is still waiting for input.
+    """
+    global _worker_vm
+    # the machine and its decoded code are kept from one state to the next,
+    # as long as the memory size and engine are the same
+    if _worker_vm is None or len(_worker_vm._bin) != snapshot.size() \
+            or _worker_vm._engine != engine:
+        _worker_vm = VirtualMachine(snapshot.memory(), engine=engine)
+    vm = _worker_vm
+
+    vm.restore(snapshot)
+    look = vm.run_script(['look'])
+    vm.restore(snapshot)
+    inventory = vm.run_script(['inv'])
+
+    commands = _listing(EXITS, look)
+    commands += ['take ' + item for item in _listing(ITEMS, look)]
+    commands += ['use ' + item for item in _listing(INVENTORY, inventory)]
+    if EQUATION.search(look):
+        commands.append('solve coins')
+
+    results = []
+    for command in commands:
+        vm.restore(snapshot)
+        transcript = vm.run_script([command])
+        # only the pages written since the restore are read again
+        pages = vm.snapshot().pages
+        changed = {number: page for number, page in enumerate(pages)
+                   if page is not snapshot.pages[number]}
+        results.append((command, transcript, changed, tuple(vm._registers),
+                        tuple(vm._stack), vm._curr_idx, _awaiting_input(vm)))
+    return look, inventory, results
+
+
+class Explorer:
+    """
+    Searches the text adventure breadth first, starting from the state of a
+    virtual machine waiting for input.
+
+    From each state, every exit is taken, every item in the room is taken
+    and every item in the inventory is used, and an equation on the wall is
+    solved with the coins at hand by the `solve coins` directive. States are
+    told apart by their memory, registers and stack, ignoring the words the
+    game only uses to read input, so that reaching the same room with the
+    same items by two routes is only explored once.
+
+    Each level of the search is spread across a pool of `processes` worker
+    processes; without it, states are expanded in this process. `report` is
+    called as `report(kind, name, path)` for every room, item and code-like
+    string the first time it is seen, with the commands that led to it.
+    """
+
+    def __init__(self, vm: VirtualMachine, processes: int = None,
+                 report=None):
+        self._vm = vm
+        self._processes = processes
+        self._report = report or (lambda kind, name, path: None)
+        self._scratch = self._find_scratch()
+        self.rooms = {}
+        self.items = {}
+        self.codes = {}
+        self.dead_ends = []
+
+    def _find_scratch(self) -> tuple:
+        """
+        Returns the memory addresses and stack positions which differ after
+        commands that otherwise leave the game untouched.
+        """
+        start = self._vm.snapshot()
+        memory = list(self._vm._bin)
+        states = []
+        for command in NEUTRAL_COMMANDS:
+            vm = self._vm.fork(start)
+            vm.run_script([command])
+            states.append((list(vm._bin), list(vm._stack)))
+        addresses = {i for words, _ in states
+                     for i, word in enumerate(words) if word != memory[i]}
+        positions = {i for _, stack in states
+                     for i, value in enumerate(stack)
+                     if i >= len(start.stack) or value != start.stack[i]}
+        return frozenset(addresses), frozenset(positions)
+
+    def digest(self, snapshot: Snapshot) -> int:
+        """Returns a hash of `snapshot` which ignores the input scratch space"""
+        addresses, positions = self._scratch
+        pages = list(snapshot.pages)
+        for address in addresses:
+            number, offset = divmod(address, PAGE_SIZE)
+            page = bytearray(pages[number])
+            page[offset * 2:offset * 2 + 2] = b'\0\0'
+            pages[number] = bytes(page)
+        stack = tuple(0 if i in positions else value
+                      for i, value in enumerate(snapshot.stack))
+        return hash((tuple(pages), snapshot.registers, stack,
+                     snapshot.curr_idx))
+
+    def _found(self, found: dict, kind: str, names, path: tuple):
+        for name in names:
+            if name not in found:
+                found[name] = path
+                self._report(kind, name, path)
+
+    def explore(self, max_depth: int = None, max_states: int = None) -> int:
+        """
+        Runs the search until no new states are left, up to `max_depth`
+        commands from the start and `max_states` distinct states. Returns the
+        number of states explored.
+        """
+        start = self._vm.snapshot()
+        seen = {self.digest(start)}
+        frontier = [(start, ())]
+        depth = 0
+        pool = None
+        if self._processes and self._processes > 1:
+            pool = ProcessPoolExecutor(self._processes)
+        try:
+            while frontier:
+                snapshots = [snapshot for snapshot, _ in frontier]
+                engines = [self._vm._engine] * len(frontier)
+                if pool is None:
+                    expanded = map(_expand, snapshots, engines)
+                else:
+                    expanded = pool.map(_expand, snapshots, engines)
+
+                next_frontier = []
+                for (snapshot, path), (look, inventory, results) in zip(frontier, expanded):
+                    self._found(self.rooms, 'room', ROOM.findall(look), path)
+                    self._found(self.items, 'item', _listing(ITEMS, look) +
+                                _listing(INVENTORY, inventory), path)
+                    for command, transcript, changed, registers, stack, curr_idx, waiting in results:
+                        route = path + (command,)
+                        self._found(self.codes, 'code',
+                                    CODE.findall(transcript), route)
+                        if not waiting:
+                            self.dead_ends.append(route)
+                            continue
+                        pages = tuple(changed.get(number, page)
+                                      for number, page in enumerate(snapshot.pages))
+                        state = Snapshot(pages, registers, stack, curr_idx, ())
+                        key = self.digest(state)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        if max_states is not None and len(seen) > max_states:
+                            return len(seen) - 1
+                        next_frontier.append((state, route))
+
+                depth += 1
+                if max_depth is not None and depth >= max_depth:
+                    break
+                frontier = next_frontier
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return len(seen)
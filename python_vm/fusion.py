@@ -0,0 +1,148 @@
+import sys
+from typing import Callable, Optional, Tuple
+from .opcode import NUM_OPERANDS, OPERATION_NAMES, Opcode
+from .dispatch import DispatchEngine
+
+OUT, PUSH, POP = Opcode.OUT.value, Opcode.PUSH.value, Opcode.POP.value
+EQ, GT, ADD = Opcode.EQ.value, Opcode.GT.value, Opcode.ADD.value
+JT, JF = Opcode.JT.value, Opcode.JF.value
+
+# the longest run of `out`, `push` or `pop` counted as one sequence
+MAX_RUN = 64
+
+# opcodes which never fall through to the next instruction, or only
+# sometimes do, so that they do not pair up with it
+BRANCHES = frozenset(op.value for op in (
+    Opcode.HALT, Opcode.JMP, Opcode.JT, Opcode.JF, Opcode.CALL, Opcode.RET))
+
+# opcodes which can start a fused sequence
+STARTS = frozenset((OUT, PUSH, POP, ADD, EQ, GT))
+
+# the sequences which could be fused into one handler, by name
+PATTERNS = ('out run', 'push run', 'pop run', 'add+jump', 'compare+jump')
+
+
+def _instruction(mem, pc: int):
+    """Returns the opcode and operands at `pc`, or None if it is not valid"""
+    op = mem[pc]
+    if op >= len(NUM_OPERANDS) or pc + NUM_OPERANDS[op] >= len(mem):
+        return None
+    return op, [mem[pc + i] for i in range(1, NUM_OPERANDS[op] + 1)]
+
+
+def _plain(pc: int, op: int, args: list) -> bool:
+    return DispatchEngine._is_plain(op, args)
+
+
+def match(mem, pc: int, usable: Callable = None) -> Optional[Tuple[str, list]]:
+    """
+    Finds a fusable sequence starting at `pc`, returning its name from
+    `PATTERNS` and its instructions as `(address, opcode, operands)`, or
+    None. Every instruction in it must pass `usable(address, opcode,
+    operands)`; by default, that all of its operands are plain.
+
+    The sequences are runs of two or more `out`, `push` or `pop`, and an
+    `add`, `eq` or `gt` followed by a `jt` or `jf` testing the register it
+    just wrote, such as the `ADD rX rX 32767; JT rX` which ends a countdown.
+    """
+    if usable is None:
+        usable = _plain
+    instructions = []
+    while len(instructions) < MAX_RUN:
+        found = _instruction(mem, pc)
+        if found is None or not usable(pc, *found):
+            break
+        op, args = found
+        if instructions:
+            first = instructions[0][1]
+            if first in (OUT, PUSH, POP):
+                if op != first:
+                    break
+            elif op in (JT, JF) and args[0] == instructions[0][2][0]:
+                instructions.append((pc, op, args))
+                break
+            else:
+                return None
+        elif op not in STARTS:
+            return None
+        instructions.append((pc, op, args))
+        pc += 1 + len(args)
+    if len(instructions) < 2 or instructions[-1][1] in (ADD, EQ, GT):
+        return None
+    first = instructions[0][1]
+    if first in (ADD, EQ, GT):
+        return ('add+jump' if first == ADD else 'compare+jump'), instructions
+    return OPERATION_NAMES[first] + ' run', instructions
+
+
+def instruction_mix(mem, hits: dict) -> dict:
+    """
+    Works out from the per-address instruction counts of a `Profile`, and
+    the memory the run finished with, how often each opcode ran, how often
+    each pair of opcodes ran back to back, and how many dispatches each of
+    `PATTERNS` would save if fused.
+
+    Pairs are only counted where the first instruction always falls through
+    to the second, and a sequence is only counted from an instruction which
+    does not itself follow one of the same sequence, as fused code would be
+    dispatched. Both are worked out against memory as it is at the end, so
+    code which was overwritten during the run is counted as it ended up.
+    """
+    opcodes = {}
+    pairs = {}
+    saved = {name: [0, 0] for name in PATTERNS}
+    for pc, count in hits.items():
+        found = _instruction(mem, pc)
+        if found is None:
+            continue
+        op, args = found
+        name = OPERATION_NAMES[op]
+        opcodes[name] = opcodes.get(name, 0) + count
+        after = pc + 1 + len(args)
+        if op not in BRANCHES and after < len(mem) and mem[after] < len(NUM_OPERANDS):
+            pair = (name, OPERATION_NAMES[mem[after]])
+            pairs[pair] = pairs.get(pair, 0) + count
+
+        fused = match(mem, pc)
+        if fused is None:
+            continue
+        pattern, instructions = fused
+        if pattern.endswith(' run') and _follows(mem, hits, pc, instructions[0][1]):
+            continue
+        saved[pattern][0] += 1
+        saved[pattern][1] += count * (len(instructions) - 1)
+    return {
+        'instructions': sum(hits.values()),
+        'opcodes': opcodes,
+        'pairs': pairs,
+        'fusions': {name: {'sites': sites, 'dispatches saved': dispatches}
+                    for name, (sites, dispatches) in saved.items()},
+    }
+
+
+def _follows(mem, hits: dict, pc: int, op: int) -> bool:
+    """
+    Checks whether the instruction at `pc` comes straight after an `op` which
+    ran, rather than after an operand which happens to equal `op`
+    """
+    start = pc - NUM_OPERANDS[op] - 1
+    return start in hits and mem[start] == op
+
+
+def dump_mix(mix: dict, stream=None, top: int = 15):
+    """Writes the report `instruction_mix` returns out to `stream`"""
+    stream = stream or sys.stdout
+    total = mix['instructions']
+    print("{:,} instructions".format(total), file=stream)
+    print("\nOpcodes:", file=stream)
+    for name, count in sorted(mix['opcodes'].items(), key=lambda item: -item[1])[:top]:
+        print("  {:8} {:>12,} {:>6.1%}".format(name, count, count / total), file=stream)
+    print("\nFalling-through pairs:", file=stream)
+    for (first, second), count in sorted(mix['pairs'].items(), key=lambda item: -item[1])[:top]:
+        print("  {:17} {:>12,} {:>6.1%}".format(
+            first + ' ' + second, count, count / total), file=stream)
+    print("\nFusions:", file=stream)
+    for name, stats in mix['fusions'].items():
+        print("  {:13} {:>5} sites {:>12,} dispatches saved {:>6.1%}".format(
+            name, stats['sites'], stats['dispatches saved'],
+            stats['dispatches saved'] / total), file=stream)
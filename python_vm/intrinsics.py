@@ -0,0 +1,41 @@
+from functools import lru_cache
+
+# entry point of the teleporter confirmation routine
+CONFIRMATION_ADDRESS = 6027
+
+
+@lru_cache(maxsize=8)
+def _confirmation_rows(r7: int) -> list:
+    # rows[m][n] holds the result of the routine for r0 = m and r1 = n
+    return [[(n + 1) % 32768 for n in range(32768)]]
+
+
+def confirmation_value(r0: int, r1: int, r7: int) -> int:
+    """
+    Computes the result of the confirmation routine at 6027, which is the
+    following Ackermann-style recurrence with every value taken modulo 32768:
+
+        f(0, n) = n + 1
+        f(m, 0) = f(m - 1, r7)
+        f(m, n) = f(m - 1, f(m, n - 1))
+
+    Whole rows of `f` are built bottom-up and kept per value of r7.
+    """
+    rows = _confirmation_rows(r7)
+    while len(rows) <= r0:
+        prev = rows[-1]
+        row = [prev[r7]] * 32768
+        for n in range(1, 32768):
+            row[n] = prev[row[n - 1]]
+        rows.append(row)
+    return rows[r0][r1]
+
+
+def confirmation(registers):
+    """
+    Intrinsic replacement for the routine at 6027. The routine always ends in
+    its `r0 == 0` branch, so r1 is left one below the result in r0.
+    """
+    result = confirmation_value(registers[0], registers[1], registers[7])
+    registers[0] = result
+    registers[1] = (result - 1) % 32768
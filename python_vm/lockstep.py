@@ -0,0 +1,248 @@
+import sys
+import time
+import zlib
+from array import array
+from typing import Iterable, List, NamedTuple, Optional, Union
+from .backends import BufferBackend
+from .disassembler import format_instruction
+from .script import expand
+from .virtual_machine import VirtualMachine, Status
+
+# engines which run exactly one instruction per step, as the reference must
+STEPWISE = ('operations', 'dispatch')
+
+# how far the reference may run looking for the state the other engine
+# reached before the two are taken to have diverged
+MAX_GAP = 1 << 20
+
+
+class State(NamedTuple):
+    """What is compared between the two engines at each checkpoint"""
+    address: int
+    registers: tuple
+    stack: tuple
+    # a CRC-32 of memory
+    memory: int
+    # input read but not yet fed to the program, and bytes written since the
+    # last checkpoint
+    pending: tuple
+    output: int
+
+
+FIELDS = State._fields
+
+
+def state_of(vm: VirtualMachine) -> State:
+    memory = vm._bin
+    if not isinstance(memory, array):
+        memory = array('H', memory)
+    return State(vm._curr_idx, tuple(vm._registers), tuple(vm._stack),
+                 zlib.crc32(memory), tuple(vm._ops._input_cache),
+                 vm._backend.tell())
+
+
+class Divergence(NamedTuple):
+    # instructions the reference ran before the last state the engines agreed on
+    instructions: int
+    # where the step which diverged starts, and the instruction there
+    address: int
+    instruction: str
+    agreed: State
+    reference: State
+    other: State
+
+    def fields(self) -> List[str]:
+        """The names of the parts of the state which differ"""
+        return [name for name, ref, other in zip(FIELDS, self.reference, self.other)
+                if ref != other]
+
+
+class Report(NamedTuple):
+    reference: str
+    other: str
+    # instructions the reference ran, and checkpoints at which the engines agreed
+    instructions: int
+    checkpoints: int
+    divergence: Optional[Divergence]
+    # seconds each engine takes on its own
+    reference_time: float = None
+    other_time: float = None
+
+
+class Lockstep:
+    """
+    Runs a `reference` engine and an `other` engine side by side on the same
+    binary and input, and checks that they go through the same states.
+
+    The other engine runs `every` steps at a time, after which the reference
+    runs until it reaches the same address, registers, stack, memory (by
+    digest), pending input and output, which makes a checkpoint. Engines
+    whose steps are whole blocks or functions can be checked this way as
+    long as the reference runs an instruction per step, which is why it
+    has to be one of `STEPWISE`.
+
+    Input is only fed when both engines are waiting for it at a checkpoint,
+    so they see every line at the same point. When the reference cannot get
+    to the other engine's state, the steps since the last checkpoint are
+    bisected to find the first which diverges. `aot_cache_dir` is passed on
+    to the other engine's machine.
+    """
+
+    def __init__(self, binary: Union[str, list, array], reference: str = 'operations',
+                 other: str = 'dispatch', every: int = 10000, max_gap: int = MAX_GAP,
+                 aot_cache_dir: str = None):
+        if reference not in STEPWISE:
+            raise ValueError("The reference engine must be one of {}".format(
+                ', '.join(STEPWISE)))
+        memory = VirtualMachine._retrieve_binary(binary)
+        self._ref = VirtualMachine(array('H', memory), engine=reference,
+                                   backend=BufferBackend())
+        self._other = VirtualMachine(array('H', memory), engine=other,
+                                     backend=BufferBackend(), aot_cache_dir=aot_cache_dir)
+        self._names = reference, other
+        self._every = every
+        self._max_gap = max_gap
+
+    def run(self, commands: Iterable[str]) -> Report:
+        """
+        Plays `commands` on both engines until they run out, the program
+        stops or the engines diverge, and reports which
+        """
+        ref, other = self._ref, self._other
+        instructions = 0
+        checkpoints = 0
+        reply = bytearray()
+        commands = expand(commands, lambda: reply.decode('utf-8', 'replace'))
+        divergence = None
+        while True:
+            start = (ref.snapshot(), other.snapshot(), self._queued())
+            found = self._chunk(self._every)
+            if found is None:
+                divergence = self._bisect(start, instructions)
+                break
+            steps, result = found
+            instructions += steps
+            checkpoints += 1
+            reply += ref._backend.drain()
+            other._backend.drain()
+            if result.status == Status.AWAITING_INPUT:
+                command = next(commands, None)
+                if command is None:
+                    break
+                reply.clear()
+                ref._backend.feed(command)
+                other._backend.feed(command)
+            elif result.status != Status.BUDGET_EXHAUSTED:
+                break
+        return Report(self._names[0], self._names[1], instructions,
+                      checkpoints, divergence)
+
+    def _queued(self) -> list:
+        """The lines fed to both engines which neither has read yet"""
+        return self._ref._backend.pending()
+
+    def _restore(self, start: tuple):
+        ref_snapshot, other_snapshot, queued = start
+        for vm, snapshot in ((self._ref, ref_snapshot), (self._other, other_snapshot)):
+            vm.restore(snapshot)
+            vm.attach(BufferBackend(queued))
+
+    def _chunk(self, budget: int):
+        """
+        Runs the other engine for `budget` steps and the reference until it
+        catches up, returning the instructions that took and the other
+        engine's `RunResult`, or None if the reference never got there
+        """
+        result = self._other.run(budget)
+        target = state_of(self._other)
+        ref = self._ref
+        steps = 0
+        while steps <= self._max_gap:
+            if ref._curr_idx == target.address and state_of(ref) == target:
+                return steps, result
+            # every step runs at least one instruction, so the reference can
+            # go as many instructions as the other engine went steps in one go
+            stopped = ref.run(result.steps - steps if result.steps > steps else 1)
+            steps += stopped.steps
+            if stopped.status != Status.BUDGET_EXHAUSTED:
+                if stopped.status == result.status and state_of(ref) == target:
+                    return steps, result
+                return None
+        return None
+
+    def _bisect(self, start: tuple, instructions: int) -> Divergence:
+        """
+        Finds the first step of the other engine after the checkpoint `start`
+        after which the reference does not reach the same state
+        """
+        agreed, diverged = 0, self._every
+        while diverged - agreed > 1:
+            middle = (agreed + diverged) // 2
+            self._restore(start)
+            if self._chunk(middle) is None:
+                diverged = middle
+            else:
+                agreed = middle
+        self._restore(start)
+        if agreed:
+            steps, _ = self._chunk(agreed)
+            instructions += steps
+        ref, other = self._ref, self._other
+        before = state_of(other)
+        other.run(1)
+        # run the reference up to where the other engine's step ended, or
+        # just the one instruction if it never gets there
+        snapshot = ref.snapshot()
+        for _ in range(self._max_gap):
+            if ref.run(1).status != Status.BUDGET_EXHAUSTED \
+                    or ref._curr_idx == other._curr_idx:
+                break
+        if ref._curr_idx != other._curr_idx:
+            ref.restore(snapshot)
+            ref.run(1)
+        address = before.address
+        instruction = format_instruction(ref._bin, address)[0] \
+            if address < len(ref._bin) else ''
+        return Divergence(instructions, address, instruction, before,
+                          state_of(ref), state_of(other))
+
+
+def time_engine(binary: Union[str, list, array], engine: str,
+                commands: List[str], repeat: int = 1) -> float:
+    """Returns the best time `engine` takes to play `commands`, on its own"""
+    memory = VirtualMachine._retrieve_binary(binary)
+    timings = []
+    for _ in range(repeat):
+        vm = VirtualMachine(array('H', memory), engine=engine, backend=BufferBackend())
+        start = time.perf_counter()
+        vm.run_script(commands)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def dump_report(report: Report, stream=None):
+    """Writes `report` out to `stream`"""
+    stream = stream or sys.stdout
+    print("{} vs {}: {:,} instructions, {:,} checkpoints".format(
+        report.reference, report.other, report.instructions,
+        report.checkpoints), file=stream)
+    divergence = report.divergence
+    if divergence is None:
+        print("No divergence", file=stream)
+    else:
+        print("Diverged after {:,} instructions, in the step from {}".format(
+            divergence.instructions, divergence.instruction.strip()), file=stream)
+        for name in divergence.fields():
+            print("  {:9} {}: {!r:.60}  {}: {!r:.60}".format(
+                name, report.reference, getattr(divergence.reference, name),
+                report.other, getattr(divergence.other, name)), file=stream)
+    if report.reference_time and report.other_time:
+        for name, seconds in ((report.reference, report.reference_time),
+                              (report.other, report.other_time)):
+            line = "{:11} {:>8.3f}s".format(name, seconds)
+            if divergence is None and report.instructions:
+                line += " {:>12,.0f} instr/s".format(report.instructions / seconds)
+            print(line, file=stream)
+        print("{} is {:.2f}x as fast as {}".format(
+            report.other, report.reference_time / report.other_time,
+            report.reference), file=stream)
@@ -28,3 +28,25 @@ class Opcode(Enum):
     OUT = 19
     IN_ = 20
     NOOP = 21
+
+
+# number of operands following each opcode, indexed by opcode value
+NUM_OPERANDS = (0, 2, 1, 1, 3, 3, 1, 2, 2, 3, 3, 3, 3, 3, 2, 2, 2, 1, 0, 1, 1, 0)
+
+# names of the `Operations` methods, indexed by opcode value
+OPERATION_NAMES = (
+    'halt', 'set', 'push', 'pop', 'eq', 'gt', 'jmp', 'jt', 'jf', 'add', 'mult',
+    'mod', 'and_', 'or_', 'not_', 'rmem', 'wmem', 'call', 'ret', 'out', 'in_',
+    'noop'
+)
+
+# operand slots (1-based, relative to the opcode) which are written to rather
+# than read from, indexed by opcode value
+WRITE_SLOTS = (
+    (), (1,), (), (1,), (1,), (1,), (), (), (), (1,), (1,), (1,), (1,), (1,),
+    (1,), (1,), (), (), (), (), (1,), ()
+)
+
+REGISTER_BASE = 32768
+NUM_REGISTERS = 8
+VALUE_LIMIT = REGISTER_BASE + NUM_REGISTERS
@@ -1,6 +1,7 @@
 import sys
 from typing import Callable
 from .opcode import Opcode
+from .output import OutputBuffer
 from .exceptions import InvalidNumberError, EmptyStackError
 
 
@@ -13,22 +14,36 @@ class Operations:
         write_mem_func: Callable,
         push_stack_func: Callable,
         pop_stack_func: Callable,
-        save_state_func: Callable
+        output: OutputBuffer = None,
+        read_line_func: Callable = None,
+        command_func: Callable = None,
+        intrinsics: dict = None
     ):
         self._input_cache = []
         self._read = read_mem_func
         self._write = write_mem_func
         self._push = push_stack_func
         self._pop = pop_stack_func
-        self._save = save_state_func
+        self._output = output if output is not None else OutputBuffer()
+        self._read_line = read_line_func or self._prompt
+        self._command = command_func or self._no_command
+        self._intrinsics = intrinsics if intrinsics is not None else {}
 
     @staticmethod
-    def halt(idx: int = None, override: bool = False):
+    def _prompt() -> str:
+        return input('> ')
+
+    @staticmethod
+    def _no_command(line: str) -> bool:
+        return False
+
+    def halt(self, idx: int = None, override: bool = False):
         """
         `halt: 0`
         Stops execution and terminates the program.
         """
-        print("Reached opcode 0, terminating program.")
+        self._output.write("Reached opcode 0, terminating program.\n")
+        self._output.flush()
         sys.exit(0)
 
     def set(self, idx: int):
@@ -199,9 +214,18 @@ class Operations:
         """
         `call: 17 a`
         Writes the address of the next instruction to the stack and jumps to `a`
+
+        If an intrinsic is registered for `a`, it is run in place of the
+        subroutine and execution continues as if the subroutine had returned.
         """
         self._push(idx + 2)
-        return self._read(idx + 1)
+        address = self._read(idx + 1)
+        intrinsic = self._intrinsics.get(address)
+        if intrinsic is None:
+            return address
+        self._pop()
+        intrinsic()
+        return idx + 2
 
     def ret(self, idx: int) -> int:
         """
@@ -217,10 +241,11 @@ class Operations:
     def out(self, idx: int) -> int:
         """
         `out: 19 a`
-        Writes the character represented by ascii code `a` to the terminal
+        Writes the character represented by ascii code `a` to the terminal.
+        Output is buffered and written out a line at a time.
         """
         ordinal = self._read(idx + 1)
-        print(chr(ordinal), end='')
+        self._output.put(ordinal)
         return idx + 2
 
     def in_(self, idx: int) -> int:
@@ -232,20 +257,18 @@ class Operations:
         is then split into ascii chars and each of them fed into memory. Since
         there is a guarantee that once input starts, it will continue until a
         newline is encountered, this approach should pose no issue.
+
+        Lines are read interactively by default; an `EOFError` from the line
+        source (end of a script, or Ctrl-D) propagates to the caller. Each line
+        is offered to the command layer first, which returns True if it was a
+        meta-command rather than input for the program.
         """
         if not self._input_cache:
-            tmp = input('> ')
-            if 'rewire teleporter' in tmp:
-                self._rewire_teleporter()
-                print('Teleporter settings altered!\n')
-                return idx
-            elif 'save' in tmp:
-                if len(tmp.split()) == 1:
-                    print(
-                        "Please provide a file name. State will be saved into both <filename>.bin and <filename>.json inside data/\n")
-                else:
-                    filename = tmp.strip().split()[-1]
-                    self._save(filename)
+            self._output.flush()
+            tmp = self._read_line()
+            if self._command(tmp):
+                # a meta-command such as `save` ran in place of the input, so
+                # the program is left waiting at this instruction for more
                 return idx
             # append a newline char since the one from `input()` is consumed by
             # the program, then convert to a list and reversing it so each char
@@ -262,7 +285,3 @@ class Operations:
         No operation
         """
         return idx + 1
-
-    def _rewire_teleporter(self):
-        self._write(0, 5485)
-        self._write(5, 5488)
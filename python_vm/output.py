@@ -0,0 +1,55 @@
+import io
+import sys
+from .backends import Backend
+
+
+class OutputBuffer:
+    """
+    Collects the characters written by the `out` operation and writes them to
+    the underlying stream a line at a time, instead of once per character.
+
+    The buffer is written out on every newline and whenever it grows past
+    `threshold` characters; `flush()` should be called before the program
+    waits for input or terminates so that nothing is left behind. Text
+    streams (such as a terminal), binary streams and `Backend`s are
+    supported; text is encoded as UTF-8 for the latter two. If no stream is
+    given, whatever `sys.stdout` is at the time of writing is used.
+    """
+
+    def __init__(self, stream=None, threshold: int = 4096):
+        self._stream = stream
+        self._threshold = threshold
+        self._chars = []
+        self._size = 0
+
+    def put(self, ordinal: int):
+        """Buffers the character represented by ascii code `ordinal`"""
+        self._chars.append(chr(ordinal))
+        self._size += 1
+        if ordinal == 10 or self._size >= self._threshold:
+            self._write_out()
+
+    def write(self, text: str):
+        """Buffers a whole string of characters"""
+        self._chars.append(text)
+        self._size += len(text)
+        if '\n' in text or self._size >= self._threshold:
+            self._write_out()
+
+    def flush(self):
+        """Writes out any buffered characters and flushes the stream"""
+        self._write_out()
+        stream = self._stream or sys.stdout
+        stream.flush()
+
+    def _write_out(self):
+        if not self._chars:
+            return
+        text = ''.join(self._chars)
+        self._chars = []
+        self._size = 0
+        stream = self._stream or sys.stdout
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase, Backend)):
+            stream.write(text.encode('utf-8'))
+        else:
+            stream.write(text)
@@ -0,0 +1,278 @@
+import sys
+import signal
+from .dispatch import DispatchEngine
+from .disassembler import listing
+from .opcode import OPERATION_NAMES, Opcode, REGISTER_BASE, VALUE_LIMIT
+from .exceptions import InvalidNumberError, EmptyStackError, InvalidOpcodeError
+
+# key of the code run outside of any subroutine in `functions` and `edges`
+ENTRY = None
+
+
+class Profile:
+    """
+    Exact profile of the instructions executed by a virtual machine, filled in
+    by passing it to `VirtualMachine.execute` (or `run_script`).
+
+    Collects how many times each address and each opcode was executed, and
+    for every `call` target the number of calls and the instructions executed
+    inside it including (inclusive) and excluding (exclusive) the subroutines
+    it calls, along with a call graph. The same profile can be passed to
+    several runs to accumulate counts across them.
+
+    Profiled runs always use `ProfilingEngine`, whatever engine the machine
+    was created with; runs without a profile are not affected at all.
+    """
+
+    unit = 'instructions'
+
+    def __init__(self):
+        self.hits = {}
+        self.opcodes = [0] * len(OPERATION_NAMES)
+        self.functions = {}
+        self.edges = {}
+        self.total = 0
+        # subroutines currently running, innermost last, as lists of
+        # [target, stack depth, total at entry, inclusive count of callees]
+        self._frames = []
+        self._active = {}
+
+    def execute(self, vm):
+        return ProfilingEngine(vm, self).execute()
+
+    def _function(self, target) -> list:
+        stats = self.functions.get(target)
+        if stats is None:
+            stats = self.functions[target] = [0, 0, 0]
+        return stats
+
+    def _enter(self, target: int, depth: int):
+        caller = self._frames[-1][0] if self._frames else ENTRY
+        self.edges[caller, target] = self.edges.get((caller, target), 0) + 1
+        self._function(target)[0] += 1
+        self._frames.append([target, depth, self.total, 0])
+        self._active[target] = self._active.get(target, 0) + 1
+
+    def _leave(self, frames: list, active: dict, functions: dict):
+        target, _, entry, callees = frames.pop()
+        inclusive = self.total - entry
+        stats = functions.get(target)
+        if stats is None:
+            stats = functions[target] = [0, 0, 0]
+        active[target] -= 1
+        # recursive calls are already counted by the outermost one
+        if not active[target]:
+            stats[1] += inclusive
+        stats[2] += inclusive - callees
+        if frames:
+            frames[-1][3] += inclusive
+
+    def _returned(self, depth: int):
+        while self._frames and self._frames[-1][1] >= depth:
+            self._leave(self._frames, self._active, self.functions)
+
+    def summary(self) -> dict:
+        """
+        Returns the per-function counts, as `target: [calls, inclusive,
+        exclusive]`, as if every subroutine still running had returned.
+        """
+        functions = {target: list(stats)
+                     for target, stats in self.functions.items()}
+        frames = [list(frame) for frame in self._frames]
+        active = dict(self._active)
+        while frames:
+            self._leave(frames, active, functions)
+        inside = sum(stats[2] for stats in functions.values())
+        functions[ENTRY] = [0, self.total, self.total - inside]
+        return functions
+
+    def dump(self, memory, stream=None, top: int = 20, full: bool = False):
+        _dump(self, self.summary(), memory, stream or sys.stdout, top, full)
+
+
+class ProfilingEngine(DispatchEngine):
+    """
+    Dispatch engine whose loop counts every instruction it runs into a
+    `Profile`, and tracks calls and returns against the stack so that
+    subroutines can be charged for the instructions executed inside them.
+    """
+
+    def __init__(self, vm, profile: Profile):
+        super().__init__(vm)
+        self._profile = profile
+
+    def execute(self):
+        code = self._code
+        mem = self._mem
+        stack = self._stack
+        values = self._values
+        profile = self._profile
+        hits = profile.hits
+        opcodes = profile.opcodes
+        call, ret = Opcode.CALL.value, Opcode.RET.value
+        pc = self._vm._curr_idx
+        self._load_registers()
+        try:
+            while True:
+                handler = code[pc]
+                if handler is None:
+                    handler = code[pc] = self._decode(pc)
+                op = mem[pc]
+                profile.total += 1
+                hits[pc] = hits.get(pc, 0) + 1
+                opcodes[op] += 1
+                if op == call:
+                    depth = len(stack)
+                    # resolved before the call, which may run an intrinsic
+                    # that changes the register; an invalid operand is left
+                    # for the handler to fail on as usual
+                    operand = mem[pc + 1]
+                    target = values[operand] if operand < VALUE_LIMIT else None
+                    pc = handler()
+                    profile._enter(target, depth)
+                    if len(stack) <= depth:
+                        # handled by an intrinsic, so it has already returned
+                        profile._returned(depth)
+                elif op == ret:
+                    pc = handler()
+                    profile._returned(len(stack))
+                else:
+                    pc = handler()
+        except InvalidNumberError as e:
+            sys.exit(f"Error in binary at index {pc}: {e}")
+        except EmptyStackError as e:
+            sys.exit(f"Error in binary at index {pc}: {e}")
+        except InvalidOpcodeError as e:
+            sys.exit(f"Error in binary at index {pc}: {e}")
+        except KeyboardInterrupt:
+            self._output.flush()
+            print(f"\n\nExiting program...")
+            sys.exit(0)
+        finally:
+            self._vm._curr_idx = pc
+            self._store_registers()
+            self._output.flush()
+
+
+class Sampler:
+    """
+    Statistical profile of a virtual machine, taken by interrupting it every
+    `interval` seconds of CPU time and recording the instruction it was on.
+
+    The machine runs on its usual engine at full speed between samples, so a
+    sampler can be left on during long runs. Besides the address and opcode
+    of each sample, the return addresses on the stack are used to charge the
+    sample to every subroutine that is running (inclusive) and to the
+    innermost one (exclusive); with the `blocks` engine, samples land on the
+    first address of each basic block. Only available where
+    `signal.setitimer` is, and only from the main thread.
+    """
+
+    unit = 'samples'
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.hits = {}
+        self.opcodes = [0] * len(OPERATION_NAMES)
+        self.functions = {}
+        self.edges = {}
+        self.total = 0
+
+    def execute(self, vm):
+        def sample(signum, frame):
+            self._sample(vm, frame)
+
+        previous = signal.signal(signal.SIGPROF, sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return vm.execute()
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+    def _sample(self, vm, frame):
+        loop = DispatchEngine.run.__code__
+        while frame is not None and frame.f_code is not loop:
+            frame = frame.f_back
+        pc = frame.f_locals['pc'] if frame is not None else vm._curr_idx
+
+        mem = vm._bin
+        self.total += 1
+        self.hits[pc] = self.hits.get(pc, 0) + 1
+        if mem[pc] < len(self.opcodes):
+            self.opcodes[mem[pc]] += 1
+
+        caller = ENTRY
+        seen = set()
+        for address in list(vm._stack):
+            # a return address follows a `call` with a literal target
+            if 2 <= address <= len(mem) and mem[address - 2] == Opcode.CALL.value \
+                    and mem[address - 1] < REGISTER_BASE:
+                target = mem[address - 1]
+                self.edges[caller, target] = self.edges.get((caller, target), 0) + 1
+                if target not in seen:
+                    seen.add(target)
+                    self._function(target)[1] += 1
+                caller = target
+        self._function(caller)[2] += 1
+
+    def _function(self, target) -> list:
+        stats = self.functions.get(target)
+        if stats is None:
+            stats = self.functions[target] = [0, 0, 0]
+        return stats
+
+    def summary(self) -> dict:
+        functions = {target: list(stats)
+                     for target, stats in self.functions.items()}
+        entry = functions.setdefault(ENTRY, [0, 0, 0])
+        entry[1] = self.total
+        return functions
+
+    def dump(self, memory, stream=None, top: int = 20, full: bool = False):
+        _dump(self, self.summary(), memory, stream or sys.stdout, top, full)
+
+
+def _name(target) -> str:
+    return '<entry>' if target is ENTRY else str(target)
+
+
+def _percent(count: int, total: int) -> str:
+    return '{:6.2f}%'.format(100 * count / total if total else 0)
+
+
+def _dump(profile, functions: dict, memory, stream, top: int, full: bool):
+    """
+    Writes the busiest opcodes, functions and call graph edges of `profile`,
+    followed by the linear listing of `memory` with the count of every
+    address alongside. Only addresses that were hit are listed unless `full`.
+    """
+    total = profile.total
+    write = stream.write
+    write("Profile of {:,} {}\n\n".format(total, profile.unit))
+
+    write("{:>8} {:>12} {:>8}\n".format('opcode', profile.unit, ''))
+    for op, count in sorted(enumerate(profile.opcodes), key=lambda item: -item[1]):
+        if count:
+            write("{:>8} {:>12,} {}\n".format(
+                OPERATION_NAMES[op].strip('_'), count, _percent(count, total)))
+
+    write("\n{:>8} {:>8} {:>12} {:>8} {:>12} {:>8}\n".format(
+        'function', 'calls', 'inclusive', '', 'exclusive', ''))
+    ranked = sorted(functions.items(), key=lambda item: -item[1][1])
+    for target, (calls, inclusive, exclusive) in ranked[:top]:
+        write("{:>8} {:>8,} {:>12,} {} {:>12,} {}\n".format(
+            _name(target), calls, inclusive, _percent(inclusive, total),
+            exclusive, _percent(exclusive, total)))
+
+    write("\n{:>8}    {:<8} {:>8}\n".format('caller', 'callee', 'count'))
+    edges = sorted(profile.edges.items(), key=lambda item: -item[1])
+    for (caller, callee), count in edges[:top]:
+        write("{:>8} -> {:<8} {:>8,}\n".format(_name(caller), _name(callee), count))
+
+    write("\n{:>12} {:>8}   listing\n".format(profile.unit, ''))
+    hits = profile.hits
+    for address, line in listing(memory):
+        count = hits.get(address, 0)
+        if count or full:
+            write("{:>12,} {}   {}\n".format(count, _percent(count, total), line))
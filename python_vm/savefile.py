@@ -0,0 +1,223 @@
+import os
+import sys
+import mmap
+import zlib
+import struct
+import hashlib
+import tempfile
+from array import array
+from typing import Optional, Tuple
+from .snapshot import Snapshot, take_pages, PAGE_SIZE
+from .opcode import NUM_REGISTERS
+
+DEFAULT_BASE_PATH = 'challenge.bin'
+SUFFIX = '.sav'
+
+MAGIC = b'SYNS'
+VERSION = 2
+# flags: the delta is zlib-compressed; memory is a delta against a base binary
+# rather than against zeros
+COMPRESSED = 1
+BASED = 2
+# magic, version, flags, SHA-256 of the base binary, instruction pointer,
+# registers, memory size in words, stack size, delta size in bytes (as
+# stored), pending input and transcript sizes in bytes
+_HEADER = struct.Struct('<4sHH32sH{}HIIIII'.format(NUM_REGISTERS))
+# each run of the delta: the address of its first word and how many follow
+_RUN = struct.Struct('<HH')
+# unchanged words between two runs which are stored rather than starting a
+# new run, as that costs no more than the header of the next run
+_GAP = _RUN.size // 2
+
+# path -> (mtime, size, digest, memory, pages) of base binaries read so far,
+# see `base_image`
+_bases = {}
+
+
+def words_of(data: bytes) -> array:
+    """Returns the little-endian 16-bit words in `data` as an array"""
+    words = array('H')
+    words.frombytes(data)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words
+
+
+def bytes_of(words) -> bytes:
+    """Returns `words` as little-endian 16-bit words"""
+    words = array('H', words)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words.tobytes()
+
+
+def write_file(path: str, *chunks: bytes):
+    """
+    Writes `chunks` into a new file at `path`, which is replaced in one go so
+    that a partial file is never read
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    # a temporary file of its own, so that processes writing the same file
+    # at once do not write into each other's
+    f = tempfile.NamedTemporaryFile(dir=directory, prefix=os.path.basename(path) + '.',
+                                    suffix='.tmp', delete=False)
+    try:
+        with f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(f.name, path)
+    except BaseException:
+        try:
+            os.unlink(f.name)
+        except OSError:
+            pass
+        raise
+
+
+def base_image(path: str) -> Tuple[bytes, array, tuple]:
+    """
+    Returns the SHA-256 digest, memory and pages of the binary at `path`,
+    read once and kept for as long as the file is unchanged.
+    """
+    stat = os.stat(path)
+    cached = _bases.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2:]
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) % 2:
+        raise ValueError("{} is not a binary of 16-bit words".format(path))
+    memory = words_of(data)
+    entry = (stat.st_mtime_ns, stat.st_size, hashlib.sha256(data).digest(),
+             memory, take_pages(memory))
+    _bases[path] = entry
+    return entry[2:]
+
+
+def _runs(pages: tuple, base_pages: tuple) -> list:
+    """
+    Returns the [start, end) word ranges in which `pages` differ from
+    `base_pages`, comparing whole pages first and only going word by word
+    through those which differ.
+    """
+    runs = []
+    for number, page in enumerate(pages):
+        old = base_pages[number] if number < len(base_pages) else b''
+        if page == old:
+            continue
+        words = array('H', page)
+        old_words = array('H', old)
+        old_words.extend([0] * (len(words) - len(old_words)))
+        start = number * PAGE_SIZE
+        for offset, (new, was) in enumerate(zip(words, old_words)):
+            if new == was:
+                continue
+            address = start + offset
+            if runs and address - runs[-1][1] <= _GAP:
+                runs[-1][1] = address + 1
+            else:
+                runs.append([address, address + 1])
+    return runs
+
+
+def save_state(path: str, snapshot: Snapshot,
+               base: Optional[str] = DEFAULT_BASE_PATH, compress: bool = True,
+               transcript: str = ''):
+    """
+    Writes `snapshot` into a single file: a fixed header, the stack, the
+    memory as runs of words which differ from the binary at `base` (or from
+    zeros if `base` is None), zlib-compressed if `compress`, the pending
+    input and `transcript`, all little-endian. The base binary is recorded
+    by its hash, so the file can only be loaded against the same one.
+    """
+    flags = COMPRESSED if compress else 0
+    digest, base_pages = bytes(32), ()
+    if base is not None:
+        digest, _, base_pages = base_image(base)
+        flags |= BASED
+    memory = array('H')
+    memory.frombytes(b''.join(snapshot.pages))
+    delta = b''.join(
+        _RUN.pack(start, end - start) + bytes_of(memory[start:end])
+        for start, end in _runs(snapshot.pages, base_pages))
+    if compress:
+        delta = zlib.compress(delta)
+    pending = ''.join(snapshot.pending_input).encode('utf-8')
+    text = transcript.encode('utf-8')
+    write_file(path,
+               _HEADER.pack(MAGIC, VERSION, flags, digest, snapshot.curr_idx,
+                            *snapshot.registers, len(memory), len(snapshot.stack),
+                            len(delta), len(pending), len(text)),
+               bytes_of(snapshot.stack), delta, pending, text)
+
+
+def load_state(path: str, base: Optional[str] = DEFAULT_BASE_PATH) -> Snapshot:
+    """
+    Reads a file written by `save_state` against the binary at `base`,
+    returning the saved state as a snapshot to create or restore a machine
+    from. Raises ValueError if the file is not a save file of this version,
+    or was saved against a different binary.
+    """
+    return read_state(path, base)[0]
+
+
+def read_state(path: str, base: Optional[str] = DEFAULT_BASE_PATH) -> Tuple[Snapshot, str]:
+    """As `load_state`, also returning the transcript saved with the state"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            raise ValueError("Truncated save file")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _read(data, base)
+
+
+def _read(data: mmap.mmap, base: Optional[str]) -> Tuple[Snapshot, str]:
+    magic, version, flags, digest, curr_idx, *rest = _HEADER.unpack_from(data)
+    registers = tuple(rest[:NUM_REGISTERS])
+    memory_size, stack_size, delta_size, pending_size, text_size = \
+        rest[NUM_REGISTERS:]
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a save file of version {}".format(VERSION))
+    offset = _HEADER.size
+    if len(data) != offset + stack_size * 2 + delta_size + pending_size + text_size:
+        raise ValueError("Truncated save file")
+
+    if flags & BASED:
+        if base is None:
+            raise ValueError("Save file needs the binary it was saved against")
+        base_digest, base_memory, _ = base_image(base)
+        if base_digest != digest:
+            raise ValueError("Save file was made against a different binary "
+                             "than {}".format(base))
+        memory = array('H', base_memory)
+    else:
+        memory = array('H')
+    if len(memory) < memory_size:
+        memory.frombytes(bytes((memory_size - len(memory)) * 2))
+    del memory[memory_size:]
+
+    stack = words_of(data[offset:offset + stack_size * 2])
+    offset += stack_size * 2
+    delta = data[offset:offset + delta_size]
+    offset += delta_size
+    if flags & COMPRESSED:
+        try:
+            delta = zlib.decompress(delta)
+        except zlib.error as e:
+            raise ValueError("Corrupt save file") from e
+    position = 0
+    while position < len(delta):
+        if position + _RUN.size > len(delta):
+            raise ValueError("Corrupt save file")
+        start, count = _RUN.unpack_from(delta, position)
+        position += _RUN.size
+        if start + count > memory_size or position + count * 2 > len(delta):
+            raise ValueError("Corrupt save file")
+        memory[start:start + count] = words_of(delta[position:position + count * 2])
+        position += count * 2
+    pending = data[offset:offset + pending_size].decode('utf-8')
+    offset += pending_size
+    transcript = data[offset:offset + text_size].decode('utf-8')
+    snapshot = Snapshot(take_pages(memory), registers, tuple(stack), curr_idx,
+                        tuple(pending))
+    return snapshot, transcript
@@ -0,0 +1,39 @@
+from typing import Callable, Iterable, Iterator
+from . import coins
+
+# commands which stand for a series of commands worked out as the game is
+# played; each maps to a generator of commands taking a function returning
+# the game's reply to the command yielded last
+DIRECTIVES = {
+    'solve coins': coins.play,
+}
+
+
+def read_script(*paths: str) -> Iterator[str]:
+    """
+    Yields the commands in the given script files in order, one per line.
+
+    Blank lines and lines starting with `#` are skipped, and anything from the
+    first `(` onwards is treated as an annotation and dropped, which is the
+    format used by the files in `solutions/`.
+    """
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                command = line.split('(')[0].strip()
+                if command and not command.startswith('#'):
+                    yield command
+
+
+def expand(commands: Iterable[str], output: Callable[[], str]) -> Iterator[str]:
+    """
+    Yields `commands`, replacing each of `DIRECTIVES` with the commands it
+    generates. `output()` must return what the game wrote since the last
+    command was taken from this generator.
+    """
+    for command in commands:
+        directive = DIRECTIVES.get(command.strip())
+        if directive is None:
+            yield command
+        else:
+            yield from directive(output)
@@ -0,0 +1,135 @@
+import asyncio
+from typing import Union
+from .virtual_machine import VirtualMachine, Status
+from .output import OutputBuffer
+from .backends import BufferBackend
+from .boot import boot, DEFAULT_CACHE_DIR
+
+DEFAULT_BIN_PATH = 'challenge.bin'
+# handlers each session runs before giving the other sessions a turn
+DEFAULT_BUDGET = 20000
+
+
+class Session:
+    """
+    A virtual machine played over a connection. Its output is collected in
+    memory rather than written to stdout, and input is taken from the lines
+    passed to `feed`; when the program asks for input and there is none, the
+    slice ends and the machine waits at the `in` instruction until there is.
+    """
+
+    def __init__(self, vm: VirtualMachine, budget: int = DEFAULT_BUDGET):
+        self._vm = vm
+        self._budget = budget
+        self._io = BufferBackend()
+        vm.attach(self._io)
+        vm._commands.handlers['save'] = self._refuse_save
+
+    @staticmethod
+    def _refuse_save(vm: VirtualMachine, args: list):
+        vm._output.write("Saving is not available over the network.\n\n")
+
+    def feed(self, line: Union[str, bytes]):
+        """Queues a line of input, without its newline"""
+        self._io.feed(line)
+
+    def run(self) -> Status:
+        """
+        Runs the machine for one slice of at most the session's budget,
+        returning why it stopped. An error in the program halts the session,
+        with the message written to its output.
+        """
+        result = self._vm.run(self._budget)
+        if result.status == Status.ERROR:
+            self._io.write('Error in binary at index {}: {}\n'.format(
+                result.address, result.error).encode('utf-8'))
+            return Status.HALTED
+        return result.status
+
+    def drain(self) -> bytes:
+        """Returns the output written since the last call"""
+        return self._io.drain()
+
+    def output(self) -> str:
+        """Returns the output written since the last call, decoded"""
+        return self.drain().decode('utf-8')
+
+
+class GameServer:
+    """
+    Serves the game over TCP or a Unix socket, with one virtual machine per
+    connection, all in this process.
+
+    The binary is booted once, and every session starts from a fork of the
+    machine waiting at the first prompt. Sessions take turns on the event
+    loop a slice of `budget` handlers at a time, so a session stuck in a long
+    computation slows the others down without stopping them. Output is
+    handed to the connection after each slice, and a session only waits for
+    its client to drain it when the client falls behind.
+    """
+
+    def __init__(self, binary: str = DEFAULT_BIN_PATH, engine: str = 'dispatch',
+                 budget: int = DEFAULT_BUDGET, cache_dir: str = DEFAULT_CACHE_DIR):
+        self._vm, self._banner = boot(binary, cache_dir, engine=engine)
+        self._start = self._vm.snapshot()
+        self._budget = budget
+        self._server = None
+        self._tasks = set()
+        self.sessions = 0
+
+    def session(self) -> Session:
+        """Returns a new session waiting at the first prompt"""
+        return Session(self._vm.fork(self._start, OutputBuffer()), self._budget)
+
+    async def _serve(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        self.sessions += 1
+        session = self.session()
+        writer.write(self._banner.encode('utf-8'))
+        try:
+            while True:
+                status = session.run()
+                data = session.drain()
+                if data:
+                    writer.write(data)
+                await writer.drain()
+                if status == Status.HALTED:
+                    break
+                if status == Status.BUDGET_EXHAUSTED:
+                    # let the other sessions have a slice
+                    await asyncio.sleep(0)
+                    continue
+                line = await reader.readline()
+                if not line:
+                    break
+                session.feed(line.rstrip(b'\r\n'))
+        except (ConnectionError, asyncio.CancelledError):
+            # the client went away, or the server is closing
+            pass
+        finally:
+            self._tasks.discard(task)
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0,
+                    path: str = None):
+        """
+        Starts listening on `path` as a Unix socket if given, or on `host`
+        and `port` otherwise, returning the `asyncio.Server`.
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve, path)
+        else:
+            self._server = await asyncio.start_server(self._serve, host, port)
+        return self._server
+
+    async def close(self):
+        """Stops listening and ends every session"""
+        if self._server is not None:
+            self._server.close()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
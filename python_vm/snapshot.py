@@ -0,0 +1,126 @@
+from array import array
+
+# number of memory words held by each page of a snapshot, and the shift
+# from a word address to its page number
+PAGE_SHIFT = 10
+PAGE_SIZE = 1 << PAGE_SHIFT
+
+
+class Snapshot:
+    """
+    The state of a virtual machine at some point between two instructions:
+    memory, registers, stack, instruction pointer and any input that has been
+    read but not yet fed to the program.
+
+    Memory is held as a tuple of immutable pages. A page which has not changed
+    since the snapshot it was taken after is the very same `bytes` object, so
+    snapshots taken from one another only store the pages that differ.
+    """
+
+    __slots__ = ('pages', 'registers', 'stack', 'curr_idx', 'pending_input')
+
+    def __init__(self, pages: tuple, registers: tuple, stack: tuple,
+                 curr_idx: int, pending_input: tuple):
+        self.pages = pages
+        self.registers = registers
+        self.stack = stack
+        self.curr_idx = curr_idx
+        self.pending_input = pending_input
+
+    def memory(self) -> array:
+        """Returns a fresh copy of the memory as an array of words"""
+        data = array('H')
+        data.frombytes(b''.join(self.pages))
+        return data
+
+    def size(self) -> int:
+        """Returns the number of words of memory held"""
+        return sum(len(page) for page in self.pages) // 2
+
+    def digest(self) -> int:
+        """
+        Returns a hash of the whole state, suitable for telling apart states
+        that differ in any way.
+        """
+        return hash((self.pages, self.registers, self.stack, self.curr_idx,
+                     self.pending_input))
+
+    def __eq__(self, other):
+        if not isinstance(other, Snapshot):
+            return NotImplemented
+        return (self.curr_idx == other.curr_idx
+                and self.registers == other.registers
+                and self.stack == other.stack
+                and self.pending_input == other.pending_input
+                and self.pages == other.pages)
+
+    def __hash__(self):
+        return self.digest()
+
+
+def _memory_view(memory) -> memoryview:
+    """Returns a writable byte view of `memory`, or None for a list"""
+    if isinstance(memory, array):
+        return memoryview(memory).cast('B')
+    return None
+
+
+def take_pages(memory, previous: tuple = None, dirty=None) -> tuple:
+    """
+    Splits `memory` into pages of `PAGE_SIZE` words, reusing the page objects
+    of `previous` wherever their contents are unchanged. Given the numbers
+    of the pages written since `previous` was taken as `dirty`, only those
+    pages are read again.
+    """
+    view = _memory_view(memory)
+    step = PAGE_SIZE * 2
+    count = (len(memory) + PAGE_SIZE - 1) // PAGE_SIZE
+    if previous is not None and dirty is not None and len(previous) == count:
+        numbers = dirty
+        pages = list(previous)
+    else:
+        numbers = range(count)
+        pages = [None] * count
+    for number in numbers:
+        start = number * PAGE_SIZE
+        if view is not None:
+            current = view[start * 2:start * 2 + step].tobytes()
+        else:
+            current = array('H', memory[start:start + PAGE_SIZE]).tobytes()
+        if previous is not None and number < len(previous) \
+                and previous[number] == current:
+            pages[number] = previous[number]
+        else:
+            pages[number] = current
+    return tuple(pages)
+
+
+def restore_pages(memory, pages: tuple, numbers=None) -> list:
+    """
+    Copies `pages` back into `memory`, skipping the pages it already matches,
+    and only looking at those in `numbers` if given. Returns the word
+    address range of every page that was written.
+    """
+    view = _memory_view(memory)
+    step = PAGE_SIZE * 2
+    size = sum(len(page) for page in pages) // 2
+    if len(memory) != size:
+        raise ValueError("Snapshot holds {} words of memory, expected {}".format(
+            size, len(memory)))
+    if numbers is None:
+        numbers = range(len(pages))
+    written = []
+    for number in sorted(numbers):
+        page = pages[number]
+        start = number * PAGE_SIZE
+        if view is not None:
+            if view[start * 2:start * 2 + step].tobytes() == page:
+                continue
+            view[start * 2:start * 2 + len(page)] = page
+        else:
+            words = array('H', page)
+            if memory[start:start + len(words)] == words.tolist():
+                continue
+            memory[start:start + len(words)] = words.tolist()
+        written.append(range(start, start + len(page) // 2))
+    return written
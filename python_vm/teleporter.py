@@ -0,0 +1,146 @@
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from .intrinsics import confirmation_value
+
+# values the teleporter passes to the confirmation routine, and the result
+# it expects back (see 5483..5495 in the disassembly)
+CHECK_R0 = 4
+CHECK_R1 = 1
+EXPECTED = 6
+
+NUM_CANDIDATES = 32768
+
+
+def _level_3(values, r7):
+    """
+    Vectorised f(3, n) for every lane, where lane `i` has `r7[i]` and asks for
+    n = `values[i]`.
+
+    The first rows of the recurrence have closed forms, f(1, n) = n + r7 + 1
+    and f(2, n) = (n + 2)(r7 + 1) - 1, so f(3, n) = f(2, f(3, n - 1)) can be
+    stepped for all lanes at once, starting from f(3, 0) = f(2, r7). Lanes
+    pick up their result when the step count reaches the `n` they asked for.
+    """
+    import numpy as np
+
+    factor = r7.astype(np.uint32) + 1
+    current = ((r7.astype(np.uint32) + 2) * factor - 1) & 32767
+    result = np.empty_like(current)
+
+    order = np.argsort(values, kind='stable')
+    bounds = np.searchsorted(values[order], np.arange(NUM_CANDIDATES + 1))
+    for n in range(int(values.max()) + 1):
+        lanes = order[bounds[n]:bounds[n + 1]]
+        if len(lanes):
+            result[lanes] = current[lanes]
+        current += 2
+        current *= factor
+        current -= 1
+        current &= 32767
+    return result
+
+
+def _evaluate_chunk(r7_values: list, r0: int, r1: int) -> list:
+    import numpy as np
+
+    r7 = np.asarray(r7_values, dtype=np.uint32)
+    if r0 == 0:
+        values = np.full_like(r7, (r1 + 1) & 32767)
+    elif r0 == 1:
+        values = (r7 + (r1 + 1)) & 32767
+    elif r0 == 2:
+        values = ((r1 + 2) * (r7 + 1) - 1) & 32767
+    elif r0 == 3:
+        values = _level_3(np.full_like(r7, r1), r7)
+    elif r0 == 4:
+        # f(4, 0) = f(3, r7) and f(4, n) = f(3, f(4, n - 1))
+        values = _level_3(r7, r7)
+        for _ in range(r1):
+            values = _level_3(values, r7)
+    else:
+        return [confirmation_value(r0, r1, int(value)) for value in r7]
+    return values.tolist()
+
+
+def _iterate(factor: int, offset: int, times: int, value: int) -> int:
+    """
+    Applies x -> factor * x + offset to `value` `times` times, modulo 32768,
+    by squaring the map rather than stepping it.
+    """
+    while times:
+        if times & 1:
+            value = (factor * value + offset) & 32767
+        factor, offset = (factor * factor) & 32767, (factor * offset + offset) & 32767
+        times >>= 1
+    return value
+
+
+def _evaluate_one(r7: int, r0: int, r1: int) -> int:
+    """
+    f(r0, r1) for a single `r7` in pure Python, from the same closed forms as
+    `_level_3`: f(3, n) is f(2, x) = (x + 2)(r7 + 1) - 1 applied n + 1 times
+    to r7, which is an affine map, so it takes a handful of steps instead of
+    n of them.
+    """
+    factor = r7 + 1
+    if r0 == 0:
+        return (r1 + 1) & 32767
+    if r0 == 1:
+        return (r7 + r1 + 1) & 32767
+    if r0 == 2:
+        return ((r1 + 2) * factor - 1) & 32767
+    if r0 == 3:
+        return _iterate(factor, 2 * factor - 1, r1 + 1, r7)
+    if r0 == 4:
+        value = r7
+        for _ in range(r1 + 1):
+            value = _iterate(factor, 2 * factor - 1, value + 1, r7)
+        return value
+    return confirmation_value(r0, r1, r7)
+
+
+def evaluate(r7_values, r0: int = CHECK_R0, r1: int = CHECK_R1,
+             processes: int = None) -> list:
+    """
+    Returns the result of the confirmation routine at 6027 for each of the
+    given r7 values, all computed together as NumPy arrays over the r7 axis.
+
+    With `processes`, the candidates are split into that many chunks which are
+    evaluated in a process pool. If NumPy is not available, each candidate is
+    evaluated on its own in pure Python with `_evaluate_one`, which is slower
+    but still takes well under a second for all of them.
+    """
+    r7_values = list(r7_values)
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return [_evaluate_one(value, r0, r1) for value in r7_values]
+
+    if not processes or processes < 2:
+        return _evaluate_chunk(r7_values, r0, r1)
+    size = -(-len(r7_values) // processes)
+    chunks = [r7_values[i:i + size] for i in range(0, len(r7_values), size)]
+    with ProcessPoolExecutor(processes) as pool:
+        results = pool.map(_evaluate_chunk, chunks,
+                           [r0] * len(chunks), [r1] * len(chunks))
+        return [value for chunk in results for value in chunk]
+
+
+def solve(expected: int = EXPECTED, r0: int = CHECK_R0, r1: int = CHECK_R1,
+          processes: int = None) -> list:
+    """
+    Returns every value of the eighth register for which the confirmation
+    routine, called with `r0` and `r1`, returns `expected`.
+    """
+    candidates = range(NUM_CANDIDATES)
+    results = evaluate(candidates, r0, r1, processes)
+    return [r7 for r7, result in zip(candidates, results) if result == expected]
+
+
+@lru_cache(maxsize=None)
+def energy_level() -> int:
+    """The energy level the teleporter expects in the eighth register"""
+    levels = solve()
+    if not levels:
+        raise ValueError("No value of r7 passes the teleporter confirmation")
+    return levels[0]
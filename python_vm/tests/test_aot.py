@@ -0,0 +1,62 @@
+from .. import aot
+from ..aot import compile_image, load_module
+from ..backends import BufferBackend
+from ..virtual_machine import VirtualMachine, Status
+
+# 0: set r0 3; call 8; out r0; halt
+# 8: add r0 r0 1; ret
+CALL = [1, 32768, 3, 17, 8, 19, 32768, 0, 9, 32768, 32768, 1, 18]
+
+
+def test_functions_call_each_other_natively(tmp_path):
+    source = compile_image(CALL)
+    assert 'def f_0(pc, depth):' in source and 'def f_8(pc, depth):' in source
+    vm = VirtualMachine(CALL[:], engine='aot', backend=BufferBackend(),
+                        aot_cache_dir=str(tmp_path))
+    # the whole program is one entry into compiled code before the `halt`
+    assert vm.run()[:3] == (Status.HALTED, 7, 1)
+    assert vm._backend.getvalue().startswith(b'\x04')
+
+
+def test_module_is_cached(tmp_path, mocker):
+    module = load_module(CALL, cache_dir=str(tmp_path))
+    assert len(list(tmp_path.glob('*.py'))) == 1
+    compile_ = mocker.patch.object(aot, 'compile_image', wraps=compile_image)
+    aot._loaded.clear()
+    assert load_module(CALL, cache_dir=str(tmp_path)).BLOCKS == module.BLOCKS
+    compile_.assert_not_called()
+    assert list(tmp_path.glob('__pycache__/*.pyc'))
+    assert not list(tmp_path.glob('*.tmp'))
+
+    # a different image misses the cache
+    load_module(CALL[:-1] + [0], cache_dir=str(tmp_path))
+    compile_.assert_called_once()
+
+
+def test_patched_function_is_dropped(tmp_path):
+    # 0: call 8; wmem 9 98; call 8; halt; 8: out 97; ret
+    binary = [17, 8, 16, 9, 98, 17, 8, 0, 19, 97, 18]
+    vm = VirtualMachine(binary, engine='aot', backend=BufferBackend(),
+                        aot_cache_dir=str(tmp_path))
+    vm.run()
+    assert vm._backend.getvalue().startswith(b'ab')
+    assert 8 in vm._runner._dead
+
+
+def test_indirect_calls_are_compiled_on_the_next_input(tmp_path, mocker):
+    mocker.patch.object(aot, 'RECOMPILE_AFTER', 1)
+    # 0: rmem r1 9; call r1; in r0; jmp 0; 9: (pointer) 10; 10: out r0; ret
+    binary = [15, 32769, 9, 17, 32769, 20, 32768, 6, 0, 10, 19, 32768, 18]
+    vm = VirtualMachine(binary, engine='aot', backend=BufferBackend(['a', 'b']),
+                        aot_cache_dir=str(tmp_path))
+    assert 10 not in vm._persistent_engine()._compiled
+    assert vm.run().status == Status.AWAITING_INPUT
+    assert 10 in vm._runner._compiled
+    assert vm._backend.getvalue() == b'\x00a\nb\n'
+
+
+def test_cache_dir_is_kept_by_forks(tmp_path):
+    vm = VirtualMachine(CALL[:], engine='aot', backend=BufferBackend(),
+                        aot_cache_dir=str(tmp_path / 'a'))
+    vm.fork().run()
+    assert len(list((tmp_path / 'a').glob('image_*.py'))) == 1
@@ -0,0 +1,63 @@
+import os
+import pytest
+from ..backends import BufferBackend, FileBackend, PipeBackend, TerminalBackend
+from ..virtual_machine import VirtualMachine
+
+# in r0; out r0; jmp 0
+ECHO = [20, 32768, 19, 32768, 6, 0]
+
+
+def test_buffer_backend():
+    backend = BufferBackend(iter(['north', b'south']))
+    backend.feed('look')
+    assert [backend.read_line() for _ in range(3)] == [b'look', b'north', b'south']
+    with pytest.raises(EOFError):
+        backend.read_line()
+    backend.write(b'ab')
+    assert (backend.tell(), backend.getvalue(1)) == (2, b'b')
+    assert backend.drain() == b'ab'
+    assert backend.getvalue() == b''
+
+
+def test_file_backend(tmp_path):
+    (tmp_path / 'in.txt').write_bytes(b'take tablet\r\nuse tablet')
+    backend = FileBackend(tmp_path / 'in.txt', tmp_path / 'out.txt')
+    assert backend.read_line() == b'take tablet'
+    assert backend.read_line() == b'use tablet'
+    with pytest.raises(EOFError):
+        backend.read_line()
+    backend.write(b'done\n')
+    backend.close()
+    assert (tmp_path / 'out.txt').read_bytes() == b'done\n'
+
+
+def test_pipe_backend():
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b'one\ntw')
+    backend = PipeBackend(read_fd, write_fd, chunk_size=4)
+    assert backend.read_line() == b'one'
+    backend.write(b'o\nthree')
+    os.close(write_fd)
+    assert [backend.read_line(), backend.read_line()] == [b'two', b'three']
+    with pytest.raises(EOFError):
+        backend.read_line()
+    os.close(read_fd)
+
+
+def test_terminal_backend(mocker, capsys):
+    mocker.patch('builtins.input', return_value='north')
+    backend = TerminalBackend()
+    assert backend.read_line() == b'north'
+    backend.write(b'Dark cave\n')
+    assert capsys.readouterr().out == 'Dark cave\n'
+
+
+@pytest.mark.parametrize("engine", ['operations', 'dispatch', 'blocks'])
+def test_attach(engine):
+    backend = BufferBackend(['ab'])
+    vm = VirtualMachine(ECHO[:], engine=engine, backend=backend)
+    assert vm.run().status.name == 'AWAITING_INPUT'
+    other = BufferBackend(['c'])
+    vm.attach(other)
+    vm.run()
+    assert (backend.getvalue(), other.getvalue()) == (b'ab\n', b'c\n')
@@ -0,0 +1,77 @@
+from pathlib import Path
+from ..virtual_machine import VirtualMachine
+from ..boot import boot, save_boot_image, load_boot_image
+
+
+ROOT = Path(__file__).resolve().parents[2]
+# out 'h'; out 'i'; in r0; out r0; jmp 4
+PROGRAM = [19, 104, 19, 105, 20, 32768, 19, 32768, 6, 4]
+
+
+def write_binary(path, words):
+    path.write_bytes(b''.join(word.to_bytes(2, 'little') for word in words))
+    return str(path)
+
+
+def test_boot_image_round_trip(tmp_path):
+    vm = VirtualMachine(PROGRAM[:], registers=list(range(8)), stack=[1, 2],
+                        curr_idx=4)
+    path = str(tmp_path / 'image.boot')
+    save_boot_image(path, vm, 'hi')
+    restored, transcript = load_boot_image(path, engine='dispatch')
+    assert transcript == 'hi'
+    assert list(restored._bin) == PROGRAM
+    assert list(restored._registers) == list(range(8))
+    assert restored._stack == [1, 2]
+    assert restored._curr_idx == 4
+    assert restored.run_script(['x']) == 'x\n'
+
+
+def test_boot_is_cached(tmp_path, mocker):
+    binary = write_binary(tmp_path / 'program.bin', PROGRAM)
+    cache = str(tmp_path / 'boot')
+    vm, transcript = boot(binary, cache)
+    assert transcript == 'hi'
+    assert vm._curr_idx == 4
+
+    run_script = mocker.spy(VirtualMachine, 'run_script')
+    vm, transcript = boot(binary, cache, engine='blocks')
+    assert transcript == 'hi'
+    assert vm._curr_idx == 4
+    assert vm._engine == 'blocks'
+    run_script.assert_not_called()
+
+    # a changed binary is booted again
+    binary = write_binary(tmp_path / 'program.bin', [19, 111] + PROGRAM[2:])
+    assert boot(binary, cache)[1] == 'oi'
+    assert run_script.call_count == 1
+
+
+def test_corrupt_boot_image_is_ignored(tmp_path):
+    binary = write_binary(tmp_path / 'program.bin', PROGRAM)
+    cache = tmp_path / 'boot'
+    boot(binary, str(cache))
+    for image in cache.iterdir():
+        image.write_bytes(image.read_bytes()[:-5])
+    vm, transcript = boot(binary, str(cache))
+    assert transcript == 'hi'
+    assert load_boot_image(str(next(cache.iterdir())), binary)[1] == 'hi'
+
+
+def test_halting_program_is_not_cached(tmp_path):
+    binary = write_binary(tmp_path / 'program.bin', [19, 104, 0])
+    cache = tmp_path / 'boot'
+    assert boot(binary, str(cache))[1].startswith('h')
+    assert not cache.exists() or not list(cache.iterdir())
+
+
+def test_boot_challenge(tmp_path):
+    binary = str(ROOT / 'challenge.bin')
+    first = boot(binary, str(tmp_path), engine='dispatch')
+    second = boot(binary, str(tmp_path), engine='dispatch')
+    assert first[1] == second[1]
+    assert 'What do you do?' in second[1]
+    assert first[0].run_script(['look']) == second[0].run_script(['look'])
+    # only the memory the boot sequence changed is stored
+    image, = Path(tmp_path).iterdir()
+    assert image.stat().st_size < 16000
@@ -0,0 +1,85 @@
+import pytest
+from itertools import permutations
+from pathlib import Path
+from ..virtual_machine import VirtualMachine
+from ..explorer import _expand
+from ..script import read_script
+from ..coins import EQUATION, solve, parse, coin_value
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def brute_force(template, values):
+    left, _, right = template.partition('=')
+    source = left.replace('^', '**')
+    solutions = set()
+    for values in permutations(values, left.count('_')):
+        blanks = iter(values)
+        expression = ''.join('({})'.format(next(blanks)) if char == '_' else char
+                             for char in source)
+        if eval(expression) == int(right):
+            solutions.add(values)
+    return sorted(solutions)
+
+
+def test_monument():
+    assert solve('_ + _ * _^2 + _^3 - _ = 399', [2, 3, 5, 7, 9]) == [(9, 2, 5, 7, 3)]
+
+
+@pytest.mark.parametrize(
+    "template,values",
+    [
+        ('_ + _ * _^2 + _^3 - _ = 399', range(1, 10)),
+        ('_ * _ - _ = 5', range(1, 7)),
+        ('-_ + 3 * (_ - _)^2 - _ = 20', range(-3, 6)),
+        ('_^2 - _ * _ + _ = 0', [-2, -1, 0, 1, 2, 3]),
+        ('_ + _ = 4', [1, 2, 2, 3]),
+        ('_ * _ * _ = 1000', range(1, 8)),
+    ]
+)
+def test_solve_matches_brute_force(template, values):
+    assert solve(template, values) == brute_force(template, values)
+
+
+@pytest.mark.parametrize("template", ['_ + _', '_ / _ = 1', '_ ^ _ = 4', 'x + _ = 1', '_ + 0.5 = 1'])
+def test_unsupported_equation(template):
+    with pytest.raises(ValueError):
+        parse(template)
+
+
+@pytest.mark.parametrize(
+    "description,expected",
+    [
+        ('This coin is made of a red metal.  It has two dots on one side.', 2),
+        ('This coin is somewhat corroded.  It has a triangle on one side.', 3),
+        ('This coin is made of a blue metal.  It has nine dots on one side.', 9),
+        ('A plain coin.', None),
+    ]
+)
+def test_coin_value(description, expected):
+    assert coin_value(description) == expected
+
+
+@pytest.fixture(scope='module')
+def ruins():
+    """A game in the ruins with all five coins, before any is used"""
+    commands = list(read_script(str(ROOT / 'solutions' / 'part1.txt')))
+    vm = VirtualMachine(str(ROOT / 'challenge.bin'), engine='dispatch')
+    vm.run_script(commands[:commands.index('use blue coin')])
+    return vm.snapshot()
+
+
+def test_solve_coins_directive(ruins):
+    vm = VirtualMachine(ruins.memory(), engine='dispatch')
+    vm.restore(ruins)
+    transcript = vm.run_script(['solve coins', 'north'])
+    assert EQUATION.search(transcript)
+    assert 'you hear a click from the north door' in transcript
+    assert '== Ruins ==' in transcript.split('click')[-1]
+
+
+def test_explorer_solves_coins(ruins):
+    _, _, results = _expand(ruins, 'dispatch')
+    transcripts = {command: transcript for command, transcript, *_ in results}
+    assert 'you hear a click' in transcripts['solve coins']
@@ -0,0 +1,35 @@
+import pytest
+from ..backends import BufferBackend
+from ..virtual_machine import VirtualMachine
+
+# in r0; out r0; jmp 0
+ECHO = [20, 32768, 19, 32768, 6, 0]
+
+
+@pytest.mark.parametrize("engine", ['operations', 'dispatch'])
+def test_meta_commands_do_not_reach_the_program(engine):
+    vm = VirtualMachine(ECHO[:], engine=engine)
+    calls = []
+    vm._commands.handlers['note'] = lambda vm, args: calls.append(args)
+    transcript = vm.run_script(['note to self', 'notes', 'x'])
+    assert calls == [['to', 'self']]
+    assert transcript == 'notes\nx\n'
+
+
+def test_commands_match_leading_words():
+    vm = VirtualMachine(ECHO[:], engine='dispatch')
+    transcript = vm.run_script(['use saved note', 'save'])
+    assert transcript.startswith('use saved note\nPlease provide a file name.')
+
+
+def test_rewire_teleporter(mocker):
+    mocker.patch('python_vm.teleporter.energy_level', return_value=25734)
+    binary = [0] * 5491
+    binary[:6] = ECHO
+    vm = VirtualMachine(binary, engine='dispatch', backend=BufferBackend(['rewire teleporter']))
+    vm.run()
+    assert vm._registers[7] == 25734
+    assert binary[5485] == 6 and binary[5489:5491] == [21, 21]
+    # only the instructions of the check are patched
+    assert binary[5452] == 0
+    assert vm._backend.getvalue() == b'Teleporter settings altered!\n\n'
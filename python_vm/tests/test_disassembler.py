@@ -0,0 +1,70 @@
+import pytest
+from ..disassembler import format_instruction, listing, trace_code, disassemble
+
+
+@pytest.mark.parametrize(
+    "memory,expected",
+    [
+        ([19, 97], ("0:     OUT  'a'", 2)),
+        ([9, 32768, 32769, 4], ("0:     ADD  r0    r1    4    ", 4)),
+        ([18], ("0:     RET ", 1)),
+        ([30000], ("0:     DATA: 30000", 1)),
+    ]
+)
+def test_format_instruction(memory, expected):
+    assert format_instruction(memory, 0) == expected
+
+
+def test_listing():
+    memory = [21, 6, 0, 40000, 19, 32776]
+    assert [address for address, _ in listing(memory)] == [0, 1, 3, 4, 5]
+    assert list(listing(memory))[3][1] == "4:     DATA: 19"
+
+
+def test_trace_code():
+    program = [7, 32768, 8, 19, 104, 19, 105, 0,
+               1, 32769, 16, 17, 32769, 6, 0, 30000, 18]
+    code, functions, labels = trace_code(program)
+    assert sorted(code) == [0, 3, 5, 7, 8, 11, 13, 16]
+    assert functions == {16}
+    assert labels == {0, 8}
+
+
+def test_trace_code_carries_on_past_invalid_words():
+    # noop; (1) invalid; (2) out 'a'; halt
+    code, _, _ = trace_code([21, 30000, 19, 97, 0], (2, 0))
+    assert sorted(code) == [0, 2, 4]
+    # jt r0 7; noop; (4) invalid; (7) out 'a'; halt
+    code, _, labels = trace_code([7, 32768, 7, 21, 30000, 0, 0, 19, 97, 0])
+    assert sorted(code) == [0, 3, 7, 9]
+    assert labels == {7}
+
+
+def test_trace_code_pointers():
+    # set r0 6; call 8; halt; (6) ret; halt; (8) call r0; ret
+    program = [1, 32768, 6, 17, 8, 0, 18, 0, 17, 32768, 18]
+    assert 6 not in trace_code(program, pointers=False)[0]
+    code, functions, _ = trace_code(program)
+    assert 6 in code
+    assert functions == {6, 8}
+
+
+def test_disassemble():
+    program = [7, 32768, 8, 19, 104, 19, 105, 0,
+               1, 32769, 16, 17, 32769, 6, 0, 30000, 18,
+               3, 97, 98, 99]
+    assert list(disassemble(program)) == [
+        'loc_0:',
+        '0:     JT   r0    loc_8',
+        '3:     OUT  "hi"',
+        '7:     HALT',
+        'loc_8:',
+        '8:     SET  r1    16',
+        '11:    CALL r1',
+        '13:    JMP  loc_0',
+        '15:    DATA 30000',
+        '',
+        'sub_16:',
+        '16:    RET',
+        '17:    STR  "abc"',
+    ]
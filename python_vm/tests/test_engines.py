@@ -0,0 +1,95 @@
+import pytest
+from ..virtual_machine import VirtualMachine
+
+
+ENGINES = ['dispatch', 'blocks', 'aot']
+
+
+def run_vm(binary, engine, cache_dir, registers=None, stack=None):
+    vm = VirtualMachine(binary[:], registers=registers or [0] * 8,
+                        stack=stack or [], engine=engine, aot_cache_dir=str(cache_dir))
+    with pytest.raises(SystemExit) as exc_info:
+        vm.execute()
+    return vm, exc_info.value
+
+
+@pytest.mark.parametrize(
+    "binary",
+    [
+        # r0 = 3 + 4, r1 = r0 * r0, r2 = r1 mod 5, out r2 + 48
+        [9, 32768, 3, 4, 10, 32769, 32768, 32768, 11, 32770, 32769, 5,
+         9, 32770, 32770, 48, 19, 32770, 0],
+        # count r0 down from 3, printing 'x' each time
+        [1, 32768, 3, 19, 120, 9, 32768, 32768, 32767, 7, 32768, 3, 0],
+        # call a subroutine which pushes, pops and returns
+        [17, 4, 19, 10, 2, 65, 3, 32769, 19, 32769, 18],
+        # rmem / wmem round trip through a data cell, then bitwise ops
+        [16, 20, 7, 15, 32768, 20, 12, 32769, 32768, 6, 13, 32769, 32769, 8,
+         14, 32770, 32769, 0, 0, 0, 0],
+        # push a run, pop it back, then compare and branch on the result
+        [2, 32768, 2, 32769, 2, 65, 3, 32770, 3, 32771, 3, 32772, 4, 32773,
+         32770, 65, 8, 32773, 21, 19, 32770, 0],
+    ]
+)
+@pytest.mark.parametrize("engine", ENGINES)
+def test_matches_reference(binary, engine, tmp_path, capsys):
+    ref_vm, ref_exit = run_vm(binary, 'operations', tmp_path)
+    ref_out = capsys.readouterr().out
+    vm, exit_ = run_vm(binary, engine, tmp_path)
+    assert capsys.readouterr().out == ref_out
+    assert exit_.code == ref_exit.code
+    assert vm._bin == ref_vm._bin
+    assert vm._registers == ref_vm._registers
+    assert vm._stack == ref_vm._stack
+    assert vm._curr_idx == ref_vm._curr_idx
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(
+    "binary,expected",
+    [
+        # out 'a', then overwrite the operand of that `out` with 'b' and jump
+        # back to it
+        ([19, 97, 7, 32768, 13, 16, 1, 98, 1, 32768, 1, 6, 0, 0], 'ab'),
+        # overwrite an instruction later on in the same straight-line run
+        ([16, 4, 98, 19, 97, 0], 'b'),
+        # overwrite the second of a run of `out`s after it has run once
+        ([19, 97, 19, 98, 7, 32768, 15, 16, 3, 99, 1, 32768, 1, 6, 0, 0], 'abac'),
+    ]
+)
+def test_self_modifying_code_is_redecoded(binary, expected, engine, tmp_path, capsys):
+    run_vm(binary, engine, tmp_path)
+    assert capsys.readouterr().out.startswith(expected)
+
+
+@pytest.mark.parametrize(
+    "binary,message",
+    [
+        ([22], "Error in binary at index 0: 22 is not listed as a valid opcode"),
+        ([3, 32768], "Error in binary at index 0: Attempting to pop from empty stack"),
+        ([21, 1, 32768, 40000],
+         "Error in binary at index 1: ('Encountered invalid number {}', 40000)"),
+        ([2, 5, 3, 32768, 3, 32768, 0],
+         "Error in binary at index 4: Attempting to pop from empty stack"),
+        ([21, 15, 32768, 4, 40000],
+         "Error in binary at index 1: ('Encountered invalid number {}', 40000)"),
+    ]
+)
+@pytest.mark.parametrize("engine", ENGINES)
+def test_error_semantics(binary, message, engine, tmp_path):
+    _, exit_ = run_vm(binary, engine, tmp_path)
+    assert exit_.code == message
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        VirtualMachine([0], engine='missing')
+
+
+def test_blocks_covering_a_word_are_recorded_once(tmp_path):
+    # 0: add r0 r0 1; wmem 3 1; eq r1 r0 100; jf r1 0; halt, where the
+    # `wmem` writes over the block it is in on every time around the loop
+    binary = [9, 32768, 32768, 1, 16, 3, 1, 4, 32769, 32768, 100, 8, 32769, 0, 0]
+    vm, _ = run_vm(binary, 'blocks', tmp_path)
+    assert vm._registers[0] == 100
+    assert max(len(starts) for starts in vm._runner._covered if starts) <= 2
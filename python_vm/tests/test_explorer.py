@@ -0,0 +1,66 @@
+import pytest
+from pathlib import Path
+from ..virtual_machine import VirtualMachine
+from .. import explorer
+from ..explorer import Explorer, CODE, EXITS, _listing
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_listing():
+    text = "There are 2 exits:\n- doorway\n- south\n\nWhat do you do?\n"
+    assert _listing(EXITS, text) == ['doorway', 'south']
+    assert _listing(EXITS, "There is 1 exit:\n- north\n") == ['north']
+    assert _listing(EXITS, "Nothing here.\n") == []
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ('writing "VgJyhWbmzQzI" on the tablet', ['VgJyhWbmzQzI']),
+        ('The code is: XQcANZleaivr\n', ['XQcANZleaivr']),
+        ('Headquarters and Synacorians', []),
+    ]
+)
+def test_code_pattern(text, expected):
+    assert CODE.findall(text) == expected
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_explore_start(processes):
+    vm = VirtualMachine(str(ROOT / 'challenge.bin'), engine='dispatch')
+    vm.run_script([])
+    found = []
+    explorer = Explorer(vm, processes, lambda *args: found.append(args))
+    states = explorer.explore(max_depth=2)
+    assert ('room', 'Dark cave', ('doorway',)) in found
+    assert explorer.items['tablet'] == ()
+    assert explorer.codes['VgJyhWbmzQzI'] == ('take tablet', 'use tablet')
+    assert states > 1
+
+
+def test_states_are_deduplicated():
+    vm = VirtualMachine(str(ROOT / 'challenge.bin'), engine='dispatch')
+    vm.run_script([])
+    explorer = Explorer(vm)
+    start = vm.snapshot()
+    vm.run_script(['doorway', 'south'])
+    assert explorer.digest(vm.snapshot()) == explorer.digest(start)
+    vm.run_script(['take tablet'])
+    assert explorer.digest(vm.snapshot()) != explorer.digest(start)
+
+
+def test_worker_machine_is_reused(mocker):
+    vm = VirtualMachine(str(ROOT / 'challenge.bin'), engine='dispatch')
+    vm.run_script([])
+    mocker.patch.object(explorer, '_worker_vm', None)
+    first = explorer._expand(vm.snapshot(), 'dispatch')
+    worker = explorer._worker_vm
+    vm.run_script(['doorway'])
+    explorer._expand(vm.snapshot(), 'dispatch')
+    assert explorer._worker_vm is worker
+    assert first[2][0][0] == 'doorway'
+    explorer._expand(vm.snapshot(), 'blocks')
+    assert explorer._worker_vm is not worker
+    assert explorer._worker_vm._engine == 'blocks'
@@ -0,0 +1,54 @@
+import pytest
+from ..fusion import match, instruction_mix
+from ..profiler import Profile
+from ..virtual_machine import VirtualMachine
+
+
+@pytest.mark.parametrize(
+    "binary,expected",
+    [
+        ([19, 97, 19, 98, 0], ('out run', 2)),
+        ([2, 32768, 2, 32769, 2, 32770, 3, 32768], ('push run', 3)),
+        # a countdown: add r0 r0 32767; jt r0 0
+        ([9, 32768, 32768, 32767, 7, 32768, 0], ('add+jump', 2)),
+        ([4, 32769, 32768, 5, 8, 32769, 0], ('compare+jump', 2)),
+        # the jump tests a different register from the one compared into
+        ([4, 32769, 32768, 5, 8, 32768, 0], None),
+        ([19, 97, 0], None),
+        # a register operand out of range stops the run
+        ([2, 32768, 2, 40000], None),
+    ]
+)
+def test_match(binary, expected):
+    found = match(binary, 0)
+    assert (found and (found[0], len(found[1]))) == expected
+
+
+def test_instruction_mix(capsys):
+    # push r0; push r1; pop r1; pop r0; add r2 r2 32767; jt r2 0; halt
+    binary = [2, 32768, 2, 32769, 3, 32769, 3, 32768, 9, 32770, 32770, 32767,
+              7, 32770, 0, 0]
+    vm = VirtualMachine(binary, registers=[0, 0, 3, 0, 0, 0, 0, 0])
+    profile = Profile()
+    with pytest.raises(SystemExit):
+        vm.execute(profile)
+    mix = instruction_mix(vm._bin, profile.hits)
+    assert mix['instructions'] == 19
+    assert mix['opcodes']['push'] == 6
+    assert mix['pairs'][('push', 'push')] == 3
+    assert ('jt', 'halt') not in mix['pairs']
+    assert mix['fusions']['push run'] == {'sites': 1, 'dispatches saved': 3}
+    assert mix['fusions']['add+jump'] == {'sites': 1, 'dispatches saved': 3}
+    assert mix['fusions']['out run'] == {'sites': 0, 'dispatches saved': 0}
+
+
+def test_instruction_mix_run_after_operand():
+    # eq r1 2 r0; push r0; push r0; halt, where the run of `push` starts
+    # right after an operand equal to the `push` opcode
+    binary = [4, 32769, 2, 32768, 2, 32768, 2, 32768, 0]
+    vm = VirtualMachine(binary)
+    profile = Profile()
+    with pytest.raises(SystemExit):
+        vm.execute(profile)
+    mix = instruction_mix(vm._bin, profile.hits)
+    assert mix['fusions']['push run'] == {'sites': 1, 'dispatches saved': 1}
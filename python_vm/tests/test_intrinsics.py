@@ -0,0 +1,77 @@
+import pytest
+from pathlib import Path
+from ..virtual_machine import VirtualMachine
+from ..intrinsics import CONFIRMATION_ADDRESS, confirmation
+
+
+ROOT = Path(__file__).resolve().parents[2]
+ENGINES = ['operations', 'dispatch', 'blocks']
+
+# r0 = '0', call the subroutine at 12 (which adds one to r0) through either a
+# literal or a register, then print r0 and halt
+DIRECT_CALL = [1, 32768, 48, 17, 12, 19, 32768, 0, 0, 0, 0, 0,
+               9, 32768, 32768, 1, 18]
+REGISTER_CALL = [1, 32768, 48, 1, 32769, 12, 17, 32769, 19, 32768, 0, 0,
+                 9, 32768, 32768, 1, 18]
+
+
+def add_two(registers):
+    registers[0] += 2
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("binary", [DIRECT_CALL, REGISTER_CALL])
+def test_intrinsic_replaces_subroutine(binary, engine):
+    vm = VirtualMachine(binary[:], engine=engine)
+    assert vm.run_script([]).startswith('1')
+
+    vm = VirtualMachine(binary[:], engine=engine)
+    vm.register_intrinsic(12, add_two)
+    assert vm.run_script([]).startswith('2')
+    assert vm._stack == []
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_memoized_intrinsic(engine):
+    calls = []
+
+    def record(registers):
+        calls.append(registers[0])
+        add_two(registers)
+
+    # call the subroutine at 14 twice with r0 = '0'
+    binary = [1, 32768, 48, 17, 14, 1, 32768, 48, 17, 14, 19, 32768, 0, 0,
+              9, 32768, 32768, 1, 18]
+    vm = VirtualMachine(binary, engine=engine)
+    vm.register_intrinsic(14, record, memoize=True, inputs=[0])
+    assert vm.run_script([]).startswith('2')
+    assert calls == [48]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("outputs", [None, [0]])
+def test_memoized_intrinsic_keeps_other_registers(engine, outputs):
+    # set r0 48; set r2 53; call 23; set r2 57; set r0 48; call 23; out r2,
+    # where the subroutine at 23 only reads and writes r0
+    binary = [1, 32768, 48, 1, 32770, 53, 17, 23, 1, 32770, 57,
+              1, 32768, 48, 17, 23, 19, 32770, 0, 0, 0, 0, 0,
+              9, 32768, 32768, 1, 18]
+    vm = VirtualMachine(binary, engine=engine)
+    vm.register_intrinsic(23, add_two, memoize=True, inputs=[0], outputs=outputs)
+    assert vm.run_script([]).startswith('9')
+    assert vm._registers[0] == 50
+
+
+@pytest.mark.parametrize("r0,r1,r7", [(2, 3, 4), (3, 1, 8)])
+def test_confirmation_matches_routine(r0, r1, r7):
+    stub = [1, 32768, r0, 1, 32769, r1, 1, 32775, r7,
+            17, CONFIRMATION_ADDRESS, 0]
+    results = []
+    for native in (False, True):
+        vm = VirtualMachine(str(ROOT / 'challenge.bin'), engine='blocks')
+        vm._bin[:len(stub)] = type(vm._bin)('H', stub)
+        if native:
+            vm.register_intrinsic(CONFIRMATION_ADDRESS, confirmation)
+        vm.run_script([])
+        results.append(list(vm._registers))
+    assert results[0] == results[1]
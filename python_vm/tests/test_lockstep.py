@@ -0,0 +1,44 @@
+import pytest
+from ..dispatch import DispatchEngine
+from ..lockstep import Lockstep
+
+# 0: set r0 0; 3: add r0 r0 1; mult r1 r0 2; eq r2 r0 100; jf r2 3
+# 18: in r3; out r3; jmp 18
+PROGRAM = [1, 32768, 0, 9, 32768, 32768, 1, 10, 32769, 32768, 2,
+           4, 32770, 32768, 100, 8, 32770, 3, 20, 32771, 19, 32771, 6, 18]
+
+
+@pytest.mark.parametrize("other", ['dispatch', 'blocks', 'aot'])
+def test_engines_agree(other, tmp_path):
+    report = Lockstep(PROGRAM, 'operations', other, every=7,
+                      aot_cache_dir=str(tmp_path)).run(['ab', 'c'])
+    assert report.divergence is None
+    # the loop, then reading and echoing each character and newline, up to
+    # the `in` which finds no more input
+    assert report.instructions == 1 + 100 * 4 + 5 * 3
+    assert report.checkpoints > 1
+
+
+def test_finds_first_divergent_instruction(mocker):
+    def decode_mult(self, pc, a, b, c):
+        V = self._values
+
+        def handler():
+            V[a] = (V[b] * V[c] + (V[b] >= 50)) % 32768
+            return pc + 4
+        return handler
+    mocker.patch.object(DispatchEngine, '_decode_mult', decode_mult)
+
+    report = Lockstep(PROGRAM, 'operations', 'dispatch', every=64).run([])
+    divergence = report.divergence
+    # the `mult` of the 50th time around the loop, which is wrong from then on
+    assert divergence.instructions == 1 + 49 * 4 + 1
+    assert divergence.address == 7
+    assert divergence.instruction.split() == ['7:', 'MULT', 'r1', 'r0', '2']
+    assert divergence.fields() == ['registers']
+    assert (divergence.reference.registers[1], divergence.other.registers[1]) == (100, 101)
+
+
+def test_reference_runs_instruction_per_step():
+    with pytest.raises(ValueError):
+        Lockstep(PROGRAM, 'blocks', 'dispatch')
@@ -1,5 +1,7 @@
+import io
 import pytest
 from ..operations import Operations
+from ..output import OutputBuffer
 from ..virtual_machine import VirtualMachine
 
 
@@ -14,7 +16,7 @@ def setup_mocks(mocker):
 def setup_vm_and_ops_module(binary, curr_idx, stack=[]):
     vm = VirtualMachine(binary, curr_idx, stack)
     ops = Operations(vm._read_from_mem, vm._write_to_mem,
-                     vm._push_stack, vm._pop_stack, vm._save_state)
+                     vm._push_stack, vm._pop_stack)
     return ops
 
 
@@ -154,7 +156,6 @@ def test_mem_manip_ops(op, curr_idx, input_bin, next_idx, res_bin):
 @pytest.mark.parametrize(
     "op,curr_idx,input_bin,next_idx,res_bin,side_effect",
     [
-        ('out', 0, [19, 97], 2, [19, 97], 'mocked_print'),
         ('in_', 0, [20, 10], 2, [20, 97], 'mocked_input')
     ]
 )
@@ -165,3 +166,20 @@ def test_io_ops(op, curr_idx, input_bin, next_idx, res_bin, side_effect):
     (eval(side_effect)).assert_called_once()
     assert result == next_idx
     assert input_bin == res_bin
+
+
+@pytest.mark.parametrize(
+    "input_bin,expected_writes",
+    [
+        ([19, 97], []),
+        ([19, 10], ['\n']),
+    ]
+)
+def test_out_op(input_bin, expected_writes):
+    stream = io.StringIO()
+    vm = VirtualMachine(input_bin, output=OutputBuffer(stream))
+    result = vm._ops.out(0)
+    assert result == 2
+    assert stream.getvalue() == ''.join(expected_writes)
+    vm._output.flush()
+    assert stream.getvalue() == chr(input_bin[1])
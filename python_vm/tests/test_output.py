@@ -0,0 +1,33 @@
+import io
+import pytest
+from ..output import OutputBuffer
+
+
+@pytest.mark.parametrize("stream_type,convert", [
+    (io.StringIO, str),
+    (io.BytesIO, lambda text: text.encode('utf-8')),
+])
+def test_flushes_on_newline(stream_type, convert):
+    stream = stream_type()
+    output = OutputBuffer(stream)
+    for char in 'ab\ncd':
+        output.put(ord(char))
+    assert stream.getvalue() == convert('ab\n')
+    output.flush()
+    assert stream.getvalue() == convert('ab\ncd')
+
+
+def test_flushes_at_threshold():
+    stream = io.StringIO()
+    output = OutputBuffer(stream, threshold=4)
+    output.write('abc')
+    assert stream.getvalue() == ''
+    output.put(ord('d'))
+    assert stream.getvalue() == 'abcd'
+
+
+def test_defaults_to_current_stdout(capsys):
+    output = OutputBuffer()
+    output.write('hello')
+    output.flush()
+    assert capsys.readouterr().out == 'hello'
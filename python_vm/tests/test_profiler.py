@@ -0,0 +1,85 @@
+import io
+import signal
+import pytest
+from ..virtual_machine import VirtualMachine
+from ..profiler import Profile, Sampler, ENTRY
+
+# 0: call 6; out 'a'; halt
+# 6: push r0; call 14; pop r0; ret
+# 14: noop; ret
+PROGRAM = [17, 6, 19, 97, 0, 0,
+           2, 32768, 17, 14, 3, 32768, 18, 0,
+           21, 18]
+
+
+def test_profile_counts():
+    vm = VirtualMachine(PROGRAM[:], engine='blocks')
+    profile = Profile()
+    assert vm.run_script([], profile) == 'aReached opcode 0, terminating program.\n'
+    assert profile.total == 9
+    assert profile.hits == {0: 1, 2: 1, 4: 1, 6: 1, 8: 1, 10: 1, 12: 1, 14: 1, 15: 1}
+    assert profile.opcodes[17] == 2
+    assert profile.opcodes[18] == 2
+    functions = profile.summary()
+    assert functions[6] == [1, 6, 4]
+    assert functions[14] == [1, 2, 2]
+    assert functions[ENTRY] == [0, 9, 3]
+    assert profile.edges == {(ENTRY, 6): 1, (6, 14): 1}
+
+
+def test_profile_recursion():
+    # 0: set r0 3; call 6; halt
+    # 6: jf r0 16; add r0 r0 32767; call 6; ret
+    program = [1, 32768, 3, 17, 6, 0,
+               8, 32768, 16, 9, 32768, 32768, 32767, 17, 6, 18, 18]
+    vm = VirtualMachine(program)
+    profile = Profile()
+    vm.run_script([], profile)
+    calls, inclusive, exclusive = profile.summary()[6]
+    assert calls == 4
+    # every instruction from the first call up to the last return
+    assert inclusive == profile.total - 3
+    assert exclusive == inclusive
+    assert profile.edges[6, 6] == 3
+
+
+def test_profile_intrinsic():
+    vm = VirtualMachine(PROGRAM[:], engine='dispatch')
+    vm.register_intrinsic(6, lambda registers: None)
+    profile = Profile()
+    vm.run_script([], profile)
+    assert profile.total == 3
+    assert profile.summary()[6] == [1, 0, 0]
+
+
+@pytest.mark.parametrize("profile", [None, Profile()])
+def test_profile_invalid_call(profile):
+    vm = VirtualMachine([17, 40000, 0], engine='dispatch')
+    with pytest.raises(SystemExit) as e:
+        vm.execute(profile)
+    assert str(e.value.code).startswith('Error in binary at index 0:')
+    assert '40000' in str(e.value.code)
+
+
+def test_profile_dump():
+    vm = VirtualMachine(PROGRAM[:])
+    profile = Profile()
+    vm.run_script([], profile)
+    stream = io.StringIO()
+    profile.dump(vm._bin, stream)
+    text = stream.getvalue()
+    assert text.startswith('Profile of 9 instructions')
+    assert "1  11.11%   2:     OUT  'a'" in text
+    assert '15:    RET' in text
+
+
+def test_sampler():
+    # 0: add r0 r0 1; jt r0 0; halt
+    vm = VirtualMachine([9, 32768, 32768, 1, 7, 32768, 0, 0], engine='dispatch')
+    sampler = Sampler(0.0005)
+    handler = signal.getsignal(signal.SIGPROF)
+    vm.run_script([], sampler)
+    assert signal.getsignal(signal.SIGPROF) is handler
+    assert set(sampler.hits) <= {0, 4, 7}
+    assert sum(sampler.hits.values()) == sampler.total
+    assert sampler.summary()[ENTRY][1] == sampler.total
@@ -0,0 +1,74 @@
+import pytest
+from array import array
+from pathlib import Path
+from ..virtual_machine import VirtualMachine
+from ..savefile import save_state, load_state
+
+ROOT = Path(__file__).resolve().parents[2]
+# out 'h'; out 'i'; in r0; out r0; jmp 4
+PROGRAM = [19, 104, 19, 105, 20, 32768, 19, 32768, 6, 4]
+
+
+def write_binary(path, words):
+    path.write_bytes(b''.join(word.to_bytes(2, 'little') for word in words))
+    return str(path)
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_save_round_trip(tmp_path, compress):
+    base = write_binary(tmp_path / 'program.bin', PROGRAM + [0] * 2000)
+    vm = VirtualMachine(base, registers=list(range(8)), stack=[1, 32775],
+                        curr_idx=4)
+    vm._bin[1] = 111
+    vm._bin[1500:1503] = array('H', [7, 8, 9])
+    vm._ops._input_cache = list('é\n')
+    path = str(tmp_path / 'x.sav')
+    save_state(path, vm.snapshot(), base, compress)
+
+    restored = VirtualMachine.from_snapshot(load_state(path, base), engine='dispatch')
+    assert restored.snapshot() == vm.snapshot()
+    assert restored._stack == [1, 32775]
+    # only the three runs of changed words are stored
+    assert Path(path).stat().st_size < 150
+    assert 'é' in restored.run_script([])
+
+
+def test_save_without_base(tmp_path):
+    vm = VirtualMachine(PROGRAM[:], curr_idx=4)
+    path = str(tmp_path / 'x.sav')
+    save_state(path, vm.snapshot(), base=None)
+    assert list(load_state(path, base=None).memory()) == PROGRAM
+
+
+def test_save_against_other_binary_is_refused(tmp_path):
+    base = write_binary(tmp_path / 'program.bin', PROGRAM)
+    path = str(tmp_path / 'x.sav')
+    save_state(path, VirtualMachine(base).snapshot(), base)
+    write_binary(tmp_path / 'program.bin', [19, 111] + PROGRAM[2:])
+    with pytest.raises(ValueError, match='different binary'):
+        load_state(path, base)
+
+
+@pytest.mark.parametrize("cut", [1, 20, 60])
+def test_truncated_save_is_refused(tmp_path, cut):
+    base = write_binary(tmp_path / 'program.bin', PROGRAM)
+    vm = VirtualMachine(PROGRAM[:], stack=[3])
+    vm._bin[0] = 21
+    path = tmp_path / 'x.sav'
+    save_state(str(path), vm.snapshot(), base)
+    path.write_bytes(path.read_bytes()[:-cut])
+    with pytest.raises(ValueError):
+        load_state(str(path), base)
+
+
+def test_save_command(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'challenge.bin').write_bytes((ROOT / 'challenge.bin').read_bytes())
+    vm = VirtualMachine('challenge.bin', engine='dispatch')
+    vm.run_script(['look'])
+    assert vm.run_script(['save x']) == 'Saved state to data/x.sav\n\n'
+    restored = VirtualMachine.from_snapshot(load_state('data/x.sav'), engine='dispatch')
+    assert restored.run_script(['look']) == vm.run_script(['look'])
+    # the boot sequence decrypts and writes over a good part of memory
+    assert (tmp_path / 'data' / 'x.sav').stat().st_size < 20000
@@ -0,0 +1,95 @@
+import asyncio
+from pathlib import Path
+from ..server import GameServer, Session
+from ..virtual_machine import VirtualMachine, Status
+
+
+ROOT = Path(__file__).resolve().parents[2]
+PROMPT = b'What do you do?\n'
+# 0: in r0; out r0; eq r1 r0 'x'; jt r1 13; jmp 0
+# 13: jmp 13 (spins once it echoes an `x`)
+ECHO = [20, 32768, 19, 32768, 4, 32769, 32768, 120, 7, 32769, 13, 6, 0, 6, 13]
+
+
+def write_binary(path, words):
+    path.write_bytes(b''.join(word.to_bytes(2, 'little') for word in words))
+    return str(path)
+
+
+async def play(reader, writer, commands):
+    """Stands in for a player: waits for each prompt before typing"""
+    transcript = await reader.readuntil(PROMPT)
+    for command in commands:
+        writer.write(command.encode() + b'\n')
+        transcript += await reader.readuntil(PROMPT)
+    return transcript.decode()
+
+
+def test_session_slices():
+    vm = VirtualMachine([9, 32768, 32768, 1, 6, 0, 0], engine='dispatch')
+    # 0: add r0 r0 1; jmp 0 (counts forever)
+    session = Session(vm, budget=100)
+    assert session.run() == Status.BUDGET_EXHAUSTED
+    assert vm._registers[0] == 50
+    assert session.run() == Status.BUDGET_EXHAUSTED
+    assert vm._registers[0] == 100
+
+
+def test_session_input_and_halt():
+    vm = VirtualMachine([20, 32768, 19, 32768, 0], engine='blocks')
+    session = Session(vm)
+    assert session.run() == Status.AWAITING_INPUT
+    session.feed('ab')
+    assert session.run() == Status.HALTED
+    assert session.output() == 'aReached opcode 0, terminating program.\n'
+
+
+def test_session_error():
+    session = Session(VirtualMachine([3, 32768], engine='dispatch'))
+    assert session.run() == Status.HALTED
+    assert session.output() == 'Error in binary at index 0: Attempting to pop from empty stack\n'
+
+
+def test_game_sessions(tmp_path):
+    async def scenario():
+        server = GameServer(str(ROOT / 'challenge.bin'), cache_dir=str(tmp_path))
+        await server.start(path=str(tmp_path / 'game.sock'))
+        clients = [await asyncio.open_unix_connection(str(tmp_path / 'game.sock'))
+                   for _ in range(3)]
+        try:
+            return await asyncio.gather(
+                play(*clients[0], ['take tablet', 'use tablet']),
+                play(*clients[1], ['doorway', 'north']),
+                # no prompt follows a meta-command, so `look` is sent with it
+                play(*clients[2], ['save x\nlook']))
+        finally:
+            for _, writer in clients:
+                writer.close()
+            await server.close()
+
+    tablet, cave, saved = asyncio.run(scenario())
+    assert 'Welcome to the Synacor Challenge!' in tablet
+    assert 'VgJyhWbmzQzI' in tablet
+    assert '== Dark cave ==' in cave and 'VgJyhWbmzQzI' not in cave
+    assert 'Saving is not available' in saved
+    assert not (tmp_path / 'x.json').exists()
+
+
+def test_busy_session_does_not_block_others(tmp_path):
+    async def scenario():
+        server = GameServer(write_binary(tmp_path / 'echo.bin', ECHO),
+                            budget=50, cache_dir=str(tmp_path))
+        listener = await server.start()
+        port = listener.sockets[0].getsockname()[1]
+        busy_reader, busy = await asyncio.open_connection('127.0.0.1', port)
+        busy.write(b'x\n')
+        assert await busy_reader.readexactly(1) == b'x'
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b'hello\n')
+        echoed = await asyncio.wait_for(reader.readline(), 5)
+        writer.close()
+        busy.close()
+        await server.close()
+        return echoed
+
+    assert asyncio.run(scenario()) == b'hello\n'
@@ -0,0 +1,110 @@
+import pytest
+from array import array
+from pathlib import Path
+from ..virtual_machine import VirtualMachine
+from ..snapshot import PAGE_SIZE, take_pages, restore_pages
+
+
+ROOT = Path(__file__).resolve().parents[2]
+# in r0; out r0; jmp 0
+ECHO = [20, 32768, 19, 32768, 6, 0]
+
+
+def state(vm):
+    return (list(vm._bin), list(vm._registers), list(vm._stack),
+            vm._curr_idx, list(vm._ops._input_cache))
+
+
+@pytest.mark.parametrize("memory", [
+    array('H', range(PAGE_SIZE * 3 + 5)),
+    list(range(PAGE_SIZE * 3 + 5)),
+])
+def test_pages_round_trip(memory):
+    pages = take_pages(memory)
+    assert len(pages) == 4
+    original = list(memory)
+    memory[PAGE_SIZE + 1] = 7
+    assert restore_pages(memory, pages) == [range(PAGE_SIZE, PAGE_SIZE * 2)]
+    assert list(memory) == original
+
+
+def test_unchanged_pages_are_shared():
+    memory = array('H', [0] * (PAGE_SIZE * 4))
+    first = take_pages(memory)
+    memory[PAGE_SIZE * 2] = 1
+    second = take_pages(memory, first)
+    assert [a is b for a, b in zip(first, second)] == [True, True, False, True]
+
+
+def test_restore_rejects_other_memory_size():
+    pages = take_pages(array('H', [0] * 10))
+    with pytest.raises(ValueError):
+        restore_pages(array('H', [0] * 11), pages)
+
+
+@pytest.mark.parametrize("engine", ['operations', 'dispatch', 'blocks'])
+def test_snapshot_and_restore(engine):
+    vm = VirtualMachine(ECHO[:], engine=engine)
+    vm._stack.append(3)
+    snapshot = vm.snapshot()
+    before = state(vm)
+    assert vm.run_script(['ab']) == 'ab\n'
+    vm.write_memory(5, [2])
+    vm.restore(snapshot)
+    assert state(vm) == before
+    assert vm.run_script(['ab']) == 'ab\n'
+
+
+@pytest.mark.parametrize("engine", ['operations', 'dispatch', 'blocks', 'aot'])
+def test_snapshot_copies_only_written_pages(engine, tmp_path):
+    # in r0; wmem 2500 r0; jmp 0, with three pages of memory
+    program = [20, 32768, 16, 2500, 32768, 6, 0] + [0] * (PAGE_SIZE * 3)
+    vm = VirtualMachine(program, engine=engine, aot_cache_dir=str(tmp_path))
+    first = vm.snapshot()
+    vm.run_script(['a'])
+    second = vm.snapshot()
+    assert [a is b for a, b in zip(first.pages, second.pages)] == \
+        [True, True, False, True]
+    assert vm._bin[2500] == 10
+    vm.restore(first)
+    assert vm._bin[2500] == 0
+    vm.restore(second)
+    assert vm._bin[2500] == 10
+
+
+def test_snapshot_keeps_pending_input():
+    # in r0; out r0; halt
+    vm = VirtualMachine([20, 32768, 19, 32768, 0])
+    vm.run_script(['xyz'])
+    snapshot = vm.snapshot()
+    assert snapshot.pending_input == tuple('\nzy')
+    child = vm.fork(snapshot)
+    child._curr_idx = 0
+    assert child.run_script([]).startswith('y')
+
+
+def test_fork_is_independent():
+    vm = VirtualMachine(ECHO[:], engine='dispatch')
+    child = vm.fork()
+    assert child.run_script(['child']) == 'child\n'
+    child.write_memory(0, [0])
+    assert vm._bin[0] == 20
+    assert child.snapshot() != vm.snapshot()
+    assert vm.fork().snapshot() == vm.snapshot()
+
+
+def test_fork_keeps_intrinsics():
+    # call 10; out r0; halt
+    vm = VirtualMachine([17, 10, 19, 32768, 0] + [0] * 6)
+
+    def native(registers):
+        registers[0] = ord('n')
+    vm.register_intrinsic(10, native)
+    assert vm.fork().run_script([]).startswith('n')
+
+
+def test_fork_playthrough():
+    vm = VirtualMachine(str(ROOT / 'challenge.bin'), engine='dispatch')
+    vm.run_script(['take tablet'])
+    child = vm.fork()
+    assert child.run_script(['look']) == vm.run_script(['look'])
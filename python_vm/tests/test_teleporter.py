@@ -0,0 +1,29 @@
+import sys
+import pytest
+from .. import teleporter
+from ..intrinsics import confirmation_value
+
+
+SAMPLE_R7 = [0, 1, 2, 8, 100, 12345, 25734, 32767]
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("r0,r1", [(0, 7), (1, 3), (2, 9), (3, 0), (3, 5), (4, 1), (4, 2)])
+def test_evaluate_matches_recurrence(mocker, numpy, r0, r1):
+    if not numpy:
+        mocker.patch.dict(sys.modules, {'numpy': None})
+    expected = [confirmation_value(r0, r1, r7) for r7 in SAMPLE_R7]
+    assert teleporter.evaluate(SAMPLE_R7, r0, r1) == expected
+
+
+def test_energy_level():
+    levels = teleporter.solve()
+    assert len(levels) == 1
+    level = levels[0]
+    assert confirmation_value(
+        teleporter.CHECK_R0, teleporter.CHECK_R1, level) == teleporter.EXPECTED
+
+
+def test_energy_level_without_numpy(mocker):
+    mocker.patch.dict(sys.modules, {'numpy': None})
+    assert teleporter.solve() == [25734]
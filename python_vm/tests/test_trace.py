@@ -0,0 +1,83 @@
+import io
+import pytest
+from ..virtual_machine import VirtualMachine, Status
+from ..backends import BufferBackend
+from ..trace import Trace, EMPTY
+
+
+def test_trace_keeps_last_instructions():
+    # 0: add r0 r0 1; eq r1 r0 5; jf r1 0; out r0; halt
+    program = [9, 32768, 32768, 1, 4, 32769, 32768, 5, 8, 32769, 0,
+               19, 32768, 0]
+    vm = VirtualMachine(program, trace=4)
+    assert vm.run_script([]).startswith('\x05')
+    assert [entry[:2] for entry in vm._trace.entries()] == [
+        (4, 4), (8, 8), (11, 19), (13, 0)]
+    stream = io.StringIO()
+    vm.dump_trace(stream)
+    assert stream.getvalue().splitlines() == [
+        "Last 4 instructions executed:",
+        "4:     EQ   r1        5     5   ; r1 <- 1",
+        "8:     JF       1     0",
+        "11:    OUT  '\\x05'",
+        "13:    HALT",
+    ]
+
+
+def test_trace_continues_across_runs():
+    # in r0; out r0; jmp 0
+    vm = VirtualMachine([20, 32768, 19, 32768, 6, 0], engine='dispatch', trace=3)
+    assert vm.run_script(['a']) == 'a\n'
+    assert [entry[0] for entry in vm._trace.entries()] == [2, 4, 0]
+    assert vm.run_script(['b']) == 'b\n'
+    assert [entry[0] for entry in vm._trace.entries()][-1] == 0
+
+
+@pytest.mark.parametrize(
+    "program,message",
+    [
+        ([2, 32768, 3, 32769, 3, 32769], 'pop from empty stack'),
+        ([1, 32768, 40000], 'invalid number'),
+        ([21, 30000], 'not listed as a valid opcode'),
+    ]
+)
+def test_trace_dumped_on_error(program, message, capsys):
+    vm = VirtualMachine(program, trace=16)
+    with pytest.raises(SystemExit) as e:
+        vm.run_script([])
+    assert message in e.value.code.lower()
+    err = capsys.readouterr().err
+    assert err.startswith('Last ')
+    assert vm._trace.entries()
+    assert list(vm._trace.entries())[-1][5] == EMPTY
+
+
+@pytest.mark.parametrize("engine", ['operations', 'dispatch', 'blocks'])
+def test_trace_kept_by_run(engine):
+    # 0: add r0 r0 1; eq r1 r0 5; jf r1 0; in r2; set r0 40000
+    program = [9, 32768, 32768, 1, 4, 32769, 32768, 5, 8, 32769, 0,
+               20, 32770, 1, 32768, 40000]
+    vm = VirtualMachine(program, engine=engine, trace=3, backend=BufferBackend())
+    assert vm.run(4)[:3] == (Status.BUDGET_EXHAUSTED, 4, 4)
+    assert [entry[:2] for entry in vm._trace.entries()] == [(4, 4), (8, 8), (0, 9)]
+    assert vm.run()[:2] == (Status.AWAITING_INPUT, 11)
+    assert [entry[0] for entry in vm._trace.entries()] == [4, 8, 11]
+    vm._backend.feed('a')
+    result = vm.run()
+    assert (result.status, result.address) == (Status.ERROR, 13)
+    (*_, read), (*failed, written) = list(vm._trace.entries())[-2:]
+    assert read == 97
+    assert failed[:4] == [13, 1, 32768, 40000] and written == EMPTY
+
+
+def test_trace_disabled():
+    vm = VirtualMachine([0])
+    assert vm._trace is None
+    with pytest.raises(ValueError):
+        vm.dump_trace()
+
+
+def test_empty_trace():
+    trace = Trace(8)
+    assert list(trace.entries()) == []
+    assert len(trace.records) == 8 * 6
@@ -0,0 +1,51 @@
+import pytest
+from ..vault import (GRID, START, TARGET, DIRECTIONS, OPERATORS, parse_grid,
+                     random_grid, shortest_path, solve)
+
+HEADINGS = {heading: offset for offset, heading in DIRECTIONS.items()}
+
+
+def walk(grid, start, path):
+    """Follows `path` from `start`, returning the final cell and value"""
+    (row, column), operation = start, None
+    value = grid[row][column]
+    for heading in path:
+        row, column = row + HEADINGS[heading][0], column + HEADINGS[heading][1]
+        assert (row, column) != start
+        cell = grid[row][column]
+        if cell in OPERATORS:
+            operation = OPERATORS[cell]
+        else:
+            value = operation(value, cell)
+    return (row, column), value
+
+
+def test_vault():
+    assert shortest_path() == ['north', 'east', 'east', 'north', 'west',
+                               'south', 'east', 'east', 'west', 'north',
+                               'north', 'east']
+
+
+@pytest.mark.parametrize("size,seed", [(4, 0), (5, 1), (6, 2)])
+def test_solve_batch(size, seed):
+    grid = random_grid(size, seed)
+    start, target = (size - 1, 0), (0, size - 1)
+    paths = solve(grid, start, target, range(50), limit=500)
+    assert any(path is not None for path in paths.values())
+    for value, path in paths.items():
+        if path is not None:
+            assert walk(grid, start, path) == (target, value)
+            # asking for the value alone finds a walk just as short
+            assert len(shortest_path(grid, start, target, value, 500)) == len(path)
+
+
+def test_unreachable():
+    assert solve(GRID, START, TARGET, [30, 999], limit=1000) == {
+        30: shortest_path(), 999: None}
+    assert shortest_path(value=30, limit=25) is None
+
+
+def test_parse_grid():
+    assert parse_grid([['*', '8'], ['22', '-']]) == [['*', 8], [22, '-']]
+    with pytest.raises(ValueError):
+        solve(GRID, (0, 0), TARGET, [30])
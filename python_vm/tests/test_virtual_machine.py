@@ -0,0 +1,162 @@
+import pytest
+from array import array
+from pathlib import Path
+from ..virtual_machine import VirtualMachine, Status
+from ..script import read_script
+from ..exceptions import InvalidNumberError
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_binary_is_loaded_into_array(tmp_path):
+    path = tmp_path / 'image.bin'
+    path.write_bytes(bytes([9, 0, 0, 128, 255, 127]))
+    vm = VirtualMachine(str(path))
+    assert isinstance(vm._bin, array)
+    assert vm._bin.typecode == 'H'
+    assert list(vm._bin) == [9, 32768, 32767]
+    assert list(vm._registers) == [0] * 8
+
+
+def test_odd_sized_binary_is_rejected(tmp_path, capsys):
+    path = tmp_path / 'image.bin'
+    path.write_bytes(bytes([9, 0, 0]))
+    with pytest.raises(SystemExit):
+        VirtualMachine(str(path))
+    assert 'Error while decoding' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "binary,idx,expected",
+    [
+        ([5, 32768, 32775], 0, 5),
+        ([5, 32768, 32775], 1, 10),
+        ([5, 32768, 32775], 2, 17),
+    ]
+)
+def test_operand_resolution(binary, idx, expected):
+    vm = VirtualMachine(binary, registers=list(range(10, 18)))
+    assert vm._read_from_mem(idx) == expected
+
+
+def test_invalid_operand():
+    vm = VirtualMachine([32776])
+    with pytest.raises(InvalidNumberError):
+        vm._read_from_mem(0)
+
+
+def test_write_to_register_and_memory():
+    binary = [32769, 4]
+    vm = VirtualMachine(binary)
+    vm._write_to_mem(7, 0)
+    vm._write_to_mem(8, 1)
+    assert vm._registers[1] == 7
+    assert binary == [32769, 8]
+
+
+@pytest.mark.parametrize("engine", ['operations', 'dispatch', 'blocks'])
+def test_run_script_echo(engine):
+    # in r0; out r0; jmp 0
+    vm = VirtualMachine([20, 32768, 19, 32768, 6, 0], engine=engine)
+    assert vm.run_script(['ab', 'c']) == 'ab\nc\n'
+
+
+@pytest.mark.parametrize("engine", ['operations', 'dispatch', 'blocks'])
+@pytest.mark.parametrize(
+    "line,expected",
+    [
+        ('hé', 'hé'),
+        # beyond 15 bits, or not UTF-8 at all
+        ('hé\U0001f600\u8000', 'hé??'),
+        (b'h\xff', 'h?'),
+    ]
+)
+def test_run_script_wide_characters(engine, line, expected):
+    vm = VirtualMachine([20, 32768, 19, 32768, 6, 0], engine=engine)
+    assert vm.run_script([line]) == expected + '\n'
+
+
+def test_run_script_meta_command():
+    vm = VirtualMachine([20, 32768, 19, 32768, 6, 0])
+    transcript = vm.run_script(['save', 'x'])
+    assert transcript.startswith('Please provide a file name.')
+    assert transcript.endswith('x\n')
+
+
+def test_run_script_halt():
+    vm = VirtualMachine([19, 104, 0])
+    assert vm.run_script([]) == 'hReached opcode 0, terminating program.\n'
+
+
+def test_read_script(tmp_path):
+    path = tmp_path / 'script.txt'
+    path.write_text('north\n# look journal\n\nuse can (some note)\n')
+    assert list(read_script(str(path))) == ['north', 'use can']
+
+
+def test_scripted_playthrough():
+    vm = VirtualMachine(str(ROOT / 'challenge.bin'), engine='dispatch')
+    transcript = vm.run_script(read_script(
+        *(str(ROOT / 'solutions' / name)
+          for name in ('part1.txt', 'teleporter.txt', 'part2.txt'))))
+    assert 'Teleporter settings altered!' in transcript
+    assert 'you have reached the end of the challenge!' in transcript
+
+
+ENGINES = ['operations', 'dispatch', 'blocks']
+# 0: add r0 r0 1; eq r1 r0 5; jf r1 0; out r0; in r1; halt
+COUNT = [9, 32768, 32768, 1, 4, 32769, 32768, 5, 8, 32769, 0,
+         19, 32768, 20, 32769, 0]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_run_until_input_then_halt(engine):
+    vm = VirtualMachine(COUNT[:], engine=engine)
+    lines = []
+
+    def read_line():
+        if not lines:
+            raise EOFError
+        return lines.pop()
+    vm._ops._read_line = read_line
+
+    result = vm.run()
+    assert (result.status, result.address) == (Status.AWAITING_INPUT, 13)
+    assert (vm._registers[0], vm._curr_idx) == (5, 13)
+    lines.append('x')
+    result = vm.run()
+    assert (result.status, result.address) == (Status.HALTED, 15)
+
+
+@pytest.mark.parametrize("engine", ['operations', 'dispatch'])
+def test_run_budget(engine):
+    vm = VirtualMachine(COUNT[:], engine=engine)
+    assert vm.run(7) == (Status.BUDGET_EXHAUSTED, 4, 7, None)
+    assert vm._registers[0] == 3
+    assert vm.step() == (Status.BUDGET_EXHAUSTED, 8, 1, None)
+    # the first run decoded the loop, the rest reuses it
+    assert vm.run(8).steps == 8
+    assert (vm._registers[0], vm._curr_idx) == (5, 13)
+
+
+def test_run_budget_counts_blocks():
+    vm = VirtualMachine(COUNT[:], engine='blocks')
+    assert vm.run(2) == (Status.BUDGET_EXHAUSTED, 0, 2, None)
+    assert vm._registers[0] == 2
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(
+    "program,address,error",
+    [
+        ([3, 32768], 0, 'Attempting to pop from empty stack'),
+        ([21, 22], 1, '22 is not listed as a valid opcode'),
+        ([21, 18, 0], 1, None),
+    ]
+)
+def test_run_stops_without_exiting(engine, program, address, error):
+    result = VirtualMachine(program, engine=engine).run()
+    assert result.status == (Status.ERROR if error else Status.HALTED)
+    assert (result.address, result.error) == (address, error)
+
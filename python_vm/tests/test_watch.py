@@ -0,0 +1,74 @@
+import pytest
+from ..backends import BufferBackend
+from ..virtual_machine import VirtualMachine, Status
+from ..watch import Hit
+
+ENGINES = ['dispatch', 'blocks', 'aot']
+# 0: add r0 r0 1; eq r1 r0 5; jf r1 0; out r0; in r1; halt
+COUNT = [9, 32768, 32768, 1, 4, 32769, 32768, 5, 8, 32769, 0,
+         19, 32768, 20, 32769, 0]
+
+
+def count_vm(engine, cache_dir):
+    return VirtualMachine(COUNT[:], engine=engine, backend=BufferBackend(['x']),
+                          aot_cache_dir=str(cache_dir))
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_register_watchpoint(engine, tmp_path):
+    vm = count_vm(engine, tmp_path)
+    vm.watch('register', 0, condition=lambda hit: hit.new == 3)
+    assert vm.run().status == Status.STOPPED
+    assert vm.last_hit == Hit('register', 0, 0, 2, 3)
+    assert (vm._curr_idx, vm._registers[0]) == (4, 3)
+    assert vm.run().status == Status.HALTED
+    assert vm._registers[0] == 5
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_breakpoint_stops_before_and_resumes(engine, tmp_path):
+    vm = count_vm(engine, tmp_path)
+    vm.watch('break', 11)
+    assert vm.run()[:2] == (Status.STOPPED, 11)
+    assert vm._backend.getvalue() == b''
+    assert vm.run().status == Status.HALTED
+    assert vm._backend.getvalue().startswith(b'\x05')
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_memory_watchpoint_callback(engine, tmp_path):
+    # set r0 7; wmem 20 r0; halt
+    vm = VirtualMachine([1, 32768, 7, 16, 20, 32768, 0] + [0] * 14,
+                        engine=engine, backend=BufferBackend(),
+                        aot_cache_dir=str(tmp_path))
+    hits = []
+    vm.watch('memory', 20, callback=hits.append)
+    assert vm.run().status == Status.HALTED
+    assert hits == [Hit('memory', 20, 3, 0, 7)]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_call_watchpoint(engine, tmp_path):
+    # 0: call 3; halt; 3: ret
+    vm = VirtualMachine([17, 3, 0, 18], engine=engine, backend=BufferBackend(),
+                        aot_cache_dir=str(tmp_path))
+    vm.watch('call', 3)
+    assert vm.run().status == Status.STOPPED
+    assert (vm._curr_idx, vm._stack) == (3, [2])
+    assert vm.run().status == Status.HALTED
+
+
+def test_unwatched_code_runs_plain_handlers(tmp_path):
+    vm = count_vm('dispatch', tmp_path)
+    vm.watch('register', 1, callback=lambda hit: None)
+    vm.run(3)
+    assert 'watch' in vm._runner._code[4].__qualname__
+    assert 'watch' not in vm._runner._code[0].__qualname__
+    vm.unwatch()
+    vm.run(3)
+    assert 'watch' not in vm._runner._code[4].__qualname__
+
+
+def test_reference_engine_has_no_watchpoints():
+    with pytest.raises(ValueError):
+        VirtualMachine(COUNT[:]).watch('break', 0)
@@ -0,0 +1,59 @@
+import pytest
+from .. import xref
+from ..xref import build_index, load_index, query
+
+# 0: set r7 5; call 10; wmem 20 r7; halt
+# 10: rmem r0 20; jt r7 17; ret
+# 17: out r0; ret
+# 20: (string) "ok"
+PROGRAM = [1, 32775, 5, 17, 10, 16, 20, 32775, 0, 0,
+           15, 32768, 20, 7, 32775, 17, 18,
+           19, 32768, 18,
+           2, 111, 107]
+
+
+def test_build_index():
+    index = build_index(PROGRAM)
+    assert index['functions'] == [0, 10]
+    assert index['calls'] == {'10': [3]}
+    assert index['jumps'] == {'17': [13]}
+    assert index['reads'] == {'7': [5, 13], '0': [17]}
+    assert index['writes'] == {'7': [0], '0': [10]}
+    assert index['loads'] == {'20': [10]}
+    assert index['stores'] == {'20': [5]}
+    assert index['strings'] == {'20': 'ok'}
+
+
+@pytest.mark.parametrize(
+    "question,expected",
+    [
+        ('who calls 10', ['3 (in sub_0)']),
+        ('who jumps to 17', ['13 (in sub_10)']),
+        ('where is r7 read', ['5 (in sub_0)', '13 (in sub_10)']),
+        ('Where is  R0 written', ['10 (in sub_10)']),
+        ('who reads 20', ['10 (in sub_10)']),
+        ('who writes 20', ['5 (in sub_0)']),
+        ('what does 5 call', ['3 calls sub_10']),
+        ('strings ok', ["20: 'ok'"]),
+        ('who calls 11', []),
+    ]
+)
+def test_query(question, expected):
+    assert query(build_index(PROGRAM), question) == expected
+
+
+def test_unknown_query():
+    with pytest.raises(ValueError):
+        query(build_index(PROGRAM), 'why')
+
+
+def test_index_is_cached(tmp_path, mocker):
+    index = load_index(PROGRAM, cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+    build = mocker.patch.object(xref, 'build_index', return_value={})
+    assert load_index(PROGRAM, cache_dir=str(tmp_path)) == index
+    build.assert_not_called()
+
+    # a different image misses the cache
+    load_index(PROGRAM[:-1] + [108], cache_dir=str(tmp_path))
+    build.assert_called_once()
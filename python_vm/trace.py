@@ -0,0 +1,222 @@
+import sys
+from array import array
+from itertools import chain, cycle
+from typing import Iterator
+from .dispatch import DispatchEngine
+from .disassembler import format_value
+from .opcode import (
+    NUM_OPERANDS, OPERATION_NAMES, WRITE_SLOTS, REGISTER_BASE, VALUE_LIMIT
+)
+from .exceptions import (
+    InvalidNumberError, EmptyStackError, InvalidOpcodeError, WatchpointHit
+)
+
+# words per record: address, opcode, three operands and the value written
+WIDTH = 6
+EMPTY = 0xFFFF
+
+_WRITES = tuple(bool(slots) for slots in WRITE_SLOTS)
+
+
+class Trace:
+    """
+    Ring buffer holding the last `size` instructions executed, each as a
+    record of `WIDTH` words in one preallocated array: its address, opcode,
+    operands and, for instructions which write a register, the value written.
+
+    Operands which are read are recorded as the value they resolved to, and
+    the operand written to is recorded as is, so that the register it names
+    can be shown.
+    """
+
+    def __init__(self, size: int = 1024):
+        self.size = size
+        self.records = array('H', [EMPTY]) * (size * WIDTH)
+        # offset of the record the next instruction is written to
+        self.next = 0
+
+    def positions(self) -> Iterator[int]:
+        """Yields record offsets forever, starting from `next`"""
+        end = self.size * WIDTH
+        return chain(range(self.next, end, WIDTH), cycle(range(0, end, WIDTH)))
+
+    def entries(self) -> Iterator[tuple]:
+        """Yields the recorded instructions, oldest first"""
+        records = self.records
+        end = self.size * WIDTH
+        for base in chain(range(self.next, end, WIDTH), range(0, self.next, WIDTH)):
+            if records[base + 1] != EMPTY:
+                yield tuple(records[base:base + WIDTH])
+
+    def format(self) -> Iterator[str]:
+        """Yields a disassembled line for each recorded instruction"""
+        for address, op, a, b, c, written in self.entries():
+            if op >= len(NUM_OPERANDS):
+                yield "{:6} DATA: {}".format(str(address) + ':', op)
+                continue
+            operands = (a, b, c)[:NUM_OPERANDS[op]]
+            line = "{:6} {:4}".format(
+                str(address) + ':', OPERATION_NAMES[op].strip('_').upper())
+            for slot, val in enumerate(operands, 1):
+                if slot in WRITE_SLOTS[op] and REGISTER_BASE <= val < VALUE_LIMIT:
+                    line += " {:5}".format(format_value(val))
+                elif op == 19 and val < 0x110000:
+                    line += " {}".format(repr(chr(val)))
+                else:
+                    line += " {:5}".format(val)
+            if _WRITES[op] and REGISTER_BASE <= a < VALUE_LIMIT and written != EMPTY:
+                line += "   ; {} <- {}".format(format_value(a), written)
+            yield line.rstrip()
+
+    def dump(self, stream=None):
+        """Writes out the recorded instructions, oldest first"""
+        stream = stream or sys.stderr
+        lines = list(self.format())
+        stream.write("Last {} instructions executed:\n".format(len(lines)))
+        for line in lines:
+            stream.write(line + '\n')
+        stream.flush()
+
+
+class TracingEngine(DispatchEngine):
+    """
+    Dispatch engine which records every instruction it runs into a `Trace`,
+    and dumps the trace when the program stops on an error. `run` records
+    the same way without dumping, leaving that to the caller.
+    """
+
+    def __init__(self, vm, trace: Trace):
+        super().__init__(vm)
+        self._trace = trace
+        # invalid operands resolve to themselves, so that they can be recorded
+        # before the instruction reports them
+        self._values.extend(range(VALUE_LIMIT, 1 << 16))
+
+    def execute(self):
+        code = self._code
+        mem = self._mem
+        values = self._values
+        trace = self._trace
+        records = trace.records
+        operands = NUM_OPERANDS
+        writes = _WRITES
+        pc = self._vm._curr_idx
+        base = trace.next
+        self._load_registers()
+        try:
+            try:
+                for base in trace.positions():
+                    handler = code[pc]
+                    if handler is None:
+                        records[base] = pc
+                        records[base + 1] = mem[pc]
+                        handler = code[pc] = self._decode(pc)
+                    op = mem[pc]
+                    records[base] = pc
+                    records[base + 1] = op
+                    count = operands[op]
+                    if count:
+                        a = mem[pc + 1]
+                        records[base + 2] = a if writes[op] else values[a]
+                        if count > 1:
+                            records[base + 3] = values[mem[pc + 2]]
+                            if count > 2:
+                                records[base + 4] = values[mem[pc + 3]]
+                    pc = handler()
+                    if writes[op]:
+                        records[base + 5] = values[a]
+            except InvalidNumberError as e:
+                sys.exit(f"Error in binary at index {pc}: {e}")
+            except EmptyStackError as e:
+                sys.exit(f"Error in binary at index {pc}: {e}")
+            except InvalidOpcodeError as e:
+                sys.exit(f"Error in binary at index {pc}: {e}")
+            except KeyboardInterrupt:
+                self._output.flush()
+                print(f"\n\nExiting program...")
+                sys.exit(0)
+        except SystemExit as e:
+            # errors exit with a message, halting exits with 0
+            if isinstance(e.code, str):
+                self._output.flush()
+                # the instruction failed, so it did not write anything
+                records[base + 5] = EMPTY
+                trace.next = (base + WIDTH) % len(records)
+                trace.dump()
+            raise
+        finally:
+            trace.next = (base + WIDTH) % len(records)
+            self._vm._curr_idx = pc
+            self._store_registers()
+            self._output.flush()
+
+    def run(self, budget: int = None):
+        """
+        As `DispatchEngine.run`, one instruction per step, recording each into
+        the trace. As with `execute`, an instruction which raises is recorded
+        without a value written, including one which waits for input or stops
+        at a breakpoint, and is recorded again once it runs.
+        """
+        if budget is None:
+            budget = sys.maxsize
+        code = self._code
+        mem = self._mem
+        values = self._values
+        trace = self._trace
+        records = trace.records
+        end = len(records)
+        operands = NUM_OPERANDS
+        writes = _WRITES
+        pc = self._vm._curr_idx
+        steps = 0
+        base = done = trace.next
+        if self._resume_at != pc:
+            self._resume_at = None
+        self._load_registers()
+        try:
+            positions = trace.positions()
+            while steps < budget:
+                base = next(positions)
+                handler = code[pc]
+                if handler is None:
+                    records[base] = pc
+                    records[base + 1] = mem[pc]
+                    handler = code[pc] = self._decode(pc)
+                op = mem[pc]
+                records[base] = pc
+                records[base + 1] = op
+                count = operands[op]
+                if count:
+                    a = mem[pc + 1]
+                    records[base + 2] = a if writes[op] else values[a]
+                    if count > 1:
+                        records[base + 3] = values[mem[pc + 2]]
+                        if count > 2:
+                            records[base + 4] = values[mem[pc + 3]]
+                pc = handler()
+                if writes[op]:
+                    records[base + 5] = values[a]
+                steps += 1
+                done = (base + WIDTH) % end
+        except WatchpointHit as e:
+            done = (base + WIDTH) % end
+            if e.hit.kind == 'break':
+                self._resume_at = pc
+                records[base + 5] = EMPTY
+            else:
+                # the instruction ran, and the watchpoint stopped it after
+                if writes[op]:
+                    records[base + 5] = values[a]
+                steps += 1
+                pc = e.resume
+            raise
+        except BaseException:
+            records[base + 5] = EMPTY
+            done = (base + WIDTH) % end
+            raise
+        finally:
+            trace.next = done
+            self.steps = steps
+            self._vm._curr_idx = pc
+            self._store_registers()
+            self._output.flush()
@@ -0,0 +1,161 @@
+import random
+import operator
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# the grid in front of the vault door, north at the top: the orb starts on the
+# 22 in the south-west corner and must weigh 30 when it reaches the 1 in the
+# north-east corner
+GRID = [['*', 8, '-', 1],
+        [4, '*', 11, '*'],
+        ['+', 4, '-', 18],
+        [22, '-', 9, '*']]
+START = (3, 0)
+TARGET = (0, 3)
+TARGET_VALUE = 30
+
+OPERATORS = {'+': operator.add, '-': operator.sub, '*': operator.mul}
+# (row, column) offsets of each heading
+DIRECTIONS = {
+    (-1, 0): 'north',
+    (1, 0): 'south',
+    (0, -1): 'west',
+    (0, 1): 'east',
+}
+# values outside [0, LIMIT) are never kept, which bounds the search to
+# LIMIT states per cell
+LIMIT = 32768
+# most moves there can be from one cell: four headings to an operator, then
+# four onwards to a number, including straight back
+MAX_MOVES = 16
+
+Cell = Tuple[int, int]
+
+
+def parse_grid(rows: Iterable[Iterable]) -> list:
+    """Converts a grid given as strings, such as '8' and '-', into numbers and operators"""
+    return [[cell if cell in OPERATORS else int(cell) for cell in row]
+            for row in rows]
+
+
+def _neighbours(grid: list, cell: Cell):
+    row, column = cell
+    for (dy, dx), heading in DIRECTIONS.items():
+        y, x = row + dy, column + dx
+        if 0 <= y < len(grid) and 0 <= x < len(grid[y]):
+            yield (y, x), heading
+
+
+def _moves(grid: list, start: Cell) -> dict:
+    """
+    Maps every number cell to the pairs of steps which lead from it, over an
+    operator, to another number cell: (operation, operand, destination,
+    headings). Moves back onto `start` are left out, as the orb is reset
+    there.
+    """
+    moves = {}
+    for row, cells in enumerate(grid):
+        for column, value in enumerate(cells):
+            if value in OPERATORS:
+                continue
+            moves[row, column] = [
+                (OPERATORS[grid[middle[0]][middle[1]]],
+                 grid[destination[0]][destination[1]], destination,
+                 (first, second))
+                for middle, first in _neighbours(grid, (row, column))
+                if grid[middle[0]][middle[1]] in OPERATORS
+                for destination, second in _neighbours(grid, middle)
+                if destination != start
+                and grid[destination[0]][destination[1]] not in OPERATORS
+            ]
+    return moves
+
+
+def _path(parents: dict, headings: list, size: int, state: int) -> List[str]:
+    path = []
+    while parents[state] >= 0:
+        state, move = divmod(parents[state], MAX_MOVES)
+        path.extend(reversed(headings[state % size][move]))
+    path.reverse()
+    return path
+
+
+def solve(grid: list, start: Cell, target: Cell, values: Iterable[int],
+          limit: int = LIMIT) -> Dict[int, Optional[List[str]]]:
+    """
+    Finds the shortest walk through `grid` from `start` to `target` giving
+    each of `values`, evaluating the numbers and operators on the way from
+    left to right. Returns a list of headings for each value, or None for a
+    value which cannot be reached.
+
+    This is a breadth-first search over (cell, value so far) states, each of
+    which is visited once, so one search answers every value. The walk ends
+    as soon as it reaches `target`, and never returns to `start`.
+    """
+    for cell in (start, target):
+        if grid[cell[0]][cell[1]] in OPERATORS:
+            raise ValueError("{} is not a number".format(cell))
+    width = len(grid[0])
+    size = width * len(grid)
+    # states are value * size + index of the cell, and each parent is the
+    # previous state * MAX_MOVES + the number of the move taken from it
+    table = [()] * size
+    headings = [()] * size
+    for (row, column), moves in _moves(grid, start).items():
+        table[row * width + column] = [
+            (operation, operand, y * width + x, number)
+            for number, (operation, operand, (y, x), _) in enumerate(moves)]
+        headings[row * width + column] = [steps for *_, steps in moves]
+    target = target[0] * width + target[1]
+
+    values = list(values)
+    remaining = set(values)
+    initial = grid[start[0]][start[1]] * size + start[0] * width + start[1]
+    parents = {initial: -1}
+    found = {}
+    if initial % size == target and initial // size in remaining:
+        remaining.discard(initial // size)
+        found[initial // size] = initial
+
+    frontier = [initial]
+    while frontier and remaining:
+        next_frontier = []
+        for state in frontier:
+            value, cell = divmod(state, size)
+            parent = state * MAX_MOVES
+            for operation, operand, destination, number in table[cell]:
+                new_value = operation(value, operand)
+                if not 0 <= new_value < limit:
+                    continue
+                new_state = new_value * size + destination
+                if new_state in parents:
+                    continue
+                parents[new_state] = parent + number
+                if destination != target:
+                    next_frontier.append(new_state)
+                elif new_value in remaining:
+                    remaining.discard(new_value)
+                    found[new_value] = new_state
+        frontier = next_frontier
+    return {value: _path(parents, headings, size, found[value])
+            if value in found else None
+            for value in values}
+
+
+def shortest_path(grid: list = GRID, start: Cell = START,
+                  target: Cell = TARGET, value: int = TARGET_VALUE,
+                  limit: int = LIMIT) -> Optional[List[str]]:
+    """Returns the headings of the shortest walk giving `value`, if there is one"""
+    return solve(grid, start, target, [value], limit)[value]
+
+
+def random_grid(size: int, seed=None, high: int = 20) -> list:
+    """
+    Returns a `size` by `size` grid laid out like the one in the game, with
+    numbers from 1 to `high` and operators alternating like a chessboard, so
+    that the south-west and north-east corners hold numbers.
+    """
+    rng = random.Random(seed)
+    return [[rng.randint(1, high) if (row + column - size + 1) % 2 == 0
+             else rng.choice(list(OPERATORS))
+             for column in range(size)]
+            for row in range(size)]
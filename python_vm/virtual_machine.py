@@ -1,41 +1,123 @@
-import struct
+import os
+import re
 import sys
-import json
-from typing import Union
+from enum import Enum
+from array import array
+from typing import Union, Iterable, Callable, NamedTuple
 from .operations import Operations
-from .opcode import Opcode
-from .exceptions import InvalidNumberError, EmptyStackError
+from .output import OutputBuffer
+from .backends import Backend, TerminalBackend, BufferBackend
+from .commands import Commands
+from .dispatch import DispatchEngine
+from .blocks import BlockEngine
+from .aot import AotEngine
+from .trace import Trace, TracingEngine
+from .snapshot import Snapshot, take_pages, restore_pages, PAGE_SHIFT
+from .savefile import save_state, DEFAULT_BASE_PATH, SUFFIX
+from .script import expand
+from .watch import Watchpoints
+from .opcode import Opcode, OPERATION_NAMES, REGISTER_BASE, NUM_REGISTERS
+from .exceptions import (
+    InvalidNumberError, EmptyStackError, InvalidOpcodeError, WatchpointHit
+)
+
+
+ENGINES = {
+    'operations': None,
+    'dispatch': DispatchEngine,
+    'blocks': BlockEngine,
+    'aot': AotEngine,
+}
+
+# characters which do not fit in a 15-bit word, such as emoji or the
+# replacement character for undecodable bytes; read in as `?`
+_UNREADABLE = re.compile('[^\x00-\u7fff]')
+
+
+class Status(Enum):
+    """Why `VirtualMachine.run` stopped"""
+    HALTED = 'halted'
+    AWAITING_INPUT = 'awaiting input'
+    BUDGET_EXHAUSTED = 'budget exhausted'
+    STOPPED = 'stopped'
+    ERROR = 'error'
+
+
+class RunResult(NamedTuple):
+    status: Status
+    # the instruction the machine stopped at: the one to run next, or the
+    # one which halted or failed
+    address: int
+    # instructions completed (blocks, with the `blocks` engine, and entries
+    # into compiled code with `aot`)
+    steps: int
+    error: str = None
 
 
 class VirtualMachine:
-    def __init__(self, binary: Union[str, list], registers: list = [], stack: list = [], curr_idx: int = 0):
+    def __init__(self, binary: Union[str, list, array], registers: list = [], stack: list = None, curr_idx: int = 0, engine: str = 'operations', output: OutputBuffer = None, trace: int = 0, backend: Backend = None, aot_cache_dir: str = None):
+        if engine not in ENGINES:
+            raise ValueError("Unknown engine {}, expected one of {}".format(
+                engine, ', '.join(ENGINES)))
         self._bin = self._retrieve_binary(binary)
-        self._registers = [0] * 8 if not registers else registers
-        self._stack = stack
+        self._registers = array('H', registers or [0] * NUM_REGISTERS)
+        self._stack = stack if stack is not None else []
+        self._backend = backend if backend is not None else TerminalBackend()
+        self._output = output if output is not None else OutputBuffer(self._backend)
+        # where the `aot` engine caches compiled modules, if not its default
+        self._aot_cache_dir = aot_cache_dir
+        self._commands = Commands(self)
+        self._intrinsics = {}
+        self._intrinsic_specs = {}
+        self._watchpoints = Watchpoints()
+        # what stopped the last run, when a watchpoint did
+        self.last_hit = None
+        self._last_pages = None
+        # numbers of the memory pages written since `_last_pages` was taken;
+        # the engines add to it, so it is cleared rather than replaced
+        self._dirty = set()
         self._ops = Operations(
             self._read_from_mem,
             self._write_to_mem,
             self._push_stack,
             self._pop_stack,
-            self._save_state
+            self._output,
+            read_line_func=self._read_line,
+            command_func=self._commands,
+            intrinsics=self._intrinsics
         )
         self._curr_idx = curr_idx
+        self._engine = engine
+        self._trace = Trace(trace) if trace else None
+        # kept between runs so that decoded code is reused
+        self._runner = None
 
     def _read_from_mem(self, idx: int) -> int:
         val = self._bin[idx]
-        if val < 32768:
+        if val < REGISTER_BASE:
             return val
-        elif (32768 <= val) and (val <= 32775):
-            return self._registers[val % 32768]
-        elif val > 32775:
-            raise InvalidNumberError("Encountered invalid number {}", val)
+        try:
+            return self._registers[val - REGISTER_BASE]
+        except IndexError:
+            raise InvalidNumberError(
+                "Encountered invalid number {}", val) from None
 
     def _write_to_mem(self, val: int, idx: int):
-        temp = self._bin[idx]
-        if (32768 <= temp) and (temp <= 32775):
-            self._registers[temp % 32768] = val
+        reg = self._bin[idx] - REGISTER_BASE
+        if 0 <= reg < NUM_REGISTERS:
+            self._registers[reg] = val
         else:
             self._bin[idx] = val
+            self._dirty.add(idx >> PAGE_SHIFT)
+
+    def _read_line(self) -> str:
+        return _UNREADABLE.sub('?', self._backend.read_line().decode('utf-8', 'replace'))
+
+    def attach(self, backend: Backend):
+        """Takes input from `backend` and writes output to it from now on"""
+        self._output.flush()
+        self._backend = backend
+        self._output._stream = backend
 
     def _push_stack(self, val: int):
         self._stack.append(val)
@@ -47,59 +129,373 @@ class VirtualMachine:
         return val
 
     @staticmethod
-    def _retrieve_binary(binary: Union[str, list]) -> list:
-        if isinstance(binary, list):
+    def _retrieve_binary(binary: Union[str, list, array]) -> array:
+        if isinstance(binary, (list, array)):
             return binary
 
+        # read the 16-bit little-endian words straight into the array buffer
+        data = array('H')
         with open(binary, 'rb') as f:
-            data = f.read()
+            size = os.fstat(f.fileno()).st_size
+            if size % data.itemsize:
+                print(
+                    "Error while decoding: Make sure the input file provided is 'challenge.bin'")
+                sys.exit(1)
+            data.fromfile(f, size // data.itemsize)
+        if sys.byteorder == 'big':
+            data.byteswap()
+        return data
+
+    @staticmethod
+    def _memory_bytes(memory: Union[list, array]) -> bytes:
+        data = array('H', memory)
+        if sys.byteorder == 'big':
+            data.byteswap()
+        return data.tobytes()
+
+    def execute(self, profile=None):
+        """
+        Runs the program from the current instruction until it halts, or until
+        reading input raises `EOFError`.
+
+        If a `Profile` or `Sampler` from `python_vm.profiler` is given, it
+        collects a profile of the run. If the machine was created with a
+        `trace` size, the last that many instructions are recorded as they
+        run and written to stderr should the program stop on an error.
+        """
+        if profile is not None:
+            return profile.execute(self)
+        engine = self._persistent_engine()
+        if engine is not None:
+            return engine.execute()
+
+        try:
+            while True:
+                try:
+                    op_val = self._bin[self._curr_idx]
+                    opcode = Opcode(op_val)
+                    operation = getattr(self._ops, opcode.name.lower())
+                    self._curr_idx = operation(self._curr_idx)
+                except ValueError:
+                    sys.exit(
+                        f"Error in binary at index {self._curr_idx}: {op_val} is not listed as a valid opcode")
+                except AttributeError:
+                    sys.exit(
+                        f"Error in binary at index {self._curr_idx}: Operation {opcode.name} not implemented")
+                except InvalidNumberError as e:
+                    sys.exit(f"Error in binary at index {self._curr_idx}: {e}")
+                except EmptyStackError as e:
+                    sys.exit(f"Error in binary at index {self._curr_idx}: {e}")
+                except KeyboardInterrupt:
+                    self._output.flush()
+                    print(f"\n\nExiting program...")
+                    sys.exit(0)
+        finally:
+            self._output.flush()
+
+    def _persistent_engine(self):
+        """
+        Returns the engine kept by this machine, creating one if there is none
+        for the configured engine yet, or None for the reference interpreter.
+        A machine with a trace always runs a `TracingEngine`.
+        """
+        if self._trace is not None:
+            if type(self._runner) is not TracingEngine:
+                self._runner = TracingEngine(self, self._trace)
+            return self._runner
+        engine = ENGINES[self._engine]
+        if engine is None:
+            return None
+        if type(self._runner) is not engine:
+            self._runner = engine(self)
+        return self._runner
+
+    def run(self, max_steps: int = None) -> RunResult:
+        """
+        Runs the program from the current instruction for at most `max_steps`
+        instructions (basic blocks with the `blocks` engine, entries into
+        compiled code with `aot`), or until it stops by itself, and returns
+        why it stopped rather than exiting.
+
+        The machine is left where it stopped, so `run` can be called again to
+        carry on: after BUDGET_EXHAUSTED, after AWAITING_INPUT once there is
+        more input (which happens when reading a line raises `EOFError`), or
+        after STOPPED, when a watchpoint stopped it and `last_hit` says which.
+        The engine and its decoded code are kept from one call to the next.
+        With a `trace`, each instruction is recorded as with `execute`, and
+        counts as a step whatever the engine; the trace is not dumped on an
+        error, as `dump_trace` can do that.
+        """
+        engine = self._persistent_engine()
+        steps = 0
+        try:
+            if engine is not None:
+                try:
+                    engine.run(max_steps)
+                finally:
+                    steps = engine.steps
+            else:
+                ops = self._ops
+                mem = self._bin
+                try:
+                    while max_steps is None or steps < max_steps:
+                        op_val = mem[self._curr_idx]
+                        if op_val >= len(OPERATION_NAMES):
+                            raise InvalidOpcodeError(
+                                f"{op_val} is not listed as a valid opcode")
+                        operation = getattr(ops, OPERATION_NAMES[op_val])
+                        self._curr_idx = operation(self._curr_idx)
+                        steps += 1
+                finally:
+                    self._output.flush()
+        except WatchpointHit as e:
+            self.last_hit = e.hit
+            return RunResult(Status.STOPPED, self._curr_idx, steps)
+        except EOFError:
+            return RunResult(Status.AWAITING_INPUT, self._curr_idx, steps)
+        except SystemExit as e:
+            if e.code:
+                raise
+            return RunResult(Status.HALTED, self._curr_idx, steps)
+        except (InvalidNumberError, EmptyStackError, InvalidOpcodeError) as e:
+            return RunResult(Status.ERROR, self._curr_idx, steps, str(e))
+        return RunResult(Status.BUDGET_EXHAUSTED, self._curr_idx, steps)
+
+    def step(self) -> RunResult:
+        """Runs a single instruction (or basic block), as `run(1)`"""
+        return self.run(1)
+
+    def register_intrinsic(self, address: int, func: Callable, memoize: bool = False, inputs: Iterable[int] = None, outputs: Iterable[int] = None):
+        """
+        Replaces the subroutine at `address` with a native implementation.
+
+        Whenever `call` targets `address`, `func` is called with the register
+        array instead, and is expected to write its results back into it.
+        Execution then carries on after the `call`, as if the subroutine had
+        run and returned.
+
+        With `memoize`, the results of `func` are cached against the values of
+        the `inputs` registers (all eight by default), so that repeated calls
+        with the same inputs skip `func` altogether. Only the `outputs`
+        registers are cached and written back on a hit; by default these are
+        the registers whose values `func` changed when it ran.
+
+        Intrinsics must be registered before `execute` is called.
+        """
+        self._intrinsic_specs[address] = (func, memoize, inputs, outputs)
+        # calls are bound to their intrinsics when decoded
+        self._runner = None
+        if not memoize:
+            self._intrinsics[address] = lambda: func(self._registers)
+            return
+
+        inputs = tuple(inputs) if inputs is not None else tuple(
+            range(NUM_REGISTERS))
+        outputs = tuple(outputs) if outputs is not None else None
+        cache = {}
+
+        def intrinsic():
+            registers = self._registers
+            key = tuple([registers[reg] for reg in inputs])
+            result = cache.get(key)
+            if result is None:
+                before = array('H', registers)
+                func(registers)
+                written = outputs if outputs is not None else [
+                    reg for reg in range(NUM_REGISTERS)
+                    if registers[reg] != before[reg]]
+                cache[key] = tuple([(reg, registers[reg]) for reg in written])
+            else:
+                for reg, value in result:
+                    registers[reg] = value
+        self._intrinsics[address] = intrinsic
+
+    def remove_intrinsic(self, address: int):
+        """Restores the subroutine at `address` to run as normal"""
+        self._intrinsics.pop(address, None)
+        self._intrinsic_specs.pop(address, None)
+        self._runner = None
+
+    def watch(self, kind: str, target: int, condition: Callable = None, callback: Callable = None):
+        """
+        Sets a breakpoint or watchpoint of `kind` (see `python_vm.watch.KINDS`)
+        on `target`: an instruction address to break at before it runs, a
+        memory address or register (0..7) to watch for writes, or the address
+        of a subroutine to watch for calls to.
+
+        On a hit, `condition` is called with the `Hit` and the watchpoint is
+        ignored unless it returns a true value; then `callback` is called
+        with the `Hit`. Execution stops if there is no callback, or it
+        returns a true value: `run` returns STOPPED, just before the
+        instruction for a breakpoint and just after it otherwise, while
+        `execute` raises `WatchpointHit`. Both may look at and change the
+        registers, memory and stack as the instruction left them.
+
+        Only the instructions which could hit a watchpoint are slowed down by
+        it, which needs one of the decoding engines: any but `operations`.
+        Writes made by intrinsics and meta-commands are not watched.
+        """
+        if ENGINES[self._engine] is None:
+            raise ValueError("Watchpoints need an engine other than operations")
+        self._watchpoints.add(kind, target, condition, callback)
+        self._rewatch()
+
+    def unwatch(self, kind: str = None, target: int = None):
+        """
+        Removes the watchpoints of `kind` on `target`, all of `kind` if no
+        target is given, or all of them
+        """
+        self._watchpoints.remove(kind, target)
+        self._rewatch()
+
+    def _rewatch(self):
+        # instructions are wrapped in the checks for watchpoints when decoded
+        if self._runner is not None:
+            self._runner._invalidate_all()
+
+    def snapshot(self) -> Snapshot:
+        """
+        Captures the memory, registers, stack, instruction pointer and pending
+        input of the machine, to be handed to `restore` or `fork` later.
+
+        Memory pages which have not been written since the previous snapshot
+        or restore are shared with it rather than copied, so taking snapshots
+        as the program runs only costs as much as the pages it has written in
+        between. Memory written from outside the program has to go through
+        `write_memory` to be seen.
+        """
+        self._last_pages = take_pages(self._bin, self._last_pages, self._dirty)
+        self._dirty.clear()
+        return Snapshot(
+            self._last_pages,
+            tuple(self._registers),
+            tuple(self._stack),
+            self._curr_idx,
+            tuple(self._ops._input_cache),
+        )
+
+    def restore(self, snapshot: Snapshot):
+        """
+        Puts the machine back into the state captured by `snapshot`. Only the
+        memory pages which have been written since the previous snapshot or
+        restore, or which that one does not share with `snapshot`, are
+        compared and copied back.
+        """
+        last = self._last_pages
+        numbers = None
+        if last is not None and len(last) == len(snapshot.pages):
+            numbers = self._dirty.union(
+                number for number, (page, other) in enumerate(zip(last, snapshot.pages))
+                if page is not other)
+        written = restore_pages(self._bin, snapshot.pages, numbers)
+        if self._runner is not None:
+            for words in written:
+                self._runner._invalidate_range(words.start, words.stop)
+        self._last_pages = snapshot.pages
+        self._dirty.clear()
+        self._registers[:] = array('H', snapshot.registers)
+        self._stack[:] = snapshot.stack
+        self._curr_idx = snapshot.curr_idx
+        self._ops._input_cache = list(snapshot.pending_input)
+
+    def write_memory(self, address: int, words: Iterable[int]):
+        """
+        Writes `words` into memory from `address` on, from outside the
+        program, dropping any code decoded from the old words and marking
+        their pages as written for the next snapshot.
+        """
+        words = list(words)
+        end = address + len(words)
+        if isinstance(self._bin, array):
+            self._bin[address:end] = array('H', words)
+        else:
+            self._bin[address:end] = words
+        self._dirty.update(range(address >> PAGE_SHIFT, ((end - 1) >> PAGE_SHIFT) + 1))
+        if self._runner is not None:
+            self._runner._invalidate_range(address, end)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Snapshot, **kwargs) -> 'VirtualMachine':
+        """
+        Returns a machine, created with `kwargs`, in the state captured by
+        `snapshot`, such as one read back by `savefile.load_state`.
+        """
+        vm = cls(snapshot.memory(), list(snapshot.registers),
+                 list(snapshot.stack), snapshot.curr_idx, **kwargs)
+        vm._last_pages = snapshot.pages
+        vm._ops._input_cache = list(snapshot.pending_input)
+        return vm
+
+    def fork(self, snapshot: Snapshot = None, output: OutputBuffer = None) -> 'VirtualMachine':
+        """
+        Returns an independent machine in the current state of this one, or
+        in the state of `snapshot` if given, with the same engine and
+        intrinsics. The copy writes to `output`, or to a new buffer on the
+        same stream as this machine.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        if output is None:
+            output = OutputBuffer(self._output._stream)
+        vm = VirtualMachine.from_snapshot(
+            snapshot, engine=self._engine, output=output,
+            trace=self._trace.size if self._trace else 0, backend=self._backend,
+            aot_cache_dir=self._aot_cache_dir)
+        for address, spec in self._intrinsic_specs.items():
+            vm.register_intrinsic(address, *spec)
+        return vm
+
+    def dump_trace(self, stream=None):
+        """Writes the instructions recorded by the trace out to `stream`"""
+        if self._trace is None:
+            raise ValueError("Tracing is not enabled for this machine")
+        self._trace.dump(stream)
+
+    def run_script(self, commands: Iterable[str], profile=None) -> str:
+        """
+        Runs the program without a terminal, feeding it `commands` one line at
+        a time in place of interactive input, and returns everything it wrote.
+
+        Meta-commands such as `save` and `rewire teleporter` are handled as
+        usual, and directives such as `solve coins` are expanded into the
+        commands they work out from the game's replies. The run ends once the
+        commands are used up and the program asks for more input, or when it
+        halts. `profile` is passed on to `execute`.
+        """
+        # where the reply to the command handed out last begins
+        reply = 0
+
+        def output() -> str:
+            return transcript.getvalue(reply).decode('utf-8')
+
+        def lines():
+            nonlocal reply
+            for command in expand(commands, output):
+                reply = transcript.tell()
+                yield command
 
-        # decode binary from 16-bit little-endians into ints
-        num_elems = len(data) // 2
+        transcript = BufferBackend(lines())
+        stream, backend = self._output._stream, self._backend
+        self.attach(transcript)
         try:
-            data = struct.unpack('<{}H'.format(num_elems), data)
-        except struct.error:
-            print(
-                "Error while decoding: Make sure the input file provided is 'challenge.bin'")
-            sys.exit(1)
-
-        # struct.unpack returns tuple, convert to list for mutability
-        return list(data)
-
-    def execute(self):
-        while True:
-            try:
-                op_val = self._bin[self._curr_idx]
-                opcode = Opcode(op_val)
-                operation = getattr(self._ops, opcode.name.lower())
-                self._curr_idx = operation(self._curr_idx)
-            except ValueError:
-                sys.exit(
-                    f"Error in binary at index {self._curr_idx}: {op_val} is not listed as a valid opcode")
-            except AttributeError:
-                sys.exit(
-                    f"Error in binary at index {self._curr_idx}: Operation {opcode.name} not implemented")
-            except InvalidNumberError as e:
-                sys.exit(f"Error in binary at index {self._curr_idx}: {e}")
-            except EmptyStackError as e:
-                sys.exit(f"Error in binary at index {self._curr_idx}: {e}")
-            except KeyboardInterrupt:
-                print(f"\n\nExiting program...")
-                sys.exit(0)
+            self.execute(profile)
+        except EOFError:
+            pass
+        except SystemExit as e:
+            if e.code:
+                raise
+        finally:
+            self._output.flush()
+            self._output._stream, self._backend = stream, backend
+        return transcript.getvalue().decode('utf-8')
 
     def _save_state(self, filename: str):
-        with open('./data/{}.bin'.format(filename), 'wb') as f:
-            data = struct.pack('<{}H'.format(len(self._bin)), *self._bin)
-            f.write(data)
-        print("Saved memory data to data/{}.bin".format(filename))
-        with open('./data/{}.json'.format(filename), 'w') as f:
-            tmp = {
-                'registers': self._registers,
-                'stack': self._stack,
-                'curr_idx': self._curr_idx
-            }
-            json.dump(tmp, f, indent=4)
-        print("Saved registers and stack data to data/{}.json\n".format(filename))
+        path = './data/{}{}'.format(filename, SUFFIX)
+        # store memory as a delta against challenge.bin where there is one,
+        # and in full otherwise
+        base = DEFAULT_BASE_PATH if os.path.exists(DEFAULT_BASE_PATH) else None
+        save_state(path, self.snapshot(), base)
+        self._output.write("Saved state to data/{}{}\n\n".format(filename, SUFFIX))
 
     def get_byte(self, idx: str):
         return self._bin[idx]
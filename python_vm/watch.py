@@ -0,0 +1,70 @@
+from typing import Callable, NamedTuple
+
+# what a breakpoint or watchpoint can be set on, and what its target is:
+# `break` on an instruction address, before the instruction runs; `memory`
+# on writes to an address; `register` on writes to a register (0..7); and
+# `call` on calls to a subroutine address
+KINDS = ('break', 'memory', 'register', 'call')
+
+
+class Hit(NamedTuple):
+    kind: str
+    target: int
+    # the instruction which hit
+    address: int
+    # the value of the memory cell or register before and after the write
+    old: int = None
+    new: int = None
+
+
+class Watchpoints:
+    """
+    The breakpoints and watchpoints set on a virtual machine, each kept as a
+    list of `(condition, callback)` pairs against its target in the mapping
+    for its kind.
+
+    When one is hit, `condition(hit)` decides whether it counts, if given;
+    then `callback(hit)` is called, if given, and execution stops if there
+    is no callback or the callback returns a true value.
+    """
+
+    def __init__(self):
+        self.breaks = {}
+        self.memory = {}
+        self.registers = {}
+        self.calls = {}
+        self._kinds = dict(zip(KINDS, (self.breaks, self.memory,
+                                       self.registers, self.calls)))
+
+    def __bool__(self) -> bool:
+        return bool(self.breaks or self.memory or self.registers or self.calls)
+
+    def add(self, kind: str, target: int, condition: Callable = None,
+            callback: Callable = None):
+        if kind not in self._kinds:
+            raise ValueError("Unknown watchpoint kind {}, expected one of {}".format(
+                kind, ', '.join(KINDS)))
+        self._kinds[kind].setdefault(target, []).append((condition, callback))
+
+    def remove(self, kind: str = None, target: int = None):
+        """
+        Removes every watchpoint on `target` of `kind`, every one of `kind`
+        without a target, or every one there is without either
+        """
+        for name, points in self._kinds.items():
+            if kind is None or name == kind:
+                if target is None:
+                    points.clear()
+                else:
+                    points.pop(target, None)
+
+    @staticmethod
+    def triggered(points: list, hit: Hit) -> bool:
+        """Runs the watchpoints `points` for `hit`, returning whether to stop"""
+        stop = False
+        for condition, callback in points:
+            if condition is not None and not condition(hit):
+                continue
+            if callback is None or callback(hit):
+                stop = True
+        return stop
@@ -0,0 +1,177 @@
+import os
+import re
+import json
+import bisect
+import hashlib
+from array import array
+from .disassembler import _trace, data_regions, string_at
+from .opcode import Opcode, WRITE_SLOTS, REGISTER_BASE, VALUE_LIMIT
+
+# bumped whenever the layout of the index changes, so stale caches are ignored
+VERSION = 2
+DEFAULT_CACHE_DIR = 'data/xref'
+
+
+def image_hash(memory, *extra: str) -> str:
+    """Returns a hex digest of the memory image and anything in `extra`"""
+    digest = hashlib.sha256(array('H', memory).tobytes())
+    for item in extra:
+        digest.update(item.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _add(table: dict, key, site: int):
+    table.setdefault(str(key), []).append(site)
+
+
+def build_index(memory, entries=(0,)) -> dict:
+    """
+    Indexes the code reachable from `entries` in `memory`:
+
+    - `functions`: entry address of every subroutine, ascending
+    - `calls`, `jumps`: sites which call or branch to each address
+    - `reads`, `writes`: sites which read or write each register
+    - `loads`, `stores`: sites which `rmem` from or `wmem` to each constant
+      address
+    - `strings`: text of every string found in data
+
+    Tables are keyed by address (or register number) as a string, so that the
+    index can be stored as JSON.
+    """
+    code, functions, _, targets = _trace(memory, entries, True)
+    index = {
+        'version': VERSION,
+        'functions': sorted(functions | set(entries)),
+        'calls': {},
+        'jumps': {},
+        'reads': {},
+        'writes': {},
+        'loads': {},
+        'stores': {},
+        'strings': {},
+    }
+    for address in sorted(code):
+        op, args = code[address]
+        target = targets.get(address)
+        if target is not None:
+            _add(index['calls' if op == Opcode.CALL.value else 'jumps'],
+                 target, address)
+        for slot, arg in enumerate(args, 1):
+            if REGISTER_BASE <= arg < VALUE_LIMIT:
+                kind = 'writes' if slot in WRITE_SLOTS[op] else 'reads'
+                _add(index[kind], arg - REGISTER_BASE, address)
+        if op == Opcode.RMEM.value and args[1] < REGISTER_BASE:
+            _add(index['loads'], args[1], address)
+        elif op == Opcode.WMEM.value and args[0] < REGISTER_BASE:
+            _add(index['stores'], args[0], address)
+
+    for start, end in data_regions(memory, code):
+        address = start
+        while address < end:
+            text = string_at(memory, address, end)
+            if text is None:
+                address += 1
+                continue
+            index['strings'][str(address)] = ''.join(map(chr, text))
+            address += 1 + len(text)
+    return index
+
+
+def cached_index(key: str, cache_dir: str = DEFAULT_CACHE_DIR):
+    """Returns the index cached under `key`, or None if there is none"""
+    try:
+        with open(os.path.join(cache_dir, key + '.json')) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if index.get('version') == VERSION else None
+
+
+def load_index(memory, entries=(0,), key: str = None,
+               cache_dir: str = DEFAULT_CACHE_DIR) -> dict:
+    """
+    Returns the index of `memory` from `entries`, from the cache in
+    `cache_dir` if it holds one for the same image and entry points, or
+    building and caching it otherwise. `key` replaces the hash of the image
+    as the cache key, for callers which can name the image more cheaply.
+    """
+    if key is None:
+        key = image_hash(memory, repr(sorted(entries)))
+    index = cached_index(key, cache_dir)
+    if index is not None:
+        return index
+
+    index = build_index(memory, entries)
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, key + '.json'), 'w') as f:
+        json.dump(index, f)
+    return index
+
+
+def function_of(index: dict, address: int):
+    """Returns the entry of the subroutine `address` is in, if any"""
+    functions = index['functions']
+    position = bisect.bisect_right(functions, address)
+    return functions[position - 1] if position else None
+
+
+def _register(name: str) -> str:
+    return str(int(name.lstrip('r')))
+
+
+# each query pattern, the index table it looks in and the way its argument is
+# turned into a key of that table
+QUERIES = (
+    (r'who calls (\d+)', 'calls', str),
+    (r'who (?:jumps to|branches to) (\d+)', 'jumps', str),
+    (r'where is (r[0-7]) read', 'reads', _register),
+    (r'where is (r[0-7]) (?:written|set)', 'writes', _register),
+    (r'who (?:reads|loads) (\d+)', 'loads', str),
+    (r'who (?:writes|stores) (\d+)', 'stores', str),
+    (r'what does (\d+) call', None, int),
+    (r'strings?(?: (.*))?', 'strings', str),
+)
+
+
+def query(index: dict, text: str) -> list:
+    """
+    Answers a question about `index`, returning a line per result. Questions
+    take the forms
+
+        who calls 6027              what does 5451 call
+        who jumps to 1312           where is r7 read
+        who reads 6068              where is r7 written
+        who writes 2732             strings teleporter
+    """
+    text = ' '.join(text.split()).lower()
+    for pattern, table, key in QUERIES:
+        match = re.fullmatch(pattern, text)
+        if match is None:
+            continue
+        arg = match.group(1)
+        if table == 'strings':
+            return ['{}: {!r}'.format(address, string)
+                    for address, string in index['strings'].items()
+                    if arg is None or arg in string.lower()]
+        if table is None:
+            return _callees(index, key(arg))
+        return ['{} (in {})'.format(site, _name(function_of(index, site)))
+                for site in index[table].get(key(arg), [])]
+    raise ValueError("Unknown query: {}".format(text))
+
+
+def _callees(index: dict, address: int) -> list:
+    """Lists the calls made by the subroutine which `address` is in"""
+    function = function_of(index, address)
+    functions = index['functions']
+    position = functions.index(function) if function is not None else -1
+    end = functions[position + 1] if position + 1 < len(functions) else VALUE_LIMIT
+    start = function if function is not None else 0
+    calls = sorted((site, int(target))
+                   for target, sites in index['calls'].items()
+                   for site in sites if start <= site < end)
+    return ['{} calls {}'.format(site, _name(target)) for site, target in calls]
+
+
+def _name(address) -> str:
+    return 'sub_{}'.format(address) if address is not None else 'top level'
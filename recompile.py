@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+import argparse
+from python_vm import VirtualMachine
+from python_vm.aot import DEFAULT_CACHE_DIR, entries_of, load_module
+from python_vm.boot import boot
+from python_vm.savefile import load_state, SUFFIX
+
+DEFAULT_BIN_PATH = 'challenge.bin'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile challenge.bin ahead of time into the Python module "
+                    "the `aot` engine runs, and print where it was cached")
+    parser.add_argument('--snapshot', default=DEFAULT_BIN_PATH,
+                        help="memory image to compile, such as data/<name>.sav from `save`")
+    parser.add_argument('--raw', action='store_true',
+                        help="compile the image as it is, rather than as it is "
+                             "once booted to the first prompt")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    if args.snapshot.endswith(SUFFIX):
+        vm = VirtualMachine.from_snapshot(load_state(args.snapshot))
+    elif args.raw or args.snapshot != DEFAULT_BIN_PATH:
+        vm = VirtualMachine(args.snapshot)
+    else:
+        vm, _ = boot(args.snapshot)
+    memory = vm._bin
+    module = load_module(memory, entries_of(memory, vm._curr_idx, vm._stack),
+                         args.cache_dir)
+    print("{} functions, {} blocks: {}".format(
+        len(module.COVERED), len(module.BLOCKS), module.__file__))
+
+
+if __name__ == '__main__':
+    main()
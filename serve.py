@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+import sys
+import asyncio
+import argparse
+from python_vm import teleporter
+from python_vm.server import GameServer, DEFAULT_BUDGET
+from python_vm.virtual_machine import ENGINES
+
+DEFAULT_BIN_PATH = 'challenge.bin'
+
+
+async def serve(args):
+    server = GameServer(DEFAULT_BIN_PATH, args.engine, args.budget)
+    # `rewire teleporter` would otherwise hold up every session the first
+    # time someone uses it
+    teleporter.energy_level()
+    listener = await server.start(args.host, args.port, args.unix)
+    for sock in listener.sockets:
+        print("Serving on {}".format(sock.getsockname()), file=sys.stderr)
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve challenge.bin to many players at once, one machine per connection")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4000)
+    parser.add_argument('--unix', help="listen on this Unix socket instead")
+    parser.add_argument('--engine', choices=[name for name in ENGINES if ENGINES[name]],
+                        default='dispatch')
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET,
+                        help="instructions each session runs before the next one's turn")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
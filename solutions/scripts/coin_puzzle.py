@@ -1,21 +1,36 @@
 #!/usr/bin/env python3
-from itertools import permutations
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..'))
+from python_vm.coins import solve
+
+# the equation on the monument in the ruins, and the value marked on each coin
+EQUATION = '_ + _ * _^2 + _^3 - _ = 399'
+COINS = {
+    2: 'red coin',
+    3: 'corroded coin',
+    5: 'shiny coin',
+    7: 'concave coin',
+    9: 'blue coin',
+}
 
 
 def main():
-    coin_dict = {
-        2: 'red coin',
-        3: 'corroded coin',
-        5: 'shiny coin',
-        7: 'concave coin',
-        9: 'blue coin'
-    }
-    for a, b, c, d, e in permutations([2, 3, 5, 7, 9]):
-        if (a + b * (c ** 2) + (d ** 3) - e) == 399:
-            break
+    parser = argparse.ArgumentParser(
+        description="Find every order of the coins which solves the equation")
+    parser.add_argument('values', type=int, nargs='*',
+                        help="values to fill in the blanks with (default: the coins)")
+    parser.add_argument('--equation', default=EQUATION)
+    args = parser.parse_args()
 
-    sol = [coin_dict.get(key) for key in (a, b, c, d, e)]
-    print(', '.join(sol))
+    for solution in solve(args.equation, args.values or COINS):
+        if args.values:
+            print(', '.join(map(str, solution)))
+        else:
+            print(', '.join(COINS[value] for value in solution))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+import sys
+import argparse
+from python_vm import VirtualMachine
+from python_vm.profiler import Profile
+from python_vm.script import read_script
+from python_vm.savefile import load_state, SUFFIX
+from python_vm.xref import (
+    DEFAULT_CACHE_DIR, image_hash, cached_index, load_index, query
+)
+
+DEFAULT_BIN_PATH = 'challenge.bin'
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Query the cross-reference index of challenge.bin, e.g. "
+                    "`who calls 6027` or `where is r7 read`")
+    parser.add_argument('question', nargs='+')
+    parser.add_argument('--snapshot', default=DEFAULT_BIN_PATH,
+                        help="memory image to index, such as data/<name>.sav from `save`")
+    parser.add_argument('--script', action='append', default=[],
+                        help="play this script first and index memory as it is "
+                             "afterwards, starting from every subroutine it called")
+    parser.add_argument('--entry', type=int, action='append', default=[],
+                        help="additional address to start decoding code from")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    if args.snapshot.endswith(SUFFIX):
+        vm = VirtualMachine.from_snapshot(load_state(args.snapshot), engine='dispatch')
+    else:
+        vm = VirtualMachine(args.snapshot, engine='dispatch')
+    entries = [0] + args.entry
+    scripts = []
+    for path in args.script:
+        with open(path) as f:
+            scripts.append(f.read())
+    # the image after the scripts is determined by the image and the scripts,
+    # so a cached index can be found without playing them again
+    key = image_hash(vm._bin, repr(sorted(entries)), *scripts)
+    index = cached_index(key, args.cache_dir)
+    if index is None:
+        if args.script:
+            profile = Profile()
+            vm.run_script(read_script(*args.script), profile)
+            entries.append(vm._curr_idx)
+            entries.extend(target for target in profile.summary()
+                           if target is not None)
+        index = load_index(vm._bin, entries, key, args.cache_dir)
+
+    try:
+        results = query(index, ' '.join(args.question))
+    except ValueError as e:
+        sys.exit(str(e))
+    for line in results:
+        print(line)
+
+
+if __name__ == '__main__':
+    main()